@@ -94,7 +94,7 @@ export function ActivityTimeline({ limit = 10, className }: ActivityTimelineProp
         <CardHeader>
           <CardTitle className="flex items-center gap-2">
             <Clock className="h-5 w-5" />
-            {t('activity.title', 'Recent Activity')}
+            {t('activity.title')}
           </CardTitle>
         </CardHeader>
         <CardContent>
@@ -119,14 +119,14 @@ export function ActivityTimeline({ limit = 10, className }: ActivityTimelineProp
       <CardHeader>
         <CardTitle className="flex items-center gap-2">
           <Clock className="h-5 w-5" />
-          {t('activity.title', 'Recent Activity')}
+          {t('activity.title')}
         </CardTitle>
       </CardHeader>
       <CardContent>
         <ScrollArea className="h-[400px] pe-4">
           {activities.length === 0 ? (
             <div className="text-center text-muted-foreground py-8">
-              {t('activity.noActivity', 'No recent activity')}
+              {t('activity.noActivity')}
             </div>
           ) : (
             <div className="relative">
@@ -333,13 +333,13 @@ export function AdvancedReporting({ organizationId }: AdvancedReportingProps) {
   ], [t]);
 
   // Sample chart data
-  const revenueChartData: ChartData = {
+  const revenueChartData: ChartData = useMemo(() => ({
     labels: ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
     datasets: [
       { label: t('reports.metrics.revenue'), data: [45000, 52000, 48000, 61000, 55000, 67000, 72000, 69000, 81000, 95000, 102000, 125000], color: '#22c55e' },
       { label: t('reports.metrics.expenses'), data: [32000, 35000, 41000, 38000, 42000, 45000, 48000, 51000, 55000, 62000, 70000, 78000], color: '#ef4444' }
     ]
-  };
+  }), [t, i18n.language]);
 
   // Top customers data
   const topCustomers = [
@@ -482,15 +482,15 @@ export function AdvancedReporting({ organizationId }: AdvancedReportingProps) {
   };
 
   // Render pie chart (CSS-based)
+  const expenses = useMemo(() => [
+    { label: t('reports.categories.salaries'), value: 35000, color: '#3b82f6' },
+    { label: t('reports.categories.rent'), value: 15000, color: '#22c55e' },
+    { label: t('reports.categories.utilities'), value: 8000, color: '#f59e0b' },
+    { label: t('reports.categories.supplies'), value: 12000, color: '#ef4444' },
+    { label: t('reports.categories.other'), value: 8000, color: '#8b5cf6' }
+  ], [t, i18n.language]);
+
   const renderPieChart = () => {
-    const expenses = [
-      { label: t('reports.categories.salaries'), value: 35000, color: '#3b82f6' },
-      { label: t('reports.categories.rent'), value: 15000, color: '#22c55e' },
-      { label: t('reports.categories.utilities'), value: 8000, color: '#f59e0b' },
-      { label: t('reports.categories.supplies'), value: 12000, color: '#ef4444' },
-      { label: t('reports.categories.other'), value: 8000, color: '#8b5cf6' }
-    ];
-    
     const total = expenses.reduce((sum, e) => sum + e.value, 0);
     let currentAngle = 0;
     
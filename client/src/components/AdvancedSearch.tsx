@@ -122,7 +122,7 @@ export function AdvancedSearch({
           <Input
             value={query}
             onChange={(e) => handleQueryChange(e.target.value)}
-            placeholder={placeholder || t('search.placeholder', 'Search...')}
+            placeholder={placeholder || t('search.placeholder')}
             className="ps-10"
             data-search-input
           />
@@ -143,7 +143,7 @@ export function AdvancedSearch({
           <PopoverTrigger asChild>
             <Button variant="outline" className="gap-2">
               <SlidersHorizontal className="h-4 w-4" />
-              {t('search.filters', 'Filters')}
+              {t('search.filters')}
               {activeFilters.length > 0 && (
                 <Badge variant="secondary" className="ms-1">
                   {activeFilters.length}
@@ -154,10 +154,10 @@ export function AdvancedSearch({
           <PopoverContent className="w-80" align="end">
             <div className="space-y-4">
               <div className="flex items-center justify-between">
-                <h4 className="font-medium">{t('search.advancedFilters', 'Advanced Filters')}</h4>
+                <h4 className="font-medium">{t('search.advancedFilters')}</h4>
                 {activeFilters.length > 0 && (
                   <Button variant="ghost" size="sm" onClick={clearAllFilters}>
-                    {t('search.clearAll', 'Clear all')}
+                    {t('search.clearAll')}
                   </Button>
                 )}
               </div>
@@ -178,7 +178,7 @@ export function AdvancedSearch({
               <Separator />
               
               <Button className="w-full" onClick={() => setIsFilterOpen(false)}>
-                {t('search.applyFilters', 'Apply Filters')}
+                {t('search.applyFilters')}
               </Button>
             </div>
           </PopoverContent>
@@ -188,7 +188,7 @@ export function AdvancedSearch({
       {/* Active Filters */}
       {activeFilters.length > 0 && (
         <div className="flex items-center gap-2 flex-wrap">
-          <span className="text-sm text-muted-foreground">{t('search.activeFilters', 'Active filters:')}</span>
+          <span className="text-sm text-muted-foreground">{t('search.activeFilters')}</span>
           {activeFilters.map(filter => {
             const definition = filters.find(f => f.id === filter.id);
             return (
@@ -226,10 +226,10 @@ function FilterInput({ filter, value, onChange }: FilterInputProps) {
             onChange(v, option?.label);
           }}>
             <SelectTrigger>
-              <SelectValue placeholder={t('search.selectOption', 'Select...')} />
+              <SelectValue placeholder={t('search.selectOption')} />
             </SelectTrigger>
             <SelectContent>
-              <SelectItem value="">{t('common.all', 'All')}</SelectItem>
+              <SelectItem value="">{t('common.all')}</SelectItem>
               {filter.options?.map(opt => (
                 <SelectItem key={opt.value} value={opt.value}>
                   {opt.label}
@@ -258,7 +258,7 @@ function FilterInput({ filter, value, onChange }: FilterInputProps) {
           <div className="flex items-center gap-2">
             <Input
               type="number"
-              placeholder={t('search.min', 'Min')}
+              placeholder={t('search.min')}
               value={value?.min || ''}
               onChange={(e) => onChange({ ...value, min: e.target.value })}
               className="w-24"
@@ -266,7 +266,7 @@ function FilterInput({ filter, value, onChange }: FilterInputProps) {
             <span>-</span>
             <Input
               type="number"
-              placeholder={t('search.max', 'Max')}
+              placeholder={t('search.max')}
               value={value?.max || ''}
               onChange={(e) => onChange({ ...value, max: e.target.value })}
               className="w-24"
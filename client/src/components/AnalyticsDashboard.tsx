@@ -221,7 +221,7 @@ export function ComparisonCard({
             </Badge>
           </div>
           <div className="flex items-center justify-between text-sm text-muted-foreground">
-            <span>{t('analytics.previousPeriod', 'Previous period')}</span>
+            <span>{t('analytics.previousPeriod')}</span>
             <span>{formatValue(previous)}</span>
           </div>
           <div className="relative h-2 bg-muted rounded-full overflow-hidden">
@@ -466,15 +466,15 @@ export function DashboardHeader({
   onExport,
   isLoading,
 }: DashboardHeaderProps) {
-  const { t } = useTranslation();
-
-  const periods = [
-    { value: '1d', label: t('analytics.today', 'Today') },
-    { value: '7d', label: t('analytics.7days', '7 Days') },
-    { value: '30d', label: t('analytics.30days', '30 Days') },
-    { value: '90d', label: t('analytics.90days', '90 Days') },
-    { value: '1y', label: t('analytics.1year', '1 Year') },
-  ];
+  const { t, i18n } = useTranslation();
+
+  const periods = useMemo(() => [
+    { value: '1d', label: t('analytics.today') },
+    { value: '7d', label: t('analytics.7days') },
+    { value: '30d', label: t('analytics.30days') },
+    { value: '90d', label: t('analytics.90days') },
+    { value: '1y', label: t('analytics.1year') },
+  ], [t, i18n.language]);
 
   return (
     <div className="flex flex-col sm:flex-row sm:items-center sm:justify-between gap-4">
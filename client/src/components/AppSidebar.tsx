@@ -1,4 +1,4 @@
-import { useState } from 'react';
+import { useState, useMemo } from 'react';
 import { Link, useLocation } from 'wouter';
 import { useAuth } from '@/contexts/AuthContext';
 import { useTranslation } from 'react-i18next';
@@ -87,7 +87,7 @@ type MenuEntry = {
 type MenuSection = { group: string; items: MenuEntry[] };
 
 export function AppSidebar() {
-  const { t } = useTranslation();
+  const { t, i18n } = useTranslation();
   const [location] = useLocation();
   const { user, logout, switchCompany } = useAuth();
   const { setOpenMobile, isMobile } = useSidebar();
@@ -107,7 +107,7 @@ export function AppSidebar() {
     ? companiesData.find(c => c.id === activeCompanyId) || companiesData[0]
     : null;
 
-  const menuItems: MenuSection[] = [
+  const menuItems: MenuSection[] = useMemo(() => [
     // ═══════════════════════════════════════════════════════════════
     // 1. MAIN - لوحة التحكم الرئيسية
     // ═══════════════════════════════════════════════════════════════
@@ -156,7 +156,7 @@ export function AppSidebar() {
     // 3. INVENTORY - المخزون (الأصناف والمستودعات)
     // ═══════════════════════════════════════════════════════════════
     {
-      group: t('navigation.inventory', { defaultValue: 'Inventory' }),
+      group: t('navigation.inventory'),
       items: [
         {
           id: 'items',
@@ -167,28 +167,28 @@ export function AppSidebar() {
         },
         {
           id: 'warehouses',
-          title: t('navigation.warehouses', { defaultValue: 'Warehouses' }),
+          title: t('navigation.warehouses'),
           href: '/inventory/warehouses',
           icon: Building,
           badge: null,
         },
         {
           id: 'adjustments',
-          title: t('navigation.stockAdjustments', { defaultValue: 'Stock Adjustments' }),
+          title: t('navigation.stockAdjustments'),
           href: '/inventory/adjustments',
           icon: ArrowRightLeft,
           badge: null,
         },
         {
           id: 'transfers',
-          title: t('navigation.stockTransfers', { defaultValue: 'Stock Transfers' }),
+          title: t('navigation.stockTransfers'),
           href: '/inventory/transfers',
           icon: ArrowRightLeft,
           badge: null,
         },
         {
           id: 'valuation',
-          title: t('navigation.valuation', { defaultValue: 'Valuation Report' }),
+          title: t('navigation.valuation'),
           href: '/inventory/valuation',
           icon: ChartBar,
           badge: null,
@@ -253,7 +253,7 @@ export function AppSidebar() {
         },
         {
           id: 'landed-cost',
-          title: t('navigation.landedCost', { defaultValue: 'Landed Costs' }),
+          title: t('navigation.landedCost'),
           href: '/inventory/landed-cost',
           icon: Calculator,
           badge: null,
@@ -303,7 +303,7 @@ export function AppSidebar() {
         },
         {
           id: 'checks',
-          title: t('navigation.checks', { defaultValue: 'Checks' }),
+          title: t('navigation.checks'),
           href: '/banking/checks',
           icon: FileCheck,
           badge: null,
@@ -321,45 +321,45 @@ export function AppSidebar() {
     // 7. ACCOUNTING - المحاسبة (القيود والعمليات المحاسبية)
     // ═══════════════════════════════════════════════════════════════
     {
-      group: t('navigation.accounting', { defaultValue: 'Accounting' }),
+      group: t('navigation.accounting'),
       items: [
         {
           id: 'journals',
-          title: t('navigation.manualJournals', { defaultValue: 'Manual Journals' }),
+          title: t('navigation.manualJournals'),
           href: '/journals',
           icon: FileText,
           badge: null,
         },
         {
           id: 'cost-centers',
-          title: t('navigation.costCenters', { defaultValue: 'Cost Centers' }),
+          title: t('navigation.costCenters'),
           href: '/accounting/cost-centers',
           icon: FolderTree,
           badge: null,
         },
         {
           id: 'assets',
-          title: t('navigation.fixedAssets', { defaultValue: 'Fixed Assets' }),
+          title: t('navigation.fixedAssets'),
           href: '/fixed-assets',
           icon: Landmark,
           badge: null,
         },
         {
           id: 'approvals',
-          title: t('approvals.title', { defaultValue: 'Approvals' }),
+          title: t('approvals.title'),
           href: '/approvals',
           icon: Shield,
           badge: null,
           subItems: [
             {
               id: 'approval-requests',
-              title: t('approvals.requests', { defaultValue: 'Requests' }),
+              title: t('approvals.requests'),
               href: '/approvals',
               icon: FileCheck,
             },
             {
               id: 'approval-settings',
-              title: t('approvals.settings', { defaultValue: 'Rules' }),
+              title: t('approvals.settings'),
               href: '/settings/approvals',
               icon: Settings,
             },
@@ -367,10 +367,10 @@ export function AppSidebar() {
         },
         {
           id: 'insights',
-          title: t('accounting.insights.title', { defaultValue: 'Auto Accountant' }),
+          title: t('accounting.insights.title'),
           href: '/accounting/insights',
           icon: BrainCircuit,
-          badge: <Badge variant="secondary" className="ml-auto text-[10px] h-4 px-1">{t('badges.ai', { defaultValue: 'AI' })}</Badge>,
+          badge: <Badge variant="secondary" className="ml-auto text-[10px] h-4 px-1">{t('badges.ai')}</Badge>,
         },
       ],
     },
@@ -378,24 +378,24 @@ export function AppSidebar() {
     // 8. BUDGETS & PROJECTS - الميزانيات والمشاريع
     // ═══════════════════════════════════════════════════════════════
     {
-      group: t('navigation.planning', { defaultValue: 'Planning' }),
+      group: t('navigation.planning'),
       items: [
         {
           id: 'budgets',
-          title: t('navigation.budgets', { defaultValue: 'Budgets' }),
+          title: t('navigation.budgets'),
           href: '/budgets',
           icon: PiggyBank,
           badge: null,
           subItems: [
             {
               id: 'budget-planning',
-              title: t('navigation.budgetPlanning', { defaultValue: 'Budget Planning' }),
+              title: t('navigation.budgetPlanning'),
               href: '/budgets',
               icon: Calculator,
             },
             {
               id: 'budget-vs-actual',
-              title: t('navigation.budgetVsActual', { defaultValue: 'Budget vs Actual' }),
+              title: t('navigation.budgetVsActual'),
               href: '/budgets/vs-actual',
               icon: BarChart3,
             },
@@ -403,20 +403,20 @@ export function AppSidebar() {
         },
         {
           id: 'projects',
-          title: t('navigation.projects', { defaultValue: 'Projects' }),
+          title: t('navigation.projects'),
           href: '/projects',
           icon: FolderKanban,
           badge: null,
           subItems: [
             {
               id: 'projects-list',
-              title: t('navigation.projectsList', { defaultValue: 'All Projects' }),
+              title: t('navigation.projectsList'),
               href: '/projects',
               icon: FolderKanban,
             },
             {
               id: 'projects-profitability',
-              title: t('navigation.projectsProfitability', { defaultValue: 'Profitability Report' }),
+              title: t('navigation.projectsProfitability'),
               href: '/projects/profitability',
               icon: BarChart3,
             },
@@ -428,18 +428,18 @@ export function AppSidebar() {
     // 9. MANUFACTURING - التصنيع
     // ═══════════════════════════════════════════════════════════════
     {
-      group: t('navigation.manufacturing', { defaultValue: 'Manufacturing' }),
+      group: t('navigation.manufacturing'),
       items: [
         {
           id: 'boms',
-          title: t('navigation.boms', { defaultValue: 'Bill of Materials' }),
+          title: t('navigation.boms'),
           href: '/manufacturing/boms',
           icon: Layers,
           badge: null,
         },
         {
           id: 'production-orders',
-          title: t('navigation.productionOrders', { defaultValue: 'Production Orders' }),
+          title: t('navigation.productionOrders'),
           href: '/manufacturing/orders',
           icon: Factory,
           badge: null,
@@ -450,25 +450,25 @@ export function AppSidebar() {
     // 10. HR & PAYROLL - الموارد البشرية والرواتب
     // ═══════════════════════════════════════════════════════════════
     {
-      group: t('navigation.hr', { defaultValue: 'HR & Payroll' }),
+      group: t('navigation.hr'),
       items: [
         {
           id: 'employees',
-          title: t('navigation.employees', { defaultValue: 'Employees' }),
+          title: t('navigation.employees'),
           href: '/hr/employees',
           icon: Users2,
           badge: null,
         },
         {
           id: 'departments',
-          title: t('navigation.departments', { defaultValue: 'Departments' }),
+          title: t('navigation.departments'),
           href: '/hr/departments',
           icon: Briefcase,
           badge: null,
         },
         {
           id: 'payroll',
-          title: t('navigation.payroll', { defaultValue: 'Payroll' }),
+          title: t('navigation.payroll'),
           href: '/hr/payroll',
           icon: Banknote,
           badge: null,
@@ -484,7 +484,7 @@ export function AppSidebar() {
         // --- القوائم المالية الرئيسية (الثلاث الأساسية) ---
         {
           id: 'financial-statements',
-          title: t('navigation.financialStatements', { defaultValue: 'Financial Statements' }),
+          title: t('navigation.financialStatements'),
           href: '/reports/balance-sheet',
           icon: BarChart3,
           badge: null,
@@ -518,7 +518,7 @@ export function AppSidebar() {
         // --- التقارير المحاسبية التفصيلية ---
         {
           id: 'accounting-reports',
-          title: t('navigation.accountingReports', { defaultValue: 'Accounting Reports' }),
+          title: t('navigation.accountingReports'),
           href: '/reports/trial-balance',
           icon: Calculator,
           badge: null,
@@ -546,7 +546,7 @@ export function AppSidebar() {
         // --- تقارير العملاء والموردين ---
         {
           id: 'receivables-payables',
-          title: t('navigation.receivablesPayables', { defaultValue: 'Receivables & Payables' }),
+          title: t('navigation.receivablesPayables'),
           href: '/reports/aging',
           icon: Users2,
           badge: null,
@@ -581,31 +581,31 @@ export function AppSidebar() {
           subItems: [
             {
               id: 'tax-overview',
-              title: t('navigation.taxOverview', { defaultValue: 'Tax Overview' }),
+              title: t('navigation.taxOverview'),
               href: '/reports/tax',
               icon: Receipt,
             },
             {
               id: 'vat-report',
-              title: t('navigation.vatReport', { defaultValue: 'VAT Report' }),
+              title: t('navigation.vatReport'),
               href: '/reports/tax/vat',
               icon: Receipt,
             },
             {
               id: 'corporate-tax-report',
-              title: t('navigation.corporateTaxReport', { defaultValue: 'Corporate Tax Report' }),
+              title: t('navigation.corporateTaxReport'),
               href: '/reports/tax/corporate',
               icon: Receipt,
             },
             {
               id: 'withholding-tax-report',
-              title: t('navigation.withholdingTaxReport', { defaultValue: 'Withholding Tax Report' }),
+              title: t('navigation.withholdingTaxReport'),
               href: '/reports/tax/withholding',
               icon: Receipt,
             },
             {
               id: 'other-taxes',
-              title: t('navigation.otherTaxes', { defaultValue: 'Other Taxes' }),
+              title: t('navigation.otherTaxes'),
               href: '/reports/tax/other',
               icon: Receipt,
             },
@@ -622,7 +622,7 @@ export function AppSidebar() {
         // --- التحليل المالي ---
         {
           id: 'financial-analysis',
-          title: t('navigation.financialAnalysis', { defaultValue: 'Financial Analysis' }),
+          title: t('navigation.financialAnalysis'),
           href: '/reports/financial-ratios',
           icon: Activity,
           badge: null,
@@ -641,7 +641,7 @@ export function AppSidebar() {
             },
             {
               id: 'esg-report',
-              title: t('navigation.esgReport', { defaultValue: 'ESG Report' }),
+              title: t('navigation.esgReport'),
               href: '/reports/esg',
               icon: Globe,
             },
@@ -650,20 +650,20 @@ export function AppSidebar() {
         // --- التقارير الذكية (AI) ---
         {
           id: 'ai-reports',
-          title: t('navigation.aiReports', { defaultValue: 'AI Reports' }),
+          title: t('navigation.aiReports'),
           href: '/reports/ai-analytics',
           icon: BrainCircuit,
-          badge: <Badge variant="secondary" className="ml-auto text-[10px] h-4 px-1">{t('badges.ai', { defaultValue: 'AI' })}</Badge>,
+          badge: <Badge variant="secondary" className="ml-auto text-[10px] h-4 px-1">{t('badges.ai')}</Badge>,
           subItems: [
             {
               id: 'ai-analytics',
-              title: t('navigation.aiAnalytics', { defaultValue: 'AI Analytics' }),
+              title: t('navigation.aiAnalytics'),
               href: '/reports/ai-analytics',
               icon: ChartBar,
             },
             {
               id: 'cash-flow-forecast',
-              title: t('navigation.cashFlowForecast', { defaultValue: 'Cash Flow Forecast' }),
+              title: t('navigation.cashFlowForecast'),
               href: '/reports/cash-flow-forecast',
               icon: ChartBar,
             },
@@ -675,18 +675,18 @@ export function AppSidebar() {
     // 12. PORTALS - البوابات الخارجية
     // ═══════════════════════════════════════════════════════════════
     {
-      group: t('navigation.portals', { defaultValue: 'Portals' }),
+      group: t('navigation.portals'),
       items: [
         {
           id: 'portal-dashboard',
-          title: t('navigation.portalDashboard', { defaultValue: 'Portal Dashboard' }),
+          title: t('navigation.portalDashboard'),
           href: '/portal/dashboard',
           icon: Globe,
           badge: null,
         },
         {
           id: 'portal-documents',
-          title: t('navigation.portalDocuments', { defaultValue: 'Portal Documents' }),
+          title: t('navigation.portalDocuments'),
           href: '/portal/documents',
           icon: FileText,
           badge: null,
@@ -697,39 +697,39 @@ export function AppSidebar() {
     // 13. TOOLS - أدوات متقدمة
     // ═══════════════════════════════════════════════════════════════
     {
-      group: t('navigation.tools', { defaultValue: 'Tools' }),
+      group: t('navigation.tools'),
       items: [
         {
           id: 'global-search',
-          title: t('navigation.globalSearch', { defaultValue: 'Global Search' }),
+          title: t('navigation.globalSearch'),
           href: '/search',
           icon: Search,
           badge: null,
         },
         {
           id: 'quick-entry',
-          title: t('navigation.quickEntry', { defaultValue: 'Quick Entry' }),
+          title: t('navigation.quickEntry'),
           href: '/quick-entry',
           icon: Plus,
           badge: null,
         },
         {
           id: 'data-import',
-          title: t('navigation.dataImport', { defaultValue: 'Data Import' }),
+          title: t('navigation.dataImport'),
           href: '/import',
           icon: Upload,
           badge: null,
         },
         {
           id: 'batch-operations',
-          title: t('navigation.batchOperations', { defaultValue: 'Batch Operations' }),
+          title: t('navigation.batchOperations'),
           href: '/batch',
           icon: Layers,
           badge: null,
         },
         {
           id: 'advanced-features',
-          title: t('navigation.advancedFeatures', { defaultValue: 'Advanced Features' }),
+          title: t('navigation.advancedFeatures'),
           href: '/advanced',
           icon: Sparkles,
           badge: null,
@@ -751,35 +751,35 @@ export function AppSidebar() {
         },
         {
           id: 'default-accounts',
-          title: t('settings.defaultAccounts', { defaultValue: 'Default Accounts' }),
+          title: t('settings.defaultAccounts'),
           href: '/settings/accounts',
           icon: BookOpen,
           badge: null,
         },
         {
           id: 'currencies',
-          title: t('navigation.currencies', { defaultValue: 'Currencies' }),
+          title: t('navigation.currencies'),
           href: '/settings/currencies',
           icon: Globe,
           badge: null,
         },
         {
           id: 'tax-settings',
-          title: t('navigation.taxSettings', { defaultValue: 'Tax Settings' }),
+          title: t('navigation.taxSettings'),
           href: '/settings/taxes',
           icon: Receipt,
           badge: null,
         },
         {
           id: 'ai-settings',
-          title: t('navigation.aiSettings', { defaultValue: 'AI Settings' }),
+          title: t('navigation.aiSettings'),
           href: '/settings/ai',
           icon: Settings,
           badge: null,
         },
         {
           id: 'legal',
-          title: t('navigation.legalSettings', { defaultValue: 'Legal' }),
+          title: t('navigation.legalSettings'),
           href: '/settings/legal',
           icon: Shield,
           badge: null,
@@ -800,24 +800,24 @@ export function AppSidebar() {
         },
         {
           id: 'user-guide',
-          title: t('navigation.userGuide', { defaultValue: 'User Guide' }),
+          title: t('navigation.userGuide'),
           href: '/user-guide',
           icon: HelpCircle,
           badge: null,
         },
       ],
     },
-  ];
+  ], [t, i18n.language]);
 
   // Conditionally add Admin group for owner/admin roles
   const canAdmin = user?.role === 'owner' || user?.role === 'admin';
   const adminGroup: MenuSection | null = canAdmin
     ? ({
-        group: t('navigation.admin', { defaultValue: 'Admin' }),
+        group: t('navigation.admin'),
         items: [
           {
             id: 'audit-logs',
-            title: t('navigation.auditLogs', { defaultValue: 'Audit Logs' }),
+            title: t('navigation.auditLogs'),
             href: '/admin/audit-logs',
             icon: Shield,
             badge: null,
@@ -472,7 +472,7 @@ export function BillFormDialog({ open, onOpenChange, onSuccess, editBillId }: Bi
                 <Input
                   value={supplierReference}
                   onChange={(e) => setSupplierReference(e.target.value)}
-                  placeholder={t('purchases.bills.supplierReferencePlaceholder', { defaultValue: 'INV-001' })}
+                  placeholder={t('purchases.bills.supplierReferencePlaceholder')}
                 />
               </div>
 
@@ -121,7 +121,7 @@ export function BulkActions({
         />
         
         <span className="text-sm font-medium">
-          {t('bulk.selected', '{{count}} selected', { count: selectedIds.length })}
+          {t('bulk.selected', { count: selectedIds.length })}
         </span>
 
         <div className="flex-1" />
@@ -129,7 +129,7 @@ export function BulkActions({
         <DropdownMenu>
           <DropdownMenuTrigger asChild>
             <Button variant="outline" size="sm" disabled={isLoading || executing}>
-              {t('bulk.actions', 'Actions')}
+              {t('bulk.actions')}
               <ChevronDown className="h-4 w-4 ms-2" />
             </Button>
           </DropdownMenuTrigger>
@@ -152,7 +152,7 @@ export function BulkActions({
         </DropdownMenu>
 
         <Button variant="ghost" size="sm" onClick={() => onSelectionChange([])}>
-          {t('bulk.clearSelection', 'Clear')}
+          {t('bulk.clearSelection')}
         </Button>
       </div>
 
@@ -161,11 +161,11 @@ export function BulkActions({
         <AlertDialogContent>
           <AlertDialogHeader>
             <AlertDialogTitle>
-              {confirmAction?.confirmTitle || t('bulk.confirmTitle', 'Confirm Action')}
+              {confirmAction?.confirmTitle || t('bulk.confirmTitle')}
             </AlertDialogTitle>
             <AlertDialogDescription>
               {confirmAction?.confirmDescription || 
-                t('bulk.confirmDescription', 'Are you sure you want to {{action}} {{count}} items? This action cannot be undone.', {
+                t('bulk.confirmDescription', {
                   action: confirmAction?.label.toLowerCase(),
                   count: selectedIds.length
                 })
@@ -54,7 +54,7 @@ interface CommandAction {
 }
 
 export function CommandPalette({ open, onOpenChange, onShowShortcuts }: CommandPaletteProps) {
-  const { t } = useTranslation();
+  const { t, i18n } = useTranslation();
   const [, navigate] = useLocation();
   const [search, setSearch] = useState('');
 
@@ -74,19 +74,19 @@ export function CommandPalette({ open, onOpenChange, onShowShortcuts }: CommandP
     { id: 'assets', label: t('sidebar.assets'), icon: Building2, keywords: ['fixed assets', 'depreciation'], action: () => navigate('/assets'), group: 'navigation' },
     
     // Quick Create
-    { id: 'new-invoice', label: t('quickActions.newInvoice', 'New Invoice'), icon: Plus, keywords: ['create', 'add'], action: () => navigate('/sales/invoices/new'), group: 'create' },
-    { id: 'new-bill', label: t('quickActions.newBill', 'New Bill'), icon: Plus, keywords: ['create', 'add', 'expense'], action: () => navigate('/purchases/bills/new'), group: 'create' },
-    { id: 'new-journal', label: t('quickActions.newJournal', 'New Journal Entry'), icon: Plus, keywords: ['create', 'add', 'entry'], action: () => navigate('/journals/new'), group: 'create' },
-    { id: 'new-contact', label: t('quickActions.newContact', 'New Contact'), icon: Plus, keywords: ['create', 'add', 'customer', 'supplier'], action: () => navigate('/contacts?new=true'), group: 'create' },
-    { id: 'new-item', label: t('quickActions.newItem', 'New Item'), icon: Plus, keywords: ['create', 'add', 'product'], action: () => navigate('/items?new=true'), group: 'create' },
-    { id: 'new-project', label: t('quickActions.newProject', 'New Project'), icon: Plus, keywords: ['create', 'add'], action: () => navigate('/projects?new=true'), group: 'create' },
+    { id: 'new-invoice', label: t('quickActions.newInvoice'), icon: Plus, keywords: ['create', 'add'], action: () => navigate('/sales/invoices/new'), group: 'create' },
+    { id: 'new-bill', label: t('quickActions.newBill'), icon: Plus, keywords: ['create', 'add', 'expense'], action: () => navigate('/purchases/bills/new'), group: 'create' },
+    { id: 'new-journal', label: t('quickActions.newJournal'), icon: Plus, keywords: ['create', 'add', 'entry'], action: () => navigate('/journals/new'), group: 'create' },
+    { id: 'new-contact', label: t('quickActions.newContact'), icon: Plus, keywords: ['create', 'add', 'customer', 'supplier'], action: () => navigate('/contacts?new=true'), group: 'create' },
+    { id: 'new-item', label: t('quickActions.newItem'), icon: Plus, keywords: ['create', 'add', 'product'], action: () => navigate('/items?new=true'), group: 'create' },
+    { id: 'new-project', label: t('quickActions.newProject'), icon: Plus, keywords: ['create', 'add'], action: () => navigate('/projects?new=true'), group: 'create' },
     
     // Reports
     { id: 'trial-balance', label: t('reports.trialBalance'), icon: BarChart3, keywords: ['report', 'tb'], action: () => navigate('/reports/trial-balance'), group: 'reports' },
     { id: 'balance-sheet', label: t('reports.balanceSheet'), icon: FileSpreadsheet, keywords: ['report', 'bs', 'financial'], action: () => navigate('/reports/balance-sheet'), group: 'reports' },
     { id: 'income-statement', label: t('reports.incomeStatement'), icon: BarChart3, keywords: ['report', 'pnl', 'profit', 'loss'], action: () => navigate('/reports/income-statement'), group: 'reports' },
     { id: 'cash-flow', label: t('reports.cashFlow'), icon: Wallet, keywords: ['report', 'cf'], action: () => navigate('/reports/cash-flow'), group: 'reports' },
-    { id: 'tax-report', label: t('reports.taxReport', 'Tax Report'), icon: Receipt, keywords: ['vat', 'tax'], action: () => navigate('/reports/tax'), group: 'reports' },
+    { id: 'tax-report', label: t('reports.taxReport'), icon: Receipt, keywords: ['vat', 'tax'], action: () => navigate('/reports/tax'), group: 'reports' },
     
     // Settings
     { id: 'settings', label: t('sidebar.settings'), icon: Settings, keywords: ['preferences', 'config'], action: () => navigate('/settings'), group: 'settings' },
@@ -95,8 +95,8 @@ export function CommandPalette({ open, onOpenChange, onShowShortcuts }: CommandP
     { id: 'currencies', label: t('settings.currencies'), icon: CreditCard, keywords: ['exchange', 'rates'], action: () => navigate('/settings/currencies'), group: 'settings' },
     
     // Help
-    { id: 'shortcuts', label: t('shortcuts.title', 'Keyboard Shortcuts'), icon: Keyboard, keywords: ['hotkeys', 'keys'], action: () => onShowShortcuts?.(), group: 'help' },
-    { id: 'user-guide', label: t('help.userGuide', 'User Guide'), icon: HelpCircle, keywords: ['documentation', 'help'], action: () => navigate('/user-guide'), group: 'help' },
+    { id: 'shortcuts', label: t('shortcuts.title'), icon: Keyboard, keywords: ['hotkeys', 'keys'], action: () => onShowShortcuts?.(), group: 'help' },
+    { id: 'user-guide', label: t('help.userGuide'), icon: HelpCircle, keywords: ['documentation', 'help'], action: () => navigate('/user-guide'), group: 'help' },
   ], [t, navigate, onShowShortcuts]);
 
   // Filter commands based on search
@@ -141,23 +141,23 @@ export function CommandPalette({ open, onOpenChange, onShowShortcuts }: CommandP
     action();
   };
 
-  const groupLabels: Record<string, string> = {
-    navigation: t('commandPalette.navigation', 'Navigation'),
-    create: t('commandPalette.quickCreate', 'Quick Create'),
-    reports: t('commandPalette.reports', 'Reports'),
-    settings: t('commandPalette.settings', 'Settings'),
-    help: t('commandPalette.help', 'Help'),
-  };
+  const groupLabels: Record<string, string> = useMemo(() => ({
+    navigation: t('commandPalette.navigation'),
+    create: t('commandPalette.quickCreate'),
+    reports: t('commandPalette.reports'),
+    settings: t('commandPalette.settings'),
+    help: t('commandPalette.help'),
+  }), [t, i18n.language]);
 
   return (
     <CommandDialog open={open} onOpenChange={onOpenChange}>
       <CommandInput 
-        placeholder={t('commandPalette.placeholder', 'Type a command or search...')}
+        placeholder={t('commandPalette.placeholder')}
         value={search}
         onValueChange={setSearch}
       />
       <CommandList>
-        <CommandEmpty>{t('commandPalette.noResults', 'No results found.')}</CommandEmpty>
+        <CommandEmpty>{t('commandPalette.noResults')}</CommandEmpty>
         
         {Object.entries(groupedCommands).map(([group, items]) => {
           if (items.length === 0) return null;
@@ -180,12 +180,12 @@ export function CommandPalette({ open, onOpenChange, onShowShortcuts }: CommandP
       </CommandList>
       
       <div className="border-t p-2 text-xs text-muted-foreground flex items-center justify-between">
-        <span>{t('commandPalette.tip', 'Tip: Use ⌘K to open anytime')}</span>
+        <span>{t('commandPalette.tip')}</span>
         <span className="flex items-center gap-1">
           <kbd className="px-1.5 py-0.5 bg-muted rounded text-xs">↑↓</kbd>
-          <span>{t('commandPalette.navigate', 'navigate')}</span>
+          <span>{t('commandPalette.navigate')}</span>
           <kbd className="px-1.5 py-0.5 bg-muted rounded text-xs ms-2">↵</kbd>
-          <span>{t('commandPalette.select', 'select')}</span>
+          <span>{t('commandPalette.select')}</span>
         </span>
       </div>
     </CommandDialog>
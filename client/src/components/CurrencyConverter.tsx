@@ -111,7 +111,7 @@ export function CurrencyConverter({ className, compact = false }: CurrencyConver
     return (
       <Card className={className}>
         <CardHeader className="pb-3">
-          <CardTitle className="text-lg">{t('currency.converter', 'Currency Converter')}</CardTitle>
+          <CardTitle className="text-lg">{t('currency.converter')}</CardTitle>
         </CardHeader>
         <CardContent className="space-y-4">
           <Skeleton className="h-10 w-full" />
@@ -167,7 +167,7 @@ export function CurrencyConverter({ className, compact = false }: CurrencyConver
         <div className="flex items-center justify-between">
           <CardTitle className="text-lg flex items-center gap-2">
             <ArrowRightLeft className="h-5 w-5" />
-            {t('currency.converter', 'Currency Converter')}
+            {t('currency.converter')}
           </CardTitle>
           <Button variant="ghost" size="sm" onClick={() => refetch()}>
             <RefreshCw className="h-4 w-4" />
@@ -177,7 +177,7 @@ export function CurrencyConverter({ className, compact = false }: CurrencyConver
       <CardContent className="space-y-4">
         {/* Amount Input */}
         <div className="space-y-2">
-          <Label>{t('currency.amount', 'Amount')}</Label>
+          <Label>{t('currency.amount')}</Label>
           <Input
             type="number"
             value={amount}
@@ -189,7 +189,7 @@ export function CurrencyConverter({ className, compact = false }: CurrencyConver
         {/* Currency Selection */}
         <div className="grid grid-cols-[1fr,auto,1fr] items-end gap-2">
           <div className="space-y-2">
-            <Label>{t('currency.from', 'From')}</Label>
+            <Label>{t('currency.from')}</Label>
             <Select value={fromCurrency} onValueChange={setFromCurrency}>
               <SelectTrigger>
                 <SelectValue />
@@ -207,7 +207,7 @@ export function CurrencyConverter({ className, compact = false }: CurrencyConver
           </Button>
 
           <div className="space-y-2">
-            <Label>{t('currency.to', 'To')}</Label>
+            <Label>{t('currency.to')}</Label>
             <Select value={toCurrency} onValueChange={setToCurrency}>
               <SelectTrigger>
                 <SelectValue />
@@ -224,12 +224,12 @@ export function CurrencyConverter({ className, compact = false }: CurrencyConver
         {/* Result */}
         <div className="p-4 rounded-lg bg-primary/5 border">
           <div className="text-sm text-muted-foreground mb-1">
-            {t('currency.result', 'Converted Amount')}
+            {t('currency.result')}
           </div>
           <div className="text-2xl font-bold">
             {convertedAmount !== null 
               ? formatCurrency(convertedAmount, toCurrency)
-              : t('currency.noRate', 'Rate not available')
+              : t('currency.noRate')
             }
           </div>
           {convertedAmount !== null && parseFloat(amount) > 0 && (
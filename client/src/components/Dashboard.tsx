@@ -42,6 +42,7 @@ import {
   Line,
 } from "recharts";
 import { exportToCsv } from "@/utils/export";
+import { useMemo } from "react";
 
 // Types for Dashboard API response
 interface DashboardData {
@@ -107,7 +108,7 @@ const getTransactionIcon = (type: string) => {
 };
 
 export function Dashboard() {
-  const { t } = useTranslation();
+  const { t, i18n } = useTranslation();
   const companyCurrency = useCompanyCurrency();
   const [, setLocation] = useLocation();
   
@@ -139,7 +140,7 @@ export function Dashboard() {
   const recentTransactions = dashboardData?.recentTransactions || [];
   
   // KPI data from API
-  const kpiData = [
+  const kpiData = useMemo(() => [
     {
       title: t('dashboard.totalCash'),
       value: formatCurrency(kpis.totalCash || 0),
@@ -172,7 +173,7 @@ export function Dashboard() {
       icon: TrendingUp,
       color: "text-green-600",
     },
-  ];
+  ], [t, i18n.language, formatCurrency, kpis]);
   
   const handleSyncNow = async () => {
     await refetch();
@@ -181,7 +182,7 @@ export function Dashboard() {
   const handleExport = () => {
     try {
       // Export a lightweight snapshot of current dashboard KPIs and any available series
-      const headers: string[] = [t('dashboard.metric', { defaultValue: 'Metric' }), t('dashboard.value', { defaultValue: 'Value' })];
+      const headers: string[] = [t('dashboard.metric'), t('dashboard.value')];
       const kpiRows = kpiData.map((k) => [k.title, k.value]);
 
       // Build a single CSV with simple section separators
@@ -191,20 +192,20 @@ export function Dashboard() {
 
       // Add a blank line and a section for Monthly Revenue vs Expenses if present
       if (monthlyRevenueData.length > 0) {
-        rows.push([], [t('dashboard.revenueVsExpenses', { defaultValue: 'Revenue vs Expenses' }), '']);
-        rows.push([t('common.month', { defaultValue: 'Month' }), t('dashboard.revenue', { defaultValue: 'Revenue' }), t('dashboard.expenses', { defaultValue: 'Expenses' })]);
+        rows.push([], [t('dashboard.revenueVsExpenses'), '']);
+        rows.push([t('common.month'), t('dashboard.revenue'), t('dashboard.expenses')]);
         for (const pt of monthlyRevenueData) rows.push([pt.month, pt.revenue ?? 0, pt.expenses ?? 0]);
       }
 
       // Add a recent transactions section if present
       if (recentTransactions.length > 0) {
-        rows.push([], [t('dashboard.recentTransactions', { defaultValue: 'Recent Transactions' }), '']);
+        rows.push([], [t('dashboard.recentTransactions'), '']);
         rows.push([
-          t('common.date', { defaultValue: 'Date' }),
-          t('common.type', { defaultValue: 'Type' }),
-          t('common.description', { defaultValue: 'Description' }),
-          t('common.amount', { defaultValue: 'Amount' }),
-          t('common.status', { defaultValue: 'Status' }),
+          t('common.date'),
+          t('common.type'),
+          t('common.description'),
+          t('common.amount'),
+          t('common.status'),
         ]);
         for (const tx of recentTransactions) rows.push([tx.date, tx.type, tx.description, tx.amount, tx.status]);
       }
@@ -3,7 +3,7 @@
  * Professional sortable, filterable data table
  */
 import { useState, useMemo, useCallback } from 'react';
-import { useTranslation } from 'react-i18next';
+import { useTypedTranslation } from '@/hooks/useTypedTranslation';
 import {
   Table,
   TableBody,
@@ -64,7 +64,7 @@ export function DataTable<T extends { id: string }>({
   emptyMessage,
   className,
 }: DataTableProps<T>) {
-  const { t } = useTranslation();
+  const { t } = useTypedTranslation();
   const [sortKey, setSortKey] = useState<string | null>(null);
   const [sortDirection, setSortDirection] = useState<SortDirection>(null);
   const [currentPage, setCurrentPage] = useState(1);
@@ -262,7 +262,7 @@ export function DataTable<T extends { id: string }>({
       {pagination && totalPages > 1 && (
         <div className="flex items-center justify-between px-2">
           <div className="flex items-center gap-2 text-sm text-muted-foreground">
-            <span>{t('table.rowsPerPage', 'Rows per page')}</span>
+            <span>{t('table.rowsPerPage')}</span>
             <Select value={String(pageSize)} onValueChange={(v) => {
               setPageSize(Number(v));
               setCurrentPage(1);
@@ -280,7 +280,7 @@ export function DataTable<T extends { id: string }>({
 
           <div className="flex items-center gap-2">
             <span className="text-sm text-muted-foreground">
-              {t('table.pageInfo', 'Page {{current}} of {{total}}', { 
+              {t('table.pageInfo', { 
                 current: currentPage, 
                 total: totalPages 
               })}
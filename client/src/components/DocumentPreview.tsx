@@ -173,10 +173,10 @@ export function DocumentPreview({
           {error && (
             <div className="text-center text-muted-foreground">
               <File className="h-16 w-16 mx-auto mb-4" />
-              <p>{t('preview.loadError', 'Failed to load document')}</p>
+              <p>{t('preview.loadError')}</p>
               <Button variant="outline" className="mt-4" onClick={handleDownload}>
                 <Download className="h-4 w-4 mr-2" />
-                {t('preview.downloadInstead', 'Download instead')}
+                {t('preview.downloadInstead')}
               </Button>
             </div>
           )}
@@ -216,10 +216,10 @@ export function DocumentPreview({
           {fileType === 'other' && (
             <div className="text-center text-muted-foreground">
               <File className="h-16 w-16 mx-auto mb-4" />
-              <p>{t('preview.unsupportedFormat', 'Preview not available for this file type')}</p>
+              <p>{t('preview.unsupportedFormat')}</p>
               <Button variant="outline" className="mt-4" onClick={handleDownload}>
                 <Download className="h-4 w-4 mr-2" />
-                {t('preview.download', 'Download')}
+                {t('preview.download')}
               </Button>
             </div>
           )}
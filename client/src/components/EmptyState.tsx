@@ -140,13 +140,13 @@ export function NoSearchResults({
   return (
     <EmptyState
       icon={<Search className="h-8 w-8 text-muted-foreground" />}
-      title={t('empty.noResults', 'No results found')}
+      title={t('empty.noResults')}
       description={query 
-        ? t('empty.noResultsFor', 'No results found for "{{query}}"', { query })
-        : t('empty.tryDifferentSearch', 'Try adjusting your search or filters')
+        ? t('empty.noResultsFor', { query })
+        : t('empty.tryDifferentSearch')
       }
       action={onClear ? {
-        label: t('empty.clearSearch', 'Clear search'),
+        label: t('empty.clearSearch'),
         onClick: onClear,
       } : undefined}
       variant="compact"
@@ -159,10 +159,10 @@ export function NoInvoices({ onCreate }: { onCreate?: () => void }) {
   return (
     <EmptyState
       icon={<FileText className="h-10 w-10 text-muted-foreground" />}
-      title={t('empty.noInvoices', 'No invoices yet')}
-      description={t('empty.noInvoicesDesc', 'Create your first invoice to start tracking your sales')}
+      title={t('empty.noInvoices')}
+      description={t('empty.noInvoicesDesc')}
       action={onCreate ? {
-        label: t('empty.createInvoice', 'Create Invoice'),
+        label: t('empty.createInvoice'),
         onClick: onCreate,
         icon: <Plus className="h-4 w-4 mr-2" />,
       } : undefined}
@@ -175,10 +175,10 @@ export function NoContacts({ onCreate }: { onCreate?: () => void }) {
   return (
     <EmptyState
       icon={<Users className="h-10 w-10 text-muted-foreground" />}
-      title={t('empty.noContacts', 'No contacts yet')}
-      description={t('empty.noContactsDesc', 'Add customers and suppliers to manage your business relationships')}
+      title={t('empty.noContacts')}
+      description={t('empty.noContactsDesc')}
       action={onCreate ? {
-        label: t('empty.addContact', 'Add Contact'),
+        label: t('empty.addContact'),
         onClick: onCreate,
         icon: <Plus className="h-4 w-4 mr-2" />,
       } : undefined}
@@ -191,10 +191,10 @@ export function NoItems({ onCreate }: { onCreate?: () => void }) {
   return (
     <EmptyState
       icon={<Package className="h-10 w-10 text-muted-foreground" />}
-      title={t('empty.noItems', 'No items yet')}
-      description={t('empty.noItemsDesc', 'Add products and services to include in your invoices')}
+      title={t('empty.noItems')}
+      description={t('empty.noItemsDesc')}
       action={onCreate ? {
-        label: t('empty.addItem', 'Add Item'),
+        label: t('empty.addItem'),
         onClick: onCreate,
         icon: <Plus className="h-4 w-4 mr-2" />,
       } : undefined}
@@ -207,10 +207,10 @@ export function NoTransactions({ onCreate }: { onCreate?: () => void }) {
   return (
     <EmptyState
       icon={<DollarSign className="h-10 w-10 text-muted-foreground" />}
-      title={t('empty.noTransactions', 'No transactions yet')}
-      description={t('empty.noTransactionsDesc', 'Record payments and receipts to track your cash flow')}
+      title={t('empty.noTransactions')}
+      description={t('empty.noTransactionsDesc')}
       action={onCreate ? {
-        label: t('empty.addTransaction', 'Add Transaction'),
+        label: t('empty.addTransaction'),
         onClick: onCreate,
         icon: <Plus className="h-4 w-4 mr-2" />,
       } : undefined}
@@ -223,10 +223,10 @@ export function NoOrders({ onCreate }: { onCreate?: () => void }) {
   return (
     <EmptyState
       icon={<ShoppingCart className="h-10 w-10 text-muted-foreground" />}
-      title={t('empty.noOrders', 'No orders yet')}
-      description={t('empty.noOrdersDesc', 'Create orders to track your sales before invoicing')}
+      title={t('empty.noOrders')}
+      description={t('empty.noOrdersDesc')}
       action={onCreate ? {
-        label: t('empty.createOrder', 'Create Order'),
+        label: t('empty.createOrder'),
         onClick: onCreate,
         icon: <Plus className="h-4 w-4 mr-2" />,
       } : undefined}
@@ -239,10 +239,10 @@ export function NoReports({ onGenerate }: { onGenerate?: () => void }) {
   return (
     <EmptyState
       icon={<BarChart3 className="h-10 w-10 text-muted-foreground" />}
-      title={t('empty.noReports', 'No data for this period')}
-      description={t('empty.noReportsDesc', 'Try selecting a different date range or add transactions first')}
+      title={t('empty.noReports')}
+      description={t('empty.noReportsDesc')}
       action={onGenerate ? {
-        label: t('empty.generateReport', 'Generate Report'),
+        label: t('empty.generateReport'),
         onClick: onGenerate,
       } : undefined}
     />
@@ -77,17 +77,17 @@ export function ExportDialog({
         <DialogHeader>
           <DialogTitle className="flex items-center gap-2">
             <Download className="h-5 w-5" />
-            {t('export.title', 'Export Data')}
+            {t('export.title')}
           </DialogTitle>
           <DialogDescription>
-            {t('export.description', 'Choose export format and options')}
+            {t('export.description')}
           </DialogDescription>
         </DialogHeader>
 
         <div className="space-y-6 py-4">
           {/* Format Selection */}
           <div className="space-y-3">
-            <Label>{t('export.format', 'Format')}</Label>
+            <Label>{t('export.format')}</Label>
             <RadioGroup 
               value={format} 
               onValueChange={(v) => setFormat(v as ExportFormat)}
@@ -116,12 +116,12 @@ export function ExportDialog({
 
           {/* Filename */}
           <div className="space-y-2">
-            <Label htmlFor="filename">{t('export.filename', 'Filename')}</Label>
+            <Label htmlFor="filename">{t('export.filename')}</Label>
             <Input
               id="filename"
               value={filename}
               onChange={(e) => setFilename(e.target.value)}
-              placeholder={t('export.filenamePlaceholder', 'Enter filename')}
+              placeholder={t('export.filenamePlaceholder')}
             />
           </div>
 
@@ -129,7 +129,7 @@ export function ExportDialog({
           <div className="space-y-3">
             <Label className="flex items-center gap-2">
               <Settings2 className="h-4 w-4" />
-              {t('export.options', 'Options')}
+              {t('export.options')}
             </Label>
             
             <div className="flex items-center space-x-2">
@@ -139,7 +139,7 @@ export function ExportDialog({
                 onCheckedChange={(checked) => setIncludeTitle(checked as boolean)}
               />
               <Label htmlFor="includeTitle" className="text-sm font-normal cursor-pointer">
-                {t('export.includeTitle', 'Include report title')}
+                {t('export.includeTitle')}
               </Label>
             </div>
           </div>
@@ -147,11 +147,11 @@ export function ExportDialog({
           {/* Summary */}
           <div className="p-3 rounded-lg bg-muted text-sm">
             <div className="flex justify-between">
-              <span className="text-muted-foreground">{t('export.rows', 'Rows')}</span>
+              <span className="text-muted-foreground">{t('export.rows')}</span>
               <span className="font-medium">{data.length}</span>
             </div>
             <div className="flex justify-between mt-1">
-              <span className="text-muted-foreground">{t('export.columns', 'Columns')}</span>
+              <span className="text-muted-foreground">{t('export.columns')}</span>
               <span className="font-medium">{columns.length}</span>
             </div>
           </div>
@@ -165,12 +165,12 @@ export function ExportDialog({
             {isExporting ? (
               <>
                 <span className="animate-spin me-2">⏳</span>
-                {t('export.exporting', 'Exporting...')}
+                {t('export.exporting')}
               </>
             ) : (
               <>
                 <Download className="h-4 w-4 me-2" />
-                {t('export.export', 'Export')}
+                {t('export.export')}
               </>
             )}
           </Button>
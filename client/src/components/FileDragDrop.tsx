@@ -3,7 +3,7 @@
  * Enterprise file upload with drag-and-drop support
  */
 import { useState, useCallback, useRef } from 'react';
-import { useTranslation } from 'react-i18next';
+import { useTypedTranslation } from '@/hooks/useTypedTranslation';
 import { Button } from '@/components/ui/button';
 import { Progress } from '@/components/ui/progress';
 import { cn } from '@/lib/utils';
@@ -56,7 +56,7 @@ export function FileDragDrop({
   value = [],
   onChange,
 }: FileDragDropProps) {
-  const { t } = useTranslation();
+  const { t } = useTypedTranslation();
   const [isDragging, setIsDragging] = useState(false);
   const [files, setFiles] = useState<FileWithPreview[]>(value);
   const [isUploading, setIsUploading] = useState(false);
@@ -85,7 +85,7 @@ export function FileDragDrop({
 
   const validateFile = (file: File): string | null => {
     if (file.size > maxSizeBytes) {
-      return t('upload.fileTooLarge', 'File exceeds {{size}}MB limit', { size: maxSize });
+      return t('upload.fileTooLarge', { size: maxSize });
     }
     if (accept[0] !== '*/*') {
       const fileType = file.type || 'application/octet-stream';
@@ -96,7 +96,7 @@ export function FileDragDrop({
         return fileType === type || file.name.endsWith(type.replace('*', ''));
       });
       if (!isAccepted) {
-        return t('upload.invalidType', 'File type not allowed');
+        return t('upload.invalidType');
       }
     }
     return null;
@@ -238,12 +238,12 @@ export function FileDragDrop({
           <div>
             <p className="font-medium">
               {isDragging
-                ? t('upload.dropHere', 'Drop files here')
-                : t('upload.dragOrClick', 'Drag files here or click to browse')}
+                ? t('upload.dropHere')
+                : t('upload.dragOrClick')}
             </p>
             <p className="text-sm text-muted-foreground mt-1">
-              {t('upload.maxSize', 'Max {{size}}MB per file', { size: maxSize })}
-              {multiple && ` • ${t('upload.maxFiles', 'Max {{count}} files', { count: maxFiles })}`}
+              {t('upload.maxSize', { size: maxSize })}
+              {multiple && ` • ${t('upload.maxFiles', { count: maxFiles })}`}
             </p>
           </div>
         </div>
@@ -254,7 +254,7 @@ export function FileDragDrop({
         <div className="space-y-2">
           <div className="flex items-center justify-between">
             <span className="text-sm text-muted-foreground">
-              {t('upload.filesCount', '{{count}} file(s)', { count: files.length })}
+              {t('upload.filesCount', { count: files.length })}
             </span>
             <div className="flex items-center gap-2">
               {onUpload && (
@@ -268,11 +268,11 @@ export function FileDragDrop({
                   ) : (
                     <Upload className="h-4 w-4 mr-2" />
                   )}
-                  {t('upload.uploadAll', 'Upload All')}
+                  {t('upload.uploadAll')}
                 </Button>
               )}
               <Button variant="ghost" size="sm" onClick={clearAll}>
-                {t('upload.clearAll', 'Clear All')}
+                {t('upload.clearAll')}
               </Button>
             </div>
           </div>
@@ -2,7 +2,7 @@
  * Floating Action Button Component
  * Material Design style FAB for mobile quick actions
  */
-import { useState } from 'react';
+import { useState, useMemo } from 'react';
 import { useTranslation } from 'react-i18next';
 import { cn } from '@/lib/utils';
 import { Button } from '@/components/ui/button';
@@ -33,10 +33,10 @@ export function FloatingActionButton({
   actions,
   className,
 }: FloatingActionButtonProps) {
-  const { t } = useTranslation();
+  const { t, i18n } = useTranslation();
   const [isOpen, setIsOpen] = useState(false);
 
-  const defaultActions: FABAction[] = [
+  const defaultActions: FABAction[] = useMemo(() => [
     {
       id: 'new-invoice',
       label: t('sales.newInvoice'),
@@ -69,7 +69,7 @@ export function FloatingActionButton({
         window.location.href = '/banking/payments/new';
       },
     },
-  ];
+  ], [t, i18n.language]);
 
   const fabActions = actions || defaultActions;
 
@@ -220,11 +220,11 @@ export function FormWizard({
             disabled={isFirst || isSubmitting}
           >
             <ChevronLeft className="h-4 w-4 mr-2" />
-            {t('wizard.previous', 'Previous')}
+            {t('wizard.previous')}
           </Button>
 
           <div className="flex items-center gap-2 text-sm text-muted-foreground">
-            {t('wizard.stepOf', 'Step {{current}} of {{total}}', {
+            {t('wizard.stepOf', {
               current: currentStep + 1,
               total: steps.length,
             })}
@@ -237,16 +237,16 @@ export function FormWizard({
             {isSubmitting ? (
               <>
                 <Loader2 className="h-4 w-4 mr-2 animate-spin" />
-                {t('wizard.submitting', 'Submitting...')}
+                {t('wizard.submitting')}
               </>
             ) : isLast ? (
               <>
                 <Check className="h-4 w-4 mr-2" />
-                {t('wizard.complete', 'Complete')}
+                {t('wizard.complete')}
               </>
             ) : (
               <>
-                {t('wizard.next', 'Next')}
+                {t('wizard.next')}
                 <ChevronRight className="h-4 w-4 ml-2" />
               </>
             )}
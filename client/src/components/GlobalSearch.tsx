@@ -1,4 +1,4 @@
-import { useState, useEffect, useCallback, useRef } from "react";
+import { useState, useEffect, useCallback, useRef, useMemo } from "react";
 import { useTranslation } from "react-i18next";
 import { useLocation } from "wouter";
 import { useQuery } from "@tanstack/react-query";
@@ -282,19 +282,20 @@ export default function GlobalSearch({ open, onOpenChange }: GlobalSearchProps)
     localStorage.removeItem("recentSearches");
   };
 
+  const labels: Record<string, string> = useMemo(() => ({
+    invoice: t("common.invoice"),
+    contact: t("common.contact"),
+    item: t("common.item"),
+    account: t("common.account"),
+    expense: t("common.expense"),
+    payment: t("common.payment"),
+    journal: t("common.journal"),
+    report: t("common.report"),
+    setting: t("common.setting"),
+    page: t("common.page"),
+  }), [t, i18n.language]);
+
   const getTypeLabel = (type: SearchResult["type"]) => {
-    const labels: Record<string, string> = {
-      invoice: t("common.invoice"),
-      contact: t("common.contact"),
-      item: t("common.item"),
-      account: t("common.account"),
-      expense: t("common.expense"),
-      payment: t("common.payment"),
-      journal: t("common.journal"),
-      report: t("common.report"),
-      setting: t("common.setting"),
-      page: t("common.page"),
-    };
     return labels[type] || type;
   };
 
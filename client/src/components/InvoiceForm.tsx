@@ -353,7 +353,7 @@ export function InvoiceForm() {
     if (lineItems.length <= 1) {
       toast({ 
         title: t('common.error'), 
-        description: t('forms.atLeastOneItem', { defaultValue: 'Invoice must have at least one item' }), 
+        description: t('forms.atLeastOneItem'), 
         variant: 'destructive' 
       });
       return;
@@ -441,20 +441,20 @@ export function InvoiceForm() {
     const errors: string[] = [];
     
     if (!customer) {
-      errors.push(t('forms.customerRequired', { defaultValue: 'Customer is required' }));
+      errors.push(t('forms.customerRequired'));
     }
     if (!invoiceDate) {
-      errors.push(t('forms.invoiceDateRequired', { defaultValue: 'Invoice date is required' }));
+      errors.push(t('forms.invoiceDateRequired'));
     }
     if (!dueDate) {
-      errors.push(t('forms.dueDateRequired', { defaultValue: 'Due date is required' }));
+      errors.push(t('forms.dueDateRequired'));
     }
     if (lineItems.length === 0) {
-      errors.push(t('forms.atLeastOneItem', { defaultValue: 'At least one item is required' }));
+      errors.push(t('forms.atLeastOneItem'));
     }
     const hasEmptyItem = lineItems.some(item => !item.description.trim() || item.rate <= 0);
     if (hasEmptyItem) {
-      errors.push(t('forms.itemsIncomplete', { defaultValue: 'All items must have description and price' }));
+      errors.push(t('forms.itemsIncomplete'));
     }
     
     setValidationErrors(errors);
@@ -487,7 +487,7 @@ export function InvoiceForm() {
       if (!validateForm()) {
         toast({ 
           title: t('common.error'), 
-          description: t('forms.pleaseFixErrors', { defaultValue: 'Please fix the errors before saving' }), 
+          description: t('forms.pleaseFixErrors'), 
           variant: 'destructive' 
         });
         return;
@@ -540,7 +540,7 @@ export function InvoiceForm() {
         tax_total: taxTotal.toFixed(2),
         total: total.toFixed(2),
         paid_amount: '0',
-        notes: poNumber ? `${t('forms.poNumber', { defaultValue: 'PO#' })}: ${poNumber}\n${notes || ''}`.trim() : (notes || undefined),
+        notes: poNumber ? `${t('forms.poNumber')}: ${poNumber}\n${notes || ''}`.trim() : (notes || undefined),
         lines: lineItems.map(item => ({
           description: item.description,
           quantity: item.quantity,
@@ -557,15 +557,15 @@ export function InvoiceForm() {
       const res = await apiRequest('POST', '/api/sales/invoices', payload);
       const created = await res.json();
       toast({ 
-        title: t('common.saved', { defaultValue: 'Saved' }), 
-        description: t('sales.invoices.draftSaved', { defaultValue: 'Invoice draft saved' }) 
+        title: t('common.saved'), 
+        description: t('sales.invoices.draftSaved') 
       });
       // Navigate to invoice detail page
       navigate(`/sales/invoices/${created.id}`);
     } catch (error: any) {
       toast({ 
         title: t('common.error'), 
-        description: error?.message || t('sales.invoices.saveFailed', { defaultValue: 'Failed to save draft' }), 
+        description: error?.message || t('sales.invoices.saveFailed'), 
         variant: 'destructive' 
       });
     }
@@ -577,7 +577,7 @@ export function InvoiceForm() {
       if (!validateForm()) {
         toast({ 
           title: t('common.error'), 
-          description: t('forms.pleaseFixErrors', { defaultValue: 'Please fix the errors before sending' }), 
+          description: t('forms.pleaseFixErrors'), 
           variant: 'destructive' 
         });
         return;
@@ -600,7 +600,7 @@ export function InvoiceForm() {
         tax_total: taxTotal.toFixed(2),
         total: total.toFixed(2),
         paid_amount: '0',
-        notes: poNumber ? `${t('forms.poNumber', { defaultValue: 'PO#' })}: ${poNumber}\n${notes || ''}`.trim() : (notes || undefined),
+        notes: poNumber ? `${t('forms.poNumber')}: ${poNumber}\n${notes || ''}`.trim() : (notes || undefined),
         lines: lineItems.map(item => ({
           description: item.description,
           quantity: item.quantity,
@@ -620,14 +620,14 @@ export function InvoiceForm() {
       await apiRequest('POST', `/api/sales/invoices/${created.id}/send`, {});
       
       toast({ 
-        title: t('sales.invoices.sent', { defaultValue: 'Invoice sent' }), 
-        description: t('sales.invoices.emailQueued', { defaultValue: 'Email queued for delivery' }) 
+        title: t('sales.invoices.sent'), 
+        description: t('sales.invoices.emailQueued') 
       });
       navigate(`/sales/invoices/${created.id}`);
     } catch (error: any) {
       toast({ 
         title: t('common.error'), 
-        description: error?.message || t('sales.invoices.sendFailed', { defaultValue: 'Failed to send invoice' }), 
+        description: error?.message || t('sales.invoices.sendFailed'), 
         variant: 'destructive' 
       });
     }
@@ -687,7 +687,7 @@ export function InvoiceForm() {
       });
     }
     if (applyFields.notes_vendor && extracted.vendor_name) {
-      setNotes(prev => `${prev ? prev + '\n' : ''}${t('ai.vendorDetected',{defaultValue:'Vendor'})}: ${extracted.vendor_name}`.trim());
+      setNotes(prev => `${prev ? prev + '\n' : ''}${t('ai.vendorDetected')}: ${extracted.vendor_name}`.trim());
     }
     if (applyFields.notes_text && extracted.notes) {
       setNotes(prev => `${prev ? prev + '\n' : ''}${extracted.notes}`.trim());
@@ -745,7 +745,7 @@ export function InvoiceForm() {
           <div>
             <h1 className={`${isMobile ? 'text-2xl' : 'text-3xl'} font-bold text-foreground`}>{t('forms.createInvoice')}</h1>
             <p className="text-muted-foreground mt-1">
-              {t('forms.createInvoiceDesc', { defaultValue: 'Create a new sales invoice' })}
+              {t('forms.createInvoiceDesc')}
             </p>
           </div>
         </div>
@@ -757,7 +757,7 @@ export function InvoiceForm() {
           <AIIngestDialog
             open={scanOpen}
             onOpenChange={setScanOpen}
-            title={t('ai.pasteInvoiceText', { defaultValue: 'Paste invoice text' })}
+            title={t('ai.pasteInvoiceText')}
             onExtract={handleScanExtract}
             allowPdf
             autoCloseOnExtract
@@ -768,16 +768,16 @@ export function InvoiceForm() {
             <DialogContent className="max-w-xl">
               <DialogHeader>
                 <div className="flex items-center justify-between gap-2">
-                  <DialogTitle>{t('ai.previewExtraction', { defaultValue: 'Preview extracted fields' })}</DialogTitle>
+                  <DialogTitle>{t('ai.previewExtraction')}</DialogTitle>
                   <div className="flex items-center gap-2">
                     {extracted && (() => {
                       const fields = ['invoice_number','date','due_date','total','currency','vendor_name','notes'];
                       const { count, total, percent } = computeCompleteness(extracted, fields);
-                      return <Badge variant="secondary" className="text-xs">{t('ai.completeness',{defaultValue:'Complete'})}: {count}/{total} ({percent}%)</Badge>;
+                      return <Badge variant="secondary" className="text-xs">{t('ai.completeness')}: {count}/{total} ({percent}%)</Badge>;
                     })()}
-                    <Button size="sm" variant="ghost" onClick={() => setAllApply(true)}>{t('common.all',{defaultValue:'All'})}</Button>
-                    <Button size="sm" variant="ghost" onClick={() => setAllApply(false)}>{t('common.none',{defaultValue:'None'})}</Button>
-                    <Button size="sm" variant="ghost" onClick={resetApplyDefaults}>{t('common.reset',{defaultValue:'Reset defaults'})}</Button>
+                    <Button size="sm" variant="ghost" onClick={() => setAllApply(true)}>{t('common.all')}</Button>
+                    <Button size="sm" variant="ghost" onClick={() => setAllApply(false)}>{t('common.none')}</Button>
+                    <Button size="sm" variant="ghost" onClick={resetApplyDefaults}>{t('common.reset')}</Button>
                   </div>
                 </div>
               </DialogHeader>
@@ -796,28 +796,28 @@ export function InvoiceForm() {
                       invoice_date: t('forms.invoiceDate'),
                       due_date: t('forms.dueDate'),
                       total: t('forms.total'),
-                      notes_vendor: t('ai.vendor', { defaultValue: 'Vendor' }),
+                      notes_vendor: t('ai.vendor'),
                       notes_text: t('common.notes'),
                     }}
                     bestMatch={bestCustomerMatch ? {
-                      label: t('ai.customerMatch',{defaultValue:'Suggested customer'}),
+                      label: t('ai.customerMatch'),
                       name: bestCustomerMatch.customer.name,
-                      actionLabel: t('ai.useCustomer',{defaultValue:'Use customer'}),
+                      actionLabel: t('ai.useCustomer'),
                       onUse: () => setCustomer(bestCustomerMatch.customer.id)
                     } : null}
                   />
                 ) : (
-                  <p className="text-muted-foreground">{t('ai.noData', { defaultValue: 'No data to preview.' })}</p>
+                  <p className="text-muted-foreground">{t('ai.noData')}</p>
                 )}
                 <div className="flex items-center gap-3 justify-end">
                   <Button variant="outline" onClick={() => setPreviewOpen(false)}>{t('common.cancel')}</Button>
                   <Button type="button" variant="secondary" onClick={async () => { try { await navigator.clipboard.writeText(JSON.stringify(extracted, null, 2)); setCopied(true); setTimeout(()=>setCopied(false), 1500);} catch {} }}>
-                    {copied ? t('common.copied',{defaultValue:'Copied!'}) : t('ai.copyJson',{defaultValue:'Copy JSON'})}
+                    {copied ? t('common.copied') : t('ai.copyJson')}
                   </Button>
                   <Button type="button" variant="secondary" onClick={() => { try { const blob = new Blob([JSON.stringify(extracted, null, 2)], { type: 'application/json' }); const url = URL.createObjectURL(blob); const a = document.createElement('a'); a.href = url; a.download = 'extraction.json'; a.click(); URL.revokeObjectURL(url); } catch {} }}>
-                    {t('ai.downloadJson',{defaultValue:'Download JSON'})}
+                    {t('ai.downloadJson')}
                   </Button>
-                  <Button onClick={applyExtracted}>{t('common.apply', { defaultValue: 'Apply' })}</Button>
+                  <Button onClick={applyExtracted}>{t('common.apply')}</Button>
                 </div>
               </div>
             </DialogContent>
@@ -860,17 +860,17 @@ export function InvoiceForm() {
                   id="invoice-number"
                   value={invoiceNumber}
                   onChange={(e) => setInvoiceNumber(e.target.value)}
-                  placeholder={t('forms.autoGenerated', { defaultValue: 'Auto-generated' })}
+                  placeholder={t('forms.autoGenerated')}
                   data-testid="input-invoice-number"
                 />
               </div>
               <div className="space-y-2">
-                <Label htmlFor="po-number">{t('forms.poNumber', { defaultValue: 'PO Number' })}</Label>
+                <Label htmlFor="po-number">{t('forms.poNumber')}</Label>
                 <Input
                   id="po-number"
                   value={poNumber}
                   onChange={(e) => setPoNumber(e.target.value)}
-                  placeholder={t('forms.optional', { defaultValue: 'Optional' })}
+                  placeholder={t('forms.optional')}
                   data-testid="input-po-number"
                 />
               </div>
@@ -885,7 +885,7 @@ export function InvoiceForm() {
                 />
               </div>
               <div className="space-y-2">
-                <Label>{t('forms.paymentTerms', { defaultValue: 'Payment Terms' })}</Label>
+                <Label>{t('forms.paymentTerms')}</Label>
                 <Select value={paymentTerms} onValueChange={setPaymentTerms}>
                   <SelectTrigger>
                     <SelectValue />
@@ -893,8 +893,8 @@ export function InvoiceForm() {
                   <SelectContent>
                     {PAYMENT_TERMS.map((term) => (
                       <SelectItem key={term.value} value={term.value}>
-                        {term.value === 'due_on_receipt' ? t('forms.dueOnReceipt', { defaultValue: 'Due on Receipt' }) :
-                         term.value === 'custom' ? t('forms.custom', { defaultValue: 'Custom' }) :
+                        {term.value === 'due_on_receipt' ? t('forms.dueOnReceipt') :
+                         term.value === 'custom' ? t('forms.custom') :
                          t('forms.netDays', { days: term.days, defaultValue: `Net ${term.days} Days` })}
                       </SelectItem>
                     ))}
@@ -916,10 +916,10 @@ export function InvoiceForm() {
             </div>
             <div className="grid grid-cols-2 gap-4">
               <div className="space-y-2">
-                <Label>{t('forms.currency', { defaultValue: 'Currency' })}</Label>
+                <Label>{t('forms.currency')}</Label>
                 <Select value={currency} onValueChange={setCurrency}>
                   <SelectTrigger>
-                    <SelectValue placeholder={t('forms.selectCurrency', { defaultValue: 'Select Currency' })} />
+                    <SelectValue placeholder={t('forms.selectCurrency')} />
                   </SelectTrigger>
                   <SelectContent>
                     {currencies.map((c: any) => (
@@ -931,7 +931,7 @@ export function InvoiceForm() {
                 </Select>
               </div>
               <div className="space-y-2">
-                <Label>{t('forms.exchangeRate', { defaultValue: 'Exchange Rate' })}</Label>
+                <Label>{t('forms.exchangeRate')}</Label>
                 <Input
                   type="number"
                   step="0.000001"
@@ -951,7 +951,7 @@ export function InvoiceForm() {
               {t('forms.customerDetails')}
             </CardTitle>
             <CardDescription>
-              {t('forms.customerDetailsDesc', { defaultValue: 'Select the customer for this invoice' })}
+              {t('forms.customerDetailsDesc')}
             </CardDescription>
           </CardHeader>
           <CardContent className="space-y-4">
@@ -982,7 +982,7 @@ export function InvoiceForm() {
             )}
             {customers.length === 0 && (
               <p className="text-sm text-muted-foreground">
-                {t('forms.noCustomersFound', { defaultValue: 'No customers found. Add customers in Contacts page.' })}
+                {t('forms.noCustomersFound')}
               </p>
             )}
           </CardContent>
@@ -999,7 +999,7 @@ export function InvoiceForm() {
                 {t('forms.lineItems')}
               </CardTitle>
               <CardDescription className="mt-1">
-                {t('forms.lineItemsDesc', { defaultValue: 'Add products or services to the invoice' })}
+                {t('forms.lineItemsDesc')}
               </CardDescription>
             </div>
             <Button onClick={addLineItem} size="sm" data-testid="button-add-line-item" className={isMobile ? 'w-full sm:w-auto' : ''}>
@@ -1021,7 +1021,7 @@ export function InvoiceForm() {
                         size="icon"
                         className="h-8 w-8"
                         onClick={() => duplicateLineItem(item.id)}
-                        title={t('common.duplicate', { defaultValue: 'Duplicate' })}
+                        title={t('common.duplicate')}
                       >
                         <Copy className="h-4 w-4" />
                       </Button>
@@ -1039,7 +1039,7 @@ export function InvoiceForm() {
                   {/* Product Selection */}
                   {items.length > 0 && (
                     <div className="space-y-2">
-                      <Label>{t('forms.selectProduct', { defaultValue: 'Select Product' })}</Label>
+                      <Label>{t('forms.selectProduct')}</Label>
                       <Select 
                         value={item.itemId || "none"} 
                         onValueChange={(value) => {
@@ -1047,10 +1047,10 @@ export function InvoiceForm() {
                         }}
                       >
                         <SelectTrigger>
-                          <SelectValue placeholder={t('forms.orTypeManually', { defaultValue: 'Or type manually below' })} />
+                          <SelectValue placeholder={t('forms.orTypeManually')} />
                         </SelectTrigger>
                         <SelectContent>
-                          <SelectItem value="none">{t('forms.manualEntry', { defaultValue: 'Manual Entry' })}</SelectItem>
+                          <SelectItem value="none">{t('forms.manualEntry')}</SelectItem>
                           {items.map((prod) => (
                             <SelectItem key={prod.id} value={prod.id}>
                               <div className="flex items-center gap-2">
@@ -1096,7 +1096,7 @@ export function InvoiceForm() {
 
                   <div className="grid grid-cols-3 gap-3">
                     <div className="space-y-2">
-                      <Label>{t('forms.discount', { defaultValue: 'Discount %' })}</Label>
+                      <Label>{t('forms.discount')}</Label>
                       <NumericInput
                         step="0.01"
                         min={0}
@@ -1116,7 +1116,7 @@ export function InvoiceForm() {
                           <SelectValue />
                         </SelectTrigger>
                         <SelectContent>
-                          <SelectItem value="0">{t('forms.noTax', { defaultValue: 'No Tax (0%)' })}</SelectItem>
+                          <SelectItem value="0">{t('forms.noTax')}</SelectItem>
                           {taxRates.map((tax) => (
                             <SelectItem key={tax.id} value={tax.rate.toString()}>
                               {tax.name}
@@ -1134,7 +1134,7 @@ export function InvoiceForm() {
                   </div>
 
                   <div className="space-y-2">
-                    <Label>{t('forms.project', { defaultValue: 'Project' })}</Label>
+                    <Label>{t('forms.project')}</Label>
                     <Select 
                       value={item.projectId || "none"} 
                       onValueChange={(value) => updateLineItem(item.id, 'projectId', value === "none" ? undefined : value)}
@@ -1168,9 +1168,9 @@ export function InvoiceForm() {
                     <TableHead className="w-[30%]">{t('forms.description')}</TableHead>
                     <TableHead className="w-[8%]">{t('forms.quantity')}</TableHead>
                     <TableHead className="w-[12%]">{t('forms.rate')}</TableHead>
-                    <TableHead className="w-[8%]">{t('forms.discount', { defaultValue: 'Disc %' })}</TableHead>
+                    <TableHead className="w-[8%]">{t('forms.discount')}</TableHead>
                     <TableHead className="w-[12%]">{t('forms.tax')}</TableHead>
-                    <TableHead className="w-[12%]">{t('forms.project', { defaultValue: 'Project' })}</TableHead>
+                    <TableHead className="w-[12%]">{t('forms.project')}</TableHead>
                     <TableHead className="w-[12%] text-end">{t('forms.amount')}</TableHead>
                     <TableHead className="w-[6%]"></TableHead>
                   </TableRow>
@@ -1188,10 +1188,10 @@ export function InvoiceForm() {
                               }}
                             >
                               <SelectTrigger className="h-8 text-xs">
-                                <SelectValue placeholder={t('forms.selectProduct', { defaultValue: 'Select product...' })} />
+                                <SelectValue placeholder={t('forms.selectProduct')} />
                               </SelectTrigger>
                               <SelectContent>
-                                <SelectItem value="none">{t('forms.manualEntry', { defaultValue: 'Manual Entry' })}</SelectItem>
+                                <SelectItem value="none">{t('forms.manualEntry')}</SelectItem>
                                 {items.map((prod) => (
                                   <SelectItem key={prod.id} value={prod.id}>
                                     {prod.code ? `${prod.code} - ` : ''}{prod.name}
@@ -1246,7 +1246,7 @@ export function InvoiceForm() {
                             <SelectValue />
                           </SelectTrigger>
                           <SelectContent>
-                            <SelectItem value="0">{t('forms.noTax', { defaultValue: 'No Tax (0%)' })}</SelectItem>
+                            <SelectItem value="0">{t('forms.noTax')}</SelectItem>
                             {taxRates.map((tax) => (
                               <SelectItem key={tax.id} value={tax.rate.toString()}>
                                 {tax.name}
@@ -1283,7 +1283,7 @@ export function InvoiceForm() {
                             size="icon"
                             onClick={() => duplicateLineItem(item.id)}
                             className="h-8 w-8 text-muted-foreground hover:text-foreground"
-                            title={t('common.duplicate', { defaultValue: 'Duplicate' })}
+                            title={t('common.duplicate')}
                           >
                             <Copy className="h-4 w-4" />
                           </Button>
@@ -1315,13 +1315,13 @@ export function InvoiceForm() {
                 <div className="flex justify-between text-sm text-green-600">
                   <span className="flex items-center gap-1">
                     <Percent className="h-3 w-3" />
-                    {t('forms.discount', { defaultValue: 'Discount' })}
+                    {t('forms.discount')}
                   </span>
                   <span className="font-mono">-{formatCurrency(calculateTotalDiscount())}</span>
                 </div>
               )}
               <div className="flex justify-between text-sm">
-                <span>{t('forms.netAmount', { defaultValue: 'Net Amount' })}</span>
+                <span>{t('forms.netAmount')}</span>
                 <span className="font-mono">{formatCurrency(calculateSubtotal())}</span>
               </div>
               <div className="flex justify-between text-sm">
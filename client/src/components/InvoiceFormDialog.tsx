@@ -255,7 +255,7 @@ export function InvoiceFormDialog({ open, onOpenChange, onSuccess, editInvoiceId
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['/api/sales/invoices'] });
       queryClient.invalidateQueries({ queryKey: ['/api/sales/invoices', editInvoiceId] });
-      toast({ title: t('common.saved'), description: t('sales.invoices.invoiceUpdated', { defaultValue: 'Invoice updated successfully' }) });
+      toast({ title: t('common.saved'), description: t('sales.invoices.invoiceUpdated') });
       resetForm();
       onOpenChange(false);
       onSuccess?.();
@@ -716,7 +716,7 @@ export function InvoiceFormDialog({ open, onOpenChange, onSuccess, editInvoiceId
               <DialogTitle className="flex items-center gap-2 text-lg sm:text-xl">
                 <FileText className="h-5 w-5" />
                 {isEditMode 
-                  ? t('sales.invoices.editInvoice', { defaultValue: 'Edit Invoice' }) 
+                  ? t('sales.invoices.editInvoice') 
                   : t('forms.createInvoice')
                 }
                 {isEditMode && invoiceNumber && (
@@ -727,7 +727,7 @@ export function InvoiceFormDialog({ open, onOpenChange, onSuccess, editInvoiceId
                 <div className="flex items-center gap-2">
                   <Button variant="outline" size="sm" onClick={() => setScanOpen(true)}>
                     <ScanLine className="h-4 w-4 me-2" />
-                    {t('ai.scanDocument', { defaultValue: 'Scan' })}
+                    {t('ai.scanDocument')}
                   </Button>
                 </div>
               )}
@@ -1027,16 +1027,16 @@ export function InvoiceFormDialog({ open, onOpenChange, onSuccess, editInvoiceId
                           {/* Revenue Account Selection */}
                           {revenueAccounts.length > 0 && (
                             <div className="space-y-1">
-                              <Label className="text-xs text-muted-foreground">{t('forms.revenueAccount', 'Revenue Account')}</Label>
+                              <Label className="text-xs text-muted-foreground">{t('forms.revenueAccount')}</Label>
                               <Select 
                                 value={item.accountId || "default"} 
                                 onValueChange={(value) => updateLineItem(item.id, 'accountId', value === "default" ? undefined : value)}
                               >
                                 <SelectTrigger className="h-10 w-full">
-                                  <SelectValue placeholder={t('forms.defaultAccount', 'Default')} />
+                                  <SelectValue placeholder={t('forms.defaultAccount')} />
                                 </SelectTrigger>
                                 <SelectContent>
-                                  <SelectItem value="default">{t('forms.defaultAccount', 'Default')}</SelectItem>
+                                  <SelectItem value="default">{t('forms.defaultAccount')}</SelectItem>
                                   {revenueAccounts.map((acc: any) => (
                                     <SelectItem key={acc.id} value={acc.id}>
                                       {acc.code} - {i18n.language === 'ar' && acc.name_ar ? acc.name_ar : acc.name}
@@ -1,4 +1,4 @@
-import { useEffect, useState, useCallback } from "react";
+import { useEffect, useState, useCallback, useMemo } from "react";
 import { useTranslation } from "react-i18next";
 import { useLocation } from "wouter";
 import {
@@ -84,7 +84,7 @@ export default function KeyboardShortcuts({
   }, [i18n]);
 
   // Define shortcuts
-  const shortcutGroups: ShortcutGroup[] = [
+  const shortcutGroups: ShortcutGroup[] = useMemo(() => [
     {
       title: t("shortcuts.navigation"),
       shortcuts: [
@@ -222,7 +222,7 @@ export default function KeyboardShortcuts({
         },
       ],
     },
-  ];
+  ], [t, i18n.language, isRTL, modKey, setLocation, setShowHelp, theme, toggleLanguage, toggleTheme]);
 
   // Handle keyboard shortcuts
   useEffect(() => {
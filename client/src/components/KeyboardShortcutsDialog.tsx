@@ -53,10 +53,10 @@ export function KeyboardShortcutsDialog({ open, onOpenChange }: KeyboardShortcut
         <DialogHeader>
           <DialogTitle className="flex items-center gap-2">
             <Keyboard className="h-5 w-5" />
-            {t('shortcuts.title', 'Keyboard Shortcuts')}
+            {t('shortcuts.title')}
           </DialogTitle>
           <DialogDescription>
-            {t('shortcuts.description', 'Use these shortcuts to navigate faster')}
+            {t('shortcuts.description')}
           </DialogDescription>
         </DialogHeader>
 
@@ -64,7 +64,7 @@ export function KeyboardShortcutsDialog({ open, onOpenChange }: KeyboardShortcut
           {/* Global Shortcuts */}
           <div>
             <h4 className="font-medium text-sm text-muted-foreground mb-3">
-              {t('shortcuts.global', 'Global')}
+              {t('shortcuts.global')}
             </h4>
             <div className="space-y-2">
               {globalShortcuts.map((shortcut, index) => (
@@ -81,7 +81,7 @@ export function KeyboardShortcutsDialog({ open, onOpenChange }: KeyboardShortcut
           {/* Page Shortcuts */}
           <div>
             <h4 className="font-medium text-sm text-muted-foreground mb-3">
-              {t('shortcuts.pageSpecific', 'Page Specific')}
+              {t('shortcuts.pageSpecific')}
             </h4>
             <div className="space-y-2">
               {pageShortcuts.map((shortcut, index) => (
@@ -97,7 +97,7 @@ export function KeyboardShortcutsDialog({ open, onOpenChange }: KeyboardShortcut
         </div>
 
         <div className="mt-4 pt-4 border-t text-xs text-muted-foreground text-center">
-          {t('shortcuts.tip', 'Tip: Press ⌘⇧H anytime to show this dialog')}
+          {t('shortcuts.tip')}
         </div>
       </DialogContent>
     </Dialog>
@@ -9,7 +9,7 @@ import {
 import { Button } from "@/components/ui/button";
 import { useState } from "react";
 import { AlertTriangle } from "lucide-react";
-import { useTranslation } from "react-i18next";
+import { useTypedTranslation } from "@/hooks/useTypedTranslation";
 
 interface LegalConsentDialogProps {
   open: boolean;
@@ -17,7 +17,7 @@ interface LegalConsentDialogProps {
 }
 
 export function LegalConsentDialog({ open, onAccept }: LegalConsentDialogProps) {
-  const { t } = useTranslation();
+  const { t } = useTypedTranslation();
   const [termsChecked, setTermsChecked] = useState(false);
   const [privacyChecked, setPrivacyChecked] = useState(false);
   const [disclaimerChecked, setDisclaimerChecked] = useState(false);
@@ -23,6 +23,7 @@ import {
   DropdownMenuTrigger,
 } from '@/components/ui/dropdown-menu';
 import { cn } from '@/lib/utils';
+import { useMemo } from 'react';
 
 interface NavItem {
   id: string;
@@ -32,11 +33,11 @@ interface NavItem {
 }
 
 export function MobileBottomNav() {
-  const { t } = useTranslation();
+  const { t, i18n } = useTranslation();
   const [location, setLocation] = useLocation();
   const { setOpenMobile } = useSidebar();
 
-  const navItems: NavItem[] = [
+  const navItems: NavItem[] = useMemo(() => [
     {
       id: 'dashboard',
       label: t('sidebar.dashboard'),
@@ -67,14 +68,14 @@ export function MobileBottomNav() {
       icon: <ChartBar className="h-5 w-5" />,
       href: '/reports',
     },
-  ];
+  ], [t, i18n.language]);
 
-  const quickActions = [
+  const quickActions = useMemo(() => [
     { id: 'new-invoice', label: t('sales.newInvoice'), href: '/sales/invoices/new' },
     { id: 'new-contact', label: t('contacts.addContact'), href: '/contacts/new' },
     { id: 'new-item', label: t('inventory.addItem'), href: '/inventory/new' },
     { id: 'new-expense', label: t('purchases.newExpense'), href: '/purchases/expenses/new' },
-  ];
+  ], [t, i18n.language]);
 
   const isActive = (href: string) => {
     if (href === '/dashboard') return location === '/dashboard' || location === '/';
@@ -2,7 +2,7 @@
  * Mobile Dashboard Component
  * Optimized dashboard for mobile devices with touch-friendly widgets
  */
-import { useState } from 'react';
+import { useState, useMemo } from 'react';
 import { useTranslation } from 'react-i18next';
 import { useLocation } from 'wouter';
 import { useQuery } from '@tanstack/react-query';
@@ -61,7 +61,7 @@ export function MobileDashboard() {
     queryKey: ['/api/dashboard/recent'],
   });
 
-  const quickActions: QuickAction[] = [
+  const quickActions: QuickAction[] = useMemo(() => [
     {
       id: 'new-invoice',
       label: t('dashboard.newInvoice'),
@@ -90,10 +90,10 @@ export function MobileDashboard() {
       href: '/banking/payments/new',
       color: 'bg-purple-100 dark:bg-purple-900/30 text-purple-600',
     },
-  ];
+  ], [t, i18n.language]);
 
   // Mock stats for demo
-  const dashboardStats = [
+  const dashboardStats = useMemo(() => [
     {
       id: 'revenue',
       label: t('dashboard.revenue'),
@@ -121,7 +121,7 @@ export function MobileDashboard() {
       trend: { value: 18, isPositive: true },
       color: 'success' as const,
     },
-  ];
+  ], [t, i18n.language]);
 
   // Mock recent items
   const recentItems: RecentItem[] = [
@@ -475,7 +475,7 @@ export function NotificationCenter() {
         <div>
           <h2 className="text-2xl font-bold flex items-center gap-2">
             <Bell className="h-6 w-6 text-primary" />
-            {t('notifications.title', 'مركز الإشعارات')}
+            {t('notifications.title')}
             {stats.unread > 0 && (
               <Badge variant="destructive" className="rounded-full">
                 {stats.unread}
@@ -3,14 +3,14 @@
  * Shows connection status and syncs when back online
  */
 import { useState, useEffect } from 'react';
-import { useTranslation } from 'react-i18next';
+import { useTypedTranslation } from '@/hooks/useTypedTranslation';
 import { useQueryClient } from '@tanstack/react-query';
 import { motion, AnimatePresence } from 'framer-motion';
 import { Wifi, WifiOff, RefreshCw, CheckCircle } from 'lucide-react';
 import { Button } from '@/components/ui/button';
 
 export function OfflineIndicator() {
-  const { t } = useTranslation();
+  const { t } = useTypedTranslation();
   const queryClient = useQueryClient();
   const [isOnline, setIsOnline] = useState(navigator.onLine);
   const [showReconnected, setShowReconnected] = useState(false);
@@ -67,7 +67,7 @@ export function OfflineIndicator() {
         >
           <WifiOff className="h-4 w-4 me-2" />
           <span className="text-sm font-medium">
-            {t('offline.message', "You're offline. Some features may be limited.")}
+            {t('offline.message')}
           </span>
         </motion.div>
       )}
@@ -83,14 +83,14 @@ export function OfflineIndicator() {
             <>
               <RefreshCw className="h-4 w-4 me-2 animate-spin" />
               <span className="text-sm font-medium">
-                {t('offline.syncing', 'Syncing data...')}
+                {t('offline.syncing')}
               </span>
             </>
           ) : (
             <>
               <CheckCircle className="h-4 w-4 me-2" />
               <span className="text-sm font-medium">
-                {t('offline.reconnected', 'Back online! Data synced.')}
+                {t('offline.reconnected')}
               </span>
             </>
           )}
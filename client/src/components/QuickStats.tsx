@@ -86,7 +86,7 @@ export function QuickStats({ className }: QuickStatsProps) {
 
   const statCards = useMemo(() => [
     {
-      label: t('quickStats.monthlyRevenue', 'Monthly Revenue'),
+      label: t('quickStats.monthlyRevenue'),
       value: formatCurrency(stats?.revenue.current || 0),
       trend: stats?.revenue.trend || 0,
       icon: DollarSign,
@@ -94,7 +94,7 @@ export function QuickStats({ className }: QuickStatsProps) {
       bgColor: 'bg-green-100 dark:bg-green-900/20',
     },
     {
-      label: t('quickStats.monthlyExpenses', 'Monthly Expenses'),
+      label: t('quickStats.monthlyExpenses'),
       value: formatCurrency(stats?.expenses.current || 0),
       trend: stats?.expenses.trend || 0,
       icon: Receipt,
@@ -103,25 +103,25 @@ export function QuickStats({ className }: QuickStatsProps) {
       invertTrend: true, // Lower expenses = good
     },
     {
-      label: t('quickStats.receivables', 'Receivables'),
+      label: t('quickStats.receivables'),
       value: formatCurrency(stats?.receivables.total || 0),
-      subtext: stats?.receivables.overdue ? t('quickStats.overdueAmount', '{{amount}} overdue', { amount: formatCurrency(stats.receivables.overdue) }) : undefined,
+      subtext: stats?.receivables.overdue ? t('quickStats.overdueAmount', { amount: formatCurrency(stats.receivables.overdue) }) : undefined,
       icon: FileText,
       color: 'text-blue-600',
       bgColor: 'bg-blue-100 dark:bg-blue-900/20',
       alert: (stats?.receivables.overdue || 0) > 0,
     },
     {
-      label: t('quickStats.payables', 'Payables'),
+      label: t('quickStats.payables'),
       value: formatCurrency(stats?.payables.total || 0),
-      subtext: stats?.payables.overdue ? t('quickStats.overdueAmount', '{{amount}} overdue', { amount: formatCurrency(stats.payables.overdue) }) : undefined,
+      subtext: stats?.payables.overdue ? t('quickStats.overdueAmount', { amount: formatCurrency(stats.payables.overdue) }) : undefined,
       icon: CreditCard,
       color: 'text-orange-600',
       bgColor: 'bg-orange-100 dark:bg-orange-900/20',
       alert: (stats?.payables.overdue || 0) > 0,
     },
     {
-      label: t('quickStats.cashBalance', 'Cash Balance'),
+      label: t('quickStats.cashBalance'),
       value: formatCurrency(stats?.cashBalance || 0),
       icon: DollarSign,
       color: 'text-emerald-600',
@@ -130,10 +130,10 @@ export function QuickStats({ className }: QuickStatsProps) {
   ], [stats, t, formatCurrency]);
 
   const invoiceStats = useMemo(() => [
-    { label: t('quickStats.draft', 'Draft'), value: stats?.invoices.draft || 0, icon: Clock, color: 'text-muted-foreground' },
-    { label: t('quickStats.sent', 'Sent'), value: stats?.invoices.sent || 0, icon: FileText, color: 'text-blue-600' },
-    { label: t('quickStats.paid', 'Paid'), value: stats?.invoices.paid || 0, icon: CheckCircle, color: 'text-green-600' },
-    { label: t('quickStats.overdue', 'Overdue'), value: stats?.invoices.overdue || 0, icon: AlertCircle, color: 'text-red-600' },
+    { label: t('quickStats.draft'), value: stats?.invoices.draft || 0, icon: Clock, color: 'text-muted-foreground' },
+    { label: t('quickStats.sent'), value: stats?.invoices.sent || 0, icon: FileText, color: 'text-blue-600' },
+    { label: t('quickStats.paid'), value: stats?.invoices.paid || 0, icon: CheckCircle, color: 'text-green-600' },
+    { label: t('quickStats.overdue'), value: stats?.invoices.overdue || 0, icon: AlertCircle, color: 'text-red-600' },
   ], [stats, t]);
 
   if (isLoading) {
@@ -198,9 +198,9 @@ export function QuickStats({ className }: QuickStatsProps) {
       <Card>
         <CardContent className="p-4">
           <div className="flex items-center justify-between mb-4">
-            <h3 className="font-medium">{t('quickStats.invoicePipeline', 'Invoice Pipeline')}</h3>
+            <h3 className="font-medium">{t('quickStats.invoicePipeline')}</h3>
             <span className="text-sm text-muted-foreground">
-              {t('quickStats.thisMonth', 'This Month')}
+              {t('quickStats.thisMonth')}
             </span>
           </div>
           <div className="grid grid-cols-4 gap-4">
@@ -3,7 +3,7 @@
  * Enterprise-grade notification system with sound and badges
  */
 import { useState, useEffect, useCallback, useRef } from 'react';
-import { useTranslation } from 'react-i18next';
+import { useTypedTranslation } from '@/hooks/useTypedTranslation';
 import { Button } from '@/components/ui/button';
 import { Badge } from '@/components/ui/badge';
 import { ScrollArea } from '@/components/ui/scroll-area';
@@ -57,7 +57,7 @@ export function RealtimeNotifications({
   onNotificationClick,
   maxDisplay = 50,
 }: NotificationsProps) {
-  const { t } = useTranslation();
+  const { t } = useTypedTranslation();
   const [isOpen, setIsOpen] = useState(false);
   const [soundEnabled, setSoundEnabled] = useState(() => {
     const saved = localStorage.getItem('notification-sound');
@@ -130,10 +130,10 @@ export function RealtimeNotifications({
     const hours = Math.floor(diff / 3600000);
     const days = Math.floor(diff / 86400000);
 
-    if (minutes < 1) return t('notifications.justNow', 'Just now');
-    if (minutes < 60) return t('notifications.minutesAgo', '{{minutes}}m ago', { minutes });
-    if (hours < 24) return t('notifications.hoursAgo', '{{hours}}h ago', { hours });
-    return t('notifications.daysAgo', '{{days}}d ago', { days });
+    if (minutes < 1) return t('notifications.justNow');
+    if (minutes < 60) return t('notifications.minutesAgo', { minutes });
+    if (hours < 24) return t('notifications.hoursAgo', { hours });
+    return t('notifications.daysAgo', { days });
   };
 
   const handleNotificationClick = (notification: Notification) => {
@@ -166,7 +166,7 @@ export function RealtimeNotifications({
         <div className="flex items-center justify-between p-4 border-b">
           <div className="flex items-center gap-2">
             <Bell className="h-5 w-5" />
-            <h4 className="font-semibold">{t('notifications.title', 'Notifications')}</h4>
+            <h4 className="font-semibold">{t('notifications.title')}</h4>
             {unreadCount > 0 && (
               <Badge variant="secondary">{unreadCount}</Badge>
             )}
@@ -177,7 +177,7 @@ export function RealtimeNotifications({
               size="icon"
               className="h-8 w-8"
               onClick={toggleSound}
-              title={soundEnabled ? t('notifications.muteSound', 'Mute') : t('notifications.enableSound', 'Enable sound')}
+              title={soundEnabled ? t('notifications.muteSound') : t('notifications.enableSound')}
             >
               {soundEnabled ? (
                 <Volume2 className="h-4 w-4" />
@@ -193,7 +193,7 @@ export function RealtimeNotifications({
           {displayNotifications.length === 0 ? (
             <div className="flex flex-col items-center justify-center py-12 text-muted-foreground">
               <BellOff className="h-12 w-12 mb-4" />
-              <p>{t('notifications.empty', 'No notifications')}</p>
+              <p>{t('notifications.empty')}</p>
             </div>
           ) : (
             <div className="divide-y">
@@ -262,7 +262,7 @@ export function RealtimeNotifications({
                 disabled={unreadCount === 0}
               >
                 <CheckCheck className="h-4 w-4 mr-2" />
-                {t('notifications.markAllRead', 'Mark all read')}
+                {t('notifications.markAllRead')}
               </Button>
               <Button
                 variant="ghost"
@@ -271,7 +271,7 @@ export function RealtimeNotifications({
                 className="text-destructive hover:text-destructive"
               >
                 <Trash2 className="h-4 w-4 mr-2" />
-                {t('notifications.clearAll', 'Clear all')}
+                {t('notifications.clearAll')}
               </Button>
             </div>
           </>
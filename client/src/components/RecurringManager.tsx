@@ -522,7 +522,7 @@ export function RecurringManager() {
         <div>
           <h2 className="text-2xl font-bold flex items-center gap-2">
             <Repeat className="h-6 w-6 text-primary" />
-            {t('recurring.title', 'المعاملات المتكررة')}
+            {t('recurring.title')}
           </h2>
           <p className="text-muted-foreground mt-1">
             {t('recurring.subtitle', 'إدارة الفواتير والمصروفات المتكررة تلقائياً')}
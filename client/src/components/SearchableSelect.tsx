@@ -124,7 +124,7 @@ export function SearchableSelect({
 
   const getSelectedLabel = () => {
     if (selectedValues.length === 0) {
-      return placeholder || t('select.placeholder', 'Select...');
+      return placeholder || t('select.placeholder');
     }
     if (multiple) {
       return (
@@ -214,7 +214,7 @@ export function SearchableSelect({
               ref={inputRef}
               value={query}
               onChange={(e) => setQuery(e.target.value)}
-              placeholder={searchPlaceholder || t('select.search', 'Search...')}
+              placeholder={searchPlaceholder || t('select.search')}
               className="pl-8"
             />
           </div>
@@ -228,7 +228,7 @@ export function SearchableSelect({
             </div>
           ) : filteredOptions.length === 0 ? (
             <div className="py-6 text-center text-muted-foreground">
-              {emptyMessage || t('select.noResults', 'No results found')}
+              {emptyMessage || t('select.noResults')}
             </div>
           ) : groupBy ? (
             Object.entries(groupedOptions).map(([group, groupOptions]) => (
@@ -272,10 +272,10 @@ export function SearchableSelect({
         {multiple && selectedValues.length > 0 && (
           <div className="p-2 border-t flex items-center justify-between">
             <span className="text-sm text-muted-foreground">
-              {t('select.selected', '{{count}} selected', { count: selectedValues.length })}
+              {t('select.selected', { count: selectedValues.length })}
             </span>
             <Button variant="ghost" size="sm" onClick={() => onChange([])}>
-              {t('select.clearAll', 'Clear all')}
+              {t('select.clearAll')}
             </Button>
           </div>
         )}
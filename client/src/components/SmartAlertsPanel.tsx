@@ -90,7 +90,7 @@ export function SmartAlertsPanel({ maxAlerts = 5, className }: SmartAlertsPanelP
         <CardHeader className="pb-3">
           <div className="flex items-center gap-2">
             <Bell className="h-5 w-5" />
-            <CardTitle className="text-lg">{t('alerts.title', 'Smart Alerts')}</CardTitle>
+            <CardTitle className="text-lg">{t('alerts.title')}</CardTitle>
           </div>
         </CardHeader>
         <CardContent>
@@ -118,17 +118,17 @@ export function SmartAlertsPanel({ maxAlerts = 5, className }: SmartAlertsPanelP
         <div className="flex items-center justify-between">
           <div className="flex items-center gap-2">
             <Bell className="h-5 w-5" />
-            <CardTitle className="text-lg">{t('alerts.title', 'Smart Alerts')}</CardTitle>
+            <CardTitle className="text-lg">{t('alerts.title')}</CardTitle>
           </div>
           <div className="flex items-center gap-2">
             {criticalCount > 0 && (
               <Badge variant="destructive" className="text-xs">
-                {criticalCount} {t('alerts.critical', 'Critical')}
+                {criticalCount} {t('alerts.critical')}
               </Badge>
             )}
             {warningCount > 0 && (
               <Badge variant="outline" className="text-xs bg-amber-100 text-amber-800">
-                {warningCount} {t('alerts.warnings', 'Warnings')}
+                {warningCount} {t('alerts.warnings')}
               </Badge>
             )}
           </div>
@@ -141,10 +141,10 @@ export function SmartAlertsPanel({ maxAlerts = 5, className }: SmartAlertsPanelP
               <AlertTriangle className="h-6 w-6 text-green-600" />
             </div>
             <p className="text-sm font-medium text-green-600">
-              {t('alerts.allClear', 'All Clear!')}
+              {t('alerts.allClear')}
             </p>
             <p className="text-xs text-muted-foreground mt-1">
-              {t('alerts.noActiveAlerts', 'No active alerts at this time')}
+              {t('alerts.noActiveAlerts')}
             </p>
           </div>
         ) : (
@@ -157,7 +157,7 @@ export function SmartAlertsPanel({ maxAlerts = 5, className }: SmartAlertsPanelP
             {alerts.length > maxAlerts && (
               <div className="mt-4 pt-4 border-t text-center">
                 <Button variant="ghost" size="sm">
-                  {t('alerts.viewAll', 'View all {{count}} alerts', { count: alerts.length })}
+                  {t('alerts.viewAll', { count: alerts.length })}
                 </Button>
               </div>
             )}
@@ -233,8 +233,8 @@ export function ConnectionStatus({ connected, label, className }: ConnectionStat
       />
       <span className="text-sm text-muted-foreground">
         {label || (connected 
-          ? t('status.connected', 'Connected') 
-          : t('status.disconnected', 'Disconnected')
+          ? t('status.connected') 
+          : t('status.disconnected')
         )}
       </span>
     </div>
@@ -317,13 +317,13 @@ export function PaymentStatusBadge({
   
   if (paid >= amount) {
     status = 'success';
-    label = t('payment.paid', 'Paid');
+    label = t('payment.paid');
   } else if (paid > 0) {
     status = 'warning';
-    label = t('payment.partial', 'Partial');
+    label = t('payment.partial');
   } else {
     status = 'neutral';
-    label = t('payment.unpaid', 'Unpaid');
+    label = t('payment.unpaid');
   }
 
   const formatAmount = (value: number) => 
@@ -353,7 +353,7 @@ export function PaymentStatusBadge({
       </div>
       {paid < amount && (
         <p className="text-xs text-muted-foreground">
-          {t('payment.remaining', 'Remaining')}: {formatAmount(remaining)}
+          {t('payment.remaining')}: {formatAmount(remaining)}
         </p>
       )}
     </div>
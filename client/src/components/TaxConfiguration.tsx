@@ -301,7 +301,7 @@ export function TaxConfiguration() {
               data-testid="button-add-tax-presets"
             >
               <Plus className="h-4 w-4 me-1" />
-              {t('tax.presets', { defaultValue: 'Presets' })}
+              {t('tax.presets')}
             </Button>
             <Button
               size="sm"
@@ -310,7 +310,7 @@ export function TaxConfiguration() {
               data-testid="button-add-tax-rate"
             >
               <Plus className="h-4 w-4 me-1" />
-              {t('common.new', { defaultValue: 'New' })}
+              {t('common.new')}
             </Button>
           </div>
         </div>
@@ -337,7 +337,7 @@ export function TaxConfiguration() {
                     <TableHead>{t('tax.rate')}</TableHead>
                     <TableHead>{t('tax.calculation')}</TableHead>
                     <TableHead>{t('tax.jurisdiction')}</TableHead>
-                    <TableHead>{t('tax.threshold', { defaultValue: 'Threshold' })}</TableHead>
+                    <TableHead>{t('tax.threshold')}</TableHead>
                     <TableHead>{t('tax.status')}</TableHead>
                     <TableHead>{t('tax.effectiveFrom')}</TableHead>
                     <TableHead className="text-end">{t('common.actions')}</TableHead>
@@ -347,7 +347,7 @@ export function TaxConfiguration() {
                   {taxRates.length === 0 && (
                     <TableRow>
                       <TableCell colSpan={10} className="p-6 text-center text-sm text-muted-foreground" data-testid="tax-empty-row">
-                        {t('tax.noTaxRates', { defaultValue: 'No tax rates yet' })}
+                        {t('tax.noTaxRates')}
                       </TableCell>
                     </TableRow>
                   )}
@@ -384,9 +384,9 @@ export function TaxConfiguration() {
                       <TableCell>
                         {tax.thresholdAmount != null ? (
                           <div className="text-xs">
-                            <div><strong>{t('tax.amt', { defaultValue: 'Amt:' })}</strong> {tax.thresholdAmount}</div>
-                            <div><strong>{t('tax.per', { defaultValue: 'Per:' })}</strong> {tax.thresholdPeriod || '-'}</div>
-                            <div><strong>{t('tax.for', { defaultValue: 'For:' })}</strong> {tax.thresholdAppliesTo || '-'}</div>
+                            <div><strong>{t('tax.amt')}</strong> {tax.thresholdAmount}</div>
+                            <div><strong>{t('tax.per')}</strong> {tax.thresholdPeriod || '-'}</div>
+                            <div><strong>{t('tax.for')}</strong> {tax.thresholdAppliesTo || '-'}</div>
                           </div>
                         ) : (
                           <span className="text-muted-foreground text-xs">—</span>
@@ -444,7 +444,7 @@ export function TaxConfiguration() {
             <div className="space-y-3 px-4 pb-4">
               {taxRates.length === 0 ? (
                 <div className="p-6 text-center text-sm text-muted-foreground" data-testid="tax-empty-row">
-                  {t('tax.noTaxRates', { defaultValue: 'No tax rates yet' })}
+                  {t('tax.noTaxRates')}
                 </div>
               ) : (
                 taxRates.map((tax) => (
@@ -497,14 +497,14 @@ export function TaxConfiguration() {
                       {/* Details Grid */}
                       <div className="grid grid-cols-2 gap-2 text-sm">
                         <div>
-                          <div className="text-muted-foreground text-xs">{t("tax.jurisdiction", "Jurisdiction")}</div>
+                          <div className="text-muted-foreground text-xs">{t("tax.jurisdiction")}</div>
                           <div className="flex items-center gap-1">
                             <Building className="h-3 w-3" />
                             <span>{tax.jurisdiction || t("tax.global")}</span>
                           </div>
                         </div>
                         <div>
-                          <div className="text-muted-foreground text-xs">{t("tax.effectiveFrom", "Effective From")}</div>
+                          <div className="text-muted-foreground text-xs">{t("tax.effectiveFrom")}</div>
                           <div className="flex items-center gap-1">
                             <Calendar className="h-3 w-3" />
                             <span>{new Date(tax.effectiveFrom).toLocaleDateString()}</span>
@@ -515,16 +515,16 @@ export function TaxConfiguration() {
                       {/* Threshold Info */}
                       {tax.thresholdAmount != null && (
                         <div className="text-xs bg-muted p-2 rounded">
-                          <div className="font-medium mb-1">{t("tax.threshold", "Threshold")}</div>
-                          <div><strong>{t("common.amount", "Amount")}:</strong> {tax.thresholdAmount}</div>
-                          <div><strong>{t("common.period", "Period")}:</strong> {tax.thresholdPeriod || '-'}</div>
-                          <div><strong>{t("tax.appliesTo", "Applies to")}:</strong> {tax.thresholdAppliesTo || '-'}</div>
+                          <div className="font-medium mb-1">{t("tax.threshold")}</div>
+                          <div><strong>{t("common.amount")}:</strong> {tax.thresholdAmount}</div>
+                          <div><strong>{t("common.period")}:</strong> {tax.thresholdPeriod || '-'}</div>
+                          <div><strong>{t("tax.appliesTo")}:</strong> {tax.thresholdAppliesTo || '-'}</div>
                         </div>
                       )}
 
                       {/* Status Toggle */}
                       <div className="flex items-center justify-between pt-2 border-t">
-                        <span className="text-sm font-medium">{t("common.status", "Status")}</span>
+                        <span className="text-sm font-medium">{t("common.status")}</span>
                         <div className="flex items-center gap-2">
                           <Switch
                             checked={tax.active}
@@ -620,7 +620,7 @@ export function TaxConfiguration() {
             </div>
             <div className="grid grid-cols-1 md:grid-cols-3 gap-4">
               <div className="space-y-2">
-                <Label htmlFor="threshold-amount">{t('tax.thresholdAmount', { defaultValue: 'Threshold Amount (Optional)' })}</Label>
+                <Label htmlFor="threshold-amount">{t('tax.thresholdAmount')}</Label>
                 <Input
                   id="threshold-amount"
                   type="number"
@@ -632,40 +632,40 @@ export function TaxConfiguration() {
                 />
               </div>
               <div className="space-y-2">
-                <Label htmlFor="threshold-period">{t('tax.thresholdPeriod', { defaultValue: 'Threshold Period' })}</Label>
+                <Label htmlFor="threshold-period">{t('tax.thresholdPeriod')}</Label>
                 <Select
                   value={formData.thresholdPeriod as any}
                   onValueChange={(value) => setFormData({...formData, thresholdPeriod: value})}
                 >
                   <SelectTrigger data-testid="select-threshold-period">
-                    <SelectValue placeholder={t("tax.selectPeriod", { defaultValue: "Select period" })} />
+                    <SelectValue placeholder={t("tax.selectPeriod")} />
                   </SelectTrigger>
                   <SelectContent>
-                    <SelectItem value="annual">{t('tax.annual', { defaultValue: 'Annual' })}</SelectItem>
-                    <SelectItem value="monthly">{t('tax.monthly', { defaultValue: 'Monthly' })}</SelectItem>
-                    <SelectItem value="rolling12">{t('tax.rolling12', { defaultValue: 'Rolling 12 Months' })}</SelectItem>
+                    <SelectItem value="annual">{t('tax.annual')}</SelectItem>
+                    <SelectItem value="monthly">{t('tax.monthly')}</SelectItem>
+                    <SelectItem value="rolling12">{t('tax.rolling12')}</SelectItem>
                   </SelectContent>
                 </Select>
               </div>
               <div className="space-y-2">
-                <Label htmlFor="threshold-applies">{t('tax.thresholdAppliesTo', { defaultValue: 'Threshold Applies To' })}</Label>
+                <Label htmlFor="threshold-applies">{t('tax.thresholdAppliesTo')}</Label>
                 <Select
                   value={formData.thresholdAppliesTo as any}
                   onValueChange={(value) => setFormData({...formData, thresholdAppliesTo: value})}
                 >
                   <SelectTrigger data-testid="select-threshold-applies">
-                    <SelectValue placeholder={t("tax.selectBasis", { defaultValue: "Select basis" })} />
+                    <SelectValue placeholder={t("tax.selectBasis")} />
                   </SelectTrigger>
                   <SelectContent>
-                    <SelectItem value="turnover">{t('tax.turnover', { defaultValue: 'Turnover (VAT)' })}</SelectItem>
-                    <SelectItem value="income">{t('tax.incomeProfit', { defaultValue: 'Income/Profit (Corporate)' })}</SelectItem>
-                    <SelectItem value="other">{t('tax.other', { defaultValue: 'Other' })}</SelectItem>
+                    <SelectItem value="turnover">{t('tax.turnover')}</SelectItem>
+                    <SelectItem value="income">{t('tax.incomeProfit')}</SelectItem>
+                    <SelectItem value="other">{t('tax.other')}</SelectItem>
                   </SelectContent>
                 </Select>
               </div>
             </div>
             <div className="space-y-2">
-              <Label htmlFor="jurisdiction">{t('tax.jurisdictionOptional', { defaultValue: 'Jurisdiction (Optional)' })}</Label>
+              <Label htmlFor="jurisdiction">{t('tax.jurisdictionOptional')}</Label>
               <Input
                 id="jurisdiction"
                 value={formData.jurisdiction || ""}
@@ -685,7 +685,7 @@ export function TaxConfiguration() {
               />
             </div>
             <div className="space-y-2">
-              <Label htmlFor="gl-account">{t('tax.glAccount', { defaultValue: 'GL Account' })}</Label>
+              <Label htmlFor="gl-account">{t('tax.glAccount')}</Label>
               <Input
                 id="gl-account"
                 value={formData.glAccount || ""}
@@ -715,18 +715,18 @@ export function TaxConfiguration() {
         <DialogContent className="max-w-2xl max-h-[80vh] overflow-y-auto" data-testid="dialog-tax-presets">
           <DialogHeader>
             <DialogTitle>
-              {t('tax.quickAddPresets', { defaultValue: 'Quick Add: Country Tax Presets' })}
+              {t('tax.quickAddPresets')}
             </DialogTitle>
           </DialogHeader>
           <div className="space-y-4">
             <div className="space-y-2">
-              <Label htmlFor="country">{t('common.country', { defaultValue: 'Country' })}</Label>
+              <Label htmlFor="country">{t('common.country')}</Label>
               <Select value={selectedCountry} onValueChange={(val) => {
                 setSelectedCountry(val);
                 setSelectedPresetTypes([]); // Reset selections when country changes
               }}>
                 <SelectTrigger data-testid="select-country">
-                  <SelectValue placeholder={t("common.selectCountry", { defaultValue: "Select a country" })} />
+                  <SelectValue placeholder={t("common.selectCountry")} />
                 </SelectTrigger>
                 <SelectContent>
                   {getCountryList().map((c) => (
@@ -741,7 +741,7 @@ export function TaxConfiguration() {
             {selectedCountry && (
               <div className="space-y-3">
                 <div className="flex items-center justify-between">
-                  <Label>{t('tax.availableTaxes', { defaultValue: 'Available Taxes' })}</Label>
+                  <Label>{t('tax.availableTaxes')}</Label>
                   <Button 
                     type="button" 
                     variant="ghost" 
@@ -756,7 +756,7 @@ export function TaxConfiguration() {
                       }
                     }}
                   >
-                    {t('common.selectAll', { defaultValue: 'Select All' })}
+                    {t('common.selectAll')}
                   </Button>
                 </div>
                 <div className="border rounded-lg divide-y max-h-60 overflow-y-auto">
@@ -807,9 +807,7 @@ export function TaxConfiguration() {
                   })}
                 </div>
                 <p className="text-xs text-muted-foreground">
-                  {t('tax.presetsHint', { 
-                    defaultValue: 'Select the taxes you want to add, or leave empty to add all.' 
-                  })}
+                  {t('tax.presetsHint')}
                 </p>
               </div>
             )}
@@ -828,10 +826,10 @@ export function TaxConfiguration() {
                 data-testid="button-apply-presets"
               >
                 {batchCreateMutation.isPending 
-                  ? t('common.loading', { defaultValue: 'Loading...' })
+                  ? t('common.loading')
                   : selectedPresetTypes.length > 0
                     ? t('tax.addSelected', { defaultValue: `Add ${selectedPresetTypes.length} Tax(es)` })
-                    : t('tax.addAllTaxes', { defaultValue: 'Add All Taxes' })
+                    : t('tax.addAllTaxes')
                 }
               </Button>
             </div>
@@ -7,10 +7,10 @@ import {
   DropdownMenuTrigger,
 } from "@/components/ui/dropdown-menu";
 import { useTheme } from "./ThemeProvider";
-import { useTranslation } from "react-i18next";
+import { useTypedTranslation } from "@/hooks/useTypedTranslation";
 
 export function ThemeToggle() {
-  const { t } = useTranslation();
+  const { t } = useTypedTranslation();
   const { theme, setTheme } = useTheme();
 
   return (
@@ -231,10 +231,10 @@ export function ActivityLog({
     const hours = Math.floor(diff / 3600000);
     const days = Math.floor(diff / 86400000);
 
-    if (minutes < 1) return t('time.justNow', 'Just now');
-    if (minutes < 60) return t('time.minutesAgo', '{{minutes}}m ago', { minutes });
-    if (hours < 24) return t('time.hoursAgo', '{{hours}}h ago', { hours });
-    if (days < 7) return t('time.daysAgo', '{{days}}d ago', { days });
+    if (minutes < 1) return t('time.justNow');
+    if (minutes < 60) return t('time.minutesAgo', { minutes });
+    if (hours < 24) return t('time.hoursAgo', { hours });
+    if (days < 7) return t('time.daysAgo', { days });
     
     return new Intl.DateTimeFormat(i18n.language, {
       month: 'short',
@@ -293,7 +293,7 @@ export function ActivityLog({
           onClick={onLoadMore}
           className="text-sm text-primary hover:underline"
         >
-          {t('activity.loadMore', 'Load more')}
+          {t('activity.loadMore')}
         </button>
       )}
     </div>
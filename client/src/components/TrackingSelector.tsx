@@ -351,7 +351,7 @@ export function TrackingSelector({
               {t('common.cancel')}
             </Button>
             <Button onClick={handleConfirm}>
-              {t('common.confirm', { defaultValue: 'تأكيد' })}
+              {t('common.confirm')}
             </Button>
           </DialogFooter>
         </DialogContent>
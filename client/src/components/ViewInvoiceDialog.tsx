@@ -167,7 +167,7 @@ export function ViewInvoiceDialog({ open, onOpenChange, invoiceId, onEdit }: Vie
         download: true,
       });
 
-      toast({ title: t('common.success'), description: t('sales.invoices.pdfDownloaded', { defaultValue: 'PDF downloaded' }) });
+      toast({ title: t('common.success'), description: t('sales.invoices.pdfDownloaded') });
     } catch (error: any) {
       console.error('PDF generation error:', error);
       toast({ title: t('common.error'), description: error?.message || 'Failed to generate PDF', variant: 'destructive' });
@@ -204,13 +204,13 @@ export function ViewInvoiceDialog({ open, onOpenChange, invoiceId, onEdit }: Vie
                   <CardContent className="p-3 sm:p-4">
                     <div className="flex items-center gap-2 text-xs sm:text-sm font-medium text-muted-foreground mb-2 sm:mb-3">
                       <Building2 className="h-3 w-3 sm:h-4 sm:w-4" />
-                      {t('settings.company.companyDetails', { defaultValue: 'Company Details' })}
+                      {t('settings.company.companyDetails')}
                     </div>
                     <div className="space-y-1">
                       <p className="font-semibold text-base sm:text-lg">{companySettings?.company_name || companySettings?.name || '—'}</p>
                       {companySettings?.tax_number && (
                         <p className="text-xs sm:text-sm text-muted-foreground">
-                          {t('settings.company.taxNumber', { defaultValue: 'Tax Number' })}: {companySettings.tax_number}
+                          {t('settings.company.taxNumber')}: {companySettings.tax_number}
                         </p>
                       )}
                       {companySettings?.email && (
@@ -268,7 +268,7 @@ export function ViewInvoiceDialog({ open, onOpenChange, invoiceId, onEdit }: Vie
                     {invoice.po_number && (
                       <div>
                         <div className="text-xs sm:text-sm text-muted-foreground mb-1">
-                          {t('sales.invoices.poNumber', { defaultValue: 'PO Number' })}
+                          {t('sales.invoices.poNumber')}
                         </div>
                         <p className="font-semibold text-sm sm:text-base">{invoice.po_number}</p>
                       </div>
@@ -285,8 +285,8 @@ export function ViewInvoiceDialog({ open, onOpenChange, invoiceId, onEdit }: Vie
                       <TableHeader>
                         <TableRow className="bg-muted/50">
                           <TableHead className="font-semibold text-xs sm:text-sm min-w-[120px]">{t('common.description')}</TableHead>
-                          <TableHead className="text-center font-semibold text-xs sm:text-sm">{t('common.quantity', { defaultValue: 'Qty' })}</TableHead>
-                          <TableHead className="text-end font-semibold text-xs sm:text-sm">{t('common.unitPrice', { defaultValue: 'Unit Price' })}</TableHead>
+                          <TableHead className="text-center font-semibold text-xs sm:text-sm">{t('common.quantity')}</TableHead>
+                          <TableHead className="text-end font-semibold text-xs sm:text-sm">{t('common.unitPrice')}</TableHead>
                           <TableHead className="text-center font-semibold text-xs sm:text-sm hidden sm:table-cell">{t('common.discount')}</TableHead>
                           <TableHead className="text-center font-semibold text-xs sm:text-sm hidden sm:table-cell">{t('common.tax')}</TableHead>
                           <TableHead className="text-end font-semibold text-xs sm:text-sm">{t('common.amount')}</TableHead>
@@ -378,7 +378,7 @@ export function ViewInvoiceDialog({ open, onOpenChange, invoiceId, onEdit }: Vie
             </div>
           ) : (
             <div className="p-4 sm:p-6 text-center text-muted-foreground">
-              {t('sales.invoices.invoiceNotFound', { defaultValue: 'Invoice not found' })}
+              {t('sales.invoices.invoiceNotFound')}
             </div>
           )}
         </ScrollArea>
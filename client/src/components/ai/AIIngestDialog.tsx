@@ -64,13 +64,13 @@ export default function AIIngestDialog({ open, onOpenChange, title, onExtract, a
 
   const buildPayload = async (): Promise<any> => {
     if (!scanText.trim() && !scanFile) {
-      throw new Error(t('ai.provideTextOrImage', { defaultValue: 'Please paste text or upload an image.' }));
+      throw new Error(t('ai.provideTextOrImage'));
     }
     const payload: any = {};
     if (scanText.trim()) payload.text = scanText.trim();
     if (scanFile) {
       if (scanFile.size > 10 * 1024 * 1024) {
-        throw new Error(t('ai.fileTooLarge', { defaultValue: 'File is too large (>10MB).' }));
+        throw new Error(t('ai.fileTooLarge'));
       }
       const b64 = await new Promise<string>((resolve, reject) => {
         const reader = new FileReader();
@@ -182,15 +182,15 @@ export default function AIIngestDialog({ open, onOpenChange, title, onExtract, a
     <Dialog open={open} onOpenChange={onOpenChange}>
       <DialogContent className="max-w-xl">
         <DialogHeader>
-          <DialogTitle>{title || t('ai.pasteInvoiceText', { defaultValue: 'Paste invoice text' })}</DialogTitle>
+          <DialogTitle>{title || t('ai.pasteInvoiceText')}</DialogTitle>
         </DialogHeader>
         <div className="space-y-3">
-          <Label htmlFor="scan-text">{t('ai.invoiceText', { defaultValue: 'Invoice text' })}</Label>
-          <Textarea id="scan-text" value={scanText} onChange={(e) => setScanText(e.target.value)} rows={8} placeholder={t('ai.pasteHere', { defaultValue: 'Paste recognized text here...' })} />
+          <Label htmlFor="scan-text">{t('ai.invoiceText')}</Label>
+          <Textarea id="scan-text" value={scanText} onChange={(e) => setScanText(e.target.value)} rows={8} placeholder={t('ai.pasteHere')} />
           {!import.meta.env.PROD && (
             <div>
               <Button type="button" variant="outline" size="sm" onClick={() => setScanText(`ACME Corp\nInvoice No: INV-2024-015\nDate: 2024-10-05\nDue Date: 2024-11-04\nSubtotal: $950.00\nVAT: $50.00\nTotal: $1,000.00`)}>
-                {t('ai.trySample', { defaultValue: 'Try sample' })}
+                {t('ai.trySample')}
               </Button>
             </div>
           )}
@@ -198,10 +198,10 @@ export default function AIIngestDialog({ open, onOpenChange, title, onExtract, a
           {aiProviders.length > 0 && (
             <div className="grid grid-cols-1 gap-3">
               <div>
-                <Label>{t('ai.provider', { defaultValue: 'AI Provider (optional)' })}</Label>
+                <Label>{t('ai.provider')}</Label>
                 <Select value={selectedProviderId} onValueChange={setSelectedProviderId}>
                   <SelectTrigger>
-                    <SelectValue placeholder={t('ai.selectProvider', { defaultValue: 'Select provider' })} />
+                    <SelectValue placeholder={t('ai.selectProvider')} />
                   </SelectTrigger>
                   <SelectContent>
                     {aiProviders.map((p: any) => (
@@ -213,11 +213,11 @@ export default function AIIngestDialog({ open, onOpenChange, title, onExtract, a
                 </Select>
               </div>
               <div>
-                <Label>{t('ai.model', { defaultValue: 'Model (optional)' })}</Label>
+                <Label>{t('ai.model')}</Label>
                 {modelOptions.length > 0 ? (
                   <Select value={selectedModel} onValueChange={setSelectedModel} disabled={modelsLoading}>
                     <SelectTrigger>
-                      <SelectValue placeholder={t('ai.selectModel', { defaultValue: 'Select model' })} />
+                      <SelectValue placeholder={t('ai.selectModel')} />
                     </SelectTrigger>
                     <SelectContent>
                       {modelOptions.map((m: any) => {
@@ -227,7 +227,7 @@ export default function AIIngestDialog({ open, onOpenChange, title, onExtract, a
                     </SelectContent>
                   </Select>
                 ) : (
-                  <Input placeholder={t('ai.enterModel', { defaultValue: 'Enter model (optional)' })} value={selectedModel} onChange={(e) => setSelectedModel(e.target.value)} />
+                  <Input placeholder={t('ai.enterModel')} value={selectedModel} onChange={(e) => setSelectedModel(e.target.value)} />
                 )}
               </div>
               {/* Planned pipeline hint */}
@@ -235,11 +235,11 @@ export default function AIIngestDialog({ open, onOpenChange, title, onExtract, a
                 <div className="rounded-md border p-2 text-xs text-muted-foreground">
                   <div className="flex items-center justify-between">
                     <span>
-                      {t('ai.plannedMode', { defaultValue: 'Planned mode' })}: {simLoading ? t('common.loading') : (plan?.mode || t('common.unknown', { defaultValue: 'Unknown' }))}
+                      {t('ai.plannedMode')}: {simLoading ? t('common.loading') : (plan?.mode || t('common.unknown'))}
                     </span>
                     {plan?.steps?.length ? (
                       <span className="inline-flex items-center gap-1">
-                        {t('ai.steps', { defaultValue: 'Steps' })}:
+                        {t('ai.steps')}:
                         {plan.steps.map((s: string, i: number) => (
                           <span key={s + i} className="px-1 py-0.5 rounded bg-muted text-[10px]">{s}</span>
                         ))}
@@ -248,7 +248,7 @@ export default function AIIngestDialog({ open, onOpenChange, title, onExtract, a
                   </div>
                   {plan?.provider?.provider && (
                     <div className="mt-1">
-                      {t('ai.providerShort', { defaultValue: 'Provider' })}: {String(plan.provider.provider)}{plan?.model ? ` • ${String(plan.model)}` : ''}
+                      {t('ai.providerShort')}: {String(plan.provider.provider)}{plan?.model ? ` • ${String(plan.model)}` : ''}
                     </div>
                   )}
                   {Array.isArray(plan?.warnings) && plan.warnings.length > 0 && (
@@ -276,9 +276,9 @@ export default function AIIngestDialog({ open, onOpenChange, title, onExtract, a
               onClick={() => fileInputRef.current?.click()}
             >
               {!scanFile ? (
-                <p className="text-sm text-muted-foreground">{t('ai.dragDrop',{defaultValue:'Drag & drop an image or PDF here, or click to select'})}</p>
+                <p className="text-sm text-muted-foreground">{t('ai.dragDrop')}</p>
               ) : (
-                <p className="text-sm">{t('ai.selectedFile',{defaultValue:'Selected'})}: {scanFile.name} ({Math.round(scanFile.size/1024)} KB)</p>
+                <p className="text-sm">{t('ai.selectedFile')}: {scanFile.name} ({Math.round(scanFile.size/1024)} KB)</p>
               )}
             </div>
             <input
@@ -291,24 +291,24 @@ export default function AIIngestDialog({ open, onOpenChange, title, onExtract, a
             />
             {allowPdf && scanFile && /pdf/i.test(scanFile.type || '') && (
               <div className="grid grid-cols-1 gap-2">
-                <Label>{t('ai.pages', { defaultValue: 'Pages (optional)' })}</Label>
-                <Input value={pdfPages} onChange={(e) => setPdfPages(e.target.value)} placeholder={t('ai.pagesPlaceholder', { defaultValue: 'e.g., 1-2,4' })} />
-                <p className="text-xs text-muted-foreground">{t('ai.pagesHelp', { defaultValue: 'Specify pages to parse (1-indexed). Ranges and commas supported.' })}</p>
+                <Label>{t('ai.pages')}</Label>
+                <Input value={pdfPages} onChange={(e) => setPdfPages(e.target.value)} placeholder={t('ai.pagesPlaceholder')} />
+                <p className="text-xs text-muted-foreground">{t('ai.pagesHelp')}</p>
               </div>
             )}
           </div>
           <div className="space-y-2">
             <Button type="button" variant="ghost" size="sm" onClick={() => setShowAdvanced(s => !s)}>
-              {showAdvanced ? t('common.hide', { defaultValue: 'Hide' }) : t('common.advanced', { defaultValue: 'Advanced' })}
+              {showAdvanced ? t('common.hide') : t('common.advanced')}
             </Button>
             {showAdvanced && (
               <div className="space-y-2">
-                <Label>{t('ai.customPrompt', { defaultValue: 'Custom prompt (optional)' })}</Label>
-                <Textarea rows={3} value={scanPrompt} onChange={(e) => setScanPrompt(e.target.value)} placeholder={t('ai.promptPlaceholder', { defaultValue: 'Guide the extraction with extra instructions' })} />
+                <Label>{t('ai.customPrompt')}</Label>
+                <Textarea rows={3} value={scanPrompt} onChange={(e) => setScanPrompt(e.target.value)} placeholder={t('ai.promptPlaceholder')} />
                 <div className="flex items-center gap-2">
                   <input id="refine-llm" type="checkbox" className="h-4 w-4" checked={refineLLM} onChange={(e) => setRefineLLM(e.target.checked)} />
                   <Label htmlFor="refine-llm" className="text-sm">
-                    {t('ai.refineWithLLM', { defaultValue: 'Use LLM refinement for text/PDF' })}
+                    {t('ai.refineWithLLM')}
                   </Label>
                 </div>
               </div>
@@ -317,22 +317,22 @@ export default function AIIngestDialog({ open, onOpenChange, title, onExtract, a
           {!consent && (
             <div className="rounded-md border p-3 space-y-2 bg-amber-50 dark:bg-amber-950/30">
               <p className="text-xs leading-relaxed">
-                {t('ai.consentNotice',{ defaultValue: 'By enabling AI extraction you agree to send the provided text/image to the selected provider for processing. Redaction is applied to sensitive tokens before LLM refinement. Enable consent to proceed.' })}
+                {t('ai.consentNotice')}
               </p>
               <div className="flex items-center gap-2">
                 <input id="ai-consent" type="checkbox" className="h-4 w-4" checked={consent} disabled={consentLoading} onChange={async (e)=>{ const v = e.target.checked; setConsent(v); if (v) await persistConsent(); }} />
                 <Label htmlFor="ai-consent" className="text-xs font-medium">
-                  {t('ai.consentAgree',{ defaultValue: 'I understand and consent to AI processing.' })}
+                  {t('ai.consentAgree')}
                 </Label>
               </div>
             </div>
           )}
           <div className="flex items-center gap-3 justify-end mt-2">
-            <Button type="button" variant="secondary" onClick={clearAll}>{t('common.clear',{defaultValue:'Clear'})}</Button>
+            <Button type="button" variant="secondary" onClick={clearAll}>{t('common.clear')}</Button>
             <Button variant="outline" onClick={() => onOpenChange(false)}>{t('common.cancel')}</Button>
-            <Button onClick={handleExtract} disabled={scanLoading || !consent}>{scanLoading ? t('common.loading') : t('ai.extractFields', { defaultValue: 'Extract fields' })}</Button>
+            <Button onClick={handleExtract} disabled={scanLoading || !consent}>{scanLoading ? t('common.loading') : t('ai.extractFields')}</Button>
           </div>
-          <p className="text-xs text-muted-foreground">{t('ai.scanDisclaimer', { defaultValue: 'Paste text, or upload an image or PDF for AI extraction.' })}</p>
+          <p className="text-xs text-muted-foreground">{t('ai.scanDisclaimer')}</p>
         </div>
       </DialogContent>
     </Dialog>
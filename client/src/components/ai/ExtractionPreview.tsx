@@ -97,15 +97,15 @@ export const ExtractionPreview: React.FC<ExtractionPreviewProps> = ({
       {/* Phase 6: Line Items Display */}
       {extraction && 'line_items' in extraction && Array.isArray((extraction as any).line_items) && (extraction as any).line_items.length > 0 && (
         <div className="space-y-2 pt-2">
-          <Label>{t('ai.lineItems', 'Line Items')}</Label>
+          <Label>{t('ai.lineItems')}</Label>
           <div className="border rounded-md overflow-hidden">
             <table className="w-full text-sm">
               <thead className="bg-muted/50">
                 <tr>
-                  <th className="p-2 text-left font-medium text-muted-foreground">{t('common.description', 'Description')}</th>
-                  <th className="p-2 text-right font-medium text-muted-foreground w-16">{t('common.qty', 'Qty')}</th>
-                  <th className="p-2 text-right font-medium text-muted-foreground w-24">{t('common.price', 'Price')}</th>
-                  <th className="p-2 text-right font-medium text-muted-foreground w-24">{t('common.total', 'Total')}</th>
+                  <th className="p-2 text-left font-medium text-muted-foreground">{t('common.description')}</th>
+                  <th className="p-2 text-right font-medium text-muted-foreground w-16">{t('common.qty')}</th>
+                  <th className="p-2 text-right font-medium text-muted-foreground w-24">{t('common.price')}</th>
+                  <th className="p-2 text-right font-medium text-muted-foreground w-24">{t('common.total')}</th>
                 </tr>
               </thead>
               <tbody>
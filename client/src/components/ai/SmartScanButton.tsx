@@ -3,7 +3,7 @@ import { Button } from "@/components/ui/button";
 import { Loader2, ScanLine } from "lucide-react";
 import { useToast } from "@/hooks/use-toast";
 import { apiRequest } from "@/lib/queryClient";
-import { useTranslation } from "react-i18next";
+import { useTypedTranslation } from "@/hooks/useTypedTranslation";
 
 interface SmartScanButtonProps {
   onScanComplete: (data: any) => void;
@@ -12,7 +12,7 @@ interface SmartScanButtonProps {
 }
 
 export function SmartScanButton({ onScanComplete, documentType, className }: SmartScanButtonProps) {
-  const { t } = useTranslation();
+  const { t } = useTypedTranslation();
   const { toast } = useToast();
   const [isScanning, setIsScanning] = useState(false);
 
@@ -38,7 +38,7 @@ export function SmartScanButton({ onScanComplete, documentType, className }: Sma
           onScanComplete(responseData.data);
           toast({
             title: t("common.success"),
-            description: t("ai.scanSuccess", "Document scanned successfully"),
+            description: t("ai.scanSuccess"),
           });
         } else {
           throw new Error(responseData.error || "Failed to extract data");
@@ -50,7 +50,7 @@ export function SmartScanButton({ onScanComplete, documentType, className }: Sma
       toast({
         variant: "destructive",
         title: t("common.error"),
-        description: error.message || t("ai.scanError", "Failed to scan document"),
+        description: error.message || t("ai.scanError"),
       });
     } finally {
       setIsScanning(false);
@@ -66,7 +66,7 @@ export function SmartScanButton({ onScanComplete, documentType, className }: Sma
         className="absolute inset-0 w-full h-full opacity-0 cursor-pointer z-10"
         onChange={handleFileUpload}
         disabled={isScanning}
-        title={t("ai.scanTooltip", "Upload Image or PDF to Scan")}
+        title={t("ai.scanTooltip")}
       />
       <Button variant="outline" disabled={isScanning} className="w-full">
         {isScanning ? (
@@ -74,7 +74,7 @@ export function SmartScanButton({ onScanComplete, documentType, className }: Sma
         ) : (
           <ScanLine className="mr-2 h-4 w-4" />
         )}
-        {isScanning ? t("common.scanning", "Scanning...") : t("ai.smartScan", "Smart Scan (AI)")}
+        {isScanning ? t("common.scanning") : t("ai.smartScan")}
       </Button>
     </div>
   );
@@ -21,20 +21,20 @@ export function BatchList({ itemId }: BatchListProps) {
     queryKey: [`/api/inventory/items/${itemId}/batches`],
   });
 
-  if (isLoading) return <div>{t("common.loading", "Loading batches...")}</div>;
+  if (isLoading) return <div>{t("common.loading")}</div>;
 
   return (
     <div className="space-y-4">
-      <h3 className="text-lg font-medium">{t("inventory.batchLotNumbers", "Batch / Lot Numbers")}</h3>
+      <h3 className="text-lg font-medium">{t("inventory.batchLotNumbers")}</h3>
       <div className="border rounded-md">
         <Table>
           <TableHeader>
             <TableRow>
               <TableHead>{t("inventory.batchNumber", "Batch #")}</TableHead>
               <TableHead>{t("inventory.expiryDate", "Expiry Date")}</TableHead>
-              <TableHead>{t("common.quantity", "Quantity")}</TableHead>
-              <TableHead>{t("inventory.warehouse", "Warehouse")}</TableHead>
-              <TableHead>{t("common.status", "Status")}</TableHead>
+              <TableHead>{t("common.quantity")}</TableHead>
+              <TableHead>{t("inventory.warehouse")}</TableHead>
+              <TableHead>{t("common.status")}</TableHead>
             </TableRow>
           </TableHeader>
           <TableBody>
@@ -48,7 +48,7 @@ export function BatchList({ itemId }: BatchListProps) {
                 <TableCell>{batch.warehouse?.name || "-"}</TableCell>
                 <TableCell>
                   <Badge variant={batch.is_active ? "default" : "secondary"}>
-                    {batch.is_active ? t("common.active", "Active") : t("common.inactive", "Inactive")}
+                    {batch.is_active ? t("common.active") : t("common.inactive")}
                   </Badge>
                 </TableCell>
               </TableRow>
@@ -56,7 +56,7 @@ export function BatchList({ itemId }: BatchListProps) {
             {batches?.length === 0 && (
               <TableRow>
                 <TableCell colSpan={5} className="text-center py-4 text-muted-foreground">
-                  {t("inventory.noBatches", "No batches found")}
+                  {t("inventory.noBatches")}
                 </TableCell>
               </TableRow>
             )}
@@ -77,7 +77,7 @@ export function StockHistoryDialog({
           </div>
         ) : error ? (
           <div className="flex justify-center p-8 text-muted-foreground">
-            {t("common.errorLoading", { defaultValue: "حدث خطأ في تحميل البيانات" })}
+            {t("common.errorLoading")}
           </div>
         ) : (
           <div className="flex-1 overflow-auto px-4 pb-4">
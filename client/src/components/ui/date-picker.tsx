@@ -45,23 +45,23 @@ function CalendarWithDropdowns({
   disabled?: (date: Date) => boolean
   locale?: any
 }) {
-  const { t } = useTranslation()
+  const { t, i18n } = useTranslation()
   const [month, setMonthState] = React.useState<Date>(selected || new Date())
 
-  const months = [
-    t("months.january", "يناير"),
-    t("months.february", "فبراير"),
-    t("months.march", "مارس"),
-    t("months.april", "أبريل"),
-    t("months.may", "مايو"),
-    t("months.june", "يونيو"),
-    t("months.july", "يوليو"),
-    t("months.august", "أغسطس"),
-    t("months.september", "سبتمبر"),
-    t("months.october", "أكتوبر"),
-    t("months.november", "نوفمبر"),
-    t("months.december", "ديسمبر"),
-  ]
+  const months = React.useMemo(() => [
+    t("months.january"),
+    t("months.february"),
+    t("months.march"),
+    t("months.april"),
+    t("months.may"),
+    t("months.june"),
+    t("months.july"),
+    t("months.august"),
+    t("months.september"),
+    t("months.october"),
+    t("months.november"),
+    t("months.december"),
+  ], [t, i18n.language])
 
   // Generate years from 2000 to 2050
   const years = Array.from({ length: 51 }, (_, i) => 2000 + i)
@@ -223,7 +223,7 @@ export function DatePicker({
           {dateValue ? (
             format(dateValue, "PPP", { locale })
           ) : (
-            <span>{placeholder || t("common.selectDate", "اختر التاريخ")}</span>
+            <span>{placeholder || t("common.selectDate")}</span>
           )}
         </Button>
       </PopoverTrigger>
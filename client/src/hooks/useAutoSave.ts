@@ -124,12 +124,12 @@ export function useAutoSave<T extends Record<string, any>>(
         const timeDiff = Date.now() - savedTimestamp.getTime();
         const minutes = Math.floor(timeDiff / 60000);
         const timeText = minutes < 1 
-          ? t('autoSave.justNow', 'just now')
-          : t('autoSave.minutesAgo', '{{minutes}} minutes', { minutes });
+          ? t('autoSave.justNow')
+          : t('autoSave.minutesAgo', { minutes });
         
         toast({
-          title: t('autoSave.foundDraft', 'Draft found'),
-          description: `${t('autoSave.savedAgo', 'Saved {{time}} ago', { time: timeText })} - ${t('autoSave.clickToRestore', 'Check your form to restore')}`,
+          title: t('autoSave.foundDraft'),
+          description: `${t('autoSave.savedAgo', { time: timeText })} - ${t('autoSave.clickToRestore')}`,
         });
         
         // Auto-restore the data
@@ -71,8 +71,8 @@ export function ConfirmationProvider({ children }: { children: ReactNode }) {
 
   const confirmDelete = useCallback((itemName?: string) => {
     return confirm({
-      title: t('confirm.deleteTitle', 'Delete {{item}}?', { item: itemName || t('common.item', 'item') }),
-      description: t('confirm.deleteDescription', 'This action cannot be undone. This will permanently delete this {{item}}.', { item: itemName || t('common.item', 'item') }),
+      title: t('confirm.deleteTitle', { item: itemName || t('common.item', 'item') }),
+      description: t('confirm.deleteDescription', { item: itemName || t('common.item', 'item') }),
       confirmLabel: t('common.delete'),
       variant: 'destructive',
     });
@@ -103,10 +103,10 @@ export function ConfirmationProvider({ children }: { children: ReactNode }) {
               <div className={`p-2 rounded-full bg-muted ${config.iconClass}`}>
                 <Icon className="h-5 w-5" />
               </div>
-              {options.title || t('confirm.title', 'Are you sure?')}
+              {options.title || t('confirm.title')}
             </AlertDialogTitle>
             <AlertDialogDescription>
-              {options.description || t('confirm.description', 'Please confirm this action.')}
+              {options.description || t('confirm.description')}
             </AlertDialogDescription>
           </AlertDialogHeader>
           <AlertDialogFooter>
@@ -0,0 +1,136 @@
+/**
+ * Legal documents (Terms, Privacy, Disclaimer) for the legal pages.
+ *
+ * The documents are not part of the translation bundles: `python -m i18n
+ * legal build` pre-renders each language's document into sanitized HTML
+ * fragments under /legal (see i18n/legal.py), and a page fetches its one
+ * document when it opens. Fragment files are named after their content, so
+ * only the manifest is revalidated; a language without its own document
+ * gets the English one.
+ *
+ *   const doc = useLegalDocument('terms');
+ *   <h2>{doc.text('sections.agreement.title')}</h2>
+ *   <p dangerouslySetInnerHTML={doc.html('sections.agreement.content2')} />
+ *   doc.items('sections.serviceDescription.items').map((item) => <LegalHtml html={item} />)
+ */
+import { useEffect, useState, type ReactNode } from 'react';
+import { useTranslation } from 'react-i18next';
+
+export type LegalDocumentName = 'terms' | 'privacy' | 'disclaimer';
+
+type Fragment = string | Fragment[] | { [key: string]: Fragment };
+
+interface Manifest {
+  version: number;
+  documents: Record<string, Record<string, { file: string }>>;
+}
+
+const BASE = '/legal';
+const MANIFEST_VERSION = 1;
+
+let manifest: Promise<Manifest> | undefined;
+const fragments = new Map<string, Promise<Fragment>>();
+
+async function fetchJson<T>(url: string, init?: RequestInit): Promise<T> {
+  const response = await fetch(url, init);
+  if (!response.ok) {
+    throw new Error(`${url} not available (${response.status})`);
+  }
+  return response.json();
+}
+
+function loadManifest(): Promise<Manifest> {
+  if (!manifest) {
+    manifest = fetchJson<Manifest>(`${BASE}/manifest.json`, { cache: 'no-cache' }).then((m) => {
+      if (m.version !== MANIFEST_VERSION) {
+        throw new Error(`Unsupported legal manifest version ${m.version}`);
+      }
+      return m;
+    });
+    manifest.catch(() => { manifest = undefined; });
+  }
+  return manifest;
+}
+
+async function loadDocument(name: LegalDocumentName, lang: string): Promise<Fragment> {
+  const entries = (await loadManifest()).documents[name] ?? {};
+  const entry = entries[lang] ?? entries[lang.split('-')[0]] ?? entries.en;
+  if (!entry) {
+    throw new Error(`Legal document ${name} has not been built`);
+  }
+  let fragment = fragments.get(entry.file);
+  if (!fragment) {
+    fragment = fetchJson<Fragment>(`${BASE}/${entry.file}`);
+    fragments.set(entry.file, fragment);
+    fragment.catch(() => fragments.delete(entry.file));
+  }
+  return fragment;
+}
+
+function lookup(tree: Fragment | undefined, key: string): Fragment | undefined {
+  let node = tree;
+  for (const part of key.split('.')) {
+    if (node === undefined || typeof node === 'string' || Array.isArray(node)) return undefined;
+    node = node[part];
+  }
+  return node;
+}
+
+function escapeHtml(value: string): string {
+  return value
+    .replace(/&/g, '&amp;')
+    .replace(/</g, '&lt;')
+    .replace(/>/g, '&gt;')
+    .replace(/"/g, '&quot;');
+}
+
+/** Fill `{{name}}` placeholders; values are escaped, the fragment already is. */
+function interpolate(html: string, params?: Record<string, string | number>): string {
+  if (!params) return html;
+  return html.replace(/\{\{\s*(\w+)\s*\}\}/g, (match, name: string) =>
+    name in params ? escapeHtml(String(params[name])) : match,
+  );
+}
+
+/** A pre-rendered fragment (already sanitized by the build). */
+export function LegalHtml({ html }: { html: Fragment | undefined }) {
+  return <span dangerouslySetInnerHTML={{ __html: typeof html === 'string' ? html : '' }} />;
+}
+
+export function useLegalDocument(name: LegalDocumentName) {
+  const { i18n } = useTranslation();
+  const lang = i18n.language;
+  const [tree, setTree] = useState<Fragment>();
+  const [error, setError] = useState<Error>();
+
+  useEffect(() => {
+    let active = true;
+    setError(undefined);
+    loadDocument(name, lang).then(
+      (fragment) => { if (active) setTree(fragment); },
+      (e: Error) => { if (active) setError(e); },
+    );
+    return () => { active = false; };
+  }, [name, lang]);
+
+  const fragmentOf = (key: string, params?: Record<string, string | number>) => {
+    const value = lookup(tree, key);
+    return typeof value === 'string' ? interpolate(value, params) : '';
+  };
+
+  return {
+    ready: tree !== undefined,
+    error,
+    /** The fragment at `key`, for `dangerouslySetInnerHTML`. */
+    html: (key: string, params?: Record<string, string | number>) => ({ __html: fragmentOf(key, params) }),
+    /** The fragment at `key` as an element. */
+    text: (key: string, params?: Record<string, string | number>): ReactNode => (
+      <LegalHtml html={fragmentOf(key, params)} />
+    ),
+    /** A list at `key`: fragments, or objects of fragments. */
+    items: <T extends Fragment = string>(key: string): T[] => {
+      const value = lookup(tree, key);
+      return Array.isArray(value) ? (value as T[]) : [];
+    },
+  };
+}
@@ -0,0 +1,34 @@
+/**
+ * useTranslation with keys checked at compile time.
+ *
+ * `t` only accepts keys of the English locale (lib/generated/i18n-keys.d.ts,
+ * written by `python -m i18n keytypes`) and requires the {{...}} values the
+ * key interpolates, so a misspelled key or a missing value is a type error
+ * instead of a key shown at runtime:
+ *
+ *   const { t } = useTypedTranslation();
+ *   t('common.save');
+ *   t('upload.filesCount', { count: files.length });
+ *
+ * i18next's own `t` is not typed globally: client/src still calls keys that
+ * English lacks, and builds others at runtime. A page moves to this hook once
+ * every key it uses exists in English.
+ */
+import { useCallback } from 'react';
+import { useTranslation } from 'react-i18next';
+import type { TOptions } from 'i18next';
+import type { TranslationKey, TranslationParams } from '@/lib/generated/i18n-keys';
+
+export type TypedT = <K extends TranslationKey>(
+  key: K,
+  ...params: K extends keyof TranslationParams ? [params: TranslationParams[K]] : []
+) => string;
+
+export function useTypedTranslation() {
+  const { t, i18n, ready } = useTranslation();
+  const typed = useCallback(
+    (key: string, params?: object) => t(key, params as TOptions) as string,
+    [t],
+  ) as TypedT;
+  return { t: typed, i18n, ready };
+}
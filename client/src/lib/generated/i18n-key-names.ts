@@ -0,0 +1,4634 @@
+// fingerprint: 367eca4bc67a62f376eff574eac5caf857aa8495
+// Generated by `python -m i18n keytypes` from locales/en. Do not edit.
+// Key names, not texts: referencing a key English lacks fails to compile.
+
+export const app__name = "app.name";
+export const app__tagline = "app.tagline";
+export const auditLogs__actions__create = "auditLogs.actions.create";
+export const auditLogs__actions__update = "auditLogs.actions.update";
+export const auditLogs__actions__delete = "auditLogs.actions.delete";
+export const auditLogs__entities__salesInvoice = "auditLogs.entities.salesInvoice";
+export const auditLogs__entities__salesQuote = "auditLogs.entities.salesQuote";
+export const auditLogs__entities__salesOrder = "auditLogs.entities.salesOrder";
+export const auditLogs__entities__salesCreditNote = "auditLogs.entities.salesCreditNote";
+export const auditLogs__entities__bill = "auditLogs.entities.bill";
+export const auditLogs__entities__purchaseOrder = "auditLogs.entities.purchaseOrder";
+export const auditLogs__entities__purchaseDebitNote = "auditLogs.entities.purchaseDebitNote";
+export const auditLogs__entities__expense = "auditLogs.entities.expense";
+export const auditLogs__entities__bankAccount = "auditLogs.entities.bankAccount";
+export const auditLogs__entities__payment = "auditLogs.entities.payment";
+export const auditLogs__entities__receipt = "auditLogs.entities.receipt";
+export const auditLogs__entities__paymentAllocation = "auditLogs.entities.paymentAllocation";
+export const auditLogs__entities__journal = "auditLogs.entities.journal";
+export const auditLogs__entities__account = "auditLogs.entities.account";
+export const auditLogs__entities__item = "auditLogs.entities.item";
+export const auditLogs__entities__warehouse = "auditLogs.entities.warehouse";
+export const auditLogs__entities__stockMovement = "auditLogs.entities.stockMovement";
+export const auditLogs__entities__stockTransfer = "auditLogs.entities.stockTransfer";
+export const auditLogs__entities__contact = "auditLogs.entities.contact";
+export const auditLogs__entities__fixedAsset = "auditLogs.entities.fixedAsset";
+export const auditLogs__entities__project = "auditLogs.entities.project";
+export const auditLogs__entities__budget = "auditLogs.entities.budget";
+export const auditLogs__entities__exchangeRate = "auditLogs.entities.exchangeRate";
+export const auditLogs__entities__user = "auditLogs.entities.user";
+export const auditLogs__entities__check = "auditLogs.entities.check";
+export const auditLogs__entities__costCenter = "auditLogs.entities.costCenter";
+export const header__globalAccounting = "header.globalAccounting";
+export const header__invoice = "header.invoice";
+export const header__payment = "header.payment";
+export const header__authOnly = "header.authOnly";
+export const header__authOnlyDescription = "header.authOnlyDescription";
+export const header__copyId = "header.copyId";
+export const header__retryBind = "header.retryBind";
+export const common__save = "common.save";
+export const common__cancel = "common.cancel";
+export const common__delete = "common.delete";
+export const common__edit = "common.edit";
+export const common__view = "common.view";
+export const common__add = "common.add";
+export const common__create = "common.create";
+export const common__update = "common.update";
+export const common__search = "common.search";
+export const common__filter = "common.filter";
+export const common__form = "common.form";
+export const common__export = "common.export";
+export const common__import = "common.import";
+export const common__download = "common.download";
+export const common__upload = "common.upload";
+export const common__print = "common.print";
+export const common__refresh = "common.refresh";
+export const common__retry = "common.retry";
+export const common__back = "common.back";
+export const common__next = "common.next";
+export const common__previous = "common.previous";
+export const common__close = "common.close";
+export const common__submit = "common.submit";
+export const common__reset = "common.reset";
+export const common__clear = "common.clear";
+export const common__apply = "common.apply";
+export const common__currency = "common.currency";
+export const common__dueDate = "common.dueDate";
+export const common__confirm = "common.confirm";
+export const common__active = "common.active";
+export const common__inactive = "common.inactive";
+export const common__pending = "common.pending";
+export const common__approved = "common.approved";
+export const common__accepted = "common.accepted";
+export const common__rejected = "common.rejected";
+export const common__paid = "common.paid";
+export const common__unpaid = "common.unpaid";
+export const common__overdue = "common.overdue";
+export const common__partiallyPaid = "common.partiallyPaid";
+export const common__draft = "common.draft";
+export const common__sent = "common.sent";
+export const common__completed = "common.completed";
+export const common__cancelled = "common.cancelled";
+export const common__yes = "common.yes";
+export const common__no = "common.no";
+export const common__all = "common.all";
+export const common__none = "common.none";
+export const common__total = "common.total";
+export const common__subtotal = "common.subtotal";
+export const common__tax = "common.tax";
+export const common__discount = "common.discount";
+export const common__amount = "common.amount";
+export const common__quantity = "common.quantity";
+export const common__unitPrice = "common.unitPrice";
+export const common__price = "common.price";
+export const common__date = "common.date";
+export const common__selectDate = "common.selectDate";
+export const common__description = "common.description";
+export const common__notes = "common.notes";
+export const common__reference = "common.reference";
+export const common__status = "common.status";
+export const common__actions = "common.actions";
+export const common__details = "common.details";
+export const common__lines = "common.lines";
+export const common__duplicate = "common.duplicate";
+export const common__summary = "common.summary";
+export const common__loading = "common.loading";
+export const common__processing = "common.processing";
+export const common__success = "common.success";
+export const common__error = "common.error";
+export const common__warning = "common.warning";
+export const common__info = "common.info";
+export const common__noData = "common.noData";
+export const common__unknown = "common.unknown";
+export const common__noDataYet = "common.noDataYet";
+export const common__noResults = "common.noResults";
+export const common__selectAll = "common.selectAll";
+export const common__deselectAll = "common.deselectAll";
+export const common__saveSuccess = "common.saveSuccess";
+export const common__saveError = "common.saveError";
+export const common__deleteSuccess = "common.deleteSuccess";
+export const common__deleteError = "common.deleteError";
+export const common__updateSuccess = "common.updateSuccess";
+export const common__updateError = "common.updateError";
+export const common__user = "common.user";
+export const common__users = "common.users";
+export const common__online = "common.online";
+export const common__offline = "common.offline";
+export const common__settings = "common.settings";
+export const common__signOut = "common.signOut";
+export const common__createSuccess = "common.createSuccess";
+export const common__createError = "common.createError";
+export const common__confirmDelete = "common.confirmDelete";
+export const common__confirmAction = "common.confirmAction";
+export const common__today = "common.today";
+export const common__yesterday = "common.yesterday";
+export const common__thisWeek = "common.thisWeek";
+export const common__thisMonth = "common.thisMonth";
+export const common__thisYear = "common.thisYear";
+export const common__lastWeek = "common.lastWeek";
+export const common__lastMonth = "common.lastMonth";
+export const common__lastYear = "common.lastYear";
+export const common__custom = "common.custom";
+export const common__errorLoadingData = "common.errorLoadingData";
+export const common__loadingData = "common.loadingData";
+export const common__refreshPage = "common.refreshPage";
+export const common__totalValue = "common.totalValue";
+export const common__creating = "common.creating";
+export const common__optional = "common.optional";
+export const common__termsAndConditions = "common.termsAndConditions";
+export const common__items = "common.items";
+export const common__issueDate = "common.issueDate";
+export const common__expiryDate = "common.expiryDate";
+export const common__viewDetails = "common.viewDetails";
+export const common__applied = "common.applied";
+export const common__partiallyApplied = "common.partiallyApplied";
+export const common__void = "common.void";
+export const common__monthly = "common.monthly";
+export const common__weekly = "common.weekly";
+export const common__yearly = "common.yearly";
+export const common__paused = "common.paused";
+export const common__expired = "common.expired";
+export const common__allTemplates = "common.allTemplates";
+export const common__currentlyRunning = "common.currentlyRunning";
+export const common__temporarilyStopped = "common.temporarilyStopped";
+export const common__monthlyRevenue = "common.monthlyRevenue";
+export const common__fromActiveTemplates = "common.fromActiveTemplates";
+export const common__downloadPDF = "common.downloadPDF";
+export const common__send = "common.send";
+export const common__applying = "common.applying";
+export const common__customer = "common.customer";
+export const common__sendNow = "common.sendNow";
+export const common__partial = "common.partial";
+export const common__refunded = "common.refunded";
+export const common__project = "common.project";
+export const common__exchangeRate = "common.exchangeRate";
+export const common__allocations = "common.allocations";
+export const common__noAllocations = "common.noAllocations";
+export const common__unmatchedSuccessfully = "common.unmatchedSuccessfully";
+export const common__unmatchFailed = "common.unmatchFailed";
+export const common__provider = "common.provider";
+export const common__label = "common.label";
+export const common__baseUrl = "common.baseUrl";
+export const common__apiKey = "common.apiKey";
+export const common__organization = "common.organization";
+export const common__selectProvider = "common.selectProvider";
+export const common__providers__openai = "common.providers.openai";
+export const common__providers__openrouter = "common.providers.openrouter";
+export const common__providers__google = "common.providers.google";
+export const common__providers__anthropic = "common.providers.anthropic";
+export const common__providers__azure = "common.providers.azure";
+export const common__providers__groq = "common.providers.groq";
+export const common__providers__mistral = "common.providers.mistral";
+export const common__providers__xai = "common.providers.xai";
+export const common__providers__together = "common.providers.together";
+export const common__providers__cohere = "common.providers.cohere";
+export const common__providers__deepseek = "common.providers.deepseek";
+export const common__providers__ollama = "common.providers.ollama";
+export const common__providers__lmstudio = "common.providers.lmstudio";
+export const common__providers__custom = "common.providers.custom";
+export const common__providers__local = "common.providers.local";
+export const common__saveChanges = "common.saveChanges";
+export const common__saving = "common.saving";
+export const common__settingsSaved = "common.settingsSaved";
+export const common__settingsUpdated = "common.settingsUpdated";
+export const common__errorLoading = "common.errorLoading";
+export const common__errorSaving = "common.errorSaving";
+export const common__notAuthorized = "common.notAuthorized";
+export const common__exportAllCsv = "common.exportAllCsv";
+export const common__exportXlsx = "common.exportXlsx";
+export const common__entityType = "common.entityType";
+export const common__any = "common.any";
+export const common__newestFirst = "common.newestFirst";
+export const common__oldestFirst = "common.oldestFirst";
+export const common__limit = "common.limit";
+export const common__actor = "common.actor";
+export const common__entityId = "common.entityId";
+export const common__results = "common.results";
+export const common__timestamp = "common.timestamp";
+export const common__new = "common.new";
+export const common__country = "common.country";
+export const common__selectCountry = "common.selectCountry";
+export const common__dashboard = "common.dashboard";
+export const common__accounts = "common.accounts";
+export const common__contacts = "common.contacts";
+export const common__sales = "common.sales";
+export const common__purchases = "common.purchases";
+export const common__banking = "common.banking";
+export const common__reports = "common.reports";
+export const common__reload = "common.reload";
+export const common__hide = "common.hide";
+export const common__advanced = "common.advanced";
+export const common__type = "common.type";
+export const common__unitCost = "common.unitCost";
+export const common__totalCost = "common.totalCost";
+export const common__current = "common.current";
+export const common__rtl = "common.rtl";
+export const common__menu = "common.menu";
+export const common__pageOf = "common.pageOf";
+export const common__pullToRefresh = "common.pullToRefresh";
+export const common__releaseToRefresh = "common.releaseToRefresh";
+export const common__refreshing = "common.refreshing";
+export const common__copy = "common.copy";
+export const common__share = "common.share";
+export const common__swipeForActions = "common.swipeForActions";
+export const common__linkCopied = "common.linkCopied";
+export const common__featureComingSoon = "common.featureComingSoon";
+export const common__month = "common.month";
+export const common__saved = "common.saved";
+export const common__copied = "common.copied";
+export const common__period = "common.period";
+export const common__qty = "common.qty";
+export const common__scanning = "common.scanning";
+export const common__recommendation = "common.recommendation";
+export const common__validationError = "common.validationError";
+export const common__expense = "common.expense";
+export const common__reject = "common.reject";
+export const common__approve = "common.approve";
+export const common__noHistoryFound = "common.noHistoryFound";
+export const common__cost = "common.cost";
+export const common__supplier = "common.supplier";
+export const common__contact = "common.contact";
+export const common__undo = "common.undo";
+export const common__undone = "common.undone";
+export const common__presets = "common.presets";
+export const common__deleteConfirm = "common.deleteConfirm";
+export const common__max = "common.max";
+export const common__from = "common.from";
+export const common__to = "common.to";
+export const common__selected = "common.selected";
+export const common__counterparty = "common.counterparty";
+export const common__ready = "common.ready";
+export const common__skipped = "common.skipped";
+export const common__done = "common.done";
+export const common__document = "common.document";
+export const common__copying = "common.copying";
+export const common__createdOn = "common.createdOn";
+export const common__na = "common.na";
+export const common__notFound = "common.notFound";
+export const common__addItem = "common.addItem";
+export const common__sku = "common.sku";
+export const common__number = "common.number";
+export const common__email = "common.email";
+export const common__password = "common.password";
+export const common__signIn = "common.signIn";
+export const common__company = "common.company";
+export const common__selectProject = "common.selectProject";
+export const common__selectAccount = "common.selectAccount";
+export const navigation__globalSearch = "navigation.globalSearch";
+export const navigation__dataImport = "navigation.dataImport";
+export const navigation__main = "navigation.main";
+export const navigation__setup = "navigation.setup";
+export const navigation__sales = "navigation.sales";
+export const navigation__purchases = "navigation.purchases";
+export const navigation__banking = "navigation.banking";
+export const navigation__reports = "navigation.reports";
+export const navigation__settings = "navigation.settings";
+export const navigation__dashboard = "navigation.dashboard";
+export const navigation__contacts = "navigation.contacts";
+export const navigation__items = "navigation.items";
+export const navigation__accounts = "navigation.accounts";
+export const navigation__companies = "navigation.companies";
+export const navigation__invoices = "navigation.invoices";
+export const navigation__addInvoice = "navigation.addInvoice";
+export const navigation__recurringInvoices = "navigation.recurringInvoices";
+export const navigation__quotations = "navigation.quotations";
+export const navigation__salesOrders = "navigation.salesOrders";
+export const navigation__creditNotes = "navigation.creditNotes";
+export const navigation__bills = "navigation.bills";
+export const navigation__purchaseOrders = "navigation.purchaseOrders";
+export const navigation__expenses = "navigation.expenses";
+export const navigation__debitNotes = "navigation.debitNotes";
+export const navigation__bankAccounts = "navigation.bankAccounts";
+export const navigation__reconciliation = "navigation.reconciliation";
+export const navigation__payments = "navigation.payments";
+export const navigation__receipts = "navigation.receipts";
+export const navigation__financialReports = "navigation.financialReports";
+export const navigation__balanceSheet = "navigation.balanceSheet";
+export const navigation__profitLoss = "navigation.profitLoss";
+export const navigation__cashFlow = "navigation.cashFlow";
+export const navigation__trialBalance = "navigation.trialBalance";
+export const navigation__accountLedger = "navigation.accountLedger";
+export const navigation__journalBook = "navigation.journalBook";
+export const navigation__agingReport = "navigation.agingReport";
+export const navigation__contactStatement = "navigation.contactStatement";
+export const navigation__salesPurchasesSummary = "navigation.salesPurchasesSummary";
+export const navigation__profitLossComparison = "navigation.profitLossComparison";
+export const navigation__financialRatios = "navigation.financialRatios";
+export const navigation__taxReports = "navigation.taxReports";
+export const navigation__taxOverview = "navigation.taxOverview";
+export const navigation__otherTaxes = "navigation.otherTaxes";
+export const navigation__vatReport = "navigation.vatReport";
+export const navigation__corporateTaxReport = "navigation.corporateTaxReport";
+export const navigation__withholdingTaxReport = "navigation.withholdingTaxReport";
+export const navigation__customTaxReport = "navigation.customTaxReport";
+export const navigation__inventoryReports = "navigation.inventoryReports";
+export const navigation__warehouses = "navigation.warehouses";
+export const navigation__stockAdjustments = "navigation.stockAdjustments";
+export const navigation__inventoryValuation = "navigation.inventoryValuation";
+export const navigation__generalSettings = "navigation.generalSettings";
+export const navigation__taxSettings = "navigation.taxSettings";
+export const navigation__languageSettings = "navigation.languageSettings";
+export const navigation__users = "navigation.users";
+export const navigation__auditLogs = "navigation.auditLogs";
+export const navigation__backup = "navigation.backup";
+export const navigation__userGuide = "navigation.userGuide";
+export const navigation__projectsList = "navigation.projectsList";
+export const navigation__projectsProfitability = "navigation.projectsProfitability";
+export const navigation__advancedFeatures = "navigation.advancedFeatures";
+export const navigation__quickEntry = "navigation.quickEntry";
+export const navigation__batchOperations = "navigation.batchOperations";
+export const navigation__inventory = "navigation.inventory";
+export const navigation__stockTransfers = "navigation.stockTransfers";
+export const navigation__valuation = "navigation.valuation";
+export const navigation__landedCost = "navigation.landedCost";
+export const navigation__checks = "navigation.checks";
+export const navigation__accounting = "navigation.accounting";
+export const navigation__manualJournals = "navigation.manualJournals";
+export const navigation__costCenters = "navigation.costCenters";
+export const navigation__fixedAssets = "navigation.fixedAssets";
+export const navigation__planning = "navigation.planning";
+export const navigation__budgets = "navigation.budgets";
+export const navigation__budgetPlanning = "navigation.budgetPlanning";
+export const navigation__budgetVsActual = "navigation.budgetVsActual";
+export const navigation__projects = "navigation.projects";
+export const navigation__manufacturing = "navigation.manufacturing";
+export const navigation__boms = "navigation.boms";
+export const navigation__productionOrders = "navigation.productionOrders";
+export const navigation__hr = "navigation.hr";
+export const navigation__employees = "navigation.employees";
+export const navigation__departments = "navigation.departments";
+export const navigation__payroll = "navigation.payroll";
+export const navigation__financialStatements = "navigation.financialStatements";
+export const navigation__accountingReports = "navigation.accountingReports";
+export const navigation__receivablesPayables = "navigation.receivablesPayables";
+export const navigation__financialAnalysis = "navigation.financialAnalysis";
+export const navigation__esgReport = "navigation.esgReport";
+export const navigation__aiReports = "navigation.aiReports";
+export const navigation__aiAnalytics = "navigation.aiAnalytics";
+export const navigation__cashFlowForecast = "navigation.cashFlowForecast";
+export const navigation__portals = "navigation.portals";
+export const navigation__portalDashboard = "navigation.portalDashboard";
+export const navigation__portalDocuments = "navigation.portalDocuments";
+export const navigation__tools = "navigation.tools";
+export const navigation__currencies = "navigation.currencies";
+export const navigation__aiSettings = "navigation.aiSettings";
+export const navigation__legalSettings = "navigation.legalSettings";
+export const navigation__admin = "navigation.admin";
+export const advanced__title = "advanced.title";
+export const advanced__subtitle = "advanced.subtitle";
+export const advanced__quickStats = "advanced.quickStats";
+export const advanced__featuresCount = "advanced.featuresCount";
+export const diagnostics__title = "diagnostics.title";
+export const diagnostics__ssoStatus = "diagnostics.ssoStatus";
+export const diagnostics__mode = "diagnostics.mode";
+export const diagnostics__bound = "diagnostics.bound";
+export const diagnostics__authOnly = "diagnostics.authOnly";
+export const diagnostics__lastRequestId = "diagnostics.lastRequestId";
+export const diagnostics__retryBind = "diagnostics.retryBind";
+export const diagnostics__onlineStatus = "diagnostics.onlineStatus";
+export const diagnostics__sessionAge = "diagnostics.sessionAge";
+export const diagnostics__lastSsoAttempt = "diagnostics.lastSsoAttempt";
+export const diagnostics__reactProbe = "diagnostics.reactProbe";
+export const diagnostics__singleReactInstance = "diagnostics.singleReactInstance";
+export const diagnostics__multipleReactInstances = "diagnostics.multipleReactInstances";
+export const diagnostics__latency = "diagnostics.latency";
+export const diagnostics__copyId = "diagnostics.copyId";
+export const diagnostics__ssoTimeline = "diagnostics.ssoTimeline";
+export const countries__uae = "countries.uae";
+export const countries__saudiArabia = "countries.saudiArabia";
+export const countries__qatar = "countries.qatar";
+export const countries__kuwait = "countries.kuwait";
+export const countries__bahrain = "countries.bahrain";
+export const countries__oman = "countries.oman";
+export const countries__jordan = "countries.jordan";
+export const countries__lebanon = "countries.lebanon";
+export const countries__egypt = "countries.egypt";
+export const countries__iraq = "countries.iraq";
+export const countries__syria = "countries.syria";
+export const countries__palestine = "countries.palestine";
+export const countries__yemen = "countries.yemen";
+export const countries__morocco = "countries.morocco";
+export const countries__algeria = "countries.algeria";
+export const countries__tunisia = "countries.tunisia";
+export const countries__libya = "countries.libya";
+export const countries__sudan = "countries.sudan";
+export const countries__unitedStates = "countries.unitedStates";
+export const countries__canada = "countries.canada";
+export const countries__mexico = "countries.mexico";
+export const countries__brazil = "countries.brazil";
+export const countries__argentina = "countries.argentina";
+export const countries__unitedKingdom = "countries.unitedKingdom";
+export const countries__germany = "countries.germany";
+export const countries__france = "countries.france";
+export const countries__italy = "countries.italy";
+export const countries__spain = "countries.spain";
+export const countries__netherlands = "countries.netherlands";
+export const countries__belgium = "countries.belgium";
+export const countries__switzerland = "countries.switzerland";
+export const countries__austria = "countries.austria";
+export const countries__sweden = "countries.sweden";
+export const countries__norway = "countries.norway";
+export const countries__denmark = "countries.denmark";
+export const countries__poland = "countries.poland";
+export const countries__turkey = "countries.turkey";
+export const countries__russia = "countries.russia";
+export const countries__india = "countries.india";
+export const countries__pakistan = "countries.pakistan";
+export const countries__bangladesh = "countries.bangladesh";
+export const countries__china = "countries.china";
+export const countries__japan = "countries.japan";
+export const countries__southKorea = "countries.southKorea";
+export const countries__indonesia = "countries.indonesia";
+export const countries__malaysia = "countries.malaysia";
+export const countries__singapore = "countries.singapore";
+export const countries__thailand = "countries.thailand";
+export const countries__philippines = "countries.philippines";
+export const countries__vietnam = "countries.vietnam";
+export const countries__australia = "countries.australia";
+export const countries__newZealand = "countries.newZealand";
+export const countries__southAfrica = "countries.southAfrica";
+export const countries__nigeria = "countries.nigeria";
+export const countries__kenya = "countries.kenya";
+export const categories__electronics = "categories.electronics";
+export const categories__accessories = "categories.accessories";
+export const categories__services = "categories.services";
+export const categories__officeSupplies = "categories.officeSupplies";
+export const categories__foodAndBeverages = "categories.foodAndBeverages";
+export const categories__travel = "categories.travel";
+export const categories__utilities = "categories.utilities";
+export const categories__rent = "categories.rent";
+export const categories__salaries = "categories.salaries";
+export const categories__marketing = "categories.marketing";
+export const categories__insurance = "categories.insurance";
+export const categories__maintenance = "categories.maintenance";
+export const categories__professional = "categories.professional";
+export const categories__company = "categories.company";
+export const categories__employee = "categories.employee";
+export const import__title = "import.title";
+export const import__description = "import.description";
+export const import__importContacts = "import.importContacts";
+export const import__importItems = "import.importItems";
+export const import__importAccounts = "import.importAccounts";
+export const import__importContactsDesc = "import.importContactsDesc";
+export const import__importItemsDesc = "import.importItemsDesc";
+export const import__importAccountsDesc = "import.importAccountsDesc";
+export const import__dragOrClick = "import.dragOrClick";
+export const import__supportedFormats = "import.supportedFormats";
+export const import__downloadTemplate = "import.downloadTemplate";
+export const import__templateTip = "import.templateTip";
+export const import__templateDownloaded = "import.templateDownloaded";
+export const import__templateDownloadedDesc = "import.templateDownloadedDesc";
+export const import__fileLoaded = "import.fileLoaded";
+export const import__rowsFound = "import.rowsFound";
+export const import__emptyFile = "import.emptyFile";
+export const import__invalidFile = "import.invalidFile";
+export const import__error = "import.error";
+export const import__mapColumns = "import.mapColumns";
+export const import__mapColumnsDesc = "import.mapColumnsDesc";
+export const import__systemField = "import.systemField";
+export const import__excelColumn = "import.excelColumn";
+export const import__required = "import.required";
+export const import__selectColumn = "import.selectColumn";
+export const import__notMapped = "import.notMapped";
+export const import__validateAndPreview = "import.validateAndPreview";
+export const import__valid = "import.valid";
+export const import__warnings = "import.warnings";
+export const import__errors = "import.errors";
+export const import__togglePreview = "import.togglePreview";
+export const import__status = "import.status";
+export const import__issues = "import.issues";
+export const import__showingFirst = "import.showingFirst";
+export const import__startImport = "import.startImport";
+export const import__noValidRows = "import.noValidRows";
+export const import__importing = "import.importing";
+export const import__complete = "import.complete";
+export const import__completeSummary = "import.completeSummary";
+export const import__imported = "import.imported";
+export const import__failed = "import.failed";
+export const import__errorDetails = "import.errorDetails";
+export const import__andMore = "import.andMore";
+export const import__importMore = "import.importMore";
+export const import__invalidNumber = "import.invalidNumber";
+export const import__requiredField = "import.requiredField";
+export const import__requiredFieldEmpty = "import.requiredFieldEmpty";
+export const fields__name = "fields.name";
+export const fields__email = "fields.email";
+export const fields__phone = "fields.phone";
+export const fields__type = "fields.type";
+export const fields__address = "fields.address";
+export const fields__city = "fields.city";
+export const fields__country = "fields.country";
+export const fields__taxNumber = "fields.taxNumber";
+export const fields__sku = "fields.sku";
+export const fields__description = "fields.description";
+export const fields__unit = "fields.unit";
+export const fields__salePrice = "fields.salePrice";
+export const fields__purchasePrice = "fields.purchasePrice";
+export const fields__quantity = "fields.quantity";
+export const fields__accountCode = "fields.accountCode";
+export const fields__accountName = "fields.accountName";
+export const fields__accountType = "fields.accountType";
+export const fields__accountSubtype = "fields.accountSubtype";
+export const fields__parentCode = "fields.parentCode";
+export const fields__openingBalance = "fields.openingBalance";
+export const globalSearch__title = "globalSearch.title";
+export const globalSearch__placeholder = "globalSearch.placeholder";
+export const globalSearch__recentSearches = "globalSearch.recentSearches";
+export const globalSearch__noResults = "globalSearch.noResults";
+export const globalSearch__noResultsDesc = "globalSearch.noResultsDesc";
+export const globalSearch__navigate = "globalSearch.navigate";
+export const globalSearch__select = "globalSearch.select";
+export const globalSearch__close = "globalSearch.close";
+export const globalSearch__pages__dashboard = "globalSearch.pages.dashboard";
+export const globalSearch__pages__dashboardDesc = "globalSearch.pages.dashboardDesc";
+export const globalSearch__pages__invoices = "globalSearch.pages.invoices";
+export const globalSearch__pages__invoicesDesc = "globalSearch.pages.invoicesDesc";
+export const globalSearch__pages__contacts = "globalSearch.pages.contacts";
+export const globalSearch__pages__contactsDesc = "globalSearch.pages.contactsDesc";
+export const globalSearch__pages__inventory = "globalSearch.pages.inventory";
+export const globalSearch__pages__inventoryDesc = "globalSearch.pages.inventoryDesc";
+export const globalSearch__pages__expenses = "globalSearch.pages.expenses";
+export const globalSearch__pages__expensesDesc = "globalSearch.pages.expensesDesc";
+export const globalSearch__pages__accounts = "globalSearch.pages.accounts";
+export const globalSearch__pages__accountsDesc = "globalSearch.pages.accountsDesc";
+export const globalSearch__pages__journal = "globalSearch.pages.journal";
+export const globalSearch__pages__journalDesc = "globalSearch.pages.journalDesc";
+export const globalSearch__pages__banking = "globalSearch.pages.banking";
+export const globalSearch__pages__bankingDesc = "globalSearch.pages.bankingDesc";
+export const globalSearch__pages__reports = "globalSearch.pages.reports";
+export const globalSearch__pages__reportsDesc = "globalSearch.pages.reportsDesc";
+export const globalSearch__pages__tax = "globalSearch.pages.tax";
+export const globalSearch__pages__taxDesc = "globalSearch.pages.taxDesc";
+export const globalSearch__pages__fixedAssets = "globalSearch.pages.fixedAssets";
+export const globalSearch__pages__fixedAssetsDesc = "globalSearch.pages.fixedAssetsDesc";
+export const globalSearch__pages__projects = "globalSearch.pages.projects";
+export const globalSearch__pages__projectsDesc = "globalSearch.pages.projectsDesc";
+export const globalSearch__pages__settings = "globalSearch.pages.settings";
+export const globalSearch__pages__settingsDesc = "globalSearch.pages.settingsDesc";
+export const globalSearch__pages__quickEntry = "globalSearch.pages.quickEntry";
+export const globalSearch__pages__quickEntryDesc = "globalSearch.pages.quickEntryDesc";
+export const globalSearch__reports__profitLoss = "globalSearch.reports.profitLoss";
+export const globalSearch__reports__profitLossDesc = "globalSearch.reports.profitLossDesc";
+export const globalSearch__reports__balanceSheet = "globalSearch.reports.balanceSheet";
+export const globalSearch__reports__balanceSheetDesc = "globalSearch.reports.balanceSheetDesc";
+export const globalSearch__reports__cashFlow = "globalSearch.reports.cashFlow";
+export const globalSearch__reports__cashFlowDesc = "globalSearch.reports.cashFlowDesc";
+export const globalSearch__reports__trialBalance = "globalSearch.reports.trialBalance";
+export const globalSearch__reports__trialBalanceDesc = "globalSearch.reports.trialBalanceDesc";
+export const globalSearch__reports__aging = "globalSearch.reports.aging";
+export const globalSearch__reports__agingDesc = "globalSearch.reports.agingDesc";
+export const quickEntry__title = "quickEntry.title";
+export const quickEntry__description = "quickEntry.description";
+export const quickEntry__fillDetails = "quickEntry.fillDetails";
+export const quickEntry__newInvoice = "quickEntry.newInvoice";
+export const quickEntry__invoiceDesc = "quickEntry.invoiceDesc";
+export const quickEntry__newExpense = "quickEntry.newExpense";
+export const quickEntry__expenseDesc = "quickEntry.expenseDesc";
+export const quickEntry__recordPayment = "quickEntry.recordPayment";
+export const quickEntry__paymentDesc = "quickEntry.paymentDesc";
+export const quickEntry__recordReceipt = "quickEntry.recordReceipt";
+export const quickEntry__receiptDesc = "quickEntry.receiptDesc";
+export const quickEntry__addItem = "quickEntry.addItem";
+export const quickEntry__itemDesc = "quickEntry.itemDesc";
+export const quickEntry__recentEntries = "quickEntry.recentEntries";
+export const quickEntry__recentEntriesDesc = "quickEntry.recentEntriesDesc";
+export const quickEntry__noRecentEntries = "quickEntry.noRecentEntries";
+export const quickEntry__entryCreated = "quickEntry.entryCreated";
+export const quickEntry__createError = "quickEntry.createError";
+export const quickEntry__descriptionPlaceholder = "quickEntry.descriptionPlaceholder";
+export const quickEntry__expenseDescPlaceholder = "quickEntry.expenseDescPlaceholder";
+export const quickEntry__referencePlaceholder = "quickEntry.referencePlaceholder";
+export const quickEntry__itemNamePlaceholder = "quickEntry.itemNamePlaceholder";
+export const quickEntry__skuPlaceholder = "quickEntry.skuPlaceholder";
+export const quickEntry__notesPlaceholder = "quickEntry.notesPlaceholder";
+export const batch__title = "batch.title";
+export const batch__description = "batch.description";
+export const batch__recordType = "batch.recordType";
+export const batch__invoices = "batch.invoices";
+export const batch__bills = "batch.bills";
+export const batch__contacts = "batch.contacts";
+export const batch__items = "batch.items";
+export const batch__searchPlaceholder = "batch.searchPlaceholder";
+export const batch__records = "batch.records";
+export const batch__exportSelected = "batch.exportSelected";
+export const batch__emailSelected = "batch.emailSelected";
+export const batch__printSelected = "batch.printSelected";
+export const batch__archiveSelected = "batch.archiveSelected";
+export const batch__deleteSelected = "batch.deleteSelected";
+export const batch__noSelection = "batch.noSelection";
+export const batch__selectRecordsFirst = "batch.selectRecordsFirst";
+export const batch__confirmAction = "batch.confirmAction";
+export const batch__confirmActionDesc = "batch.confirmActionDesc";
+export const batch__processing = "batch.processing";
+export const batch__progressStatus = "batch.progressStatus";
+export const batch__operationComplete = "batch.operationComplete";
+export const batch__operationSummary = "batch.operationSummary";
+export const batch__successCount = "batch.successCount";
+export const batch__failedCount = "batch.failedCount";
+export const notifications__title = "notifications.title";
+export const notifications__empty = "notifications.empty";
+export const notifications__justNow = "notifications.justNow";
+export const notifications__minutesAgo = "notifications.minutesAgo";
+export const notifications__hoursAgo = "notifications.hoursAgo";
+export const notifications__daysAgo = "notifications.daysAgo";
+export const notifications__markAllRead = "notifications.markAllRead";
+export const notifications__clearAll = "notifications.clearAll";
+export const notifications__muteSound = "notifications.muteSound";
+export const notifications__enableSound = "notifications.enableSound";
+export const dashboard__title = "dashboard.title";
+export const dashboard__lastUpdate = "dashboard.lastUpdate";
+export const dashboard__refreshed = "dashboard.refreshed";
+export const dashboard__widgetRemoved = "dashboard.widgetRemoved";
+export const dashboard__widgetAdded = "dashboard.widgetAdded";
+export const dashboard__layoutSaved = "dashboard.layoutSaved";
+export const dashboard__layoutReset = "dashboard.layoutReset";
+export const dashboard__addWidget = "dashboard.addWidget";
+export const dashboard__selectWidgetType = "dashboard.selectWidgetType";
+export const dashboard__configureWidget = "dashboard.configureWidget";
+export const dashboard__widgetTitle = "dashboard.widgetTitle";
+export const dashboard__widgetSize = "dashboard.widgetSize";
+export const dashboard__widgetPlaceholder = "dashboard.widgetPlaceholder";
+export const dashboard__refresh = "dashboard.refresh";
+export const dashboard__hide = "dashboard.hide";
+export const dashboard__customize = "dashboard.customize";
+export const dashboard__reset = "dashboard.reset";
+export const dashboard__save = "dashboard.save";
+export const dashboard__editMode = "dashboard.editMode";
+export const dashboard__metrics__revenue = "dashboard.metrics.revenue";
+export const dashboard__metrics__expenses = "dashboard.metrics.expenses";
+export const dashboard__metrics__profit = "dashboard.metrics.profit";
+export const dashboard__metrics__invoices = "dashboard.metrics.invoices";
+export const dashboard__metrics__customers = "dashboard.metrics.customers";
+export const dashboard__metrics__items = "dashboard.metrics.items";
+export const dashboard__metrics__receivables = "dashboard.metrics.receivables";
+export const dashboard__metrics__payables = "dashboard.metrics.payables";
+export const dashboard__widgets__kpi = "dashboard.widgets.kpi";
+export const dashboard__widgets__chart = "dashboard.widgets.chart";
+export const dashboard__widgets__list = "dashboard.widgets.list";
+export const dashboard__widgets__calendar = "dashboard.widgets.calendar";
+export const dashboard__widgets__tasks = "dashboard.widgets.tasks";
+export const dashboard__widgets__alerts = "dashboard.widgets.alerts";
+export const dashboard__widgets__quickActions = "dashboard.widgets.quickActions";
+export const dashboard__widgets__recentActivity = "dashboard.widgets.recentActivity";
+export const dashboard__widgets__goals = "dashboard.widgets.goals";
+export const dashboard__widgets__weather = "dashboard.widgets.weather";
+export const dashboard__widgets__notes = "dashboard.widgets.notes";
+export const dashboard__sizes__small = "dashboard.sizes.small";
+export const dashboard__sizes__medium = "dashboard.sizes.medium";
+export const dashboard__sizes__large = "dashboard.sizes.large";
+export const dashboard__sizes__full = "dashboard.sizes.full";
+export const dashboard__alerts__overdueInvoices = "dashboard.alerts.overdueInvoices";
+export const dashboard__alerts__lowStock = "dashboard.alerts.lowStock";
+export const dashboard__alerts__paymentReceived = "dashboard.alerts.paymentReceived";
+export const dashboard__tasks__reviewInvoices = "dashboard.tasks.reviewInvoices";
+export const dashboard__tasks__sendQuotes = "dashboard.tasks.sendQuotes";
+export const dashboard__tasks__reconcileAccounts = "dashboard.tasks.reconcileAccounts";
+export const dashboard__goals__monthlyRevenue = "dashboard.goals.monthlyRevenue";
+export const dashboard__goals__newCustomers = "dashboard.goals.newCustomers";
+export const dashboard__goals__invoiceCollection = "dashboard.goals.invoiceCollection";
+export const dashboard__actions__newInvoice = "dashboard.actions.newInvoice";
+export const dashboard__actions__newContact = "dashboard.actions.newContact";
+export const dashboard__actions__newExpense = "dashboard.actions.newExpense";
+export const dashboard__actions__newItem = "dashboard.actions.newItem";
+export const dashboard__metric = "dashboard.metric";
+export const dashboard__value = "dashboard.value";
+export const dashboard__revenueVsExpenses = "dashboard.revenueVsExpenses";
+export const dashboard__revenue = "dashboard.revenue";
+export const dashboard__expenses = "dashboard.expenses";
+export const dashboard__recentTransactions = "dashboard.recentTransactions";
+export const banking__checkingAccount = "banking.checkingAccount";
+export const banking__savingsAccount = "banking.savingsAccount";
+export const banking__creditCard = "banking.creditCard";
+export const banking__cash = "banking.cash";
+export const banking__investment = "banking.investment";
+export const banking__paymentCreated = "banking.paymentCreated";
+export const banking__failedToCreatePayment = "banking.failedToCreatePayment";
+export const banking__allocations = "banking.allocations";
+export const banking__noAllocations = "banking.noAllocations";
+export const banking__unmatchedSuccessfully = "banking.unmatchedSuccessfully";
+export const banking__unmatchFailed = "banking.unmatchFailed";
+export const banking__unmatch = "banking.unmatch";
+export const banking__accounts__title = "banking.accounts.title";
+export const banking__accounts__description = "banking.accounts.description";
+export const banking__accounts__addAccount = "banking.accounts.addAccount";
+export const banking__accounts__editAccount = "banking.accounts.editAccount";
+export const banking__accounts__createAccount = "banking.accounts.createAccount";
+export const banking__accounts__updateAccount = "banking.accounts.updateAccount";
+export const banking__accounts__accountCreated = "banking.accounts.accountCreated";
+export const banking__accounts__accountCreatedDesc = "banking.accounts.accountCreatedDesc";
+export const banking__accounts__accountUpdated = "banking.accounts.accountUpdated";
+export const banking__accounts__accountUpdatedDesc = "banking.accounts.accountUpdatedDesc";
+export const banking__accounts__saveError = "banking.accounts.saveError";
+export const banking__accounts__accountDeleted = "banking.accounts.accountDeleted";
+export const banking__accounts__accountDeletedDesc = "banking.accounts.accountDeletedDesc";
+export const banking__accounts__deleteError = "banking.accounts.deleteError";
+export const banking__accounts__confirmDelete = "banking.accounts.confirmDelete";
+export const banking__accounts__loading = "banking.accounts.loading";
+export const banking__accounts__errorLoading = "banking.accounts.errorLoading";
+export const banking__accounts__failedToLoad = "banking.accounts.failedToLoad";
+export const banking__accounts__bank = "banking.accounts.bank";
+export const banking__accounts__accountName = "banking.accounts.accountName";
+export const banking__accounts__accountNamePlaceholder = "banking.accounts.accountNamePlaceholder";
+export const banking__accounts__accountNumber = "banking.accounts.accountNumber";
+export const banking__accounts__accountNumberPlaceholder = "banking.accounts.accountNumberPlaceholder";
+export const banking__accounts__bankName = "banking.accounts.bankName";
+export const banking__accounts__bankNamePlaceholder = "banking.accounts.bankNamePlaceholder";
+export const banking__accounts__branch = "banking.accounts.branch";
+export const banking__accounts__branchPlaceholder = "banking.accounts.branchPlaceholder";
+export const banking__accounts__iban = "banking.accounts.iban";
+export const banking__accounts__ibanPlaceholder = "banking.accounts.ibanPlaceholder";
+export const banking__accounts__swiftCode = "banking.accounts.swiftCode";
+export const banking__accounts__swiftPlaceholder = "banking.accounts.swiftPlaceholder";
+export const banking__accounts__balance = "banking.accounts.balance";
+export const banking__accounts__currentBalance = "banking.accounts.currentBalance";
+export const banking__accounts__openingBalance = "banking.accounts.openingBalance";
+export const banking__accounts__openingBalancePlaceholder = "banking.accounts.openingBalancePlaceholder";
+export const banking__accounts__currentBalancePlaceholder = "banking.accounts.currentBalancePlaceholder";
+export const banking__accounts__accountType = "banking.accounts.accountType";
+export const banking__accounts__activeAccount = "banking.accounts.activeAccount";
+export const banking__accounts__activeAccountDesc = "banking.accounts.activeAccountDesc";
+export const banking__accounts__defaultAccount = "banking.accounts.defaultAccount";
+export const banking__accounts__defaultAccountDesc = "banking.accounts.defaultAccountDesc";
+export const banking__accounts__defaultBadge = "banking.accounts.defaultBadge";
+export const banking__accounts__lastTransaction = "banking.accounts.lastTransaction";
+export const banking__accounts__recentTransactions = "banking.accounts.recentTransactions";
+export const banking__accounts__failedToLoadTransactions = "banking.accounts.failedToLoadTransactions";
+export const banking__accounts__noRecentTransactions = "banking.accounts.noRecentTransactions";
+export const banking__accounts__totalBalance = "banking.accounts.totalBalance";
+export const banking__accounts__acrossAllAccounts = "banking.accounts.acrossAllAccounts";
+export const banking__accounts__totalAssets = "banking.accounts.totalAssets";
+export const banking__accounts__cashBankBalances = "banking.accounts.cashBankBalances";
+export const banking__accounts__totalLiabilities = "banking.accounts.totalLiabilities";
+export const banking__accounts__creditCardsOverdrafts = "banking.accounts.creditCardsOverdrafts";
+export const banking__accounts__activeAccounts = "banking.accounts.activeAccounts";
+export const banking__accounts__ofTotal = "banking.accounts.ofTotal";
+export const banking__accounts__totalAccounts = "banking.accounts.totalAccounts";
+export const banking__accounts__glAccount = "banking.accounts.glAccount";
+export const banking__accounts__selectGLAccount = "banking.accounts.selectGLAccount";
+export const banking__payments__title = "banking.payments.title";
+export const banking__payments__description = "banking.payments.description";
+export const banking__payments__descriptionShort = "banking.payments.descriptionShort";
+export const banking__payments__addPayment = "banking.payments.addPayment";
+export const banking__payments__editPayment = "banking.payments.editPayment";
+export const banking__payments__createPayment = "banking.payments.createPayment";
+export const banking__payments__paymentNumber = "banking.payments.paymentNumber";
+export const banking__payments__paymentDate = "banking.payments.paymentDate";
+export const banking__payments__paymentMethod = "banking.payments.paymentMethod";
+export const banking__payments__paymentReference = "banking.payments.paymentReference";
+export const banking__payments__referencePlaceholder = "banking.payments.referencePlaceholder";
+export const banking__payments__descriptionPlaceholder = "banking.payments.descriptionPlaceholder";
+export const banking__payments__payTo = "banking.payments.payTo";
+export const banking__payments__totalPayments = "banking.payments.totalPayments";
+export const banking__payments__totalAmount = "banking.payments.totalAmount";
+export const banking__payments__allPayments = "banking.payments.allPayments";
+export const banking__payments__completed = "banking.payments.completed";
+export const banking__payments__pending = "banking.payments.pending";
+export const banking__payments__failed = "banking.payments.failed";
+export const banking__payments__inProcess = "banking.payments.inProcess";
+export const banking__payments__needAttention = "banking.payments.needAttention";
+export const banking__payments__paymentCreated = "banking.payments.paymentCreated";
+export const banking__payments__paymentCreatedDesc = "banking.payments.paymentCreatedDesc";
+export const banking__payments__paymentCreateError = "banking.payments.paymentCreateError";
+export const banking__payments__paymentDeleted = "banking.payments.paymentDeleted";
+export const banking__payments__paymentDeletedDesc = "banking.payments.paymentDeletedDesc";
+export const banking__payments__paymentDeleteError = "banking.payments.paymentDeleteError";
+export const banking__payments__retryPayment = "banking.payments.retryPayment";
+export const banking__payments__sendRemittance = "banking.payments.sendRemittance";
+export const banking__payments__downloadReceipt = "banking.payments.downloadReceipt";
+export const banking__payments__cancelPayment = "banking.payments.cancelPayment";
+export const banking__payments__paymentRetried = "banking.payments.paymentRetried";
+export const banking__payments__paymentRetriedDesc = "banking.payments.paymentRetriedDesc";
+export const banking__payments__paymentCancelled = "banking.payments.paymentCancelled";
+export const banking__payments__paymentCancelledDesc = "banking.payments.paymentCancelledDesc";
+export const banking__payments__remittanceSent = "banking.payments.remittanceSent";
+export const banking__payments__remittanceSentDesc = "banking.payments.remittanceSentDesc";
+export const banking__payments__confirmDelete = "banking.payments.confirmDelete";
+export const banking__payments__confirmCancel = "banking.payments.confirmCancel";
+export const banking__payments__failedToLoad = "banking.payments.failedToLoad";
+export const banking__payments__paidFromAccount = "banking.payments.paidFromAccount";
+export const banking__payments__selectPaidFromAccount = "banking.payments.selectPaidFromAccount";
+export const banking__makePayment = "banking.makePayment";
+export const banking__paymentInitiated = "banking.paymentInitiated";
+export const banking__paymentInitiatedDesc = "banking.paymentInitiatedDesc";
+export const banking__receipts__title = "banking.receipts.title";
+export const banking__receipts__description = "banking.receipts.description";
+export const banking__receipts__descriptionShort = "banking.receipts.descriptionShort";
+export const banking__receipts__addReceipt = "banking.receipts.addReceipt";
+export const banking__receipts__editReceipt = "banking.receipts.editReceipt";
+export const banking__receipts__createReceipt = "banking.receipts.createReceipt";
+export const banking__receipts__receiptDate = "banking.receipts.receiptDate";
+export const banking__receipts__receiptNumber = "banking.receipts.receiptNumber";
+export const banking__receipts__receivedFrom = "banking.receipts.receivedFrom";
+export const banking__receipts__totalReceipts = "banking.receipts.totalReceipts";
+export const banking__receipts__totalAmount = "banking.receipts.totalAmount";
+export const banking__receipts__allReceipts = "banking.receipts.allReceipts";
+export const banking__receipts__collected = "banking.receipts.collected";
+export const banking__receipts__collectedDesc = "banking.receipts.collectedDesc";
+export const banking__receipts__pending = "banking.receipts.pending";
+export const banking__receipts__beingProcessed = "banking.receipts.beingProcessed";
+export const banking__receipts__today = "banking.receipts.today";
+export const banking__receipts__receivedToday = "banking.receipts.receivedToday";
+export const banking__receipts__descriptionPlaceholder = "banking.receipts.descriptionPlaceholder";
+export const banking__receipts__receiptCreated = "banking.receipts.receiptCreated";
+export const banking__receipts__receiptCreatedDesc = "banking.receipts.receiptCreatedDesc";
+export const banking__receipts__createError = "banking.receipts.createError";
+export const banking__receipts__receiptDeleted = "banking.receipts.receiptDeleted";
+export const banking__receipts__receiptDeletedDesc = "banking.receipts.receiptDeletedDesc";
+export const banking__receipts__receiptDeleteError = "banking.receipts.receiptDeleteError";
+export const banking__receipts__confirmDelete = "banking.receipts.confirmDelete";
+export const banking__receipts__applyToInvoice = "banking.receipts.applyToInvoice";
+export const banking__receipts__sendReceipt = "banking.receipts.sendReceipt";
+export const banking__receipts__receiptApplied = "banking.receipts.receiptApplied";
+export const banking__receipts__receiptAppliedDesc = "banking.receipts.receiptAppliedDesc";
+export const banking__receipts__receiptSent = "banking.receipts.receiptSent";
+export const banking__receipts__receiptSentDesc = "banking.receipts.receiptSentDesc";
+export const banking__receipts__refund = "banking.receipts.refund";
+export const banking__receipts__confirmRefund = "banking.receipts.confirmRefund";
+export const banking__receipts__refundInitiated = "banking.receipts.refundInitiated";
+export const banking__receipts__refundInitiatedDesc = "banking.receipts.refundInitiatedDesc";
+export const banking__receipts__depositToAccount = "banking.receipts.depositToAccount";
+export const banking__receipts__selectDepositAccount = "banking.receipts.selectDepositAccount";
+export const banking__reconciliation__title = "banking.reconciliation.title";
+export const banking__reconciliation__description = "banking.reconciliation.description";
+export const banking__reconciliation__descriptionShort = "banking.reconciliation.descriptionShort";
+export const banking__reconciliation__autoMatch = "banking.reconciliation.autoMatch";
+export const banking__reconciliation__completeReconciliation = "banking.reconciliation.completeReconciliation";
+export const banking__reconciliation__bookBalance = "banking.reconciliation.bookBalance";
+export const banking__reconciliation__asPerYourRecords = "banking.reconciliation.asPerYourRecords";
+export const banking__reconciliation__bankBalance = "banking.reconciliation.bankBalance";
+export const banking__reconciliation__fromBankStatement = "banking.reconciliation.fromBankStatement";
+export const banking__reconciliation__difference = "banking.reconciliation.difference";
+export const banking__reconciliation__reconciled = "banking.reconciliation.reconciled";
+export const banking__reconciliation__toReconcile = "banking.reconciliation.toReconcile";
+export const banking__reconciliation__balanced = "banking.reconciliation.balanced";
+export const banking__reconciliation__unbalanced = "banking.reconciliation.unbalanced";
+export const banking__reconciliation__matched = "banking.reconciliation.matched";
+export const banking__reconciliation__unmatched = "banking.reconciliation.unmatched";
+export const banking__reconciliation__unmatchedDesc = "banking.reconciliation.unmatchedDesc";
+export const banking__reconciliation__transactionsFromYourAccounting = "banking.reconciliation.transactionsFromYourAccounting";
+export const banking__reconciliation__bankStatement = "banking.reconciliation.bankStatement";
+export const banking__reconciliation__transactionMatched = "banking.reconciliation.transactionMatched";
+export const banking__reconciliation__transactionMatchedDesc = "banking.reconciliation.transactionMatchedDesc";
+export const banking__reconciliation__autoStarted = "banking.reconciliation.autoStarted";
+export const banking__reconciliation__autoStartedDesc = "banking.reconciliation.autoStartedDesc";
+export const banking__reconciliation__cannotComplete = "banking.reconciliation.cannotComplete";
+export const banking__reconciliation__cannotCompleteDesc = "banking.reconciliation.cannotCompleteDesc";
+export const banking__reconciliation__completed = "banking.reconciliation.completed";
+export const banking__reconciliation__completedDesc = "banking.reconciliation.completedDesc";
+export const banking__reconciliation__noAutoMatches = "banking.reconciliation.noAutoMatches";
+export const banking__reconciliation__adjustFilters = "banking.reconciliation.adjustFilters";
+export const banking__reconciliation__autoCompleted = "banking.reconciliation.autoCompleted";
+export const banking__reconciliation__autoSummary = "banking.reconciliation.autoSummary";
+export const banking__reconciliation__undoAutoMatch = "banking.reconciliation.undoAutoMatch";
+export const banking__reconciliation__suggestedMatches = "banking.reconciliation.suggestedMatches";
+export const banking__reconciliation__savePresetAs = "banking.reconciliation.savePresetAs";
+export const banking__reconciliation__receipts = "banking.reconciliation.receipts";
+export const banking__reconciliation__payments = "banking.reconciliation.payments";
+export const banking__reconciliation__maxCandidates = "banking.reconciliation.maxCandidates";
+export const banking__reconciliation__minScore = "banking.reconciliation.minScore";
+export const banking__reconciliation__amountTolerance = "banking.reconciliation.amountTolerance";
+export const banking__reconciliation__maxDays = "banking.reconciliation.maxDays";
+export const banking__reconciliation__preferExact = "banking.reconciliation.preferExact";
+export const banking__reconciliation__sameCurrencyOnly = "banking.reconciliation.sameCurrencyOnly";
+export const banking__reconciliation__highOnly = "banking.reconciliation.highOnly";
+export const banking__reconciliation__highConfidence = "banking.reconciliation.highConfidence";
+export const banking__reconciliation__customerReceipts = "banking.reconciliation.customerReceipts";
+export const banking__reconciliation__receipt = "banking.reconciliation.receipt";
+export const banking__reconciliation__noCandidate = "banking.reconciliation.noCandidate";
+export const banking__reconciliation__currencyMismatch = "banking.reconciliation.currencyMismatch";
+export const banking__reconciliation__score = "banking.reconciliation.score";
+export const banking__reconciliation__scoreExplain = "banking.reconciliation.scoreExplain";
+export const banking__reconciliation__amountScore = "banking.reconciliation.amountScore";
+export const banking__reconciliation__dateScore = "banking.reconciliation.dateScore";
+export const banking__reconciliation__match = "banking.reconciliation.match";
+export const banking__reconciliation__vendorPayments = "banking.reconciliation.vendorPayments";
+export const banking__reconciliation__payment = "banking.reconciliation.payment";
+export const banking__reconciliation__autoPreview = "banking.reconciliation.autoPreview";
+export const banking__reconciliation__autoPreviewDesc = "banking.reconciliation.autoPreviewDesc";
+export const banking__reconciliation__selectReceipts = "banking.reconciliation.selectReceipts";
+export const banking__reconciliation__selectPayments = "banking.reconciliation.selectPayments";
+export const banking__reconciliation__selectHighConfidence = "banking.reconciliation.selectHighConfidence";
+export const banking__reconciliation__deselectCurrencyMismatch = "banking.reconciliation.deselectCurrencyMismatch";
+export const banking__reconciliation__maxDateDiff = "banking.reconciliation.maxDateDiff";
+export const banking__reconciliation__deselectAbove = "banking.reconciliation.deselectAbove";
+export const banking__reconciliation__why = "banking.reconciliation.why";
+export const banking__reconciliation__exactAmount = "banking.reconciliation.exactAmount";
+export const banking__reconciliation__closeAmount = "banking.reconciliation.closeAmount";
+export const banking__reconciliation__mismatch = "banking.reconciliation.mismatch";
+export const banking__reconciliation__sameCurrency = "banking.reconciliation.sameCurrency";
+export const banking__reconciliation__withinDays = "banking.reconciliation.withinDays";
+export const banking__reconciliation__dateDiffN = "banking.reconciliation.dateDiffN";
+export const banking__reconciliation__uniqueCandidate = "banking.reconciliation.uniqueCandidate";
+export const banking__reconciliation__recentMatches = "banking.reconciliation.recentMatches";
+export const banking__reconciliation__unmatch = "banking.reconciliation.unmatch";
+export const banking__reconciliation__completeShort = "banking.reconciliation.completeShort";
+export const banking__reconciliation__autoMatchFailed = "banking.reconciliation.autoMatchFailed";
+export const banking__reconciliation__suggestionFailed = "banking.reconciliation.suggestionFailed";
+export const banking__reconciliation__suggestionsFailed = "banking.reconciliation.suggestionsFailed";
+export const banking__checks__title = "banking.checks.title";
+export const banking__checks__receivable = "banking.checks.receivable";
+export const banking__checks__payable = "banking.checks.payable";
+export const banking__checks__add = "banking.checks.add";
+export const banking__checks__addReceivable = "banking.checks.addReceivable";
+export const banking__checks__addPayable = "banking.checks.addPayable";
+export const banking__checks__number = "banking.checks.number";
+export const banking__checks__bankName = "banking.checks.bankName";
+export const banking__checks__issueDate = "banking.checks.issueDate";
+export const banking__checks__dueDate = "banking.checks.dueDate";
+export const banking__checks__bank = "banking.checks.bank";
+export const banking__checks__createSuccess = "banking.checks.createSuccess";
+export const banking__checks__statusUpdateSuccess = "banking.checks.statusUpdateSuccess";
+export const banking__checks__status__on_hand = "banking.checks.status.on_hand";
+export const banking__checks__status__deposited = "banking.checks.status.deposited";
+export const banking__checks__status__cleared = "banking.checks.status.cleared";
+export const banking__checks__status__bounced = "banking.checks.status.bounced";
+export const banking__checks__status__returned = "banking.checks.status.returned";
+export const banking__checks__status__cancelled = "banking.checks.status.cancelled";
+export const sales__invoices__title = "sales.invoices.title";
+export const sales__invoices__description = "sales.invoices.description";
+export const sales__invoices__addInvoice = "sales.invoices.addInvoice";
+export const sales__invoices__editInvoice = "sales.invoices.editInvoice";
+export const sales__invoices__invoiceNumber = "sales.invoices.invoiceNumber";
+export const sales__invoices__invoiceDate = "sales.invoices.invoiceDate";
+export const sales__invoices__dueDate = "sales.invoices.dueDate";
+export const sales__invoices__customer = "sales.invoices.customer";
+export const sales__invoices__selectCustomer = "sales.invoices.selectCustomer";
+export const sales__invoices__items = "sales.invoices.items";
+export const sales__invoices__addItem = "sales.invoices.addItem";
+export const sales__invoices__subtotal = "sales.invoices.subtotal";
+export const sales__invoices__tax = "sales.invoices.tax";
+export const sales__invoices__discount = "sales.invoices.discount";
+export const sales__invoices__total = "sales.invoices.total";
+export const sales__invoices__status = "sales.invoices.status";
+export const sales__invoices__draft = "sales.invoices.draft";
+export const sales__invoices__sent = "sales.invoices.sent";
+export const sales__invoices__paid = "sales.invoices.paid";
+export const sales__invoices__partially_paid = "sales.invoices.partially_paid";
+export const sales__invoices__overdue = "sales.invoices.overdue";
+export const sales__invoices__cancelled = "sales.invoices.cancelled";
+export const sales__invoices__notes = "sales.invoices.notes";
+export const sales__invoices__termsConditions = "sales.invoices.termsConditions";
+export const sales__invoices__downloadPDF = "sales.invoices.downloadPDF";
+export const sales__invoices__pdfDownloaded = "sales.invoices.pdfDownloaded";
+export const sales__invoices__pdfFailed = "sales.invoices.pdfFailed";
+export const sales__invoices__sendEmail = "sales.invoices.sendEmail";
+export const sales__invoices__send = "sales.invoices.send";
+export const sales__invoices__markAsPaid = "sales.invoices.markAsPaid";
+export const sales__invoices__totalInvoices = "sales.invoices.totalInvoices";
+export const sales__invoices__paidInvoices = "sales.invoices.paidInvoices";
+export const sales__invoices__unpaidInvoices = "sales.invoices.unpaidInvoices";
+export const sales__invoices__overdueInvoices = "sales.invoices.overdueInvoices";
+export const sales__invoices__invoiceDeletedSuccess = "sales.invoices.invoiceDeletedSuccess";
+export const sales__invoices__invoiceDeleteError = "sales.invoices.invoiceDeleteError";
+export const sales__invoices__loadFailedTryAgain = "sales.invoices.loadFailedTryAgain";
+export const sales__invoices__descriptionShort = "sales.invoices.descriptionShort";
+export const sales__invoices__paidAmount = "sales.invoices.paidAmount";
+export const sales__invoices__outstanding = "sales.invoices.outstanding";
+export const sales__invoices__allInvoices = "sales.invoices.allInvoices";
+export const sales__invoices__collected = "sales.invoices.collected";
+export const sales__invoices__toCollect = "sales.invoices.toCollect";
+export const sales__invoices__confirmDelete = "sales.invoices.confirmDelete";
+export const sales__invoices__invoiceDuplicated = "sales.invoices.invoiceDuplicated";
+export const sales__invoices__invoiceDuplicatedDesc = "sales.invoices.invoiceDuplicatedDesc";
+export const sales__invoices__invoiceSent = "sales.invoices.invoiceSent";
+export const sales__invoices__invoiceSentDesc = "sales.invoices.invoiceSentDesc";
+export const sales__invoices__noInvoicesFound = "sales.invoices.noInvoicesFound";
+export const sales__invoices__draftSaved = "sales.invoices.draftSaved";
+export const sales__invoices__saveFailed = "sales.invoices.saveFailed";
+export const sales__invoices__emailQueued = "sales.invoices.emailQueued";
+export const sales__invoices__sendFailed = "sales.invoices.sendFailed";
+export const sales__invoices__updated = "sales.invoices.updated";
+export const sales__invoices__invoiceUpdated = "sales.invoices.invoiceUpdated";
+export const sales__invoices__updateFailed = "sales.invoices.updateFailed";
+export const sales__invoices__cannotEditNonDraft = "sales.invoices.cannotEditNonDraft";
+export const sales__invoices__previewPDF = "sales.invoices.previewPDF";
+export const sales__invoices__invoice = "sales.invoices.invoice";
+export const sales__invoices__invoiceNotFound = "sales.invoices.invoiceNotFound";
+export const sales__invoices__poNumber = "sales.invoices.poNumber";
+export const sales__orders__title = "sales.orders.title";
+export const sales__orders__description = "sales.orders.description";
+export const sales__orders__addOrder = "sales.orders.addOrder";
+export const sales__orders__editOrder = "sales.orders.editOrder";
+export const sales__orders__orderNumber = "sales.orders.orderNumber";
+export const sales__orders__orderDate = "sales.orders.orderDate";
+export const sales__orders__deliveryDate = "sales.orders.deliveryDate";
+export const sales__orders__convertToInvoice = "sales.orders.convertToInvoice";
+export const sales__orders__totalOrders = "sales.orders.totalOrders";
+export const sales__orders__pending = "sales.orders.pending";
+export const sales__orders__processing = "sales.orders.processing";
+export const sales__orders__unfulfilled = "sales.orders.unfulfilled";
+export const sales__orders__fulfilled = "sales.orders.fulfilled";
+export const sales__orders__confirmed = "sales.orders.confirmed";
+export const sales__orders__shipped = "sales.orders.shipped";
+export const sales__orders__delivered = "sales.orders.delivered";
+export const sales__orders__completed = "sales.orders.completed";
+export const sales__orders__descriptionShort = "sales.orders.descriptionShort";
+export const sales__orders__orderCreatedSuccess = "sales.orders.orderCreatedSuccess";
+export const sales__orders__orderCreateError = "sales.orders.orderCreateError";
+export const sales__orders__invoiceCreated = "sales.orders.invoiceCreated";
+export const sales__orders__orderConvertedSuccess = "sales.orders.orderConvertedSuccess";
+export const sales__orders__confirmConvert = "sales.orders.confirmConvert";
+export const sales__orders__orderShipped = "sales.orders.orderShipped";
+export const sales__orders__orderShippedSuccess = "sales.orders.orderShippedSuccess";
+export const sales__orders__orderCancelled = "sales.orders.orderCancelled";
+export const sales__orders__orderCancelledSuccess = "sales.orders.orderCancelledSuccess";
+export const sales__orders__confirmCancel = "sales.orders.confirmCancel";
+export const sales__orders__pendingOrders = "sales.orders.pendingOrders";
+export const sales__orders__processingOrders = "sales.orders.processingOrders";
+export const sales__orders__shippedOrders = "sales.orders.shippedOrders";
+export const sales__orders__markAsShipped = "sales.orders.markAsShipped";
+export const sales__orders__cancelOrder = "sales.orders.cancelOrder";
+export const sales__orders__noOrdersFound = "sales.orders.noOrdersFound";
+export const sales__orders__orderValue = "sales.orders.orderValue";
+export const sales__orders__totalRevenue = "sales.orders.totalRevenue";
+export const sales__orders__toProcess = "sales.orders.toProcess";
+export const sales__orders__inProgress = "sales.orders.inProgress";
+export const sales__orders__onTheWay = "sales.orders.onTheWay";
+export const sales__orders__allOrders = "sales.orders.allOrders";
+export const sales__orders__paymentStatus = "sales.orders.paymentStatus";
+export const sales__orders__createInvoice = "sales.orders.createInvoice";
+export const sales__quotations__title = "sales.quotations.title";
+export const sales__quotations__description = "sales.quotations.description";
+export const sales__quotations__addQuotation = "sales.quotations.addQuotation";
+export const sales__quotations__editQuotation = "sales.quotations.editQuotation";
+export const sales__quotations__quotationNumber = "sales.quotations.quotationNumber";
+export const sales__quotations__quotationDate = "sales.quotations.quotationDate";
+export const sales__quotations__expiryDate = "sales.quotations.expiryDate";
+export const sales__quotations__validUntil = "sales.quotations.validUntil";
+export const sales__quotations__convertToOrder = "sales.quotations.convertToOrder";
+export const sales__quotations__totalQuotations = "sales.quotations.totalQuotations";
+export const sales__quotations__accepted = "sales.quotations.accepted";
+export const sales__quotations__rejected = "sales.quotations.rejected";
+export const sales__quotations__expired = "sales.quotations.expired";
+export const sales__quotations__quotationCreatedSuccess = "sales.quotations.quotationCreatedSuccess";
+export const sales__quotations__quotationCreateError = "sales.quotations.quotationCreateError";
+export const sales__quotations__quotationDeletedSuccess = "sales.quotations.quotationDeletedSuccess";
+export const sales__quotations__quotationDeleteError = "sales.quotations.quotationDeleteError";
+export const sales__quotations__confirmDelete = "sales.quotations.confirmDelete";
+export const sales__quotations__confirmConvert = "sales.quotations.confirmConvert";
+export const sales__quotations__convertedToInvoice = "sales.quotations.convertedToInvoice";
+export const sales__quotations__quotationConvertedSuccess = "sales.quotations.quotationConvertedSuccess";
+export const sales__quotations__quotationConvertError = "sales.quotations.quotationConvertError";
+export const sales__quotations__quotationDuplicated = "sales.quotations.quotationDuplicated";
+export const sales__quotations__quotationDuplicatedDescription = "sales.quotations.quotationDuplicatedDescription";
+export const sales__quotations__quotationSent = "sales.quotations.quotationSent";
+export const sales__quotations__quotationSentSuccess = "sales.quotations.quotationSentSuccess";
+export const sales__quotations__acceptedQuotations = "sales.quotations.acceptedQuotations";
+export const sales__quotations__acceptanceRate = "sales.quotations.acceptanceRate";
+export const sales__quotations__averageValue = "sales.quotations.averageValue";
+export const sales__quotations__quoteNumber = "sales.quotations.quoteNumber";
+export const sales__quotations__convertToInvoice = "sales.quotations.convertToInvoice";
+export const sales__quotations__noQuotationsFound = "sales.quotations.noQuotationsFound";
+export const sales__quotations__potentialRevenue = "sales.quotations.potentialRevenue";
+export const sales__quotations__perQuotation = "sales.quotations.perQuotation";
+export const sales__quotations__editQuotationDescription = "sales.quotations.editQuotationDescription";
+export const sales__quotations__quotationUpdatedSuccess = "sales.quotations.quotationUpdatedSuccess";
+export const sales__quotations__quotationUpdateError = "sales.quotations.quotationUpdateError";
+export const sales__quotations__errorLoadingQuote = "sales.quotations.errorLoadingQuote";
+export const sales__quotations__saveAsDraft = "sales.quotations.saveAsDraft";
+export const sales__quotations__saveAndSend = "sales.quotations.saveAndSend";
+export const sales__quotations__editQuote = "sales.quotations.editQuote";
+export const sales__quotations__viewQuoteDetails = "sales.quotations.viewQuoteDetails";
+export const sales__quotations__quoteItems = "sales.quotations.quoteItems";
+export const sales__quotations__discount = "sales.quotations.discount";
+export const sales__quotations__afterDiscount = "sales.quotations.afterDiscount";
+export const sales__quotations__selectTax = "sales.quotations.selectTax";
+export const sales__quotations__equivalentInBaseCurrency = "sales.quotations.equivalentInBaseCurrency";
+export const sales__quotations__exchangeRate = "sales.quotations.exchangeRate";
+export const sales__quotations__quoteNumberDescription = "sales.quotations.quoteNumberDescription";
+export const sales__creditNotes__title = "sales.creditNotes.title";
+export const sales__creditNotes__description = "sales.creditNotes.description";
+export const sales__creditNotes__addCreditNote = "sales.creditNotes.addCreditNote";
+export const sales__creditNotes__editCreditNote = "sales.creditNotes.editCreditNote";
+export const sales__creditNotes__creditNoteNumber = "sales.creditNotes.creditNoteNumber";
+export const sales__creditNotes__creditNoteDate = "sales.creditNotes.creditNoteDate";
+export const sales__creditNotes__reason = "sales.creditNotes.reason";
+export const sales__creditNotes__refund = "sales.creditNotes.refund";
+export const sales__creditNotes__adjustment = "sales.creditNotes.adjustment";
+export const sales__creditNotes__returnGoods = "sales.creditNotes.returnGoods";
+export const sales__creditNotes__totalCreditNotes = "sales.creditNotes.totalCreditNotes";
+export const sales__creditNotes__issued = "sales.creditNotes.issued";
+export const sales__creditNotes__applied = "sales.creditNotes.applied";
+export const sales__creditNotes__descriptionShort = "sales.creditNotes.descriptionShort";
+export const sales__creditNotes__creditNoteCreatedSuccess = "sales.creditNotes.creditNoteCreatedSuccess";
+export const sales__creditNotes__creditNoteCreateError = "sales.creditNotes.creditNoteCreateError";
+export const sales__creditNotes__creditNoteUpdatedSuccess = "sales.creditNotes.creditNoteUpdatedSuccess";
+export const sales__creditNotes__creditNoteUpdateError = "sales.creditNotes.creditNoteUpdateError";
+export const sales__creditNotes__creditNoteDeletedSuccess = "sales.creditNotes.creditNoteDeletedSuccess";
+export const sales__creditNotes__creditNoteDeleteError = "sales.creditNotes.creditNoteDeleteError";
+export const sales__creditNotes__creditNoteApplyError = "sales.creditNotes.creditNoteApplyError";
+export const sales__creditNotes__creditApplied = "sales.creditNotes.creditApplied";
+export const sales__creditNotes__creditAppliedSuccess = "sales.creditNotes.creditAppliedSuccess";
+export const sales__creditNotes__creditNoteSent = "sales.creditNotes.creditNoteSent";
+export const sales__creditNotes__creditNoteSentSuccess = "sales.creditNotes.creditNoteSentSuccess";
+export const sales__creditNotes__creditNoteVoided = "sales.creditNotes.creditNoteVoided";
+export const sales__creditNotes__creditNoteVoidedSuccess = "sales.creditNotes.creditNoteVoidedSuccess";
+export const sales__creditNotes__confirmVoid = "sales.creditNotes.confirmVoid";
+export const sales__creditNotes__relatedInvoice = "sales.creditNotes.relatedInvoice";
+export const sales__creditNotes__issueDate = "sales.creditNotes.issueDate";
+export const sales__creditNotes__createNewCreditNote = "sales.creditNotes.createNewCreditNote";
+export const sales__creditNotes__creditNoteDetails = "sales.creditNotes.creditNoteDetails";
+export const sales__creditNotes__applyCreditNote = "sales.creditNotes.applyCreditNote";
+export const sales__creditNotes__creditNote = "sales.creditNotes.creditNote";
+export const sales__creditNotes__apply = "sales.creditNotes.apply";
+export const sales__creditNotes__totalAmount = "sales.creditNotes.totalAmount";
+export const sales__creditNotes__appliedCredits = "sales.creditNotes.appliedCredits";
+export const sales__creditNotes__pendingCredits = "sales.creditNotes.pendingCredits";
+export const sales__creditNotes__invoiceNumber = "sales.creditNotes.invoiceNumber";
+export const sales__creditNotes__applyToInvoice = "sales.creditNotes.applyToInvoice";
+export const sales__creditNotes__voidCreditNote = "sales.creditNotes.voidCreditNote";
+export const sales__creditNotes__noCreditNotesFound = "sales.creditNotes.noCreditNotesFound";
+export const sales__creditNotes__creditIssued = "sales.creditNotes.creditIssued";
+export const sales__creditNotes__toInvoices = "sales.creditNotes.toInvoices";
+export const sales__creditNotes__toBeApplied = "sales.creditNotes.toBeApplied";
+export const sales__recurringInvoices__title = "sales.recurringInvoices.title";
+export const sales__recurringInvoices__description = "sales.recurringInvoices.description";
+export const sales__recurringInvoices__addTemplate = "sales.recurringInvoices.addTemplate";
+export const sales__recurringInvoices__editTemplate = "sales.recurringInvoices.editTemplate";
+export const sales__recurringInvoices__templateName = "sales.recurringInvoices.templateName";
+export const sales__recurringInvoices__frequency = "sales.recurringInvoices.frequency";
+export const sales__recurringInvoices__startDate = "sales.recurringInvoices.startDate";
+export const sales__recurringInvoices__endDate = "sales.recurringInvoices.endDate";
+export const sales__recurringInvoices__nextInvoiceDate = "sales.recurringInvoices.nextInvoiceDate";
+export const sales__recurringInvoices__active = "sales.recurringInvoices.active";
+export const sales__recurringInvoices__paused = "sales.recurringInvoices.paused";
+export const sales__recurringInvoices__daily = "sales.recurringInvoices.daily";
+export const sales__recurringInvoices__weekly = "sales.recurringInvoices.weekly";
+export const sales__recurringInvoices__monthly = "sales.recurringInvoices.monthly";
+export const sales__recurringInvoices__quarterly = "sales.recurringInvoices.quarterly";
+export const sales__recurringInvoices__yearly = "sales.recurringInvoices.yearly";
+export const sales__recurringInvoices__totalTemplates = "sales.recurringInvoices.totalTemplates";
+export const sales__recurringInvoices__recurringInvoiceCreatedSuccess = "sales.recurringInvoices.recurringInvoiceCreatedSuccess";
+export const sales__recurringInvoices__recurringInvoiceCreateError = "sales.recurringInvoices.recurringInvoiceCreateError";
+export const sales__recurringInvoices__recurringInvoiceStatusChanged = "sales.recurringInvoices.recurringInvoiceStatusChanged";
+export const sales__recurringInvoices__templateActivatedSuccess = "sales.recurringInvoices.templateActivatedSuccess";
+export const sales__recurringInvoices__templatePausedSuccess = "sales.recurringInvoices.templatePausedSuccess";
+export const sales__recurringInvoices__descriptionShort = "sales.recurringInvoices.descriptionShort";
+export const sales__recurringInvoices__addRecurringInvoice = "sales.recurringInvoices.addRecurringInvoice";
+export const sales__recurringInvoices__createTemplate = "sales.recurringInvoices.createTemplate";
+export const sales__recurringInvoices__paymentTerms = "sales.recurringInvoices.paymentTerms";
+export const sales__recurringInvoices__totalRecurring = "sales.recurringInvoices.totalRecurring";
+export const sales__recurringInvoices__activeTemplates = "sales.recurringInvoices.activeTemplates";
+export const sales__recurringInvoices__nextInvoice = "sales.recurringInvoices.nextInvoice";
+export const sales__recurringInvoices__invoicesSent = "sales.recurringInvoices.invoicesSent";
+export const sales__recurringInvoices__pauseTemplate = "sales.recurringInvoices.pauseTemplate";
+export const sales__recurringInvoices__activateTemplate = "sales.recurringInvoices.activateTemplate";
+export const sales__recurringInvoices__noRecurringInvoicesFound = "sales.recurringInvoices.noRecurringInvoicesFound";
+export const sales__recurringInvoices__generateNow = "sales.recurringInvoices.generateNow";
+export const sales__recurringInvoices__invoiceGeneratedSuccess = "sales.recurringInvoices.invoiceGeneratedSuccess";
+export const sales__recurringInvoices__invoiceGenerationFailed = "sales.recurringInvoices.invoiceGenerationFailed";
+export const sales__confirmed = "sales.confirmed";
+export const sales__processing = "sales.processing";
+export const sales__shipped = "sales.shipped";
+export const sales__delivered = "sales.delivered";
+export const sales__unfulfilled = "sales.unfulfilled";
+export const sales__fulfilled = "sales.fulfilled";
+export const sales__customers__customer = "sales.customers.customer";
+export const paymentTerms__net15 = "paymentTerms.net15";
+export const paymentTerms__net30 = "paymentTerms.net30";
+export const paymentTerms__net60 = "paymentTerms.net60";
+export const paymentTerms__net90 = "paymentTerms.net90";
+export const paymentTerms__dueOnReceipt = "paymentTerms.dueOnReceipt";
+export const paymentTerms__net45 = "paymentTerms.net45";
+export const purchases__bills__title = "purchases.bills.title";
+export const purchases__bills__description = "purchases.bills.description";
+export const purchases__bills__addBill = "purchases.bills.addBill";
+export const purchases__bills__quickBill = "purchases.bills.quickBill";
+export const purchases__bills__newBill = "purchases.bills.newBill";
+export const purchases__bills__editBill = "purchases.bills.editBill";
+export const purchases__bills__billNumber = "purchases.bills.billNumber";
+export const purchases__bills__billDate = "purchases.bills.billDate";
+export const purchases__bills__supplier = "purchases.bills.supplier";
+export const purchases__bills__selectSupplier = "purchases.bills.selectSupplier";
+export const purchases__bills__totalBills = "purchases.bills.totalBills";
+export const purchases__bills__paidBills = "purchases.bills.paidBills";
+export const purchases__bills__unpaidBills = "purchases.bills.unpaidBills";
+export const purchases__bills__overdueBills = "purchases.bills.overdueBills";
+export const purchases__bills__allBills = "purchases.bills.allBills";
+export const purchases__bills__totalAmount = "purchases.bills.totalAmount";
+export const purchases__bills__outstanding = "purchases.bills.outstanding";
+export const purchases__bills__toBePaid = "purchases.bills.toBePaid";
+export const purchases__bills__overdueAmount = "purchases.bills.overdueAmount";
+export const purchases__bills__pastDueDate = "purchases.bills.pastDueDate";
+export const purchases__bills__descriptionPlaceholder = "purchases.bills.descriptionPlaceholder";
+export const purchases__bills__supplierReference = "purchases.bills.supplierReference";
+export const purchases__bills__supplierInvoiceNumber = "purchases.bills.supplierInvoiceNumber";
+export const purchases__bills__billCreated = "purchases.bills.billCreated";
+export const purchases__bills__billCreatedDesc = "purchases.bills.billCreatedDesc";
+export const purchases__bills__billCreateError = "purchases.bills.billCreateError";
+export const purchases__bills__billDeleted = "purchases.bills.billDeleted";
+export const purchases__bills__billDeletedDesc = "purchases.bills.billDeletedDesc";
+export const purchases__bills__billDeleteError = "purchases.bills.billDeleteError";
+export const purchases__bills__billDuplicated = "purchases.bills.billDuplicated";
+export const purchases__bills__billDuplicatedDesc = "purchases.bills.billDuplicatedDesc";
+export const purchases__bills__confirmDelete = "purchases.bills.confirmDelete";
+export const purchases__bills__supplierReferencePlaceholder = "purchases.bills.supplierReferencePlaceholder";
+export const purchases__bills__bill = "purchases.bills.bill";
+export const purchases__orders__title = "purchases.orders.title";
+export const purchases__orders__description = "purchases.orders.description";
+export const purchases__orders__descriptionShort = "purchases.orders.descriptionShort";
+export const purchases__orders__addPurchaseOrder = "purchases.orders.addPurchaseOrder";
+export const purchases__orders__editPurchaseOrder = "purchases.orders.editPurchaseOrder";
+export const purchases__orders__purchaseOrderNumber = "purchases.orders.purchaseOrderNumber";
+export const purchases__orders__purchaseOrderDate = "purchases.orders.purchaseOrderDate";
+export const purchases__orders__expectedDelivery = "purchases.orders.expectedDelivery";
+export const purchases__orders__convertToBill = "purchases.orders.convertToBill";
+export const purchases__orders__totalPurchaseOrders = "purchases.orders.totalPurchaseOrders";
+export const purchases__orders__received = "purchases.orders.received";
+export const purchases__orders__ordered = "purchases.orders.ordered";
+export const purchases__orders__pendingApproval = "purchases.orders.pendingApproval";
+export const purchases__orders__needReview = "purchases.orders.needReview";
+export const purchases__orders__allOrders = "purchases.orders.allOrders";
+export const purchases__orders__approval = "purchases.orders.approval";
+export const purchases__orders__totalValue = "purchases.orders.totalValue";
+export const purchases__orders__purchaseVolume = "purchases.orders.purchaseVolume";
+export const purchases__orders__averageValue = "purchases.orders.averageValue";
+export const purchases__orders__perOrder = "purchases.orders.perOrder";
+export const purchases__orders__viewDetails = "purchases.orders.viewDetails";
+export const purchases__orders__approve = "purchases.orders.approve";
+export const purchases__orders__sendToVendor = "purchases.orders.sendToVendor";
+export const purchases__orders__cancelOrder = "purchases.orders.cancelOrder";
+export const purchases__orders__createPurchaseOrder = "purchases.orders.createPurchaseOrder";
+export const purchases__orders__descriptionPlaceholder = "purchases.orders.descriptionPlaceholder";
+export const purchases__orders__orderCreated = "purchases.orders.orderCreated";
+export const purchases__orders__orderCreatedDesc = "purchases.orders.orderCreatedDesc";
+export const purchases__orders__orderCreateError = "purchases.orders.orderCreateError";
+export const purchases__orders__orderApproved = "purchases.orders.orderApproved";
+export const purchases__orders__orderApprovedDesc = "purchases.orders.orderApprovedDesc";
+export const purchases__orders__orderConvertedDesc = "purchases.orders.orderConvertedDesc";
+export const purchases__orders__orderConvertError = "purchases.orders.orderConvertError";
+export const purchases__orders__confirmConvert = "purchases.orders.confirmConvert";
+export const purchases__orders__orderSent = "purchases.orders.orderSent";
+export const purchases__orders__orderSentDesc = "purchases.orders.orderSentDesc";
+export const purchases__orders__orderCancelled = "purchases.orders.orderCancelled";
+export const purchases__orders__orderCancelledDesc = "purchases.orders.orderCancelledDesc";
+export const purchases__orders__confirmCancel = "purchases.orders.confirmCancel";
+export const purchases__expenses__title = "purchases.expenses.title";
+export const purchases__expenses__description = "purchases.expenses.description";
+export const purchases__expenses__descriptionShort = "purchases.expenses.descriptionShort";
+export const purchases__expenses__addExpense = "purchases.expenses.addExpense";
+export const purchases__expenses__editExpense = "purchases.expenses.editExpense";
+export const purchases__expenses__expenseNumber = "purchases.expenses.expenseNumber";
+export const purchases__expenses__expenseDate = "purchases.expenses.expenseDate";
+export const purchases__expenses__category = "purchases.expenses.category";
+export const purchases__expenses__selectCategory = "purchases.expenses.selectCategory";
+export const purchases__expenses__amount = "purchases.expenses.amount";
+export const purchases__expenses__paidBy = "purchases.expenses.paidBy";
+export const purchases__expenses__paidByPlaceholder = "purchases.expenses.paidByPlaceholder";
+export const purchases__expenses__paymentMethod = "purchases.expenses.paymentMethod";
+export const purchases__expenses__payment = "purchases.expenses.payment";
+export const purchases__expenses__reference = "purchases.expenses.reference";
+export const purchases__expenses__receipt = "purchases.expenses.receipt";
+export const purchases__expenses__uploadReceipt = "purchases.expenses.uploadReceipt";
+export const purchases__expenses__reimbursable = "purchases.expenses.reimbursable";
+export const purchases__expenses__reimbursableHint = "purchases.expenses.reimbursableHint";
+export const purchases__expenses__notesPlaceholder = "purchases.expenses.notesPlaceholder";
+export const purchases__expenses__createExpense = "purchases.expenses.createExpense";
+export const purchases__expenses__totalExpenses = "purchases.expenses.totalExpenses";
+export const purchases__expenses__allExpenses = "purchases.expenses.allExpenses";
+export const purchases__expenses__approvedExpenses = "purchases.expenses.approvedExpenses";
+export const purchases__expenses__awaitingApproval = "purchases.expenses.awaitingApproval";
+export const purchases__expenses__toReimburse = "purchases.expenses.toReimburse";
+export const purchases__expenses__approved = "purchases.expenses.approved";
+export const purchases__expenses__accepted = "purchases.expenses.accepted";
+export const purchases__expenses__rejected = "purchases.expenses.rejected";
+export const purchases__expenses__reimbursed = "purchases.expenses.reimbursed";
+export const purchases__expenses__approve = "purchases.expenses.approve";
+export const purchases__expenses__reject = "purchases.expenses.reject";
+export const purchases__expenses__reimburse = "purchases.expenses.reimburse";
+export const purchases__expenses__expenseCreated = "purchases.expenses.expenseCreated";
+export const purchases__expenses__expenseCreatedDesc = "purchases.expenses.expenseCreatedDesc";
+export const purchases__expenses__expenseCreateError = "purchases.expenses.expenseCreateError";
+export const purchases__expenses__expenseUpdated = "purchases.expenses.expenseUpdated";
+export const purchases__expenses__expenseUpdatedDesc = "purchases.expenses.expenseUpdatedDesc";
+export const purchases__expenses__expenseUpdateError = "purchases.expenses.expenseUpdateError";
+export const purchases__expenses__viewDetails = "purchases.expenses.viewDetails";
+export const purchases__expenses__categories__office = "purchases.expenses.categories.office";
+export const purchases__expenses__categories__rent = "purchases.expenses.categories.rent";
+export const purchases__expenses__categories__utilities = "purchases.expenses.categories.utilities";
+export const purchases__expenses__categories__salaries = "purchases.expenses.categories.salaries";
+export const purchases__expenses__categories__marketing = "purchases.expenses.categories.marketing";
+export const purchases__expenses__categories__travel = "purchases.expenses.categories.travel";
+export const purchases__expenses__categories__equipment = "purchases.expenses.categories.equipment";
+export const purchases__expenses__categories__supplies = "purchases.expenses.categories.supplies";
+export const purchases__expenses__categories__insurance = "purchases.expenses.categories.insurance";
+export const purchases__expenses__categories__maintenance = "purchases.expenses.categories.maintenance";
+export const purchases__expenses__categories__software = "purchases.expenses.categories.software";
+export const purchases__expenses__categories__entertainment = "purchases.expenses.categories.entertainment";
+export const purchases__expenses__categories__training = "purchases.expenses.categories.training";
+export const purchases__expenses__categories__meals = "purchases.expenses.categories.meals";
+export const purchases__expenses__categories__communication = "purchases.expenses.categories.communication";
+export const purchases__expenses__categories__other = "purchases.expenses.categories.other";
+export const purchases__expenses__paymentMethods__cash = "purchases.expenses.paymentMethods.cash";
+export const purchases__expenses__paymentMethods__creditCard = "purchases.expenses.paymentMethods.creditCard";
+export const purchases__expenses__paymentMethods__companyCard = "purchases.expenses.paymentMethods.companyCard";
+export const purchases__expenses__paymentMethods__bankTransfer = "purchases.expenses.paymentMethods.bankTransfer";
+export const purchases__expenses__paymentMethods__personalCard = "purchases.expenses.paymentMethods.personalCard";
+export const purchases__expenses__paymentMethods__pettyCash = "purchases.expenses.paymentMethods.pettyCash";
+export const purchases__expenses__expenseAccount = "purchases.expenses.expenseAccount";
+export const purchases__expenses__selectExpenseAccount = "purchases.expenses.selectExpenseAccount";
+export const purchases__expenses__paidFromAccount = "purchases.expenses.paidFromAccount";
+export const purchases__expenses__selectPaidFromAccount = "purchases.expenses.selectPaidFromAccount";
+export const purchases__debitNotes__title = "purchases.debitNotes.title";
+export const purchases__debitNotes__description = "purchases.debitNotes.description";
+export const purchases__debitNotes__addDebitNote = "purchases.debitNotes.addDebitNote";
+export const purchases__debitNotes__editDebitNote = "purchases.debitNotes.editDebitNote";
+export const purchases__debitNotes__debitNote = "purchases.debitNotes.debitNote";
+export const purchases__debitNotes__debitNoteNumber = "purchases.debitNotes.debitNoteNumber";
+export const purchases__debitNotes__debitNoteDate = "purchases.debitNotes.debitNoteDate";
+export const purchases__debitNotes__relatedBill = "purchases.debitNotes.relatedBill";
+export const purchases__debitNotes__reason = "purchases.debitNotes.reason";
+export const purchases__debitNotes__createDebitNote = "purchases.debitNotes.createDebitNote";
+export const purchases__debitNotes__totalDebitNotes = "purchases.debitNotes.totalDebitNotes";
+export const purchases__debitNotes__totalAmount = "purchases.debitNotes.totalAmount";
+export const purchases__debitNotes__debitIssued = "purchases.debitNotes.debitIssued";
+export const purchases__debitNotes__applied = "purchases.debitNotes.applied";
+export const purchases__debitNotes__toBills = "purchases.debitNotes.toBills";
+export const purchases__debitNotes__pending = "purchases.debitNotes.pending";
+export const purchases__debitNotes__toBeApplied = "purchases.debitNotes.toBeApplied";
+export const purchases__debitNotes__searchPlaceholder = "purchases.debitNotes.searchPlaceholder";
+export const purchases__debitNotes__send = "purchases.debitNotes.send";
+export const purchases__debitNotes__applyToBill = "purchases.debitNotes.applyToBill";
+export const purchases__debitNotes__downloadPDF = "purchases.debitNotes.downloadPDF";
+export const purchases__debitNotes__confirmVoid = "purchases.debitNotes.confirmVoid";
+export const purchases__debitNotes__debitNoteCreated = "purchases.debitNotes.debitNoteCreated";
+export const purchases__debitNotes__debitNoteCreatedDesc = "purchases.debitNotes.debitNoteCreatedDesc";
+export const purchases__debitNotes__debitNoteCreateError = "purchases.debitNotes.debitNoteCreateError";
+export const purchases__debitNotes__debitNoteSent = "purchases.debitNotes.debitNoteSent";
+export const purchases__debitNotes__debitNoteSentDesc = "purchases.debitNotes.debitNoteSentDesc";
+export const purchases__debitNotes__debitNoteApplied = "purchases.debitNotes.debitNoteApplied";
+export const purchases__debitNotes__debitNoteAppliedDesc = "purchases.debitNotes.debitNoteAppliedDesc";
+export const purchases__debitNotes__debitNoteVoided = "purchases.debitNotes.debitNoteVoided";
+export const purchases__debitNotes__debitNoteVoidedDesc = "purchases.debitNotes.debitNoteVoidedDesc";
+export const purchases__debitNotes__debitNoteUpdated = "purchases.debitNotes.debitNoteUpdated";
+export const purchases__debitNotes__debitNoteUpdateError = "purchases.debitNotes.debitNoteUpdateError";
+export const purchases__debitNotes__debitNoteDeleted = "purchases.debitNotes.debitNoteDeleted";
+export const purchases__debitNotes__debitNoteDeleteError = "purchases.debitNotes.debitNoteDeleteError";
+export const purchases__debitNotes__debitNoteApplyError = "purchases.debitNotes.debitNoteApplyError";
+export const purchases__debitNotes__applyDebitNote = "purchases.debitNotes.applyDebitNote";
+export const purchases__vendors__vendor = "purchases.vendors.vendor";
+export const accounting__costCenters__title = "accounting.costCenters.title";
+export const accounting__costCenters__createSuccess = "accounting.costCenters.createSuccess";
+export const accounting__costCenters__updateSuccess = "accounting.costCenters.updateSuccess";
+export const accounting__costCenters__deleteSuccess = "accounting.costCenters.deleteSuccess";
+export const accounting__costCenters__add = "accounting.costCenters.add";
+export const accounting__costCenters__edit = "accounting.costCenters.edit";
+export const accounting__costCenters__code = "accounting.costCenters.code";
+export const accounting__costCenters__name = "accounting.costCenters.name";
+export const accounting__costCenters__parent = "accounting.costCenters.parent";
+export const accounting__costCenters__list = "accounting.costCenters.list";
+export const accounting__insights__title = "accounting.insights.title";
+export const accounting__insights__subtitle = "accounting.insights.subtitle";
+export const accounting__insights__anomalies = "accounting.insights.anomalies";
+export const accounting__insights__anomaliesDesc = "accounting.insights.anomaliesDesc";
+export const accounting__insights__suggestions = "accounting.insights.suggestions";
+export const accounting__insights__suggestionsDesc = "accounting.insights.suggestionsDesc";
+export const accounting__insights__cashFlowForecast = "accounting.insights.cashFlowForecast";
+export const accounting__insights__cashFlowDesc = "accounting.insights.cashFlowDesc";
+export const accounting__insights__expenseAnalysis = "accounting.insights.expenseAnalysis";
+export const accounting__insights__expenseDesc = "accounting.insights.expenseDesc";
+export const accounting__insights__askAI = "accounting.insights.askAI";
+export const accounting__insights__aiReport = "accounting.insights.aiReport";
+export const accounting__insights__allGood = "accounting.insights.allGood";
+export const accounting__insights__noIssues = "accounting.insights.noIssues";
+export const accounting__journals__title = "accounting.journals.title";
+export const accounting__journals__pageDescription = "accounting.journals.pageDescription";
+export const accounting__journals__new = "accounting.journals.new";
+export const accounting__journals__entries = "accounting.journals.entries";
+export const accounting__journals__date = "accounting.journals.date";
+export const accounting__journals__number = "accounting.journals.number";
+export const accounting__journals__description = "accounting.journals.description";
+export const accounting__journals__reference = "accounting.journals.reference";
+export const accounting__journals__source = "accounting.journals.source";
+export const accounting__journals__amount = "accounting.journals.amount";
+export const accounting__journals__actions = "accounting.journals.actions";
+export const accounting__journals__noJournals = "accounting.journals.noJournals";
+export const accounting__journals__manual = "accounting.journals.manual";
+export const accounting__journals__draftWithAI = "accounting.journals.draftWithAI";
+export const accounting__journals__draftJournalWithAI = "accounting.journals.draftJournalWithAI";
+export const accounting__journals__aiDescription = "accounting.journals.aiDescription";
+export const accounting__journals__aiPlaceholder = "accounting.journals.aiPlaceholder";
+export const accounting__journals__drafting = "accounting.journals.drafting";
+export const accounting__journals__generateDraft = "accounting.journals.generateDraft";
+export const accounting__journals__aiDraftWarnings = "accounting.journals.aiDraftWarnings";
+export const accounting__journals__draftGenerated = "accounting.journals.draftGenerated";
+export const accounting__journals__draftFromDescription = "accounting.journals.draftFromDescription";
+export const accounting__journals__aiDraftFailed = "accounting.journals.aiDraftFailed";
+export const accounting__journals__details = "accounting.journals.details";
+export const accounting__journals__account = "accounting.journals.account";
+export const accounting__journals__project = "accounting.journals.project";
+export const accounting__journals__selectAccount = "accounting.journals.selectAccount";
+export const accounting__journals__selectProject = "accounting.journals.selectProject";
+export const accounting__journals__totalDebit = "accounting.journals.totalDebit";
+export const accounting__journals__totalCredit = "accounting.journals.totalCredit";
+export const accounting__journals__addLine = "accounting.journals.addLine";
+export const accounting__journals__debit = "accounting.journals.debit";
+export const accounting__journals__credit = "accounting.journals.credit";
+export const accounting__journals__difference = "accounting.journals.difference";
+export const accounting__journals__messages__created = "accounting.journals.messages.created";
+export const accounting__journals__messages__balancedError = "accounting.journals.messages.balancedError";
+export const accounting__journals__messages__accountError = "accounting.journals.messages.accountError";
+export const accounting__accounts__messages__created = "accounting.accounts.messages.created";
+export const accounting__accounts__messages__createFailed = "accounting.accounts.messages.createFailed";
+export const accounting__accounts__messages__updated = "accounting.accounts.messages.updated";
+export const accounting__accounts__messages__updateFailed = "accounting.accounts.messages.updateFailed";
+export const accounting__accounts__messages__deleted = "accounting.accounts.messages.deleted";
+export const accounting__accounts__messages__deleteFailed = "accounting.accounts.messages.deleteFailed";
+export const accounting__accounts__messages__deleteConfirm = "accounting.accounts.messages.deleteConfirm";
+export const accounting__accounts__messages__deleteWarning = "accounting.accounts.messages.deleteWarning";
+export const accounting__accounts__messages__noAccounts = "accounting.accounts.messages.noAccounts";
+export const accounting__accounts__messages__startAdding = "accounting.accounts.messages.startAdding";
+export const accounting__accounts__messages__defaultsCreated = "accounting.accounts.messages.defaultsCreated";
+export const accounting__accounts__messages__initFailed = "accounting.accounts.messages.initFailed";
+export const accounting__accounts__title = "accounting.accounts.title";
+export const accounting__accounts__description = "accounting.accounts.description";
+export const accounting__accounts__add = "accounting.accounts.add";
+export const accounting__accounts__create = "accounting.accounts.create";
+export const accounting__accounts__edit = "accounting.accounts.edit";
+export const accounting__accounts__code = "accounting.accounts.code";
+export const accounting__accounts__name = "accounting.accounts.name";
+export const accounting__accounts__type = "accounting.accounts.type";
+export const accounting__accounts__subtype = "accounting.accounts.subtype";
+export const accounting__accounts__parentAccount = "accounting.accounts.parentAccount";
+export const accounting__accounts__descriptionLabel = "accounting.accounts.descriptionLabel";
+export const accounting__accounts__active = "accounting.accounts.active";
+export const accounting__accounts__activeDesc = "accounting.accounts.activeDesc";
+export const accounting__accounts__initDefaults = "accounting.accounts.initDefaults";
+export const accounting__accounts__initDefaultsDesc = "accounting.accounts.initDefaultsDesc";
+export const accounting__accounts__initDefaultsWarning = "accounting.accounts.initDefaultsWarning";
+export const accounting__accounts__createDefaults = "accounting.accounts.createDefaults";
+export const accounting__accounts__treeView = "accounting.accounts.treeView";
+export const accounting__accounts__listView = "accounting.accounts.listView";
+export const accounting__accounts__searchPlaceholder = "accounting.accounts.searchPlaceholder";
+export const accounting__accounts__types__asset = "accounting.accounts.types.asset";
+export const accounting__accounts__types__liability = "accounting.accounts.types.liability";
+export const accounting__accounts__types__equity = "accounting.accounts.types.equity";
+export const accounting__accounts__types__revenue = "accounting.accounts.types.revenue";
+export const accounting__accounts__types__expense = "accounting.accounts.types.expense";
+export const accounting__accounts__subtypes__CurrentAsset = "accounting.accounts.subtypes.CurrentAsset";
+export const accounting__accounts__subtypes__Cash = "accounting.accounts.subtypes.Cash";
+export const accounting__accounts__subtypes__AccountsReceivable = "accounting.accounts.subtypes.AccountsReceivable";
+export const accounting__accounts__subtypes__Inventory = "accounting.accounts.subtypes.Inventory";
+export const accounting__accounts__subtypes__FixedAsset = "accounting.accounts.subtypes.FixedAsset";
+export const accounting__accounts__subtypes__OtherAsset = "accounting.accounts.subtypes.OtherAsset";
+export const accounting__accounts__subtypes__CurrentLiability = "accounting.accounts.subtypes.CurrentLiability";
+export const accounting__accounts__subtypes__AccountsPayable = "accounting.accounts.subtypes.AccountsPayable";
+export const accounting__accounts__subtypes__CreditCard = "accounting.accounts.subtypes.CreditCard";
+export const accounting__accounts__subtypes__LongTermLiability = "accounting.accounts.subtypes.LongTermLiability";
+export const accounting__accounts__subtypes__OtherLiability = "accounting.accounts.subtypes.OtherLiability";
+export const accounting__accounts__subtypes__OwnersEquity = "accounting.accounts.subtypes.OwnersEquity";
+export const accounting__accounts__subtypes__RetainedEarnings = "accounting.accounts.subtypes.RetainedEarnings";
+export const accounting__accounts__subtypes__ShareCapital = "accounting.accounts.subtypes.ShareCapital";
+export const accounting__accounts__subtypes__Dividends = "accounting.accounts.subtypes.Dividends";
+export const accounting__accounts__subtypes__SalesRevenue = "accounting.accounts.subtypes.SalesRevenue";
+export const accounting__accounts__subtypes__ServiceRevenue = "accounting.accounts.subtypes.ServiceRevenue";
+export const accounting__accounts__subtypes__OtherRevenue = "accounting.accounts.subtypes.OtherRevenue";
+export const accounting__accounts__subtypes__InterestIncome = "accounting.accounts.subtypes.InterestIncome";
+export const accounting__accounts__subtypes__CostOfGoods = "accounting.accounts.subtypes.CostOfGoods";
+export const accounting__accounts__subtypes__OperatingExpense = "accounting.accounts.subtypes.OperatingExpense";
+export const accounting__accounts__subtypes__SalaryExpense = "accounting.accounts.subtypes.SalaryExpense";
+export const accounting__accounts__subtypes__RentExpense = "accounting.accounts.subtypes.RentExpense";
+export const accounting__accounts__subtypes__UtilityExpense = "accounting.accounts.subtypes.UtilityExpense";
+export const accounting__accounts__subtypes__OtherExpense = "accounting.accounts.subtypes.OtherExpense";
+export const projects__title = "projects.title";
+export const projects__description = "projects.description";
+export const projects__addProject = "projects.addProject";
+export const projects__createTitle = "projects.createTitle";
+export const projects__createDesc = "projects.createDesc";
+export const projects__code = "projects.code";
+export const projects__name = "projects.name";
+export const projects__status = "projects.status";
+export const projects__budget = "projects.budget";
+export const projects__startDate = "projects.startDate";
+export const projects__endDate = "projects.endDate";
+export const projects__actions = "projects.actions";
+export const projects__view = "projects.view";
+export const projects__active = "projects.active";
+export const projects__completed = "projects.completed";
+export const projects__on_hold = "projects.on_hold";
+export const projects__cancelled = "projects.cancelled";
+export const projects__createdSuccess = "projects.createdSuccess";
+export const projects__notFound = "projects.notFound";
+export const projects__revenue = "projects.revenue";
+export const projects__expenses = "projects.expenses";
+export const projects__profit = "projects.profit";
+export const projects__utilized = "projects.utilized";
+export const projects__transactions = "projects.transactions";
+export const projects__noTransactions = "projects.noTransactions";
+export const projects__totalProjects = "projects.totalProjects";
+export const projects__activeProjects = "projects.activeProjects";
+export const projects__completedProjects = "projects.completedProjects";
+export const projects__totalBudget = "projects.totalBudget";
+export const projects__viewTitle = "projects.viewTitle";
+export const projects__editTitle = "projects.editTitle";
+export const projects__updatedSuccess = "projects.updatedSuccess";
+export const projects__deletedSuccess = "projects.deletedSuccess";
+export const projects__deleteConfirm = "projects.deleteConfirm";
+export const projects__dateError = "projects.dateError";
+export const projects__profitabilityReport = "projects.profitabilityReport";
+export const projects__profitabilityDesc = "projects.profitabilityDesc";
+export const projects__profitable = "projects.profitable";
+export const projects__loss = "projects.loss";
+export const projects__breakeven = "projects.breakeven";
+export const projects__totalRevenue = "projects.totalRevenue";
+export const projects__totalExpenses = "projects.totalExpenses";
+export const projects__netProfit = "projects.netProfit";
+export const projects__profitMargin = "projects.profitMargin";
+export const projects__profitableProjects = "projects.profitableProjects";
+export const projects__lossProjects = "projects.lossProjects";
+export const projects__profitabilityDetails = "projects.profitabilityDetails";
+export const projects__budgetUsage = "projects.budgetUsage";
+export const projects__profitability = "projects.profitability";
+export const projects__financialSummary = "projects.financialSummary";
+export const projects__spent = "projects.spent";
+export const projects__noFinancialData = "projects.noFinancialData";
+export const projects__overview = "projects.overview";
+export const projects__phases = "projects.phases";
+export const projects__tasks = "projects.tasks";
+export const projects__timeTracking = "projects.timeTracking";
+export const projects__addPhase = "projects.addPhase";
+export const projects__editPhase = "projects.editPhase";
+export const projects__noPhases = "projects.noPhases";
+export const projects__phase = "projects.phase";
+export const projects__progress = "projects.progress";
+export const projects__phaseStatus__pending = "projects.phaseStatus.pending";
+export const projects__phaseStatus__in_progress = "projects.phaseStatus.in_progress";
+export const projects__phaseStatus__completed = "projects.phaseStatus.completed";
+export const projects__phaseStatus__on_hold = "projects.phaseStatus.on_hold";
+export const projects__addTask = "projects.addTask";
+export const projects__editTask = "projects.editTask";
+export const projects__noTasks = "projects.noTasks";
+export const projects__task = "projects.task";
+export const projects__taskTitle = "projects.taskTitle";
+export const projects__taskStatus__todo = "projects.taskStatus.todo";
+export const projects__taskStatus__in_progress = "projects.taskStatus.in_progress";
+export const projects__taskStatus__completed = "projects.taskStatus.completed";
+export const projects__taskStatus__blocked = "projects.taskStatus.blocked";
+export const projects__priority__low = "projects.priority.low";
+export const projects__priority__medium = "projects.priority.medium";
+export const projects__priority__high = "projects.priority.high";
+export const projects__priority__urgent = "projects.priority.urgent";
+export const projects__dueDate = "projects.dueDate";
+export const projects__assignedTo = "projects.assignedTo";
+export const projects__selectAssignee = "projects.selectAssignee";
+export const projects__estimatedHours = "projects.estimatedHours";
+export const projects__selectPhase = "projects.selectPhase";
+export const projects__logTime = "projects.logTime";
+export const projects__noTimeEntries = "projects.noTimeEntries";
+export const projects__totalHoursLogged = "projects.totalHoursLogged";
+export const projects__billable = "projects.billable";
+export const projects__hourlyRate = "projects.hourlyRate";
+export const projects__timeEntryDate = "projects.timeEntryDate";
+export const projects__timeEntryHours = "projects.timeEntryHours";
+export const projects__selectTask = "projects.selectTask";
+export const projects__deletePhaseConfirm = "projects.deletePhaseConfirm";
+export const projects__deleteTaskConfirm = "projects.deleteTaskConfirm";
+export const projects__deleteTimeConfirm = "projects.deleteTimeConfirm";
+export const projects__phaseCreatedSuccess = "projects.phaseCreatedSuccess";
+export const projects__phaseUpdatedSuccess = "projects.phaseUpdatedSuccess";
+export const projects__phaseDeletedSuccess = "projects.phaseDeletedSuccess";
+export const projects__taskCreatedSuccess = "projects.taskCreatedSuccess";
+export const projects__taskUpdatedSuccess = "projects.taskUpdatedSuccess";
+export const projects__taskDeletedSuccess = "projects.taskDeletedSuccess";
+export const projects__timeCreatedSuccess = "projects.timeCreatedSuccess";
+export const projects__timeDeletedSuccess = "projects.timeDeletedSuccess";
+export const reports__title = "reports.title";
+export const reports__description = "reports.description";
+export const reports__export = "reports.export";
+export const reports__exportAs = "reports.exportAs";
+export const reports__exportSuccess = "reports.exportSuccess";
+export const reports__exportedAs = "reports.exportedAs";
+export const reports__exportError = "reports.exportError";
+export const reports__image = "reports.image";
+export const reports__customize = "reports.customize";
+export const reports__customizeDescription = "reports.customizeDescription";
+export const reports__visibleWidgets = "reports.visibleWidgets";
+export const reports__dateRange__label = "reports.dateRange.label";
+export const reports__dateRange__today = "reports.dateRange.today";
+export const reports__dateRange__yesterday = "reports.dateRange.yesterday";
+export const reports__dateRange__7days = "reports.dateRange.7days";
+export const reports__dateRange__30days = "reports.dateRange.30days";
+export const reports__dateRange__90days = "reports.dateRange.90days";
+export const reports__dateRange__thisMonth = "reports.dateRange.thisMonth";
+export const reports__dateRange__lastMonth = "reports.dateRange.lastMonth";
+export const reports__dateRange__thisYear = "reports.dateRange.thisYear";
+export const reports__dateRange__lastYear = "reports.dateRange.lastYear";
+export const reports__dateRange__custom = "reports.dateRange.custom";
+export const reports__compare = "reports.compare";
+export const reports__previousPeriod = "reports.previousPeriod";
+export const reports__lastYear = "reports.lastYear";
+export const reports__vsPrevious = "reports.vsPrevious";
+export const reports__total = "reports.total";
+export const reports__metrics__revenue = "reports.metrics.revenue";
+export const reports__metrics__expenses = "reports.metrics.expenses";
+export const reports__metrics__profit = "reports.metrics.profit";
+export const reports__metrics__invoices = "reports.metrics.invoices";
+export const reports__metrics__customers = "reports.metrics.customers";
+export const reports__metrics__items = "reports.metrics.items";
+export const reports__metrics__transactions = "reports.metrics.transactions";
+export const reports__metrics__receivables = "reports.metrics.receivables";
+export const reports__metrics__payables = "reports.metrics.payables";
+export const reports__charts__revenueTrend = "reports.charts.revenueTrend";
+export const reports__charts__revenueTrendDesc = "reports.charts.revenueTrendDesc";
+export const reports__charts__expensesByCategory = "reports.charts.expensesByCategory";
+export const reports__charts__expensesByCategoryDesc = "reports.charts.expensesByCategoryDesc";
+export const reports__charts__cashFlow = "reports.charts.cashFlow";
+export const reports__charts__cashFlowDesc = "reports.charts.cashFlowDesc";
+export const reports__cashFlow__inflow = "reports.cashFlow.inflow";
+export const reports__cashFlow__outflow = "reports.cashFlow.outflow";
+export const reports__cashFlow__net = "reports.cashFlow.net";
+export const reports__categories__salaries = "reports.categories.salaries";
+export const reports__categories__rent = "reports.categories.rent";
+export const reports__categories__utilities = "reports.categories.utilities";
+export const reports__categories__supplies = "reports.categories.supplies";
+export const reports__categories__other = "reports.categories.other";
+export const reports__tables__topCustomers = "reports.tables.topCustomers";
+export const reports__tables__topCustomersDesc = "reports.tables.topCustomersDesc";
+export const reports__tables__customer = "reports.tables.customer";
+export const reports__tables__revenue = "reports.tables.revenue";
+export const reports__tables__growth = "reports.tables.growth";
+export const reports__comparison__title = "reports.comparison.title";
+export const reports__comparison__description = "reports.comparison.description";
+export const reports__insights__title = "reports.insights.title";
+export const reports__insights__revenueUp = "reports.insights.revenueUp";
+export const reports__insights__revenueUpDesc = "reports.insights.revenueUpDesc";
+export const reports__insights__overdueInvoices = "reports.insights.overdueInvoices";
+export const reports__insights__overdueInvoicesDesc = "reports.insights.overdueInvoicesDesc";
+export const reports__insights__cashFlowPositive = "reports.insights.cashFlowPositive";
+export const reports__insights__cashFlowPositiveDesc = "reports.insights.cashFlowPositiveDesc";
+export const reports__taxReport = "reports.taxReport";
+export const reports__aiAnalytics__title = "reports.aiAnalytics.title";
+export const reports__loadingForecast = "reports.loadingForecast";
+export const reports__failedToLoadForecast = "reports.failedToLoadForecast";
+export const reports__cashFlowForecast = "reports.cashFlowForecast";
+export const reports__projectedCashIn = "reports.projectedCashIn";
+export const reports__projectedCashOut = "reports.projectedCashOut";
+export const reports__netForecast = "reports.netForecast";
+export const reports__cashFlowTrend = "reports.cashFlowTrend";
+export const reports__aiInsights = "reports.aiInsights";
+export const reports__noSpecificInsights = "reports.noSpecificInsights";
+export const reports__insight = "reports.insight";
+export const reports__loadingESGReport = "reports.loadingESGReport";
+export const reports__failedToLoadESGReport = "reports.failedToLoadESGReport";
+export const reports__esgTitle = "reports.esgTitle";
+export const reports__totalCarbon = "reports.totalCarbon";
+export const reports__yearToDate = "reports.yearToDate";
+export const reports__energyUsage = "reports.energyUsage";
+export const reports__emissionsByCategory = "reports.emissionsByCategory";
+export const reports__emissionsTrend = "reports.emissionsTrend";
+export const reports__globalDashboardDesc = "reports.globalDashboardDesc";
+export const reports__totalCash = "reports.totalCash";
+export const reports__totalRevenue = "reports.totalRevenue";
+export const reports__totalExpenses = "reports.totalExpenses";
+export const reports__companyBreakdown = "reports.companyBreakdown";
+export const reports__cash = "reports.cash";
+export const reports__revenue = "reports.revenue";
+export const reports__expenses = "reports.expenses";
+export const ratios__title = "ratios.title";
+export const ratios__description = "ratios.description";
+export const ratios__liquidity = "ratios.liquidity";
+export const ratios__profitability = "ratios.profitability";
+export const ratios__leverage = "ratios.leverage";
+export const ratios__efficiency = "ratios.efficiency";
+export const ratios__totalAssets = "ratios.totalAssets";
+export const ratios__totalLiabilities = "ratios.totalLiabilities";
+export const ratios__revenue = "ratios.revenue";
+export const ratios__netIncome = "ratios.netIncome";
+export const ratios__currentRatio = "ratios.currentRatio";
+export const ratios__currentRatioDesc = "ratios.currentRatioDesc";
+export const ratios__quickRatio = "ratios.quickRatio";
+export const ratios__quickRatioDesc = "ratios.quickRatioDesc";
+export const ratios__workingCapital = "ratios.workingCapital";
+export const ratios__workingCapitalDesc = "ratios.workingCapitalDesc";
+export const ratios__grossMargin = "ratios.grossMargin";
+export const ratios__grossMarginDesc = "ratios.grossMarginDesc";
+export const ratios__netMargin = "ratios.netMargin";
+export const ratios__netMarginDesc = "ratios.netMarginDesc";
+export const ratios__roa = "ratios.roa";
+export const ratios__roaDesc = "ratios.roaDesc";
+export const ratios__roe = "ratios.roe";
+export const ratios__roeDesc = "ratios.roeDesc";
+export const ratios__debtRatio = "ratios.debtRatio";
+export const ratios__debtRatioDesc = "ratios.debtRatioDesc";
+export const ratios__debtToEquity = "ratios.debtToEquity";
+export const ratios__debtToEquityDesc = "ratios.debtToEquityDesc";
+export const ratios__equityRatio = "ratios.equityRatio";
+export const ratios__equityRatioDesc = "ratios.equityRatioDesc";
+export const ratios__assetTurnover = "ratios.assetTurnover";
+export const ratios__assetTurnoverDesc = "ratios.assetTurnoverDesc";
+export const ratios__inventoryTurnover = "ratios.inventoryTurnover";
+export const ratios__inventoryTurnoverDesc = "ratios.inventoryTurnoverDesc";
+export const ratios__daysInventory = "ratios.daysInventory";
+export const ratios__daysInventoryDesc = "ratios.daysInventoryDesc";
+export const ratios__days = "ratios.days";
+export const ratios__benchmark = "ratios.benchmark";
+export const ratios__positive = "ratios.positive";
+export const ratios__legend = "ratios.legend";
+export const ratios__healthy = "ratios.healthy";
+export const ratios__needsAttention = "ratios.needsAttention";
+export const ratios__critical = "ratios.critical";
+export const inventory__inStock = "inventory.inStock";
+export const inventory__lowStock = "inventory.lowStock";
+export const inventory__critical = "inventory.critical";
+export const inventory__outOfStock = "inventory.outOfStock";
+export const inventory__stockHistory = "inventory.stockHistory";
+export const inventory__itemAdded = "inventory.itemAdded";
+export const inventory__itemAddedSuccess = "inventory.itemAddedSuccess";
+export const inventory__addingItem = "inventory.addingItem";
+export const inventory__addItem = "inventory.addItem";
+export const inventory__totalItems = "inventory.totalItems";
+export const inventory__totalValue = "inventory.totalValue";
+export const inventory__totalQuantity = "inventory.totalQuantity";
+export const inventory__selectCategory = "inventory.selectCategory";
+export const inventory__searchPlaceholder = "inventory.searchPlaceholder";
+export const inventory__warehouses__title = "inventory.warehouses.title";
+export const inventory__warehouses__description = "inventory.warehouses.description";
+export const inventory__warehouses__addWarehouse = "inventory.warehouses.addWarehouse";
+export const inventory__warehouses__editWarehouse = "inventory.warehouses.editWarehouse";
+export const inventory__warehouses__code = "inventory.warehouses.code";
+export const inventory__warehouses__name = "inventory.warehouses.name";
+export const inventory__warehouses__location = "inventory.warehouses.location";
+export const inventory__warehouses__status = "inventory.warehouses.status";
+export const inventory__warehouses__active = "inventory.warehouses.active";
+export const inventory__warehouses__inactive = "inventory.warehouses.inactive";
+export const inventory__warehouses__details = "inventory.warehouses.details";
+export const inventory__warehouses__descriptionPlaceholder = "inventory.warehouses.descriptionPlaceholder";
+export const inventory__warehouses__created = "inventory.warehouses.created";
+export const inventory__warehouses__createdDesc = "inventory.warehouses.createdDesc";
+export const inventory__warehouses__updated = "inventory.warehouses.updated";
+export const inventory__warehouses__updatedDesc = "inventory.warehouses.updatedDesc";
+export const inventory__warehouses__deleted = "inventory.warehouses.deleted";
+export const inventory__warehouses__deletedDesc = "inventory.warehouses.deletedDesc";
+export const inventory__warehouses__deleteConfirm = "inventory.warehouses.deleteConfirm";
+export const inventory__warehouses__editDetails = "inventory.warehouses.editDetails";
+export const inventory__adjustments__title = "inventory.adjustments.title";
+export const inventory__adjustments__description = "inventory.adjustments.description";
+export const inventory__adjustments__addAdjustment = "inventory.adjustments.addAdjustment";
+export const inventory__adjustments__editAdjustment = "inventory.adjustments.editAdjustment";
+export const inventory__adjustments__date = "inventory.adjustments.date";
+export const inventory__adjustments__reference = "inventory.adjustments.reference";
+export const inventory__adjustments__warehouse = "inventory.adjustments.warehouse";
+export const inventory__adjustments__reason = "inventory.adjustments.reason";
+export const inventory__adjustments__status = "inventory.adjustments.status";
+export const inventory__adjustments__notes = "inventory.adjustments.notes";
+export const inventory__adjustments__items = "inventory.adjustments.items";
+export const inventory__adjustments__item = "inventory.adjustments.item";
+export const inventory__adjustments__quantity = "inventory.adjustments.quantity";
+export const inventory__adjustments__type = "inventory.adjustments.type";
+export const inventory__adjustments__increase = "inventory.adjustments.increase";
+export const inventory__adjustments__decrease = "inventory.adjustments.decrease";
+export const inventory__adjustments__details = "inventory.adjustments.details";
+export const inventory__adjustments__created = "inventory.adjustments.created";
+export const inventory__adjustments__createdDesc = "inventory.adjustments.createdDesc";
+export const inventory__adjustments__updated = "inventory.adjustments.updated";
+export const inventory__adjustments__updatedDesc = "inventory.adjustments.updatedDesc";
+export const inventory__adjustments__deleted = "inventory.adjustments.deleted";
+export const inventory__adjustments__deletedDesc = "inventory.adjustments.deletedDesc";
+export const inventory__adjustments__deleteConfirm = "inventory.adjustments.deleteConfirm";
+export const inventory__adjustments__selectWarehouse = "inventory.adjustments.selectWarehouse";
+export const inventory__adjustments__selectItem = "inventory.adjustments.selectItem";
+export const inventory__adjustments__selectType = "inventory.adjustments.selectType";
+export const inventory__adjustments__reasonPlaceholder = "inventory.adjustments.reasonPlaceholder";
+export const inventory__valuation__title = "inventory.valuation.title";
+export const inventory__valuation__description = "inventory.valuation.description";
+export const inventory__valuation__totalValue = "inventory.valuation.totalValue";
+export const inventory__valuation__totalItems = "inventory.valuation.totalItems";
+export const inventory__valuation__itemCode = "inventory.valuation.itemCode";
+export const inventory__valuation__itemName = "inventory.valuation.itemName";
+export const inventory__valuation__quantity = "inventory.valuation.quantity";
+export const inventory__valuation__averageCost = "inventory.valuation.averageCost";
+export const inventory__valuation__value = "inventory.valuation.value";
+export const inventory__rawMaterials = "inventory.rawMaterials";
+export const inventory__warehousePlaceholder = "inventory.warehousePlaceholder";
+export const inventory__productName = "inventory.productName";
+export const inventory__reorderPoint = "inventory.reorderPoint";
+export const inventory__unitCost = "inventory.unitCost";
+export const inventory__stockLevelsAsOf = "inventory.stockLevelsAsOf";
+export const inventory__locationOptional = "inventory.locationOptional";
+export const inventory__currentQuantity = "inventory.currentQuantity";
+export const inventory__reorderQuantity = "inventory.reorderQuantity";
+export const inventory__lowStockAlert = "inventory.lowStockAlert";
+export const inventory__itemsNeedReorder = "inventory.itemsNeedReorder";
+export const inventory__uniqueSkus = "inventory.uniqueSkus";
+export const inventory__unitsInStock = "inventory.unitsInStock";
+export const inventory__stockMovements = "inventory.stockMovements";
+export const inventory__recentStockMovements = "inventory.recentStockMovements";
+export const inventory__inventoryValuationMethod = "inventory.inventoryValuationMethod";
+export const inventory__fifo = "inventory.fifo";
+export const inventory__changeMethod = "inventory.changeMethod";
+export const inventory__valuationByCategory = "inventory.valuationByCategory";
+export const inventory__reorder = "inventory.reorder";
+export const inventory__failedToAddItem = "inventory.failedToAddItem";
+export const inventory__location = "inventory.location";
+export const inventory__skuPlaceholder = "inventory.skuPlaceholder";
+export const inventory__productNamePlaceholder = "inventory.productNamePlaceholder";
+export const inventory__purchase = "inventory.purchase";
+export const inventory__sale = "inventory.sale";
+export const inventory__adjustment = "inventory.adjustment";
+export const inventory__transferIn = "inventory.transferIn";
+export const inventory__transferOut = "inventory.transferOut";
+export const inventory__batchLotNumbers = "inventory.batchLotNumbers";
+export const inventory__warehouse = "inventory.warehouse";
+export const inventory__noBatches = "inventory.noBatches";
+export const inventory__selectWarehouse = "inventory.selectWarehouse";
+export const inventory__voucherCreated = "inventory.voucherCreated";
+export const inventory__allocated = "inventory.allocated";
+export const inventory__costsDistributed = "inventory.costsDistributed";
+export const inventory__posted = "inventory.posted";
+export const inventory__landedCostsApplied = "inventory.landedCostsApplied";
+export const inventory__billAdded = "inventory.billAdded";
+export const inventory__freightBillAdded = "inventory.freightBillAdded";
+export const inventory__itemsAdded = "inventory.itemsAdded";
+export const inventory__stockMovementsAdded = "inventory.stockMovementsAdded";
+export const inventory__newLandedCostVoucher = "inventory.newLandedCostVoucher";
+export const inventory__createAllocationRecord = "inventory.createAllocationRecord";
+export const inventory__allocateCosts = "inventory.allocateCosts";
+export const inventory__post = "inventory.post";
+export const inventory__createDraft = "inventory.createDraft";
+export const inventory__allocationMethod = "inventory.allocationMethod";
+export const inventory__byValue = "inventory.byValue";
+export const inventory__byQuantity = "inventory.byQuantity";
+export const inventory__importShipmentPlaceholder = "inventory.importShipmentPlaceholder";
+export const inventory__totalFreight = "inventory.totalFreight";
+export const inventory__itemsValue = "inventory.itemsValue";
+export const inventory__freightCustomsBills = "inventory.freightCustomsBills";
+export const inventory__addBillsDescription = "inventory.addBillsDescription";
+export const inventory__addBill = "inventory.addBill";
+export const inventory__addFreightBill = "inventory.addFreightBill";
+export const inventory__selectBill = "inventory.selectBill";
+export const inventory__selectBillPlaceholder = "inventory.selectBillPlaceholder";
+export const inventory__amountToAllocate = "inventory.amountToAllocate";
+export const inventory__billNumber = "inventory.billNumber";
+export const inventory__noBillsAdded = "inventory.noBillsAdded";
+export const inventory__itemsToAllocate = "inventory.itemsToAllocate";
+export const inventory__selectGRNDescription = "inventory.selectGRNDescription";
+export const inventory__addItems = "inventory.addItems";
+export const inventory__selectStockReceipts = "inventory.selectStockReceipts";
+export const inventory__addSelectedItems = "inventory.addSelectedItems";
+export const inventory__originalCost = "inventory.originalCost";
+export const inventory__newUnitCost = "inventory.newUnitCost";
+export const inventory__noItemsAdded = "inventory.noItemsAdded";
+export const inventory__landedCostVouchers = "inventory.landedCostVouchers";
+export const inventory__landedCostDescription = "inventory.landedCostDescription";
+export const inventory__newVoucher = "inventory.newVoucher";
+export const inventory__vouchers = "inventory.vouchers";
+export const inventory__noLandedCostVouchers = "inventory.noLandedCostVouchers";
+export const inventory__method = "inventory.method";
+export const inventory__selectItem = "inventory.selectItem";
+export const inventory__batch = "inventory.batch";
+export const inventory__exp = "inventory.exp";
+export const inventory__transferUpdated = "inventory.transferUpdated";
+export const inventory__transferUpdatedDescription = "inventory.transferUpdatedDescription";
+export const inventory__cannotEdit = "inventory.cannotEdit";
+export const inventory__onlyDraftEditable = "inventory.onlyDraftEditable";
+export const inventory__editTransfer = "inventory.editTransfer";
+export const inventory__editTransferDescription = "inventory.editTransferDescription";
+export const inventory__transferDetails = "inventory.transferDetails";
+export const inventory__selectSource = "inventory.selectSource";
+export const inventory__selectDestination = "inventory.selectDestination";
+export const inventory__transferCreated = "inventory.transferCreated";
+export const inventory__transferCreatedDescription = "inventory.transferCreatedDescription";
+export const inventory__createTransferDescription = "inventory.createTransferDescription";
+export const inventory__createTransfer = "inventory.createTransfer";
+export const inventory__transferCompleted = "inventory.transferCompleted";
+export const inventory__transferDeleted = "inventory.transferDeleted";
+export const inventory__stockTransfers = "inventory.stockTransfers";
+export const inventory__stockTransfersDescription = "inventory.stockTransfersDescription";
+export const inventory__transferHistory = "inventory.transferHistory";
+export const inventory__deleteTransferTitle = "inventory.deleteTransferTitle";
+export const inventory__deleteTransferDescription = "inventory.deleteTransferDescription";
+export const inventory__approveTransferTitle = "inventory.approveTransferTitle";
+export const inventory__approveTransferDescription = "inventory.approveTransferDescription";
+export const inventory__approveAndTransfer = "inventory.approveAndTransfer";
+export const inventory__noTransfersFound = "inventory.noTransfersFound";
+export const inventory__fromLastMonth = "inventory.fromLastMonth";
+export const hr__departments = "hr.departments";
+export const hr__addDepartment = "hr.addDepartment";
+export const hr__editDepartment = "hr.editDepartment";
+export const hr__departmentName = "hr.departmentName";
+export const hr__name = "hr.name";
+export const hr__noDepartments = "hr.noDepartments";
+export const hr__departmentCreateSuccess = "hr.departmentCreateSuccess";
+export const hr__departmentUpdateSuccess = "hr.departmentUpdateSuccess";
+export const hr__employees = "hr.employees";
+export const hr__addEmployee = "hr.addEmployee";
+export const hr__editEmployee = "hr.editEmployee";
+export const hr__firstName = "hr.firstName";
+export const hr__lastName = "hr.lastName";
+export const hr__department = "hr.department";
+export const hr__jobTitle = "hr.jobTitle";
+export const hr__hireDate = "hr.hireDate";
+export const hr__salary = "hr.salary";
+export const hr__contact = "hr.contact";
+export const hr__role = "hr.role";
+export const hr__noEmployees = "hr.noEmployees";
+export const hr__employeeCreateSuccess = "hr.employeeCreateSuccess";
+export const hr__employeeUpdateSuccess = "hr.employeeUpdateSuccess";
+export const hr__payroll = "hr.payroll";
+export const hr__newPayrollRun = "hr.newPayrollRun";
+export const hr__periodStart = "hr.periodStart";
+export const hr__periodEnd = "hr.periodEnd";
+export const hr__paymentDate = "hr.paymentDate";
+export const hr__generate = "hr.generate";
+export const hr__history = "hr.history";
+export const hr__noRuns = "hr.noRuns";
+export const hr__payslips = "hr.payslips";
+export const hr__selectRun = "hr.selectRun";
+export const hr__employee = "hr.employee";
+export const hr__basic = "hr.basic";
+export const hr__allowances = "hr.allowances";
+export const hr__deductions = "hr.deductions";
+export const hr__net = "hr.net";
+export const hr__selectRunPrompt = "hr.selectRunPrompt";
+export const hr__payrollRunSuccess = "hr.payrollRunSuccess";
+export const status__draft = "status.draft";
+export const status__pending = "status.pending";
+export const status__sent = "status.sent";
+export const status__viewed = "status.viewed";
+export const status__paid = "status.paid";
+export const status__partial = "status.partial";
+export const status__overdue = "status.overdue";
+export const status__cancelled = "status.cancelled";
+export const status__void = "status.void";
+export const status__active = "status.active";
+export const status__inactive = "status.inactive";
+export const status__processing = "status.processing";
+export const status__completed = "status.completed";
+export const status__failed = "status.failed";
+export const status__connected = "status.connected";
+export const status__disconnected = "status.disconnected";
+export const status__planned = "status.planned";
+export const status__inProgress = "status.inProgress";
+export const contacts__title = "contacts.title";
+export const contacts__subtitle = "contacts.subtitle";
+export const contacts__customers = "contacts.customers";
+export const contacts__suppliers = "contacts.suppliers";
+export const contacts__both = "contacts.both";
+export const contacts__all = "contacts.all";
+export const contacts__addContact = "contacts.addContact";
+export const contacts__editContact = "contacts.editContact";
+export const contacts__deleteContact = "contacts.deleteContact";
+export const contacts__addCustomer = "contacts.addCustomer";
+export const contacts__addSupplier = "contacts.addSupplier";
+export const contacts__companyName = "contacts.companyName";
+export const contacts__contactName = "contacts.contactName";
+export const contacts__displayName = "contacts.displayName";
+export const contacts__contactCode = "contacts.contactCode";
+export const contacts__contactType = "contacts.contactType";
+export const contacts__email = "contacts.email";
+export const contacts__phone = "contacts.phone";
+export const contacts__website = "contacts.website";
+export const contacts__address = "contacts.address";
+export const contacts__city = "contacts.city";
+export const contacts__state = "contacts.state";
+export const contacts__country = "contacts.country";
+export const contacts__postalCode = "contacts.postalCode";
+export const contacts__taxNumber = "contacts.taxNumber";
+export const contacts__registrationNumber = "contacts.registrationNumber";
+export const contacts__paymentTerms = "contacts.paymentTerms";
+export const contacts__paymentTermsDays = "contacts.paymentTermsDays";
+export const contacts__creditLimit = "contacts.creditLimit";
+export const contacts__currency = "contacts.currency";
+export const contacts__isActive = "contacts.isActive";
+export const contacts__customer = "contacts.customer";
+export const contacts__supplier = "contacts.supplier";
+export const contacts__noContacts = "contacts.noContacts";
+export const contacts__noContactsDesc = "contacts.noContactsDesc";
+export const contacts__contactCreated = "contacts.contactCreated";
+export const contacts__contactCreatedDesc = "contacts.contactCreatedDesc";
+export const contacts__contactUpdated = "contacts.contactUpdated";
+export const contacts__contactUpdatedDesc = "contacts.contactUpdatedDesc";
+export const contacts__contactDeleted = "contacts.contactDeleted";
+export const contacts__contactDeletedDesc = "contacts.contactDeletedDesc";
+export const contacts__dueOnReceipt = "contacts.dueOnReceipt";
+export const contacts__net7 = "contacts.net7";
+export const contacts__net15 = "contacts.net15";
+export const contacts__net30 = "contacts.net30";
+export const contacts__net45 = "contacts.net45";
+export const contacts__net60 = "contacts.net60";
+export const contacts__net90 = "contacts.net90";
+export const contacts__activeContactDesc = "contacts.activeContactDesc";
+export const contacts__companyNamePlaceholder = "contacts.companyNamePlaceholder";
+export const contacts__viewStatement = "contacts.viewStatement";
+export const contacts__linkedCompanyHelp = "contacts.linkedCompanyHelp";
+export const items__title = "items.title";
+export const items__subtitle = "items.subtitle";
+export const items__products = "items.products";
+export const items__services = "items.services";
+export const items__all = "items.all";
+export const items__addItem = "items.addItem";
+export const items__editItem = "items.editItem";
+export const items__deleteItem = "items.deleteItem";
+export const items__addProduct = "items.addProduct";
+export const items__addService = "items.addService";
+export const items__itemName = "items.itemName";
+export const items__itemCode = "items.itemCode";
+export const items__itemType = "items.itemType";
+export const items__product = "items.product";
+export const items__service = "items.service";
+export const items__description = "items.description";
+export const items__category = "items.category";
+export const items__unit = "items.unit";
+export const items__barcode = "items.barcode";
+export const items__salePrice = "items.salePrice";
+export const items__purchasePrice = "items.purchasePrice";
+export const items__unitPrice = "items.unitPrice";
+export const items__stockQuantity = "items.stockQuantity";
+export const items__minimumStock = "items.minimumStock";
+export const items__reorderLevel = "items.reorderLevel";
+export const items__supplier = "items.supplier";
+export const items__taxable = "items.taxable";
+export const items__isActive = "items.isActive";
+export const items__isSellable = "items.isSellable";
+export const items__isPurchasable = "items.isPurchasable";
+export const items__trackInventory = "items.trackInventory";
+export const items__inStock = "items.inStock";
+export const items__outOfStock = "items.outOfStock";
+export const items__lowStock = "items.lowStock";
+export const items__salesAccount = "items.salesAccount";
+export const items__purchaseAccount = "items.purchaseAccount";
+export const items__inventoryAccount = "items.inventoryAccount";
+export const items__defaultTax = "items.defaultTax";
+export const items__noItems = "items.noItems";
+export const items__noItemsDesc = "items.noItemsDesc";
+export const items__itemCreated = "items.itemCreated";
+export const items__itemCreatedDesc = "items.itemCreatedDesc";
+export const items__itemUpdated = "items.itemUpdated";
+export const items__itemUpdatedDesc = "items.itemUpdatedDesc";
+export const items__itemDeleted = "items.itemDeleted";
+export const items__itemDeletedDesc = "items.itemDeletedDesc";
+export const items__piece = "items.piece";
+export const items__kg = "items.kg";
+export const items__liter = "items.liter";
+export const items__meter = "items.meter";
+export const items__hour = "items.hour";
+export const items__day = "items.day";
+export const items__box = "items.box";
+export const items__pack = "items.pack";
+export const items__dozen = "items.dozen";
+export const items__trackInventoryDesc = "items.trackInventoryDesc";
+export const items__units__piece = "items.units.piece";
+export const items__units__kg = "items.units.kg";
+export const items__units__liter = "items.units.liter";
+export const items__units__meter = "items.units.meter";
+export const items__units__hour = "items.units.hour";
+export const items__units__day = "items.units.day";
+export const items__units__box = "items.units.box";
+export const items__units__pack = "items.units.pack";
+export const items__units__dozen = "items.units.dozen";
+export const items__categories__electronics = "items.categories.electronics";
+export const items__categories__furniture = "items.categories.furniture";
+export const items__categories__clothing = "items.categories.clothing";
+export const items__categories__food = "items.categories.food";
+export const items__categories__stationery = "items.categories.stationery";
+export const items__categories__services = "items.categories.services";
+export const items__categories__consulting = "items.categories.consulting";
+export const items__categories__maintenance = "items.categories.maintenance";
+export const items__categories__other = "items.categories.other";
+export const items__trackingType = "items.trackingType";
+export const items__tracking__none = "items.tracking.none";
+export const items__tracking__noneDesc = "items.tracking.noneDesc";
+export const items__tracking__batch = "items.tracking.batch";
+export const items__tracking__batchDesc = "items.tracking.batchDesc";
+export const items__tracking__serial = "items.tracking.serial";
+export const items__tracking__serialDesc = "items.tracking.serialDesc";
+export const items__tracking__batchHint = "items.tracking.batchHint";
+export const items__tracking__serialHint = "items.tracking.serialHint";
+export const items__tracking__noneHint = "items.tracking.noneHint";
+export const items__warehouseHint = "items.warehouseHint";
+export const items__item = "items.item";
+export const accounts__title = "accounts.title";
+export const accounts__subtitle = "accounts.subtitle";
+export const accounts__addAccount = "accounts.addAccount";
+export const accounts__editAccount = "accounts.editAccount";
+export const accounts__deleteAccount = "accounts.deleteAccount";
+export const accounts__assets = "accounts.assets";
+export const accounts__liabilities = "accounts.liabilities";
+export const accounts__equity = "accounts.equity";
+export const accounts__revenue = "accounts.revenue";
+export const accounts__income = "accounts.income";
+export const accounts__expenses = "accounts.expenses";
+export const accounts__expense = "accounts.expense";
+export const accounts__accountCode = "accounts.accountCode";
+export const accounts__accountName = "accounts.accountName";
+export const accounts__accountNameAr = "accounts.accountNameAr";
+export const accounts__accountNameArPlaceholder = "accounts.accountNameArPlaceholder";
+export const accounts__accountType = "accounts.accountType";
+export const accounts__accountSubtype = "accounts.accountSubtype";
+export const accounts__parentAccount = "accounts.parentAccount";
+export const accounts__balance = "accounts.balance";
+export const accounts__debit = "accounts.debit";
+export const accounts__credit = "accounts.credit";
+export const accounts__isActive = "accounts.isActive";
+export const accounts__currentAsset = "accounts.currentAsset";
+export const accounts__cash = "accounts.cash";
+export const accounts__accountsReceivable = "accounts.accountsReceivable";
+export const accounts__inventory = "accounts.inventory";
+export const accounts__fixedAsset = "accounts.fixedAsset";
+export const accounts__otherAsset = "accounts.otherAsset";
+export const accounts__currentLiability = "accounts.currentLiability";
+export const accounts__accountsPayable = "accounts.accountsPayable";
+export const accounts__creditCard = "accounts.creditCard";
+export const accounts__longTermLiability = "accounts.longTermLiability";
+export const accounts__otherLiability = "accounts.otherLiability";
+export const accounts__ownersEquity = "accounts.ownersEquity";
+export const accounts__retainedEarnings = "accounts.retainedEarnings";
+export const accounts__shareCapital = "accounts.shareCapital";
+export const accounts__dividends = "accounts.dividends";
+export const accounts__salesRevenue = "accounts.salesRevenue";
+export const accounts__serviceRevenue = "accounts.serviceRevenue";
+export const accounts__otherRevenue = "accounts.otherRevenue";
+export const accounts__interestIncome = "accounts.interestIncome";
+export const accounts__costOfGoods = "accounts.costOfGoods";
+export const accounts__operatingExpense = "accounts.operatingExpense";
+export const accounts__salaryExpense = "accounts.salaryExpense";
+export const accounts__rentExpense = "accounts.rentExpense";
+export const accounts__utilityExpense = "accounts.utilityExpense";
+export const accounts__otherExpense = "accounts.otherExpense";
+export const accounts__noAccounts = "accounts.noAccounts";
+export const accounts__noAccountsDesc = "accounts.noAccountsDesc";
+export const accounts__accountCreated = "accounts.accountCreated";
+export const accounts__accountCreatedDesc = "accounts.accountCreatedDesc";
+export const accounts__accountUpdated = "accounts.accountUpdated";
+export const accounts__accountUpdatedDesc = "accounts.accountUpdatedDesc";
+export const accounts__accountDeleted = "accounts.accountDeleted";
+export const accounts__accountDeletedDesc = "accounts.accountDeletedDesc";
+export const companies__title = "companies.title";
+export const companies__subtitle = "companies.subtitle";
+export const companies__addCompany = "companies.addCompany";
+export const companies__editCompany = "companies.editCompany";
+export const companies__deleteCompany = "companies.deleteCompany";
+export const companies__companyName = "companies.companyName";
+export const companies__legalName = "companies.legalName";
+export const companies__taxNumber = "companies.taxNumber";
+export const companies__registrationNumber = "companies.registrationNumber";
+export const companies__baseCurrency = "companies.baseCurrency";
+export const companies__fiscalYearStart = "companies.fiscalYearStart";
+export const companies__dateFormat = "companies.dateFormat";
+export const companies__numberFormat = "companies.numberFormat";
+export const companies__defaultCompany = "companies.defaultCompany";
+export const companies__activeCompany = "companies.activeCompany";
+export const companies__noCompanies = "companies.noCompanies";
+export const companies__noCompaniesDesc = "companies.noCompaniesDesc";
+export const companies__confirmDelete = "companies.confirmDelete";
+export const companies__deleteWarning = "companies.deleteWarning";
+export const companies__companyDetails = "companies.companyDetails";
+export const companies__basicInfo = "companies.basicInfo";
+export const companies__financialSettings = "companies.financialSettings";
+export const companies__formatSettings = "companies.formatSettings";
+export const companies__companyInfo = "companies.companyInfo";
+export const companies__businessRegistration = "companies.businessRegistration";
+export const companies__taxInfo = "companies.taxInfo";
+export const companies__bankingInfo = "companies.bankingInfo";
+export const companies__industry = "companies.industry";
+export const companies__fiscalYear = "companies.fiscalYear";
+export const companies__timezone = "companies.timezone";
+export const companies__website = "companies.website";
+export const companies__switchCompany = "companies.switchCompany";
+export const companies__manage = "companies.manage";
+export const companies__noCompany = "companies.noCompany";
+export const settings__general__title = "settings.general.title";
+export const settings__general__description = "settings.general.description";
+export const settings__general__companySettings = "settings.general.companySettings";
+export const settings__general__systemSettings = "settings.general.systemSettings";
+export const settings__general__notifications = "settings.general.notifications";
+export const settings__general__preferences = "settings.general.preferences";
+export const settings__general__timezone = "settings.general.timezone";
+export const settings__general__language = "settings.general.language";
+export const settings__general__theme = "settings.general.theme";
+export const settings__general__lightMode = "settings.general.lightMode";
+export const settings__general__darkMode = "settings.general.darkMode";
+export const settings__general__autoMode = "settings.general.autoMode";
+export const settings__tabs__company = "settings.tabs.company";
+export const settings__tabs__regional = "settings.tabs.regional";
+export const settings__tabs__invoice = "settings.tabs.invoice";
+export const settings__tabs__notifications = "settings.tabs.notifications";
+export const settings__tabs__security = "settings.tabs.security";
+export const settings__company__title = "settings.company.title";
+export const settings__company__description = "settings.company.description";
+export const settings__company__logo = "settings.company.logo";
+export const settings__company__uploadLogo = "settings.company.uploadLogo";
+export const settings__company__logoHelp = "settings.company.logoHelp";
+export const settings__company__name = "settings.company.name";
+export const settings__company__taxId = "settings.company.taxId";
+export const settings__company__email = "settings.company.email";
+export const settings__company__phone = "settings.company.phone";
+export const settings__company__address = "settings.company.address";
+export const settings__company__city = "settings.company.city";
+export const settings__company__country = "settings.company.country";
+export const settings__company__zip = "settings.company.zip";
+export const settings__company__companyDetails = "settings.company.companyDetails";
+export const settings__company__taxNumber = "settings.company.taxNumber";
+export const settings__regional__title = "settings.regional.title";
+export const settings__regional__description = "settings.regional.description";
+export const settings__regional__currency = "settings.regional.currency";
+export const settings__regional__dateFormat = "settings.regional.dateFormat";
+export const settings__regional__timeZone = "settings.regional.timeZone";
+export const settings__regional__fiscalYearStart = "settings.regional.fiscalYearStart";
+export const settings__invoice__title = "settings.invoice.title";
+export const settings__invoice__description = "settings.invoice.description";
+export const settings__invoice__invoiceNumbering = "settings.invoice.invoiceNumbering";
+export const settings__invoice__prefix = "settings.invoice.prefix";
+export const settings__invoice__prefixHelp = "settings.invoice.prefixHelp";
+export const settings__invoice__nextNumber = "settings.invoice.nextNumber";
+export const settings__invoice__nextNumberHelp = "settings.invoice.nextNumberHelp";
+export const settings__invoice__quotationNumbering = "settings.invoice.quotationNumbering";
+export const settings__invoice__quotePrefix = "settings.invoice.quotePrefix";
+export const settings__invoice__quotePrefixHelp = "settings.invoice.quotePrefixHelp";
+export const settings__invoice__nextQuoteNumber = "settings.invoice.nextQuoteNumber";
+export const settings__invoice__nextQuoteNumberHelp = "settings.invoice.nextQuoteNumberHelp";
+export const settings__invoice__quoteValidityDays = "settings.invoice.quoteValidityDays";
+export const settings__invoice__quoteValidityHelp = "settings.invoice.quoteValidityHelp";
+export const settings__invoice__days = "settings.invoice.days";
+export const settings__invoice__paymentSettings = "settings.invoice.paymentSettings";
+export const settings__invoice__paymentTerms = "settings.invoice.paymentTerms";
+export const settings__invoice__taxRate = "settings.invoice.taxRate";
+export const settings__notifications__title = "settings.notifications.title";
+export const settings__notifications__description = "settings.notifications.description";
+export const settings__notifications__email = "settings.notifications.email";
+export const settings__notifications__emailDesc = "settings.notifications.emailDesc";
+export const settings__notifications__sms = "settings.notifications.sms";
+export const settings__notifications__smsDesc = "settings.notifications.smsDesc";
+export const settings__notifications__invoiceReminders = "settings.notifications.invoiceReminders";
+export const settings__notifications__invoiceRemindersDesc = "settings.notifications.invoiceRemindersDesc";
+export const settings__notifications__paymentAlerts = "settings.notifications.paymentAlerts";
+export const settings__notifications__paymentAlertsDesc = "settings.notifications.paymentAlertsDesc";
+export const settings__notifications__lowStockAlerts = "settings.notifications.lowStockAlerts";
+export const settings__notifications__lowStockAlertsDesc = "settings.notifications.lowStockAlertsDesc";
+export const settings__security__title = "settings.security.title";
+export const settings__security__description = "settings.security.description";
+export const settings__security__2fa = "settings.security.2fa";
+export const settings__security__2faDesc = "settings.security.2faDesc";
+export const settings__security__ipRestriction = "settings.security.ipRestriction";
+export const settings__security__ipRestrictionDesc = "settings.security.ipRestrictionDesc";
+export const settings__security__sessionTimeout = "settings.security.sessionTimeout";
+export const settings__security__passwordExpiry = "settings.security.passwordExpiry";
+export const settings__defaultAccounts = "settings.defaultAccounts";
+export const settings__defaultAccountsDescription = "settings.defaultAccountsDescription";
+export const settings__defaultAccountsSaved = "settings.defaultAccountsSaved";
+export const settings__salesRevenue = "settings.salesRevenue";
+export const settings__salesRevenueDesc = "settings.salesRevenueDesc";
+export const settings__defaultSalesAccount = "settings.defaultSalesAccount";
+export const settings__salesAccountHint = "settings.salesAccountHint";
+export const settings__defaultReceivableAccount = "settings.defaultReceivableAccount";
+export const settings__receivableAccountHint = "settings.receivableAccountHint";
+export const settings__purchasesExpenses = "settings.purchasesExpenses";
+export const settings__purchasesExpensesDesc = "settings.purchasesExpensesDesc";
+export const settings__defaultPurchaseAccount = "settings.defaultPurchaseAccount";
+export const settings__purchaseAccountHint = "settings.purchaseAccountHint";
+export const settings__defaultPayableAccount = "settings.defaultPayableAccount";
+export const settings__payableAccountHint = "settings.payableAccountHint";
+export const settings__defaultExpenseAccount = "settings.defaultExpenseAccount";
+export const settings__expenseAccountHint = "settings.expenseAccountHint";
+export const settings__inventory = "settings.inventory";
+export const settings__inventoryDesc = "settings.inventoryDesc";
+export const settings__defaultInventoryAccount = "settings.defaultInventoryAccount";
+export const settings__inventoryAccountHint = "settings.inventoryAccountHint";
+export const settings__banking = "settings.banking";
+export const settings__bankingDesc = "settings.bankingDesc";
+export const settings__defaultBankAccount = "settings.defaultBankAccount";
+export const settings__bankAccountHint = "settings.bankAccountHint";
+export const settings__defaultCashAccount = "settings.defaultCashAccount";
+export const settings__cashAccountHint = "settings.cashAccountHint";
+export const settings__users__title = "settings.users.title";
+export const settings__users__description = "settings.users.description";
+export const settings__users__addUser = "settings.users.addUser";
+export const settings__users__editUser = "settings.users.editUser";
+export const settings__users__role = "settings.users.role";
+export const settings__users__permissions = "settings.users.permissions";
+export const settings__users__lastLogin = "settings.users.lastLogin";
+export const settings__users__totalUsers = "settings.users.totalUsers";
+export const settings__users__activeUsers = "settings.users.activeUsers";
+export const settings__users__roles__admin = "settings.users.roles.admin";
+export const settings__users__roles__accountant = "settings.users.roles.accountant";
+export const settings__users__roles__manager = "settings.users.roles.manager";
+export const settings__users__roles__user = "settings.users.roles.user";
+export const settings__users__roles__viewer = "settings.users.roles.viewer";
+export const settings__users__userCreated = "settings.users.userCreated";
+export const settings__users__userCreatedSuccess = "settings.users.userCreatedSuccess";
+export const settings__users__userUpdated = "settings.users.userUpdated";
+export const settings__users__userUpdatedSuccess = "settings.users.userUpdatedSuccess";
+export const settings__users__userDeleted = "settings.users.userDeleted";
+export const settings__users__userDeletedSuccess = "settings.users.userDeletedSuccess";
+export const settings__users__createError = "settings.users.createError";
+export const settings__users__updateError = "settings.users.updateError";
+export const settings__users__deleteError = "settings.users.deleteError";
+export const settings__users__fillRequiredFields = "settings.users.fillRequiredFields";
+export const settings__users__confirmDeleteUser = "settings.users.confirmDeleteUser";
+export const settings__users__passwordReset = "settings.users.passwordReset";
+export const settings__users__passwordResetSent = "settings.users.passwordResetSent";
+export const settings__users__statusUpdated = "settings.users.statusUpdated";
+export const settings__users__statusChangedTo = "settings.users.statusChangedTo";
+export const settings__users__usersAndRoles = "settings.users.usersAndRoles";
+export const settings__users__manageUserAccounts = "settings.users.manageUserAccounts";
+export const settings__users__allRegisteredUsers = "settings.users.allRegisteredUsers";
+export const settings__users__currentlyActive = "settings.users.currentlyActive";
+export const settings__users__definedRoles = "settings.users.definedRoles";
+export const settings__users__lastActive = "settings.users.lastActive";
+export const settings__users__mostRecentLogin = "settings.users.mostRecentLogin";
+export const settings__language__title = "settings.language.title";
+export const settings__language__description = "settings.language.description";
+export const settings__language__selectLanguage = "settings.language.selectLanguage";
+export const settings__language__currentLanguage = "settings.language.currentLanguage";
+export const settings__language__addLanguage = "settings.language.addLanguage";
+export const settings__language__languageConfig = "settings.language.languageConfig";
+export const settings__language__defaultLanguage = "settings.language.defaultLanguage";
+export const settings__language__defaultLanguageDesc = "settings.language.defaultLanguageDesc";
+export const settings__language__fallbackLanguage = "settings.language.fallbackLanguage";
+export const settings__language__fallbackLanguageDesc = "settings.language.fallbackLanguageDesc";
+export const settings__language__autoDetect = "settings.language.autoDetect";
+export const settings__language__autoDetectDesc = "settings.language.autoDetectDesc";
+export const settings__language__dateFormatByLanguage = "settings.language.dateFormatByLanguage";
+export const settings__language__dateFormatByLanguageDesc = "settings.language.dateFormatByLanguageDesc";
+export const settings__language__currencyByLanguage = "settings.language.currencyByLanguage";
+export const settings__language__currencyByLanguageDesc = "settings.language.currencyByLanguageDesc";
+export const settings__language__saveConfig = "settings.language.saveConfig";
+export const settings__language__languageStatusUpdated = "settings.language.languageStatusUpdated";
+export const settings__language__defaultLanguageUpdated = "settings.language.defaultLanguageUpdated";
+export const settings__language__translationsExported = "settings.language.translationsExported";
+export const settings__language__translationsImported = "settings.language.translationsImported";
+export const settings__language__openingAddDialog = "settings.language.openingAddDialog";
+export const settings__language__settingsUpdated = "settings.language.settingsUpdated";
+export const settings__language__saveError = "settings.language.saveError";
+export const settings__ai__title = "settings.ai.title";
+export const settings__ai__description = "settings.ai.description";
+export const settings__ai__configuredProviders = "settings.ai.configuredProviders";
+export const settings__ai__configuredProvidersDesc = "settings.ai.configuredProvidersDesc";
+export const settings__ai__addProvider = "settings.ai.addProvider";
+export const settings__ai__editProvider = "settings.ai.editProvider";
+export const settings__ai__formHelp = "settings.ai.formHelp";
+export const settings__ai__keyHint = "settings.ai.keyHint";
+export const settings__ai__defaultModel = "settings.ai.defaultModel";
+export const settings__ai__defaultModelHint = "settings.ai.defaultModelHint";
+export const settings__ai__loadModels = "settings.ai.loadModels";
+export const settings__ai__chooseDefaultModel = "settings.ai.chooseDefaultModel";
+export const settings__ai__embeddingsModel = "settings.ai.embeddingsModel";
+export const settings__ai__embeddingsModelHint = "settings.ai.embeddingsModelHint";
+export const settings__ai__chooseEmbeddingsModel = "settings.ai.chooseEmbeddingsModel";
+export const settings__ai__visionModel = "settings.ai.visionModel";
+export const settings__ai__visionModelHint = "settings.ai.visionModelHint";
+export const settings__ai__chooseVisionModel = "settings.ai.chooseVisionModel";
+export const settings__ai__failedToLoadModels = "settings.ai.failedToLoadModels";
+export const settings__ai__failedToSaveProvider = "settings.ai.failedToSaveProvider";
+export const settings__ai__providerDeleted = "settings.ai.providerDeleted";
+export const settings__ai__failedToDelete = "settings.ai.failedToDelete";
+export const settings__ai__selectProvider = "settings.ai.selectProvider";
+export const settings__ai__enterLabel = "settings.ai.enterLabel";
+export const settings__ai__enterBaseUrl = "settings.ai.enterBaseUrl";
+export const settings__ai__enterApiKey = "settings.ai.enterApiKey";
+export const settings__ai__enterOrgId = "settings.ai.enterOrgId";
+export const settings__ai__selectModel = "settings.ai.selectModel";
+export const settings__ai__ollamaHint = "settings.ai.ollamaHint";
+export const settings__ai__lmstudioHint = "settings.ai.lmstudioHint";
+export const settings__ai__localHint = "settings.ai.localHint";
+export const settings__ai__customHint = "settings.ai.customHint";
+export const settings__ai__localProvidersNote = "settings.ai.localProvidersNote";
+export const settings__currencies__title = "settings.currencies.title";
+export const settings__currencies__description = "settings.currencies.description";
+export const settings__currencies__activeCurrencies = "settings.currencies.activeCurrencies";
+export const settings__currencies__activeCurrenciesDesc = "settings.currencies.activeCurrenciesDesc";
+export const settings__currencies__exchangeRates = "settings.currencies.exchangeRates";
+export const settings__currencies__exchangeRatesDesc = "settings.currencies.exchangeRatesDesc";
+export const settings__currencies__addRate = "settings.currencies.addRate";
+export const settings__currencies__addExchangeRate = "settings.currencies.addExchangeRate";
+export const settings__currencies__addRateDesc = "settings.currencies.addRateDesc";
+export const settings__currencies__code = "settings.currencies.code";
+export const settings__currencies__name = "settings.currencies.name";
+export const settings__currencies__symbol = "settings.currencies.symbol";
+export const settings__currencies__rate = "settings.currencies.rate";
+export const settings__currencies__fetchLiveRate = "settings.currencies.fetchLiveRate";
+export const settings__currencies__rateAddedSuccess = "settings.currencies.rateAddedSuccess";
+export const settings__currencies__rateAddError = "settings.currencies.rateAddError";
+export const settings__currencies__liveRateSuccess = "settings.currencies.liveRateSuccess";
+export const settings__currencies__liveRateError = "settings.currencies.liveRateError";
+export const settings__currencies__selectCurrencyFirst = "settings.currencies.selectCurrencyFirst";
+export const settings__currencies__rateLabel = "settings.currencies.rateLabel";
+export const settings__currencies__USD = "settings.currencies.USD";
+export const settings__currencies__EUR = "settings.currencies.EUR";
+export const settings__currencies__GBP = "settings.currencies.GBP";
+export const settings__currencies__JPY = "settings.currencies.JPY";
+export const settings__currencies__CHF = "settings.currencies.CHF";
+export const settings__currencies__CAD = "settings.currencies.CAD";
+export const settings__currencies__AUD = "settings.currencies.AUD";
+export const settings__currencies__NZD = "settings.currencies.NZD";
+export const settings__currencies__AED = "settings.currencies.AED";
+export const settings__currencies__SAR = "settings.currencies.SAR";
+export const settings__currencies__EGP = "settings.currencies.EGP";
+export const settings__currencies__SYP = "settings.currencies.SYP";
+export const settings__currencies__LBP = "settings.currencies.LBP";
+export const settings__currencies__IQD = "settings.currencies.IQD";
+export const settings__currencies__JOD = "settings.currencies.JOD";
+export const settings__currencies__KWD = "settings.currencies.KWD";
+export const settings__currencies__QAR = "settings.currencies.QAR";
+export const settings__currencies__BHD = "settings.currencies.BHD";
+export const settings__currencies__OMR = "settings.currencies.OMR";
+export const settings__currencies__YER = "settings.currencies.YER";
+export const settings__currencies__MAD = "settings.currencies.MAD";
+export const settings__currencies__DZD = "settings.currencies.DZD";
+export const settings__currencies__TND = "settings.currencies.TND";
+export const settings__currencies__LYD = "settings.currencies.LYD";
+export const settings__currencies__SDG = "settings.currencies.SDG";
+export const settings__currencies__ILS = "settings.currencies.ILS";
+export const settings__currencies__IRR = "settings.currencies.IRR";
+export const settings__currencies__TRY = "settings.currencies.TRY";
+export const settings__currencies__PHP = "settings.currencies.PHP";
+export const settings__currencies__CNY = "settings.currencies.CNY";
+export const settings__currencies__KRW = "settings.currencies.KRW";
+export const settings__currencies__INR = "settings.currencies.INR";
+export const settings__currencies__IDR = "settings.currencies.IDR";
+export const settings__currencies__THB = "settings.currencies.THB";
+export const settings__currencies__MYR = "settings.currencies.MYR";
+export const settings__currencies__SGD = "settings.currencies.SGD";
+export const settings__currencies__VND = "settings.currencies.VND";
+export const settings__currencies__BDT = "settings.currencies.BDT";
+export const settings__currencies__PKR = "settings.currencies.PKR";
+export const settings__currencies__LKR = "settings.currencies.LKR";
+export const settings__currencies__MMK = "settings.currencies.MMK";
+export const settings__currencies__KHR = "settings.currencies.KHR";
+export const settings__currencies__LAK = "settings.currencies.LAK";
+export const settings__currencies__NPR = "settings.currencies.NPR";
+export const settings__currencies__BTN = "settings.currencies.BTN";
+export const settings__currencies__MNT = "settings.currencies.MNT";
+export const settings__currencies__KZT = "settings.currencies.KZT";
+export const settings__currencies__UZS = "settings.currencies.UZS";
+export const settings__currencies__TJS = "settings.currencies.TJS";
+export const settings__currencies__KGS = "settings.currencies.KGS";
+export const settings__currencies__TMT = "settings.currencies.TMT";
+export const settings__currencies__AFN = "settings.currencies.AFN";
+export const settings__currencies__NOK = "settings.currencies.NOK";
+export const settings__currencies__SEK = "settings.currencies.SEK";
+export const settings__currencies__DKK = "settings.currencies.DKK";
+export const settings__currencies__ISK = "settings.currencies.ISK";
+export const settings__currencies__PLN = "settings.currencies.PLN";
+export const settings__currencies__CZK = "settings.currencies.CZK";
+export const settings__currencies__HUF = "settings.currencies.HUF";
+export const settings__currencies__RON = "settings.currencies.RON";
+export const settings__currencies__BGN = "settings.currencies.BGN";
+export const settings__currencies__HRK = "settings.currencies.HRK";
+export const settings__currencies__RSD = "settings.currencies.RSD";
+export const settings__currencies__BAM = "settings.currencies.BAM";
+export const settings__currencies__MKD = "settings.currencies.MKD";
+export const settings__currencies__ALL = "settings.currencies.ALL";
+export const settings__currencies__MDL = "settings.currencies.MDL";
+export const settings__currencies__UAH = "settings.currencies.UAH";
+export const settings__currencies__BYN = "settings.currencies.BYN";
+export const settings__currencies__RUB = "settings.currencies.RUB";
+export const settings__currencies__ZAR = "settings.currencies.ZAR";
+export const settings__currencies__NGN = "settings.currencies.NGN";
+export const settings__currencies__GHS = "settings.currencies.GHS";
+export const settings__currencies__KES = "settings.currencies.KES";
+export const settings__currencies__UGX = "settings.currencies.UGX";
+export const settings__currencies__TZS = "settings.currencies.TZS";
+export const settings__currencies__ETB = "settings.currencies.ETB";
+export const settings__currencies__RWF = "settings.currencies.RWF";
+export const settings__currencies__XOF = "settings.currencies.XOF";
+export const settings__currencies__XAF = "settings.currencies.XAF";
+export const settings__currencies__MZN = "settings.currencies.MZN";
+export const settings__currencies__BWP = "settings.currencies.BWP";
+export const settings__currencies__NAD = "settings.currencies.NAD";
+export const settings__currencies__SZL = "settings.currencies.SZL";
+export const settings__currencies__LSL = "settings.currencies.LSL";
+export const settings__currencies__MXN = "settings.currencies.MXN";
+export const settings__currencies__BRL = "settings.currencies.BRL";
+export const settings__currencies__ARS = "settings.currencies.ARS";
+export const settings__currencies__CLP = "settings.currencies.CLP";
+export const settings__currencies__COP = "settings.currencies.COP";
+export const settings__currencies__PEN = "settings.currencies.PEN";
+export const settings__currencies__UYU = "settings.currencies.UYU";
+export const settings__currencies__PYG = "settings.currencies.PYG";
+export const settings__currencies__BOB = "settings.currencies.BOB";
+export const settings__currencies__VED = "settings.currencies.VED";
+export const settings__currencies__GYD = "settings.currencies.GYD";
+export const settings__currencies__SRD = "settings.currencies.SRD";
+export const settings__legal__title = "settings.legal.title";
+export const settings__legal__subtitle = "settings.legal.subtitle";
+export const settings__legal__consentStatus = "settings.legal.consentStatus";
+export const settings__legal__currentLegalVersion = "settings.legal.currentLegalVersion";
+export const settings__legal__status = "settings.legal.status";
+export const settings__legal__accepted = "settings.legal.accepted";
+export const settings__legal__notAccepted = "settings.legal.notAccepted";
+export const settings__legal__acceptedAt = "settings.legal.acceptedAt";
+export const settings__legal__acceptedVersion = "settings.legal.acceptedVersion";
+export const settings__legal__acceptNow = "settings.legal.acceptNow";
+export const settings__legal__downloadAck = "settings.legal.downloadAck";
+export const settings__legal__viewTerms = "settings.legal.viewTerms";
+export const settings__legal__viewPrivacy = "settings.legal.viewPrivacy";
+export const settings__legal__viewDisclaimer = "settings.legal.viewDisclaimer";
+export const settings__legal__summary = "settings.legal.summary";
+export const settings__legal__syncFromGoogle = "settings.legal.syncFromGoogle";
+export const settings__legal__syncSuccess = "settings.legal.syncSuccess";
+export const settings__legal__syncError = "settings.legal.syncError";
+export const settings__legal__pleaseSignIn = "settings.legal.pleaseSignIn";
+export const settings__legal__userDataNotAvailable = "settings.legal.userDataNotAvailable";
+export const settings__legal__popupBlocked = "settings.legal.popupBlocked";
+export const settings__consentDialog__byAccepting = "settings.consentDialog.byAccepting";
+export const settings__consentDialog__toolNotAdvice = "settings.consentDialog.toolNotAdvice";
+export const settings__consentDialog__responsibleForData = "settings.consentDialog.responsibleForData";
+export const settings__consentDialog__consultAccountant = "settings.consentDialog.consultAccountant";
+export const settings__consentDialog__limitedLiability = "settings.consentDialog.limitedLiability";
+export const settings__consentDialog__agreeToPrivacy = "settings.consentDialog.agreeToPrivacy";
+export const settings__companyInformation = "settings.companyInformation";
+export const settings__companyLogo = "settings.companyLogo";
+export const settings__logoUploaded = "settings.logoUploaded";
+export const settings__companyName = "settings.companyName";
+export const settings__taxIdVatNumber = "settings.taxIdVatNumber";
+export const settings__logoUploadedDesc = "settings.logoUploadedDesc";
+export const users__title = "users.title";
+export const users__addUser = "users.addUser";
+export const users__editUser = "users.editUser";
+export const users__userName = "users.userName";
+export const users__fullName = "users.fullName";
+export const users__role = "users.role";
+export const users__permissions = "users.permissions";
+export const users__lastLogin = "users.lastLogin";
+export const users__createdDate = "users.createdDate";
+export const users__owner = "users.owner";
+export const users__accountant = "users.accountant";
+export const users__salesPerson = "users.salesPerson";
+export const users__viewer = "users.viewer";
+export const users__enabled = "users.enabled";
+export const users__disabled = "users.disabled";
+export const users__usersAndRoles = "users.usersAndRoles";
+export const users__manageUserAccounts = "users.manageUserAccounts";
+export const users__totalUsers = "users.totalUsers";
+export const users__allRegisteredUsers = "users.allRegisteredUsers";
+export const users__activeUsers = "users.activeUsers";
+export const users__currentlyActive = "users.currentlyActive";
+export const users__roles = "users.roles";
+export const users__definedRoles = "users.definedRoles";
+export const users__pendingInvites = "users.pendingInvites";
+export const users__awaitingAcceptance = "users.awaitingAcceptance";
+export const users__searchUsers = "users.searchUsers";
+export const users__filterByRole = "users.filterByRole";
+export const users__filterByStatus = "users.filterByStatus";
+export const users__allRoles = "users.allRoles";
+export const users__allStatuses = "users.allStatuses";
+export const users__name = "users.name";
+export const users__email = "users.email";
+export const users__lastActive = "users.lastActive";
+export const users__actions = "users.actions";
+export const users__viewDetails = "users.viewDetails";
+export const users__editPermissions = "users.editPermissions";
+export const users__resetPassword = "users.resetPassword";
+export const users__toggleStatus = "users.toggleStatus";
+export const users__deleteUser = "users.deleteUser";
+export const users__confirmDeleteUser = "users.confirmDeleteUser";
+export const users__userDeleted = "users.userDeleted";
+export const users__userDeletedDesc = "users.userDeletedDesc";
+export const users__passwordReset = "users.passwordReset";
+export const users__passwordResetDesc = "users.passwordResetDesc";
+export const users__statusChanged = "users.statusChanged";
+export const users__userStatusChanged = "users.userStatusChanged";
+export const users__permissionsSaved = "users.permissionsSaved";
+export const users__permissionsSavedDesc = "users.permissionsSavedDesc";
+export const users__rolesManagement = "users.rolesManagement";
+export const users__defineAndManageRoles = "users.defineAndManageRoles";
+export const users__roleName = "users.roleName";
+export const users__description = "users.description";
+export const users__userCount = "users.userCount";
+export const users__userPermissions = "users.userPermissions";
+export const users__selectPermissions = "users.selectPermissions";
+export const users__dashboard = "users.dashboard";
+export const users__sales = "users.sales";
+export const users__purchases = "users.purchases";
+export const users__banking = "users.banking";
+export const users__reports = "users.reports";
+export const users__settings = "users.settings";
+export const users__customers = "users.customers";
+export const users__vendors = "users.vendors";
+export const users__salesReports = "users.salesReports";
+export const users__purchaseReports = "users.purchaseReports";
+export const users__joined = "users.joined";
+export const users__deactivate = "users.deactivate";
+export const users__activate = "users.activate";
+export const users__userRoles = "users.userRoles";
+export const users__defineRolesPermissions = "users.defineRolesPermissions";
+export const users__more = "users.more";
+export const users__configure = "users.configure";
+export const users__permissionsMatrix = "users.permissionsMatrix";
+export const users__configureModuleAccess = "users.configureModuleAccess";
+export const users__module = "users.module";
+export const users__admin = "users.admin";
+export const users__savePermissions = "users.savePermissions";
+export const users__addNewUser = "users.addNewUser";
+export const users__createUserAndAssignRole = "users.createUserAndAssignRole";
+export const users__enterFullName = "users.enterFullName";
+export const users__enterEmail = "users.enterEmail";
+export const users__enterPhone = "users.enterPhone";
+export const users__selectRole = "users.selectRole";
+export const users__enterDepartment = "users.enterDepartment";
+export const users__userCreated = "users.userCreated";
+export const users__userCreatedSuccess = "users.userCreatedSuccess";
+export const users__manageUsers = "users.manageUsers";
+export const users__inviteUser = "users.inviteUser";
+export const users__enterPassword = "users.enterPassword";
+export const users__updateUserInformation = "users.updateUserInformation";
+export const users__leaveEmptyToKeepCurrent = "users.leaveEmptyToKeepCurrent";
+export const users__enterNewPassword = "users.enterNewPassword";
+export const users__saveChanges = "users.saveChanges";
+export const users__mostRecentLogin = "users.mostRecentLogin";
+export const users__passwordResetSent = "users.passwordResetSent";
+export const users__statusUpdated = "users.statusUpdated";
+export const users__statusChangedTo = "users.statusChangedTo";
+export const users__fillRequiredFields = "users.fillRequiredFields";
+export const users__permissionsUpdated = "users.permissionsUpdated";
+export const users__permissionsUpdatedDesc = "users.permissionsUpdatedDesc";
+export const users__permissionsUpdateError = "users.permissionsUpdateError";
+export const users__managePermissions = "users.managePermissions";
+export const users__customizeUserPermissions = "users.customizeUserPermissions";
+export const users__canView = "users.canView";
+export const users__canCreate = "users.canCreate";
+export const users__canEdit = "users.canEdit";
+export const users__canDelete = "users.canDelete";
+export const auth__login = "auth.login";
+export const auth__register = "auth.register";
+export const auth__existingAccount = "auth.existingAccount";
+export const auth__createAccount = "auth.createAccount";
+export const auth__createAccountPrompt = "auth.createAccountPrompt";
+export const auth__firstUserNote = "auth.firstUserNote";
+export const auth__firstUserNoteDesc = "auth.firstUserNoteDesc";
+export const auth__email = "auth.email";
+export const auth__emailPlaceholder = "auth.emailPlaceholder";
+export const auth__password = "auth.password";
+export const auth__passwordPlaceholder = "auth.passwordPlaceholder";
+export const auth__username = "auth.username";
+export const auth__usernamePlaceholder = "auth.usernamePlaceholder";
+export const auth__fullName = "auth.fullName";
+export const auth__fullNamePlaceholder = "auth.fullNamePlaceholder";
+export const auth__companyInformation = "auth.companyInformation";
+export const auth__companyName = "auth.companyName";
+export const auth__companyNamePlaceholder = "auth.companyNamePlaceholder";
+export const auth__currency = "auth.currency";
+export const auth__selectCurrency = "auth.selectCurrency";
+export const auth__fiscalYear = "auth.fiscalYear";
+export const auth__selectMonth = "auth.selectMonth";
+export const auth__userInformation = "auth.userInformation";
+export const auth__months__january = "auth.months.january";
+export const auth__months__february = "auth.months.february";
+export const auth__months__march = "auth.months.march";
+export const auth__months__april = "auth.months.april";
+export const auth__months__may = "auth.months.may";
+export const auth__months__june = "auth.months.june";
+export const auth__months__july = "auth.months.july";
+export const auth__months__august = "auth.months.august";
+export const auth__months__september = "auth.months.september";
+export const auth__months__october = "auth.months.october";
+export const auth__months__november = "auth.months.november";
+export const auth__months__december = "auth.months.december";
+export const auth__currencies__USD = "auth.currencies.USD";
+export const auth__currencies__EUR = "auth.currencies.EUR";
+export const auth__currencies__GBP = "auth.currencies.GBP";
+export const auth__currencies__JPY = "auth.currencies.JPY";
+export const auth__currencies__CNY = "auth.currencies.CNY";
+export const auth__currencies__SAR = "auth.currencies.SAR";
+export const auth__currencies__AED = "auth.currencies.AED";
+export const auth__currencies__KWD = "auth.currencies.KWD";
+export const auth__currencies__QAR = "auth.currencies.QAR";
+export const auth__currencies__BHD = "auth.currencies.BHD";
+export const auth__currencies__OMR = "auth.currencies.OMR";
+export const auth__currencies__JOD = "auth.currencies.JOD";
+export const auth__currencies__LBP = "auth.currencies.LBP";
+export const auth__currencies__EGP = "auth.currencies.EGP";
+export const auth__currencies__IQD = "auth.currencies.IQD";
+export const auth__currencies__SYP = "auth.currencies.SYP";
+export const auth__currencies__YER = "auth.currencies.YER";
+export const auth__currencies__LYD = "auth.currencies.LYD";
+export const auth__currencies__TND = "auth.currencies.TND";
+export const auth__currencies__DZD = "auth.currencies.DZD";
+export const auth__currencies__MAD = "auth.currencies.MAD";
+export const auth__currencies__MRU = "auth.currencies.MRU";
+export const auth__currencies__SDG = "auth.currencies.SDG";
+export const auth__currencies__SOS = "auth.currencies.SOS";
+export const auth__currencies__DJF = "auth.currencies.DJF";
+export const auth__currencies__KMF = "auth.currencies.KMF";
+export const auth__currencies__INR = "auth.currencies.INR";
+export const auth__currencies__PKR = "auth.currencies.PKR";
+export const auth__currencies__BDT = "auth.currencies.BDT";
+export const auth__currencies__IDR = "auth.currencies.IDR";
+export const auth__currencies__MYR = "auth.currencies.MYR";
+export const auth__currencies__PHP = "auth.currencies.PHP";
+export const auth__currencies__SGD = "auth.currencies.SGD";
+export const auth__currencies__THB = "auth.currencies.THB";
+export const auth__currencies__VND = "auth.currencies.VND";
+export const auth__currencies__KRW = "auth.currencies.KRW";
+export const auth__currencies__NGN = "auth.currencies.NGN";
+export const auth__currencies__ZAR = "auth.currencies.ZAR";
+export const auth__currencies__KES = "auth.currencies.KES";
+export const auth__currencies__GHS = "auth.currencies.GHS";
+export const auth__currencies__TZS = "auth.currencies.TZS";
+export const auth__currencies__UGX = "auth.currencies.UGX";
+export const auth__currencies__ETB = "auth.currencies.ETB";
+export const auth__currencies__CAD = "auth.currencies.CAD";
+export const auth__currencies__MXN = "auth.currencies.MXN";
+export const auth__currencies__BRL = "auth.currencies.BRL";
+export const auth__currencies__ARS = "auth.currencies.ARS";
+export const auth__currencies__CLP = "auth.currencies.CLP";
+export const auth__currencies__COP = "auth.currencies.COP";
+export const auth__currencies__CHF = "auth.currencies.CHF";
+export const auth__currencies__SEK = "auth.currencies.SEK";
+export const auth__currencies__NOK = "auth.currencies.NOK";
+export const auth__currencies__DKK = "auth.currencies.DKK";
+export const auth__currencies__PLN = "auth.currencies.PLN";
+export const auth__currencies__TRY = "auth.currencies.TRY";
+export const auth__currencies__RUB = "auth.currencies.RUB";
+export const auth__currencies__UAH = "auth.currencies.UAH";
+export const auth__currencies__AUD = "auth.currencies.AUD";
+export const auth__currencies__NZD = "auth.currencies.NZD";
+export const auth__validationErrors__emailInvalid = "auth.validationErrors.emailInvalid";
+export const auth__validationErrors__passwordMinLength = "auth.validationErrors.passwordMinLength";
+export const auth__validationErrors__companyNameMinLength = "auth.validationErrors.companyNameMinLength";
+export const auth__validationErrors__selectCurrency = "auth.validationErrors.selectCurrency";
+export const auth__validationErrors__usernameMinLength = "auth.validationErrors.usernameMinLength";
+export const auth__validationErrors__fullNameMinLength = "auth.validationErrors.fullNameMinLength";
+export const auth__loginSuccess = "auth.loginSuccess";
+export const auth__signInToContinue = "auth.signInToContinue";
+export const auth__createNewCompany = "auth.createNewCompany";
+export const auth__loginError = "auth.loginError";
+export const auth__invalidCredentials = "auth.invalidCredentials";
+export const auth__googleLoginError = "auth.googleLoginError";
+export const auth__orContinueWith = "auth.orContinueWith";
+export const auth__signInWithGoogle = "auth.signInWithGoogle";
+export const auth__creatingAccount = "auth.creatingAccount";
+export const pages__companies__title = "pages.companies.title";
+export const pages__companies__description = "pages.companies.description";
+export const pages__companies__addCompany = "pages.companies.addCompany";
+export const pages__companies__editCompany = "pages.companies.editCompany";
+export const pages__companies__createCompany = "pages.companies.createCompany";
+export const pages__companies__currentActive = "pages.companies.currentActive";
+export const pages__companies__noCompanies = "pages.companies.noCompanies";
+export const pages__companies__createFirstCompany = "pages.companies.createFirstCompany";
+export const pages__companies__confirmDelete = "pages.companies.confirmDelete";
+export const pages__companies__currentCompany = "pages.companies.currentCompany";
+export const pages__companies__createWithDemoData = "pages.companies.createWithDemoData";
+export const pages__companies__demoDataDescription = "pages.companies.demoDataDescription";
+export const pages__titles__Contacts = "pages.titles.Contacts";
+export const pages__titles__Items = "pages.titles.Items";
+export const pages__titles__Accounts = "pages.titles.Accounts";
+export const pages__titles__Invoices = "pages.titles.Invoices";
+export const pages__titles__Payments = "pages.titles.Payments";
+export const pages__titles__Receipts = "pages.titles.Receipts";
+export const pages__titles__Bills = "pages.titles.Bills";
+export const pages__titles__Expenses = "pages.titles.Expenses";
+export const pages__titles__Purchase_Orders = "pages.titles.Purchase Orders";
+export const pages__titles__Sales_Orders = "pages.titles.Sales Orders";
+export const pages__titles__Quotations = "pages.titles.Quotations";
+export const pages__titles__Debit_Notes = "pages.titles.Debit Notes";
+export const pages__titles__Credit_Notes = "pages.titles.Credit Notes";
+export const pages__titles__Inventory = "pages.titles.Inventory";
+export const pages__titles__Tax_Report = "pages.titles.Tax Report";
+export const pages__titles__Trial_Balance = "pages.titles.Trial Balance";
+export const pages__titles__Profit___Loss = "pages.titles.Profit & Loss";
+export const pages__titles__Balance_Sheet = "pages.titles.Balance Sheet";
+export const pages__titles__Cash_Flow = "pages.titles.Cash Flow";
+export const pages__titles__Bank_Reconciliation = "pages.titles.Bank Reconciliation";
+export const pages__titles__Bank_Accounts = "pages.titles.Bank Accounts";
+export const pages__titles__Users = "pages.titles.Users";
+export const pages__titles__General_Settings = "pages.titles.General Settings";
+export const pages__descriptions__Manage_your_customers_and_suppliers = "pages.descriptions.Manage your customers and suppliers";
+export const pages__descriptions__Manage_your_products_and_services = "pages.descriptions.Manage your products and services";
+export const pages__descriptions__Chart_of_accounts = "pages.descriptions.Chart of accounts";
+export const pages__descriptions__Manage_invoices = "pages.descriptions.Manage invoices";
+export const pages__descriptions__Manage_payments = "pages.descriptions.Manage payments";
+export const pages__descriptions__Manage_outgoing_payments_to_vendors = "pages.descriptions.Manage outgoing payments to vendors";
+export const pages__descriptions__Manage_receipts = "pages.descriptions.Manage receipts";
+export const pages__descriptions__Manage_bills = "pages.descriptions.Manage bills";
+export const pages__descriptions__Track_and_manage_expenses = "pages.descriptions.Track and manage expenses";
+export const forms__companyName = "forms.companyName";
+export const forms__companyNamePlaceholder = "forms.companyNamePlaceholder";
+export const forms__legalName = "forms.legalName";
+export const forms__legalNamePlaceholder = "forms.legalNamePlaceholder";
+export const forms__taxNumber = "forms.taxNumber";
+export const forms__registrationNumber = "forms.registrationNumber";
+export const forms__baseCurrency = "forms.baseCurrency";
+export const forms__selectCurrency = "forms.selectCurrency";
+export const forms__fiscalYearStart = "forms.fiscalYearStart";
+export const forms__selectMonth = "forms.selectMonth";
+export const forms__cancel = "forms.cancel";
+export const forms__update = "forms.update";
+export const forms__create = "forms.create";
+export const forms__company = "forms.company";
+export const forms__currency = "forms.currency";
+export const forms__fiscalYear = "forms.fiscalYear";
+export const forms__active = "forms.active";
+export const forms__edit = "forms.edit";
+export const forms__delete = "forms.delete";
+export const forms__validationError = "forms.validationError";
+export const forms__taxNumberPlaceholder = "forms.taxNumberPlaceholder";
+export const forms__registrationNumberPlaceholder = "forms.registrationNumberPlaceholder";
+export const forms__selectFiscalYear = "forms.selectFiscalYear";
+export const forms__dateFormat = "forms.dateFormat";
+export const forms__selectDateFormat = "forms.selectDateFormat";
+export const forms__numberFormat = "forms.numberFormat";
+export const forms__selectNumberFormat = "forms.selectNumberFormat";
+export const forms__invoiceNumber = "forms.invoiceNumber";
+export const forms__invoiceDate = "forms.invoiceDate";
+export const forms__dueDate = "forms.dueDate";
+export const forms__customer = "forms.customer";
+export const forms__selectCustomer = "forms.selectCustomer";
+export const forms__description = "forms.description";
+export const forms__quantity = "forms.quantity";
+export const forms__rate = "forms.rate";
+export const forms__tax = "forms.tax";
+export const forms__amount = "forms.amount";
+export const forms__subtotal = "forms.subtotal";
+export const forms__total = "forms.total";
+export const forms__notesAndTerms = "forms.notesAndTerms";
+export const forms__notesPlaceholder = "forms.notesPlaceholder";
+export const forms__noTax = "forms.noTax";
+export const forms__editTaxRate = "forms.editTaxRate";
+export const forms__addNewTaxRate = "forms.addNewTaxRate";
+export const forms__taxName = "forms.taxName";
+export const forms__taxCode = "forms.taxCode";
+export const forms__taxRate = "forms.taxRate";
+export const forms__taxType = "forms.taxType";
+export const forms__lineItems = "forms.lineItems";
+export const forms__noItems = "forms.noItems";
+export const forms__createInvoice = "forms.createInvoice";
+export const forms__createInvoiceDesc = "forms.createInvoiceDesc";
+export const forms__createInvoiceDescMobile = "forms.createInvoiceDescMobile";
+export const forms__saveDraft = "forms.saveDraft";
+export const forms__saveAndSend = "forms.saveAndSend";
+export const forms__sendInvoice = "forms.sendInvoice";
+export const forms__invoiceDetails = "forms.invoiceDetails";
+export const forms__customerDetails = "forms.customerDetails";
+export const forms__addItem = "forms.addItem";
+export const forms__itemLabel = "forms.itemLabel";
+export const forms__itemDescriptionPlaceholder = "forms.itemDescriptionPlaceholder";
+export const forms__project = "forms.project";
+export const forms__selectProject = "forms.selectProject";
+export const forms__none = "forms.none";
+export const forms__revenueAccount = "forms.revenueAccount";
+export const forms__expenseAccount = "forms.expenseAccount";
+export const forms__defaultAccount = "forms.defaultAccount";
+export const forms__exchangeRate = "forms.exchangeRate";
+export const forms__scannedItem = "forms.scannedItem";
+export const forms__poNumber = "forms.poNumber";
+export const forms__paymentTerms = "forms.paymentTerms";
+export const forms__dueOnReceipt = "forms.dueOnReceipt";
+export const forms__netDays = "forms.netDays";
+export const forms__custom = "forms.custom";
+export const forms__autoGenerated = "forms.autoGenerated";
+export const forms__optional = "forms.optional";
+export const forms__selectDate = "forms.selectDate";
+export const forms__customerDetailsDesc = "forms.customerDetailsDesc";
+export const forms__lineItemsDesc = "forms.lineItemsDesc";
+export const forms__selectProduct = "forms.selectProduct";
+export const forms__orTypeManually = "forms.orTypeManually";
+export const forms__manualEntry = "forms.manualEntry";
+export const forms__discount = "forms.discount";
+export const forms__netAmount = "forms.netAmount";
+export const forms__equivalentIn = "forms.equivalentIn";
+export const forms__duplicate = "forms.duplicate";
+export const forms__atLeastOneItem = "forms.atLeastOneItem";
+export const forms__customerRequired = "forms.customerRequired";
+export const forms__invoiceDateRequired = "forms.invoiceDateRequired";
+export const forms__dueDateRequired = "forms.dueDateRequired";
+export const forms__itemsIncomplete = "forms.itemsIncomplete";
+export const forms__pleaseFixErrors = "forms.pleaseFixErrors";
+export const forms__noCustomersFound = "forms.noCustomersFound";
+export const forms__salesOrder = "forms.salesOrder";
+export const forms__unknownCustomer = "forms.unknownCustomer";
+export const forms__item = "forms.item";
+export const forms__parentCompany = "forms.parentCompany";
+export const forms__selectParentCompany = "forms.selectParentCompany";
+export const forms__noParentCompany = "forms.noParentCompany";
+export const months__january = "months.january";
+export const months__february = "months.february";
+export const months__march = "months.march";
+export const months__april = "months.april";
+export const months__may = "months.may";
+export const months__june = "months.june";
+export const months__july = "months.july";
+export const months__august = "months.august";
+export const months__september = "months.september";
+export const months__october = "months.october";
+export const months__november = "months.november";
+export const months__december = "months.december";
+export const validationErrors__companyNameMin = "validationErrors.companyNameMin";
+export const validationErrors__currencyRequired = "validationErrors.currencyRequired";
+export const validationErrors__emailInvalid = "validationErrors.emailInvalid";
+export const validationErrors__passwordMinLength = "validationErrors.passwordMinLength";
+export const validationErrors__companyNameMinLength = "validationErrors.companyNameMinLength";
+export const validationErrors__selectCurrency = "validationErrors.selectCurrency";
+export const validationErrors__usernameMinLength = "validationErrors.usernameMinLength";
+export const validationErrors__fullNameMinLength = "validationErrors.fullNameMinLength";
+export const validationErrors__invoiceRequired = "validationErrors.invoiceRequired";
+export const validationErrors__customerRequired = "validationErrors.customerRequired";
+export const validationErrors__reasonMinLength = "validationErrors.reasonMinLength";
+export const validationErrors__validUntilRequired = "validationErrors.validUntilRequired";
+export const paymentMethods__Bank_Transfer = "paymentMethods.Bank Transfer";
+export const paymentMethods__Credit_Card = "paymentMethods.Credit Card";
+export const paymentMethods__Check = "paymentMethods.Check";
+export const paymentMethods__Online_Payment = "paymentMethods.Online Payment";
+export const paymentMethods__Cash = "paymentMethods.Cash";
+export const currencies__USD = "currencies.USD";
+export const currencies__EUR = "currencies.EUR";
+export const currencies__GBP = "currencies.GBP";
+export const currencies__JPY = "currencies.JPY";
+export const currencies__CHF = "currencies.CHF";
+export const currencies__CAD = "currencies.CAD";
+export const currencies__AUD = "currencies.AUD";
+export const currencies__NZD = "currencies.NZD";
+export const currencies__AED = "currencies.AED";
+export const currencies__SAR = "currencies.SAR";
+export const currencies__EGP = "currencies.EGP";
+export const currencies__SYP = "currencies.SYP";
+export const currencies__LBP = "currencies.LBP";
+export const currencies__IQD = "currencies.IQD";
+export const currencies__JOD = "currencies.JOD";
+export const currencies__KWD = "currencies.KWD";
+export const currencies__QAR = "currencies.QAR";
+export const currencies__BHD = "currencies.BHD";
+export const currencies__OMR = "currencies.OMR";
+export const currencies__YER = "currencies.YER";
+export const currencies__MAD = "currencies.MAD";
+export const currencies__DZD = "currencies.DZD";
+export const currencies__TND = "currencies.TND";
+export const currencies__LYD = "currencies.LYD";
+export const currencies__SDG = "currencies.SDG";
+export const currencies__ILS = "currencies.ILS";
+export const currencies__IRR = "currencies.IRR";
+export const currencies__TRY = "currencies.TRY";
+export const currencies__PHP = "currencies.PHP";
+export const currencies__CNY = "currencies.CNY";
+export const currencies__KRW = "currencies.KRW";
+export const currencies__INR = "currencies.INR";
+export const currencies__IDR = "currencies.IDR";
+export const currencies__THB = "currencies.THB";
+export const currencies__MYR = "currencies.MYR";
+export const currencies__SGD = "currencies.SGD";
+export const currencies__VND = "currencies.VND";
+export const currencies__BDT = "currencies.BDT";
+export const currencies__PKR = "currencies.PKR";
+export const currencies__LKR = "currencies.LKR";
+export const currencies__MMK = "currencies.MMK";
+export const currencies__KHR = "currencies.KHR";
+export const currencies__LAK = "currencies.LAK";
+export const currencies__NPR = "currencies.NPR";
+export const currencies__BTN = "currencies.BTN";
+export const currencies__MNT = "currencies.MNT";
+export const currencies__KZT = "currencies.KZT";
+export const currencies__UZS = "currencies.UZS";
+export const currencies__TJS = "currencies.TJS";
+export const currencies__KGS = "currencies.KGS";
+export const currencies__TMT = "currencies.TMT";
+export const currencies__AFN = "currencies.AFN";
+export const currencies__NOK = "currencies.NOK";
+export const currencies__SEK = "currencies.SEK";
+export const currencies__DKK = "currencies.DKK";
+export const currencies__ISK = "currencies.ISK";
+export const currencies__PLN = "currencies.PLN";
+export const currencies__CZK = "currencies.CZK";
+export const currencies__HUF = "currencies.HUF";
+export const currencies__RON = "currencies.RON";
+export const currencies__BGN = "currencies.BGN";
+export const currencies__HRK = "currencies.HRK";
+export const currencies__RSD = "currencies.RSD";
+export const currencies__BAM = "currencies.BAM";
+export const currencies__MKD = "currencies.MKD";
+export const currencies__ALL = "currencies.ALL";
+export const currencies__MDL = "currencies.MDL";
+export const currencies__UAH = "currencies.UAH";
+export const currencies__BYN = "currencies.BYN";
+export const currencies__RUB = "currencies.RUB";
+export const currencies__ZAR = "currencies.ZAR";
+export const currencies__NGN = "currencies.NGN";
+export const currencies__GHS = "currencies.GHS";
+export const currencies__KES = "currencies.KES";
+export const currencies__UGX = "currencies.UGX";
+export const currencies__TZS = "currencies.TZS";
+export const currencies__ETB = "currencies.ETB";
+export const currencies__RWF = "currencies.RWF";
+export const currencies__XOF = "currencies.XOF";
+export const currencies__XAF = "currencies.XAF";
+export const currencies__MZN = "currencies.MZN";
+export const currencies__BWP = "currencies.BWP";
+export const currencies__NAD = "currencies.NAD";
+export const currencies__SZL = "currencies.SZL";
+export const currencies__LSL = "currencies.LSL";
+export const currencies__MXN = "currencies.MXN";
+export const currencies__BRL = "currencies.BRL";
+export const currencies__ARS = "currencies.ARS";
+export const currencies__CLP = "currencies.CLP";
+export const currencies__COP = "currencies.COP";
+export const currencies__PEN = "currencies.PEN";
+export const currencies__UYU = "currencies.UYU";
+export const currencies__PYG = "currencies.PYG";
+export const currencies__BOB = "currencies.BOB";
+export const currencies__VED = "currencies.VED";
+export const currencies__GYD = "currencies.GYD";
+export const currencies__SRD = "currencies.SRD";
+export const formats__dateFormat = "formats.dateFormat";
+export const formats__numberFormat = "formats.numberFormat";
+export const formats__selectDateFormat = "formats.selectDateFormat";
+export const formats__selectNumberFormat = "formats.selectNumberFormat";
+export const formats__us = "formats.us";
+export const formats__eu = "formats.eu";
+export const formats__fr = "formats.fr";
+export const formats__february = "formats.february";
+export const formats__date__label = "formats.date.label";
+export const formats__date__DD_MM_YYYY = "formats.date.DD/MM/YYYY";
+export const formats__date__MM_DD_YYYY = "formats.date.MM/DD/YYYY";
+export const formats__date__YYYY_MM_DD = "formats.date.YYYY/MM/DD";
+export const formats__date__DD_MM_YYYY_2 = "formats.date.DD-MM-YYYY";
+export const formats__date__MM_DD_YYYY_2 = "formats.date.MM-DD-YYYY";
+export const formats__date__YYYY_MM_DD_2 = "formats.date.YYYY-MM-DD";
+export const formats__number__label = "formats.number.label";
+export const formats__number__comma_dot = "formats.number.comma_dot";
+export const formats__number__dot_comma = "formats.number.dot_comma";
+export const formats__number__space_comma = "formats.number.space_comma";
+export const formats__number__arabic = "formats.number.arabic";
+export const messages__companyCreated = "messages.companyCreated";
+export const messages__companyCreatedDesc = "messages.companyCreatedDesc";
+export const messages__companyUpdated = "messages.companyUpdated";
+export const messages__companyUpdatedDesc = "messages.companyUpdatedDesc";
+export const messages__companyDeleted = "messages.companyDeleted";
+export const messages__companyDeletedDesc = "messages.companyDeletedDesc";
+export const messages__createCompanyError = "messages.createCompanyError";
+export const messages__updateCompanyError = "messages.updateCompanyError";
+export const messages__deleteCompanyError = "messages.deleteCompanyError";
+export const messages__noAccountsFound = "messages.noAccountsFound";
+export const messages__startByAddingAccount = "messages.startByAddingAccount";
+export const messages__loadingAccounts = "messages.loadingAccounts";
+export const messages__noItemsFound = "messages.noItemsFound";
+export const messages__startByAddingItem = "messages.startByAddingItem";
+export const messages__loadingItems = "messages.loadingItems";
+export const messages__noContactsFound = "messages.noContactsFound";
+export const messages__startByAddingContact = "messages.startByAddingContact";
+export const messages__saveSuccess = "messages.saveSuccess";
+export const messages__updateSuccess = "messages.updateSuccess";
+export const messages__deleteSuccess = "messages.deleteSuccess";
+export const messages__saveError = "messages.saveError";
+export const messages__updateError = "messages.updateError";
+export const messages__deleteError = "messages.deleteError";
+export const messages__networkError = "messages.networkError";
+export const messages__serverError = "messages.serverError";
+export const messages__accessDenied = "messages.accessDenied";
+export const messages__sessionExpired = "messages.sessionExpired";
+export const messages__dataNotFound = "messages.dataNotFound";
+export const messages__validationError = "messages.validationError";
+export const invoice__createInvoice = "invoice.createInvoice";
+export const invoice__createInvoiceDesc = "invoice.createInvoiceDesc";
+export const invoice__createInvoiceDescMobile = "invoice.createInvoiceDescMobile";
+export const invoice__saveDraft = "invoice.saveDraft";
+export const invoice__sendInvoice = "invoice.sendInvoice";
+export const invoice__invoiceDetails = "invoice.invoiceDetails";
+export const invoice__invoiceNumber = "invoice.invoiceNumber";
+export const invoice__invoiceDate = "invoice.invoiceDate";
+export const invoice__dueDate = "invoice.dueDate";
+export const invoice__customerDetails = "invoice.customerDetails";
+export const invoice__customer = "invoice.customer";
+export const invoice__selectCustomer = "invoice.selectCustomer";
+export const invoice__lineItems = "invoice.lineItems";
+export const invoice__addItem = "invoice.addItem";
+export const invoice__description = "invoice.description";
+export const invoice__qty = "invoice.qty";
+export const invoice__rate = "invoice.rate";
+export const invoice__tax = "invoice.tax";
+export const invoice__amount = "invoice.amount";
+export const invoice__itemDescription = "invoice.itemDescription";
+export const invoice__subtotal = "invoice.subtotal";
+export const invoice__totalTax = "invoice.totalTax";
+export const invoice__total = "invoice.total";
+export const invoice__notesAndTerms = "invoice.notesAndTerms";
+export const invoice__notesPlaceholder = "invoice.notesPlaceholder";
+export const invoice__invoiceSavedDraft = "invoice.invoiceSavedDraft";
+export const invoice__invoiceSent = "invoice.invoiceSent";
+export const tax__taxConfiguration = "tax.taxConfiguration";
+export const tax__taxConfigDesc = "tax.taxConfigDesc";
+export const tax__addTaxRate = "tax.addTaxRate";
+export const tax__taxRates = "tax.taxRates";
+export const tax__name = "tax.name";
+export const tax__code = "tax.code";
+export const tax__type = "tax.type";
+export const tax__rate = "tax.rate";
+export const tax__calculation = "tax.calculation";
+export const tax__jurisdiction = "tax.jurisdiction";
+export const tax__status = "tax.status";
+export const tax__effectiveFrom = "tax.effectiveFrom";
+export const tax__global = "tax.global";
+export const tax__inclusive = "tax.inclusive";
+export const tax__exclusive = "tax.exclusive";
+export const tax__editTaxRate = "tax.editTaxRate";
+export const tax__addNewTaxRate = "tax.addNewTaxRate";
+export const tax__taxName = "tax.taxName";
+export const tax__taxNamePlaceholder = "tax.taxNamePlaceholder";
+export const tax__taxCode = "tax.taxCode";
+export const tax__taxCodePlaceholder = "tax.taxCodePlaceholder";
+export const tax__taxType = "tax.taxType";
+export const tax__taxRate = "tax.taxRate";
+export const tax__taxInclusive = "tax.taxInclusive";
+export const tax__taxInclusiveDesc = "tax.taxInclusiveDesc";
+export const tax__presets = "tax.presets";
+export const tax__threshold = "tax.threshold";
+export const tax__noTaxRates = "tax.noTaxRates";
+export const tax__amt = "tax.amt";
+export const tax__per = "tax.per";
+export const tax__for = "tax.for";
+export const tax__thresholdAmount = "tax.thresholdAmount";
+export const tax__thresholdPeriod = "tax.thresholdPeriod";
+export const tax__selectPeriod = "tax.selectPeriod";
+export const tax__annual = "tax.annual";
+export const tax__monthly = "tax.monthly";
+export const tax__rolling12 = "tax.rolling12";
+export const tax__thresholdAppliesTo = "tax.thresholdAppliesTo";
+export const tax__selectBasis = "tax.selectBasis";
+export const tax__turnover = "tax.turnover";
+export const tax__incomeProfit = "tax.incomeProfit";
+export const tax__other = "tax.other";
+export const tax__jurisdictionOptional = "tax.jurisdictionOptional";
+export const tax__glAccount = "tax.glAccount";
+export const tax__quickAddPresets = "tax.quickAddPresets";
+export const tax__presetTypes = "tax.presetTypes";
+export const tax__createPresets = "tax.createPresets";
+export const tax__appliesTo = "tax.appliesTo";
+export const tax__availableTaxes = "tax.availableTaxes";
+export const tax__presetsHint = "tax.presetsHint";
+export const tax__addAllTaxes = "tax.addAllTaxes";
+export const backup__title = "backup.title";
+export const backup__description = "backup.description";
+export const backup__createBackup = "backup.createBackup";
+export const backup__createDescription = "backup.createDescription";
+export const backup__downloadBackup = "backup.downloadBackup";
+export const backup__autoBackup = "backup.autoBackup";
+export const backup__autoBackupDescription = "backup.autoBackupDescription";
+export const backup__enableAutoBackup = "backup.enableAutoBackup";
+export const backup__autoBackupWillSave = "backup.autoBackupWillSave";
+export const backup__autoBackupEnabled = "backup.autoBackupEnabled";
+export const backup__autoBackupDisabled = "backup.autoBackupDisabled";
+export const backup__autoBackupWillStart = "backup.autoBackupWillStart";
+export const backup__autoBackupWillStop = "backup.autoBackupWillStop";
+export const backup__frequency = "backup.frequency";
+export const backup__daily = "backup.daily";
+export const backup__weekly = "backup.weekly";
+export const backup__monthly = "backup.monthly";
+export const backup__maxBackupsToKeep = "backup.maxBackupsToKeep";
+export const backup__backups = "backup.backups";
+export const backup__oldBackupsWillBeMarked = "backup.oldBackupsWillBeMarked";
+export const backup__status = "backup.status";
+export const backup__active = "backup.active";
+export const backup__lastBackup = "backup.lastBackup";
+export const backup__never = "backup.never";
+export const backup__nextBackup = "backup.nextBackup";
+export const backup__backupNow = "backup.backupNow";
+export const backup__restoreBackup = "backup.restoreBackup";
+export const backup__restoreDescription = "backup.restoreDescription";
+export const backup__selectedFile = "backup.selectedFile";
+export const backup__restore = "backup.restore";
+export const backup__merge = "backup.merge";
+export const backup__restoreWarning = "backup.restoreWarning";
+export const backup__mergeWarning = "backup.mergeWarning";
+export const backup__infoTitle = "backup.infoTitle";
+export const backup__infoDescription = "backup.infoDescription";
+export const backup__infoCompanies = "backup.infoCompanies";
+export const backup__infoAccounts = "backup.infoAccounts";
+export const backup__infoContacts = "backup.infoContacts";
+export const backup__infoItems = "backup.infoItems";
+export const backup__infoTaxes = "backup.infoTaxes";
+export const backup__infoJournals = "backup.infoJournals";
+export const backup__infoInvoices = "backup.infoInvoices";
+export const backup__infoBills = "backup.infoBills";
+export const backup__infoPayments = "backup.infoPayments";
+export const backup__infoBanking = "backup.infoBanking";
+export const backup__infoInventory = "backup.infoInventory";
+export const backup__infoAssets = "backup.infoAssets";
+export const backup__infoProjects = "backup.infoProjects";
+export const backup__infoBudgets = "backup.infoBudgets";
+export const backup__infoEmployees = "backup.infoEmployees";
+export const backup__infoSettings = "backup.infoSettings";
+export const backup__infoComplete = "backup.infoComplete";
+export const backup__infoTimestamp = "backup.infoTimestamp";
+export const backup__noCompanyWarning = "backup.noCompanyWarning";
+export const backup__createCompanyNow = "backup.createCompanyNow";
+export const backup__success = "backup.success";
+export const backup__downloadComplete = "backup.downloadComplete";
+export const backup__error = "backup.error";
+export const backup__failed = "backup.failed";
+export const backup__mergeSuccess = "backup.mergeSuccess";
+export const backup__restoreSuccess = "backup.restoreSuccess";
+export const backup__dataMerged = "backup.dataMerged";
+export const backup__dataRestored = "backup.dataRestored";
+export const backup__newAccounts = "backup.newAccounts";
+export const backup__newContacts = "backup.newContacts";
+export const backup__newItems = "backup.newItems";
+export const backup__accounts = "backup.accounts";
+export const backup__contacts = "backup.contacts";
+export const backup__items = "backup.items";
+export const backup__invalidFile = "backup.invalidFile";
+export const backup__continueQuestion = "backup.continueQuestion";
+export const backup__autoBackupCompleted = "backup.autoBackupCompleted";
+export const backup__autoBackupSuccess = "backup.autoBackupSuccess";
+export const backup__autoBackupNever = "backup.autoBackupNever";
+export const validation__required = "validation.required";
+export const validation__minLength = "validation.minLength";
+export const validation__maxLength = "validation.maxLength";
+export const validation__min = "validation.min";
+export const validation__max = "validation.max";
+export const validation__pattern = "validation.pattern";
+export const validation__email = "validation.email";
+export const validation__phone = "validation.phone";
+export const validation__url = "validation.url";
+export const validation__iban = "validation.iban";
+export const validation__taxNumber = "validation.taxNumber";
+export const validation__decimal = "validation.decimal";
+export const validation__integer = "validation.integer";
+export const validation__date = "validation.date";
+export const validation__future = "validation.future";
+export const validation__past = "validation.past";
+export const validation__unique = "validation.unique";
+export const validation__invalid = "validation.invalid";
+export const validation__errorsFound = "validation.errorsFound";
+export const validation__warnings = "validation.warnings";
+export const validation__errorsCount = "validation.errorsCount";
+export const validation__allValid = "validation.allValid";
+export const validation__progress = "validation.progress";
+export const validation__accountRequired = "validation.accountRequired";
+export const validation__itemCodeRequired = "validation.itemCodeRequired";
+export const validation__itemNameMin2 = "validation.itemNameMin2";
+export const placeholders__Select_type = "placeholders.Select type";
+export const placeholders__Select_currency = "placeholders.Select currency";
+export const placeholders__searchExpenses = "placeholders.searchExpenses";
+export const placeholders__selectSupplier = "placeholders.selectSupplier";
+export const placeholders__selectVendor = "placeholders.selectVendor";
+export const placeholders__selectBill = "placeholders.selectBill";
+export const placeholders__enterReason = "placeholders.enterReason";
+export const placeholders__additionalNotes = "placeholders.additionalNotes";
+export const placeholders__Select_method = "placeholders.Select method";
+export const placeholders__selectMethod = "placeholders.selectMethod";
+export const accountTypes__currentAssets = "accountTypes.currentAssets";
+export const accountTypes__nonCurrentAssets = "accountTypes.nonCurrentAssets";
+export const accountTypes__currentLiabilities = "accountTypes.currentLiabilities";
+export const accountTypes__nonCurrentLiabilities = "accountTypes.nonCurrentLiabilities";
+export const accountTypes__equity = "accountTypes.equity";
+export const profitLossPage__title = "profitLossPage.title";
+export const profitLossPage__description = "profitLossPage.description";
+export const profitLossPage__revenue = "profitLossPage.revenue";
+export const profitLossPage__costOfSales = "profitLossPage.costOfSales";
+export const profitLossPage__grossProfit = "profitLossPage.grossProfit";
+export const profitLossPage__operatingExpenses = "profitLossPage.operatingExpenses";
+export const profitLossPage__operatingIncome = "profitLossPage.operatingIncome";
+export const profitLossPage__netIncome = "profitLossPage.netIncome";
+export const profitLossPage__netProfit = "profitLossPage.netProfit";
+export const profitLossPage__netLoss = "profitLossPage.netLoss";
+export const profitLossPage__debit = "profitLossPage.debit";
+export const profitLossPage__credit = "profitLossPage.credit";
+export const profitLossPage__currentBalance = "profitLossPage.currentBalance";
+export const profitLossPage__projectedBalance = "profitLossPage.projectedBalance";
+export const profitLossPage__netChange = "profitLossPage.netChange";
+export const profitLossPage__lowestBalance = "profitLossPage.lowestBalance";
+export const profitLossPage__on = "profitLossPage.on";
+export const profitLossPage__cashFlowProjection = "profitLossPage.cashFlowProjection";
+export const profitLossPage__cashFlowProjectionDesc = "profitLossPage.cashFlowProjectionDesc";
+export const profitLossPage__inflow = "profitLossPage.inflow";
+export const profitLossPage__outflow = "profitLossPage.outflow";
+export const profitLossPage__aiAnalysis = "profitLossPage.aiAnalysis";
+export const profitLossPage__forecastDetails = "profitLossPage.forecastDetails";
+export const profitLossPage__current = "profitLossPage.current";
+export const profitLossPage__days30 = "profitLossPage.days30";
+export const profitLossPage__days60 = "profitLossPage.days60";
+export const profitLossPage__days90 = "profitLossPage.days90";
+export const profitLossPage__daysOver90 = "profitLossPage.daysOver90";
+export const profitLossPage__operatingRevenue = "profitLossPage.operatingRevenue";
+export const profitLossPage__nonOperatingRevenue = "profitLossPage.nonOperatingRevenue";
+export const profitLossPage__taxes = "profitLossPage.taxes";
+export const cashFlowPage__title = "cashFlowPage.title";
+export const cashFlowPage__description = "cashFlowPage.description";
+export const cashFlowPage__cashFlowAnalysisFor = "cashFlowPage.cashFlowAnalysisFor";
+export const cashFlowPage__indirectMethod = "cashFlowPage.indirectMethod";
+export const cashFlowPage__directMethod = "cashFlowPage.directMethod";
+export const cashFlowPage__beginningCash = "cashFlowPage.beginningCash";
+export const cashFlowPage__startOfPeriod = "cashFlowPage.startOfPeriod";
+export const cashFlowPage__operatingCash = "cashFlowPage.operatingCash";
+export const cashFlowPage__investingCash = "cashFlowPage.investingCash";
+export const cashFlowPage__financingCash = "cashFlowPage.financingCash";
+export const cashFlowPage__netOperatingCash = "cashFlowPage.netOperatingCash";
+export const cashFlowPage__netInvestingCash = "cashFlowPage.netInvestingCash";
+export const cashFlowPage__netFinancingCash = "cashFlowPage.netFinancingCash";
+export const cashFlowPage__endingCash = "cashFlowPage.endingCash";
+export const cashFlowPage__summary = "cashFlowPage.summary";
+export const cashFlowPage__detailedView = "cashFlowPage.detailedView";
+export const cashFlowPage__export = "cashFlowPage.export";
+export const cashFlowPage__print = "cashFlowPage.print";
+export const cashFlowPage__dateRange = "cashFlowPage.dateRange";
+export const cashFlowPage__from = "cashFlowPage.from";
+export const cashFlowPage__to = "cashFlowPage.to";
+export const cashFlowPage__generate = "cashFlowPage.generate";
+export const cashFlowPage__refresh = "cashFlowPage.refresh";
+export const cashFlowPage__noData = "cashFlowPage.noData";
+export const cashFlowPage__chart__title = "cashFlowPage.chart.title";
+export const cashFlowPage__chart__inflow = "cashFlowPage.chart.inflow";
+export const cashFlowPage__chart__outflow = "cashFlowPage.chart.outflow";
+export const cashFlowPage__chart__net = "cashFlowPage.chart.net";
+export const cashFlowPage__table__date = "cashFlowPage.table.date";
+export const cashFlowPage__table__description = "cashFlowPage.table.description";
+export const cashFlowPage__table__reference = "cashFlowPage.table.reference";
+export const cashFlowPage__table__inflow = "cashFlowPage.table.inflow";
+export const cashFlowPage__table__outflow = "cashFlowPage.table.outflow";
+export const cashFlowPage__table__netFlow = "cashFlowPage.table.netFlow";
+export const cashFlowPage__table__cumulativeCashFlow = "cashFlowPage.table.cumulativeCashFlow";
+export const cashFlowPage__table__netAmount = "cashFlowPage.table.netAmount";
+export const cashFlowPage__table__beginningCashBalance = "cashFlowPage.table.beginningCashBalance";
+export const cashFlowPage__table__cashFlowsFromOperatingActivities = "cashFlowPage.table.cashFlowsFromOperatingActivities";
+export const cashFlowPage__table__netCashFromOperatingActivities = "cashFlowPage.table.netCashFromOperatingActivities";
+export const cashFlowPage__table__cashFlowsFromInvestingActivities = "cashFlowPage.table.cashFlowsFromInvestingActivities";
+export const cashFlowPage__table__netCashFromInvestingActivities = "cashFlowPage.table.netCashFromInvestingActivities";
+export const cashFlowPage__table__cashFlowsFromFinancingActivities = "cashFlowPage.table.cashFlowsFromFinancingActivities";
+export const cashFlowPage__table__netCashFromFinancingActivities = "cashFlowPage.table.netCashFromFinancingActivities";
+export const cashFlowPage__table__netChangeInCash = "cashFlowPage.table.netChangeInCash";
+export const cashFlowPage__table__endingCashBalance = "cashFlowPage.table.endingCashBalance";
+export const trialBalancePage__title = "trialBalancePage.title";
+export const trialBalancePage__description = "trialBalancePage.description";
+export const trialBalancePage__generateReport = "trialBalancePage.generateReport";
+export const trialBalancePage__asOf = "trialBalancePage.asOf";
+export const trialBalancePage__from = "trialBalancePage.from";
+export const trialBalancePage__to = "trialBalancePage.to";
+export const trialBalancePage__totalDebits = "trialBalancePage.totalDebits";
+export const trialBalancePage__totalCredits = "trialBalancePage.totalCredits";
+export const trialBalancePage__debitCreditSummary = "trialBalancePage.debitCreditSummary";
+export const trialBalancePage__account = "trialBalancePage.account";
+export const trialBalancePage__accounts = "trialBalancePage.accounts";
+export const trialBalancePage__balance = "trialBalancePage.balance";
+export const trialBalancePage__balanced = "trialBalancePage.balanced";
+export const trialBalancePage__difference = "trialBalancePage.difference";
+export const trialBalancePage__unbalanced = "trialBalancePage.unbalanced";
+export const trialBalancePage__currentPeriod = "trialBalancePage.currentPeriod";
+export const trialBalancePage__previousPeriod = "trialBalancePage.previousPeriod";
+export const trialBalancePage__yearEnd = "trialBalancePage.yearEnd";
+export const trialBalancePage__customDate = "trialBalancePage.customDate";
+export const trialBalancePage__allAccounts = "trialBalancePage.allAccounts";
+export const trialBalancePage__assetsOnly = "trialBalancePage.assetsOnly";
+export const trialBalancePage__liabilitiesOnly = "trialBalancePage.liabilitiesOnly";
+export const trialBalancePage__equityOnly = "trialBalancePage.equityOnly";
+export const trialBalancePage__revenueOnly = "trialBalancePage.revenueOnly";
+export const trialBalancePage__expensesOnly = "trialBalancePage.expensesOnly";
+export const trialBalancePage__allDebitEntries = "trialBalancePage.allDebitEntries";
+export const trialBalancePage__allCreditEntries = "trialBalancePage.allCreditEntries";
+export const trialBalancePage__trialBalanceDetails = "trialBalancePage.trialBalanceDetails";
+export const trialBalancePage__noAccountData = "trialBalancePage.noAccountData";
+export const trialBalancePage__accountsList = "trialBalancePage.accountsList";
+export const trialBalancePage__debit = "trialBalancePage.debit";
+export const trialBalancePage__credit = "trialBalancePage.credit";
+export const trialBalancePage__total = "trialBalancePage.total";
+export const trialBalancePage__subtotal = "trialBalancePage.subtotal";
+export const trialBalancePage__date = "trialBalancePage.date";
+export const trialBalancePage__reference = "trialBalancePage.reference";
+export const trialBalancePage__status = "trialBalancePage.status";
+export const trialBalancePage__actions = "trialBalancePage.actions";
+export const trialBalancePage__viewDetails = "trialBalancePage.viewDetails";
+export const trialBalancePage__downloadPDF = "trialBalancePage.downloadPDF";
+export const trialBalancePage__exportCSV = "trialBalancePage.exportCSV";
+export const trialBalancePage__exportExcel = "trialBalancePage.exportExcel";
+export const trialBalancePage__print = "trialBalancePage.print";
+export const trialBalancePage__refresh = "trialBalancePage.refresh";
+export const trialBalancePage__confirmDelete = "trialBalancePage.confirmDelete";
+export const trialBalancePage__deleteSuccess = "trialBalancePage.deleteSuccess";
+export const trialBalancePage__deleteError = "trialBalancePage.deleteError";
+export const trialBalancePage__noData = "trialBalancePage.noData";
+export const trialBalancePage__loading = "trialBalancePage.loading";
+export const trialBalancePage__errorLoading = "trialBalancePage.errorLoading";
+export const trialBalancePage__failedToLoad = "trialBalancePage.failedToLoad";
+export const trialBalancePage__viewAccountDetails = "trialBalancePage.viewAccountDetails";
+export const trialBalancePage__accountCode = "trialBalancePage.accountCode";
+export const trialBalancePage__accountName = "trialBalancePage.accountName";
+export const time__justNow = "time.justNow";
+export const time__minutesAgo = "time.minutesAgo";
+export const time__hoursAgo = "time.hoursAgo";
+export const time__daysAgo = "time.daysAgo";
+export const time__minutes = "time.minutes";
+export const time__hours = "time.hours";
+export const time__days = "time.days";
+export const time__years = "time.years";
+export const timezones__dubai = "timezones.dubai";
+export const timezones__riyadh = "timezones.riyadh";
+export const timezones__qatar = "timezones.qatar";
+export const timezones__kuwait = "timezones.kuwait";
+export const timezones__bahrain = "timezones.bahrain";
+export const timezones__muscat = "timezones.muscat";
+export const timezones__cairo = "timezones.cairo";
+export const timezones__amman = "timezones.amman";
+export const timezones__beirut = "timezones.beirut";
+export const timezones__baghdad = "timezones.baghdad";
+export const timezones__eastern = "timezones.eastern";
+export const timezones__central = "timezones.central";
+export const timezones__mountain = "timezones.mountain";
+export const timezones__pacific = "timezones.pacific";
+export const timezones__london = "timezones.london";
+export const timezones__paris = "timezones.paris";
+export const timezones__berlin = "timezones.berlin";
+export const timezones__moscow = "timezones.moscow";
+export const timezones__india = "timezones.india";
+export const timezones__pakistan = "timezones.pakistan";
+export const timezones__china = "timezones.china";
+export const timezones__tokyo = "timezones.tokyo";
+export const timezones__singapore = "timezones.singapore";
+export const timezones__sydney = "timezones.sydney";
+export const timezones__auckland = "timezones.auckland";
+export const budgets__title = "budgets.title";
+export const budgets__description = "budgets.description";
+export const budgets__budgetVsActual = "budgets.budgetVsActual";
+export const budgets__budgetVsActualDesc = "budgets.budgetVsActualDesc";
+export const budgets__fiscalYear = "budgets.fiscalYear";
+export const budgets__performanceReport = "budgets.performanceReport";
+export const budgets__detailedBreakdown = "budgets.detailedBreakdown";
+export const budgets__account = "budgets.account";
+export const budgets__type = "budgets.type";
+export const budgets__budget = "budgets.budget";
+export const budgets__actual = "budgets.actual";
+export const budgets__variance = "budgets.variance";
+export const budgets__progress = "budgets.progress";
+export const budgets__status = "budgets.status";
+export const budgets__saveSuccess = "budgets.saveSuccess";
+export const budgets__saveError = "budgets.saveError";
+export const budgets__enterAmount = "budgets.enterAmount";
+export const budgets__annualBudget = "budgets.annualBudget";
+export const budgets__budgetEntry = "budgets.budgetEntry";
+export const budgets__budgetEntryDesc = "budgets.budgetEntryDesc";
+export const budgets__accountCode = "budgets.accountCode";
+export const budgets__accountName = "budgets.accountName";
+export const budgets__totalRevenue = "budgets.totalRevenue";
+export const budgets__totalExpenses = "budgets.totalExpenses";
+export const budgets__netBudget = "budgets.netBudget";
+export const budgets__netActual = "budgets.netActual";
+export const budgets__target = "budgets.target";
+export const budgets__plannedProfit = "budgets.plannedProfit";
+export const budgets__underBudget = "budgets.underBudget";
+export const budgets__overBudget = "budgets.overBudget";
+export const budgets__aboveTarget = "budgets.aboveTarget";
+export const budgets__belowTarget = "budgets.belowTarget";
+export const budgets__onTarget = "budgets.onTarget";
+export const budgets__noBudgetData = "budgets.noBudgetData";
+export const budgets__revenue = "budgets.revenue";
+export const budgets__expenses = "budgets.expenses";
+export const budgets__entryMode = "budgets.entryMode";
+export const budgets__annualEntry = "budgets.annualEntry";
+export const budgets__monthlyEntry = "budgets.monthlyEntry";
+export const budgets__months__january = "budgets.months.january";
+export const budgets__months__february = "budgets.months.february";
+export const budgets__months__march = "budgets.months.march";
+export const budgets__months__april = "budgets.months.april";
+export const budgets__months__may = "budgets.months.may";
+export const budgets__months__june = "budgets.months.june";
+export const budgets__months__july = "budgets.months.july";
+export const budgets__months__august = "budgets.months.august";
+export const budgets__months__september = "budgets.months.september";
+export const budgets__months__october = "budgets.months.october";
+export const budgets__months__november = "budgets.months.november";
+export const budgets__months__december = "budgets.months.december";
+export const budgets__deleteConfirm = "budgets.deleteConfirm";
+export const budgets__deleteSuccess = "budgets.deleteSuccess";
+export const budgets__deleteError = "budgets.deleteError";
+export const budgets__total = "budgets.total";
+export const budgets__variancePercentage = "budgets.variancePercentage";
+export const budgets__expenseBudgets = "budgets.expenseBudgets";
+export const budgets__revenueBudgets = "budgets.revenueBudgets";
+export const budgets__expenseDesc = "budgets.expenseDesc";
+export const budgets__revenueDesc = "budgets.revenueDesc";
+export const budgets__noExpenseAccounts = "budgets.noExpenseAccounts";
+export const budgets__noRevenueAccounts = "budgets.noRevenueAccounts";
+export const budgets__deleteBudget = "budgets.deleteBudget";
+export const budgets__annual = "budgets.annual";
+export const budgets__monthly = "budgets.monthly";
+export const budgets__copyBudget = "budgets.copyBudget";
+export const budgets__copyBudgetDesc = "budgets.copyBudgetDesc";
+export const budgets__copyFromYear = "budgets.copyFromYear";
+export const budgets__fromYear = "budgets.fromYear";
+export const budgets__toYear = "budgets.toYear";
+export const budgets__adjustmentPercent = "budgets.adjustmentPercent";
+export const budgets__adjustmentHint = "budgets.adjustmentHint";
+export const budgets__copySuccess = "budgets.copySuccess";
+export const budgets__copyError = "budgets.copyError";
+export const budgets__totalExpense = "budgets.totalExpense";
+export const ai__analytics__title = "ai.analytics.title";
+export const ai__analytics__subtitle = "ai.analytics.subtitle";
+export const ai__analytics__totalExtractions = "ai.analytics.totalExtractions";
+export const ai__analytics__successRate = "ai.analytics.successRate";
+export const ai__analytics__estimatedCost = "ai.analytics.estimatedCost";
+export const ai__analytics__failedExtractions = "ai.analytics.failedExtractions";
+export const ai__analytics__extractionVolume = "ai.analytics.extractionVolume";
+export const ai__analytics__providerPerformance = "ai.analytics.providerPerformance";
+export const ai__analytics__modelUsage = "ai.analytics.modelUsage";
+export const ai__analytics__extractionModes = "ai.analytics.extractionModes";
+export const ai__analytics__recentActivity = "ai.analytics.recentActivity";
+export const ai__analytics__timestamp = "ai.analytics.timestamp";
+export const ai__analytics__provider = "ai.analytics.provider";
+export const ai__analytics__model = "ai.analytics.model";
+export const ai__analytics__mode = "ai.analytics.mode";
+export const ai__analytics__status = "ai.analytics.status";
+export const ai__analytics__cost = "ai.analytics.cost";
+export const ai__analytics__tokens = "ai.analytics.tokens";
+export const ai__analytics__success = "ai.analytics.success";
+export const ai__analytics__failed = "ai.analytics.failed";
+export const ai__analytics__unknownModel = "ai.analytics.unknownModel";
+export const ai__analytics__tokensInOut = "ai.analytics.tokensInOut";
+export const ai__pasteInvoiceText = "ai.pasteInvoiceText";
+export const ai__previewExtraction = "ai.previewExtraction";
+export const ai__completeness = "ai.completeness";
+export const ai__vendorDetected = "ai.vendorDetected";
+export const ai__vendor = "ai.vendor";
+export const ai__customerMatch = "ai.customerMatch";
+export const ai__useCustomer = "ai.useCustomer";
+export const ai__noData = "ai.noData";
+export const ai__copyJson = "ai.copyJson";
+export const ai__downloadJson = "ai.downloadJson";
+export const ai__provideTextOrImage = "ai.provideTextOrImage";
+export const ai__fileTooLarge = "ai.fileTooLarge";
+export const ai__invoiceText = "ai.invoiceText";
+export const ai__pasteHere = "ai.pasteHere";
+export const ai__trySample = "ai.trySample";
+export const ai__provider = "ai.provider";
+export const ai__selectProvider = "ai.selectProvider";
+export const ai__model = "ai.model";
+export const ai__selectModel = "ai.selectModel";
+export const ai__enterModel = "ai.enterModel";
+export const ai__plannedMode = "ai.plannedMode";
+export const ai__steps = "ai.steps";
+export const ai__providerShort = "ai.providerShort";
+export const ai__dragDrop = "ai.dragDrop";
+export const ai__selectedFile = "ai.selectedFile";
+export const ai__pages = "ai.pages";
+export const ai__pagesPlaceholder = "ai.pagesPlaceholder";
+export const ai__pagesHelp = "ai.pagesHelp";
+export const ai__customPrompt = "ai.customPrompt";
+export const ai__promptPlaceholder = "ai.promptPlaceholder";
+export const ai__refineWithLLM = "ai.refineWithLLM";
+export const ai__consentNotice = "ai.consentNotice";
+export const ai__consentAgree = "ai.consentAgree";
+export const ai__extractFields = "ai.extractFields";
+export const ai__scanDisclaimer = "ai.scanDisclaimer";
+export const ai__complete = "ai.complete";
+export const ai__source = "ai.source";
+export const ai__current = "ai.current";
+export const ai__applyToForm = "ai.applyToForm";
+export const ai__noTrendData = "ai.noTrendData";
+export const ai__total = "ai.total";
+export const ai__accepted = "ai.accepted";
+export const ai__acc = "ai.acc";
+export const ai__max = "ai.max";
+export const ai__scanDocument = "ai.scanDocument";
+export const ai__lineItems = "ai.lineItems";
+export const ai__scanSuccess = "ai.scanSuccess";
+export const ai__scanError = "ai.scanError";
+export const ai__scanTooltip = "ai.scanTooltip";
+export const ai__smartScan = "ai.smartScan";
+export const ai__generating = "ai.generating";
+export const ai__suggest = "ai.suggest";
+export const ai__suggested = "ai.suggested";
+export const ai__accounts = "ai.accounts";
+export const ai__suggestionsReady = "ai.suggestionsReady";
+export const ai__suggestedForN = "ai.suggestedForN";
+export const ai__suggestForAll = "ai.suggestForAll";
+export const ai__scanFailed = "ai.scanFailed";
+export const ai__fieldsApplied = "ai.fieldsApplied";
+export const ai__vendorMatch = "ai.vendorMatch";
+export const ai__useSupplier = "ai.useSupplier";
+export const ai__meta = "ai.meta";
+export const ai__scanRedirect = "ai.scanRedirect";
+export const toast__titles__Contact_created = "toast.titles.Contact created";
+export const toast__titles__Error = "toast.titles.Error";
+export const toast__descriptions__New_contact_has_been_added_successfully__ = "toast.descriptions.New contact has been added successfully.";
+export const toast__descriptions__Failed_to_create_contact = "toast.descriptions.Failed to create contact";
+export const footer__terms = "footer.terms";
+export const footer__privacy = "footer.privacy";
+export const footer__disclaimer = "footer.disclaimer";
+export const footer__copyright = "footer.copyright";
+export const consentDialog__welcome = "consentDialog.welcome";
+export const consentDialog__reviewTerms = "consentDialog.reviewTerms";
+export const consentDialog__importantInfo = "consentDialog.importantInfo";
+export const consentDialog__readAndAgree = "consentDialog.readAndAgree";
+export const consentDialog__termsDesc = "consentDialog.termsDesc";
+export const consentDialog__privacyDesc = "consentDialog.privacyDesc";
+export const consentDialog__readAndUnderstand = "consentDialog.readAndUnderstand";
+export const consentDialog__disclaimerDesc = "consentDialog.disclaimerDesc";
+export const consentDialog__acceptContinue = "consentDialog.acceptContinue";
+export const consentDialog__checkAll = "consentDialog.checkAll";
+export const consentDialog__signOutSwitch = "consentDialog.signOutSwitch";
+export const consentDialog__mustAccept = "consentDialog.mustAccept";
+export const consentDialog__alertCheckAll = "consentDialog.alertCheckAll";
+export const consentDialog__softwareToolOnly = "consentDialog.softwareToolOnly";
+export const consentDialog__notSubstitute = "consentDialog.notSubstitute";
+export const consentDialog__byAccepting = "consentDialog.byAccepting";
+export const consentDialog__toolNotAdvice = "consentDialog.toolNotAdvice";
+export const consentDialog__responsibleForData = "consentDialog.responsibleForData";
+export const consentDialog__consultAccountant = "consentDialog.consultAccountant";
+export const consentDialog__limitedLiability = "consentDialog.limitedLiability";
+export const consentDialog__agreeToPrivacy = "consentDialog.agreeToPrivacy";
+export const errors__somethingWentWrong = "errors.somethingWentWrong";
+export const errors__unexpectedError = "errors.unexpectedError";
+export const ui__dialogContent = "ui.dialogContent";
+export const ui__toggleTheme = "ui.toggleTheme";
+export const ui__light = "ui.light";
+export const ui__dark = "ui.dark";
+export const ui__system = "ui.system";
+export const taxes__vat = "taxes.vat";
+export const taxes__salesTax = "taxes.salesTax";
+export const taxes__corporateTax = "taxes.corporateTax";
+export const taxes__withholding = "taxes.withholding";
+export const taxes__custom = "taxes.custom";
+export const approvals__title = "approvals.title";
+export const approvals__subtitle = "approvals.subtitle";
+export const approvals__pending = "approvals.pending";
+export const approvals__history = "approvals.history";
+export const approvals__noPending = "approvals.noPending";
+export const approvals__noPendingDesc = "approvals.noPendingDesc";
+export const approvals__requestedBy = "approvals.requestedBy";
+export const approvals__confirmApprove = "approvals.confirmApprove";
+export const approvals__confirmReject = "approvals.confirmReject";
+export const approvals__commentPrompt = "approvals.commentPrompt";
+export const approvals__commentPlaceholder = "approvals.commentPlaceholder";
+export const approvals__actionSuccess = "approvals.actionSuccess";
+export const approvals__settingsTitle = "approvals.settingsTitle";
+export const approvals__settingsSubtitle = "approvals.settingsSubtitle";
+export const approvals__addRule = "approvals.addRule";
+export const approvals__addNewRule = "approvals.addNewRule";
+export const approvals__entityType = "approvals.entityType";
+export const approvals__minAmount = "approvals.minAmount";
+export const approvals__maxAmount = "approvals.maxAmount";
+export const approvals__requiredRole = "approvals.requiredRole";
+export const approvals__activeRules = "approvals.activeRules";
+export const approvals__rulesDesc = "approvals.rulesDesc";
+export const approvals__noRules = "approvals.noRules";
+export const approvals__type = "approvals.type";
+export const approvals__threshold = "approvals.threshold";
+export const approvals__approver = "approvals.approver";
+export const approvals__ruleCreated = "approvals.ruleCreated";
+export const approvals__requests = "approvals.requests";
+export const approvals__settings = "approvals.settings";
+export const approvals__workflowCreated = "approvals.workflowCreated";
+export const approvals__workflowDeleted = "approvals.workflowDeleted";
+export const approvals__pleaseProvideName = "approvals.pleaseProvideName";
+export const approvals__workflowName = "approvals.workflowName";
+export const approvals__workflowNamePlaceholder = "approvals.workflowNamePlaceholder";
+export const approvals__purchaseOrder = "approvals.purchaseOrder";
+export const approvals__salesInvoice = "approvals.salesInvoice";
+export const approvals__triggerDescription = "approvals.triggerDescription";
+export const approvals__approvalSteps = "approvals.approvalSteps";
+export const approvals__addStep = "approvals.addStep";
+export const approvals__noWorkflows = "approvals.noWorkflows";
+export const approvals__noWorkflowsDesc = "approvals.noWorkflowsDesc";
+export const approvals__createFirst = "approvals.createFirst";
+export const approvals__above = "approvals.above";
+export const approvals__approvalChain = "approvals.approvalChain";
+export const approvals__createdOn = "approvals.createdOn";
+export const approvals__approve = "approvals.approve";
+export const shortcuts__title = "shortcuts.title";
+export const shortcuts__navigation = "shortcuts.navigation";
+export const shortcuts__actions = "shortcuts.actions";
+export const shortcuts__appearance = "shortcuts.appearance";
+export const shortcuts__general = "shortcuts.general";
+export const shortcuts__openSearch = "shortcuts.openSearch";
+export const shortcuts__goHome = "shortcuts.goHome";
+export const shortcuts__goToInvoices = "shortcuts.goToInvoices";
+export const shortcuts__goToContacts = "shortcuts.goToContacts";
+export const shortcuts__goToInventory = "shortcuts.goToInventory";
+export const shortcuts__goToExpenses = "shortcuts.goToExpenses";
+export const shortcuts__goToAccounts = "shortcuts.goToAccounts";
+export const shortcuts__goToReports = "shortcuts.goToReports";
+export const shortcuts__goToSettings = "shortcuts.goToSettings";
+export const shortcuts__newInvoice = "shortcuts.newInvoice";
+export const shortcuts__newContact = "shortcuts.newContact";
+export const shortcuts__newItem = "shortcuts.newItem";
+export const shortcuts__save = "shortcuts.save";
+export const shortcuts__print = "shortcuts.print";
+export const shortcuts__toggleTheme = "shortcuts.toggleTheme";
+export const shortcuts__toggleLanguage = "shortcuts.toggleLanguage";
+export const shortcuts__closeDialog = "shortcuts.closeDialog";
+export const shortcuts__showHelp = "shortcuts.showHelp";
+export const shortcuts__next = "shortcuts.next";
+export const shortcuts__previous = "shortcuts.previous";
+export const shortcuts__toOpenHelp = "shortcuts.toOpenHelp";
+export const shortcuts__description = "shortcuts.description";
+export const shortcuts__global = "shortcuts.global";
+export const shortcuts__pageSpecific = "shortcuts.pageSpecific";
+export const shortcuts__tip = "shortcuts.tip";
+export const commandPalette__placeholder = "commandPalette.placeholder";
+export const commandPalette__noResults = "commandPalette.noResults";
+export const commandPalette__navigation = "commandPalette.navigation";
+export const commandPalette__quickCreate = "commandPalette.quickCreate";
+export const commandPalette__reports = "commandPalette.reports";
+export const commandPalette__settings = "commandPalette.settings";
+export const commandPalette__help = "commandPalette.help";
+export const commandPalette__tip = "commandPalette.tip";
+export const commandPalette__navigate = "commandPalette.navigate";
+export const commandPalette__select = "commandPalette.select";
+export const quickActions__newInvoice = "quickActions.newInvoice";
+export const quickActions__newBill = "quickActions.newBill";
+export const quickActions__newJournal = "quickActions.newJournal";
+export const quickActions__newContact = "quickActions.newContact";
+export const quickActions__newItem = "quickActions.newItem";
+export const quickActions__newProject = "quickActions.newProject";
+export const activity__title = "activity.title";
+export const activity__recentActivity = "activity.recentActivity";
+export const activity__allActivity = "activity.allActivity";
+export const activity__loadMore = "activity.loadMore";
+export const activity__noActivity = "activity.noActivity";
+export const activity__noActivityDesc = "activity.noActivityDesc";
+export const activity__filter = "activity.filter";
+export const activity__filterByEntity = "activity.filterByEntity";
+export const activity__filterByAction = "activity.filterByAction";
+export const activity__filterByUser = "activity.filterByUser";
+export const activity__clearFilters = "activity.clearFilters";
+export const activity__today = "activity.today";
+export const activity__yesterday = "activity.yesterday";
+export const activity__thisWeek = "activity.thisWeek";
+export const activity__thisMonth = "activity.thisMonth";
+export const activity__older = "activity.older";
+export const activity__viewDetails = "activity.viewDetails";
+export const activity__created = "activity.created";
+export const activity__updated = "activity.updated";
+export const activity__deleted = "activity.deleted";
+export const activity__viewed = "activity.viewed";
+export const activity__sent = "activity.sent";
+export const activity__approved = "activity.approved";
+export const activity__rejected = "activity.rejected";
+export const activity__paid = "activity.paid";
+export const activity__commented = "activity.commented";
+export const activity__attached = "activity.attached";
+export const activity__invoice = "activity.invoice";
+export const activity__contact = "activity.contact";
+export const activity__item = "activity.item";
+export const activity__transaction = "activity.transaction";
+export const activity__order = "activity.order";
+export const activity__report = "activity.report";
+export const activity__setting = "activity.setting";
+export const activity__user = "activity.user";
+export const activity__unknown = "activity.unknown";
+export const activity__by = "activity.by";
+export const activity__at = "activity.at";
+export const activity__system = "activity.system";
+export const activity__autoActivity = "activity.autoActivity";
+export const activity__changes = "activity.changes";
+export const activity__previousValue = "activity.previousValue";
+export const activity__newValue = "activity.newValue";
+export const activity__refresh = "activity.refresh";
+export const activity__autoRefresh = "activity.autoRefresh";
+export const activity__realTime = "activity.realTime";
+export const activity__paused = "activity.paused";
+export const quickStats__monthlyRevenue = "quickStats.monthlyRevenue";
+export const quickStats__monthlyExpenses = "quickStats.monthlyExpenses";
+export const quickStats__receivables = "quickStats.receivables";
+export const quickStats__payables = "quickStats.payables";
+export const quickStats__cashBalance = "quickStats.cashBalance";
+export const quickStats__overdueAmount = "quickStats.overdueAmount";
+export const quickStats__invoicePipeline = "quickStats.invoicePipeline";
+export const quickStats__thisMonth = "quickStats.thisMonth";
+export const quickStats__draft = "quickStats.draft";
+export const quickStats__sent = "quickStats.sent";
+export const quickStats__paid = "quickStats.paid";
+export const quickStats__overdue = "quickStats.overdue";
+export const alerts__title = "alerts.title";
+export const alerts__critical = "alerts.critical";
+export const alerts__warnings = "alerts.warnings";
+export const alerts__allClear = "alerts.allClear";
+export const alerts__noActiveAlerts = "alerts.noActiveAlerts";
+export const alerts__viewAll = "alerts.viewAll";
+export const alerts__overdueInvoices = "alerts.overdueInvoices";
+export const alerts__overdueInvoicesDesc = "alerts.overdueInvoicesDesc";
+export const alerts__viewOverdue = "alerts.viewOverdue";
+export const alerts__overdueBills = "alerts.overdueBills";
+export const alerts__overdueBillsDesc = "alerts.overdueBillsDesc";
+export const alerts__viewOverdueBills = "alerts.viewOverdueBills";
+export const alerts__lowStock = "alerts.lowStock";
+export const alerts__lowStockDesc = "alerts.lowStockDesc";
+export const alerts__viewInventory = "alerts.viewInventory";
+export const alerts__upcomingPayments = "alerts.upcomingPayments";
+export const alerts__upcomingPaymentsDesc = "alerts.upcomingPaymentsDesc";
+export const alerts__viewPayments = "alerts.viewPayments";
+export const alerts__pendingApprovals = "alerts.pendingApprovals";
+export const alerts__pendingApprovalsDesc = "alerts.pendingApprovalsDesc";
+export const alerts__viewApprovals = "alerts.viewApprovals";
+export const alerts__cashFlowWarning = "alerts.cashFlowWarning";
+export const alerts__cashFlowWarningDesc = "alerts.cashFlowWarningDesc";
+export const alerts__viewCashFlow = "alerts.viewCashFlow";
+export const alerts__types__danger = "alerts.types.danger";
+export const alerts__types__warning = "alerts.types.warning";
+export const alerts__types__info = "alerts.types.info";
+export const export__title = "export.title";
+export const export__description = "export.description";
+export const export__format = "export.format";
+export const export__filename = "export.filename";
+export const export__filenamePlaceholder = "export.filenamePlaceholder";
+export const export__options = "export.options";
+export const export__includeTitle = "export.includeTitle";
+export const export__rows = "export.rows";
+export const export__columns = "export.columns";
+export const export__export = "export.export";
+export const export__exporting = "export.exporting";
+export const export__excelDesc = "export.excelDesc";
+export const export__pdfDesc = "export.pdfDesc";
+export const export__csvDesc = "export.csvDesc";
+export const bulk__selected = "bulk.selected";
+export const bulk__actions = "bulk.actions";
+export const bulk__clearSelection = "bulk.clearSelection";
+export const bulk__delete = "bulk.delete";
+export const bulk__archive = "bulk.archive";
+export const bulk__export = "bulk.export";
+export const bulk__print = "bulk.print";
+export const bulk__confirmTitle = "bulk.confirmTitle";
+export const bulk__confirmDescription = "bulk.confirmDescription";
+export const search__placeholder = "search.placeholder";
+export const search__search = "search.search";
+export const search__clear = "search.clear";
+export const search__save = "search.save";
+export const search__saveSearch = "search.saveSearch";
+export const search__saveSearchDescription = "search.saveSearchDescription";
+export const search__searchName = "search.searchName";
+export const search__searchNamePlaceholder = "search.searchNamePlaceholder";
+export const search__searchSaved = "search.searchSaved";
+export const search__filters = "search.filters";
+export const search__addFilter = "search.addFilter";
+export const search__noFilters = "search.noFilters";
+export const search__noResults = "search.noResults";
+export const search__noResultsDescription = "search.noResultsDescription";
+export const search__recentSearches = "search.recentSearches";
+export const search__savedSearches = "search.savedSearches";
+export const search__suggestions = "search.suggestions";
+export const search__suggestionOverdue = "search.suggestionOverdue";
+export const search__suggestionThisMonth = "search.suggestionThisMonth";
+export const search__toSelect = "search.toSelect";
+export const search__toNavigate = "search.toNavigate";
+export const search__selectDate = "search.selectDate";
+export const search__enterValue = "search.enterValue";
+export const search__and = "search.and";
+export const search__entities__all = "search.entities.all";
+export const search__entities__invoice = "search.entities.invoice";
+export const search__entities__contact = "search.entities.contact";
+export const search__entities__item = "search.entities.item";
+export const search__entities__expense = "search.entities.expense";
+export const search__entities__payment = "search.entities.payment";
+export const search__entities__journal = "search.entities.journal";
+export const search__fields__keyword = "search.fields.keyword";
+export const search__fields__number = "search.fields.number";
+export const search__fields__contact = "search.fields.contact";
+export const search__fields__amount = "search.fields.amount";
+export const search__fields__date = "search.fields.date";
+export const search__fields__dueDate = "search.fields.dueDate";
+export const search__fields__status = "search.fields.status";
+export const search__fields__name = "search.fields.name";
+export const search__fields__email = "search.fields.email";
+export const search__fields__phone = "search.fields.phone";
+export const search__fields__type = "search.fields.type";
+export const search__fields__balance = "search.fields.balance";
+export const search__fields__sku = "search.fields.sku";
+export const search__fields__price = "search.fields.price";
+export const search__fields__quantity = "search.fields.quantity";
+export const search__fields__category = "search.fields.category";
+export const search__fields__description = "search.fields.description";
+export const search__fields__vendor = "search.fields.vendor";
+export const search__fields__reference = "search.fields.reference";
+export const search__fields__method = "search.fields.method";
+export const search__operators__equals = "search.operators.equals";
+export const search__operators__contains = "search.operators.contains";
+export const search__operators__startsWith = "search.operators.startsWith";
+export const search__operators__endsWith = "search.operators.endsWith";
+export const search__operators__greaterThan = "search.operators.greaterThan";
+export const search__operators__lessThan = "search.operators.lessThan";
+export const search__operators__between = "search.operators.between";
+export const search__operators__isEmpty = "search.operators.isEmpty";
+export const search__operators__isNotEmpty = "search.operators.isNotEmpty";
+export const search__dateRanges__today = "search.dateRanges.today";
+export const search__dateRanges__yesterday = "search.dateRanges.yesterday";
+export const search__dateRanges__last7Days = "search.dateRanges.last7Days";
+export const search__dateRanges__last30Days = "search.dateRanges.last30Days";
+export const search__dateRanges__thisMonth = "search.dateRanges.thisMonth";
+export const search__dateRanges__lastMonth = "search.dateRanges.lastMonth";
+export const search__dateRanges__thisYear = "search.dateRanges.thisYear";
+export const search__advancedFilters = "search.advancedFilters";
+export const search__clearAll = "search.clearAll";
+export const search__applyFilters = "search.applyFilters";
+export const search__activeFilters = "search.activeFilters";
+export const search__selectOption = "search.selectOption";
+export const search__min = "search.min";
+export const search__max = "search.max";
+export const table__rowsPerPage = "table.rowsPerPage";
+export const table__pageInfo = "table.pageInfo";
+export const currency__title = "currency.title";
+export const currency__description = "currency.description";
+export const currency__lastUpdate = "currency.lastUpdate";
+export const currency__refreshRates = "currency.refreshRates";
+export const currency__ratesUpdated = "currency.ratesUpdated";
+export const currency__converter = "currency.converter";
+export const currency__from = "currency.from";
+export const currency__to = "currency.to";
+export const currency__amount = "currency.amount";
+export const currency__result = "currency.result";
+export const currency__exchangeRate = "currency.exchangeRate";
+export const currency__inverseRate = "currency.inverseRate";
+export const currency__viewHistory = "currency.viewHistory";
+export const currency__saveConversion = "currency.saveConversion";
+export const currency__conversionSaved = "currency.conversionSaved";
+export const currency__copied = "currency.copied";
+export const currency__quickRates = "currency.quickRates";
+export const currency__quickRatesDescription = "currency.quickRatesDescription";
+export const currency__conversionHistory = "currency.conversionHistory";
+export const currency__rateHistory = "currency.rateHistory";
+export const currency__last30Days = "currency.last30Days";
+export const currency__high = "currency.high";
+export const currency__low = "currency.low";
+export const currency__average = "currency.average";
+export const currency__searchCurrencies = "currency.searchCurrencies";
+export const currency__favorites = "currency.favorites";
+export const currency__regions__americas = "currency.regions.americas";
+export const currency__regions__europe = "currency.regions.europe";
+export const currency__regions__asia = "currency.regions.asia";
+export const currency__regions__middleeast = "currency.regions.middleeast";
+export const currency__regions__africa = "currency.regions.africa";
+export const currency__regions__oceania = "currency.regions.oceania";
+export const currency__regions__other = "currency.regions.other";
+export const currency__noRate = "currency.noRate";
+export const confirm__title = "confirm.title";
+export const confirm__description = "confirm.description";
+export const confirm__deleteTitle = "confirm.deleteTitle";
+export const confirm__deleteDescription = "confirm.deleteDescription";
+export const offline__message = "offline.message";
+export const offline__syncing = "offline.syncing";
+export const offline__reconnected = "offline.reconnected";
+export const autoSave__saving = "autoSave.saving";
+export const autoSave__saved = "autoSave.saved";
+export const autoSave__error = "autoSave.error";
+export const autoSave__offline = "autoSave.offline";
+export const autoSave__savedJustNow = "autoSave.savedJustNow";
+export const autoSave__savedMinutesAgo = "autoSave.savedMinutesAgo";
+export const autoSave__notSaved = "autoSave.notSaved";
+export const autoSave__foundDraft = "autoSave.foundDraft";
+export const autoSave__savedAgo = "autoSave.savedAgo";
+export const autoSave__justNow = "autoSave.justNow";
+export const autoSave__minutesAgo = "autoSave.minutesAgo";
+export const autoSave__hoursAgo = "autoSave.hoursAgo";
+export const autoSave__restore = "autoSave.restore";
+export const autoSave__discard = "autoSave.discard";
+export const autoSave__restored = "autoSave.restored";
+export const autoSave__restoredDesc = "autoSave.restoredDesc";
+export const autoSave__restoreFailed = "autoSave.restoreFailed";
+export const autoSave__restoreFailedDesc = "autoSave.restoreFailedDesc";
+export const autoSave__cleared = "autoSave.cleared";
+export const autoSave__clearedDesc = "autoSave.clearedDesc";
+export const autoSave__clickToRestore = "autoSave.clickToRestore";
+export const reminders__title = "reminders.title";
+export const reminders__description = "reminders.description";
+export const reminders__settings__autoReminders = "reminders.settings.autoReminders";
+export const reminders__settings__autoRemindersDesc = "reminders.settings.autoRemindersDesc";
+export const reminders__settings__emailNotifications = "reminders.settings.emailNotifications";
+export const reminders__settings__emailNotificationsDesc = "reminders.settings.emailNotificationsDesc";
+export const reminders__settings__excludeWeekends = "reminders.settings.excludeWeekends";
+export const reminders__settings__excludeWeekendsDesc = "reminders.settings.excludeWeekendsDesc";
+export const reminders__settings__maxReminders = "reminders.settings.maxReminders";
+export const reminders__settings__reminders = "reminders.settings.reminders";
+export const reminders__settings__unlimited = "reminders.settings.unlimited";
+export const reminders__sendBulk = "reminders.sendBulk";
+export const reminders__stats__overdueInvoices = "reminders.stats.overdueInvoices";
+export const reminders__stats__totalAmount = "reminders.stats.totalAmount";
+export const reminders__stats__avgDaysOverdue = "reminders.stats.avgDaysOverdue";
+export const reminders__stats__sentToday = "reminders.stats.sentToday";
+export const reminders__tabs__overview = "reminders.tabs.overview";
+export const reminders__tabs__rules = "reminders.tabs.rules";
+export const reminders__tabs__history = "reminders.tabs.history";
+export const reminders__tabs__settings = "reminders.tabs.settings";
+export const reminders__overdueInvoices = "reminders.overdueInvoices";
+export const reminders__overdueInvoicesDesc = "reminders.overdueInvoicesDesc";
+export const reminders__noOverdue = "reminders.noOverdue";
+export const reminders__noOverdueDesc = "reminders.noOverdueDesc";
+export const reminders__daysOverdue = "reminders.daysOverdue";
+export const reminders__remindersSent = "reminders.remindersSent";
+export const reminders__reminderRules = "reminders.reminderRules";
+export const reminders__reminderRulesDesc = "reminders.reminderRulesDesc";
+export const reminders__addRule = "reminders.addRule";
+export const reminders__editRule = "reminders.editRule";
+export const reminders__ruleDialogDesc = "reminders.ruleDialogDesc";
+export const reminders__ruleName = "reminders.ruleName";
+export const reminders__ruleNamePlaceholder = "reminders.ruleNamePlaceholder";
+export const reminders__onDueDate = "reminders.onDueDate";
+export const reminders__daysBefore = "reminders.daysBefore";
+export const reminders__daysAfter = "reminders.daysAfter";
+export const reminders__beforeDue = "reminders.beforeDue";
+export const reminders__afterDue = "reminders.afterDue";
+export const reminders__timing = "reminders.timing";
+export const reminders__frequency__label = "reminders.frequency.label";
+export const reminders__frequency__once = "reminders.frequency.once";
+export const reminders__frequency__daily = "reminders.frequency.daily";
+export const reminders__frequency__weekly = "reminders.frequency.weekly";
+export const reminders__channels__label = "reminders.channels.label";
+export const reminders__channels__email = "reminders.channels.email";
+export const reminders__channels__notification = "reminders.channels.notification";
+export const reminders__channels__sms = "reminders.channels.sms";
+export const reminders__reminderHistory = "reminders.reminderHistory";
+export const reminders__reminderHistoryDesc = "reminders.reminderHistoryDesc";
+export const reminders__noHistory = "reminders.noHistory";
+export const reminders__noHistoryDesc = "reminders.noHistoryDesc";
+export const reminders__channel = "reminders.channel";
+export const reminders__status__sent = "reminders.status.sent";
+export const reminders__status__failed = "reminders.status.failed";
+export const reminders__status__pending = "reminders.status.pending";
+export const reminders__reminderSent = "reminders.reminderSent";
+export const reminders__reminderSentTo = "reminders.reminderSentTo";
+export const reminders__reminderFailed = "reminders.reminderFailed";
+export const reminders__reminderFailedDesc = "reminders.reminderFailedDesc";
+export const reminders__settingsTitle = "reminders.settingsTitle";
+export const reminders__settingsDesc = "reminders.settingsDesc";
+export const enhancedTable__columns = "enhancedTable.columns";
+export const enhancedTable__selectedCount = "enhancedTable.selectedCount";
+export const enhancedTable__totalCount = "enhancedTable.totalCount";
+export const enhancedTable__pinLeft = "enhancedTable.pinLeft";
+export const enhancedTable__pinRight = "enhancedTable.pinRight";
+export const enhancedTable__unpin = "enhancedTable.unpin";
+export const enhancedTable__hideColumn = "enhancedTable.hideColumn";
+export const email__sendInvoice = "email.sendInvoice";
+export const email__sendInvoiceDescription = "email.sendInvoiceDescription";
+export const email__sendEmail = "email.sendEmail";
+export const email__to = "email.to";
+export const email__toPlaceholder = "email.toPlaceholder";
+export const email__cc = "email.cc";
+export const email__subject = "email.subject";
+export const email__subjectPlaceholder = "email.subjectPlaceholder";
+export const email__message = "email.message";
+export const email__messagePlaceholder = "email.messagePlaceholder";
+export const email__customMessage = "email.customMessage";
+export const email__customMessagePlaceholder = "email.customMessagePlaceholder";
+export const email__send = "email.send";
+export const email__sending = "email.sending";
+export const email__success = "email.success";
+export const email__sendSuccess = "email.sendSuccess";
+export const email__sendFailed = "email.sendFailed";
+export const email__invoiceSentTo = "email.invoiceSentTo";
+export const email__reminderSuccess = "email.reminderSuccess";
+export const email__reminderSentTo = "email.reminderSentTo";
+export const email__sendReminder = "email.sendReminder";
+export const email__unknownError = "email.unknownError";
+export const email__error = "email.error";
+export const email__notConfigured = "email.notConfigured";
+export const email__invoiceSubjectDefault = "email.invoiceSubjectDefault";
+export const email__invoiceMessageDefault = "email.invoiceMessageDefault";
+export const select__placeholder = "select.placeholder";
+export const select__search = "select.search";
+export const select__noResults = "select.noResults";
+export const select__selected = "select.selected";
+export const select__clearAll = "select.clearAll";
+export const upload__dragOrClick = "upload.dragOrClick";
+export const upload__dropHere = "upload.dropHere";
+export const upload__maxSize = "upload.maxSize";
+export const upload__maxFiles = "upload.maxFiles";
+export const upload__filesCount = "upload.filesCount";
+export const upload__uploadAll = "upload.uploadAll";
+export const upload__clearAll = "upload.clearAll";
+export const upload__fileTooLarge = "upload.fileTooLarge";
+export const upload__invalidType = "upload.invalidType";
+export const wizard__previous = "wizard.previous";
+export const wizard__next = "wizard.next";
+export const wizard__complete = "wizard.complete";
+export const wizard__submitting = "wizard.submitting";
+export const wizard__stepOf = "wizard.stepOf";
+export const analytics__previousPeriod = "analytics.previousPeriod";
+export const analytics__today = "analytics.today";
+export const analytics__7days = "analytics.7days";
+export const analytics__30days = "analytics.30days";
+export const analytics__90days = "analytics.90days";
+export const analytics__1year = "analytics.1year";
+export const preview__loadError = "preview.loadError";
+export const preview__downloadInstead = "preview.downloadInstead";
+export const preview__download = "preview.download";
+export const preview__unsupportedFormat = "preview.unsupportedFormat";
+export const empty__noResults = "empty.noResults";
+export const empty__noResultsFor = "empty.noResultsFor";
+export const empty__tryDifferentSearch = "empty.tryDifferentSearch";
+export const empty__clearSearch = "empty.clearSearch";
+export const empty__noInvoices = "empty.noInvoices";
+export const empty__noInvoicesDesc = "empty.noInvoicesDesc";
+export const empty__createInvoice = "empty.createInvoice";
+export const empty__noContacts = "empty.noContacts";
+export const empty__noContactsDesc = "empty.noContactsDesc";
+export const empty__addContact = "empty.addContact";
+export const empty__noItems = "empty.noItems";
+export const empty__noItemsDesc = "empty.noItemsDesc";
+export const empty__addItem = "empty.addItem";
+export const empty__noTransactions = "empty.noTransactions";
+export const empty__noTransactionsDesc = "empty.noTransactionsDesc";
+export const empty__addTransaction = "empty.addTransaction";
+export const empty__noOrders = "empty.noOrders";
+export const empty__noOrdersDesc = "empty.noOrdersDesc";
+export const empty__createOrder = "empty.createOrder";
+export const empty__noReports = "empty.noReports";
+export const empty__noReportsDesc = "empty.noReportsDesc";
+export const empty__generateReport = "empty.generateReport";
+export const payment__paid = "payment.paid";
+export const payment__partial = "payment.partial";
+export const payment__unpaid = "payment.unpaid";
+export const payment__remaining = "payment.remaining";
+export const notes__title = "notes.title";
+export const notes__addNote = "notes.addNote";
+export const notes__placeholder = "notes.placeholder";
+export const notes__pin = "notes.pin";
+export const notes__unpin = "notes.unpin";
+export const notes__delete = "notes.delete";
+export const notes__edit = "notes.edit";
+export const notes__reply = "notes.reply";
+export const notes__cancel = "notes.cancel";
+export const notes__save = "notes.save";
+export const notes__mentions = "notes.mentions";
+export const notes__attachments = "notes.attachments";
+export const notes__tags = "notes.tags";
+export const notes__addTag = "notes.addTag";
+export const notes__pinnedNotes = "notes.pinnedNotes";
+export const notes__allNotes = "notes.allNotes";
+export const notes__noNotes = "notes.noNotes";
+export const notes__noNotesDesc = "notes.noNotesDesc";
+export const notes__deleteConfirm = "notes.deleteConfirm";
+export const notes__created = "notes.created";
+export const notes__updated = "notes.updated";
+export const notes__deleted = "notes.deleted";
+export const notes__pinned = "notes.pinned";
+export const notes__unpinned = "notes.unpinned";
+export const notes__replyTo = "notes.replyTo";
+export const notes__viewReplies = "notes.viewReplies";
+export const notes__hideReplies = "notes.hideReplies";
+export const notes__attachFile = "notes.attachFile";
+export const notes__uploadingFile = "notes.uploadingFile";
+export const notes__fileUploaded = "notes.fileUploaded";
+export const notes__removeAttachment = "notes.removeAttachment";
+export const notes__mentionUser = "notes.mentionUser";
+export const notes__internal = "notes.internal";
+export const notes__internalDesc = "notes.internalDesc";
+export const notes__lastEdited = "notes.lastEdited";
+export const bulkImport__import = "bulkImport.import";
+export const bulkImport__title = "bulkImport.title";
+export const bulkImport__description = "bulkImport.description";
+export const bulkImport__entityType = "bulkImport.entityType";
+export const bulkImport__entities__contacts = "bulkImport.entities.contacts";
+export const bulkImport__entities__items = "bulkImport.entities.items";
+export const bulkImport__entities__invoices = "bulkImport.entities.invoices";
+export const bulkImport__entities__transactions = "bulkImport.entities.transactions";
+export const bulkImport__entities__accounts = "bulkImport.entities.accounts";
+export const bulkImport__entities__journalEntries = "bulkImport.entities.journalEntries";
+export const bulkImport__downloadTemplate = "bulkImport.downloadTemplate";
+export const bulkImport__dropzone = "bulkImport.dropzone";
+export const bulkImport__supportedFormats = "bulkImport.supportedFormats";
+export const bulkImport__invalidFileType = "bulkImport.invalidFileType";
+export const bulkImport__help = "bulkImport.help";
+export const bulkImport__helpTitle = "bulkImport.helpTitle";
+export const bulkImport__helpText1 = "bulkImport.helpText1";
+export const bulkImport__helpText2 = "bulkImport.helpText2";
+export const bulkImport__helpText3 = "bulkImport.helpText3";
+export const bulkImport__helpText4 = "bulkImport.helpText4";
+export const bulkImport__fileLoaded = "bulkImport.fileLoaded";
+export const bulkImport__rowsFound = "bulkImport.rowsFound";
+export const bulkImport__mapColumns = "bulkImport.mapColumns";
+export const bulkImport__skipColumn = "bulkImport.skipColumn";
+export const bulkImport__continue = "bulkImport.continue";
+export const bulkImport__valid = "bulkImport.valid";
+export const bulkImport__invalid = "bulkImport.invalid";
+export const bulkImport__selectAll = "bulkImport.selectAll";
+export const bulkImport__status = "bulkImport.status";
+export const bulkImport__errors = "bulkImport.errors";
+export const bulkImport__showingFirst = "bulkImport.showingFirst";
+export const bulkImport__importing = "bulkImport.importing";
+export const bulkImport__importComplete = "bulkImport.importComplete";
+export const bulkImport__importSummary = "bulkImport.importSummary";
+export const bulkImport__someErrors = "bulkImport.someErrors";
+export const bulkImport__andMore = "bulkImport.andMore";
+export const bulkImport__importSelected = "bulkImport.importSelected";
+export const bulkImport__parseError = "bulkImport.parseError";
+export const bulkImport__invalidDate = "bulkImport.invalidDate";
+export const bulkImport__invalidNumber = "bulkImport.invalidNumber";
+export const bulkImport__requiredField = "bulkImport.requiredField";
+export const bulkImport__templateDownloaded = "bulkImport.templateDownloaded";
+export const bulkImport__templateDescription = "bulkImport.templateDescription";
+export const bulkExport__export = "bulkExport.export";
+export const bulkExport__title = "bulkExport.title";
+export const bulkExport__description = "bulkExport.description";
+export const bulkExport__entityType = "bulkExport.entityType";
+export const bulkExport__format = "bulkExport.format";
+export const bulkExport__selectFields = "bulkExport.selectFields";
+export const bulkExport__exporting = "bulkExport.exporting";
+export const bulkExport__exportComplete = "bulkExport.exportComplete";
+export const bulkExport__exportSuccess = "bulkExport.exportSuccess";
+export const bulkExport__exportFailed = "bulkExport.exportFailed";
+export const recurring__title = "recurring.title";
+export const recurring__description = "recurring.description";
+export const recurring__add = "recurring.add";
+export const recurring__addTitle = "recurring.addTitle";
+export const recurring__addDescription = "recurring.addDescription";
+export const recurring__editTitle = "recurring.editTitle";
+export const recurring__editDescription = "recurring.editDescription";
+export const recurring__copy = "recurring.copy";
+export const recurring__stats__active = "recurring.stats.active";
+export const recurring__stats__paused = "recurring.stats.paused";
+export const recurring__stats__total = "recurring.stats.total";
+export const recurring__stats__monthlyTotal = "recurring.stats.monthlyTotal";
+export const recurring__upcomingTitle = "recurring.upcomingTitle";
+export const recurring__upcomingDesc = "recurring.upcomingDesc";
+export const recurring__filterStatus = "recurring.filterStatus";
+export const recurring__filterType = "recurring.filterType";
+export const recurring__allStatuses = "recurring.allStatuses";
+export const recurring__allTypes = "recurring.allTypes";
+export const recurring__status__active = "recurring.status.active";
+export const recurring__status__paused = "recurring.status.paused";
+export const recurring__status__completed = "recurring.status.completed";
+export const recurring__status__cancelled = "recurring.status.cancelled";
+export const recurring__type__invoice = "recurring.type.invoice";
+export const recurring__type__expense = "recurring.type.expense";
+export const recurring__type__payment = "recurring.type.payment";
+export const recurring__type__journalEntry = "recurring.type.journalEntry";
+export const recurring__type__transfer = "recurring.type.transfer";
+export const recurring__frequency__daily = "recurring.frequency.daily";
+export const recurring__frequency__weekly = "recurring.frequency.weekly";
+export const recurring__frequency__biweekly = "recurring.frequency.biweekly";
+export const recurring__frequency__monthly = "recurring.frequency.monthly";
+export const recurring__frequency__quarterly = "recurring.frequency.quarterly";
+export const recurring__frequency__yearly = "recurring.frequency.yearly";
+export const recurring__table__name = "recurring.table.name";
+export const recurring__table__type = "recurring.table.type";
+export const recurring__table__amount = "recurring.table.amount";
+export const recurring__table__frequency = "recurring.table.frequency";
+export const recurring__table__nextRun = "recurring.table.nextRun";
+export const recurring__table__status = "recurring.table.status";
+export const recurring__runNow = "recurring.runNow";
+export const recurring__viewHistory = "recurring.viewHistory";
+export const recurring__pause = "recurring.pause";
+export const recurring__activate = "recurring.activate";
+export const recurring__edit = "recurring.edit";
+export const recurring__duplicate = "recurring.duplicate";
+export const recurring__delete = "recurring.delete";
+export const recurring__noRecurring = "recurring.noRecurring";
+export const recurring__noRecurringDesc = "recurring.noRecurringDesc";
+export const recurring__startDate = "recurring.startDate";
+export const recurring__lastRun = "recurring.lastRun";
+export const recurring__runCount = "recurring.runCount";
+export const recurring__contact = "recurring.contact";
+export const recurring__category = "recurring.category";
+export const recurring__form__name = "recurring.form.name";
+export const recurring__form__namePlaceholder = "recurring.form.namePlaceholder";
+export const recurring__form__type = "recurring.form.type";
+export const recurring__form__amount = "recurring.form.amount";
+export const recurring__form__frequency = "recurring.form.frequency";
+export const recurring__form__startDate = "recurring.form.startDate";
+export const recurring__form__endDate = "recurring.form.endDate";
+export const recurring__form__dayOfMonth = "recurring.form.dayOfMonth";
+export const recurring__form__dayOfWeek = "recurring.form.dayOfWeek";
+export const recurring__form__description = "recurring.form.description";
+export const recurring__form__descriptionPlaceholder = "recurring.form.descriptionPlaceholder";
+export const recurring__form__autoApprove = "recurring.form.autoApprove";
+export const recurring__form__autoApproveDesc = "recurring.form.autoApproveDesc";
+export const recurring__lastDayOfMonth = "recurring.lastDayOfMonth";
+export const recurring__days__sunday = "recurring.days.sunday";
+export const recurring__days__monday = "recurring.days.monday";
+export const recurring__days__tuesday = "recurring.days.tuesday";
+export const recurring__days__wednesday = "recurring.days.wednesday";
+export const recurring__days__thursday = "recurring.days.thursday";
+export const recurring__days__friday = "recurring.days.friday";
+export const recurring__days__saturday = "recurring.days.saturday";
+export const recurring__save = "recurring.save";
+export const recurring__create = "recurring.create";
+export const recurring__deleteTitle = "recurring.deleteTitle";
+export const recurring__deleteDescription = "recurring.deleteDescription";
+export const recurring__confirmDelete = "recurring.confirmDelete";
+export const recurring__historyTitle = "recurring.historyTitle";
+export const recurring__historyDescription = "recurring.historyDescription";
+export const recurring__history__date = "recurring.history.date";
+export const recurring__history__amount = "recurring.history.amount";
+export const recurring__history__status = "recurring.history.status";
+export const recurring__history__transaction = "recurring.history.transaction";
+export const recurring__history__success = "recurring.history.success";
+export const recurring__history__failed = "recurring.history.failed";
+export const recurring__history__skipped = "recurring.history.skipped";
+export const recurring__noHistory = "recurring.noHistory";
+export const recurring__created = "recurring.created";
+export const recurring__updated = "recurring.updated";
+export const recurring__deleted = "recurring.deleted";
+export const recurring__activated = "recurring.activated";
+export const recurring__paused = "recurring.paused";
+export const recurring__runSuccess = "recurring.runSuccess";
+export const recurring__runError = "recurring.runError";
+export const recurring__createError = "recurring.createError";
+export const recurring__updateError = "recurring.updateError";
+export const recurring__deleteError = "recurring.deleteError";
+export const scanner__scanDocument = "scanner.scanDocument";
+export const scanner__title = "scanner.title";
+export const scanner__description = "scanner.description";
+export const scanner__uploadTab = "scanner.uploadTab";
+export const scanner__cameraTab = "scanner.cameraTab";
+export const scanner__dropzone = "scanner.dropzone";
+export const scanner__supportedFormats = "scanner.supportedFormats";
+export const scanner__invalidFileType = "scanner.invalidFileType";
+export const scanner__documentType = "scanner.documentType";
+export const scanner__types__invoice = "scanner.types.invoice";
+export const scanner__types__receipt = "scanner.types.receipt";
+export const scanner__types__bill = "scanner.types.bill";
+export const scanner__types__contract = "scanner.types.contract";
+export const scanner__types__id_card = "scanner.types.id_card";
+export const scanner__types__business_card = "scanner.types.business_card";
+export const scanner__types__other = "scanner.types.other";
+export const scanner__imageAdjustments = "scanner.imageAdjustments";
+export const scanner__rotateLeft = "scanner.rotateLeft";
+export const scanner__rotateRight = "scanner.rotateRight";
+export const scanner__zoomIn = "scanner.zoomIn";
+export const scanner__zoomOut = "scanner.zoomOut";
+export const scanner__reset = "scanner.reset";
+export const scanner__brightness = "scanner.brightness";
+export const scanner__contrast = "scanner.contrast";
+export const scanner__extractData = "scanner.extractData";
+export const scanner__processing = "scanner.processing";
+export const scanner__startCamera = "scanner.startCamera";
+export const scanner__capture = "scanner.capture";
+export const scanner__cameraError = "scanner.cameraError";
+export const scanner__cameraPermission = "scanner.cameraPermission";
+export const scanner__steps__preparing = "scanner.steps.preparing";
+export const scanner__steps__preprocessing = "scanner.steps.preprocessing";
+export const scanner__steps__extractingText = "scanner.steps.extractingText";
+export const scanner__steps__analyzingFields = "scanner.steps.analyzingFields";
+export const scanner__steps__validating = "scanner.steps.validating";
+export const scanner__steps__complete = "scanner.steps.complete";
+export const scanner__processComplete = "scanner.processComplete";
+export const scanner__fieldsExtracted = "scanner.fieldsExtracted";
+export const scanner__processError = "scanner.processError";
+export const scanner__scannedDocument = "scanner.scannedDocument";
+export const scanner__extractedText = "scanner.extractedText";
+export const scanner__extractedFields = "scanner.extractedFields";
+export const scanner__fieldsFound = "scanner.fieldsFound";
+export const scanner__copy = "scanner.copy";
+export const scanner__copied = "scanner.copied";
+export const scanner__scanAnother = "scanner.scanAnother";
+export const scanner__useData = "scanner.useData";
+export const scanner__dataSaved = "scanner.dataSaved";
+export const scanner__fields__vendorName = "scanner.fields.vendorName";
+export const scanner__fields__vendorAddress = "scanner.fields.vendorAddress";
+export const scanner__fields__vendorEmail = "scanner.fields.vendorEmail";
+export const scanner__fields__vendorPhone = "scanner.fields.vendorPhone";
+export const scanner__fields__invoiceNumber = "scanner.fields.invoiceNumber";
+export const scanner__fields__invoiceDate = "scanner.fields.invoiceDate";
+export const scanner__fields__dueDate = "scanner.fields.dueDate";
+export const scanner__fields__customerName = "scanner.fields.customerName";
+export const scanner__fields__subtotal = "scanner.fields.subtotal";
+export const scanner__fields__taxAmount = "scanner.fields.taxAmount";
+export const scanner__fields__totalAmount = "scanner.fields.totalAmount";
+export const scanner__fields__currency = "scanner.fields.currency";
+export const scanner__fields__date = "scanner.fields.date";
+export const scanner__fields__paymentMethod = "scanner.fields.paymentMethod";
+export const scanner__fields__accountNumber = "scanner.fields.accountNumber";
+export const scanner__fields__name = "scanner.fields.name";
+export const scanner__fields__title = "scanner.fields.title";
+export const scanner__fields__company = "scanner.fields.company";
+export const scanner__fields__email = "scanner.fields.email";
+export const scanner__fields__phone = "scanner.fields.phone";
+export const scanner__fields__website = "scanner.fields.website";
+export const scanner__fields__address = "scanner.fields.address";
+export const audit__title = "audit.title";
+export const audit__description = "audit.description";
+export const audit__searchPlaceholder = "audit.searchPlaceholder";
+export const audit__noLogs = "audit.noLogs";
+export const audit__noLogsDescription = "audit.noLogsDescription";
+export const audit__export = "audit.export";
+export const audit__exportAs = "audit.exportAs";
+export const audit__exportSuccess = "audit.exportSuccess";
+export const audit__exportedAs = "audit.exportedAs";
+export const audit__refresh = "audit.refresh";
+export const audit__clearFilters = "audit.clearFilters";
+export const audit__viewDetails = "audit.viewDetails";
+export const audit__logDetails = "audit.logDetails";
+export const audit__showFilters = "audit.showFilters";
+export const audit__hideFilters = "audit.hideFilters";
+export const audit__totalLogs = "audit.totalLogs";
+export const audit__filtered = "audit.filtered";
+export const audit__showing = "audit.showing";
+export const audit__filters__title = "audit.filters.title";
+export const audit__filters__action = "audit.filters.action";
+export const audit__filters__entity = "audit.filters.entity";
+export const audit__filters__user = "audit.filters.user";
+export const audit__filters__dateRange = "audit.filters.dateRange";
+export const audit__filters__allActions = "audit.filters.allActions";
+export const audit__filters__allEntities = "audit.filters.allEntities";
+export const audit__filters__allUsers = "audit.filters.allUsers";
+export const audit__filters__today = "audit.filters.today";
+export const audit__filters__yesterday = "audit.filters.yesterday";
+export const audit__filters__last7Days = "audit.filters.last7Days";
+export const audit__filters__last30Days = "audit.filters.last30Days";
+export const audit__filters__thisMonth = "audit.filters.thisMonth";
+export const audit__filters__custom = "audit.filters.custom";
+export const audit__actions__create = "audit.actions.create";
+export const audit__actions__update = "audit.actions.update";
+export const audit__actions__delete = "audit.actions.delete";
+export const audit__actions__view = "audit.actions.view";
+export const audit__actions__export = "audit.actions.export";
+export const audit__actions__import = "audit.actions.import";
+export const audit__actions__login = "audit.actions.login";
+export const audit__actions__logout = "audit.actions.logout";
+export const audit__actions__approve = "audit.actions.approve";
+export const audit__actions__reject = "audit.actions.reject";
+export const audit__actions__send = "audit.actions.send";
+export const audit__actions__archive = "audit.actions.archive";
+export const audit__actions__restore = "audit.actions.restore";
+export const audit__entities__invoice = "audit.entities.invoice";
+export const audit__entities__contact = "audit.entities.contact";
+export const audit__entities__item = "audit.entities.item";
+export const audit__entities__expense = "audit.entities.expense";
+export const audit__entities__payment = "audit.entities.payment";
+export const audit__entities__journal = "audit.entities.journal";
+export const audit__entities__account = "audit.entities.account";
+export const audit__entities__user = "audit.entities.user";
+export const audit__entities__settings = "audit.entities.settings";
+export const audit__entities__report = "audit.entities.report";
+export const audit__entities__bank = "audit.entities.bank";
+export const audit__fields__timestamp = "audit.fields.timestamp";
+export const audit__fields__user = "audit.fields.user";
+export const audit__fields__action = "audit.fields.action";
+export const audit__fields__entity = "audit.fields.entity";
+export const audit__fields__entityId = "audit.fields.entityId";
+export const audit__fields__ipAddress = "audit.fields.ipAddress";
+export const audit__fields__userAgent = "audit.fields.userAgent";
+export const audit__fields__changes = "audit.fields.changes";
+export const audit__fields__oldValue = "audit.fields.oldValue";
+export const audit__fields__newValue = "audit.fields.newValue";
+export const audit__fields__field = "audit.fields.field";
+export const audit__stats__todayLogs = "audit.stats.todayLogs";
+export const audit__stats__thisWeek = "audit.stats.thisWeek";
+export const audit__stats__activeUsers = "audit.stats.activeUsers";
+export const audit__stats__mostCommon = "audit.stats.mostCommon";
+export const templates__title = "templates.title";
+export const templates__description = "templates.description";
+export const templates__searchPlaceholder = "templates.searchPlaceholder";
+export const templates__all = "templates.all";
+export const templates__preview = "templates.preview";
+export const templates__previewDescription = "templates.previewDescription";
+export const templates__customize = "templates.customize";
+export const templates__customizeTemplate = "templates.customizeTemplate";
+export const templates__customizeDescription = "templates.customizeDescription";
+export const templates__apply = "templates.apply";
+export const templates__useTemplate = "templates.useTemplate";
+export const templates__templateApplied = "templates.templateApplied";
+export const templates__premium = "templates.premium";
+export const templates__default = "templates.default";
+export const templates__noTemplates = "templates.noTemplates";
+export const templates__noTemplatesDescription = "templates.noTemplatesDescription";
+export const templates__categories__professional = "templates.categories.professional";
+export const templates__categories__modern = "templates.categories.modern";
+export const templates__categories__creative = "templates.categories.creative";
+export const templates__categories__minimal = "templates.categories.minimal";
+export const templates__categories__classic = "templates.categories.classic";
+export const templates__categories__industry = "templates.categories.industry";
+export const templates__colors = "templates.colors";
+export const templates__typography = "templates.typography";
+export const templates__layout = "templates.layout";
+export const templates__elements = "templates.elements";
+export const templates__colorScheme = "templates.colorScheme";
+export const templates__colorSchemes__blue = "templates.colorSchemes.blue";
+export const templates__colorSchemes__green = "templates.colorSchemes.green";
+export const templates__colorSchemes__purple = "templates.colorSchemes.purple";
+export const templates__colorSchemes__red = "templates.colorSchemes.red";
+export const templates__colorSchemes__gray = "templates.colorSchemes.gray";
+export const templates__colorSchemes__custom = "templates.colorSchemes.custom";
+export const templates__primaryColor = "templates.primaryColor";
+export const templates__secondaryColor = "templates.secondaryColor";
+export const templates__accentColor = "templates.accentColor";
+export const templates__fontFamily = "templates.fontFamily";
+export const templates__fontSize = "templates.fontSize";
+export const templates__paperSize = "templates.paperSize";
+export const templates__margins = "templates.margins";
+export const templates__logoPosition = "templates.logoPosition";
+export const templates__left = "templates.left";
+export const templates__center = "templates.center";
+export const templates__right = "templates.right";
+export const templates__showLogo = "templates.showLogo";
+export const templates__showWatermark = "templates.showWatermark";
+export const templates__showPaymentTerms = "templates.showPaymentTerms";
+export const templates__showNotes = "templates.showNotes";
+export const templates__showBankDetails = "templates.showBankDetails";
+export const templates__showSignature = "templates.showSignature";
+export const templates__resetDefaults = "templates.resetDefaults";
+export const templates__customizationSaved = "templates.customizationSaved";
+export const visualization__title = "visualization.title";
+export const visualization__description = "visualization.description";
+export const visualization__lastUpdate = "visualization.lastUpdate";
+export const visualization__refreshed = "visualization.refreshed";
+export const visualization__exported = "visualization.exported";
+export const visualization__expand = "visualization.expand";
+export const visualization__download = "visualization.download";
+export const visualization__exportAs = "visualization.exportAs";
+export const visualization__settings = "visualization.settings";
+export const visualization__colorPalette = "visualization.colorPalette";
+export const visualization__ranges__7d = "visualization.ranges.7d";
+export const visualization__ranges__30d = "visualization.ranges.30d";
+export const visualization__ranges__90d = "visualization.ranges.90d";
+export const visualization__ranges__ytd = "visualization.ranges.ytd";
+export const visualization__ranges__1y = "visualization.ranges.1y";
+export const visualization__palettes__default = "visualization.palettes.default";
+export const visualization__palettes__warm = "visualization.palettes.warm";
+export const visualization__palettes__cool = "visualization.palettes.cool";
+export const visualization__palettes__mono = "visualization.palettes.mono";
+export const visualization__palettes__rainbow = "visualization.palettes.rainbow";
+export const visualization__charts__revenueTrend = "visualization.charts.revenueTrend";
+export const visualization__charts__expenseBreakdown = "visualization.charts.expenseBreakdown";
+export const visualization__charts__cashFlow = "visualization.charts.cashFlow";
+export const visualization__charts__invoiceStatus = "visualization.charts.invoiceStatus";
+export const visualization__charts__collectionRate = "visualization.charts.collectionRate";
+export const visualization__charts__salesFunnel = "visualization.charts.salesFunnel";
+export const badges__ai = "badges.ai";
+export const help__userGuide = "help.userGuide";
+export const zatca__short = "zatca.short";
+export const fixedAssets__title = "fixedAssets.title";
+export const fixedAssets__description = "fixedAssets.description";
+export const fixedAssets__newAsset = "fixedAssets.newAsset";
+export const fixedAssets__registerAsset = "fixedAssets.registerAsset";
+export const fixedAssets__enterDetails = "fixedAssets.enterDetails";
+export const fixedAssets__assetNamePlaceholder = "fixedAssets.assetNamePlaceholder";
+export const fixedAssets__acquisitionCost = "fixedAssets.acquisitionCost";
+export const fixedAssets__acquisitionDate = "fixedAssets.acquisitionDate";
+export const fixedAssets__usefulLifeYears = "fixedAssets.usefulLifeYears";
+export const fixedAssets__salvageValue = "fixedAssets.salvageValue";
+export const fixedAssets__depreciationMethod = "fixedAssets.depreciationMethod";
+export const fixedAssets__straightLine = "fixedAssets.straightLine";
+export const fixedAssets__decliningBalance = "fixedAssets.decliningBalance";
+export const fixedAssets__assetAccount = "fixedAssets.assetAccount";
+export const fixedAssets__selectAssetAccount = "fixedAssets.selectAssetAccount";
+export const fixedAssets__accumulatedDepreciationAccount = "fixedAssets.accumulatedDepreciationAccount";
+export const fixedAssets__selectContraAccount = "fixedAssets.selectContraAccount";
+export const fixedAssets__depreciationExpenseAccount = "fixedAssets.depreciationExpenseAccount";
+export const fixedAssets__selectExpenseAccount = "fixedAssets.selectExpenseAccount";
+export const fixedAssets__createAsset = "fixedAssets.createAsset";
+export const fixedAssets__postDepreciation = "fixedAssets.postDepreciation";
+export const fixedAssets__calculateDescription = "fixedAssets.calculateDescription";
+export const fixedAssets__depreciationDate = "fixedAssets.depreciationDate";
+export const fixedAssets__posting = "fixedAssets.posting";
+export const fixedAssets__assetRegistry = "fixedAssets.assetRegistry";
+export const fixedAssets__acquired = "fixedAssets.acquired";
+export const fixedAssets__bookValue = "fixedAssets.bookValue";
+export const fixedAssets__disposed = "fixedAssets.disposed";
+export const checks__createSuccess = "checks.createSuccess";
+export const checks__statusUpdateSuccess = "checks.statusUpdateSuccess";
+export const checks__extractSuccess = "checks.extractSuccess";
+export const checks__extractFailed = "checks.extractFailed";
+export const checks__title = "checks.title";
+export const checks__subtitle = "checks.subtitle";
+export const checks__scanning = "checks.scanning";
+export const checks__scanCheck = "checks.scanCheck";
+export const checks__add = "checks.add";
+export const checks__addReceivable = "checks.addReceivable";
+export const checks__addPayable = "checks.addPayable";
+export const checks__bankName = "checks.bankName";
+export const checks__issueDate = "checks.issueDate";
+export const checks__dueDate = "checks.dueDate";
+export const checks__receivable = "checks.receivable";
+export const checks__payable = "checks.payable";
+export const checks__bank = "checks.bank";
+export const checks__noChecks = "checks.noChecks";
+export const checks__markDeposited = "checks.markDeposited";
+export const checks__markCleared = "checks.markCleared";
+export const manufacturing__bomCreateSuccess = "manufacturing.bomCreateSuccess";
+export const manufacturing__bomUpdateSuccess = "manufacturing.bomUpdateSuccess";
+export const manufacturing__boms = "manufacturing.boms";
+export const manufacturing__addBom = "manufacturing.addBom";
+export const manufacturing__editBom = "manufacturing.editBom";
+export const manufacturing__bomName = "manufacturing.bomName";
+export const manufacturing__version = "manufacturing.version";
+export const manufacturing__finishedGood = "manufacturing.finishedGood";
+export const manufacturing__laborCost = "manufacturing.laborCost";
+export const manufacturing__overheadCost = "manufacturing.overheadCost";
+export const manufacturing__name = "manufacturing.name";
+export const manufacturing__noBoms = "manufacturing.noBoms";
+export const manufacturing__orderCreateSuccess = "manufacturing.orderCreateSuccess";
+export const manufacturing__orderUpdateSuccess = "manufacturing.orderUpdateSuccess";
+export const manufacturing__orderCompleteSuccess = "manufacturing.orderCompleteSuccess";
+export const manufacturing__orders = "manufacturing.orders";
+export const manufacturing__addOrder = "manufacturing.addOrder";
+export const manufacturing__editOrder = "manufacturing.editOrder";
+export const manufacturing__orderNumber = "manufacturing.orderNumber";
+export const manufacturing__bom = "manufacturing.bom";
+export const manufacturing__startDate = "manufacturing.startDate";
+export const manufacturing__dueDate = "manufacturing.dueDate";
+export const manufacturing__completeOrder = "manufacturing.completeOrder";
+export const manufacturing__dates = "manufacturing.dates";
+export const manufacturing__noOrders = "manufacturing.noOrders";
+export const manufacturing__complete = "manufacturing.complete";
+export const portal__welcome = "portal.welcome";
+export const portal__outstandingBalance = "portal.outstandingBalance";
+export const portal__totalAmountDue = "portal.totalAmountDue";
+export const portal__recentDocuments = "portal.recentDocuments";
+export const portal__inLast30Days = "portal.inLast30Days";
+export const portal__recentActivity = "portal.recentActivity";
+export const portal__noRecentDocuments = "portal.noRecentDocuments";
+export const portal__documents = "portal.documents";
+export const portal__documentsDescription = "portal.documentsDescription";
+export const portal__allDocuments = "portal.allDocuments";
+export const portal__noDocumentsFound = "portal.noDocumentsFound";
+export const portal__clientPortal = "portal.clientPortal";
+export const portal__dashboard = "portal.dashboard";
+export const portal__logout = "portal.logout";
+export const portal__loginFailed = "portal.loginFailed";
+export const portal__invalidCredentials = "portal.invalidCredentials";
+export const portal__signInDescription = "portal.signInDescription";
+export const portal__emailPlaceholder = "portal.emailPlaceholder";
+export const roles__owner = "roles.owner";
+export const roles__admin = "roles.admin";
+export const roles__accountant = "roles.accountant";
+export const roles__sales = "roles.sales";
+export const roles__viewer = "roles.viewer";
@@ -0,0 +1,4752 @@
+// fingerprint: 367eca4bc67a62f376eff574eac5caf857aa8495
+// Generated by `python -m i18n keytypes` from locales/en. Do not edit.
+
+export type TranslationKey =
+  | "app.name"
+  | "app.tagline"
+  | "auditLogs.actions.create"
+  | "auditLogs.actions.update"
+  | "auditLogs.actions.delete"
+  | "auditLogs.entities.salesInvoice"
+  | "auditLogs.entities.salesQuote"
+  | "auditLogs.entities.salesOrder"
+  | "auditLogs.entities.salesCreditNote"
+  | "auditLogs.entities.bill"
+  | "auditLogs.entities.purchaseOrder"
+  | "auditLogs.entities.purchaseDebitNote"
+  | "auditLogs.entities.expense"
+  | "auditLogs.entities.bankAccount"
+  | "auditLogs.entities.payment"
+  | "auditLogs.entities.receipt"
+  | "auditLogs.entities.paymentAllocation"
+  | "auditLogs.entities.journal"
+  | "auditLogs.entities.account"
+  | "auditLogs.entities.item"
+  | "auditLogs.entities.warehouse"
+  | "auditLogs.entities.stockMovement"
+  | "auditLogs.entities.stockTransfer"
+  | "auditLogs.entities.contact"
+  | "auditLogs.entities.fixedAsset"
+  | "auditLogs.entities.project"
+  | "auditLogs.entities.budget"
+  | "auditLogs.entities.exchangeRate"
+  | "auditLogs.entities.user"
+  | "auditLogs.entities.check"
+  | "auditLogs.entities.costCenter"
+  | "header.globalAccounting"
+  | "header.invoice"
+  | "header.payment"
+  | "header.authOnly"
+  | "header.authOnlyDescription"
+  | "header.copyId"
+  | "header.retryBind"
+  | "common.save"
+  | "common.cancel"
+  | "common.delete"
+  | "common.edit"
+  | "common.view"
+  | "common.add"
+  | "common.create"
+  | "common.update"
+  | "common.search"
+  | "common.filter"
+  | "common.form"
+  | "common.export"
+  | "common.import"
+  | "common.download"
+  | "common.upload"
+  | "common.print"
+  | "common.refresh"
+  | "common.retry"
+  | "common.back"
+  | "common.next"
+  | "common.previous"
+  | "common.close"
+  | "common.submit"
+  | "common.reset"
+  | "common.clear"
+  | "common.apply"
+  | "common.currency"
+  | "common.dueDate"
+  | "common.confirm"
+  | "common.active"
+  | "common.inactive"
+  | "common.pending"
+  | "common.approved"
+  | "common.accepted"
+  | "common.rejected"
+  | "common.paid"
+  | "common.unpaid"
+  | "common.overdue"
+  | "common.partiallyPaid"
+  | "common.draft"
+  | "common.sent"
+  | "common.completed"
+  | "common.cancelled"
+  | "common.yes"
+  | "common.no"
+  | "common.all"
+  | "common.none"
+  | "common.total"
+  | "common.subtotal"
+  | "common.tax"
+  | "common.discount"
+  | "common.amount"
+  | "common.quantity"
+  | "common.unitPrice"
+  | "common.price"
+  | "common.date"
+  | "common.selectDate"
+  | "common.description"
+  | "common.notes"
+  | "common.reference"
+  | "common.status"
+  | "common.actions"
+  | "common.details"
+  | "common.lines"
+  | "common.duplicate"
+  | "common.summary"
+  | "common.loading"
+  | "common.processing"
+  | "common.success"
+  | "common.error"
+  | "common.warning"
+  | "common.info"
+  | "common.noData"
+  | "common.unknown"
+  | "common.noDataYet"
+  | "common.noResults"
+  | "common.selectAll"
+  | "common.deselectAll"
+  | "common.saveSuccess"
+  | "common.saveError"
+  | "common.deleteSuccess"
+  | "common.deleteError"
+  | "common.updateSuccess"
+  | "common.updateError"
+  | "common.user"
+  | "common.users"
+  | "common.online"
+  | "common.offline"
+  | "common.settings"
+  | "common.signOut"
+  | "common.createSuccess"
+  | "common.createError"
+  | "common.confirmDelete"
+  | "common.confirmAction"
+  | "common.today"
+  | "common.yesterday"
+  | "common.thisWeek"
+  | "common.thisMonth"
+  | "common.thisYear"
+  | "common.lastWeek"
+  | "common.lastMonth"
+  | "common.lastYear"
+  | "common.custom"
+  | "common.errorLoadingData"
+  | "common.loadingData"
+  | "common.refreshPage"
+  | "common.totalValue"
+  | "common.creating"
+  | "common.optional"
+  | "common.termsAndConditions"
+  | "common.items"
+  | "common.issueDate"
+  | "common.expiryDate"
+  | "common.viewDetails"
+  | "common.applied"
+  | "common.partiallyApplied"
+  | "common.void"
+  | "common.monthly"
+  | "common.weekly"
+  | "common.yearly"
+  | "common.paused"
+  | "common.expired"
+  | "common.allTemplates"
+  | "common.currentlyRunning"
+  | "common.temporarilyStopped"
+  | "common.monthlyRevenue"
+  | "common.fromActiveTemplates"
+  | "common.downloadPDF"
+  | "common.send"
+  | "common.applying"
+  | "common.customer"
+  | "common.sendNow"
+  | "common.partial"
+  | "common.refunded"
+  | "common.project"
+  | "common.exchangeRate"
+  | "common.allocations"
+  | "common.noAllocations"
+  | "common.unmatchedSuccessfully"
+  | "common.unmatchFailed"
+  | "common.provider"
+  | "common.label"
+  | "common.baseUrl"
+  | "common.apiKey"
+  | "common.organization"
+  | "common.selectProvider"
+  | "common.providers.openai"
+  | "common.providers.openrouter"
+  | "common.providers.google"
+  | "common.providers.anthropic"
+  | "common.providers.azure"
+  | "common.providers.groq"
+  | "common.providers.mistral"
+  | "common.providers.xai"
+  | "common.providers.together"
+  | "common.providers.cohere"
+  | "common.providers.deepseek"
+  | "common.providers.ollama"
+  | "common.providers.lmstudio"
+  | "common.providers.custom"
+  | "common.providers.local"
+  | "common.saveChanges"
+  | "common.saving"
+  | "common.settingsSaved"
+  | "common.settingsUpdated"
+  | "common.errorLoading"
+  | "common.errorSaving"
+  | "common.notAuthorized"
+  | "common.exportAllCsv"
+  | "common.exportXlsx"
+  | "common.entityType"
+  | "common.any"
+  | "common.newestFirst"
+  | "common.oldestFirst"
+  | "common.limit"
+  | "common.actor"
+  | "common.entityId"
+  | "common.results"
+  | "common.timestamp"
+  | "common.new"
+  | "common.country"
+  | "common.selectCountry"
+  | "common.dashboard"
+  | "common.accounts"
+  | "common.contacts"
+  | "common.sales"
+  | "common.purchases"
+  | "common.banking"
+  | "common.reports"
+  | "common.reload"
+  | "common.hide"
+  | "common.advanced"
+  | "common.type"
+  | "common.unitCost"
+  | "common.totalCost"
+  | "common.current"
+  | "common.rtl"
+  | "common.menu"
+  | "common.pageOf"
+  | "common.pullToRefresh"
+  | "common.releaseToRefresh"
+  | "common.refreshing"
+  | "common.copy"
+  | "common.share"
+  | "common.swipeForActions"
+  | "common.linkCopied"
+  | "common.featureComingSoon"
+  | "common.month"
+  | "common.saved"
+  | "common.copied"
+  | "common.period"
+  | "common.qty"
+  | "common.scanning"
+  | "common.recommendation"
+  | "common.validationError"
+  | "common.expense"
+  | "common.reject"
+  | "common.approve"
+  | "common.noHistoryFound"
+  | "common.cost"
+  | "common.supplier"
+  | "common.contact"
+  | "common.undo"
+  | "common.undone"
+  | "common.presets"
+  | "common.deleteConfirm"
+  | "common.max"
+  | "common.from"
+  | "common.to"
+  | "common.selected"
+  | "common.counterparty"
+  | "common.ready"
+  | "common.skipped"
+  | "common.done"
+  | "common.document"
+  | "common.copying"
+  | "common.createdOn"
+  | "common.na"
+  | "common.notFound"
+  | "common.addItem"
+  | "common.sku"
+  | "common.number"
+  | "common.email"
+  | "common.password"
+  | "common.signIn"
+  | "common.company"
+  | "common.selectProject"
+  | "common.selectAccount"
+  | "navigation.globalSearch"
+  | "navigation.dataImport"
+  | "navigation.main"
+  | "navigation.setup"
+  | "navigation.sales"
+  | "navigation.purchases"
+  | "navigation.banking"
+  | "navigation.reports"
+  | "navigation.settings"
+  | "navigation.dashboard"
+  | "navigation.contacts"
+  | "navigation.items"
+  | "navigation.accounts"
+  | "navigation.companies"
+  | "navigation.invoices"
+  | "navigation.addInvoice"
+  | "navigation.recurringInvoices"
+  | "navigation.quotations"
+  | "navigation.salesOrders"
+  | "navigation.creditNotes"
+  | "navigation.bills"
+  | "navigation.purchaseOrders"
+  | "navigation.expenses"
+  | "navigation.debitNotes"
+  | "navigation.bankAccounts"
+  | "navigation.reconciliation"
+  | "navigation.payments"
+  | "navigation.receipts"
+  | "navigation.financialReports"
+  | "navigation.balanceSheet"
+  | "navigation.profitLoss"
+  | "navigation.cashFlow"
+  | "navigation.trialBalance"
+  | "navigation.accountLedger"
+  | "navigation.journalBook"
+  | "navigation.agingReport"
+  | "navigation.contactStatement"
+  | "navigation.salesPurchasesSummary"
+  | "navigation.profitLossComparison"
+  | "navigation.financialRatios"
+  | "navigation.taxReports"
+  | "navigation.taxOverview"
+  | "navigation.otherTaxes"
+  | "navigation.vatReport"
+  | "navigation.corporateTaxReport"
+  | "navigation.withholdingTaxReport"
+  | "navigation.customTaxReport"
+  | "navigation.inventoryReports"
+  | "navigation.warehouses"
+  | "navigation.stockAdjustments"
+  | "navigation.inventoryValuation"
+  | "navigation.generalSettings"
+  | "navigation.taxSettings"
+  | "navigation.languageSettings"
+  | "navigation.users"
+  | "navigation.auditLogs"
+  | "navigation.backup"
+  | "navigation.userGuide"
+  | "navigation.projectsList"
+  | "navigation.projectsProfitability"
+  | "navigation.advancedFeatures"
+  | "navigation.quickEntry"
+  | "navigation.batchOperations"
+  | "navigation.inventory"
+  | "navigation.stockTransfers"
+  | "navigation.valuation"
+  | "navigation.landedCost"
+  | "navigation.checks"
+  | "navigation.accounting"
+  | "navigation.manualJournals"
+  | "navigation.costCenters"
+  | "navigation.fixedAssets"
+  | "navigation.planning"
+  | "navigation.budgets"
+  | "navigation.budgetPlanning"
+  | "navigation.budgetVsActual"
+  | "navigation.projects"
+  | "navigation.manufacturing"
+  | "navigation.boms"
+  | "navigation.productionOrders"
+  | "navigation.hr"
+  | "navigation.employees"
+  | "navigation.departments"
+  | "navigation.payroll"
+  | "navigation.financialStatements"
+  | "navigation.accountingReports"
+  | "navigation.receivablesPayables"
+  | "navigation.financialAnalysis"
+  | "navigation.esgReport"
+  | "navigation.aiReports"
+  | "navigation.aiAnalytics"
+  | "navigation.cashFlowForecast"
+  | "navigation.portals"
+  | "navigation.portalDashboard"
+  | "navigation.portalDocuments"
+  | "navigation.tools"
+  | "navigation.currencies"
+  | "navigation.aiSettings"
+  | "navigation.legalSettings"
+  | "navigation.admin"
+  | "advanced.title"
+  | "advanced.subtitle"
+  | "advanced.quickStats"
+  | "advanced.featuresCount"
+  | "diagnostics.title"
+  | "diagnostics.ssoStatus"
+  | "diagnostics.mode"
+  | "diagnostics.bound"
+  | "diagnostics.authOnly"
+  | "diagnostics.lastRequestId"
+  | "diagnostics.retryBind"
+  | "diagnostics.onlineStatus"
+  | "diagnostics.sessionAge"
+  | "diagnostics.lastSsoAttempt"
+  | "diagnostics.reactProbe"
+  | "diagnostics.singleReactInstance"
+  | "diagnostics.multipleReactInstances"
+  | "diagnostics.latency"
+  | "diagnostics.copyId"
+  | "diagnostics.ssoTimeline"
+  | "countries.uae"
+  | "countries.saudiArabia"
+  | "countries.qatar"
+  | "countries.kuwait"
+  | "countries.bahrain"
+  | "countries.oman"
+  | "countries.jordan"
+  | "countries.lebanon"
+  | "countries.egypt"
+  | "countries.iraq"
+  | "countries.syria"
+  | "countries.palestine"
+  | "countries.yemen"
+  | "countries.morocco"
+  | "countries.algeria"
+  | "countries.tunisia"
+  | "countries.libya"
+  | "countries.sudan"
+  | "countries.unitedStates"
+  | "countries.canada"
+  | "countries.mexico"
+  | "countries.brazil"
+  | "countries.argentina"
+  | "countries.unitedKingdom"
+  | "countries.germany"
+  | "countries.france"
+  | "countries.italy"
+  | "countries.spain"
+  | "countries.netherlands"
+  | "countries.belgium"
+  | "countries.switzerland"
+  | "countries.austria"
+  | "countries.sweden"
+  | "countries.norway"
+  | "countries.denmark"
+  | "countries.poland"
+  | "countries.turkey"
+  | "countries.russia"
+  | "countries.india"
+  | "countries.pakistan"
+  | "countries.bangladesh"
+  | "countries.china"
+  | "countries.japan"
+  | "countries.southKorea"
+  | "countries.indonesia"
+  | "countries.malaysia"
+  | "countries.singapore"
+  | "countries.thailand"
+  | "countries.philippines"
+  | "countries.vietnam"
+  | "countries.australia"
+  | "countries.newZealand"
+  | "countries.southAfrica"
+  | "countries.nigeria"
+  | "countries.kenya"
+  | "categories.electronics"
+  | "categories.accessories"
+  | "categories.services"
+  | "categories.officeSupplies"
+  | "categories.foodAndBeverages"
+  | "categories.travel"
+  | "categories.utilities"
+  | "categories.rent"
+  | "categories.salaries"
+  | "categories.marketing"
+  | "categories.insurance"
+  | "categories.maintenance"
+  | "categories.professional"
+  | "categories.company"
+  | "categories.employee"
+  | "import.title"
+  | "import.description"
+  | "import.importContacts"
+  | "import.importItems"
+  | "import.importAccounts"
+  | "import.importContactsDesc"
+  | "import.importItemsDesc"
+  | "import.importAccountsDesc"
+  | "import.dragOrClick"
+  | "import.supportedFormats"
+  | "import.downloadTemplate"
+  | "import.templateTip"
+  | "import.templateDownloaded"
+  | "import.templateDownloadedDesc"
+  | "import.fileLoaded"
+  | "import.rowsFound"
+  | "import.emptyFile"
+  | "import.invalidFile"
+  | "import.error"
+  | "import.mapColumns"
+  | "import.mapColumnsDesc"
+  | "import.systemField"
+  | "import.excelColumn"
+  | "import.required"
+  | "import.selectColumn"
+  | "import.notMapped"
+  | "import.validateAndPreview"
+  | "import.valid"
+  | "import.warnings"
+  | "import.errors"
+  | "import.togglePreview"
+  | "import.status"
+  | "import.issues"
+  | "import.showingFirst"
+  | "import.startImport"
+  | "import.noValidRows"
+  | "import.importing"
+  | "import.complete"
+  | "import.completeSummary"
+  | "import.imported"
+  | "import.failed"
+  | "import.errorDetails"
+  | "import.andMore"
+  | "import.importMore"
+  | "import.invalidNumber"
+  | "import.requiredField"
+  | "import.requiredFieldEmpty"
+  | "fields.name"
+  | "fields.email"
+  | "fields.phone"
+  | "fields.type"
+  | "fields.address"
+  | "fields.city"
+  | "fields.country"
+  | "fields.taxNumber"
+  | "fields.sku"
+  | "fields.description"
+  | "fields.unit"
+  | "fields.salePrice"
+  | "fields.purchasePrice"
+  | "fields.quantity"
+  | "fields.accountCode"
+  | "fields.accountName"
+  | "fields.accountType"
+  | "fields.accountSubtype"
+  | "fields.parentCode"
+  | "fields.openingBalance"
+  | "globalSearch.title"
+  | "globalSearch.placeholder"
+  | "globalSearch.recentSearches"
+  | "globalSearch.noResults"
+  | "globalSearch.noResultsDesc"
+  | "globalSearch.navigate"
+  | "globalSearch.select"
+  | "globalSearch.close"
+  | "globalSearch.pages.dashboard"
+  | "globalSearch.pages.dashboardDesc"
+  | "globalSearch.pages.invoices"
+  | "globalSearch.pages.invoicesDesc"
+  | "globalSearch.pages.contacts"
+  | "globalSearch.pages.contactsDesc"
+  | "globalSearch.pages.inventory"
+  | "globalSearch.pages.inventoryDesc"
+  | "globalSearch.pages.expenses"
+  | "globalSearch.pages.expensesDesc"
+  | "globalSearch.pages.accounts"
+  | "globalSearch.pages.accountsDesc"
+  | "globalSearch.pages.journal"
+  | "globalSearch.pages.journalDesc"
+  | "globalSearch.pages.banking"
+  | "globalSearch.pages.bankingDesc"
+  | "globalSearch.pages.reports"
+  | "globalSearch.pages.reportsDesc"
+  | "globalSearch.pages.tax"
+  | "globalSearch.pages.taxDesc"
+  | "globalSearch.pages.fixedAssets"
+  | "globalSearch.pages.fixedAssetsDesc"
+  | "globalSearch.pages.projects"
+  | "globalSearch.pages.projectsDesc"
+  | "globalSearch.pages.settings"
+  | "globalSearch.pages.settingsDesc"
+  | "globalSearch.pages.quickEntry"
+  | "globalSearch.pages.quickEntryDesc"
+  | "globalSearch.reports.profitLoss"
+  | "globalSearch.reports.profitLossDesc"
+  | "globalSearch.reports.balanceSheet"
+  | "globalSearch.reports.balanceSheetDesc"
+  | "globalSearch.reports.cashFlow"
+  | "globalSearch.reports.cashFlowDesc"
+  | "globalSearch.reports.trialBalance"
+  | "globalSearch.reports.trialBalanceDesc"
+  | "globalSearch.reports.aging"
+  | "globalSearch.reports.agingDesc"
+  | "quickEntry.title"
+  | "quickEntry.description"
+  | "quickEntry.fillDetails"
+  | "quickEntry.newInvoice"
+  | "quickEntry.invoiceDesc"
+  | "quickEntry.newExpense"
+  | "quickEntry.expenseDesc"
+  | "quickEntry.recordPayment"
+  | "quickEntry.paymentDesc"
+  | "quickEntry.recordReceipt"
+  | "quickEntry.receiptDesc"
+  | "quickEntry.addItem"
+  | "quickEntry.itemDesc"
+  | "quickEntry.recentEntries"
+  | "quickEntry.recentEntriesDesc"
+  | "quickEntry.noRecentEntries"
+  | "quickEntry.entryCreated"
+  | "quickEntry.createError"
+  | "quickEntry.descriptionPlaceholder"
+  | "quickEntry.expenseDescPlaceholder"
+  | "quickEntry.referencePlaceholder"
+  | "quickEntry.itemNamePlaceholder"
+  | "quickEntry.skuPlaceholder"
+  | "quickEntry.notesPlaceholder"
+  | "batch.title"
+  | "batch.description"
+  | "batch.recordType"
+  | "batch.invoices"
+  | "batch.bills"
+  | "batch.contacts"
+  | "batch.items"
+  | "batch.searchPlaceholder"
+  | "batch.records"
+  | "batch.exportSelected"
+  | "batch.emailSelected"
+  | "batch.printSelected"
+  | "batch.archiveSelected"
+  | "batch.deleteSelected"
+  | "batch.noSelection"
+  | "batch.selectRecordsFirst"
+  | "batch.confirmAction"
+  | "batch.confirmActionDesc"
+  | "batch.processing"
+  | "batch.progressStatus"
+  | "batch.operationComplete"
+  | "batch.operationSummary"
+  | "batch.successCount"
+  | "batch.failedCount"
+  | "notifications.title"
+  | "notifications.empty"
+  | "notifications.justNow"
+  | "notifications.minutesAgo"
+  | "notifications.hoursAgo"
+  | "notifications.daysAgo"
+  | "notifications.markAllRead"
+  | "notifications.clearAll"
+  | "notifications.muteSound"
+  | "notifications.enableSound"
+  | "dashboard.title"
+  | "dashboard.lastUpdate"
+  | "dashboard.refreshed"
+  | "dashboard.widgetRemoved"
+  | "dashboard.widgetAdded"
+  | "dashboard.layoutSaved"
+  | "dashboard.layoutReset"
+  | "dashboard.addWidget"
+  | "dashboard.selectWidgetType"
+  | "dashboard.configureWidget"
+  | "dashboard.widgetTitle"
+  | "dashboard.widgetSize"
+  | "dashboard.widgetPlaceholder"
+  | "dashboard.refresh"
+  | "dashboard.hide"
+  | "dashboard.customize"
+  | "dashboard.reset"
+  | "dashboard.save"
+  | "dashboard.editMode"
+  | "dashboard.metrics.revenue"
+  | "dashboard.metrics.expenses"
+  | "dashboard.metrics.profit"
+  | "dashboard.metrics.invoices"
+  | "dashboard.metrics.customers"
+  | "dashboard.metrics.items"
+  | "dashboard.metrics.receivables"
+  | "dashboard.metrics.payables"
+  | "dashboard.widgets.kpi"
+  | "dashboard.widgets.chart"
+  | "dashboard.widgets.list"
+  | "dashboard.widgets.calendar"
+  | "dashboard.widgets.tasks"
+  | "dashboard.widgets.alerts"
+  | "dashboard.widgets.quickActions"
+  | "dashboard.widgets.recentActivity"
+  | "dashboard.widgets.goals"
+  | "dashboard.widgets.weather"
+  | "dashboard.widgets.notes"
+  | "dashboard.sizes.small"
+  | "dashboard.sizes.medium"
+  | "dashboard.sizes.large"
+  | "dashboard.sizes.full"
+  | "dashboard.alerts.overdueInvoices"
+  | "dashboard.alerts.lowStock"
+  | "dashboard.alerts.paymentReceived"
+  | "dashboard.tasks.reviewInvoices"
+  | "dashboard.tasks.sendQuotes"
+  | "dashboard.tasks.reconcileAccounts"
+  | "dashboard.goals.monthlyRevenue"
+  | "dashboard.goals.newCustomers"
+  | "dashboard.goals.invoiceCollection"
+  | "dashboard.actions.newInvoice"
+  | "dashboard.actions.newContact"
+  | "dashboard.actions.newExpense"
+  | "dashboard.actions.newItem"
+  | "dashboard.metric"
+  | "dashboard.value"
+  | "dashboard.revenueVsExpenses"
+  | "dashboard.revenue"
+  | "dashboard.expenses"
+  | "dashboard.recentTransactions"
+  | "banking.checkingAccount"
+  | "banking.savingsAccount"
+  | "banking.creditCard"
+  | "banking.cash"
+  | "banking.investment"
+  | "banking.paymentCreated"
+  | "banking.failedToCreatePayment"
+  | "banking.allocations"
+  | "banking.noAllocations"
+  | "banking.unmatchedSuccessfully"
+  | "banking.unmatchFailed"
+  | "banking.unmatch"
+  | "banking.accounts.title"
+  | "banking.accounts.description"
+  | "banking.accounts.addAccount"
+  | "banking.accounts.editAccount"
+  | "banking.accounts.createAccount"
+  | "banking.accounts.updateAccount"
+  | "banking.accounts.accountCreated"
+  | "banking.accounts.accountCreatedDesc"
+  | "banking.accounts.accountUpdated"
+  | "banking.accounts.accountUpdatedDesc"
+  | "banking.accounts.saveError"
+  | "banking.accounts.accountDeleted"
+  | "banking.accounts.accountDeletedDesc"
+  | "banking.accounts.deleteError"
+  | "banking.accounts.confirmDelete"
+  | "banking.accounts.loading"
+  | "banking.accounts.errorLoading"
+  | "banking.accounts.failedToLoad"
+  | "banking.accounts.bank"
+  | "banking.accounts.accountName"
+  | "banking.accounts.accountNamePlaceholder"
+  | "banking.accounts.accountNumber"
+  | "banking.accounts.accountNumberPlaceholder"
+  | "banking.accounts.bankName"
+  | "banking.accounts.bankNamePlaceholder"
+  | "banking.accounts.branch"
+  | "banking.accounts.branchPlaceholder"
+  | "banking.accounts.iban"
+  | "banking.accounts.ibanPlaceholder"
+  | "banking.accounts.swiftCode"
+  | "banking.accounts.swiftPlaceholder"
+  | "banking.accounts.balance"
+  | "banking.accounts.currentBalance"
+  | "banking.accounts.openingBalance"
+  | "banking.accounts.openingBalancePlaceholder"
+  | "banking.accounts.currentBalancePlaceholder"
+  | "banking.accounts.accountType"
+  | "banking.accounts.activeAccount"
+  | "banking.accounts.activeAccountDesc"
+  | "banking.accounts.defaultAccount"
+  | "banking.accounts.defaultAccountDesc"
+  | "banking.accounts.defaultBadge"
+  | "banking.accounts.lastTransaction"
+  | "banking.accounts.recentTransactions"
+  | "banking.accounts.failedToLoadTransactions"
+  | "banking.accounts.noRecentTransactions"
+  | "banking.accounts.totalBalance"
+  | "banking.accounts.acrossAllAccounts"
+  | "banking.accounts.totalAssets"
+  | "banking.accounts.cashBankBalances"
+  | "banking.accounts.totalLiabilities"
+  | "banking.accounts.creditCardsOverdrafts"
+  | "banking.accounts.activeAccounts"
+  | "banking.accounts.ofTotal"
+  | "banking.accounts.totalAccounts"
+  | "banking.accounts.glAccount"
+  | "banking.accounts.selectGLAccount"
+  | "banking.payments.title"
+  | "banking.payments.description"
+  | "banking.payments.descriptionShort"
+  | "banking.payments.addPayment"
+  | "banking.payments.editPayment"
+  | "banking.payments.createPayment"
+  | "banking.payments.paymentNumber"
+  | "banking.payments.paymentDate"
+  | "banking.payments.paymentMethod"
+  | "banking.payments.paymentReference"
+  | "banking.payments.referencePlaceholder"
+  | "banking.payments.descriptionPlaceholder"
+  | "banking.payments.payTo"
+  | "banking.payments.totalPayments"
+  | "banking.payments.totalAmount"
+  | "banking.payments.allPayments"
+  | "banking.payments.completed"
+  | "banking.payments.pending"
+  | "banking.payments.failed"
+  | "banking.payments.inProcess"
+  | "banking.payments.needAttention"
+  | "banking.payments.paymentCreated"
+  | "banking.payments.paymentCreatedDesc"
+  | "banking.payments.paymentCreateError"
+  | "banking.payments.paymentDeleted"
+  | "banking.payments.paymentDeletedDesc"
+  | "banking.payments.paymentDeleteError"
+  | "banking.payments.retryPayment"
+  | "banking.payments.sendRemittance"
+  | "banking.payments.downloadReceipt"
+  | "banking.payments.cancelPayment"
+  | "banking.payments.paymentRetried"
+  | "banking.payments.paymentRetriedDesc"
+  | "banking.payments.paymentCancelled"
+  | "banking.payments.paymentCancelledDesc"
+  | "banking.payments.remittanceSent"
+  | "banking.payments.remittanceSentDesc"
+  | "banking.payments.confirmDelete"
+  | "banking.payments.confirmCancel"
+  | "banking.payments.failedToLoad"
+  | "banking.payments.paidFromAccount"
+  | "banking.payments.selectPaidFromAccount"
+  | "banking.makePayment"
+  | "banking.paymentInitiated"
+  | "banking.paymentInitiatedDesc"
+  | "banking.receipts.title"
+  | "banking.receipts.description"
+  | "banking.receipts.descriptionShort"
+  | "banking.receipts.addReceipt"
+  | "banking.receipts.editReceipt"
+  | "banking.receipts.createReceipt"
+  | "banking.receipts.receiptDate"
+  | "banking.receipts.receiptNumber"
+  | "banking.receipts.receivedFrom"
+  | "banking.receipts.totalReceipts"
+  | "banking.receipts.totalAmount"
+  | "banking.receipts.allReceipts"
+  | "banking.receipts.collected"
+  | "banking.receipts.collectedDesc"
+  | "banking.receipts.pending"
+  | "banking.receipts.beingProcessed"
+  | "banking.receipts.today"
+  | "banking.receipts.receivedToday"
+  | "banking.receipts.descriptionPlaceholder"
+  | "banking.receipts.receiptCreated"
+  | "banking.receipts.receiptCreatedDesc"
+  | "banking.receipts.createError"
+  | "banking.receipts.receiptDeleted"
+  | "banking.receipts.receiptDeletedDesc"
+  | "banking.receipts.receiptDeleteError"
+  | "banking.receipts.confirmDelete"
+  | "banking.receipts.applyToInvoice"
+  | "banking.receipts.sendReceipt"
+  | "banking.receipts.receiptApplied"
+  | "banking.receipts.receiptAppliedDesc"
+  | "banking.receipts.receiptSent"
+  | "banking.receipts.receiptSentDesc"
+  | "banking.receipts.refund"
+  | "banking.receipts.confirmRefund"
+  | "banking.receipts.refundInitiated"
+  | "banking.receipts.refundInitiatedDesc"
+  | "banking.receipts.depositToAccount"
+  | "banking.receipts.selectDepositAccount"
+  | "banking.reconciliation.title"
+  | "banking.reconciliation.description"
+  | "banking.reconciliation.descriptionShort"
+  | "banking.reconciliation.autoMatch"
+  | "banking.reconciliation.completeReconciliation"
+  | "banking.reconciliation.bookBalance"
+  | "banking.reconciliation.asPerYourRecords"
+  | "banking.reconciliation.bankBalance"
+  | "banking.reconciliation.fromBankStatement"
+  | "banking.reconciliation.difference"
+  | "banking.reconciliation.reconciled"
+  | "banking.reconciliation.toReconcile"
+  | "banking.reconciliation.balanced"
+  | "banking.reconciliation.unbalanced"
+  | "banking.reconciliation.matched"
+  | "banking.reconciliation.unmatched"
+  | "banking.reconciliation.unmatchedDesc"
+  | "banking.reconciliation.transactionsFromYourAccounting"
+  | "banking.reconciliation.bankStatement"
+  | "banking.reconciliation.transactionMatched"
+  | "banking.reconciliation.transactionMatchedDesc"
+  | "banking.reconciliation.autoStarted"
+  | "banking.reconciliation.autoStartedDesc"
+  | "banking.reconciliation.cannotComplete"
+  | "banking.reconciliation.cannotCompleteDesc"
+  | "banking.reconciliation.completed"
+  | "banking.reconciliation.completedDesc"
+  | "banking.reconciliation.noAutoMatches"
+  | "banking.reconciliation.adjustFilters"
+  | "banking.reconciliation.autoCompleted"
+  | "banking.reconciliation.autoSummary"
+  | "banking.reconciliation.undoAutoMatch"
+  | "banking.reconciliation.suggestedMatches"
+  | "banking.reconciliation.savePresetAs"
+  | "banking.reconciliation.receipts"
+  | "banking.reconciliation.payments"
+  | "banking.reconciliation.maxCandidates"
+  | "banking.reconciliation.minScore"
+  | "banking.reconciliation.amountTolerance"
+  | "banking.reconciliation.maxDays"
+  | "banking.reconciliation.preferExact"
+  | "banking.reconciliation.sameCurrencyOnly"
+  | "banking.reconciliation.highOnly"
+  | "banking.reconciliation.highConfidence"
+  | "banking.reconciliation.customerReceipts"
+  | "banking.reconciliation.receipt"
+  | "banking.reconciliation.noCandidate"
+  | "banking.reconciliation.currencyMismatch"
+  | "banking.reconciliation.score"
+  | "banking.reconciliation.scoreExplain"
+  | "banking.reconciliation.amountScore"
+  | "banking.reconciliation.dateScore"
+  | "banking.reconciliation.match"
+  | "banking.reconciliation.vendorPayments"
+  | "banking.reconciliation.payment"
+  | "banking.reconciliation.autoPreview"
+  | "banking.reconciliation.autoPreviewDesc"
+  | "banking.reconciliation.selectReceipts"
+  | "banking.reconciliation.selectPayments"
+  | "banking.reconciliation.selectHighConfidence"
+  | "banking.reconciliation.deselectCurrencyMismatch"
+  | "banking.reconciliation.maxDateDiff"
+  | "banking.reconciliation.deselectAbove"
+  | "banking.reconciliation.why"
+  | "banking.reconciliation.exactAmount"
+  | "banking.reconciliation.closeAmount"
+  | "banking.reconciliation.mismatch"
+  | "banking.reconciliation.sameCurrency"
+  | "banking.reconciliation.withinDays"
+  | "banking.reconciliation.dateDiffN"
+  | "banking.reconciliation.uniqueCandidate"
+  | "banking.reconciliation.recentMatches"
+  | "banking.reconciliation.unmatch"
+  | "banking.reconciliation.completeShort"
+  | "banking.reconciliation.autoMatchFailed"
+  | "banking.reconciliation.suggestionFailed"
+  | "banking.reconciliation.suggestionsFailed"
+  | "banking.checks.title"
+  | "banking.checks.receivable"
+  | "banking.checks.payable"
+  | "banking.checks.add"
+  | "banking.checks.addReceivable"
+  | "banking.checks.addPayable"
+  | "banking.checks.number"
+  | "banking.checks.bankName"
+  | "banking.checks.issueDate"
+  | "banking.checks.dueDate"
+  | "banking.checks.bank"
+  | "banking.checks.createSuccess"
+  | "banking.checks.statusUpdateSuccess"
+  | "banking.checks.status.on_hand"
+  | "banking.checks.status.deposited"
+  | "banking.checks.status.cleared"
+  | "banking.checks.status.bounced"
+  | "banking.checks.status.returned"
+  | "banking.checks.status.cancelled"
+  | "sales.invoices.title"
+  | "sales.invoices.description"
+  | "sales.invoices.addInvoice"
+  | "sales.invoices.editInvoice"
+  | "sales.invoices.invoiceNumber"
+  | "sales.invoices.invoiceDate"
+  | "sales.invoices.dueDate"
+  | "sales.invoices.customer"
+  | "sales.invoices.selectCustomer"
+  | "sales.invoices.items"
+  | "sales.invoices.addItem"
+  | "sales.invoices.subtotal"
+  | "sales.invoices.tax"
+  | "sales.invoices.discount"
+  | "sales.invoices.total"
+  | "sales.invoices.status"
+  | "sales.invoices.draft"
+  | "sales.invoices.sent"
+  | "sales.invoices.paid"
+  | "sales.invoices.partially_paid"
+  | "sales.invoices.overdue"
+  | "sales.invoices.cancelled"
+  | "sales.invoices.notes"
+  | "sales.invoices.termsConditions"
+  | "sales.invoices.downloadPDF"
+  | "sales.invoices.pdfDownloaded"
+  | "sales.invoices.pdfFailed"
+  | "sales.invoices.sendEmail"
+  | "sales.invoices.send"
+  | "sales.invoices.markAsPaid"
+  | "sales.invoices.totalInvoices"
+  | "sales.invoices.paidInvoices"
+  | "sales.invoices.unpaidInvoices"
+  | "sales.invoices.overdueInvoices"
+  | "sales.invoices.invoiceDeletedSuccess"
+  | "sales.invoices.invoiceDeleteError"
+  | "sales.invoices.loadFailedTryAgain"
+  | "sales.invoices.descriptionShort"
+  | "sales.invoices.paidAmount"
+  | "sales.invoices.outstanding"
+  | "sales.invoices.allInvoices"
+  | "sales.invoices.collected"
+  | "sales.invoices.toCollect"
+  | "sales.invoices.confirmDelete"
+  | "sales.invoices.invoiceDuplicated"
+  | "sales.invoices.invoiceDuplicatedDesc"
+  | "sales.invoices.invoiceSent"
+  | "sales.invoices.invoiceSentDesc"
+  | "sales.invoices.noInvoicesFound"
+  | "sales.invoices.draftSaved"
+  | "sales.invoices.saveFailed"
+  | "sales.invoices.emailQueued"
+  | "sales.invoices.sendFailed"
+  | "sales.invoices.updated"
+  | "sales.invoices.invoiceUpdated"
+  | "sales.invoices.updateFailed"
+  | "sales.invoices.cannotEditNonDraft"
+  | "sales.invoices.previewPDF"
+  | "sales.invoices.invoice"
+  | "sales.invoices.invoiceNotFound"
+  | "sales.invoices.poNumber"
+  | "sales.orders.title"
+  | "sales.orders.description"
+  | "sales.orders.addOrder"
+  | "sales.orders.editOrder"
+  | "sales.orders.orderNumber"
+  | "sales.orders.orderDate"
+  | "sales.orders.deliveryDate"
+  | "sales.orders.convertToInvoice"
+  | "sales.orders.totalOrders"
+  | "sales.orders.pending"
+  | "sales.orders.processing"
+  | "sales.orders.unfulfilled"
+  | "sales.orders.fulfilled"
+  | "sales.orders.confirmed"
+  | "sales.orders.shipped"
+  | "sales.orders.delivered"
+  | "sales.orders.completed"
+  | "sales.orders.descriptionShort"
+  | "sales.orders.orderCreatedSuccess"
+  | "sales.orders.orderCreateError"
+  | "sales.orders.invoiceCreated"
+  | "sales.orders.orderConvertedSuccess"
+  | "sales.orders.confirmConvert"
+  | "sales.orders.orderShipped"
+  | "sales.orders.orderShippedSuccess"
+  | "sales.orders.orderCancelled"
+  | "sales.orders.orderCancelledSuccess"
+  | "sales.orders.confirmCancel"
+  | "sales.orders.pendingOrders"
+  | "sales.orders.processingOrders"
+  | "sales.orders.shippedOrders"
+  | "sales.orders.markAsShipped"
+  | "sales.orders.cancelOrder"
+  | "sales.orders.noOrdersFound"
+  | "sales.orders.orderValue"
+  | "sales.orders.totalRevenue"
+  | "sales.orders.toProcess"
+  | "sales.orders.inProgress"
+  | "sales.orders.onTheWay"
+  | "sales.orders.allOrders"
+  | "sales.orders.paymentStatus"
+  | "sales.orders.createInvoice"
+  | "sales.quotations.title"
+  | "sales.quotations.description"
+  | "sales.quotations.addQuotation"
+  | "sales.quotations.editQuotation"
+  | "sales.quotations.quotationNumber"
+  | "sales.quotations.quotationDate"
+  | "sales.quotations.expiryDate"
+  | "sales.quotations.validUntil"
+  | "sales.quotations.convertToOrder"
+  | "sales.quotations.totalQuotations"
+  | "sales.quotations.accepted"
+  | "sales.quotations.rejected"
+  | "sales.quotations.expired"
+  | "sales.quotations.quotationCreatedSuccess"
+  | "sales.quotations.quotationCreateError"
+  | "sales.quotations.quotationDeletedSuccess"
+  | "sales.quotations.quotationDeleteError"
+  | "sales.quotations.confirmDelete"
+  | "sales.quotations.confirmConvert"
+  | "sales.quotations.convertedToInvoice"
+  | "sales.quotations.quotationConvertedSuccess"
+  | "sales.quotations.quotationConvertError"
+  | "sales.quotations.quotationDuplicated"
+  | "sales.quotations.quotationDuplicatedDescription"
+  | "sales.quotations.quotationSent"
+  | "sales.quotations.quotationSentSuccess"
+  | "sales.quotations.acceptedQuotations"
+  | "sales.quotations.acceptanceRate"
+  | "sales.quotations.averageValue"
+  | "sales.quotations.quoteNumber"
+  | "sales.quotations.convertToInvoice"
+  | "sales.quotations.noQuotationsFound"
+  | "sales.quotations.potentialRevenue"
+  | "sales.quotations.perQuotation"
+  | "sales.quotations.editQuotationDescription"
+  | "sales.quotations.quotationUpdatedSuccess"
+  | "sales.quotations.quotationUpdateError"
+  | "sales.quotations.errorLoadingQuote"
+  | "sales.quotations.saveAsDraft"
+  | "sales.quotations.saveAndSend"
+  | "sales.quotations.editQuote"
+  | "sales.quotations.viewQuoteDetails"
+  | "sales.quotations.quoteItems"
+  | "sales.quotations.discount"
+  | "sales.quotations.afterDiscount"
+  | "sales.quotations.selectTax"
+  | "sales.quotations.equivalentInBaseCurrency"
+  | "sales.quotations.exchangeRate"
+  | "sales.quotations.quoteNumberDescription"
+  | "sales.creditNotes.title"
+  | "sales.creditNotes.description"
+  | "sales.creditNotes.addCreditNote"
+  | "sales.creditNotes.editCreditNote"
+  | "sales.creditNotes.creditNoteNumber"
+  | "sales.creditNotes.creditNoteDate"
+  | "sales.creditNotes.reason"
+  | "sales.creditNotes.refund"
+  | "sales.creditNotes.adjustment"
+  | "sales.creditNotes.returnGoods"
+  | "sales.creditNotes.totalCreditNotes"
+  | "sales.creditNotes.issued"
+  | "sales.creditNotes.applied"
+  | "sales.creditNotes.descriptionShort"
+  | "sales.creditNotes.creditNoteCreatedSuccess"
+  | "sales.creditNotes.creditNoteCreateError"
+  | "sales.creditNotes.creditNoteUpdatedSuccess"
+  | "sales.creditNotes.creditNoteUpdateError"
+  | "sales.creditNotes.creditNoteDeletedSuccess"
+  | "sales.creditNotes.creditNoteDeleteError"
+  | "sales.creditNotes.creditNoteApplyError"
+  | "sales.creditNotes.creditApplied"
+  | "sales.creditNotes.creditAppliedSuccess"
+  | "sales.creditNotes.creditNoteSent"
+  | "sales.creditNotes.creditNoteSentSuccess"
+  | "sales.creditNotes.creditNoteVoided"
+  | "sales.creditNotes.creditNoteVoidedSuccess"
+  | "sales.creditNotes.confirmVoid"
+  | "sales.creditNotes.relatedInvoice"
+  | "sales.creditNotes.issueDate"
+  | "sales.creditNotes.createNewCreditNote"
+  | "sales.creditNotes.creditNoteDetails"
+  | "sales.creditNotes.applyCreditNote"
+  | "sales.creditNotes.creditNote"
+  | "sales.creditNotes.apply"
+  | "sales.creditNotes.totalAmount"
+  | "sales.creditNotes.appliedCredits"
+  | "sales.creditNotes.pendingCredits"
+  | "sales.creditNotes.invoiceNumber"
+  | "sales.creditNotes.applyToInvoice"
+  | "sales.creditNotes.voidCreditNote"
+  | "sales.creditNotes.noCreditNotesFound"
+  | "sales.creditNotes.creditIssued"
+  | "sales.creditNotes.toInvoices"
+  | "sales.creditNotes.toBeApplied"
+  | "sales.recurringInvoices.title"
+  | "sales.recurringInvoices.description"
+  | "sales.recurringInvoices.addTemplate"
+  | "sales.recurringInvoices.editTemplate"
+  | "sales.recurringInvoices.templateName"
+  | "sales.recurringInvoices.frequency"
+  | "sales.recurringInvoices.startDate"
+  | "sales.recurringInvoices.endDate"
+  | "sales.recurringInvoices.nextInvoiceDate"
+  | "sales.recurringInvoices.active"
+  | "sales.recurringInvoices.paused"
+  | "sales.recurringInvoices.daily"
+  | "sales.recurringInvoices.weekly"
+  | "sales.recurringInvoices.monthly"
+  | "sales.recurringInvoices.quarterly"
+  | "sales.recurringInvoices.yearly"
+  | "sales.recurringInvoices.totalTemplates"
+  | "sales.recurringInvoices.recurringInvoiceCreatedSuccess"
+  | "sales.recurringInvoices.recurringInvoiceCreateError"
+  | "sales.recurringInvoices.recurringInvoiceStatusChanged"
+  | "sales.recurringInvoices.templateActivatedSuccess"
+  | "sales.recurringInvoices.templatePausedSuccess"
+  | "sales.recurringInvoices.descriptionShort"
+  | "sales.recurringInvoices.addRecurringInvoice"
+  | "sales.recurringInvoices.createTemplate"
+  | "sales.recurringInvoices.paymentTerms"
+  | "sales.recurringInvoices.totalRecurring"
+  | "sales.recurringInvoices.activeTemplates"
+  | "sales.recurringInvoices.nextInvoice"
+  | "sales.recurringInvoices.invoicesSent"
+  | "sales.recurringInvoices.pauseTemplate"
+  | "sales.recurringInvoices.activateTemplate"
+  | "sales.recurringInvoices.noRecurringInvoicesFound"
+  | "sales.recurringInvoices.generateNow"
+  | "sales.recurringInvoices.invoiceGeneratedSuccess"
+  | "sales.recurringInvoices.invoiceGenerationFailed"
+  | "sales.confirmed"
+  | "sales.processing"
+  | "sales.shipped"
+  | "sales.delivered"
+  | "sales.unfulfilled"
+  | "sales.fulfilled"
+  | "sales.customers.customer"
+  | "paymentTerms.net15"
+  | "paymentTerms.net30"
+  | "paymentTerms.net60"
+  | "paymentTerms.net90"
+  | "paymentTerms.dueOnReceipt"
+  | "paymentTerms.net45"
+  | "purchases.bills.title"
+  | "purchases.bills.description"
+  | "purchases.bills.addBill"
+  | "purchases.bills.quickBill"
+  | "purchases.bills.newBill"
+  | "purchases.bills.editBill"
+  | "purchases.bills.billNumber"
+  | "purchases.bills.billDate"
+  | "purchases.bills.supplier"
+  | "purchases.bills.selectSupplier"
+  | "purchases.bills.totalBills"
+  | "purchases.bills.paidBills"
+  | "purchases.bills.unpaidBills"
+  | "purchases.bills.overdueBills"
+  | "purchases.bills.allBills"
+  | "purchases.bills.totalAmount"
+  | "purchases.bills.outstanding"
+  | "purchases.bills.toBePaid"
+  | "purchases.bills.overdueAmount"
+  | "purchases.bills.pastDueDate"
+  | "purchases.bills.descriptionPlaceholder"
+  | "purchases.bills.supplierReference"
+  | "purchases.bills.supplierInvoiceNumber"
+  | "purchases.bills.billCreated"
+  | "purchases.bills.billCreatedDesc"
+  | "purchases.bills.billCreateError"
+  | "purchases.bills.billDeleted"
+  | "purchases.bills.billDeletedDesc"
+  | "purchases.bills.billDeleteError"
+  | "purchases.bills.billDuplicated"
+  | "purchases.bills.billDuplicatedDesc"
+  | "purchases.bills.confirmDelete"
+  | "purchases.bills.supplierReferencePlaceholder"
+  | "purchases.bills.bill"
+  | "purchases.orders.title"
+  | "purchases.orders.description"
+  | "purchases.orders.descriptionShort"
+  | "purchases.orders.addPurchaseOrder"
+  | "purchases.orders.editPurchaseOrder"
+  | "purchases.orders.purchaseOrderNumber"
+  | "purchases.orders.purchaseOrderDate"
+  | "purchases.orders.expectedDelivery"
+  | "purchases.orders.convertToBill"
+  | "purchases.orders.totalPurchaseOrders"
+  | "purchases.orders.received"
+  | "purchases.orders.ordered"
+  | "purchases.orders.pendingApproval"
+  | "purchases.orders.needReview"
+  | "purchases.orders.allOrders"
+  | "purchases.orders.approval"
+  | "purchases.orders.totalValue"
+  | "purchases.orders.purchaseVolume"
+  | "purchases.orders.averageValue"
+  | "purchases.orders.perOrder"
+  | "purchases.orders.viewDetails"
+  | "purchases.orders.approve"
+  | "purchases.orders.sendToVendor"
+  | "purchases.orders.cancelOrder"
+  | "purchases.orders.createPurchaseOrder"
+  | "purchases.orders.descriptionPlaceholder"
+  | "purchases.orders.orderCreated"
+  | "purchases.orders.orderCreatedDesc"
+  | "purchases.orders.orderCreateError"
+  | "purchases.orders.orderApproved"
+  | "purchases.orders.orderApprovedDesc"
+  | "purchases.orders.orderConvertedDesc"
+  | "purchases.orders.orderConvertError"
+  | "purchases.orders.confirmConvert"
+  | "purchases.orders.orderSent"
+  | "purchases.orders.orderSentDesc"
+  | "purchases.orders.orderCancelled"
+  | "purchases.orders.orderCancelledDesc"
+  | "purchases.orders.confirmCancel"
+  | "purchases.expenses.title"
+  | "purchases.expenses.description"
+  | "purchases.expenses.descriptionShort"
+  | "purchases.expenses.addExpense"
+  | "purchases.expenses.editExpense"
+  | "purchases.expenses.expenseNumber"
+  | "purchases.expenses.expenseDate"
+  | "purchases.expenses.category"
+  | "purchases.expenses.selectCategory"
+  | "purchases.expenses.amount"
+  | "purchases.expenses.paidBy"
+  | "purchases.expenses.paidByPlaceholder"
+  | "purchases.expenses.paymentMethod"
+  | "purchases.expenses.payment"
+  | "purchases.expenses.reference"
+  | "purchases.expenses.receipt"
+  | "purchases.expenses.uploadReceipt"
+  | "purchases.expenses.reimbursable"
+  | "purchases.expenses.reimbursableHint"
+  | "purchases.expenses.notesPlaceholder"
+  | "purchases.expenses.createExpense"
+  | "purchases.expenses.totalExpenses"
+  | "purchases.expenses.allExpenses"
+  | "purchases.expenses.approvedExpenses"
+  | "purchases.expenses.awaitingApproval"
+  | "purchases.expenses.toReimburse"
+  | "purchases.expenses.approved"
+  | "purchases.expenses.accepted"
+  | "purchases.expenses.rejected"
+  | "purchases.expenses.reimbursed"
+  | "purchases.expenses.approve"
+  | "purchases.expenses.reject"
+  | "purchases.expenses.reimburse"
+  | "purchases.expenses.expenseCreated"
+  | "purchases.expenses.expenseCreatedDesc"
+  | "purchases.expenses.expenseCreateError"
+  | "purchases.expenses.expenseUpdated"
+  | "purchases.expenses.expenseUpdatedDesc"
+  | "purchases.expenses.expenseUpdateError"
+  | "purchases.expenses.viewDetails"
+  | "purchases.expenses.categories.office"
+  | "purchases.expenses.categories.rent"
+  | "purchases.expenses.categories.utilities"
+  | "purchases.expenses.categories.salaries"
+  | "purchases.expenses.categories.marketing"
+  | "purchases.expenses.categories.travel"
+  | "purchases.expenses.categories.equipment"
+  | "purchases.expenses.categories.supplies"
+  | "purchases.expenses.categories.insurance"
+  | "purchases.expenses.categories.maintenance"
+  | "purchases.expenses.categories.software"
+  | "purchases.expenses.categories.entertainment"
+  | "purchases.expenses.categories.training"
+  | "purchases.expenses.categories.meals"
+  | "purchases.expenses.categories.communication"
+  | "purchases.expenses.categories.other"
+  | "purchases.expenses.paymentMethods.cash"
+  | "purchases.expenses.paymentMethods.creditCard"
+  | "purchases.expenses.paymentMethods.companyCard"
+  | "purchases.expenses.paymentMethods.bankTransfer"
+  | "purchases.expenses.paymentMethods.personalCard"
+  | "purchases.expenses.paymentMethods.pettyCash"
+  | "purchases.expenses.expenseAccount"
+  | "purchases.expenses.selectExpenseAccount"
+  | "purchases.expenses.paidFromAccount"
+  | "purchases.expenses.selectPaidFromAccount"
+  | "purchases.debitNotes.title"
+  | "purchases.debitNotes.description"
+  | "purchases.debitNotes.addDebitNote"
+  | "purchases.debitNotes.editDebitNote"
+  | "purchases.debitNotes.debitNote"
+  | "purchases.debitNotes.debitNoteNumber"
+  | "purchases.debitNotes.debitNoteDate"
+  | "purchases.debitNotes.relatedBill"
+  | "purchases.debitNotes.reason"
+  | "purchases.debitNotes.createDebitNote"
+  | "purchases.debitNotes.totalDebitNotes"
+  | "purchases.debitNotes.totalAmount"
+  | "purchases.debitNotes.debitIssued"
+  | "purchases.debitNotes.applied"
+  | "purchases.debitNotes.toBills"
+  | "purchases.debitNotes.pending"
+  | "purchases.debitNotes.toBeApplied"
+  | "purchases.debitNotes.searchPlaceholder"
+  | "purchases.debitNotes.send"
+  | "purchases.debitNotes.applyToBill"
+  | "purchases.debitNotes.downloadPDF"
+  | "purchases.debitNotes.confirmVoid"
+  | "purchases.debitNotes.debitNoteCreated"
+  | "purchases.debitNotes.debitNoteCreatedDesc"
+  | "purchases.debitNotes.debitNoteCreateError"
+  | "purchases.debitNotes.debitNoteSent"
+  | "purchases.debitNotes.debitNoteSentDesc"
+  | "purchases.debitNotes.debitNoteApplied"
+  | "purchases.debitNotes.debitNoteAppliedDesc"
+  | "purchases.debitNotes.debitNoteVoided"
+  | "purchases.debitNotes.debitNoteVoidedDesc"
+  | "purchases.debitNotes.debitNoteUpdated"
+  | "purchases.debitNotes.debitNoteUpdateError"
+  | "purchases.debitNotes.debitNoteDeleted"
+  | "purchases.debitNotes.debitNoteDeleteError"
+  | "purchases.debitNotes.debitNoteApplyError"
+  | "purchases.debitNotes.applyDebitNote"
+  | "purchases.vendors.vendor"
+  | "accounting.costCenters.title"
+  | "accounting.costCenters.createSuccess"
+  | "accounting.costCenters.updateSuccess"
+  | "accounting.costCenters.deleteSuccess"
+  | "accounting.costCenters.add"
+  | "accounting.costCenters.edit"
+  | "accounting.costCenters.code"
+  | "accounting.costCenters.name"
+  | "accounting.costCenters.parent"
+  | "accounting.costCenters.list"
+  | "accounting.insights.title"
+  | "accounting.insights.subtitle"
+  | "accounting.insights.anomalies"
+  | "accounting.insights.anomaliesDesc"
+  | "accounting.insights.suggestions"
+  | "accounting.insights.suggestionsDesc"
+  | "accounting.insights.cashFlowForecast"
+  | "accounting.insights.cashFlowDesc"
+  | "accounting.insights.expenseAnalysis"
+  | "accounting.insights.expenseDesc"
+  | "accounting.insights.askAI"
+  | "accounting.insights.aiReport"
+  | "accounting.insights.allGood"
+  | "accounting.insights.noIssues"
+  | "accounting.journals.title"
+  | "accounting.journals.pageDescription"
+  | "accounting.journals.new"
+  | "accounting.journals.entries"
+  | "accounting.journals.date"
+  | "accounting.journals.number"
+  | "accounting.journals.description"
+  | "accounting.journals.reference"
+  | "accounting.journals.source"
+  | "accounting.journals.amount"
+  | "accounting.journals.actions"
+  | "accounting.journals.noJournals"
+  | "accounting.journals.manual"
+  | "accounting.journals.draftWithAI"
+  | "accounting.journals.draftJournalWithAI"
+  | "accounting.journals.aiDescription"
+  | "accounting.journals.aiPlaceholder"
+  | "accounting.journals.drafting"
+  | "accounting.journals.generateDraft"
+  | "accounting.journals.aiDraftWarnings"
+  | "accounting.journals.draftGenerated"
+  | "accounting.journals.draftFromDescription"
+  | "accounting.journals.aiDraftFailed"
+  | "accounting.journals.details"
+  | "accounting.journals.account"
+  | "accounting.journals.project"
+  | "accounting.journals.selectAccount"
+  | "accounting.journals.selectProject"
+  | "accounting.journals.totalDebit"
+  | "accounting.journals.totalCredit"
+  | "accounting.journals.addLine"
+  | "accounting.journals.debit"
+  | "accounting.journals.credit"
+  | "accounting.journals.difference"
+  | "accounting.journals.messages.created"
+  | "accounting.journals.messages.balancedError"
+  | "accounting.journals.messages.accountError"
+  | "accounting.accounts.messages.created"
+  | "accounting.accounts.messages.createFailed"
+  | "accounting.accounts.messages.updated"
+  | "accounting.accounts.messages.updateFailed"
+  | "accounting.accounts.messages.deleted"
+  | "accounting.accounts.messages.deleteFailed"
+  | "accounting.accounts.messages.deleteConfirm"
+  | "accounting.accounts.messages.deleteWarning"
+  | "accounting.accounts.messages.noAccounts"
+  | "accounting.accounts.messages.startAdding"
+  | "accounting.accounts.messages.defaultsCreated"
+  | "accounting.accounts.messages.initFailed"
+  | "accounting.accounts.title"
+  | "accounting.accounts.description"
+  | "accounting.accounts.add"
+  | "accounting.accounts.create"
+  | "accounting.accounts.edit"
+  | "accounting.accounts.code"
+  | "accounting.accounts.name"
+  | "accounting.accounts.type"
+  | "accounting.accounts.subtype"
+  | "accounting.accounts.parentAccount"
+  | "accounting.accounts.descriptionLabel"
+  | "accounting.accounts.active"
+  | "accounting.accounts.activeDesc"
+  | "accounting.accounts.initDefaults"
+  | "accounting.accounts.initDefaultsDesc"
+  | "accounting.accounts.initDefaultsWarning"
+  | "accounting.accounts.createDefaults"
+  | "accounting.accounts.treeView"
+  | "accounting.accounts.listView"
+  | "accounting.accounts.searchPlaceholder"
+  | "accounting.accounts.types.asset"
+  | "accounting.accounts.types.liability"
+  | "accounting.accounts.types.equity"
+  | "accounting.accounts.types.revenue"
+  | "accounting.accounts.types.expense"
+  | "accounting.accounts.subtypes.CurrentAsset"
+  | "accounting.accounts.subtypes.Cash"
+  | "accounting.accounts.subtypes.AccountsReceivable"
+  | "accounting.accounts.subtypes.Inventory"
+  | "accounting.accounts.subtypes.FixedAsset"
+  | "accounting.accounts.subtypes.OtherAsset"
+  | "accounting.accounts.subtypes.CurrentLiability"
+  | "accounting.accounts.subtypes.AccountsPayable"
+  | "accounting.accounts.subtypes.CreditCard"
+  | "accounting.accounts.subtypes.LongTermLiability"
+  | "accounting.accounts.subtypes.OtherLiability"
+  | "accounting.accounts.subtypes.OwnersEquity"
+  | "accounting.accounts.subtypes.RetainedEarnings"
+  | "accounting.accounts.subtypes.ShareCapital"
+  | "accounting.accounts.subtypes.Dividends"
+  | "accounting.accounts.subtypes.SalesRevenue"
+  | "accounting.accounts.subtypes.ServiceRevenue"
+  | "accounting.accounts.subtypes.OtherRevenue"
+  | "accounting.accounts.subtypes.InterestIncome"
+  | "accounting.accounts.subtypes.CostOfGoods"
+  | "accounting.accounts.subtypes.OperatingExpense"
+  | "accounting.accounts.subtypes.SalaryExpense"
+  | "accounting.accounts.subtypes.RentExpense"
+  | "accounting.accounts.subtypes.UtilityExpense"
+  | "accounting.accounts.subtypes.OtherExpense"
+  | "projects.title"
+  | "projects.description"
+  | "projects.addProject"
+  | "projects.createTitle"
+  | "projects.createDesc"
+  | "projects.code"
+  | "projects.name"
+  | "projects.status"
+  | "projects.budget"
+  | "projects.startDate"
+  | "projects.endDate"
+  | "projects.actions"
+  | "projects.view"
+  | "projects.active"
+  | "projects.completed"
+  | "projects.on_hold"
+  | "projects.cancelled"
+  | "projects.createdSuccess"
+  | "projects.notFound"
+  | "projects.revenue"
+  | "projects.expenses"
+  | "projects.profit"
+  | "projects.utilized"
+  | "projects.transactions"
+  | "projects.noTransactions"
+  | "projects.totalProjects"
+  | "projects.activeProjects"
+  | "projects.completedProjects"
+  | "projects.totalBudget"
+  | "projects.viewTitle"
+  | "projects.editTitle"
+  | "projects.updatedSuccess"
+  | "projects.deletedSuccess"
+  | "projects.deleteConfirm"
+  | "projects.dateError"
+  | "projects.profitabilityReport"
+  | "projects.profitabilityDesc"
+  | "projects.profitable"
+  | "projects.loss"
+  | "projects.breakeven"
+  | "projects.totalRevenue"
+  | "projects.totalExpenses"
+  | "projects.netProfit"
+  | "projects.profitMargin"
+  | "projects.profitableProjects"
+  | "projects.lossProjects"
+  | "projects.profitabilityDetails"
+  | "projects.budgetUsage"
+  | "projects.profitability"
+  | "projects.financialSummary"
+  | "projects.spent"
+  | "projects.noFinancialData"
+  | "projects.overview"
+  | "projects.phases"
+  | "projects.tasks"
+  | "projects.timeTracking"
+  | "projects.addPhase"
+  | "projects.editPhase"
+  | "projects.noPhases"
+  | "projects.phase"
+  | "projects.progress"
+  | "projects.phaseStatus.pending"
+  | "projects.phaseStatus.in_progress"
+  | "projects.phaseStatus.completed"
+  | "projects.phaseStatus.on_hold"
+  | "projects.addTask"
+  | "projects.editTask"
+  | "projects.noTasks"
+  | "projects.task"
+  | "projects.taskTitle"
+  | "projects.taskStatus.todo"
+  | "projects.taskStatus.in_progress"
+  | "projects.taskStatus.completed"
+  | "projects.taskStatus.blocked"
+  | "projects.priority.low"
+  | "projects.priority.medium"
+  | "projects.priority.high"
+  | "projects.priority.urgent"
+  | "projects.dueDate"
+  | "projects.assignedTo"
+  | "projects.selectAssignee"
+  | "projects.estimatedHours"
+  | "projects.selectPhase"
+  | "projects.logTime"
+  | "projects.noTimeEntries"
+  | "projects.totalHoursLogged"
+  | "projects.billable"
+  | "projects.hourlyRate"
+  | "projects.timeEntryDate"
+  | "projects.timeEntryHours"
+  | "projects.selectTask"
+  | "projects.deletePhaseConfirm"
+  | "projects.deleteTaskConfirm"
+  | "projects.deleteTimeConfirm"
+  | "projects.phaseCreatedSuccess"
+  | "projects.phaseUpdatedSuccess"
+  | "projects.phaseDeletedSuccess"
+  | "projects.taskCreatedSuccess"
+  | "projects.taskUpdatedSuccess"
+  | "projects.taskDeletedSuccess"
+  | "projects.timeCreatedSuccess"
+  | "projects.timeDeletedSuccess"
+  | "reports.title"
+  | "reports.description"
+  | "reports.export"
+  | "reports.exportAs"
+  | "reports.exportSuccess"
+  | "reports.exportedAs"
+  | "reports.exportError"
+  | "reports.image"
+  | "reports.customize"
+  | "reports.customizeDescription"
+  | "reports.visibleWidgets"
+  | "reports.dateRange.label"
+  | "reports.dateRange.today"
+  | "reports.dateRange.yesterday"
+  | "reports.dateRange.7days"
+  | "reports.dateRange.30days"
+  | "reports.dateRange.90days"
+  | "reports.dateRange.thisMonth"
+  | "reports.dateRange.lastMonth"
+  | "reports.dateRange.thisYear"
+  | "reports.dateRange.lastYear"
+  | "reports.dateRange.custom"
+  | "reports.compare"
+  | "reports.previousPeriod"
+  | "reports.lastYear"
+  | "reports.vsPrevious"
+  | "reports.total"
+  | "reports.metrics.revenue"
+  | "reports.metrics.expenses"
+  | "reports.metrics.profit"
+  | "reports.metrics.invoices"
+  | "reports.metrics.customers"
+  | "reports.metrics.items"
+  | "reports.metrics.transactions"
+  | "reports.metrics.receivables"
+  | "reports.metrics.payables"
+  | "reports.charts.revenueTrend"
+  | "reports.charts.revenueTrendDesc"
+  | "reports.charts.expensesByCategory"
+  | "reports.charts.expensesByCategoryDesc"
+  | "reports.charts.cashFlow"
+  | "reports.charts.cashFlowDesc"
+  | "reports.cashFlow.inflow"
+  | "reports.cashFlow.outflow"
+  | "reports.cashFlow.net"
+  | "reports.categories.salaries"
+  | "reports.categories.rent"
+  | "reports.categories.utilities"
+  | "reports.categories.supplies"
+  | "reports.categories.other"
+  | "reports.tables.topCustomers"
+  | "reports.tables.topCustomersDesc"
+  | "reports.tables.customer"
+  | "reports.tables.revenue"
+  | "reports.tables.growth"
+  | "reports.comparison.title"
+  | "reports.comparison.description"
+  | "reports.insights.title"
+  | "reports.insights.revenueUp"
+  | "reports.insights.revenueUpDesc"
+  | "reports.insights.overdueInvoices"
+  | "reports.insights.overdueInvoicesDesc"
+  | "reports.insights.cashFlowPositive"
+  | "reports.insights.cashFlowPositiveDesc"
+  | "reports.taxReport"
+  | "reports.aiAnalytics.title"
+  | "reports.loadingForecast"
+  | "reports.failedToLoadForecast"
+  | "reports.cashFlowForecast"
+  | "reports.projectedCashIn"
+  | "reports.projectedCashOut"
+  | "reports.netForecast"
+  | "reports.cashFlowTrend"
+  | "reports.aiInsights"
+  | "reports.noSpecificInsights"
+  | "reports.insight"
+  | "reports.loadingESGReport"
+  | "reports.failedToLoadESGReport"
+  | "reports.esgTitle"
+  | "reports.totalCarbon"
+  | "reports.yearToDate"
+  | "reports.energyUsage"
+  | "reports.emissionsByCategory"
+  | "reports.emissionsTrend"
+  | "reports.globalDashboardDesc"
+  | "reports.totalCash"
+  | "reports.totalRevenue"
+  | "reports.totalExpenses"
+  | "reports.companyBreakdown"
+  | "reports.cash"
+  | "reports.revenue"
+  | "reports.expenses"
+  | "ratios.title"
+  | "ratios.description"
+  | "ratios.liquidity"
+  | "ratios.profitability"
+  | "ratios.leverage"
+  | "ratios.efficiency"
+  | "ratios.totalAssets"
+  | "ratios.totalLiabilities"
+  | "ratios.revenue"
+  | "ratios.netIncome"
+  | "ratios.currentRatio"
+  | "ratios.currentRatioDesc"
+  | "ratios.quickRatio"
+  | "ratios.quickRatioDesc"
+  | "ratios.workingCapital"
+  | "ratios.workingCapitalDesc"
+  | "ratios.grossMargin"
+  | "ratios.grossMarginDesc"
+  | "ratios.netMargin"
+  | "ratios.netMarginDesc"
+  | "ratios.roa"
+  | "ratios.roaDesc"
+  | "ratios.roe"
+  | "ratios.roeDesc"
+  | "ratios.debtRatio"
+  | "ratios.debtRatioDesc"
+  | "ratios.debtToEquity"
+  | "ratios.debtToEquityDesc"
+  | "ratios.equityRatio"
+  | "ratios.equityRatioDesc"
+  | "ratios.assetTurnover"
+  | "ratios.assetTurnoverDesc"
+  | "ratios.inventoryTurnover"
+  | "ratios.inventoryTurnoverDesc"
+  | "ratios.daysInventory"
+  | "ratios.daysInventoryDesc"
+  | "ratios.days"
+  | "ratios.benchmark"
+  | "ratios.positive"
+  | "ratios.legend"
+  | "ratios.healthy"
+  | "ratios.needsAttention"
+  | "ratios.critical"
+  | "inventory.inStock"
+  | "inventory.lowStock"
+  | "inventory.critical"
+  | "inventory.outOfStock"
+  | "inventory.stockHistory"
+  | "inventory.itemAdded"
+  | "inventory.itemAddedSuccess"
+  | "inventory.addingItem"
+  | "inventory.addItem"
+  | "inventory.totalItems"
+  | "inventory.totalValue"
+  | "inventory.totalQuantity"
+  | "inventory.selectCategory"
+  | "inventory.searchPlaceholder"
+  | "inventory.warehouses.title"
+  | "inventory.warehouses.description"
+  | "inventory.warehouses.addWarehouse"
+  | "inventory.warehouses.editWarehouse"
+  | "inventory.warehouses.code"
+  | "inventory.warehouses.name"
+  | "inventory.warehouses.location"
+  | "inventory.warehouses.status"
+  | "inventory.warehouses.active"
+  | "inventory.warehouses.inactive"
+  | "inventory.warehouses.details"
+  | "inventory.warehouses.descriptionPlaceholder"
+  | "inventory.warehouses.created"
+  | "inventory.warehouses.createdDesc"
+  | "inventory.warehouses.updated"
+  | "inventory.warehouses.updatedDesc"
+  | "inventory.warehouses.deleted"
+  | "inventory.warehouses.deletedDesc"
+  | "inventory.warehouses.deleteConfirm"
+  | "inventory.warehouses.editDetails"
+  | "inventory.adjustments.title"
+  | "inventory.adjustments.description"
+  | "inventory.adjustments.addAdjustment"
+  | "inventory.adjustments.editAdjustment"
+  | "inventory.adjustments.date"
+  | "inventory.adjustments.reference"
+  | "inventory.adjustments.warehouse"
+  | "inventory.adjustments.reason"
+  | "inventory.adjustments.status"
+  | "inventory.adjustments.notes"
+  | "inventory.adjustments.items"
+  | "inventory.adjustments.item"
+  | "inventory.adjustments.quantity"
+  | "inventory.adjustments.type"
+  | "inventory.adjustments.increase"
+  | "inventory.adjustments.decrease"
+  | "inventory.adjustments.details"
+  | "inventory.adjustments.created"
+  | "inventory.adjustments.createdDesc"
+  | "inventory.adjustments.updated"
+  | "inventory.adjustments.updatedDesc"
+  | "inventory.adjustments.deleted"
+  | "inventory.adjustments.deletedDesc"
+  | "inventory.adjustments.deleteConfirm"
+  | "inventory.adjustments.selectWarehouse"
+  | "inventory.adjustments.selectItem"
+  | "inventory.adjustments.selectType"
+  | "inventory.adjustments.reasonPlaceholder"
+  | "inventory.valuation.title"
+  | "inventory.valuation.description"
+  | "inventory.valuation.totalValue"
+  | "inventory.valuation.totalItems"
+  | "inventory.valuation.itemCode"
+  | "inventory.valuation.itemName"
+  | "inventory.valuation.quantity"
+  | "inventory.valuation.averageCost"
+  | "inventory.valuation.value"
+  | "inventory.rawMaterials"
+  | "inventory.warehousePlaceholder"
+  | "inventory.productName"
+  | "inventory.reorderPoint"
+  | "inventory.unitCost"
+  | "inventory.stockLevelsAsOf"
+  | "inventory.locationOptional"
+  | "inventory.currentQuantity"
+  | "inventory.reorderQuantity"
+  | "inventory.lowStockAlert"
+  | "inventory.itemsNeedReorder"
+  | "inventory.uniqueSkus"
+  | "inventory.unitsInStock"
+  | "inventory.stockMovements"
+  | "inventory.recentStockMovements"
+  | "inventory.inventoryValuationMethod"
+  | "inventory.fifo"
+  | "inventory.changeMethod"
+  | "inventory.valuationByCategory"
+  | "inventory.reorder"
+  | "inventory.failedToAddItem"
+  | "inventory.location"
+  | "inventory.skuPlaceholder"
+  | "inventory.productNamePlaceholder"
+  | "inventory.purchase"
+  | "inventory.sale"
+  | "inventory.adjustment"
+  | "inventory.transferIn"
+  | "inventory.transferOut"
+  | "inventory.batchLotNumbers"
+  | "inventory.warehouse"
+  | "inventory.noBatches"
+  | "inventory.selectWarehouse"
+  | "inventory.voucherCreated"
+  | "inventory.allocated"
+  | "inventory.costsDistributed"
+  | "inventory.posted"
+  | "inventory.landedCostsApplied"
+  | "inventory.billAdded"
+  | "inventory.freightBillAdded"
+  | "inventory.itemsAdded"
+  | "inventory.stockMovementsAdded"
+  | "inventory.newLandedCostVoucher"
+  | "inventory.createAllocationRecord"
+  | "inventory.allocateCosts"
+  | "inventory.post"
+  | "inventory.createDraft"
+  | "inventory.allocationMethod"
+  | "inventory.byValue"
+  | "inventory.byQuantity"
+  | "inventory.importShipmentPlaceholder"
+  | "inventory.totalFreight"
+  | "inventory.itemsValue"
+  | "inventory.freightCustomsBills"
+  | "inventory.addBillsDescription"
+  | "inventory.addBill"
+  | "inventory.addFreightBill"
+  | "inventory.selectBill"
+  | "inventory.selectBillPlaceholder"
+  | "inventory.amountToAllocate"
+  | "inventory.billNumber"
+  | "inventory.noBillsAdded"
+  | "inventory.itemsToAllocate"
+  | "inventory.selectGRNDescription"
+  | "inventory.addItems"
+  | "inventory.selectStockReceipts"
+  | "inventory.addSelectedItems"
+  | "inventory.originalCost"
+  | "inventory.newUnitCost"
+  | "inventory.noItemsAdded"
+  | "inventory.landedCostVouchers"
+  | "inventory.landedCostDescription"
+  | "inventory.newVoucher"
+  | "inventory.vouchers"
+  | "inventory.noLandedCostVouchers"
+  | "inventory.method"
+  | "inventory.selectItem"
+  | "inventory.batch"
+  | "inventory.exp"
+  | "inventory.transferUpdated"
+  | "inventory.transferUpdatedDescription"
+  | "inventory.cannotEdit"
+  | "inventory.onlyDraftEditable"
+  | "inventory.editTransfer"
+  | "inventory.editTransferDescription"
+  | "inventory.transferDetails"
+  | "inventory.selectSource"
+  | "inventory.selectDestination"
+  | "inventory.transferCreated"
+  | "inventory.transferCreatedDescription"
+  | "inventory.createTransferDescription"
+  | "inventory.createTransfer"
+  | "inventory.transferCompleted"
+  | "inventory.transferDeleted"
+  | "inventory.stockTransfers"
+  | "inventory.stockTransfersDescription"
+  | "inventory.transferHistory"
+  | "inventory.deleteTransferTitle"
+  | "inventory.deleteTransferDescription"
+  | "inventory.approveTransferTitle"
+  | "inventory.approveTransferDescription"
+  | "inventory.approveAndTransfer"
+  | "inventory.noTransfersFound"
+  | "inventory.fromLastMonth"
+  | "hr.departments"
+  | "hr.addDepartment"
+  | "hr.editDepartment"
+  | "hr.departmentName"
+  | "hr.name"
+  | "hr.noDepartments"
+  | "hr.departmentCreateSuccess"
+  | "hr.departmentUpdateSuccess"
+  | "hr.employees"
+  | "hr.addEmployee"
+  | "hr.editEmployee"
+  | "hr.firstName"
+  | "hr.lastName"
+  | "hr.department"
+  | "hr.jobTitle"
+  | "hr.hireDate"
+  | "hr.salary"
+  | "hr.contact"
+  | "hr.role"
+  | "hr.noEmployees"
+  | "hr.employeeCreateSuccess"
+  | "hr.employeeUpdateSuccess"
+  | "hr.payroll"
+  | "hr.newPayrollRun"
+  | "hr.periodStart"
+  | "hr.periodEnd"
+  | "hr.paymentDate"
+  | "hr.generate"
+  | "hr.history"
+  | "hr.noRuns"
+  | "hr.payslips"
+  | "hr.selectRun"
+  | "hr.employee"
+  | "hr.basic"
+  | "hr.allowances"
+  | "hr.deductions"
+  | "hr.net"
+  | "hr.selectRunPrompt"
+  | "hr.payrollRunSuccess"
+  | "status.draft"
+  | "status.pending"
+  | "status.sent"
+  | "status.viewed"
+  | "status.paid"
+  | "status.partial"
+  | "status.overdue"
+  | "status.cancelled"
+  | "status.void"
+  | "status.active"
+  | "status.inactive"
+  | "status.processing"
+  | "status.completed"
+  | "status.failed"
+  | "status.connected"
+  | "status.disconnected"
+  | "status.planned"
+  | "status.inProgress"
+  | "contacts.title"
+  | "contacts.subtitle"
+  | "contacts.customers"
+  | "contacts.suppliers"
+  | "contacts.both"
+  | "contacts.all"
+  | "contacts.addContact"
+  | "contacts.editContact"
+  | "contacts.deleteContact"
+  | "contacts.addCustomer"
+  | "contacts.addSupplier"
+  | "contacts.companyName"
+  | "contacts.contactName"
+  | "contacts.displayName"
+  | "contacts.contactCode"
+  | "contacts.contactType"
+  | "contacts.email"
+  | "contacts.phone"
+  | "contacts.website"
+  | "contacts.address"
+  | "contacts.city"
+  | "contacts.state"
+  | "contacts.country"
+  | "contacts.postalCode"
+  | "contacts.taxNumber"
+  | "contacts.registrationNumber"
+  | "contacts.paymentTerms"
+  | "contacts.paymentTermsDays"
+  | "contacts.creditLimit"
+  | "contacts.currency"
+  | "contacts.isActive"
+  | "contacts.customer"
+  | "contacts.supplier"
+  | "contacts.noContacts"
+  | "contacts.noContactsDesc"
+  | "contacts.contactCreated"
+  | "contacts.contactCreatedDesc"
+  | "contacts.contactUpdated"
+  | "contacts.contactUpdatedDesc"
+  | "contacts.contactDeleted"
+  | "contacts.contactDeletedDesc"
+  | "contacts.dueOnReceipt"
+  | "contacts.net7"
+  | "contacts.net15"
+  | "contacts.net30"
+  | "contacts.net45"
+  | "contacts.net60"
+  | "contacts.net90"
+  | "contacts.activeContactDesc"
+  | "contacts.companyNamePlaceholder"
+  | "contacts.viewStatement"
+  | "contacts.linkedCompanyHelp"
+  | "items.title"
+  | "items.subtitle"
+  | "items.products"
+  | "items.services"
+  | "items.all"
+  | "items.addItem"
+  | "items.editItem"
+  | "items.deleteItem"
+  | "items.addProduct"
+  | "items.addService"
+  | "items.itemName"
+  | "items.itemCode"
+  | "items.itemType"
+  | "items.product"
+  | "items.service"
+  | "items.description"
+  | "items.category"
+  | "items.unit"
+  | "items.barcode"
+  | "items.salePrice"
+  | "items.purchasePrice"
+  | "items.unitPrice"
+  | "items.stockQuantity"
+  | "items.minimumStock"
+  | "items.reorderLevel"
+  | "items.supplier"
+  | "items.taxable"
+  | "items.isActive"
+  | "items.isSellable"
+  | "items.isPurchasable"
+  | "items.trackInventory"
+  | "items.inStock"
+  | "items.outOfStock"
+  | "items.lowStock"
+  | "items.salesAccount"
+  | "items.purchaseAccount"
+  | "items.inventoryAccount"
+  | "items.defaultTax"
+  | "items.noItems"
+  | "items.noItemsDesc"
+  | "items.itemCreated"
+  | "items.itemCreatedDesc"
+  | "items.itemUpdated"
+  | "items.itemUpdatedDesc"
+  | "items.itemDeleted"
+  | "items.itemDeletedDesc"
+  | "items.piece"
+  | "items.kg"
+  | "items.liter"
+  | "items.meter"
+  | "items.hour"
+  | "items.day"
+  | "items.box"
+  | "items.pack"
+  | "items.dozen"
+  | "items.trackInventoryDesc"
+  | "items.units.piece"
+  | "items.units.kg"
+  | "items.units.liter"
+  | "items.units.meter"
+  | "items.units.hour"
+  | "items.units.day"
+  | "items.units.box"
+  | "items.units.pack"
+  | "items.units.dozen"
+  | "items.categories.electronics"
+  | "items.categories.furniture"
+  | "items.categories.clothing"
+  | "items.categories.food"
+  | "items.categories.stationery"
+  | "items.categories.services"
+  | "items.categories.consulting"
+  | "items.categories.maintenance"
+  | "items.categories.other"
+  | "items.trackingType"
+  | "items.tracking.none"
+  | "items.tracking.noneDesc"
+  | "items.tracking.batch"
+  | "items.tracking.batchDesc"
+  | "items.tracking.serial"
+  | "items.tracking.serialDesc"
+  | "items.tracking.batchHint"
+  | "items.tracking.serialHint"
+  | "items.tracking.noneHint"
+  | "items.warehouseHint"
+  | "items.item"
+  | "accounts.title"
+  | "accounts.subtitle"
+  | "accounts.addAccount"
+  | "accounts.editAccount"
+  | "accounts.deleteAccount"
+  | "accounts.assets"
+  | "accounts.liabilities"
+  | "accounts.equity"
+  | "accounts.revenue"
+  | "accounts.income"
+  | "accounts.expenses"
+  | "accounts.expense"
+  | "accounts.accountCode"
+  | "accounts.accountName"
+  | "accounts.accountNameAr"
+  | "accounts.accountNameArPlaceholder"
+  | "accounts.accountType"
+  | "accounts.accountSubtype"
+  | "accounts.parentAccount"
+  | "accounts.balance"
+  | "accounts.debit"
+  | "accounts.credit"
+  | "accounts.isActive"
+  | "accounts.currentAsset"
+  | "accounts.cash"
+  | "accounts.accountsReceivable"
+  | "accounts.inventory"
+  | "accounts.fixedAsset"
+  | "accounts.otherAsset"
+  | "accounts.currentLiability"
+  | "accounts.accountsPayable"
+  | "accounts.creditCard"
+  | "accounts.longTermLiability"
+  | "accounts.otherLiability"
+  | "accounts.ownersEquity"
+  | "accounts.retainedEarnings"
+  | "accounts.shareCapital"
+  | "accounts.dividends"
+  | "accounts.salesRevenue"
+  | "accounts.serviceRevenue"
+  | "accounts.otherRevenue"
+  | "accounts.interestIncome"
+  | "accounts.costOfGoods"
+  | "accounts.operatingExpense"
+  | "accounts.salaryExpense"
+  | "accounts.rentExpense"
+  | "accounts.utilityExpense"
+  | "accounts.otherExpense"
+  | "accounts.noAccounts"
+  | "accounts.noAccountsDesc"
+  | "accounts.accountCreated"
+  | "accounts.accountCreatedDesc"
+  | "accounts.accountUpdated"
+  | "accounts.accountUpdatedDesc"
+  | "accounts.accountDeleted"
+  | "accounts.accountDeletedDesc"
+  | "companies.title"
+  | "companies.subtitle"
+  | "companies.addCompany"
+  | "companies.editCompany"
+  | "companies.deleteCompany"
+  | "companies.companyName"
+  | "companies.legalName"
+  | "companies.taxNumber"
+  | "companies.registrationNumber"
+  | "companies.baseCurrency"
+  | "companies.fiscalYearStart"
+  | "companies.dateFormat"
+  | "companies.numberFormat"
+  | "companies.defaultCompany"
+  | "companies.activeCompany"
+  | "companies.noCompanies"
+  | "companies.noCompaniesDesc"
+  | "companies.confirmDelete"
+  | "companies.deleteWarning"
+  | "companies.companyDetails"
+  | "companies.basicInfo"
+  | "companies.financialSettings"
+  | "companies.formatSettings"
+  | "companies.companyInfo"
+  | "companies.businessRegistration"
+  | "companies.taxInfo"
+  | "companies.bankingInfo"
+  | "companies.industry"
+  | "companies.fiscalYear"
+  | "companies.timezone"
+  | "companies.website"
+  | "companies.switchCompany"
+  | "companies.manage"
+  | "companies.noCompany"
+  | "settings.general.title"
+  | "settings.general.description"
+  | "settings.general.companySettings"
+  | "settings.general.systemSettings"
+  | "settings.general.notifications"
+  | "settings.general.preferences"
+  | "settings.general.timezone"
+  | "settings.general.language"
+  | "settings.general.theme"
+  | "settings.general.lightMode"
+  | "settings.general.darkMode"
+  | "settings.general.autoMode"
+  | "settings.tabs.company"
+  | "settings.tabs.regional"
+  | "settings.tabs.invoice"
+  | "settings.tabs.notifications"
+  | "settings.tabs.security"
+  | "settings.company.title"
+  | "settings.company.description"
+  | "settings.company.logo"
+  | "settings.company.uploadLogo"
+  | "settings.company.logoHelp"
+  | "settings.company.name"
+  | "settings.company.taxId"
+  | "settings.company.email"
+  | "settings.company.phone"
+  | "settings.company.address"
+  | "settings.company.city"
+  | "settings.company.country"
+  | "settings.company.zip"
+  | "settings.company.companyDetails"
+  | "settings.company.taxNumber"
+  | "settings.regional.title"
+  | "settings.regional.description"
+  | "settings.regional.currency"
+  | "settings.regional.dateFormat"
+  | "settings.regional.timeZone"
+  | "settings.regional.fiscalYearStart"
+  | "settings.invoice.title"
+  | "settings.invoice.description"
+  | "settings.invoice.invoiceNumbering"
+  | "settings.invoice.prefix"
+  | "settings.invoice.prefixHelp"
+  | "settings.invoice.nextNumber"
+  | "settings.invoice.nextNumberHelp"
+  | "settings.invoice.quotationNumbering"
+  | "settings.invoice.quotePrefix"
+  | "settings.invoice.quotePrefixHelp"
+  | "settings.invoice.nextQuoteNumber"
+  | "settings.invoice.nextQuoteNumberHelp"
+  | "settings.invoice.quoteValidityDays"
+  | "settings.invoice.quoteValidityHelp"
+  | "settings.invoice.days"
+  | "settings.invoice.paymentSettings"
+  | "settings.invoice.paymentTerms"
+  | "settings.invoice.taxRate"
+  | "settings.notifications.title"
+  | "settings.notifications.description"
+  | "settings.notifications.email"
+  | "settings.notifications.emailDesc"
+  | "settings.notifications.sms"
+  | "settings.notifications.smsDesc"
+  | "settings.notifications.invoiceReminders"
+  | "settings.notifications.invoiceRemindersDesc"
+  | "settings.notifications.paymentAlerts"
+  | "settings.notifications.paymentAlertsDesc"
+  | "settings.notifications.lowStockAlerts"
+  | "settings.notifications.lowStockAlertsDesc"
+  | "settings.security.title"
+  | "settings.security.description"
+  | "settings.security.2fa"
+  | "settings.security.2faDesc"
+  | "settings.security.ipRestriction"
+  | "settings.security.ipRestrictionDesc"
+  | "settings.security.sessionTimeout"
+  | "settings.security.passwordExpiry"
+  | "settings.defaultAccounts"
+  | "settings.defaultAccountsDescription"
+  | "settings.defaultAccountsSaved"
+  | "settings.salesRevenue"
+  | "settings.salesRevenueDesc"
+  | "settings.defaultSalesAccount"
+  | "settings.salesAccountHint"
+  | "settings.defaultReceivableAccount"
+  | "settings.receivableAccountHint"
+  | "settings.purchasesExpenses"
+  | "settings.purchasesExpensesDesc"
+  | "settings.defaultPurchaseAccount"
+  | "settings.purchaseAccountHint"
+  | "settings.defaultPayableAccount"
+  | "settings.payableAccountHint"
+  | "settings.defaultExpenseAccount"
+  | "settings.expenseAccountHint"
+  | "settings.inventory"
+  | "settings.inventoryDesc"
+  | "settings.defaultInventoryAccount"
+  | "settings.inventoryAccountHint"
+  | "settings.banking"
+  | "settings.bankingDesc"
+  | "settings.defaultBankAccount"
+  | "settings.bankAccountHint"
+  | "settings.defaultCashAccount"
+  | "settings.cashAccountHint"
+  | "settings.users.title"
+  | "settings.users.description"
+  | "settings.users.addUser"
+  | "settings.users.editUser"
+  | "settings.users.role"
+  | "settings.users.permissions"
+  | "settings.users.lastLogin"
+  | "settings.users.totalUsers"
+  | "settings.users.activeUsers"
+  | "settings.users.roles.admin"
+  | "settings.users.roles.accountant"
+  | "settings.users.roles.manager"
+  | "settings.users.roles.user"
+  | "settings.users.roles.viewer"
+  | "settings.users.userCreated"
+  | "settings.users.userCreatedSuccess"
+  | "settings.users.userUpdated"
+  | "settings.users.userUpdatedSuccess"
+  | "settings.users.userDeleted"
+  | "settings.users.userDeletedSuccess"
+  | "settings.users.createError"
+  | "settings.users.updateError"
+  | "settings.users.deleteError"
+  | "settings.users.fillRequiredFields"
+  | "settings.users.confirmDeleteUser"
+  | "settings.users.passwordReset"
+  | "settings.users.passwordResetSent"
+  | "settings.users.statusUpdated"
+  | "settings.users.statusChangedTo"
+  | "settings.users.usersAndRoles"
+  | "settings.users.manageUserAccounts"
+  | "settings.users.allRegisteredUsers"
+  | "settings.users.currentlyActive"
+  | "settings.users.definedRoles"
+  | "settings.users.lastActive"
+  | "settings.users.mostRecentLogin"
+  | "settings.language.title"
+  | "settings.language.description"
+  | "settings.language.selectLanguage"
+  | "settings.language.currentLanguage"
+  | "settings.language.addLanguage"
+  | "settings.language.languageConfig"
+  | "settings.language.defaultLanguage"
+  | "settings.language.defaultLanguageDesc"
+  | "settings.language.fallbackLanguage"
+  | "settings.language.fallbackLanguageDesc"
+  | "settings.language.autoDetect"
+  | "settings.language.autoDetectDesc"
+  | "settings.language.dateFormatByLanguage"
+  | "settings.language.dateFormatByLanguageDesc"
+  | "settings.language.currencyByLanguage"
+  | "settings.language.currencyByLanguageDesc"
+  | "settings.language.saveConfig"
+  | "settings.language.languageStatusUpdated"
+  | "settings.language.defaultLanguageUpdated"
+  | "settings.language.translationsExported"
+  | "settings.language.translationsImported"
+  | "settings.language.openingAddDialog"
+  | "settings.language.settingsUpdated"
+  | "settings.language.saveError"
+  | "settings.ai.title"
+  | "settings.ai.description"
+  | "settings.ai.configuredProviders"
+  | "settings.ai.configuredProvidersDesc"
+  | "settings.ai.addProvider"
+  | "settings.ai.editProvider"
+  | "settings.ai.formHelp"
+  | "settings.ai.keyHint"
+  | "settings.ai.defaultModel"
+  | "settings.ai.defaultModelHint"
+  | "settings.ai.loadModels"
+  | "settings.ai.chooseDefaultModel"
+  | "settings.ai.embeddingsModel"
+  | "settings.ai.embeddingsModelHint"
+  | "settings.ai.chooseEmbeddingsModel"
+  | "settings.ai.visionModel"
+  | "settings.ai.visionModelHint"
+  | "settings.ai.chooseVisionModel"
+  | "settings.ai.failedToLoadModels"
+  | "settings.ai.failedToSaveProvider"
+  | "settings.ai.providerDeleted"
+  | "settings.ai.failedToDelete"
+  | "settings.ai.selectProvider"
+  | "settings.ai.enterLabel"
+  | "settings.ai.enterBaseUrl"
+  | "settings.ai.enterApiKey"
+  | "settings.ai.enterOrgId"
+  | "settings.ai.selectModel"
+  | "settings.ai.ollamaHint"
+  | "settings.ai.lmstudioHint"
+  | "settings.ai.localHint"
+  | "settings.ai.customHint"
+  | "settings.ai.localProvidersNote"
+  | "settings.currencies.title"
+  | "settings.currencies.description"
+  | "settings.currencies.activeCurrencies"
+  | "settings.currencies.activeCurrenciesDesc"
+  | "settings.currencies.exchangeRates"
+  | "settings.currencies.exchangeRatesDesc"
+  | "settings.currencies.addRate"
+  | "settings.currencies.addExchangeRate"
+  | "settings.currencies.addRateDesc"
+  | "settings.currencies.code"
+  | "settings.currencies.name"
+  | "settings.currencies.symbol"
+  | "settings.currencies.rate"
+  | "settings.currencies.fetchLiveRate"
+  | "settings.currencies.rateAddedSuccess"
+  | "settings.currencies.rateAddError"
+  | "settings.currencies.liveRateSuccess"
+  | "settings.currencies.liveRateError"
+  | "settings.currencies.selectCurrencyFirst"
+  | "settings.currencies.rateLabel"
+  | "settings.currencies.USD"
+  | "settings.currencies.EUR"
+  | "settings.currencies.GBP"
+  | "settings.currencies.JPY"
+  | "settings.currencies.CHF"
+  | "settings.currencies.CAD"
+  | "settings.currencies.AUD"
+  | "settings.currencies.NZD"
+  | "settings.currencies.AED"
+  | "settings.currencies.SAR"
+  | "settings.currencies.EGP"
+  | "settings.currencies.SYP"
+  | "settings.currencies.LBP"
+  | "settings.currencies.IQD"
+  | "settings.currencies.JOD"
+  | "settings.currencies.KWD"
+  | "settings.currencies.QAR"
+  | "settings.currencies.BHD"
+  | "settings.currencies.OMR"
+  | "settings.currencies.YER"
+  | "settings.currencies.MAD"
+  | "settings.currencies.DZD"
+  | "settings.currencies.TND"
+  | "settings.currencies.LYD"
+  | "settings.currencies.SDG"
+  | "settings.currencies.ILS"
+  | "settings.currencies.IRR"
+  | "settings.currencies.TRY"
+  | "settings.currencies.PHP"
+  | "settings.currencies.CNY"
+  | "settings.currencies.KRW"
+  | "settings.currencies.INR"
+  | "settings.currencies.IDR"
+  | "settings.currencies.THB"
+  | "settings.currencies.MYR"
+  | "settings.currencies.SGD"
+  | "settings.currencies.VND"
+  | "settings.currencies.BDT"
+  | "settings.currencies.PKR"
+  | "settings.currencies.LKR"
+  | "settings.currencies.MMK"
+  | "settings.currencies.KHR"
+  | "settings.currencies.LAK"
+  | "settings.currencies.NPR"
+  | "settings.currencies.BTN"
+  | "settings.currencies.MNT"
+  | "settings.currencies.KZT"
+  | "settings.currencies.UZS"
+  | "settings.currencies.TJS"
+  | "settings.currencies.KGS"
+  | "settings.currencies.TMT"
+  | "settings.currencies.AFN"
+  | "settings.currencies.NOK"
+  | "settings.currencies.SEK"
+  | "settings.currencies.DKK"
+  | "settings.currencies.ISK"
+  | "settings.currencies.PLN"
+  | "settings.currencies.CZK"
+  | "settings.currencies.HUF"
+  | "settings.currencies.RON"
+  | "settings.currencies.BGN"
+  | "settings.currencies.HRK"
+  | "settings.currencies.RSD"
+  | "settings.currencies.BAM"
+  | "settings.currencies.MKD"
+  | "settings.currencies.ALL"
+  | "settings.currencies.MDL"
+  | "settings.currencies.UAH"
+  | "settings.currencies.BYN"
+  | "settings.currencies.RUB"
+  | "settings.currencies.ZAR"
+  | "settings.currencies.NGN"
+  | "settings.currencies.GHS"
+  | "settings.currencies.KES"
+  | "settings.currencies.UGX"
+  | "settings.currencies.TZS"
+  | "settings.currencies.ETB"
+  | "settings.currencies.RWF"
+  | "settings.currencies.XOF"
+  | "settings.currencies.XAF"
+  | "settings.currencies.MZN"
+  | "settings.currencies.BWP"
+  | "settings.currencies.NAD"
+  | "settings.currencies.SZL"
+  | "settings.currencies.LSL"
+  | "settings.currencies.MXN"
+  | "settings.currencies.BRL"
+  | "settings.currencies.ARS"
+  | "settings.currencies.CLP"
+  | "settings.currencies.COP"
+  | "settings.currencies.PEN"
+  | "settings.currencies.UYU"
+  | "settings.currencies.PYG"
+  | "settings.currencies.BOB"
+  | "settings.currencies.VED"
+  | "settings.currencies.GYD"
+  | "settings.currencies.SRD"
+  | "settings.legal.title"
+  | "settings.legal.subtitle"
+  | "settings.legal.consentStatus"
+  | "settings.legal.currentLegalVersion"
+  | "settings.legal.status"
+  | "settings.legal.accepted"
+  | "settings.legal.notAccepted"
+  | "settings.legal.acceptedAt"
+  | "settings.legal.acceptedVersion"
+  | "settings.legal.acceptNow"
+  | "settings.legal.downloadAck"
+  | "settings.legal.viewTerms"
+  | "settings.legal.viewPrivacy"
+  | "settings.legal.viewDisclaimer"
+  | "settings.legal.summary"
+  | "settings.legal.syncFromGoogle"
+  | "settings.legal.syncSuccess"
+  | "settings.legal.syncError"
+  | "settings.legal.pleaseSignIn"
+  | "settings.legal.userDataNotAvailable"
+  | "settings.legal.popupBlocked"
+  | "settings.consentDialog.byAccepting"
+  | "settings.consentDialog.toolNotAdvice"
+  | "settings.consentDialog.responsibleForData"
+  | "settings.consentDialog.consultAccountant"
+  | "settings.consentDialog.limitedLiability"
+  | "settings.consentDialog.agreeToPrivacy"
+  | "settings.companyInformation"
+  | "settings.companyLogo"
+  | "settings.logoUploaded"
+  | "settings.companyName"
+  | "settings.taxIdVatNumber"
+  | "settings.logoUploadedDesc"
+  | "users.title"
+  | "users.addUser"
+  | "users.editUser"
+  | "users.userName"
+  | "users.fullName"
+  | "users.role"
+  | "users.permissions"
+  | "users.lastLogin"
+  | "users.createdDate"
+  | "users.owner"
+  | "users.accountant"
+  | "users.salesPerson"
+  | "users.viewer"
+  | "users.enabled"
+  | "users.disabled"
+  | "users.usersAndRoles"
+  | "users.manageUserAccounts"
+  | "users.totalUsers"
+  | "users.allRegisteredUsers"
+  | "users.activeUsers"
+  | "users.currentlyActive"
+  | "users.roles"
+  | "users.definedRoles"
+  | "users.pendingInvites"
+  | "users.awaitingAcceptance"
+  | "users.searchUsers"
+  | "users.filterByRole"
+  | "users.filterByStatus"
+  | "users.allRoles"
+  | "users.allStatuses"
+  | "users.name"
+  | "users.email"
+  | "users.lastActive"
+  | "users.actions"
+  | "users.viewDetails"
+  | "users.editPermissions"
+  | "users.resetPassword"
+  | "users.toggleStatus"
+  | "users.deleteUser"
+  | "users.confirmDeleteUser"
+  | "users.userDeleted"
+  | "users.userDeletedDesc"
+  | "users.passwordReset"
+  | "users.passwordResetDesc"
+  | "users.statusChanged"
+  | "users.userStatusChanged"
+  | "users.permissionsSaved"
+  | "users.permissionsSavedDesc"
+  | "users.rolesManagement"
+  | "users.defineAndManageRoles"
+  | "users.roleName"
+  | "users.description"
+  | "users.userCount"
+  | "users.userPermissions"
+  | "users.selectPermissions"
+  | "users.dashboard"
+  | "users.sales"
+  | "users.purchases"
+  | "users.banking"
+  | "users.reports"
+  | "users.settings"
+  | "users.customers"
+  | "users.vendors"
+  | "users.salesReports"
+  | "users.purchaseReports"
+  | "users.joined"
+  | "users.deactivate"
+  | "users.activate"
+  | "users.userRoles"
+  | "users.defineRolesPermissions"
+  | "users.more"
+  | "users.configure"
+  | "users.permissionsMatrix"
+  | "users.configureModuleAccess"
+  | "users.module"
+  | "users.admin"
+  | "users.savePermissions"
+  | "users.addNewUser"
+  | "users.createUserAndAssignRole"
+  | "users.enterFullName"
+  | "users.enterEmail"
+  | "users.enterPhone"
+  | "users.selectRole"
+  | "users.enterDepartment"
+  | "users.userCreated"
+  | "users.userCreatedSuccess"
+  | "users.manageUsers"
+  | "users.inviteUser"
+  | "users.enterPassword"
+  | "users.updateUserInformation"
+  | "users.leaveEmptyToKeepCurrent"
+  | "users.enterNewPassword"
+  | "users.saveChanges"
+  | "users.mostRecentLogin"
+  | "users.passwordResetSent"
+  | "users.statusUpdated"
+  | "users.statusChangedTo"
+  | "users.fillRequiredFields"
+  | "users.permissionsUpdated"
+  | "users.permissionsUpdatedDesc"
+  | "users.permissionsUpdateError"
+  | "users.managePermissions"
+  | "users.customizeUserPermissions"
+  | "users.canView"
+  | "users.canCreate"
+  | "users.canEdit"
+  | "users.canDelete"
+  | "auth.login"
+  | "auth.register"
+  | "auth.existingAccount"
+  | "auth.createAccount"
+  | "auth.createAccountPrompt"
+  | "auth.firstUserNote"
+  | "auth.firstUserNoteDesc"
+  | "auth.email"
+  | "auth.emailPlaceholder"
+  | "auth.password"
+  | "auth.passwordPlaceholder"
+  | "auth.username"
+  | "auth.usernamePlaceholder"
+  | "auth.fullName"
+  | "auth.fullNamePlaceholder"
+  | "auth.companyInformation"
+  | "auth.companyName"
+  | "auth.companyNamePlaceholder"
+  | "auth.currency"
+  | "auth.selectCurrency"
+  | "auth.fiscalYear"
+  | "auth.selectMonth"
+  | "auth.userInformation"
+  | "auth.months.january"
+  | "auth.months.february"
+  | "auth.months.march"
+  | "auth.months.april"
+  | "auth.months.may"
+  | "auth.months.june"
+  | "auth.months.july"
+  | "auth.months.august"
+  | "auth.months.september"
+  | "auth.months.october"
+  | "auth.months.november"
+  | "auth.months.december"
+  | "auth.currencies.USD"
+  | "auth.currencies.EUR"
+  | "auth.currencies.GBP"
+  | "auth.currencies.JPY"
+  | "auth.currencies.CNY"
+  | "auth.currencies.SAR"
+  | "auth.currencies.AED"
+  | "auth.currencies.KWD"
+  | "auth.currencies.QAR"
+  | "auth.currencies.BHD"
+  | "auth.currencies.OMR"
+  | "auth.currencies.JOD"
+  | "auth.currencies.LBP"
+  | "auth.currencies.EGP"
+  | "auth.currencies.IQD"
+  | "auth.currencies.SYP"
+  | "auth.currencies.YER"
+  | "auth.currencies.LYD"
+  | "auth.currencies.TND"
+  | "auth.currencies.DZD"
+  | "auth.currencies.MAD"
+  | "auth.currencies.MRU"
+  | "auth.currencies.SDG"
+  | "auth.currencies.SOS"
+  | "auth.currencies.DJF"
+  | "auth.currencies.KMF"
+  | "auth.currencies.INR"
+  | "auth.currencies.PKR"
+  | "auth.currencies.BDT"
+  | "auth.currencies.IDR"
+  | "auth.currencies.MYR"
+  | "auth.currencies.PHP"
+  | "auth.currencies.SGD"
+  | "auth.currencies.THB"
+  | "auth.currencies.VND"
+  | "auth.currencies.KRW"
+  | "auth.currencies.NGN"
+  | "auth.currencies.ZAR"
+  | "auth.currencies.KES"
+  | "auth.currencies.GHS"
+  | "auth.currencies.TZS"
+  | "auth.currencies.UGX"
+  | "auth.currencies.ETB"
+  | "auth.currencies.CAD"
+  | "auth.currencies.MXN"
+  | "auth.currencies.BRL"
+  | "auth.currencies.ARS"
+  | "auth.currencies.CLP"
+  | "auth.currencies.COP"
+  | "auth.currencies.CHF"
+  | "auth.currencies.SEK"
+  | "auth.currencies.NOK"
+  | "auth.currencies.DKK"
+  | "auth.currencies.PLN"
+  | "auth.currencies.TRY"
+  | "auth.currencies.RUB"
+  | "auth.currencies.UAH"
+  | "auth.currencies.AUD"
+  | "auth.currencies.NZD"
+  | "auth.validationErrors.emailInvalid"
+  | "auth.validationErrors.passwordMinLength"
+  | "auth.validationErrors.companyNameMinLength"
+  | "auth.validationErrors.selectCurrency"
+  | "auth.validationErrors.usernameMinLength"
+  | "auth.validationErrors.fullNameMinLength"
+  | "auth.loginSuccess"
+  | "auth.signInToContinue"
+  | "auth.createNewCompany"
+  | "auth.loginError"
+  | "auth.invalidCredentials"
+  | "auth.googleLoginError"
+  | "auth.orContinueWith"
+  | "auth.signInWithGoogle"
+  | "auth.creatingAccount"
+  | "pages.companies.title"
+  | "pages.companies.description"
+  | "pages.companies.addCompany"
+  | "pages.companies.editCompany"
+  | "pages.companies.createCompany"
+  | "pages.companies.currentActive"
+  | "pages.companies.noCompanies"
+  | "pages.companies.createFirstCompany"
+  | "pages.companies.confirmDelete"
+  | "pages.companies.currentCompany"
+  | "pages.companies.createWithDemoData"
+  | "pages.companies.demoDataDescription"
+  | "pages.titles.Contacts"
+  | "pages.titles.Items"
+  | "pages.titles.Accounts"
+  | "pages.titles.Invoices"
+  | "pages.titles.Payments"
+  | "pages.titles.Receipts"
+  | "pages.titles.Bills"
+  | "pages.titles.Expenses"
+  | "pages.titles.Purchase Orders"
+  | "pages.titles.Sales Orders"
+  | "pages.titles.Quotations"
+  | "pages.titles.Debit Notes"
+  | "pages.titles.Credit Notes"
+  | "pages.titles.Inventory"
+  | "pages.titles.Tax Report"
+  | "pages.titles.Trial Balance"
+  | "pages.titles.Profit & Loss"
+  | "pages.titles.Balance Sheet"
+  | "pages.titles.Cash Flow"
+  | "pages.titles.Bank Reconciliation"
+  | "pages.titles.Bank Accounts"
+  | "pages.titles.Users"
+  | "pages.titles.General Settings"
+  | "pages.descriptions.Manage your customers and suppliers"
+  | "pages.descriptions.Manage your products and services"
+  | "pages.descriptions.Chart of accounts"
+  | "pages.descriptions.Manage invoices"
+  | "pages.descriptions.Manage payments"
+  | "pages.descriptions.Manage outgoing payments to vendors"
+  | "pages.descriptions.Manage receipts"
+  | "pages.descriptions.Manage bills"
+  | "pages.descriptions.Track and manage expenses"
+  | "forms.companyName"
+  | "forms.companyNamePlaceholder"
+  | "forms.legalName"
+  | "forms.legalNamePlaceholder"
+  | "forms.taxNumber"
+  | "forms.registrationNumber"
+  | "forms.baseCurrency"
+  | "forms.selectCurrency"
+  | "forms.fiscalYearStart"
+  | "forms.selectMonth"
+  | "forms.cancel"
+  | "forms.update"
+  | "forms.create"
+  | "forms.company"
+  | "forms.currency"
+  | "forms.fiscalYear"
+  | "forms.active"
+  | "forms.edit"
+  | "forms.delete"
+  | "forms.validationError"
+  | "forms.taxNumberPlaceholder"
+  | "forms.registrationNumberPlaceholder"
+  | "forms.selectFiscalYear"
+  | "forms.dateFormat"
+  | "forms.selectDateFormat"
+  | "forms.numberFormat"
+  | "forms.selectNumberFormat"
+  | "forms.invoiceNumber"
+  | "forms.invoiceDate"
+  | "forms.dueDate"
+  | "forms.customer"
+  | "forms.selectCustomer"
+  | "forms.description"
+  | "forms.quantity"
+  | "forms.rate"
+  | "forms.tax"
+  | "forms.amount"
+  | "forms.subtotal"
+  | "forms.total"
+  | "forms.notesAndTerms"
+  | "forms.notesPlaceholder"
+  | "forms.noTax"
+  | "forms.editTaxRate"
+  | "forms.addNewTaxRate"
+  | "forms.taxName"
+  | "forms.taxCode"
+  | "forms.taxRate"
+  | "forms.taxType"
+  | "forms.lineItems"
+  | "forms.noItems"
+  | "forms.createInvoice"
+  | "forms.createInvoiceDesc"
+  | "forms.createInvoiceDescMobile"
+  | "forms.saveDraft"
+  | "forms.saveAndSend"
+  | "forms.sendInvoice"
+  | "forms.invoiceDetails"
+  | "forms.customerDetails"
+  | "forms.addItem"
+  | "forms.itemLabel"
+  | "forms.itemDescriptionPlaceholder"
+  | "forms.project"
+  | "forms.selectProject"
+  | "forms.none"
+  | "forms.revenueAccount"
+  | "forms.expenseAccount"
+  | "forms.defaultAccount"
+  | "forms.exchangeRate"
+  | "forms.scannedItem"
+  | "forms.poNumber"
+  | "forms.paymentTerms"
+  | "forms.dueOnReceipt"
+  | "forms.netDays"
+  | "forms.custom"
+  | "forms.autoGenerated"
+  | "forms.optional"
+  | "forms.selectDate"
+  | "forms.customerDetailsDesc"
+  | "forms.lineItemsDesc"
+  | "forms.selectProduct"
+  | "forms.orTypeManually"
+  | "forms.manualEntry"
+  | "forms.discount"
+  | "forms.netAmount"
+  | "forms.equivalentIn"
+  | "forms.duplicate"
+  | "forms.atLeastOneItem"
+  | "forms.customerRequired"
+  | "forms.invoiceDateRequired"
+  | "forms.dueDateRequired"
+  | "forms.itemsIncomplete"
+  | "forms.pleaseFixErrors"
+  | "forms.noCustomersFound"
+  | "forms.salesOrder"
+  | "forms.unknownCustomer"
+  | "forms.item"
+  | "forms.parentCompany"
+  | "forms.selectParentCompany"
+  | "forms.noParentCompany"
+  | "months.january"
+  | "months.february"
+  | "months.march"
+  | "months.april"
+  | "months.may"
+  | "months.june"
+  | "months.july"
+  | "months.august"
+  | "months.september"
+  | "months.october"
+  | "months.november"
+  | "months.december"
+  | "validationErrors.companyNameMin"
+  | "validationErrors.currencyRequired"
+  | "validationErrors.emailInvalid"
+  | "validationErrors.passwordMinLength"
+  | "validationErrors.companyNameMinLength"
+  | "validationErrors.selectCurrency"
+  | "validationErrors.usernameMinLength"
+  | "validationErrors.fullNameMinLength"
+  | "validationErrors.invoiceRequired"
+  | "validationErrors.customerRequired"
+  | "validationErrors.reasonMinLength"
+  | "validationErrors.validUntilRequired"
+  | "paymentMethods.Bank Transfer"
+  | "paymentMethods.Credit Card"
+  | "paymentMethods.Check"
+  | "paymentMethods.Online Payment"
+  | "paymentMethods.Cash"
+  | "currencies.USD"
+  | "currencies.EUR"
+  | "currencies.GBP"
+  | "currencies.JPY"
+  | "currencies.CHF"
+  | "currencies.CAD"
+  | "currencies.AUD"
+  | "currencies.NZD"
+  | "currencies.AED"
+  | "currencies.SAR"
+  | "currencies.EGP"
+  | "currencies.SYP"
+  | "currencies.LBP"
+  | "currencies.IQD"
+  | "currencies.JOD"
+  | "currencies.KWD"
+  | "currencies.QAR"
+  | "currencies.BHD"
+  | "currencies.OMR"
+  | "currencies.YER"
+  | "currencies.MAD"
+  | "currencies.DZD"
+  | "currencies.TND"
+  | "currencies.LYD"
+  | "currencies.SDG"
+  | "currencies.ILS"
+  | "currencies.IRR"
+  | "currencies.TRY"
+  | "currencies.PHP"
+  | "currencies.CNY"
+  | "currencies.KRW"
+  | "currencies.INR"
+  | "currencies.IDR"
+  | "currencies.THB"
+  | "currencies.MYR"
+  | "currencies.SGD"
+  | "currencies.VND"
+  | "currencies.BDT"
+  | "currencies.PKR"
+  | "currencies.LKR"
+  | "currencies.MMK"
+  | "currencies.KHR"
+  | "currencies.LAK"
+  | "currencies.NPR"
+  | "currencies.BTN"
+  | "currencies.MNT"
+  | "currencies.KZT"
+  | "currencies.UZS"
+  | "currencies.TJS"
+  | "currencies.KGS"
+  | "currencies.TMT"
+  | "currencies.AFN"
+  | "currencies.NOK"
+  | "currencies.SEK"
+  | "currencies.DKK"
+  | "currencies.ISK"
+  | "currencies.PLN"
+  | "currencies.CZK"
+  | "currencies.HUF"
+  | "currencies.RON"
+  | "currencies.BGN"
+  | "currencies.HRK"
+  | "currencies.RSD"
+  | "currencies.BAM"
+  | "currencies.MKD"
+  | "currencies.ALL"
+  | "currencies.MDL"
+  | "currencies.UAH"
+  | "currencies.BYN"
+  | "currencies.RUB"
+  | "currencies.ZAR"
+  | "currencies.NGN"
+  | "currencies.GHS"
+  | "currencies.KES"
+  | "currencies.UGX"
+  | "currencies.TZS"
+  | "currencies.ETB"
+  | "currencies.RWF"
+  | "currencies.XOF"
+  | "currencies.XAF"
+  | "currencies.MZN"
+  | "currencies.BWP"
+  | "currencies.NAD"
+  | "currencies.SZL"
+  | "currencies.LSL"
+  | "currencies.MXN"
+  | "currencies.BRL"
+  | "currencies.ARS"
+  | "currencies.CLP"
+  | "currencies.COP"
+  | "currencies.PEN"
+  | "currencies.UYU"
+  | "currencies.PYG"
+  | "currencies.BOB"
+  | "currencies.VED"
+  | "currencies.GYD"
+  | "currencies.SRD"
+  | "formats.dateFormat"
+  | "formats.numberFormat"
+  | "formats.selectDateFormat"
+  | "formats.selectNumberFormat"
+  | "formats.us"
+  | "formats.eu"
+  | "formats.fr"
+  | "formats.february"
+  | "formats.date.label"
+  | "formats.date.DD/MM/YYYY"
+  | "formats.date.MM/DD/YYYY"
+  | "formats.date.YYYY/MM/DD"
+  | "formats.date.DD-MM-YYYY"
+  | "formats.date.MM-DD-YYYY"
+  | "formats.date.YYYY-MM-DD"
+  | "formats.number.label"
+  | "formats.number.comma_dot"
+  | "formats.number.dot_comma"
+  | "formats.number.space_comma"
+  | "formats.number.arabic"
+  | "messages.companyCreated"
+  | "messages.companyCreatedDesc"
+  | "messages.companyUpdated"
+  | "messages.companyUpdatedDesc"
+  | "messages.companyDeleted"
+  | "messages.companyDeletedDesc"
+  | "messages.createCompanyError"
+  | "messages.updateCompanyError"
+  | "messages.deleteCompanyError"
+  | "messages.noAccountsFound"
+  | "messages.startByAddingAccount"
+  | "messages.loadingAccounts"
+  | "messages.noItemsFound"
+  | "messages.startByAddingItem"
+  | "messages.loadingItems"
+  | "messages.noContactsFound"
+  | "messages.startByAddingContact"
+  | "messages.saveSuccess"
+  | "messages.updateSuccess"
+  | "messages.deleteSuccess"
+  | "messages.saveError"
+  | "messages.updateError"
+  | "messages.deleteError"
+  | "messages.networkError"
+  | "messages.serverError"
+  | "messages.accessDenied"
+  | "messages.sessionExpired"
+  | "messages.dataNotFound"
+  | "messages.validationError"
+  | "invoice.createInvoice"
+  | "invoice.createInvoiceDesc"
+  | "invoice.createInvoiceDescMobile"
+  | "invoice.saveDraft"
+  | "invoice.sendInvoice"
+  | "invoice.invoiceDetails"
+  | "invoice.invoiceNumber"
+  | "invoice.invoiceDate"
+  | "invoice.dueDate"
+  | "invoice.customerDetails"
+  | "invoice.customer"
+  | "invoice.selectCustomer"
+  | "invoice.lineItems"
+  | "invoice.addItem"
+  | "invoice.description"
+  | "invoice.qty"
+  | "invoice.rate"
+  | "invoice.tax"
+  | "invoice.amount"
+  | "invoice.itemDescription"
+  | "invoice.subtotal"
+  | "invoice.totalTax"
+  | "invoice.total"
+  | "invoice.notesAndTerms"
+  | "invoice.notesPlaceholder"
+  | "invoice.invoiceSavedDraft"
+  | "invoice.invoiceSent"
+  | "tax.taxConfiguration"
+  | "tax.taxConfigDesc"
+  | "tax.addTaxRate"
+  | "tax.taxRates"
+  | "tax.name"
+  | "tax.code"
+  | "tax.type"
+  | "tax.rate"
+  | "tax.calculation"
+  | "tax.jurisdiction"
+  | "tax.status"
+  | "tax.effectiveFrom"
+  | "tax.global"
+  | "tax.inclusive"
+  | "tax.exclusive"
+  | "tax.editTaxRate"
+  | "tax.addNewTaxRate"
+  | "tax.taxName"
+  | "tax.taxNamePlaceholder"
+  | "tax.taxCode"
+  | "tax.taxCodePlaceholder"
+  | "tax.taxType"
+  | "tax.taxRate"
+  | "tax.taxInclusive"
+  | "tax.taxInclusiveDesc"
+  | "tax.presets"
+  | "tax.threshold"
+  | "tax.noTaxRates"
+  | "tax.amt"
+  | "tax.per"
+  | "tax.for"
+  | "tax.thresholdAmount"
+  | "tax.thresholdPeriod"
+  | "tax.selectPeriod"
+  | "tax.annual"
+  | "tax.monthly"
+  | "tax.rolling12"
+  | "tax.thresholdAppliesTo"
+  | "tax.selectBasis"
+  | "tax.turnover"
+  | "tax.incomeProfit"
+  | "tax.other"
+  | "tax.jurisdictionOptional"
+  | "tax.glAccount"
+  | "tax.quickAddPresets"
+  | "tax.presetTypes"
+  | "tax.createPresets"
+  | "tax.appliesTo"
+  | "tax.availableTaxes"
+  | "tax.presetsHint"
+  | "tax.addAllTaxes"
+  | "backup.title"
+  | "backup.description"
+  | "backup.createBackup"
+  | "backup.createDescription"
+  | "backup.downloadBackup"
+  | "backup.autoBackup"
+  | "backup.autoBackupDescription"
+  | "backup.enableAutoBackup"
+  | "backup.autoBackupWillSave"
+  | "backup.autoBackupEnabled"
+  | "backup.autoBackupDisabled"
+  | "backup.autoBackupWillStart"
+  | "backup.autoBackupWillStop"
+  | "backup.frequency"
+  | "backup.daily"
+  | "backup.weekly"
+  | "backup.monthly"
+  | "backup.maxBackupsToKeep"
+  | "backup.backups"
+  | "backup.oldBackupsWillBeMarked"
+  | "backup.status"
+  | "backup.active"
+  | "backup.lastBackup"
+  | "backup.never"
+  | "backup.nextBackup"
+  | "backup.backupNow"
+  | "backup.restoreBackup"
+  | "backup.restoreDescription"
+  | "backup.selectedFile"
+  | "backup.restore"
+  | "backup.merge"
+  | "backup.restoreWarning"
+  | "backup.mergeWarning"
+  | "backup.infoTitle"
+  | "backup.infoDescription"
+  | "backup.infoCompanies"
+  | "backup.infoAccounts"
+  | "backup.infoContacts"
+  | "backup.infoItems"
+  | "backup.infoTaxes"
+  | "backup.infoJournals"
+  | "backup.infoInvoices"
+  | "backup.infoBills"
+  | "backup.infoPayments"
+  | "backup.infoBanking"
+  | "backup.infoInventory"
+  | "backup.infoAssets"
+  | "backup.infoProjects"
+  | "backup.infoBudgets"
+  | "backup.infoEmployees"
+  | "backup.infoSettings"
+  | "backup.infoComplete"
+  | "backup.infoTimestamp"
+  | "backup.noCompanyWarning"
+  | "backup.createCompanyNow"
+  | "backup.success"
+  | "backup.downloadComplete"
+  | "backup.error"
+  | "backup.failed"
+  | "backup.mergeSuccess"
+  | "backup.restoreSuccess"
+  | "backup.dataMerged"
+  | "backup.dataRestored"
+  | "backup.newAccounts"
+  | "backup.newContacts"
+  | "backup.newItems"
+  | "backup.accounts"
+  | "backup.contacts"
+  | "backup.items"
+  | "backup.invalidFile"
+  | "backup.continueQuestion"
+  | "backup.autoBackupCompleted"
+  | "backup.autoBackupSuccess"
+  | "backup.autoBackupNever"
+  | "validation.required"
+  | "validation.minLength"
+  | "validation.maxLength"
+  | "validation.min"
+  | "validation.max"
+  | "validation.pattern"
+  | "validation.email"
+  | "validation.phone"
+  | "validation.url"
+  | "validation.iban"
+  | "validation.taxNumber"
+  | "validation.decimal"
+  | "validation.integer"
+  | "validation.date"
+  | "validation.future"
+  | "validation.past"
+  | "validation.unique"
+  | "validation.invalid"
+  | "validation.errorsFound"
+  | "validation.warnings"
+  | "validation.errorsCount"
+  | "validation.allValid"
+  | "validation.progress"
+  | "validation.accountRequired"
+  | "validation.itemCodeRequired"
+  | "validation.itemNameMin2"
+  | "placeholders.Select type"
+  | "placeholders.Select currency"
+  | "placeholders.searchExpenses"
+  | "placeholders.selectSupplier"
+  | "placeholders.selectVendor"
+  | "placeholders.selectBill"
+  | "placeholders.enterReason"
+  | "placeholders.additionalNotes"
+  | "placeholders.Select method"
+  | "placeholders.selectMethod"
+  | "accountTypes.currentAssets"
+  | "accountTypes.nonCurrentAssets"
+  | "accountTypes.currentLiabilities"
+  | "accountTypes.nonCurrentLiabilities"
+  | "accountTypes.equity"
+  | "profitLossPage.title"
+  | "profitLossPage.description"
+  | "profitLossPage.revenue"
+  | "profitLossPage.costOfSales"
+  | "profitLossPage.grossProfit"
+  | "profitLossPage.operatingExpenses"
+  | "profitLossPage.operatingIncome"
+  | "profitLossPage.netIncome"
+  | "profitLossPage.netProfit"
+  | "profitLossPage.netLoss"
+  | "profitLossPage.debit"
+  | "profitLossPage.credit"
+  | "profitLossPage.currentBalance"
+  | "profitLossPage.projectedBalance"
+  | "profitLossPage.netChange"
+  | "profitLossPage.lowestBalance"
+  | "profitLossPage.on"
+  | "profitLossPage.cashFlowProjection"
+  | "profitLossPage.cashFlowProjectionDesc"
+  | "profitLossPage.inflow"
+  | "profitLossPage.outflow"
+  | "profitLossPage.aiAnalysis"
+  | "profitLossPage.forecastDetails"
+  | "profitLossPage.current"
+  | "profitLossPage.days30"
+  | "profitLossPage.days60"
+  | "profitLossPage.days90"
+  | "profitLossPage.daysOver90"
+  | "profitLossPage.operatingRevenue"
+  | "profitLossPage.nonOperatingRevenue"
+  | "profitLossPage.taxes"
+  | "cashFlowPage.title"
+  | "cashFlowPage.description"
+  | "cashFlowPage.cashFlowAnalysisFor"
+  | "cashFlowPage.indirectMethod"
+  | "cashFlowPage.directMethod"
+  | "cashFlowPage.beginningCash"
+  | "cashFlowPage.startOfPeriod"
+  | "cashFlowPage.operatingCash"
+  | "cashFlowPage.investingCash"
+  | "cashFlowPage.financingCash"
+  | "cashFlowPage.netOperatingCash"
+  | "cashFlowPage.netInvestingCash"
+  | "cashFlowPage.netFinancingCash"
+  | "cashFlowPage.endingCash"
+  | "cashFlowPage.summary"
+  | "cashFlowPage.detailedView"
+  | "cashFlowPage.export"
+  | "cashFlowPage.print"
+  | "cashFlowPage.dateRange"
+  | "cashFlowPage.from"
+  | "cashFlowPage.to"
+  | "cashFlowPage.generate"
+  | "cashFlowPage.refresh"
+  | "cashFlowPage.noData"
+  | "cashFlowPage.chart.title"
+  | "cashFlowPage.chart.inflow"
+  | "cashFlowPage.chart.outflow"
+  | "cashFlowPage.chart.net"
+  | "cashFlowPage.table.date"
+  | "cashFlowPage.table.description"
+  | "cashFlowPage.table.reference"
+  | "cashFlowPage.table.inflow"
+  | "cashFlowPage.table.outflow"
+  | "cashFlowPage.table.netFlow"
+  | "cashFlowPage.table.cumulativeCashFlow"
+  | "cashFlowPage.table.netAmount"
+  | "cashFlowPage.table.beginningCashBalance"
+  | "cashFlowPage.table.cashFlowsFromOperatingActivities"
+  | "cashFlowPage.table.netCashFromOperatingActivities"
+  | "cashFlowPage.table.cashFlowsFromInvestingActivities"
+  | "cashFlowPage.table.netCashFromInvestingActivities"
+  | "cashFlowPage.table.cashFlowsFromFinancingActivities"
+  | "cashFlowPage.table.netCashFromFinancingActivities"
+  | "cashFlowPage.table.netChangeInCash"
+  | "cashFlowPage.table.endingCashBalance"
+  | "trialBalancePage.title"
+  | "trialBalancePage.description"
+  | "trialBalancePage.generateReport"
+  | "trialBalancePage.asOf"
+  | "trialBalancePage.from"
+  | "trialBalancePage.to"
+  | "trialBalancePage.totalDebits"
+  | "trialBalancePage.totalCredits"
+  | "trialBalancePage.debitCreditSummary"
+  | "trialBalancePage.account"
+  | "trialBalancePage.accounts"
+  | "trialBalancePage.balance"
+  | "trialBalancePage.balanced"
+  | "trialBalancePage.difference"
+  | "trialBalancePage.unbalanced"
+  | "trialBalancePage.currentPeriod"
+  | "trialBalancePage.previousPeriod"
+  | "trialBalancePage.yearEnd"
+  | "trialBalancePage.customDate"
+  | "trialBalancePage.allAccounts"
+  | "trialBalancePage.assetsOnly"
+  | "trialBalancePage.liabilitiesOnly"
+  | "trialBalancePage.equityOnly"
+  | "trialBalancePage.revenueOnly"
+  | "trialBalancePage.expensesOnly"
+  | "trialBalancePage.allDebitEntries"
+  | "trialBalancePage.allCreditEntries"
+  | "trialBalancePage.trialBalanceDetails"
+  | "trialBalancePage.noAccountData"
+  | "trialBalancePage.accountsList"
+  | "trialBalancePage.debit"
+  | "trialBalancePage.credit"
+  | "trialBalancePage.total"
+  | "trialBalancePage.subtotal"
+  | "trialBalancePage.date"
+  | "trialBalancePage.reference"
+  | "trialBalancePage.status"
+  | "trialBalancePage.actions"
+  | "trialBalancePage.viewDetails"
+  | "trialBalancePage.downloadPDF"
+  | "trialBalancePage.exportCSV"
+  | "trialBalancePage.exportExcel"
+  | "trialBalancePage.print"
+  | "trialBalancePage.refresh"
+  | "trialBalancePage.confirmDelete"
+  | "trialBalancePage.deleteSuccess"
+  | "trialBalancePage.deleteError"
+  | "trialBalancePage.noData"
+  | "trialBalancePage.loading"
+  | "trialBalancePage.errorLoading"
+  | "trialBalancePage.failedToLoad"
+  | "trialBalancePage.viewAccountDetails"
+  | "trialBalancePage.accountCode"
+  | "trialBalancePage.accountName"
+  | "time.justNow"
+  | "time.minutesAgo"
+  | "time.hoursAgo"
+  | "time.daysAgo"
+  | "time.minutes"
+  | "time.hours"
+  | "time.days"
+  | "time.years"
+  | "timezones.dubai"
+  | "timezones.riyadh"
+  | "timezones.qatar"
+  | "timezones.kuwait"
+  | "timezones.bahrain"
+  | "timezones.muscat"
+  | "timezones.cairo"
+  | "timezones.amman"
+  | "timezones.beirut"
+  | "timezones.baghdad"
+  | "timezones.eastern"
+  | "timezones.central"
+  | "timezones.mountain"
+  | "timezones.pacific"
+  | "timezones.london"
+  | "timezones.paris"
+  | "timezones.berlin"
+  | "timezones.moscow"
+  | "timezones.india"
+  | "timezones.pakistan"
+  | "timezones.china"
+  | "timezones.tokyo"
+  | "timezones.singapore"
+  | "timezones.sydney"
+  | "timezones.auckland"
+  | "budgets.title"
+  | "budgets.description"
+  | "budgets.budgetVsActual"
+  | "budgets.budgetVsActualDesc"
+  | "budgets.fiscalYear"
+  | "budgets.performanceReport"
+  | "budgets.detailedBreakdown"
+  | "budgets.account"
+  | "budgets.type"
+  | "budgets.budget"
+  | "budgets.actual"
+  | "budgets.variance"
+  | "budgets.progress"
+  | "budgets.status"
+  | "budgets.saveSuccess"
+  | "budgets.saveError"
+  | "budgets.enterAmount"
+  | "budgets.annualBudget"
+  | "budgets.budgetEntry"
+  | "budgets.budgetEntryDesc"
+  | "budgets.accountCode"
+  | "budgets.accountName"
+  | "budgets.totalRevenue"
+  | "budgets.totalExpenses"
+  | "budgets.netBudget"
+  | "budgets.netActual"
+  | "budgets.target"
+  | "budgets.plannedProfit"
+  | "budgets.underBudget"
+  | "budgets.overBudget"
+  | "budgets.aboveTarget"
+  | "budgets.belowTarget"
+  | "budgets.onTarget"
+  | "budgets.noBudgetData"
+  | "budgets.revenue"
+  | "budgets.expenses"
+  | "budgets.entryMode"
+  | "budgets.annualEntry"
+  | "budgets.monthlyEntry"
+  | "budgets.months.january"
+  | "budgets.months.february"
+  | "budgets.months.march"
+  | "budgets.months.april"
+  | "budgets.months.may"
+  | "budgets.months.june"
+  | "budgets.months.july"
+  | "budgets.months.august"
+  | "budgets.months.september"
+  | "budgets.months.october"
+  | "budgets.months.november"
+  | "budgets.months.december"
+  | "budgets.deleteConfirm"
+  | "budgets.deleteSuccess"
+  | "budgets.deleteError"
+  | "budgets.total"
+  | "budgets.variancePercentage"
+  | "budgets.expenseBudgets"
+  | "budgets.revenueBudgets"
+  | "budgets.expenseDesc"
+  | "budgets.revenueDesc"
+  | "budgets.noExpenseAccounts"
+  | "budgets.noRevenueAccounts"
+  | "budgets.deleteBudget"
+  | "budgets.annual"
+  | "budgets.monthly"
+  | "budgets.copyBudget"
+  | "budgets.copyBudgetDesc"
+  | "budgets.copyFromYear"
+  | "budgets.fromYear"
+  | "budgets.toYear"
+  | "budgets.adjustmentPercent"
+  | "budgets.adjustmentHint"
+  | "budgets.copySuccess"
+  | "budgets.copyError"
+  | "budgets.totalExpense"
+  | "ai.analytics.title"
+  | "ai.analytics.subtitle"
+  | "ai.analytics.totalExtractions"
+  | "ai.analytics.successRate"
+  | "ai.analytics.estimatedCost"
+  | "ai.analytics.failedExtractions"
+  | "ai.analytics.extractionVolume"
+  | "ai.analytics.providerPerformance"
+  | "ai.analytics.modelUsage"
+  | "ai.analytics.extractionModes"
+  | "ai.analytics.recentActivity"
+  | "ai.analytics.timestamp"
+  | "ai.analytics.provider"
+  | "ai.analytics.model"
+  | "ai.analytics.mode"
+  | "ai.analytics.status"
+  | "ai.analytics.cost"
+  | "ai.analytics.tokens"
+  | "ai.analytics.success"
+  | "ai.analytics.failed"
+  | "ai.analytics.unknownModel"
+  | "ai.analytics.tokensInOut"
+  | "ai.pasteInvoiceText"
+  | "ai.previewExtraction"
+  | "ai.completeness"
+  | "ai.vendorDetected"
+  | "ai.vendor"
+  | "ai.customerMatch"
+  | "ai.useCustomer"
+  | "ai.noData"
+  | "ai.copyJson"
+  | "ai.downloadJson"
+  | "ai.provideTextOrImage"
+  | "ai.fileTooLarge"
+  | "ai.invoiceText"
+  | "ai.pasteHere"
+  | "ai.trySample"
+  | "ai.provider"
+  | "ai.selectProvider"
+  | "ai.model"
+  | "ai.selectModel"
+  | "ai.enterModel"
+  | "ai.plannedMode"
+  | "ai.steps"
+  | "ai.providerShort"
+  | "ai.dragDrop"
+  | "ai.selectedFile"
+  | "ai.pages"
+  | "ai.pagesPlaceholder"
+  | "ai.pagesHelp"
+  | "ai.customPrompt"
+  | "ai.promptPlaceholder"
+  | "ai.refineWithLLM"
+  | "ai.consentNotice"
+  | "ai.consentAgree"
+  | "ai.extractFields"
+  | "ai.scanDisclaimer"
+  | "ai.complete"
+  | "ai.source"
+  | "ai.current"
+  | "ai.applyToForm"
+  | "ai.noTrendData"
+  | "ai.total"
+  | "ai.accepted"
+  | "ai.acc"
+  | "ai.max"
+  | "ai.scanDocument"
+  | "ai.lineItems"
+  | "ai.scanSuccess"
+  | "ai.scanError"
+  | "ai.scanTooltip"
+  | "ai.smartScan"
+  | "ai.generating"
+  | "ai.suggest"
+  | "ai.suggested"
+  | "ai.accounts"
+  | "ai.suggestionsReady"
+  | "ai.suggestedForN"
+  | "ai.suggestForAll"
+  | "ai.scanFailed"
+  | "ai.fieldsApplied"
+  | "ai.vendorMatch"
+  | "ai.useSupplier"
+  | "ai.meta"
+  | "ai.scanRedirect"
+  | "toast.titles.Contact created"
+  | "toast.titles.Error"
+  | "toast.descriptions.New contact has been added successfully."
+  | "toast.descriptions.Failed to create contact"
+  | "footer.terms"
+  | "footer.privacy"
+  | "footer.disclaimer"
+  | "footer.copyright"
+  | "consentDialog.welcome"
+  | "consentDialog.reviewTerms"
+  | "consentDialog.importantInfo"
+  | "consentDialog.readAndAgree"
+  | "consentDialog.termsDesc"
+  | "consentDialog.privacyDesc"
+  | "consentDialog.readAndUnderstand"
+  | "consentDialog.disclaimerDesc"
+  | "consentDialog.acceptContinue"
+  | "consentDialog.checkAll"
+  | "consentDialog.signOutSwitch"
+  | "consentDialog.mustAccept"
+  | "consentDialog.alertCheckAll"
+  | "consentDialog.softwareToolOnly"
+  | "consentDialog.notSubstitute"
+  | "consentDialog.byAccepting"
+  | "consentDialog.toolNotAdvice"
+  | "consentDialog.responsibleForData"
+  | "consentDialog.consultAccountant"
+  | "consentDialog.limitedLiability"
+  | "consentDialog.agreeToPrivacy"
+  | "errors.somethingWentWrong"
+  | "errors.unexpectedError"
+  | "ui.dialogContent"
+  | "ui.toggleTheme"
+  | "ui.light"
+  | "ui.dark"
+  | "ui.system"
+  | "taxes.vat"
+  | "taxes.salesTax"
+  | "taxes.corporateTax"
+  | "taxes.withholding"
+  | "taxes.custom"
+  | "approvals.title"
+  | "approvals.subtitle"
+  | "approvals.pending"
+  | "approvals.history"
+  | "approvals.noPending"
+  | "approvals.noPendingDesc"
+  | "approvals.requestedBy"
+  | "approvals.confirmApprove"
+  | "approvals.confirmReject"
+  | "approvals.commentPrompt"
+  | "approvals.commentPlaceholder"
+  | "approvals.actionSuccess"
+  | "approvals.settingsTitle"
+  | "approvals.settingsSubtitle"
+  | "approvals.addRule"
+  | "approvals.addNewRule"
+  | "approvals.entityType"
+  | "approvals.minAmount"
+  | "approvals.maxAmount"
+  | "approvals.requiredRole"
+  | "approvals.activeRules"
+  | "approvals.rulesDesc"
+  | "approvals.noRules"
+  | "approvals.type"
+  | "approvals.threshold"
+  | "approvals.approver"
+  | "approvals.ruleCreated"
+  | "approvals.requests"
+  | "approvals.settings"
+  | "approvals.workflowCreated"
+  | "approvals.workflowDeleted"
+  | "approvals.pleaseProvideName"
+  | "approvals.workflowName"
+  | "approvals.workflowNamePlaceholder"
+  | "approvals.purchaseOrder"
+  | "approvals.salesInvoice"
+  | "approvals.triggerDescription"
+  | "approvals.approvalSteps"
+  | "approvals.addStep"
+  | "approvals.noWorkflows"
+  | "approvals.noWorkflowsDesc"
+  | "approvals.createFirst"
+  | "approvals.above"
+  | "approvals.approvalChain"
+  | "approvals.createdOn"
+  | "approvals.approve"
+  | "shortcuts.title"
+  | "shortcuts.navigation"
+  | "shortcuts.actions"
+  | "shortcuts.appearance"
+  | "shortcuts.general"
+  | "shortcuts.openSearch"
+  | "shortcuts.goHome"
+  | "shortcuts.goToInvoices"
+  | "shortcuts.goToContacts"
+  | "shortcuts.goToInventory"
+  | "shortcuts.goToExpenses"
+  | "shortcuts.goToAccounts"
+  | "shortcuts.goToReports"
+  | "shortcuts.goToSettings"
+  | "shortcuts.newInvoice"
+  | "shortcuts.newContact"
+  | "shortcuts.newItem"
+  | "shortcuts.save"
+  | "shortcuts.print"
+  | "shortcuts.toggleTheme"
+  | "shortcuts.toggleLanguage"
+  | "shortcuts.closeDialog"
+  | "shortcuts.showHelp"
+  | "shortcuts.next"
+  | "shortcuts.previous"
+  | "shortcuts.toOpenHelp"
+  | "shortcuts.description"
+  | "shortcuts.global"
+  | "shortcuts.pageSpecific"
+  | "shortcuts.tip"
+  | "commandPalette.placeholder"
+  | "commandPalette.noResults"
+  | "commandPalette.navigation"
+  | "commandPalette.quickCreate"
+  | "commandPalette.reports"
+  | "commandPalette.settings"
+  | "commandPalette.help"
+  | "commandPalette.tip"
+  | "commandPalette.navigate"
+  | "commandPalette.select"
+  | "quickActions.newInvoice"
+  | "quickActions.newBill"
+  | "quickActions.newJournal"
+  | "quickActions.newContact"
+  | "quickActions.newItem"
+  | "quickActions.newProject"
+  | "activity.title"
+  | "activity.recentActivity"
+  | "activity.allActivity"
+  | "activity.loadMore"
+  | "activity.noActivity"
+  | "activity.noActivityDesc"
+  | "activity.filter"
+  | "activity.filterByEntity"
+  | "activity.filterByAction"
+  | "activity.filterByUser"
+  | "activity.clearFilters"
+  | "activity.today"
+  | "activity.yesterday"
+  | "activity.thisWeek"
+  | "activity.thisMonth"
+  | "activity.older"
+  | "activity.viewDetails"
+  | "activity.created"
+  | "activity.updated"
+  | "activity.deleted"
+  | "activity.viewed"
+  | "activity.sent"
+  | "activity.approved"
+  | "activity.rejected"
+  | "activity.paid"
+  | "activity.commented"
+  | "activity.attached"
+  | "activity.invoice"
+  | "activity.contact"
+  | "activity.item"
+  | "activity.transaction"
+  | "activity.order"
+  | "activity.report"
+  | "activity.setting"
+  | "activity.user"
+  | "activity.unknown"
+  | "activity.by"
+  | "activity.at"
+  | "activity.system"
+  | "activity.autoActivity"
+  | "activity.changes"
+  | "activity.previousValue"
+  | "activity.newValue"
+  | "activity.refresh"
+  | "activity.autoRefresh"
+  | "activity.realTime"
+  | "activity.paused"
+  | "quickStats.monthlyRevenue"
+  | "quickStats.monthlyExpenses"
+  | "quickStats.receivables"
+  | "quickStats.payables"
+  | "quickStats.cashBalance"
+  | "quickStats.overdueAmount"
+  | "quickStats.invoicePipeline"
+  | "quickStats.thisMonth"
+  | "quickStats.draft"
+  | "quickStats.sent"
+  | "quickStats.paid"
+  | "quickStats.overdue"
+  | "alerts.title"
+  | "alerts.critical"
+  | "alerts.warnings"
+  | "alerts.allClear"
+  | "alerts.noActiveAlerts"
+  | "alerts.viewAll"
+  | "alerts.overdueInvoices"
+  | "alerts.overdueInvoicesDesc"
+  | "alerts.viewOverdue"
+  | "alerts.overdueBills"
+  | "alerts.overdueBillsDesc"
+  | "alerts.viewOverdueBills"
+  | "alerts.lowStock"
+  | "alerts.lowStockDesc"
+  | "alerts.viewInventory"
+  | "alerts.upcomingPayments"
+  | "alerts.upcomingPaymentsDesc"
+  | "alerts.viewPayments"
+  | "alerts.pendingApprovals"
+  | "alerts.pendingApprovalsDesc"
+  | "alerts.viewApprovals"
+  | "alerts.cashFlowWarning"
+  | "alerts.cashFlowWarningDesc"
+  | "alerts.viewCashFlow"
+  | "alerts.types.danger"
+  | "alerts.types.warning"
+  | "alerts.types.info"
+  | "export.title"
+  | "export.description"
+  | "export.format"
+  | "export.filename"
+  | "export.filenamePlaceholder"
+  | "export.options"
+  | "export.includeTitle"
+  | "export.rows"
+  | "export.columns"
+  | "export.export"
+  | "export.exporting"
+  | "export.excelDesc"
+  | "export.pdfDesc"
+  | "export.csvDesc"
+  | "bulk.selected"
+  | "bulk.actions"
+  | "bulk.clearSelection"
+  | "bulk.delete"
+  | "bulk.archive"
+  | "bulk.export"
+  | "bulk.print"
+  | "bulk.confirmTitle"
+  | "bulk.confirmDescription"
+  | "search.placeholder"
+  | "search.search"
+  | "search.clear"
+  | "search.save"
+  | "search.saveSearch"
+  | "search.saveSearchDescription"
+  | "search.searchName"
+  | "search.searchNamePlaceholder"
+  | "search.searchSaved"
+  | "search.filters"
+  | "search.addFilter"
+  | "search.noFilters"
+  | "search.noResults"
+  | "search.noResultsDescription"
+  | "search.recentSearches"
+  | "search.savedSearches"
+  | "search.suggestions"
+  | "search.suggestionOverdue"
+  | "search.suggestionThisMonth"
+  | "search.toSelect"
+  | "search.toNavigate"
+  | "search.selectDate"
+  | "search.enterValue"
+  | "search.and"
+  | "search.entities.all"
+  | "search.entities.invoice"
+  | "search.entities.contact"
+  | "search.entities.item"
+  | "search.entities.expense"
+  | "search.entities.payment"
+  | "search.entities.journal"
+  | "search.fields.keyword"
+  | "search.fields.number"
+  | "search.fields.contact"
+  | "search.fields.amount"
+  | "search.fields.date"
+  | "search.fields.dueDate"
+  | "search.fields.status"
+  | "search.fields.name"
+  | "search.fields.email"
+  | "search.fields.phone"
+  | "search.fields.type"
+  | "search.fields.balance"
+  | "search.fields.sku"
+  | "search.fields.price"
+  | "search.fields.quantity"
+  | "search.fields.category"
+  | "search.fields.description"
+  | "search.fields.vendor"
+  | "search.fields.reference"
+  | "search.fields.method"
+  | "search.operators.equals"
+  | "search.operators.contains"
+  | "search.operators.startsWith"
+  | "search.operators.endsWith"
+  | "search.operators.greaterThan"
+  | "search.operators.lessThan"
+  | "search.operators.between"
+  | "search.operators.isEmpty"
+  | "search.operators.isNotEmpty"
+  | "search.dateRanges.today"
+  | "search.dateRanges.yesterday"
+  | "search.dateRanges.last7Days"
+  | "search.dateRanges.last30Days"
+  | "search.dateRanges.thisMonth"
+  | "search.dateRanges.lastMonth"
+  | "search.dateRanges.thisYear"
+  | "search.advancedFilters"
+  | "search.clearAll"
+  | "search.applyFilters"
+  | "search.activeFilters"
+  | "search.selectOption"
+  | "search.min"
+  | "search.max"
+  | "table.rowsPerPage"
+  | "table.pageInfo"
+  | "currency.title"
+  | "currency.description"
+  | "currency.lastUpdate"
+  | "currency.refreshRates"
+  | "currency.ratesUpdated"
+  | "currency.converter"
+  | "currency.from"
+  | "currency.to"
+  | "currency.amount"
+  | "currency.result"
+  | "currency.exchangeRate"
+  | "currency.inverseRate"
+  | "currency.viewHistory"
+  | "currency.saveConversion"
+  | "currency.conversionSaved"
+  | "currency.copied"
+  | "currency.quickRates"
+  | "currency.quickRatesDescription"
+  | "currency.conversionHistory"
+  | "currency.rateHistory"
+  | "currency.last30Days"
+  | "currency.high"
+  | "currency.low"
+  | "currency.average"
+  | "currency.searchCurrencies"
+  | "currency.favorites"
+  | "currency.regions.americas"
+  | "currency.regions.europe"
+  | "currency.regions.asia"
+  | "currency.regions.middleeast"
+  | "currency.regions.africa"
+  | "currency.regions.oceania"
+  | "currency.regions.other"
+  | "currency.noRate"
+  | "confirm.title"
+  | "confirm.description"
+  | "confirm.deleteTitle"
+  | "confirm.deleteDescription"
+  | "offline.message"
+  | "offline.syncing"
+  | "offline.reconnected"
+  | "autoSave.saving"
+  | "autoSave.saved"
+  | "autoSave.error"
+  | "autoSave.offline"
+  | "autoSave.savedJustNow"
+  | "autoSave.savedMinutesAgo"
+  | "autoSave.notSaved"
+  | "autoSave.foundDraft"
+  | "autoSave.savedAgo"
+  | "autoSave.justNow"
+  | "autoSave.minutesAgo"
+  | "autoSave.hoursAgo"
+  | "autoSave.restore"
+  | "autoSave.discard"
+  | "autoSave.restored"
+  | "autoSave.restoredDesc"
+  | "autoSave.restoreFailed"
+  | "autoSave.restoreFailedDesc"
+  | "autoSave.cleared"
+  | "autoSave.clearedDesc"
+  | "autoSave.clickToRestore"
+  | "reminders.title"
+  | "reminders.description"
+  | "reminders.settings.autoReminders"
+  | "reminders.settings.autoRemindersDesc"
+  | "reminders.settings.emailNotifications"
+  | "reminders.settings.emailNotificationsDesc"
+  | "reminders.settings.excludeWeekends"
+  | "reminders.settings.excludeWeekendsDesc"
+  | "reminders.settings.maxReminders"
+  | "reminders.settings.reminders"
+  | "reminders.settings.unlimited"
+  | "reminders.sendBulk"
+  | "reminders.stats.overdueInvoices"
+  | "reminders.stats.totalAmount"
+  | "reminders.stats.avgDaysOverdue"
+  | "reminders.stats.sentToday"
+  | "reminders.tabs.overview"
+  | "reminders.tabs.rules"
+  | "reminders.tabs.history"
+  | "reminders.tabs.settings"
+  | "reminders.overdueInvoices"
+  | "reminders.overdueInvoicesDesc"
+  | "reminders.noOverdue"
+  | "reminders.noOverdueDesc"
+  | "reminders.daysOverdue"
+  | "reminders.remindersSent"
+  | "reminders.reminderRules"
+  | "reminders.reminderRulesDesc"
+  | "reminders.addRule"
+  | "reminders.editRule"
+  | "reminders.ruleDialogDesc"
+  | "reminders.ruleName"
+  | "reminders.ruleNamePlaceholder"
+  | "reminders.onDueDate"
+  | "reminders.daysBefore"
+  | "reminders.daysAfter"
+  | "reminders.beforeDue"
+  | "reminders.afterDue"
+  | "reminders.timing"
+  | "reminders.frequency.label"
+  | "reminders.frequency.once"
+  | "reminders.frequency.daily"
+  | "reminders.frequency.weekly"
+  | "reminders.channels.label"
+  | "reminders.channels.email"
+  | "reminders.channels.notification"
+  | "reminders.channels.sms"
+  | "reminders.reminderHistory"
+  | "reminders.reminderHistoryDesc"
+  | "reminders.noHistory"
+  | "reminders.noHistoryDesc"
+  | "reminders.channel"
+  | "reminders.status.sent"
+  | "reminders.status.failed"
+  | "reminders.status.pending"
+  | "reminders.reminderSent"
+  | "reminders.reminderSentTo"
+  | "reminders.reminderFailed"
+  | "reminders.reminderFailedDesc"
+  | "reminders.settingsTitle"
+  | "reminders.settingsDesc"
+  | "enhancedTable.columns"
+  | "enhancedTable.selectedCount"
+  | "enhancedTable.totalCount"
+  | "enhancedTable.pinLeft"
+  | "enhancedTable.pinRight"
+  | "enhancedTable.unpin"
+  | "enhancedTable.hideColumn"
+  | "email.sendInvoice"
+  | "email.sendInvoiceDescription"
+  | "email.sendEmail"
+  | "email.to"
+  | "email.toPlaceholder"
+  | "email.cc"
+  | "email.subject"
+  | "email.subjectPlaceholder"
+  | "email.message"
+  | "email.messagePlaceholder"
+  | "email.customMessage"
+  | "email.customMessagePlaceholder"
+  | "email.send"
+  | "email.sending"
+  | "email.success"
+  | "email.sendSuccess"
+  | "email.sendFailed"
+  | "email.invoiceSentTo"
+  | "email.reminderSuccess"
+  | "email.reminderSentTo"
+  | "email.sendReminder"
+  | "email.unknownError"
+  | "email.error"
+  | "email.notConfigured"
+  | "email.invoiceSubjectDefault"
+  | "email.invoiceMessageDefault"
+  | "select.placeholder"
+  | "select.search"
+  | "select.noResults"
+  | "select.selected"
+  | "select.clearAll"
+  | "upload.dragOrClick"
+  | "upload.dropHere"
+  | "upload.maxSize"
+  | "upload.maxFiles"
+  | "upload.filesCount"
+  | "upload.uploadAll"
+  | "upload.clearAll"
+  | "upload.fileTooLarge"
+  | "upload.invalidType"
+  | "wizard.previous"
+  | "wizard.next"
+  | "wizard.complete"
+  | "wizard.submitting"
+  | "wizard.stepOf"
+  | "analytics.previousPeriod"
+  | "analytics.today"
+  | "analytics.7days"
+  | "analytics.30days"
+  | "analytics.90days"
+  | "analytics.1year"
+  | "preview.loadError"
+  | "preview.downloadInstead"
+  | "preview.download"
+  | "preview.unsupportedFormat"
+  | "empty.noResults"
+  | "empty.noResultsFor"
+  | "empty.tryDifferentSearch"
+  | "empty.clearSearch"
+  | "empty.noInvoices"
+  | "empty.noInvoicesDesc"
+  | "empty.createInvoice"
+  | "empty.noContacts"
+  | "empty.noContactsDesc"
+  | "empty.addContact"
+  | "empty.noItems"
+  | "empty.noItemsDesc"
+  | "empty.addItem"
+  | "empty.noTransactions"
+  | "empty.noTransactionsDesc"
+  | "empty.addTransaction"
+  | "empty.noOrders"
+  | "empty.noOrdersDesc"
+  | "empty.createOrder"
+  | "empty.noReports"
+  | "empty.noReportsDesc"
+  | "empty.generateReport"
+  | "payment.paid"
+  | "payment.partial"
+  | "payment.unpaid"
+  | "payment.remaining"
+  | "notes.title"
+  | "notes.addNote"
+  | "notes.placeholder"
+  | "notes.pin"
+  | "notes.unpin"
+  | "notes.delete"
+  | "notes.edit"
+  | "notes.reply"
+  | "notes.cancel"
+  | "notes.save"
+  | "notes.mentions"
+  | "notes.attachments"
+  | "notes.tags"
+  | "notes.addTag"
+  | "notes.pinnedNotes"
+  | "notes.allNotes"
+  | "notes.noNotes"
+  | "notes.noNotesDesc"
+  | "notes.deleteConfirm"
+  | "notes.created"
+  | "notes.updated"
+  | "notes.deleted"
+  | "notes.pinned"
+  | "notes.unpinned"
+  | "notes.replyTo"
+  | "notes.viewReplies"
+  | "notes.hideReplies"
+  | "notes.attachFile"
+  | "notes.uploadingFile"
+  | "notes.fileUploaded"
+  | "notes.removeAttachment"
+  | "notes.mentionUser"
+  | "notes.internal"
+  | "notes.internalDesc"
+  | "notes.lastEdited"
+  | "bulkImport.import"
+  | "bulkImport.title"
+  | "bulkImport.description"
+  | "bulkImport.entityType"
+  | "bulkImport.entities.contacts"
+  | "bulkImport.entities.items"
+  | "bulkImport.entities.invoices"
+  | "bulkImport.entities.transactions"
+  | "bulkImport.entities.accounts"
+  | "bulkImport.entities.journalEntries"
+  | "bulkImport.downloadTemplate"
+  | "bulkImport.dropzone"
+  | "bulkImport.supportedFormats"
+  | "bulkImport.invalidFileType"
+  | "bulkImport.help"
+  | "bulkImport.helpTitle"
+  | "bulkImport.helpText1"
+  | "bulkImport.helpText2"
+  | "bulkImport.helpText3"
+  | "bulkImport.helpText4"
+  | "bulkImport.fileLoaded"
+  | "bulkImport.rowsFound"
+  | "bulkImport.mapColumns"
+  | "bulkImport.skipColumn"
+  | "bulkImport.continue"
+  | "bulkImport.valid"
+  | "bulkImport.invalid"
+  | "bulkImport.selectAll"
+  | "bulkImport.status"
+  | "bulkImport.errors"
+  | "bulkImport.showingFirst"
+  | "bulkImport.importing"
+  | "bulkImport.importComplete"
+  | "bulkImport.importSummary"
+  | "bulkImport.someErrors"
+  | "bulkImport.andMore"
+  | "bulkImport.importSelected"
+  | "bulkImport.parseError"
+  | "bulkImport.invalidDate"
+  | "bulkImport.invalidNumber"
+  | "bulkImport.requiredField"
+  | "bulkImport.templateDownloaded"
+  | "bulkImport.templateDescription"
+  | "bulkExport.export"
+  | "bulkExport.title"
+  | "bulkExport.description"
+  | "bulkExport.entityType"
+  | "bulkExport.format"
+  | "bulkExport.selectFields"
+  | "bulkExport.exporting"
+  | "bulkExport.exportComplete"
+  | "bulkExport.exportSuccess"
+  | "bulkExport.exportFailed"
+  | "recurring.title"
+  | "recurring.description"
+  | "recurring.add"
+  | "recurring.addTitle"
+  | "recurring.addDescription"
+  | "recurring.editTitle"
+  | "recurring.editDescription"
+  | "recurring.copy"
+  | "recurring.stats.active"
+  | "recurring.stats.paused"
+  | "recurring.stats.total"
+  | "recurring.stats.monthlyTotal"
+  | "recurring.upcomingTitle"
+  | "recurring.upcomingDesc"
+  | "recurring.filterStatus"
+  | "recurring.filterType"
+  | "recurring.allStatuses"
+  | "recurring.allTypes"
+  | "recurring.status.active"
+  | "recurring.status.paused"
+  | "recurring.status.completed"
+  | "recurring.status.cancelled"
+  | "recurring.type.invoice"
+  | "recurring.type.expense"
+  | "recurring.type.payment"
+  | "recurring.type.journalEntry"
+  | "recurring.type.transfer"
+  | "recurring.frequency.daily"
+  | "recurring.frequency.weekly"
+  | "recurring.frequency.biweekly"
+  | "recurring.frequency.monthly"
+  | "recurring.frequency.quarterly"
+  | "recurring.frequency.yearly"
+  | "recurring.table.name"
+  | "recurring.table.type"
+  | "recurring.table.amount"
+  | "recurring.table.frequency"
+  | "recurring.table.nextRun"
+  | "recurring.table.status"
+  | "recurring.runNow"
+  | "recurring.viewHistory"
+  | "recurring.pause"
+  | "recurring.activate"
+  | "recurring.edit"
+  | "recurring.duplicate"
+  | "recurring.delete"
+  | "recurring.noRecurring"
+  | "recurring.noRecurringDesc"
+  | "recurring.startDate"
+  | "recurring.lastRun"
+  | "recurring.runCount"
+  | "recurring.contact"
+  | "recurring.category"
+  | "recurring.form.name"
+  | "recurring.form.namePlaceholder"
+  | "recurring.form.type"
+  | "recurring.form.amount"
+  | "recurring.form.frequency"
+  | "recurring.form.startDate"
+  | "recurring.form.endDate"
+  | "recurring.form.dayOfMonth"
+  | "recurring.form.dayOfWeek"
+  | "recurring.form.description"
+  | "recurring.form.descriptionPlaceholder"
+  | "recurring.form.autoApprove"
+  | "recurring.form.autoApproveDesc"
+  | "recurring.lastDayOfMonth"
+  | "recurring.days.sunday"
+  | "recurring.days.monday"
+  | "recurring.days.tuesday"
+  | "recurring.days.wednesday"
+  | "recurring.days.thursday"
+  | "recurring.days.friday"
+  | "recurring.days.saturday"
+  | "recurring.save"
+  | "recurring.create"
+  | "recurring.deleteTitle"
+  | "recurring.deleteDescription"
+  | "recurring.confirmDelete"
+  | "recurring.historyTitle"
+  | "recurring.historyDescription"
+  | "recurring.history.date"
+  | "recurring.history.amount"
+  | "recurring.history.status"
+  | "recurring.history.transaction"
+  | "recurring.history.success"
+  | "recurring.history.failed"
+  | "recurring.history.skipped"
+  | "recurring.noHistory"
+  | "recurring.created"
+  | "recurring.updated"
+  | "recurring.deleted"
+  | "recurring.activated"
+  | "recurring.paused"
+  | "recurring.runSuccess"
+  | "recurring.runError"
+  | "recurring.createError"
+  | "recurring.updateError"
+  | "recurring.deleteError"
+  | "scanner.scanDocument"
+  | "scanner.title"
+  | "scanner.description"
+  | "scanner.uploadTab"
+  | "scanner.cameraTab"
+  | "scanner.dropzone"
+  | "scanner.supportedFormats"
+  | "scanner.invalidFileType"
+  | "scanner.documentType"
+  | "scanner.types.invoice"
+  | "scanner.types.receipt"
+  | "scanner.types.bill"
+  | "scanner.types.contract"
+  | "scanner.types.id_card"
+  | "scanner.types.business_card"
+  | "scanner.types.other"
+  | "scanner.imageAdjustments"
+  | "scanner.rotateLeft"
+  | "scanner.rotateRight"
+  | "scanner.zoomIn"
+  | "scanner.zoomOut"
+  | "scanner.reset"
+  | "scanner.brightness"
+  | "scanner.contrast"
+  | "scanner.extractData"
+  | "scanner.processing"
+  | "scanner.startCamera"
+  | "scanner.capture"
+  | "scanner.cameraError"
+  | "scanner.cameraPermission"
+  | "scanner.steps.preparing"
+  | "scanner.steps.preprocessing"
+  | "scanner.steps.extractingText"
+  | "scanner.steps.analyzingFields"
+  | "scanner.steps.validating"
+  | "scanner.steps.complete"
+  | "scanner.processComplete"
+  | "scanner.fieldsExtracted"
+  | "scanner.processError"
+  | "scanner.scannedDocument"
+  | "scanner.extractedText"
+  | "scanner.extractedFields"
+  | "scanner.fieldsFound"
+  | "scanner.copy"
+  | "scanner.copied"
+  | "scanner.scanAnother"
+  | "scanner.useData"
+  | "scanner.dataSaved"
+  | "scanner.fields.vendorName"
+  | "scanner.fields.vendorAddress"
+  | "scanner.fields.vendorEmail"
+  | "scanner.fields.vendorPhone"
+  | "scanner.fields.invoiceNumber"
+  | "scanner.fields.invoiceDate"
+  | "scanner.fields.dueDate"
+  | "scanner.fields.customerName"
+  | "scanner.fields.subtotal"
+  | "scanner.fields.taxAmount"
+  | "scanner.fields.totalAmount"
+  | "scanner.fields.currency"
+  | "scanner.fields.date"
+  | "scanner.fields.paymentMethod"
+  | "scanner.fields.accountNumber"
+  | "scanner.fields.name"
+  | "scanner.fields.title"
+  | "scanner.fields.company"
+  | "scanner.fields.email"
+  | "scanner.fields.phone"
+  | "scanner.fields.website"
+  | "scanner.fields.address"
+  | "audit.title"
+  | "audit.description"
+  | "audit.searchPlaceholder"
+  | "audit.noLogs"
+  | "audit.noLogsDescription"
+  | "audit.export"
+  | "audit.exportAs"
+  | "audit.exportSuccess"
+  | "audit.exportedAs"
+  | "audit.refresh"
+  | "audit.clearFilters"
+  | "audit.viewDetails"
+  | "audit.logDetails"
+  | "audit.showFilters"
+  | "audit.hideFilters"
+  | "audit.totalLogs"
+  | "audit.filtered"
+  | "audit.showing"
+  | "audit.filters.title"
+  | "audit.filters.action"
+  | "audit.filters.entity"
+  | "audit.filters.user"
+  | "audit.filters.dateRange"
+  | "audit.filters.allActions"
+  | "audit.filters.allEntities"
+  | "audit.filters.allUsers"
+  | "audit.filters.today"
+  | "audit.filters.yesterday"
+  | "audit.filters.last7Days"
+  | "audit.filters.last30Days"
+  | "audit.filters.thisMonth"
+  | "audit.filters.custom"
+  | "audit.actions.create"
+  | "audit.actions.update"
+  | "audit.actions.delete"
+  | "audit.actions.view"
+  | "audit.actions.export"
+  | "audit.actions.import"
+  | "audit.actions.login"
+  | "audit.actions.logout"
+  | "audit.actions.approve"
+  | "audit.actions.reject"
+  | "audit.actions.send"
+  | "audit.actions.archive"
+  | "audit.actions.restore"
+  | "audit.entities.invoice"
+  | "audit.entities.contact"
+  | "audit.entities.item"
+  | "audit.entities.expense"
+  | "audit.entities.payment"
+  | "audit.entities.journal"
+  | "audit.entities.account"
+  | "audit.entities.user"
+  | "audit.entities.settings"
+  | "audit.entities.report"
+  | "audit.entities.bank"
+  | "audit.fields.timestamp"
+  | "audit.fields.user"
+  | "audit.fields.action"
+  | "audit.fields.entity"
+  | "audit.fields.entityId"
+  | "audit.fields.ipAddress"
+  | "audit.fields.userAgent"
+  | "audit.fields.changes"
+  | "audit.fields.oldValue"
+  | "audit.fields.newValue"
+  | "audit.fields.field"
+  | "audit.stats.todayLogs"
+  | "audit.stats.thisWeek"
+  | "audit.stats.activeUsers"
+  | "audit.stats.mostCommon"
+  | "templates.title"
+  | "templates.description"
+  | "templates.searchPlaceholder"
+  | "templates.all"
+  | "templates.preview"
+  | "templates.previewDescription"
+  | "templates.customize"
+  | "templates.customizeTemplate"
+  | "templates.customizeDescription"
+  | "templates.apply"
+  | "templates.useTemplate"
+  | "templates.templateApplied"
+  | "templates.premium"
+  | "templates.default"
+  | "templates.noTemplates"
+  | "templates.noTemplatesDescription"
+  | "templates.categories.professional"
+  | "templates.categories.modern"
+  | "templates.categories.creative"
+  | "templates.categories.minimal"
+  | "templates.categories.classic"
+  | "templates.categories.industry"
+  | "templates.colors"
+  | "templates.typography"
+  | "templates.layout"
+  | "templates.elements"
+  | "templates.colorScheme"
+  | "templates.colorSchemes.blue"
+  | "templates.colorSchemes.green"
+  | "templates.colorSchemes.purple"
+  | "templates.colorSchemes.red"
+  | "templates.colorSchemes.gray"
+  | "templates.colorSchemes.custom"
+  | "templates.primaryColor"
+  | "templates.secondaryColor"
+  | "templates.accentColor"
+  | "templates.fontFamily"
+  | "templates.fontSize"
+  | "templates.paperSize"
+  | "templates.margins"
+  | "templates.logoPosition"
+  | "templates.left"
+  | "templates.center"
+  | "templates.right"
+  | "templates.showLogo"
+  | "templates.showWatermark"
+  | "templates.showPaymentTerms"
+  | "templates.showNotes"
+  | "templates.showBankDetails"
+  | "templates.showSignature"
+  | "templates.resetDefaults"
+  | "templates.customizationSaved"
+  | "visualization.title"
+  | "visualization.description"
+  | "visualization.lastUpdate"
+  | "visualization.refreshed"
+  | "visualization.exported"
+  | "visualization.expand"
+  | "visualization.download"
+  | "visualization.exportAs"
+  | "visualization.settings"
+  | "visualization.colorPalette"
+  | "visualization.ranges.7d"
+  | "visualization.ranges.30d"
+  | "visualization.ranges.90d"
+  | "visualization.ranges.ytd"
+  | "visualization.ranges.1y"
+  | "visualization.palettes.default"
+  | "visualization.palettes.warm"
+  | "visualization.palettes.cool"
+  | "visualization.palettes.mono"
+  | "visualization.palettes.rainbow"
+  | "visualization.charts.revenueTrend"
+  | "visualization.charts.expenseBreakdown"
+  | "visualization.charts.cashFlow"
+  | "visualization.charts.invoiceStatus"
+  | "visualization.charts.collectionRate"
+  | "visualization.charts.salesFunnel"
+  | "badges.ai"
+  | "help.userGuide"
+  | "zatca.short"
+  | "fixedAssets.title"
+  | "fixedAssets.description"
+  | "fixedAssets.newAsset"
+  | "fixedAssets.registerAsset"
+  | "fixedAssets.enterDetails"
+  | "fixedAssets.assetNamePlaceholder"
+  | "fixedAssets.acquisitionCost"
+  | "fixedAssets.acquisitionDate"
+  | "fixedAssets.usefulLifeYears"
+  | "fixedAssets.salvageValue"
+  | "fixedAssets.depreciationMethod"
+  | "fixedAssets.straightLine"
+  | "fixedAssets.decliningBalance"
+  | "fixedAssets.assetAccount"
+  | "fixedAssets.selectAssetAccount"
+  | "fixedAssets.accumulatedDepreciationAccount"
+  | "fixedAssets.selectContraAccount"
+  | "fixedAssets.depreciationExpenseAccount"
+  | "fixedAssets.selectExpenseAccount"
+  | "fixedAssets.createAsset"
+  | "fixedAssets.postDepreciation"
+  | "fixedAssets.calculateDescription"
+  | "fixedAssets.depreciationDate"
+  | "fixedAssets.posting"
+  | "fixedAssets.assetRegistry"
+  | "fixedAssets.acquired"
+  | "fixedAssets.bookValue"
+  | "fixedAssets.disposed"
+  | "checks.createSuccess"
+  | "checks.statusUpdateSuccess"
+  | "checks.extractSuccess"
+  | "checks.extractFailed"
+  | "checks.title"
+  | "checks.subtitle"
+  | "checks.scanning"
+  | "checks.scanCheck"
+  | "checks.add"
+  | "checks.addReceivable"
+  | "checks.addPayable"
+  | "checks.bankName"
+  | "checks.issueDate"
+  | "checks.dueDate"
+  | "checks.receivable"
+  | "checks.payable"
+  | "checks.bank"
+  | "checks.noChecks"
+  | "checks.markDeposited"
+  | "checks.markCleared"
+  | "manufacturing.bomCreateSuccess"
+  | "manufacturing.bomUpdateSuccess"
+  | "manufacturing.boms"
+  | "manufacturing.addBom"
+  | "manufacturing.editBom"
+  | "manufacturing.bomName"
+  | "manufacturing.version"
+  | "manufacturing.finishedGood"
+  | "manufacturing.laborCost"
+  | "manufacturing.overheadCost"
+  | "manufacturing.name"
+  | "manufacturing.noBoms"
+  | "manufacturing.orderCreateSuccess"
+  | "manufacturing.orderUpdateSuccess"
+  | "manufacturing.orderCompleteSuccess"
+  | "manufacturing.orders"
+  | "manufacturing.addOrder"
+  | "manufacturing.editOrder"
+  | "manufacturing.orderNumber"
+  | "manufacturing.bom"
+  | "manufacturing.startDate"
+  | "manufacturing.dueDate"
+  | "manufacturing.completeOrder"
+  | "manufacturing.dates"
+  | "manufacturing.noOrders"
+  | "manufacturing.complete"
+  | "portal.welcome"
+  | "portal.outstandingBalance"
+  | "portal.totalAmountDue"
+  | "portal.recentDocuments"
+  | "portal.inLast30Days"
+  | "portal.recentActivity"
+  | "portal.noRecentDocuments"
+  | "portal.documents"
+  | "portal.documentsDescription"
+  | "portal.allDocuments"
+  | "portal.noDocumentsFound"
+  | "portal.clientPortal"
+  | "portal.dashboard"
+  | "portal.logout"
+  | "portal.loginFailed"
+  | "portal.invalidCredentials"
+  | "portal.signInDescription"
+  | "portal.emailPlaceholder"
+  | "roles.owner"
+  | "roles.admin"
+  | "roles.accountant"
+  | "roles.sales"
+  | "roles.viewer";
+
+export interface TranslationParams {
+  "common.pageOf": { current: string | number; total: string | number };
+  "import.rowsFound": { count: number };
+  "import.showingFirst": { count: number; total: string | number };
+  "import.startImport": { count: number };
+  "import.completeSummary": { success: string | number; failed: string | number };
+  "import.andMore": { count: number };
+  "import.invalidNumber": { field: string | number; row: string | number };
+  "import.requiredField": { field: string | number };
+  "import.requiredFieldEmpty": { field: string | number };
+  "batch.confirmActionDesc": { action: string | number; count: number };
+  "batch.progressStatus": { current: string | number; total: string | number };
+  "batch.operationSummary": { success: string | number; failed: string | number };
+  "batch.successCount": { count: number };
+  "batch.failedCount": { count: number };
+  "notifications.minutesAgo": { minutes: string | number };
+  "notifications.hoursAgo": { hours: string | number };
+  "notifications.daysAgo": { days: string | number };
+  "dashboard.alerts.overdueInvoices": { count: number };
+  "dashboard.alerts.lowStock": { count: number };
+  "banking.accounts.ofTotal": { count: number };
+  "banking.reconciliation.autoSummary": { count: number };
+  "banking.reconciliation.withinDays": { n: string | number };
+  "banking.reconciliation.dateDiffN": { n: string | number };
+  "sales.quotations.equivalentInBaseCurrency": { currency: string | number };
+  "accounting.accounts.messages.defaultsCreated": { count: number };
+  "reports.exportedAs": { format: string | number };
+  "inventory.approveTransferDescription": { from: string | number; to: string | number };
+  "settings.invoice.days": { count: number };
+  "settings.users.statusChangedTo": { status: string | number };
+  "settings.language.translationsExported": { language: string | number };
+  "settings.currencies.rateLabel": { currency: string | number; baseCurrency: string | number };
+  "users.statusChangedTo": { status: string | number };
+  "forms.itemLabel": { index: string | number };
+  "forms.netDays": { days: string | number };
+  "forms.equivalentIn": { currency: string | number };
+  "validation.minLength": { value: string | number };
+  "validation.maxLength": { value: string | number };
+  "validation.min": { value: string | number };
+  "validation.max": { value: string | number };
+  "validation.errorsFound": { count: number };
+  "validation.warnings": { count: number };
+  "validation.errorsCount": { count: number };
+  "validation.progress": { valid: string | number; total: string | number };
+  "time.minutesAgo": { minutes: string | number };
+  "time.hoursAgo": { hours: string | number };
+  "time.daysAgo": { days: string | number };
+  "time.minutes": { count: number };
+  "time.hours": { count: number };
+  "time.days": { count: number };
+  "time.years": { count: number };
+  "ai.analytics.tokensInOut": { in: string | number; out: string | number };
+  "ai.complete": { count: number; total: string | number; percent: string | number };
+  "ai.source": { mode: string | number };
+  "ai.current": { value: string | number };
+  "ai.total": { value: string | number };
+  "ai.accepted": { value: string | number };
+  "ai.acc": { value: string | number };
+  "ai.max": { value: string | number };
+  "footer.copyright": { year: string | number };
+  "consentDialog.mustAccept": { version: string | number };
+  "quickStats.overdueAmount": { amount: string | number };
+  "alerts.viewAll": { count: number };
+  "alerts.overdueInvoices": { count: number };
+  "alerts.overdueInvoicesDesc": { amount: string | number };
+  "alerts.overdueBills": { count: number };
+  "alerts.overdueBillsDesc": { amount: string | number };
+  "alerts.lowStock": { count: number };
+  "alerts.upcomingPayments": { count: number };
+  "alerts.upcomingPaymentsDesc": { amount: string | number };
+  "alerts.pendingApprovals": { count: number };
+  "bulk.selected": { count: number };
+  "bulk.confirmDescription": { action: string | number; count: number };
+  "table.pageInfo": { current: string | number; total: string | number };
+  "confirm.deleteTitle": { item: string | number };
+  "confirm.deleteDescription": { item: string | number };
+  "autoSave.savedMinutesAgo": { minutes: string | number };
+  "autoSave.savedAgo": { time: string | number };
+  "autoSave.minutesAgo": { minutes: string | number };
+  "autoSave.hoursAgo": { hours: string | number };
+  "reminders.daysBefore": { days: string | number };
+  "reminders.daysAfter": { days: string | number };
+  "reminders.reminderSentTo": { contact: string | number };
+  "enhancedTable.selectedCount": { count: number };
+  "enhancedTable.totalCount": { count: number };
+  "email.invoiceSentTo": { email: string | number };
+  "email.reminderSentTo": { email: string | number };
+  "email.invoiceSubjectDefault": { number: string | number };
+  "email.invoiceMessageDefault": { number: string | number; amount: string | number };
+  "select.selected": { count: number };
+  "upload.maxSize": { size: string | number };
+  "upload.maxFiles": { count: number };
+  "upload.filesCount": { count: number };
+  "upload.fileTooLarge": { size: string | number };
+  "wizard.stepOf": { current: string | number; total: string | number };
+  "empty.noResultsFor": { query: string | number };
+  "notes.replyTo": { name: string | number };
+  "notes.viewReplies": { count: number };
+  "notes.lastEdited": { time: string | number };
+  "bulkImport.rowsFound": { count: number };
+  "bulkImport.showingFirst": { shown: string | number; total: string | number };
+  "bulkImport.importSummary": { success: string | number; failed: string | number };
+  "bulkImport.andMore": { count: number };
+  "bulkImport.importSelected": { count: number };
+  "bulkImport.requiredField": { field: string | number };
+  "bulkExport.exportSuccess": { count: number };
+  "recurring.upcomingDesc": { count: number };
+  "recurring.deleteDescription": { name: string | number };
+  "recurring.historyDescription": { name: string | number };
+  "scanner.fieldsExtracted": { count: number };
+  "audit.exportedAs": { format: string | number };
+  "audit.showing": { count: number; total: string | number };
+  "visualization.exported": { format: string | number };
+}
+
+export type TranslationParamsOf<K extends TranslationKey> =
+  K extends keyof TranslationParams ? TranslationParams[K] : Record<string, never>;
@@ -1,25 +1,7 @@
 import i18n from 'i18next';
 import { initReactI18next } from 'react-i18next';
 import LanguageDetector from 'i18next-browser-languagedetector';
-
-// Import all language files
-import en from '../locales/en/translation.json';
-import ar from '../locales/ar/translation.json';
-import tl from '../locales/tl/translation.json';
-import hi from '../locales/hi/translation.json';
-import ur from '../locales/ur/translation.json';
-import fr from '../locales/fr/translation.json';
-import es from '../locales/es/translation.json';
-import zh from '../locales/zh/translation.json';
-import ru from '../locales/ru/translation.json';
-import bn from '../locales/bn/translation.json';
-import ms from '../locales/ms/translation.json';
-import tr from '../locales/tr/translation.json';
-import pt from '../locales/pt/translation.json';
-import id from '../locales/id/translation.json';
-import de from '../locales/de/translation.json';
-import ko from '../locales/ko/translation.json';
-import ja from '../locales/ja/translation.json';
+import { loadResources, pinnedLanguage } from './locale-resources';
 
 // Language configuration
 export const languages = [
@@ -50,25 +32,8 @@ i18n
   .use(LanguageDetector)
   .use(initReactI18next)
   .init({
-    resources: {
-      en: { translation: en },
-      ar: { translation: ar },
-      fr: { translation: fr },
-      es: { translation: es },
-      de: { translation: de },
-      zh: { translation: zh },
-      ja: { translation: ja },
-      ko: { translation: ko },
-      ru: { translation: ru },
-      hi: { translation: hi },
-      ur: { translation: ur },
-      tl: { translation: tl },
-      bn: { translation: bn },
-      ms: { translation: ms },
-      tr: { translation: tr },
-      pt: { translation: pt },
-      id: { translation: id },
-    },
+    resources: loadResources(languages.map(({ code }) => code)),
+    lng: pinnedLanguage,
     fallbackLng: 'en',
     debug: false,
     
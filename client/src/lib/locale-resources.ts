@@ -0,0 +1,40 @@
+/**
+ * The i18next resources: every locale, in either on-disk layout (see
+ * i18n/shards.py) - one translation.json, or index.json listing one file per
+ * top-level namespace after `python -m i18n shard split`.
+ *
+ * A single-locale build (`python -m i18n inline`, see vite.config.ts)
+ * replaces this module with one that imports just its locale and sets
+ * `pinnedLanguage`.
+ */
+type LocaleTree = Record<string, unknown>;
+
+const localeFiles = import.meta.glob<LocaleTree>('../locales/*/*.json', {
+  eager: true,
+  import: 'default',
+});
+
+function loadTranslation(lang: string): LocaleTree | undefined {
+  const file = (name: string) => localeFiles[`../locales/${lang}/${name}`];
+  const single = file('translation.json');
+  if (single) return single;
+  const index = file('index.json') as { namespaces: Record<string, string> } | undefined;
+  if (!index) return undefined;
+  const tree: LocaleTree = {};
+  for (const [namespace, name] of Object.entries(index.namespaces)) {
+    tree[namespace] = file(name);
+  }
+  return tree;
+}
+
+export function loadResources(codes: string[]): Record<string, { translation: LocaleTree }> {
+  return Object.fromEntries(
+    codes.flatMap((code) => {
+      const translation = loadTranslation(code);
+      return translation ? [[code, { translation }]] : [];
+    }),
+  );
+}
+
+/** The one language of a single-locale build; undefined: detect it. */
+export const pinnedLanguage: string | undefined = undefined;
@@ -0,0 +1,115 @@
+/**
+ * Reader for the binary locale packs written by `python -m i18n pack`
+ * (format described in i18n/pack.py).
+ *
+ * A pack is queried in place: a lookup hashes the key (FNV-1a over its
+ * UTF-8 bytes), binary-searches the sorted hash table, confirms the entry
+ * with a second hash (djb2) and decodes only the value it finds, so opening
+ * a language costs a fetch and a few typed-array views instead of a
+ * JSON.parse of the whole file. Decoded values are cached. Keys are not
+ * stored in the pack, so it cannot list them.
+ *
+ * The native apps bundle the pack of the device language and fetch the
+ * others on demand:
+ *
+ *   const pack = await loadLocalePack('ar');
+ *   pack.get('common.save'); // "حفظ"
+ */
+
+const MAGIC = 0x50383149; // "I18P"
+const VERSION = 1;
+const HEADER_SIZE = 32;
+const JSON_KIND = 0x80000000;
+
+const encoder = new TextEncoder();
+const decoder = new TextDecoder();
+
+export type PackValue = string | string[] | Record<string, unknown>;
+
+function fnv1a(bytes: Uint8Array): number {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < bytes.length; i++) {
+    hash = Math.imul(hash ^ bytes[i], 0x01000193) >>> 0;
+  }
+  return hash;
+}
+
+function djb2(bytes: Uint8Array): number {
+  let hash = 5381;
+  for (let i = 0; i < bytes.length; i++) {
+    hash = (Math.imul(hash, 33) ^ bytes[i]) >>> 0;
+  }
+  return hash;
+}
+
+export class LocalePack {
+  readonly lang: string;
+  readonly size: number;
+  private readonly hashes: Uint32Array;
+  private readonly entries: Uint32Array;
+  private readonly strings: Uint8Array;
+  private readonly cache = new Map<string, PackValue | undefined>();
+
+  constructor(buffer: ArrayBuffer) {
+    const header = new DataView(buffer, 0, HEADER_SIZE);
+    if (header.getUint32(0, true) !== MAGIC || header.getUint16(4, true) !== VERSION) {
+      throw new Error(`Not a version ${VERSION} locale pack`);
+    }
+    const count = header.getUint32(8, true);
+    this.size = count;
+    this.hashes = new Uint32Array(buffer, header.getUint32(12, true), count);
+    this.entries = new Uint32Array(buffer, header.getUint32(16, true), count * 3);
+    this.strings = new Uint8Array(buffer, header.getUint32(20, true), header.getUint32(24, true));
+    this.lang = decoder.decode(new Uint8Array(buffer, 28, 4)).replace(/\0+$/, '');
+  }
+
+  /** Entry index of `key`, or -1. */
+  private find(key: string): number {
+    const bytes = encoder.encode(key);
+    const hash = fnv1a(bytes);
+    const { hashes, entries } = this;
+    let lo = 0;
+    let hi = hashes.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >>> 1;
+      if (hashes[mid] < hash) lo = mid + 1;
+      else hi = mid;
+    }
+    if (lo < hashes.length && hashes[lo] === hash) {
+      const check = djb2(bytes);
+      for (let i = lo; i < hashes.length && hashes[i] === hash; i++) {
+        if (entries[i * 3] === check) return i;
+      }
+    }
+    return -1;
+  }
+
+  has(key: string): boolean {
+    return this.cache.has(key) ? this.cache.get(key) !== undefined : this.find(key) >= 0;
+  }
+
+  /** The value of a dotted key (`undefined` if the pack does not have it). */
+  get(key: string): PackValue | undefined {
+    if (this.cache.has(key)) return this.cache.get(key);
+    const i = this.find(key);
+    let value: PackValue | undefined;
+    if (i >= 0) {
+      const offset = this.entries[i * 3 + 1];
+      const sizeAndKind = this.entries[i * 3 + 2];
+      const size = (sizeAndKind & ~JSON_KIND) >>> 0;
+      const text = decoder.decode(this.strings.subarray(offset, offset + size));
+      value = sizeAndKind & JSON_KIND ? JSON.parse(text) : text;
+    }
+    this.cache.set(key, value);
+    return value;
+  }
+}
+
+/** Fetch and open `<base>/<lang>.i18p` (bundled with the app or from the server). */
+export async function loadLocalePack(lang: string, base = '/locales'): Promise<LocalePack> {
+  const response = await fetch(`${base}/${lang}.i18p`);
+  if (!response.ok) {
+    throw new Error(`Locale pack ${lang} not available (${response.status})`);
+  }
+  return new LocalePack(await response.arrayBuffer());
+}
@@ -1,4 +1,4 @@
-import { useState } from "react";
+import { useState, useMemo } from "react";
 import { useTranslation } from "react-i18next";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs";
@@ -80,38 +80,38 @@ export default function AdvancedFeaturesPage() {
   const [activeTab, setActiveTab] = useState("overview");
   const isRTL = i18n.language === "ar";
 
-  const features = [
+  const features = useMemo(() => [
     {
       id: "smart-dashboard",
       title: t("dashboard.smartDashboard", "لوحة التحكم الذكية"),
       description: t("dashboard.smartDashboardDesc", "لوحة تحكم قابلة للتخصيص مع السحب والإفلات وودجات متعددة"),
       icon: <LayoutDashboard className="h-6 w-6" />,
-      badge: t("common.new", "جديد"),
+      badge: t("common.new"),
     },
     {
       id: "audit-trail",
-      title: t("audit.title", "سجل المراجعة"),
-      description: t("audit.description", "تتبع شامل لجميع التغييرات والعمليات في النظام"),
+      title: t("audit.title"),
+      description: t("audit.description"),
       icon: <History className="h-6 w-6" />,
       badge: t("common.premium", "متميز"),
     },
     {
       id: "currency-converter",
-      title: t("currency.converter", "محول العملات"),
+      title: t("currency.converter"),
       description: t("currency.converterDesc", "تحويل العملات مع أسعار صرف حية وأكثر من 30 عملة"),
       icon: <ArrowLeftRight className="h-6 w-6" />,
     },
     {
       id: "invoice-templates",
-      title: t("templates.title", "قوالب الفواتير"),
-      description: t("templates.description", "أكثر من 14 قالب احترافي مع تخصيص كامل"),
+      title: t("templates.title"),
+      description: t("templates.description"),
       icon: <FileText className="h-6 w-6" />,
-      badge: t("common.new", "جديد"),
+      badge: t("common.new"),
     },
     {
       id: "data-visualization",
-      title: t("visualization.title", "تصور البيانات"),
-      description: t("visualization.description", "رسوم بيانية متقدمة وتحليلات مرئية للبيانات"),
+      title: t("visualization.title"),
+      description: t("visualization.description"),
       icon: <BarChart3 className="h-6 w-6" />,
     },
     {
@@ -119,20 +119,20 @@ export default function AdvancedFeaturesPage() {
       title: t("goals.title", "تتبع الأهداف المالية"),
       description: t("goals.description", "حدد أهدافك المالية وتابع تقدمك نحو تحقيقها"),
       icon: <Target className="h-6 w-6" />,
-      badge: t("common.new", "جديد"),
+      badge: t("common.new"),
     },
     {
       id: "notifications",
-      title: t("notifications.title", "مركز الإشعارات"),
+      title: t("notifications.title"),
       description: t("notifications.description", "إشعارات ذكية للتنبيهات والمواعيد والمهام"),
       icon: <Bell className="h-6 w-6" />,
     },
     {
       id: "recurring",
-      title: t("recurring.title", "المعاملات المتكررة"),
-      description: t("recurring.description", "إدارة الفواتير والمصروفات المتكررة تلقائياً"),
+      title: t("recurring.title"),
+      description: t("recurring.description"),
       icon: <Repeat className="h-6 w-6" />,
-      badge: t("common.new", "جديد"),
+      badge: t("common.new"),
     },
     {
       id: "expense-analyzer",
@@ -152,14 +152,14 @@ export default function AdvancedFeaturesPage() {
       title: t("team.title", "تعاون الفريق"),
       description: t("team.description", "التواصل والتعاون مع أعضاء الفريق"),
       icon: <Users className="h-6 w-6" />,
-      badge: t("common.new", "جديد"),
+      badge: t("common.new"),
     },
     {
       id: "customer-portal",
       title: t("portal.title", "بوابة العملاء"),
       description: t("portal.description", "بوابة خدمة ذاتية للعملاء والموردين"),
       icon: <Globe className="h-6 w-6" />,
-      badge: t("common.new", "جديد"),
+      badge: t("common.new"),
     },
     {
       id: "zatca",
@@ -168,7 +168,7 @@ export default function AdvancedFeaturesPage() {
       icon: <Shield className="h-6 w-6" />,
       badge: t("common.required", "مطلوب"),
     },
-  ];
+  ], [t, i18n.language]);
 
   const handleTemplateSelect = (template: any, customization: any) => {
     console.log("Selected template:", template, customization);
@@ -182,15 +182,15 @@ export default function AdvancedFeaturesPage() {
         <div>
           <h1 className="text-3xl font-bold flex items-center gap-2">
             <Sparkles className="h-8 w-8 text-primary" />
-            {t("advanced.title", "الميزات المتقدمة")}
+            {t("advanced.title")}
           </h1>
           <p className="text-muted-foreground mt-1">
-            {t("advanced.subtitle", "اكتشف الأدوات القوية لإدارة أعمالك بكفاءة أعلى")}
+            {t("advanced.subtitle")}
           </p>
         </div>
         <Button variant="outline">
           <Settings className="h-4 w-4 ml-2" />
-          {t("common.settings", "الإعدادات")}
+          {t("common.settings")}
         </Button>
       </div>
 
@@ -211,7 +211,7 @@ export default function AdvancedFeaturesPage() {
             <TabsTrigger value="cashflow">{t("cashflow.short", "التدفق النقدي")}</TabsTrigger>
             <TabsTrigger value="team">{t("team.short", "الفريق")}</TabsTrigger>
             <TabsTrigger value="customer-portal">{t("portal.short", "البوابة")}</TabsTrigger>
-            <TabsTrigger value="zatca">{t("zatca.short", "ZATCA")}</TabsTrigger>
+            <TabsTrigger value="zatca">{t("zatca.short")}</TabsTrigger>
           </TabsList>
           <ScrollBar orientation="horizontal" />
         </ScrollArea>
@@ -234,13 +234,13 @@ export default function AdvancedFeaturesPage() {
           {/* Quick Stats */}
           <Card>
             <CardHeader>
-              <CardTitle>{t("advanced.quickStats", "إحصائيات سريعة")}</CardTitle>
+              <CardTitle>{t("advanced.quickStats")}</CardTitle>
             </CardHeader>
             <CardContent>
               <div className="grid grid-cols-2 md:grid-cols-4 lg:grid-cols-6 gap-4">
                 <div className="text-center p-4 bg-blue-50 rounded-lg">
                   <div className="text-2xl font-bold text-blue-600">13</div>
-                  <div className="text-sm text-muted-foreground">{t("advanced.featuresCount", "ميزات متقدمة")}</div>
+                  <div className="text-sm text-muted-foreground">{t("advanced.featuresCount")}</div>
                 </div>
                 <div className="text-center p-4 bg-green-50 rounded-lg">
                   <div className="text-2xl font-bold text-green-600">30+</div>
@@ -81,12 +81,12 @@ export default function AuthPage() {
   // Get comprehensive currency list from shared utility
   const currencies = useMemo(() => mapCurrencies(t, 'auth.currencies'), [t, i18n.resolvedLanguage]);
 
-  const months = [
+  const months = useMemo(() => [
     { value: '1', label: t('auth.months.january') },
     { value: '4', label: t('auth.months.april') },
     { value: '7', label: t('auth.months.july') },
     { value: '10', label: t('auth.months.october') },
-  ];
+  ], [t, i18n.language]);
 
   // Create resolvers based on current schemas
   const loginResolver = useMemo(() => zodResolver(loginSchema), [loginSchema, i18n.resolvedLanguage]);
@@ -2,7 +2,7 @@
  * Batch Operations Page
  * Perform bulk actions on multiple records
  */
-import { useState } from 'react';
+import { useState, useMemo } from 'react';
 import { useTranslation } from 'react-i18next';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import PageContainer from '@/components/layout/PageContainer';
@@ -50,7 +50,7 @@ type RecordType = 'invoices' | 'bills' | 'contacts' | 'items';
 type BatchAction = 'export' | 'email' | 'print' | 'delete' | 'archive' | 'updateStatus';
 
 export default function BatchOperationsPage() {
-  const { t } = useTranslation();
+  const { t, i18n } = useTranslation();
   const { toast } = useToast();
   const queryClient = useQueryClient();
 
@@ -79,14 +79,14 @@ export default function BatchOperationsPage() {
     queryKey: [getEndpointForType(recordType)],
   });
 
-  const recordTypeOptions = [
+  const recordTypeOptions = useMemo(() => [
     { value: 'invoices', label: t('batch.invoices'), endpoint: '/api/sales/invoices' },
     { value: 'bills', label: t('batch.bills'), endpoint: '/api/purchases/bills' },
     { value: 'contacts', label: t('batch.contacts'), endpoint: '/api/contacts' },
     { value: 'items', label: t('batch.items'), endpoint: '/api/items' },
-  ];
+  ], [t, i18n.language]);
 
-  const batchActions = [
+  const batchActions = useMemo(() => [
     {
       id: 'export' as BatchAction,
       label: t('batch.exportSelected'),
@@ -122,7 +122,7 @@ export default function BatchOperationsPage() {
       color: 'bg-red-100 text-red-600',
       available: ['invoices', 'bills', 'contacts', 'items'],
     },
-  ];
+  ], [t, i18n.language]);
 
   const filteredRecords = (records as any[]).filter(record => {
     if (!searchQuery) return true;
@@ -478,18 +478,18 @@ export default function CompaniesPage() {
                     name="parent_company_id"
                     render={({ field }) => (
                       <FormItem>
-                        <FormLabel>{t('forms.parentCompany', { defaultValue: 'Parent Company (Holding)' })}</FormLabel>
+                        <FormLabel>{t('forms.parentCompany')}</FormLabel>
                         <Select 
                           onValueChange={(value) => field.onChange(value === "none" ? null : value)} 
                           value={field.value || "none"}
                         >
                           <FormControl>
                             <SelectTrigger>
-                              <SelectValue placeholder={t('forms.selectParentCompany', { defaultValue: 'Select Parent Company (Optional)' })} />
+                              <SelectValue placeholder={t('forms.selectParentCompany')} />
                             </SelectTrigger>
                           </FormControl>
                           <SelectContent>
-                            <SelectItem value="none">{t('forms.noParentCompany', { defaultValue: 'No Parent Company' })}</SelectItem>
+                            <SelectItem value="none">{t('forms.noParentCompany')}</SelectItem>
                             {companies
                               .filter((c: any) => c.id !== editingCompany?.id) // Prevent self-selection
                               .map((company: any) => (
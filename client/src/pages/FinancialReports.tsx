@@ -1,4 +1,4 @@
-import { useState } from "react";
+import { useState, useMemo } from "react";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { FileText, TrendingUp, DollarSign, Receipt, Calendar, Building } from "lucide-react";
@@ -11,7 +11,7 @@ import {
 
 export default function FinancialReports() {
   const { user } = useAuth();
-  const { t } = useTranslation();
+  const { t, i18n } = useTranslation();
   const [loading, setLoading] = useState(false);
   const [selectedReport, setSelectedReport] = useState<string | null>(null);
   const [reportData, setReportData] = useState<any>(null);
@@ -20,7 +20,7 @@ export default function FinancialReports() {
     end: new Date().toISOString().split('T')[0] // Today
   });
 
-  const reports = [
+  const reports = useMemo(() => [
     {
       id: "balance-sheet",
       name: t('reports.financial.balanceSheetTitle'),
@@ -63,7 +63,7 @@ export default function FinancialReports() {
       icon: Building,
       endpoint: "/api/reports/consolidated-balance-sheet",
     },
-  ];
+  ], [t, i18n.language]);
 
   const generateReport = async (reportId: string, endpoint: string) => {
     setLoading(true);
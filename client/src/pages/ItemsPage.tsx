@@ -729,7 +729,7 @@ export default function ItemsPage() {
                             name="tracking_type"
                             render={({ field }) => (
                               <FormItem>
-                                <FormLabel>{t('items.trackingType', { defaultValue: 'Tracking Type' })}</FormLabel>
+                                <FormLabel>{t('items.trackingType')}</FormLabel>
                                 <Select onValueChange={field.onChange} value={field.value || 'none'}>
                                   <FormControl>
                                     <SelectTrigger>
@@ -739,28 +739,28 @@ export default function ItemsPage() {
                                   <SelectContent>
                                     <SelectItem value="none">
                                       <div className="flex flex-col">
-                                        <span>{t('items.tracking.none', { defaultValue: 'Standard Tracking' })}</span>
-                                        <span className="text-xs text-muted-foreground">{t('items.tracking.noneDesc', { defaultValue: 'Track quantity only' })}</span>
+                                        <span>{t('items.tracking.none')}</span>
+                                        <span className="text-xs text-muted-foreground">{t('items.tracking.noneDesc')}</span>
                                       </div>
                                     </SelectItem>
                                     <SelectItem value="batch">
                                       <div className="flex flex-col">
-                                        <span>{t('items.tracking.batch', { defaultValue: 'Batch / Lot Tracking' })}</span>
-                                        <span className="text-xs text-muted-foreground">{t('items.tracking.batchDesc', { defaultValue: 'Track by batch number and expiry date' })}</span>
+                                        <span>{t('items.tracking.batch')}</span>
+                                        <span className="text-xs text-muted-foreground">{t('items.tracking.batchDesc')}</span>
                                       </div>
                                     </SelectItem>
                                     <SelectItem value="serial">
                                       <div className="flex flex-col">
-                                        <span>{t('items.tracking.serial', { defaultValue: 'Serial Number Tracking' })}</span>
-                                        <span className="text-xs text-muted-foreground">{t('items.tracking.serialDesc', { defaultValue: 'Track each unit individually' })}</span>
+                                        <span>{t('items.tracking.serial')}</span>
+                                        <span className="text-xs text-muted-foreground">{t('items.tracking.serialDesc')}</span>
                                       </div>
                                     </SelectItem>
                                   </SelectContent>
                                 </Select>
                                 <FormDescription className="text-xs">
-                                  {field.value === 'batch' && t('items.tracking.batchHint', { defaultValue: 'Ideal for products with expiry dates like food and medicine' })}
-                                  {field.value === 'serial' && t('items.tracking.serialHint', { defaultValue: 'Ideal for electronics, equipment, and high-value items' })}
-                                  {(!field.value || field.value === 'none') && t('items.tracking.noneHint', { defaultValue: 'Simple quantity tracking for general products' })}
+                                  {field.value === 'batch' && t('items.tracking.batchHint')}
+                                  {field.value === 'serial' && t('items.tracking.serialHint')}
+                                  {(!field.value || field.value === 'none') && t('items.tracking.noneHint')}
                                 </FormDescription>
                                 <FormMessage />
                               </FormItem>
@@ -792,11 +792,11 @@ export default function ItemsPage() {
                               name="default_warehouse_id"
                               render={({ field }) => (
                                 <FormItem>
-                                  <FormLabel>{t('inventory.warehouse', 'Warehouse')}</FormLabel>
+                                  <FormLabel>{t('inventory.warehouse')}</FormLabel>
                                   <Select onValueChange={field.onChange} value={field.value || ""}>
                                     <FormControl>
                                       <SelectTrigger>
-                                        <SelectValue placeholder={t('inventory.selectWarehouse', 'Select warehouse')} />
+                                        <SelectValue placeholder={t('inventory.selectWarehouse')} />
                                       </SelectTrigger>
                                     </FormControl>
                                     <SelectContent>
@@ -808,7 +808,7 @@ export default function ItemsPage() {
                                     </SelectContent>
                                   </Select>
                                   <FormDescription>
-                                    {t('items.warehouseHint', 'Required to record opening stock')}
+                                    {t('items.warehouseHint')}
                                   </FormDescription>
                                   <FormMessage />
                                 </FormItem>
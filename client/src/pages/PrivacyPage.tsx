@@ -1,11 +1,21 @@
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Building2, Lock, Shield, Eye, Database, UserCheck, Globe } from "lucide-react";
 import { useTranslation } from "react-i18next";
+import { LegalHtml, useLegalDocument } from "@/hooks/useLegalDocument";
 
 export default function PrivacyPage() {
   const currentYear = new Date().getFullYear();
   const { t, i18n } = useTranslation();
   const isRTL = i18n.language === 'ar';
+  const doc = useLegalDocument('privacy');
+
+  if (!doc.ready) {
+    return (
+      <div className="container mx-auto py-8 px-4 max-w-5xl text-muted-foreground" dir={isRTL ? 'rtl' : 'ltr'}>
+        {doc.error ? doc.error.message : t('common.loading')}
+      </div>
+    );
+  }
 
   return (
     <div className="container mx-auto py-8 px-4 max-w-5xl" dir={isRTL ? 'rtl' : 'ltr'}>
@@ -13,14 +23,14 @@ export default function PrivacyPage() {
         <CardHeader className="border-b bg-gradient-to-r from-green-50 to-blue-50 dark:from-green-950/30 dark:to-blue-950/30">
           <div className="flex items-center gap-3 mb-2">
             <Lock className="h-10 w-10 text-primary" />
-            <CardTitle className="text-4xl font-bold">{t('privacyPage.title')}</CardTitle>
+            <CardTitle className="text-4xl font-bold">{doc.text('title')}</CardTitle>
           </div>
           <p className="text-sm text-muted-foreground mt-2">
-            {t('privacyPage.lastUpdated')}
+            {doc.text('lastUpdated')}
           </p>
           <p className="text-sm text-muted-foreground mt-2">
             <Building2 className="inline h-4 w-4 me-1" />
-            {t('privacyPage.providedBy')} <strong>TibrCode Software Development</strong>
+            {doc.text('providedBy')} <strong>TibrCode Software Development</strong>
           </p>
         </CardHeader>
         
@@ -29,18 +39,18 @@ export default function PrivacyPage() {
           <section>
             <h2 className="text-2xl font-bold text-primary mb-4 flex items-center gap-2">
               <Shield className="h-6 w-6" />
-              {t('privacyPage.sections.introduction.title')}
+              {doc.text('sections.introduction.title')}
             </h2>
             <p className="mb-4 leading-relaxed">
-              {t('privacyPage.sections.introduction.content1')}
+              {doc.text('sections.introduction.content1')}
             </p>
             <p className="mb-4 leading-relaxed">
-              {t('privacyPage.sections.introduction.content2')}
+              {doc.text('sections.introduction.content2')}
             </p>
             <div className="bg-blue-50 dark:bg-blue-950/30 border-l-4 border-blue-500 rounded-r-lg p-4">
-              <p className="text-sm font-semibold mb-2">{t('privacyPage.sections.introduction.rightsTitle')}</p>
+              <p className="text-sm font-semibold mb-2">{doc.text('sections.introduction.rightsTitle')}</p>
               <p className="text-sm">
-                {t('privacyPage.sections.introduction.rightsContent')}
+                {doc.text('sections.introduction.rightsContent')}
               </p>
             </div>
           </section>
@@ -49,7 +59,7 @@ export default function PrivacyPage() {
           <section>
             <h2 className="text-2xl font-bold text-primary mb-4 flex items-center gap-2">
               <Database className="h-6 w-6" />
-              {t('privacyPage.sections.informationCollected.title')}
+              {doc.text('sections.informationCollected.title')}
             </h2>
             
             <div className="grid md:grid-cols-2 gap-4 mb-6">
@@ -57,10 +67,10 @@ export default function PrivacyPage() {
               <div className="bg-green-50 dark:bg-green-950/30 border border-green-200 dark:border-green-800 rounded-lg p-5">
                 <h3 className="font-semibold text-lg mb-3 flex items-center gap-2">
                   <Eye className="h-5 w-5 text-green-600" />
-                  {t('privacyPage.sections.informationCollected.whatWeCollect.title')}
+                  {doc.text('sections.informationCollected.whatWeCollect.title')}
                 </h3>
                 <ul className="space-y-2 text-sm">
-                  {(t('privacyPage.sections.informationCollected.whatWeCollect.items', { returnObjects: true }) as string[]).map((item, index) => (
+                  {doc.items('sections.informationCollected.whatWeCollect.items').map((item, index) => (
                     <li key={index} dangerouslySetInnerHTML={{ __html: item }} />
                   ))}
                 </ul>
@@ -70,52 +80,52 @@ export default function PrivacyPage() {
               <div className="bg-red-50 dark:bg-red-950/30 border border-red-200 dark:border-red-800 rounded-lg p-5">
                 <h3 className="font-semibold text-lg mb-3 flex items-center gap-2">
                   <Shield className="h-5 w-5 text-red-600" />
-                  {t('privacyPage.sections.informationCollected.whatWeDontCollect.title')}
+                  {doc.text('sections.informationCollected.whatWeDontCollect.title')}
                 </h3>
                 <ul className="space-y-2 text-sm">
-                  {(t('privacyPage.sections.informationCollected.whatWeDontCollect.items', { returnObjects: true }) as string[]).map((item, index) => (
-                    <li key={index}>{item}</li>
+                  {doc.items('sections.informationCollected.whatWeDontCollect.items').map((item, index) => (
+                    <li key={index} dangerouslySetInnerHTML={{ __html: item }} />
                   ))}
                 </ul>
               </div>
             </div>
 
-            <h3 className="font-semibold text-lg mb-2">{t('privacyPage.sections.informationCollected.dataYouProvide.title')}</h3>
+            <h3 className="font-semibold text-lg mb-2">{doc.text('sections.informationCollected.dataYouProvide.title')}</h3>
             <p className="mb-4">
-              {t('privacyPage.sections.informationCollected.dataYouProvide.content')}
+              {doc.text('sections.informationCollected.dataYouProvide.content')}
             </p>
 
-            <h3 className="font-semibold text-lg mb-2">{t('privacyPage.sections.informationCollected.dataCollectedAutomatically.title')}</h3>
+            <h3 className="font-semibold text-lg mb-2">{doc.text('sections.informationCollected.dataCollectedAutomatically.title')}</h3>
             <p className="mb-4">
-              {t('privacyPage.sections.informationCollected.dataCollectedAutomatically.content')}
+              {doc.text('sections.informationCollected.dataCollectedAutomatically.content')}
             </p>
 
-            <h3 className="font-semibold text-lg mb-2">{t('privacyPage.sections.informationCollected.cookies.title')}</h3>
+            <h3 className="font-semibold text-lg mb-2">{doc.text('sections.informationCollected.cookies.title')}</h3>
             <p className="mb-4">
-              {t('privacyPage.sections.informationCollected.cookies.content')}
+              {doc.text('sections.informationCollected.cookies.content')}
             </p>
           </section>
 
           {/* 3. How We Use Your Data */}
           <section>
-            <h2 className="text-2xl font-bold text-primary mb-4">{t('privacyPage.sections.howWeUseData.title')}</h2>
+            <h2 className="text-2xl font-bold text-primary mb-4">{doc.text('sections.howWeUseData.title')}</h2>
             
-            <p className="mb-4">{t('privacyPage.sections.howWeUseData.intro')}</p>
+            <p className="mb-4">{doc.text('sections.howWeUseData.intro')}</p>
             
             <div className="space-y-3">
-              {(t('privacyPage.sections.howWeUseData.purposes', { returnObjects: true }) as any[]).map((purpose, index) => (
+              {doc.items<Record<string, string>>('sections.howWeUseData.purposes').map((purpose, index) => (
                 <div key={index} className="bg-muted rounded-lg p-4">
-                  <h4 className="font-semibold mb-2">{purpose.title}</h4>
-                  <p className="text-sm">{purpose.desc}</p>
+                  <h4 className="font-semibold mb-2"><LegalHtml html={purpose.title} /></h4>
+                  <p className="text-sm"><LegalHtml html={purpose.desc} /></p>
                 </div>
               ))}
             </div>
 
             <div className="bg-amber-50 dark:bg-amber-950/30 border-2 border-amber-400 rounded-lg p-4 mt-4">
-              <p className="text-sm font-semibold mb-2">{t('privacyPage.sections.howWeUseData.weDoNot.title')}</p>
+              <p className="text-sm font-semibold mb-2">{doc.text('sections.howWeUseData.weDoNot.title')}</p>
               <ul className="text-sm space-y-1">
-                {(t('privacyPage.sections.howWeUseData.weDoNot.items', { returnObjects: true }) as string[]).map((item, index) => (
-                  <li key={index}>{item}</li>
+                {doc.items('sections.howWeUseData.weDoNot.items').map((item, index) => (
+                  <li key={index} dangerouslySetInnerHTML={{ __html: item }} />
                 ))}
               </ul>
             </div>
@@ -125,16 +135,16 @@ export default function PrivacyPage() {
           <section>
             <h2 className="text-2xl font-bold text-primary mb-4 flex items-center gap-2">
               <Globe className="h-6 w-6" />
-              {t('privacyPage.sections.legalBasis.title')}
+              {doc.text('sections.legalBasis.title')}
             </h2>
             
-            <p className="mb-4">{t('privacyPage.sections.legalBasis.intro')}</p>
+            <p className="mb-4">{doc.text('sections.legalBasis.intro')}</p>
             
             <ul className="space-y-3">
-              {(t('privacyPage.sections.legalBasis.items', { returnObjects: true }) as any[]).map((item, index) => (
+              {doc.items<Record<string, string>>('sections.legalBasis.items').map((item, index) => (
                 <li key={index} className="flex gap-3">
-                  <span className="font-semibold min-w-[140px]">{item.title}</span>
-                  <span>{item.desc}</span>
+                  <span className="font-semibold min-w-[140px]"><LegalHtml html={item.title} /></span>
+                  <span><LegalHtml html={item.desc} /></span>
                 </li>
               ))}
             </ul>
@@ -142,33 +152,33 @@ export default function PrivacyPage() {
 
           {/* 5. Data Sharing */}
           <section>
-            <h2 className="text-2xl font-bold text-primary mb-4">{t('privacyPage.sections.dataSharing.title')}</h2>
+            <h2 className="text-2xl font-bold text-primary mb-4">{doc.text('sections.dataSharing.title')}</h2>
             
-            <p className="mb-4">{t('privacyPage.sections.dataSharing.intro')}</p>
+            <p className="mb-4">{doc.text('sections.dataSharing.intro')}</p>
 
-            <h3 className="font-semibold text-lg mb-2">{t('privacyPage.sections.dataSharing.serviceProviders.title')}</h3>
+            <h3 className="font-semibold text-lg mb-2">{doc.text('sections.dataSharing.serviceProviders.title')}</h3>
             <p className="mb-4">
-              {t('privacyPage.sections.dataSharing.serviceProviders.intro')}
+              {doc.text('sections.dataSharing.serviceProviders.intro')}
             </p>
             <ul className="list-disc pl-6 space-y-1 mb-4">
-              {(t('privacyPage.sections.dataSharing.serviceProviders.items', { returnObjects: true }) as string[]).map((item, index) => (
+              {doc.items('sections.dataSharing.serviceProviders.items').map((item, index) => (
                 <li key={index} dangerouslySetInnerHTML={{ __html: item }} />
               ))}
             </ul>
 
-            <h3 className="font-semibold text-lg mb-2">{t('privacyPage.sections.dataSharing.legalRequirements.title')}</h3>
+            <h3 className="font-semibold text-lg mb-2">{doc.text('sections.dataSharing.legalRequirements.title')}</h3>
             <p className="mb-4">
-              {t('privacyPage.sections.dataSharing.legalRequirements.content')}
+              {doc.text('sections.dataSharing.legalRequirements.content')}
             </p>
 
-            <h3 className="font-semibold text-lg mb-2">{t('privacyPage.sections.dataSharing.businessTransfers.title')}</h3>
+            <h3 className="font-semibold text-lg mb-2">{doc.text('sections.dataSharing.businessTransfers.title')}</h3>
             <p className="mb-4">
-              {t('privacyPage.sections.dataSharing.businessTransfers.content')}
+              {doc.text('sections.dataSharing.businessTransfers.content')}
             </p>
 
-            <h3 className="font-semibold text-lg mb-2">{t('privacyPage.sections.dataSharing.withConsent.title')}</h3>
+            <h3 className="font-semibold text-lg mb-2">{doc.text('sections.dataSharing.withConsent.title')}</h3>
             <p className="mb-4">
-              {t('privacyPage.sections.dataSharing.withConsent.content')}
+              {doc.text('sections.dataSharing.withConsent.content')}
             </p>
           </section>
 
@@ -176,22 +186,22 @@ export default function PrivacyPage() {
           <section>
             <h2 className="text-2xl font-bold text-primary mb-4 flex items-center gap-2">
               <Lock className="h-6 w-6" />
-              {t('privacyPage.sections.dataSecurity.title')}
+              {doc.text('sections.dataSecurity.title')}
             </h2>
             
             <p className="mb-4 leading-relaxed">
-              {t('privacyPage.sections.dataSecurity.intro')}
+              {doc.text('sections.dataSecurity.intro')}
             </p>
 
             <div className="grid md:grid-cols-2 gap-4">
               <div className="bg-green-50 dark:bg-green-950/30 border border-green-200 dark:border-green-800 rounded-lg p-4">
                 <h4 className="font-semibold mb-2 flex items-center gap-2">
                   <Shield className="h-5 w-5" />
-                  {t('privacyPage.sections.dataSecurity.technical.title')}
+                  {doc.text('sections.dataSecurity.technical.title')}
                 </h4>
                 <ul className="text-sm space-y-1">
-                  {(t('privacyPage.sections.dataSecurity.technical.items', { returnObjects: true }) as string[]).map((item, index) => (
-                    <li key={index}>{item}</li>
+                  {doc.items('sections.dataSecurity.technical.items').map((item, index) => (
+                    <li key={index} dangerouslySetInnerHTML={{ __html: item }} />
                   ))}
                 </ul>
               </div>
@@ -199,32 +209,32 @@ export default function PrivacyPage() {
               <div className="bg-blue-50 dark:bg-blue-950/30 border border-blue-200 dark:border-blue-800 rounded-lg p-4">
                 <h4 className="font-semibold mb-2 flex items-center gap-2">
                   <UserCheck className="h-5 w-5" />
-                  {t('privacyPage.sections.dataSecurity.organizational.title')}
+                  {doc.text('sections.dataSecurity.organizational.title')}
                 </h4>
                 <ul className="text-sm space-y-1">
-                  {(t('privacyPage.sections.dataSecurity.organizational.items', { returnObjects: true }) as string[]).map((item, index) => (
-                    <li key={index}>{item}</li>
+                  {doc.items('sections.dataSecurity.organizational.items').map((item, index) => (
+                    <li key={index} dangerouslySetInnerHTML={{ __html: item }} />
                   ))}
                 </ul>
               </div>
             </div>
 
             <div className="bg-red-50 dark:bg-red-950/30 border-2 border-red-400 rounded-lg p-4 mt-4">
-              <p className="text-sm font-bold mb-2">{t('privacyPage.sections.dataSecurity.notice.title')}</p>
+              <p className="text-sm font-bold mb-2">{doc.text('sections.dataSecurity.notice.title')}</p>
               <p className="text-sm">
-                {t('privacyPage.sections.dataSecurity.notice.content')}
+                {doc.text('sections.dataSecurity.notice.content')}
               </p>
             </div>
           </section>
 
           {/* 7. Data Retention */}
           <section>
-            <h2 className="text-2xl font-bold text-primary mb-4">{t('privacyPage.sections.dataRetention.title')}</h2>
+            <h2 className="text-2xl font-bold text-primary mb-4">{doc.text('sections.dataRetention.title')}</h2>
             
-            <p className="mb-4">{t('privacyPage.sections.dataRetention.intro')}</p>
+            <p className="mb-4">{doc.text('sections.dataRetention.intro')}</p>
             
             <ul className="space-y-2 mb-4">
-              {(t('privacyPage.sections.dataRetention.items', { returnObjects: true }) as string[]).map((item, index) => (
+              {doc.items('sections.dataRetention.items').map((item, index) => (
                 <li key={index} dangerouslySetInnerHTML={{ __html: item }} />
               ))}
             </ul>
@@ -232,60 +242,60 @@ export default function PrivacyPage() {
 
           {/* 8. Your Rights */}
           <section>
-            <h2 className="text-2xl font-bold text-primary mb-4">{t('privacyPage.sections.yourRights.title')}</h2>
+            <h2 className="text-2xl font-bold text-primary mb-4">{doc.text('sections.yourRights.title')}</h2>
             
-            <p className="mb-4">{t('privacyPage.sections.yourRights.intro')}</p>
+            <p className="mb-4">{doc.text('sections.yourRights.intro')}</p>
 
             <div className="space-y-3">
-              {(t('privacyPage.sections.yourRights.rights', { returnObjects: true }) as any[]).map((right, index) => (
+              {doc.items<Record<string, string>>('sections.yourRights.rights').map((right, index) => (
                 <div key={index} className="bg-primary/5 border-l-4 border-primary rounded-r-lg p-4">
-                  <h4 className="font-semibold mb-1">{right.title}</h4>
-                  <p className="text-sm">{right.desc}</p>
+                  <h4 className="font-semibold mb-1"><LegalHtml html={right.title} /></h4>
+                  <p className="text-sm"><LegalHtml html={right.desc} /></p>
                 </div>
               ))}
             </div>
 
-            <p className="mt-4 text-sm" dangerouslySetInnerHTML={{ __html: t('privacyPage.sections.yourRights.contact') }} />
+            <p className="mt-4 text-sm" dangerouslySetInnerHTML={doc.html('sections.yourRights.contact')} />
           </section>
 
           {/* 9. International Transfers */}
           <section>
-            <h2 className="text-2xl font-bold text-primary mb-4">{t('privacyPage.sections.internationalTransfers.title')}</h2>
+            <h2 className="text-2xl font-bold text-primary mb-4">{doc.text('sections.internationalTransfers.title')}</h2>
             
             <p className="mb-4">
-              {t('privacyPage.sections.internationalTransfers.content')}
+              {doc.text('sections.internationalTransfers.content')}
             </p>
           </section>
 
           {/* 10. Children's Privacy */}
           <section>
-            <h2 className="text-2xl font-bold text-primary mb-4">{t('privacyPage.sections.childrensPrivacy.title')}</h2>
+            <h2 className="text-2xl font-bold text-primary mb-4">{doc.text('sections.childrensPrivacy.title')}</h2>
             
             <p className="mb-4">
-              {t('privacyPage.sections.childrensPrivacy.content')}
+              {doc.text('sections.childrensPrivacy.content')}
             </p>
           </section>
 
           {/* 11. Changes to Policy */}
           <section>
-            <h2 className="text-2xl font-bold text-primary mb-4">{t('privacyPage.sections.changesToPolicy.title')}</h2>
+            <h2 className="text-2xl font-bold text-primary mb-4">{doc.text('sections.changesToPolicy.title')}</h2>
             
             <p className="mb-4">
-              {t('privacyPage.sections.changesToPolicy.content')}
+              {doc.text('sections.changesToPolicy.content')}
             </p>
           </section>
 
           {/* Contact */}
           <section>
-            <h2 className="text-2xl font-bold text-primary mb-4">{t('privacyPage.sections.contactUs.title')}</h2>
-            <p className="mb-4">{t('privacyPage.sections.contactUs.intro')}</p>
+            <h2 className="text-2xl font-bold text-primary mb-4">{doc.text('sections.contactUs.title')}</h2>
+            <p className="mb-4">{doc.text('sections.contactUs.intro')}</p>
             <div className="bg-muted rounded-lg p-5">
-              <p className="font-semibold mb-2">{t('privacyPage.sections.contactUs.details.company')}</p>
-              <p className="mb-1" dangerouslySetInnerHTML={{ __html: t('privacyPage.sections.contactUs.details.dpo') }} />
-              <p className="mb-1" dangerouslySetInnerHTML={{ __html: t('privacyPage.sections.contactUs.details.support') }} />
-              <p className="mb-3" dangerouslySetInnerHTML={{ __html: t('privacyPage.sections.contactUs.details.legal') }} />
+              <p className="font-semibold mb-2">{doc.text('sections.contactUs.details.company')}</p>
+              <p className="mb-1" dangerouslySetInnerHTML={doc.html('sections.contactUs.details.dpo')} />
+              <p className="mb-1" dangerouslySetInnerHTML={doc.html('sections.contactUs.details.support')} />
+              <p className="mb-3" dangerouslySetInnerHTML={doc.html('sections.contactUs.details.legal')} />
               <p className="text-sm text-muted-foreground">
-                {t('privacyPage.sections.contactUs.details.responseTime')}
+                {doc.text('sections.contactUs.details.responseTime')}
               </p>
             </div>
           </section>
@@ -293,10 +303,10 @@ export default function PrivacyPage() {
           {/* Footer */}
           <div className="mt-12 pt-6 border-t text-center space-y-2">
             <p className="text-sm text-muted-foreground">
-              {t('privacyPage.footer.rights', { year: currentYear })}
+              {doc.text('footer.rights', { year: currentYear })}
             </p>
             <p className="text-xs text-muted-foreground">
-              {t('privacyPage.footer.compliance')}
+              {doc.text('footer.compliance')}
             </p>
           </div>
         </CardContent>
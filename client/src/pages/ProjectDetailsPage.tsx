@@ -401,15 +401,15 @@ export default function ProjectDetailsPage() {
           </TabsTrigger>
           <TabsTrigger value="phases" className="flex items-center gap-1">
             <Layers className="h-4 w-4" />
-            <span className="hidden sm:inline">{t("projects.phases", "المراحل")}</span>
+            <span className="hidden sm:inline">{t("projects.phases")}</span>
           </TabsTrigger>
           <TabsTrigger value="tasks" className="flex items-center gap-1">
             <ListTodo className="h-4 w-4" />
-            <span className="hidden sm:inline">{t("projects.tasks", "المهام")}</span>
+            <span className="hidden sm:inline">{t("projects.tasks")}</span>
           </TabsTrigger>
           <TabsTrigger value="time" className="flex items-center gap-1">
             <Timer className="h-4 w-4" />
-            <span className="hidden sm:inline">{t("projects.timeTracking", "الوقت")}</span>
+            <span className="hidden sm:inline">{t("projects.timeTracking")}</span>
           </TabsTrigger>
         </TabsList>
 
@@ -500,10 +500,10 @@ export default function ProjectDetailsPage() {
         {/* Phases Tab */}
         <TabsContent value="phases" className="space-y-4">
           <div className="flex justify-between items-center">
-            <h3 className="text-lg font-semibold">{t("projects.phases", "مراحل المشروع")}</h3>
+            <h3 className="text-lg font-semibold">{t("projects.phases")}</h3>
             <Button onClick={() => { resetPhaseForm(); setEditingPhase(null); setIsPhaseDialogOpen(true); }}>
               <Plus className="me-2 h-4 w-4" />
-              {t("projects.addPhase", "إضافة مرحلة")}
+              {t("projects.addPhase")}
             </Button>
           </div>
 
@@ -511,7 +511,7 @@ export default function ProjectDetailsPage() {
             <Card>
               <CardContent className="text-center py-12 text-muted-foreground">
                 <Layers className="h-12 w-12 mx-auto mb-4 opacity-50" />
-                <p>{t("projects.noPhases", "لا توجد مراحل بعد")}</p>
+                <p>{t("projects.noPhases")}</p>
               </CardContent>
             </Card>
           ) : (
@@ -538,7 +538,7 @@ export default function ProjectDetailsPage() {
                           </div>
                           <div className="mt-3 space-y-1">
                             <div className="flex justify-between text-xs">
-                              <span>{t("projects.progress", "التقدم")}</span>
+                              <span>{t("projects.progress")}</span>
                               <span>{phase.progress_percent}%</span>
                             </div>
                             <Progress value={phase.progress_percent} className="h-2" />
@@ -564,10 +564,10 @@ export default function ProjectDetailsPage() {
         {/* Tasks Tab */}
         <TabsContent value="tasks" className="space-y-4">
           <div className="flex justify-between items-center">
-            <h3 className="text-lg font-semibold">{t("projects.tasks", "المهام")}</h3>
+            <h3 className="text-lg font-semibold">{t("projects.tasks")}</h3>
             <Button onClick={() => { resetTaskForm(); setEditingTask(null); setIsTaskDialogOpen(true); }}>
               <Plus className="me-2 h-4 w-4" />
-              {t("projects.addTask", "إضافة مهمة")}
+              {t("projects.addTask")}
             </Button>
           </div>
 
@@ -575,7 +575,7 @@ export default function ProjectDetailsPage() {
             <Card>
               <CardContent className="text-center py-12 text-muted-foreground">
                 <ListTodo className="h-12 w-12 mx-auto mb-4 opacity-50" />
-                <p>{t("projects.noTasks", "لا توجد مهام بعد")}</p>
+                <p>{t("projects.noTasks")}</p>
               </CardContent>
             </Card>
           ) : (
@@ -629,12 +629,12 @@ export default function ProjectDetailsPage() {
         <TabsContent value="time" className="space-y-4">
           <div className="flex justify-between items-center">
             <div>
-              <h3 className="text-lg font-semibold">{t("projects.timeTracking", "تتبع الوقت")}</h3>
-              <p className="text-sm text-muted-foreground">{t("projects.totalHoursLogged", "إجمالي الساعات")}: {totalTimeHours.toFixed(1)} {t("common.hours", "ساعة")}</p>
+              <h3 className="text-lg font-semibold">{t("projects.timeTracking")}</h3>
+              <p className="text-sm text-muted-foreground">{t("projects.totalHoursLogged")}: {totalTimeHours.toFixed(1)} {t("common.hours", "ساعة")}</p>
             </div>
             <Button onClick={() => { resetTimeForm(); setIsTimeDialogOpen(true); }}>
               <Plus className="me-2 h-4 w-4" />
-              {t("projects.logTime", "تسجيل وقت")}
+              {t("projects.logTime")}
             </Button>
           </div>
 
@@ -642,7 +642,7 @@ export default function ProjectDetailsPage() {
             <Card>
               <CardContent className="text-center py-12 text-muted-foreground">
                 <Timer className="h-12 w-12 mx-auto mb-4 opacity-50" />
-                <p>{t("projects.noTimeEntries", "لا توجد سجلات وقت بعد")}</p>
+                <p>{t("projects.noTimeEntries")}</p>
               </CardContent>
             </Card>
           ) : (
@@ -652,10 +652,10 @@ export default function ProjectDetailsPage() {
                   <TableHeader>
                     <TableRow>
                       <TableHead>{t("common.date")}</TableHead>
-                      <TableHead>{t("projects.task", "المهمة")}</TableHead>
+                      <TableHead>{t("projects.task")}</TableHead>
                       <TableHead>{t("common.description")}</TableHead>
                       <TableHead className="text-end">{t("common.hours", "ساعات")}</TableHead>
-                      <TableHead>{t("projects.billable", "قابل للفوترة")}</TableHead>
+                      <TableHead>{t("projects.billable")}</TableHead>
                       <TableHead></TableHead>
                     </TableRow>
                   </TableHeader>
@@ -668,9 +668,9 @@ export default function ProjectDetailsPage() {
                         <TableCell className="text-end font-medium">{parseFloat(entry.hours).toFixed(1)}</TableCell>
                         <TableCell>
                           {entry.billable ? (
-                            <Badge variant="outline" className="bg-green-50 text-green-600 dark:bg-green-950">{t("common.yes", "نعم")}</Badge>
+                            <Badge variant="outline" className="bg-green-50 text-green-600 dark:bg-green-950">{t("common.yes")}</Badge>
                           ) : (
-                            <Badge variant="outline">{t("common.no", "لا")}</Badge>
+                            <Badge variant="outline">{t("common.no")}</Badge>
                           )}
                         </TableCell>
                         <TableCell>
@@ -692,7 +692,7 @@ export default function ProjectDetailsPage() {
       <Dialog open={isPhaseDialogOpen} onOpenChange={setIsPhaseDialogOpen}>
         <DialogContent>
           <DialogHeader>
-            <DialogTitle>{editingPhase ? t("projects.editPhase", "تعديل المرحلة") : t("projects.addPhase", "إضافة مرحلة")}</DialogTitle>
+            <DialogTitle>{editingPhase ? t("projects.editPhase") : t("projects.addPhase")}</DialogTitle>
           </DialogHeader>
           <form onSubmit={handlePhaseSubmit} className="space-y-4">
             <div className="space-y-2">
@@ -711,9 +711,9 @@ export default function ProjectDetailsPage() {
               <div className="space-y-2">
                 <Label>{t("projects.status")}</Label>
                 <select className="flex h-10 w-full rounded-md border border-input bg-background px-3 py-2 text-sm" value={phaseForm.status} onChange={e => setPhaseForm({...phaseForm, status: e.target.value})}>
-                  <option value="pending">{t("projects.phaseStatus.pending", "في الانتظار")}</option>
-                  <option value="in_progress">{t("projects.phaseStatus.in_progress", "قيد التنفيذ")}</option>
-                  <option value="completed">{t("projects.phaseStatus.completed", "مكتملة")}</option>
+                  <option value="pending">{t("projects.phaseStatus.pending")}</option>
+                  <option value="in_progress">{t("projects.phaseStatus.in_progress")}</option>
+                  <option value="completed">{t("projects.phaseStatus.completed")}</option>
                   <option value="cancelled">{t("projects.phaseStatus.cancelled", "ملغية")}</option>
                 </select>
               </div>
@@ -743,11 +743,11 @@ export default function ProjectDetailsPage() {
       <Dialog open={isTaskDialogOpen} onOpenChange={setIsTaskDialogOpen}>
         <DialogContent>
           <DialogHeader>
-            <DialogTitle>{editingTask ? t("projects.editTask", "تعديل المهمة") : t("projects.addTask", "إضافة مهمة")}</DialogTitle>
+            <DialogTitle>{editingTask ? t("projects.editTask") : t("projects.addTask")}</DialogTitle>
           </DialogHeader>
           <form onSubmit={handleTaskSubmit} className="space-y-4">
             <div className="space-y-2">
-              <Label>{t("projects.taskTitle", "عنوان المهمة")}</Label>
+              <Label>{t("projects.taskTitle")}</Label>
               <Input value={taskForm.title} onChange={e => setTaskForm({...taskForm, title: e.target.value})} required />
             </div>
             <div className="space-y-2">
@@ -756,19 +756,19 @@ export default function ProjectDetailsPage() {
             </div>
             <div className="grid grid-cols-2 gap-4">
               <div className="space-y-2">
-                <Label>{t("projects.phase", "المرحلة")}</Label>
+                <Label>{t("projects.phase")}</Label>
                 <select className="flex h-10 w-full rounded-md border border-input bg-background px-3 py-2 text-sm" value={taskForm.phase_id} onChange={e => setTaskForm({...taskForm, phase_id: e.target.value})}>
-                  <option value="">{t("common.none", "بدون")}</option>
+                  <option value="">{t("common.none")}</option>
                   {phases.map((p: any) => <option key={p.id} value={p.id}>{p.name}</option>)}
                 </select>
               </div>
               <div className="space-y-2">
                 <Label>{t("projects.priority.label", "الأولوية")}</Label>
                 <select className="flex h-10 w-full rounded-md border border-input bg-background px-3 py-2 text-sm" value={taskForm.priority} onChange={e => setTaskForm({...taskForm, priority: e.target.value})}>
-                  <option value="low">{t("projects.priority.low", "منخفضة")}</option>
-                  <option value="medium">{t("projects.priority.medium", "متوسطة")}</option>
-                  <option value="high">{t("projects.priority.high", "عالية")}</option>
-                  <option value="urgent">{t("projects.priority.urgent", "عاجلة")}</option>
+                  <option value="low">{t("projects.priority.low")}</option>
+                  <option value="medium">{t("projects.priority.medium")}</option>
+                  <option value="high">{t("projects.priority.high")}</option>
+                  <option value="urgent">{t("projects.priority.urgent")}</option>
                 </select>
               </div>
             </div>
@@ -776,20 +776,20 @@ export default function ProjectDetailsPage() {
               <div className="space-y-2">
                 <Label>{t("projects.status")}</Label>
                 <select className="flex h-10 w-full rounded-md border border-input bg-background px-3 py-2 text-sm" value={taskForm.status} onChange={e => setTaskForm({...taskForm, status: e.target.value})}>
-                  <option value="todo">{t("projects.taskStatus.todo", "للتنفيذ")}</option>
-                  <option value="in_progress">{t("projects.taskStatus.in_progress", "قيد التنفيذ")}</option>
+                  <option value="todo">{t("projects.taskStatus.todo")}</option>
+                  <option value="in_progress">{t("projects.taskStatus.in_progress")}</option>
                   <option value="review">{t("projects.taskStatus.review", "قيد المراجعة")}</option>
-                  <option value="completed">{t("projects.taskStatus.completed", "مكتملة")}</option>
+                  <option value="completed">{t("projects.taskStatus.completed")}</option>
                   <option value="cancelled">{t("projects.taskStatus.cancelled", "ملغية")}</option>
                 </select>
               </div>
               <div className="space-y-2">
-                <Label>{t("projects.dueDate", "تاريخ الاستحقاق")}</Label>
+                <Label>{t("projects.dueDate")}</Label>
                 <Input type="date" value={taskForm.due_date} onChange={e => setTaskForm({...taskForm, due_date: e.target.value})} className="[color-scheme:dark] dark:[color-scheme:dark]" />
               </div>
             </div>
             <div className="space-y-2">
-              <Label>{t("projects.estimatedHours", "الساعات المقدرة")}</Label>
+              <Label>{t("projects.estimatedHours")}</Label>
               <Input type="number" step="0.5" value={taskForm.estimated_hours} onChange={e => setTaskForm({...taskForm, estimated_hours: e.target.value})} />
             </div>
             <DialogFooter>
@@ -807,7 +807,7 @@ export default function ProjectDetailsPage() {
       <Dialog open={isTimeDialogOpen} onOpenChange={setIsTimeDialogOpen}>
         <DialogContent>
           <DialogHeader>
-            <DialogTitle>{t("projects.logTime", "تسجيل وقت")}</DialogTitle>
+            <DialogTitle>{t("projects.logTime")}</DialogTitle>
           </DialogHeader>
           <form onSubmit={handleTimeSubmit} className="space-y-4">
             <div className="grid grid-cols-2 gap-4">
@@ -821,9 +821,9 @@ export default function ProjectDetailsPage() {
               </div>
             </div>
             <div className="space-y-2">
-              <Label>{t("projects.task", "المهمة")}</Label>
+              <Label>{t("projects.task")}</Label>
               <select className="flex h-10 w-full rounded-md border border-input bg-background px-3 py-2 text-sm" value={timeForm.task_id} onChange={e => setTimeForm({...timeForm, task_id: e.target.value})}>
-                <option value="">{t("common.none", "بدون")}</option>
+                <option value="">{t("common.none")}</option>
                 {tasks.map((t: any) => <option key={t.id} value={t.id}>{t.title}</option>)}
               </select>
             </div>
@@ -833,7 +833,7 @@ export default function ProjectDetailsPage() {
             </div>
             <div className="flex items-center gap-2">
               <input type="checkbox" id="billable" checked={timeForm.billable} onChange={e => setTimeForm({...timeForm, billable: e.target.checked})} className="h-4 w-4" />
-              <Label htmlFor="billable">{t("projects.billable", "قابل للفوترة")}</Label>
+              <Label htmlFor="billable">{t("projects.billable")}</Label>
             </div>
             <DialogFooter>
               <Button type="button" variant="outline" onClick={() => setIsTimeDialogOpen(false)}>{t("common.cancel")}</Button>
@@ -850,7 +850,7 @@ export default function ProjectDetailsPage() {
       <AlertDialog open={isDeleteDialogOpen} onOpenChange={setIsDeleteDialogOpen}>
         <AlertDialogContent>
           <AlertDialogHeader>
-            <AlertDialogTitle>{t("common.confirmDelete", "تأكيد الحذف")}</AlertDialogTitle>
+            <AlertDialogTitle>{t("common.confirmDelete")}</AlertDialogTitle>
             <AlertDialogDescription>
               {t("common.deleteWarning", "هل أنت متأكد؟ لا يمكن التراجع عن هذا الإجراء.")}
             </AlertDialogDescription>
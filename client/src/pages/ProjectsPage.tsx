@@ -72,7 +72,7 @@ export default function ProjectsPage() {
       const start = new Date(startDate);
       const end = new Date(endDate);
       if (start > end) {
-        setDateError(t("projects.dateError", "تاريخ البدء يجب أن يكون قبل تاريخ الانتهاء"));
+        setDateError(t("projects.dateError"));
         return false;
       }
     }
@@ -131,7 +131,7 @@ export default function ProjectsPage() {
       setDateError("");
       toast({
         title: t("common.success"),
-        description: t("projects.updatedSuccess", "تم تحديث المشروع بنجاح"),
+        description: t("projects.updatedSuccess"),
       });
     },
     onError: (error: any) => {
@@ -158,7 +158,7 @@ export default function ProjectsPage() {
       setSelectedProject(null);
       toast({
         title: t("common.success"),
-        description: t("projects.deletedSuccess", "تم حذف المشروع بنجاح"),
+        description: t("projects.deletedSuccess"),
       });
     },
     onError: (error: any) => {
@@ -353,7 +353,7 @@ export default function ProjectsPage() {
         <div className="flex gap-2">
           <Button variant="outline" onClick={() => setLocation("/projects/profitability")}>
             <BarChart3 className="me-2 h-4 w-4" />
-            {t("projects.profitabilityReport", "تقرير الربحية")}
+            {t("projects.profitabilityReport")}
           </Button>
           <Button onClick={openCreateDialog}>
             <Plus className="me-2 h-4 w-4" />
@@ -368,7 +368,7 @@ export default function ProjectsPage() {
           <CardHeader className="pb-2">
             <CardTitle className="text-sm font-medium text-muted-foreground flex items-center gap-2">
               <FolderKanban className="h-4 w-4" />
-              {t("projects.totalProjects", { defaultValue: "إجمالي المشاريع" })}
+              {t("projects.totalProjects")}
             </CardTitle>
           </CardHeader>
           <CardContent>
@@ -379,7 +379,7 @@ export default function ProjectsPage() {
           <CardHeader className="pb-2">
             <CardTitle className="text-sm font-medium text-muted-foreground flex items-center gap-2">
               <TrendingUp className="h-4 w-4 text-green-600" />
-              {t("projects.activeProjects", { defaultValue: "مشاريع نشطة" })}
+              {t("projects.activeProjects")}
             </CardTitle>
           </CardHeader>
           <CardContent>
@@ -390,7 +390,7 @@ export default function ProjectsPage() {
           <CardHeader className="pb-2">
             <CardTitle className="text-sm font-medium text-muted-foreground flex items-center gap-2">
               <TrendingDown className="h-4 w-4 text-blue-600" />
-              {t("projects.completedProjects", { defaultValue: "مشاريع مكتملة" })}
+              {t("projects.completedProjects")}
             </CardTitle>
           </CardHeader>
           <CardContent>
@@ -401,7 +401,7 @@ export default function ProjectsPage() {
           <CardHeader className="pb-2">
             <CardTitle className="text-sm font-medium text-muted-foreground flex items-center gap-2">
               <DollarSign className="h-4 w-4 text-purple-600" />
-              {t("projects.totalBudget", { defaultValue: "إجمالي الميزانيات" })}
+              {t("projects.totalBudget")}
             </CardTitle>
           </CardHeader>
           <CardContent>
@@ -439,7 +439,7 @@ export default function ProjectsPage() {
       <Dialog open={isViewOpen} onOpenChange={setIsViewOpen}>
         <DialogContent className="sm:max-w-[700px] max-h-[90vh] overflow-y-auto">
           <DialogHeader>
-            <DialogTitle>{t("projects.viewTitle", "تفاصيل المشروع")}</DialogTitle>
+            <DialogTitle>{t("projects.viewTitle")}</DialogTitle>
           </DialogHeader>
           {selectedProject && (
             <div className="space-y-6">
@@ -471,7 +471,7 @@ export default function ProjectsPage() {
               <div className="border rounded-lg p-4 bg-muted/30">
                 <h4 className="font-semibold mb-4 flex items-center gap-2">
                   <DollarSign className="h-4 w-4" />
-                  {t("projects.financialSummary", "الملخص المالي")}
+                  {t("projects.financialSummary")}
                 </h4>
                 {loadingFinancials ? (
                   <div className="flex items-center justify-center py-4">
@@ -508,7 +508,7 @@ export default function ProjectsPage() {
                     {selectedProject.budget && parseFloat(selectedProject.budget) > 0 && (
                       <div className="space-y-2">
                         <div className="flex justify-between text-sm">
-                          <span className="text-muted-foreground">{t("projects.budgetUsage", "استخدام الميزانية")}</span>
+                          <span className="text-muted-foreground">{t("projects.budgetUsage")}</span>
                           <span className={`font-medium ${
                             ((selectedProjectFinancials.expenses / parseFloat(selectedProject.budget)) * 100) > 100 
                               ? 'text-red-600' 
@@ -528,7 +528,7 @@ export default function ProjectsPage() {
                           }`}
                         />
                         <div className="flex justify-between text-xs text-muted-foreground">
-                          <span>{t("projects.spent", "المنفق")}: {Number(selectedProjectFinancials.expenses || 0).toLocaleString(i18n.language, { style: 'currency', currency: companyCurrency })}</span>
+                          <span>{t("projects.spent")}: {Number(selectedProjectFinancials.expenses || 0).toLocaleString(i18n.language, { style: 'currency', currency: companyCurrency })}</span>
                           <span>{t("projects.budget")}: {Number(selectedProject.budget).toLocaleString(i18n.language, { style: 'currency', currency: companyCurrency })}</span>
                         </div>
                       </div>
@@ -536,7 +536,7 @@ export default function ProjectsPage() {
                   </div>
                 ) : (
                   <p className="text-sm text-muted-foreground text-center py-4">
-                    {t("projects.noFinancialData", "لا توجد بيانات مالية")}
+                    {t("projects.noFinancialData")}
                   </p>
                 )}
               </div>
@@ -572,7 +572,7 @@ export default function ProjectsPage() {
           )}
           <DialogFooter>
             <Button variant="outline" onClick={() => setIsViewOpen(false)}>
-              {t("common.close", "إغلاق")}
+              {t("common.close")}
             </Button>
             <Button onClick={() => { setIsViewOpen(false); openEditDialog(selectedProject); }}>
               <Edit className="me-2 h-4 w-4" />
@@ -586,7 +586,7 @@ export default function ProjectsPage() {
       <Dialog open={isEditOpen} onOpenChange={setIsEditOpen}>
         <DialogContent className="sm:max-w-[600px] max-h-[90vh] overflow-y-auto">
           <DialogHeader>
-            <DialogTitle>{t("projects.editTitle", "تعديل المشروع")}</DialogTitle>
+            <DialogTitle>{t("projects.editTitle")}</DialogTitle>
           </DialogHeader>
           <form id="edit-form" onSubmit={handleUpdate} className="space-y-4">
             {renderFormFields()}
@@ -606,9 +606,9 @@ export default function ProjectsPage() {
       <AlertDialog open={isDeleteOpen} onOpenChange={setIsDeleteOpen}>
         <AlertDialogContent>
           <AlertDialogHeader>
-            <AlertDialogTitle>{t("common.confirmDelete", "تأكيد الحذف")}</AlertDialogTitle>
+            <AlertDialogTitle>{t("common.confirmDelete")}</AlertDialogTitle>
             <AlertDialogDescription>
-              {t("projects.deleteConfirm", "هل أنت متأكد من حذف هذا المشروع؟ لا يمكن التراجع عن هذا الإجراء.")}
+              {t("projects.deleteConfirm")}
             </AlertDialogDescription>
           </AlertDialogHeader>
           <AlertDialogFooter>
@@ -3,7 +3,7 @@
  * Fast data entry for common operations
  * Optimized for mobile use with large touch targets
  */
-import { useState } from 'react';
+import { useState, useMemo } from 'react';
 import { useTranslation } from 'react-i18next';
 import { useLocation } from 'wouter';
 import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query';
@@ -48,14 +48,14 @@ interface QuickEntryOption {
 }
 
 export default function QuickEntryPage() {
-  const { t } = useTranslation();
+  const { t, i18n } = useTranslation();
   const [, setLocation] = useLocation();
   const { toast } = useToast();
   const queryClient = useQueryClient();
 
   const [selectedType, setSelectedType] = useState<EntryType | null>(null);
 
-  const entryOptions: QuickEntryOption[] = [
+  const entryOptions: QuickEntryOption[] = useMemo(() => [
     {
       id: 'invoice',
       label: t('quickEntry.newInvoice'),
@@ -91,7 +91,7 @@ export default function QuickEntryPage() {
       icon: <Package className="h-8 w-8" />,
       color: 'bg-orange-100 dark:bg-orange-900/30 text-orange-600 dark:text-orange-400',
     },
-  ];
+  ], [t, i18n.language]);
 
   if (selectedType) {
     return (
@@ -1,6 +1,6 @@
 import { useState } from "react";
 import { useQuery } from "@tanstack/react-query";
-import { useTranslation } from "react-i18next";
+import { useTypedTranslation } from "@/hooks/useTypedTranslation";
 import { 
   AlertTriangle, 
   CheckCircle, 
@@ -17,7 +17,7 @@ import PageContainer from "@/components/layout/PageContainer";
 import { apiRequest } from "@/lib/queryClient";
 
 export default function InsightsPage() {
-  const { t } = useTranslation();
+  const { t } = useTypedTranslation();
   const [aiEnabled, setAiEnabled] = useState(false);
   const [isLoadingAI, setIsLoadingAI] = useState(false);
 
@@ -60,10 +60,10 @@ export default function InsightsPage() {
         <div>
           <h1 className="text-2xl sm:text-3xl font-bold tracking-tight flex items-center gap-2">
             <BrainCircuit className="h-8 w-8 text-primary" />
-            {t("accounting.insights.title", "Automated Accountant")}
+            {t("accounting.insights.title")}
           </h1>
           <p className="text-muted-foreground mt-1">
-            {t("accounting.insights.subtitle", "Real-time financial health checks and AI advisory.")}
+            {t("accounting.insights.subtitle")}
           </p>
         </div>
         <Button 
@@ -76,7 +76,7 @@ export default function InsightsPage() {
           ) : (
             <TrendingUp className="mr-2 h-4 w-4" />
           )}
-          {t("accounting.insights.askAI", "Generate CFO Report")}
+          {t("accounting.insights.askAI")}
         </Button>
       </div>
 
@@ -86,7 +86,7 @@ export default function InsightsPage() {
           <CardHeader>
             <CardTitle className="text-purple-900 flex items-center gap-2">
               <BrainCircuit className="h-5 w-5" />
-              {t("accounting.insights.aiReport", "AI CFO Commentary")}
+              {t("accounting.insights.aiReport")}
             </CardTitle>
           </CardHeader>
           <CardContent>
@@ -102,14 +102,14 @@ export default function InsightsPage() {
         {isLoading ? (
           <div className="text-center py-12 text-muted-foreground">
             <Loader2 className="h-8 w-8 animate-spin mx-auto mb-4" />
-            {t("common.loading", "Analyzing financial data...")}
+            {t("common.loading")}
           </div>
         ) : data?.alerts?.length === 0 ? (
           <Alert className="bg-green-50 border-green-200">
             <CheckCircle className="h-4 w-4 text-green-600" />
-            <AlertTitle className="text-green-800">{t("accounting.insights.allGood", "All Good!")}</AlertTitle>
+            <AlertTitle className="text-green-800">{t("accounting.insights.allGood")}</AlertTitle>
             <AlertDescription className="text-green-700">
-              {t("accounting.insights.noIssues", "Your automated accountant found no issues or anomalies.")}
+              {t("accounting.insights.noIssues")}
             </AlertDescription>
           </Alert>
         ) : (
@@ -135,7 +135,7 @@ export default function InsightsPage() {
                 {alert.action && (
                   <div className="mt-2 p-3 bg-secondary/50 rounded-md text-sm font-medium flex items-center gap-2">
                     <Info className="h-4 w-4" />
-                    {t("common.recommendation", "Action")}: {alert.action}
+                    {t("common.recommendation")}: {alert.action}
                   </div>
                 )}
                 
@@ -143,7 +143,7 @@ export default function InsightsPage() {
                 {alert.data && alert.data.length > 0 && (
                   <div className="mt-4 border rounded-md overflow-hidden">
                     <div className="bg-muted px-3 py-2 text-xs font-medium text-muted-foreground">
-                      {t("common.details", "Affected Records")}
+                      {t("common.details")}
                     </div>
                     <div className="divide-y">
                       {alert.data.map((item: any, i: number) => (
@@ -191,37 +191,37 @@ export default function AuditLogsPage() {
                 <SelectContent>
                   <SelectItem value="__any__">{t('common.any')}</SelectItem>
                   {/* Sales */}
-                  <SelectItem value="sales_invoice">{t('auditLogs.entities.salesInvoice', 'فاتورة مبيعات')}</SelectItem>
-                  <SelectItem value="sales_quote">{t('auditLogs.entities.salesQuote', 'عرض سعر')}</SelectItem>
-                  <SelectItem value="sales_order">{t('auditLogs.entities.salesOrder', 'طلب مبيعات')}</SelectItem>
-                  <SelectItem value="sales_credit_note">{t('auditLogs.entities.salesCreditNote', 'إشعار دائن')}</SelectItem>
+                  <SelectItem value="sales_invoice">{t('auditLogs.entities.salesInvoice')}</SelectItem>
+                  <SelectItem value="sales_quote">{t('auditLogs.entities.salesQuote')}</SelectItem>
+                  <SelectItem value="sales_order">{t('auditLogs.entities.salesOrder')}</SelectItem>
+                  <SelectItem value="sales_credit_note">{t('auditLogs.entities.salesCreditNote')}</SelectItem>
                   {/* Purchases */}
-                  <SelectItem value="bill">{t('auditLogs.entities.bill', 'فاتورة شراء')}</SelectItem>
-                  <SelectItem value="purchase_order">{t('auditLogs.entities.purchaseOrder', 'أمر شراء')}</SelectItem>
-                  <SelectItem value="purchase_debit_note">{t('auditLogs.entities.purchaseDebitNote', 'إشعار مدين')}</SelectItem>
-                  <SelectItem value="expense">{t('auditLogs.entities.expense', 'مصروف')}</SelectItem>
+                  <SelectItem value="bill">{t('auditLogs.entities.bill')}</SelectItem>
+                  <SelectItem value="purchase_order">{t('auditLogs.entities.purchaseOrder')}</SelectItem>
+                  <SelectItem value="purchase_debit_note">{t('auditLogs.entities.purchaseDebitNote')}</SelectItem>
+                  <SelectItem value="expense">{t('auditLogs.entities.expense')}</SelectItem>
                   {/* Banking */}
-                  <SelectItem value="bank_account">{t('auditLogs.entities.bankAccount', 'حساب بنكي')}</SelectItem>
-                  <SelectItem value="payment">{t('auditLogs.entities.payment', 'دفعة')}</SelectItem>
-                  <SelectItem value="receipt">{t('auditLogs.entities.receipt', 'إيصال')}</SelectItem>
-                  <SelectItem value="payment_allocation">{t('auditLogs.entities.paymentAllocation', 'تخصيص دفعة')}</SelectItem>
+                  <SelectItem value="bank_account">{t('auditLogs.entities.bankAccount')}</SelectItem>
+                  <SelectItem value="payment">{t('auditLogs.entities.payment')}</SelectItem>
+                  <SelectItem value="receipt">{t('auditLogs.entities.receipt')}</SelectItem>
+                  <SelectItem value="payment_allocation">{t('auditLogs.entities.paymentAllocation')}</SelectItem>
                   {/* Accounting */}
-                  <SelectItem value="journal">{t('auditLogs.entities.journal', 'قيد يومية')}</SelectItem>
-                  <SelectItem value="account">{t('auditLogs.entities.account', 'حساب')}</SelectItem>
+                  <SelectItem value="journal">{t('auditLogs.entities.journal')}</SelectItem>
+                  <SelectItem value="account">{t('auditLogs.entities.account')}</SelectItem>
                   {/* Inventory */}
-                  <SelectItem value="item">{t('auditLogs.entities.item', 'منتج')}</SelectItem>
-                  <SelectItem value="warehouse">{t('auditLogs.entities.warehouse', 'مستودع')}</SelectItem>
-                  <SelectItem value="stock_movement">{t('auditLogs.entities.stockMovement', 'حركة مخزون')}</SelectItem>
-                  <SelectItem value="stock_transfer">{t('auditLogs.entities.stockTransfer', 'تحويل مخزون')}</SelectItem>
+                  <SelectItem value="item">{t('auditLogs.entities.item')}</SelectItem>
+                  <SelectItem value="warehouse">{t('auditLogs.entities.warehouse')}</SelectItem>
+                  <SelectItem value="stock_movement">{t('auditLogs.entities.stockMovement')}</SelectItem>
+                  <SelectItem value="stock_transfer">{t('auditLogs.entities.stockTransfer')}</SelectItem>
                   {/* Contacts & Others */}
-                  <SelectItem value="contact">{t('auditLogs.entities.contact', 'جهة اتصال')}</SelectItem>
-                  <SelectItem value="fixed_asset">{t('auditLogs.entities.fixedAsset', 'أصل ثابت')}</SelectItem>
-                  <SelectItem value="project">{t('auditLogs.entities.project', 'مشروع')}</SelectItem>
-                  <SelectItem value="budget">{t('auditLogs.entities.budget', 'ميزانية')}</SelectItem>
-                  <SelectItem value="exchange_rate">{t('auditLogs.entities.exchangeRate', 'سعر صرف')}</SelectItem>
-                  <SelectItem value="users">{t('auditLogs.entities.user', 'مستخدم')}</SelectItem>
-                  <SelectItem value="check">{t('auditLogs.entities.check', 'شيك')}</SelectItem>
-                  <SelectItem value="cost_center">{t('auditLogs.entities.costCenter', 'مركز تكلفة')}</SelectItem>
+                  <SelectItem value="contact">{t('auditLogs.entities.contact')}</SelectItem>
+                  <SelectItem value="fixed_asset">{t('auditLogs.entities.fixedAsset')}</SelectItem>
+                  <SelectItem value="project">{t('auditLogs.entities.project')}</SelectItem>
+                  <SelectItem value="budget">{t('auditLogs.entities.budget')}</SelectItem>
+                  <SelectItem value="exchange_rate">{t('auditLogs.entities.exchangeRate')}</SelectItem>
+                  <SelectItem value="users">{t('auditLogs.entities.user')}</SelectItem>
+                  <SelectItem value="check">{t('auditLogs.entities.check')}</SelectItem>
+                  <SelectItem value="cost_center">{t('auditLogs.entities.costCenter')}</SelectItem>
                 </SelectContent>
               </Select>
             </div>
@@ -233,9 +233,9 @@ export default function AuditLogsPage() {
                 </SelectTrigger>
                 <SelectContent>
                   <SelectItem value="__any__">{t('common.any')}</SelectItem>
-                  <SelectItem value="create">{t('auditLogs.actions.create', 'create')}</SelectItem>
-                  <SelectItem value="delete">{t('auditLogs.actions.delete', 'delete')}</SelectItem>
-                  <SelectItem value="update">{t('auditLogs.actions.update', 'update')}</SelectItem>
+                  <SelectItem value="create">{t('auditLogs.actions.create')}</SelectItem>
+                  <SelectItem value="delete">{t('auditLogs.actions.delete')}</SelectItem>
+                  <SelectItem value="update">{t('auditLogs.actions.update')}</SelectItem>
                 </SelectContent>
               </Select>
             </div>
@@ -46,7 +46,7 @@ export default function ApprovalSettings() {
       queryClient.invalidateQueries({ queryKey: ["/api/approvals/workflows"] });
       toast({
         title: t("common.success"),
-        description: t("approvals.workflowCreated", "Workflow created successfully"),
+        description: t("approvals.workflowCreated"),
       });
       setIsCreateOpen(false);
       // Reset form
@@ -72,7 +72,7 @@ export default function ApprovalSettings() {
       queryClient.invalidateQueries({ queryKey: ["/api/approvals/workflows"] });
       toast({
         title: t("common.success"),
-        description: t("approvals.workflowDeleted", "Workflow deleted successfully"),
+        description: t("approvals.workflowDeleted"),
       });
     },
     onError: (error: any) => {
@@ -88,8 +88,8 @@ export default function ApprovalSettings() {
     if (!name) {
       toast({
         variant: "destructive",
-        title: t("common.validationError", "Validation Error"),
-        description: t("approvals.pleaseProvideName", "Please provide a workflow name"),
+        title: t("common.validationError"),
+        description: t("approvals.pleaseProvideName"),
       });
       return;
     }
@@ -123,10 +123,10 @@ export default function ApprovalSettings() {
         <div>
           <h1 className="text-2xl sm:text-3xl font-bold tracking-tight flex items-center gap-2">
             <Shield className="h-8 w-8 text-primary" />
-            {t("approvals.settingsTitle", "Approval Workflows")}
+            {t("approvals.settingsTitle")}
           </h1>
           <p className="text-muted-foreground mt-1">
-            {t("approvals.settingsSubtitle", "Configure rules for automatic approval requests.")}
+            {t("approvals.settingsSubtitle")}
           </p>
         </div>
         <Dialog open={isCreateOpen} onOpenChange={setIsCreateOpen}>
@@ -143,30 +143,30 @@ export default function ApprovalSettings() {
             <div className="space-y-4 py-4">
               <div className="grid grid-cols-1 sm:grid-cols-2 gap-4">
                 <div className="space-y-2">
-                  <Label>{t("approvals.workflowName", "Workflow Name")}</Label>
+                  <Label>{t("approvals.workflowName")}</Label>
                   <Input 
-                    placeholder={t("approvals.workflowNamePlaceholder", "e.g. High Value Expenses")} 
+                    placeholder={t("approvals.workflowNamePlaceholder")} 
                     value={name}
                     onChange={(e) => setName(e.target.value)}
                   />
                 </div>
                 <div className="space-y-2">
-                  <Label>{t("approvals.entityType", "Transaction Type")}</Label>
+                  <Label>{t("approvals.entityType")}</Label>
                   <Select value={entityType} onValueChange={setEntityType}>
                     <SelectTrigger>
                       <SelectValue />
                     </SelectTrigger>
                     <SelectContent>
-                      <SelectItem value="expense">{t("common.expense", "Expense")}</SelectItem>
-                      <SelectItem value="purchase_order">{t("approvals.purchaseOrder", "Purchase Order")}</SelectItem>
-                      <SelectItem value="invoice">{t("approvals.salesInvoice", "Sales Invoice")}</SelectItem>
+                      <SelectItem value="expense">{t("common.expense")}</SelectItem>
+                      <SelectItem value="purchase_order">{t("approvals.purchaseOrder")}</SelectItem>
+                      <SelectItem value="invoice">{t("approvals.salesInvoice")}</SelectItem>
                     </SelectContent>
                   </Select>
                 </div>
               </div>
               
               <div className="space-y-2">
-                <Label>{t("approvals.minAmount", "Trigger Amount")}</Label>
+                <Label>{t("approvals.minAmount")}</Label>
                 <Input 
                   type="number" 
                   value={triggerAmount} 
@@ -174,7 +174,7 @@ export default function ApprovalSettings() {
                   min="0"
                 />
                 <p className="text-xs text-muted-foreground">
-                  {t("approvals.triggerDescription", "Transactions above this amount will trigger this workflow.")}
+                  {t("approvals.triggerDescription")}
                 </p>
               </div>
 
@@ -182,9 +182,9 @@ export default function ApprovalSettings() {
 
               <div className="space-y-2">
                 <div className="flex justify-between items-center">
-                  <Label>{t("approvals.approvalSteps", "Approval Steps")}</Label>
+                  <Label>{t("approvals.approvalSteps")}</Label>
                   <Button variant="outline" size="sm" onClick={addStep}>
-                    <Plus className="h-3 w-3 me-1" /> {t("approvals.addStep", "Add Step")}
+                    <Plus className="h-3 w-3 me-1" /> {t("approvals.addStep")}
                   </Button>
                 </div>
                 
@@ -219,10 +219,10 @@ export default function ApprovalSettings() {
             </div>
             <DialogFooter>
               <Button variant="outline" onClick={() => setIsCreateOpen(false)}>
-                {t("common.cancel", "Cancel")}
+                {t("common.cancel")}
               </Button>
               <Button onClick={handleCreate} disabled={createMutation.isPending}>
-                {createMutation.isPending ? t("common.saving", "Saving...") : t("common.create", "Create")}
+                {createMutation.isPending ? t("common.saving") : t("common.create")}
               </Button>
             </DialogFooter>
           </DialogContent>
@@ -231,18 +231,18 @@ export default function ApprovalSettings() {
 
       {isLoading ? (
         <div className="text-center py-12 text-muted-foreground">
-          {t("common.loading", "Loading...")}
+          {t("common.loading")}
         </div>
       ) : workflows.length === 0 ? (
         <Card className="bg-muted/50 border-dashed">
           <CardContent className="flex flex-col items-center justify-center py-12 text-center">
             <AlertTriangle className="h-12 w-12 text-yellow-500 mb-4" />
-            <h3 className="text-lg font-semibold">{t("approvals.noWorkflows", "No Workflows Configured")}</h3>
+            <h3 className="text-lg font-semibold">{t("approvals.noWorkflows")}</h3>
             <p className="text-muted-foreground max-w-md mt-2">
-              {t("approvals.noWorkflowsDesc", "Create a workflow to start enforcing approvals for high-value transactions.")}
+              {t("approvals.noWorkflowsDesc")}
             </p>
             <Button variant="outline" className="mt-4" onClick={() => setIsCreateOpen(true)}>
-              {t("approvals.createFirst", "Create First Workflow")}
+              {t("approvals.createFirst")}
             </Button>
           </CardContent>
         </Card>
@@ -268,12 +268,12 @@ export default function ApprovalSettings() {
                   {workflow.name || "Unnamed Workflow"}
                 </CardTitle>
                 <CardDescription>
-                  {t("approvals.above", "Above")} {new Intl.NumberFormat('en-US', { style: 'currency', currency: companyCurrency }).format(workflow.trigger_amount || workflow.min_amount || 0)}
+                  {t("approvals.above")} {new Intl.NumberFormat('en-US', { style: 'currency', currency: companyCurrency }).format(workflow.trigger_amount || workflow.min_amount || 0)}
                 </CardDescription>
               </CardHeader>
               <CardContent>
                 <div className="space-y-2 mt-2">
-                  <Label className="text-xs text-muted-foreground uppercase tracking-wider">{t("approvals.approvalChain", "Approval Chain")}</Label>
+                  <Label className="text-xs text-muted-foreground uppercase tracking-wider">{t("approvals.approvalChain")}</Label>
                   <div className="flex flex-col gap-2">
                     {workflow.steps && workflow.steps.length > 0 ? (
                       workflow.steps.map((step: any, idx: number) => (
@@ -297,7 +297,7 @@ export default function ApprovalSettings() {
                   </div>
                 </div>
                 <div className="text-xs text-muted-foreground mt-4 pt-2 border-t">
-                  {t("approvals.createdOn", "Created on")} {new Date(workflow.created_at).toLocaleDateString()}
+                  {t("approvals.createdOn")} {new Date(workflow.created_at).toLocaleDateString()}
                 </div>
               </CardContent>
             </Card>
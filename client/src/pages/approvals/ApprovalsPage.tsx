@@ -1,6 +1,6 @@
 import { useState } from "react";
 import { useQuery, useMutation } from "@tanstack/react-query";
-import { useTranslation } from "react-i18next";
+import { useTypedTranslation } from "@/hooks/useTypedTranslation";
 import { 
   CheckCircle, 
   XCircle, 
@@ -28,7 +28,7 @@ import { apiRequest, queryClient } from "@/lib/queryClient";
 import { useToast } from "@/hooks/use-toast";
 
 export default function ApprovalsPage() {
-  const { t } = useTranslation();
+  const { t } = useTypedTranslation();
   const { toast } = useToast();
   const [selectedRequest, setSelectedRequest] = useState<any>(null);
   const [comment, setComment] = useState("");
@@ -46,7 +46,7 @@ export default function ApprovalsPage() {
       queryClient.invalidateQueries({ queryKey: ["/api/approvals/requests"] });
       toast({
         title: t("common.success"),
-        description: t("approvals.actionSuccess", "Request processed successfully"),
+        description: t("approvals.actionSuccess"),
       });
       setSelectedRequest(null);
       setComment("");
@@ -81,31 +81,31 @@ export default function ApprovalsPage() {
         <div>
           <h1 className="text-3xl font-bold tracking-tight flex items-center gap-2">
             <ShieldCheck className="h-8 w-8 text-primary" />
-            {t("approvals.title", "Approvals")}
+            {t("approvals.title")}
           </h1>
           <p className="text-muted-foreground mt-1">
-            {t("approvals.subtitle", "Review and approve pending requests.")}
+            {t("approvals.subtitle")}
           </p>
         </div>
       </div>
 
       <Tabs defaultValue="pending">
         <TabsList>
-          <TabsTrigger value="pending">{t("approvals.pending", "Pending Requests")}</TabsTrigger>
-          <TabsTrigger value="history" disabled>{t("approvals.history", "History")}</TabsTrigger>
+          <TabsTrigger value="pending">{t("approvals.pending")}</TabsTrigger>
+          <TabsTrigger value="history" disabled>{t("approvals.history")}</TabsTrigger>
         </TabsList>
 
         <TabsContent value="pending" className="mt-6">
           {isLoading ? (
             <div className="text-center py-12 text-muted-foreground">
-              {t("common.loading", "Loading...")}
+              {t("common.loading")}
             </div>
           ) : requests.length === 0 ? (
             <Card className="bg-muted/50 border-dashed">
               <CardContent className="flex flex-col items-center justify-center py-12 text-center">
                 <CheckCircle className="h-12 w-12 text-muted-foreground mb-4" />
-                <h3 className="text-lg font-semibold">{t("approvals.noPending", "All caught up!")}</h3>
-                <p className="text-muted-foreground">{t("approvals.noPendingDesc", "You have no pending approval requests.")}</p>
+                <h3 className="text-lg font-semibold">{t("approvals.noPending")}</h3>
+                <p className="text-muted-foreground">{t("approvals.noPendingDesc")}</p>
               </CardContent>
             </Card>
           ) : (
@@ -123,7 +123,7 @@ export default function ApprovalsPage() {
                         </span>
                       </div>
                       <Badge variant="secondary" className="bg-yellow-100 text-yellow-800 hover:bg-yellow-100">
-                        {t("common.pending", "Pending")}
+                        {t("common.pending")}
                       </Badge>
                     </div>
                     <CardTitle className="text-lg mt-2">
@@ -140,7 +140,7 @@ export default function ApprovalsPage() {
                       </Badge>
                     </div>
                     <CardDescription>
-                      {t("approvals.requestedBy", "Requested by")}: {req.requester?.username || req.requester?.email || 'Unknown'}
+                      {t("approvals.requestedBy")}: {req.requester?.username || req.requester?.email || 'Unknown'}
                     </CardDescription>
                   </CardHeader>
                   <CardContent>
@@ -152,11 +152,11 @@ export default function ApprovalsPage() {
                       <div className="flex gap-2">
                         <Button variant="outline" className="text-red-600 hover:text-red-700 hover:bg-red-50" onClick={() => handleAction(req, 'reject')}>
                           <XCircle className="mr-2 h-4 w-4" />
-                          {t("common.reject", "Reject")}
+                          {t("common.reject")}
                         </Button>
                         <Button className="bg-green-600 hover:bg-green-700" onClick={() => handleAction(req, 'approve')}>
                           <CheckCircle className="mr-2 h-4 w-4" />
-                          {t("common.approve", "Approve")}
+                          {t("common.approve")}
                         </Button>
                       </div>
                     </div>
@@ -172,22 +172,22 @@ export default function ApprovalsPage() {
         <DialogContent>
           <DialogHeader>
             <DialogTitle>
-              {actionType === 'approve' ? t("approvals.confirmApprove", "Confirm Approval") : t("approvals.confirmReject", "Confirm Rejection")}
+              {actionType === 'approve' ? t("approvals.confirmApprove") : t("approvals.confirmReject")}
             </DialogTitle>
           </DialogHeader>
           <div className="space-y-4 py-4">
             <p className="text-sm text-muted-foreground">
-              {t("approvals.commentPrompt", "Add an optional comment for the requester:")}
+              {t("approvals.commentPrompt")}
             </p>
             <Textarea 
               value={comment} 
               onChange={(e) => setComment(e.target.value)} 
-              placeholder={t("approvals.commentPlaceholder", "e.g., Approved as per budget...")}
+              placeholder={t("approvals.commentPlaceholder")}
             />
           </div>
           <DialogFooter>
             <Button variant="outline" onClick={() => setSelectedRequest(null)}>
-              {t("common.cancel", "Cancel")}
+              {t("common.cancel")}
             </Button>
             <Button 
               variant={actionType === 'reject' ? "destructive" : "default"}
@@ -195,7 +195,7 @@ export default function ApprovalsPage() {
               disabled={actionMutation.isPending}
             >
               {actionMutation.isPending && <Clock className="mr-2 h-4 w-4 animate-spin" />}
-              {t("common.confirm", "Confirm")}
+              {t("common.confirm")}
             </Button>
           </DialogFooter>
         </DialogContent>
@@ -146,23 +146,23 @@ export default function AssetsPage() {
       {/* Responsive Header */}
       <div className="flex flex-col space-y-4 sm:flex-row sm:items-center sm:justify-between sm:space-y-0">
         <div>
-          <h1 className="text-2xl sm:text-3xl font-bold tracking-tight">{t("fixedAssets.title", { defaultValue: "Fixed Assets" })}</h1>
+          <h1 className="text-2xl sm:text-3xl font-bold tracking-tight">{t("fixedAssets.title")}</h1>
           <p className="text-sm sm:text-base text-muted-foreground mt-1">
-            {t("fixedAssets.description", { defaultValue: "Manage your company's fixed assets and depreciation" })}
+            {t("fixedAssets.description")}
           </p>
         </div>
         <Dialog open={isCreateOpen} onOpenChange={setIsCreateOpen}>
           <DialogTrigger asChild>
             <Button className="w-full sm:w-auto">
               <Plus className="me-2 h-4 w-4" />
-              {t("fixedAssets.newAsset", { defaultValue: "New Asset" })}
+              {t("fixedAssets.newAsset")}
             </Button>
           </DialogTrigger>
           <DialogContent className="sm:max-w-[600px] max-h-[90vh] overflow-y-auto">
             <DialogHeader>
-              <DialogTitle>{t("fixedAssets.registerAsset", { defaultValue: "Register New Asset" })}</DialogTitle>
+              <DialogTitle>{t("fixedAssets.registerAsset")}</DialogTitle>
               <DialogDescription>
-                {t("fixedAssets.enterDetails", { defaultValue: "Enter asset details for tracking and depreciation." })}
+                {t("fixedAssets.enterDetails")}
               </DialogDescription>
             </DialogHeader>
             <form id="asset-form" onSubmit={handleSubmit} className="space-y-4">
@@ -184,14 +184,14 @@ export default function AssetsPage() {
                     value={newAsset.name}
                     onChange={(e) => setNewAsset({ ...newAsset, name: e.target.value })}
                     required
-                    placeholder={t("fixedAssets.assetNamePlaceholder", { defaultValue: "Office Laptop" })}
+                    placeholder={t("fixedAssets.assetNamePlaceholder")}
                   />
                 </div>
               </div>
 
               <div className="grid grid-cols-1 sm:grid-cols-2 gap-4">
                 <div className="space-y-2">
-                  <Label htmlFor="cost">{t("fixedAssets.acquisitionCost", { defaultValue: "Acquisition Cost" })}</Label>
+                  <Label htmlFor="cost">{t("fixedAssets.acquisitionCost")}</Label>
                   <Input
                     id="cost"
                     type="number"
@@ -202,7 +202,7 @@ export default function AssetsPage() {
                   />
                 </div>
                 <div className="space-y-2">
-                  <Label htmlFor="date">{t("fixedAssets.acquisitionDate", { defaultValue: "Acquisition Date" })}</Label>
+                  <Label htmlFor="date">{t("fixedAssets.acquisitionDate")}</Label>
                   <Input
                     id="date"
                     type="date"
@@ -215,7 +215,7 @@ export default function AssetsPage() {
 
               <div className="grid grid-cols-1 sm:grid-cols-2 gap-4">
                 <div className="space-y-2">
-                  <Label htmlFor="life">{t("fixedAssets.usefulLifeYears", { defaultValue: "Useful Life (Years)" })}</Label>
+                  <Label htmlFor="life">{t("fixedAssets.usefulLifeYears")}</Label>
                   <Input
                     id="life"
                     type="number"
@@ -225,7 +225,7 @@ export default function AssetsPage() {
                   />
                 </div>
                 <div className="space-y-2">
-                  <Label htmlFor="salvage">{t("fixedAssets.salvageValue", { defaultValue: "Salvage Value" })}</Label>
+                  <Label htmlFor="salvage">{t("fixedAssets.salvageValue")}</Label>
                   <Input
                     id="salvage"
                     type="number"
@@ -237,7 +237,7 @@ export default function AssetsPage() {
               </div>
 
               <div className="space-y-2">
-                <Label htmlFor="method">{t("fixedAssets.depreciationMethod", { defaultValue: "Depreciation Method" })}</Label>
+                <Label htmlFor="method">{t("fixedAssets.depreciationMethod")}</Label>
                 <Select 
                   value={newAsset.depreciation_method} 
                   onValueChange={(val) => setNewAsset({...newAsset, depreciation_method: val})}
@@ -246,20 +246,20 @@ export default function AssetsPage() {
                     <SelectValue />
                   </SelectTrigger>
                   <SelectContent>
-                    <SelectItem value="straight_line">{t("fixedAssets.straightLine", { defaultValue: "Straight Line" })}</SelectItem>
-                    <SelectItem value="declining_balance">{t("fixedAssets.decliningBalance", { defaultValue: "Declining Balance" })}</SelectItem>
+                    <SelectItem value="straight_line">{t("fixedAssets.straightLine")}</SelectItem>
+                    <SelectItem value="declining_balance">{t("fixedAssets.decliningBalance")}</SelectItem>
                   </SelectContent>
                 </Select>
               </div>
 
               <div className="space-y-2">
-                <Label htmlFor="asset_account">{t("fixedAssets.assetAccount", { defaultValue: "Asset Account" })}</Label>
+                <Label htmlFor="asset_account">{t("fixedAssets.assetAccount")}</Label>
                 <Select 
                   value={newAsset.asset_account_id} 
                   onValueChange={(val) => setNewAsset({...newAsset, asset_account_id: val})}
                 >
                   <SelectTrigger>
-                    <SelectValue placeholder={t("fixedAssets.selectAssetAccount", { defaultValue: "Select Asset Account" })} />
+                    <SelectValue placeholder={t("fixedAssets.selectAssetAccount")} />
                   </SelectTrigger>
                   <SelectContent>
                     {accounts?.filter((a: any) => a.account_type === 'asset').map((a: any) => (
@@ -270,13 +270,13 @@ export default function AssetsPage() {
               </div>
 
               <div className="space-y-2">
-                <Label htmlFor="depreciation_account">{t("fixedAssets.accumulatedDepreciationAccount", { defaultValue: "Accumulated Depreciation Account" })}</Label>
+                <Label htmlFor="depreciation_account">{t("fixedAssets.accumulatedDepreciationAccount")}</Label>
                 <Select 
                   value={newAsset.depreciation_account_id} 
                   onValueChange={(val) => setNewAsset({...newAsset, depreciation_account_id: val})}
                 >
                   <SelectTrigger>
-                    <SelectValue placeholder={t("fixedAssets.selectContraAccount", { defaultValue: "Select Contra Asset Account" })} />
+                    <SelectValue placeholder={t("fixedAssets.selectContraAccount")} />
                   </SelectTrigger>
                   <SelectContent>
                     {accounts?.filter((a: any) => a.account_type === 'asset').map((a: any) => (
@@ -287,13 +287,13 @@ export default function AssetsPage() {
               </div>
 
               <div className="space-y-2">
-                <Label htmlFor="expense_account">{t("fixedAssets.depreciationExpenseAccount", { defaultValue: "Depreciation Expense Account" })}</Label>
+                <Label htmlFor="expense_account">{t("fixedAssets.depreciationExpenseAccount")}</Label>
                 <Select 
                   value={newAsset.expense_account_id} 
                   onValueChange={(val) => setNewAsset({...newAsset, expense_account_id: val})}
                 >
                   <SelectTrigger>
-                    <SelectValue placeholder={t("fixedAssets.selectExpenseAccount", { defaultValue: "Select Expense Account" })} />
+                    <SelectValue placeholder={t("fixedAssets.selectExpenseAccount")} />
                   </SelectTrigger>
                   <SelectContent>
                     {accounts?.filter((a: any) => a.account_type === 'expense').map((a: any) => (
@@ -306,10 +306,10 @@ export default function AssetsPage() {
             </form>
             <DialogFooter className="flex flex-col-reverse sm:flex-row gap-2">
               <Button type="button" variant="outline" onClick={() => setIsCreateOpen(false)} className="w-full sm:w-auto">
-                {t("common.cancel", "Cancel")}
+                {t("common.cancel")}
               </Button>
               <Button type="submit" form="asset-form" disabled={createAssetMutation.isPending} className="w-full sm:w-auto">
-                {createAssetMutation.isPending ? t("common.creating", "Creating...") : t("fixedAssets.createAsset", "Create Asset")}
+                {createAssetMutation.isPending ? t("common.creating") : t("fixedAssets.createAsset")}
               </Button>
             </DialogFooter>
           </DialogContent>
@@ -318,14 +318,14 @@ export default function AssetsPage() {
         <Dialog open={isDepreciateOpen} onOpenChange={setIsDepreciateOpen}>
           <DialogContent>
             <DialogHeader>
-              <DialogTitle>{t("fixedAssets.postDepreciation", { defaultValue: "Post Depreciation" })}</DialogTitle>
+              <DialogTitle>{t("fixedAssets.postDepreciation")}</DialogTitle>
               <DialogDescription>
-                {t("fixedAssets.calculateDescription", { defaultValue: "Calculate and post depreciation up to the selected date." })}
+                {t("fixedAssets.calculateDescription")}
               </DialogDescription>
             </DialogHeader>
             <div className="space-y-4 py-4">
               <div className="space-y-2">
-                <Label htmlFor="depreciate_date">{t("fixedAssets.depreciationDate", { defaultValue: "Depreciation Date" })}</Label>
+                <Label htmlFor="depreciate_date">{t("fixedAssets.depreciationDate")}</Label>
                 <Input
                   id="depreciate_date"
                   type="date"
@@ -335,9 +335,9 @@ export default function AssetsPage() {
               </div>
             </div>
             <DialogFooter>
-              <Button variant="outline" onClick={() => setIsDepreciateOpen(false)}>{t("common.cancel", { defaultValue: "Cancel" })}</Button>
+              <Button variant="outline" onClick={() => setIsDepreciateOpen(false)}>{t("common.cancel")}</Button>
               <Button onClick={handleConfirmDepreciate} disabled={depreciateMutation.isPending}>
-                {depreciateMutation.isPending ? t("fixedAssets.posting", { defaultValue: "Posting..." }) : t("fixedAssets.postDepreciation", { defaultValue: "Post Depreciation" })}
+                {depreciateMutation.isPending ? t("fixedAssets.posting") : t("fixedAssets.postDepreciation")}
               </Button>
             </DialogFooter>
           </DialogContent>
@@ -360,11 +360,11 @@ export default function AssetsPage() {
                 <TableBody>
                   {isHistoryLoading ? (
                     <TableRow>
-                      <TableCell colSpan={3} className="text-center">{t("common.loading", "Loading...")}</TableCell>
+                      <TableCell colSpan={3} className="text-center">{t("common.loading")}</TableCell>
                     </TableRow>
                   ) : history?.length === 0 ? (
                     <TableRow>
-                      <TableCell colSpan={3} className="text-center">{t("common.noHistoryFound", "No history found")}</TableCell>
+                      <TableCell colSpan={3} className="text-center">{t("common.noHistoryFound")}</TableCell>
                     </TableRow>
                   ) : (
                     history?.map((entry: any) => (
@@ -384,7 +384,7 @@ export default function AssetsPage() {
 
       <Card>
         <CardHeader>
-          <CardTitle>{t("fixedAssets.assetRegistry", { defaultValue: "Asset Registry" })}</CardTitle>
+          <CardTitle>{t("fixedAssets.assetRegistry")}</CardTitle>
         </CardHeader>
         <CardContent>
           <div className="overflow-x-auto">
@@ -393,17 +393,17 @@ export default function AssetsPage() {
               <TableRow>
                 <TableHead>{t("fixedAssets.assetCode", { defaultValue: "Code" })}</TableHead>
                 <TableHead>{t("fixedAssets.assetName", { defaultValue: "Name" })}</TableHead>
-                <TableHead>{t("fixedAssets.acquired", { defaultValue: "Acquired" })}</TableHead>
-                <TableHead className="text-end">{t("common.cost", { defaultValue: "Cost" })}</TableHead>
-                <TableHead className="text-end">{t("fixedAssets.bookValue", { defaultValue: "Book Value" })}</TableHead>
-                <TableHead>{t("common.status", { defaultValue: "Status" })}</TableHead>
-                <TableHead className="text-end">{t("common.actions", { defaultValue: "Actions" })}</TableHead>
+                <TableHead>{t("fixedAssets.acquired")}</TableHead>
+                <TableHead className="text-end">{t("common.cost")}</TableHead>
+                <TableHead className="text-end">{t("fixedAssets.bookValue")}</TableHead>
+                <TableHead>{t("common.status")}</TableHead>
+                <TableHead className="text-end">{t("common.actions")}</TableHead>
               </TableRow>
             </TableHeader>
             <TableBody>
               {isLoading ? (
                 <TableRow>
-                  <TableCell colSpan={7} className="text-center">{t("common.loading", "Loading...")}</TableCell>
+                  <TableCell colSpan={7} className="text-center">{t("common.loading")}</TableCell>
                 </TableRow>
               ) : (
                 assets?.map((asset: any) => {
@@ -417,7 +417,7 @@ export default function AssetsPage() {
                       <TableCell className="text-end">{bookValue.toLocaleString(i18n.language, { minimumFractionDigits: 2 })}</TableCell>
                       <TableCell>
                         <Badge variant={asset.is_active ? 'default' : 'secondary'}>
-                          {asset.is_active ? t("common.active", { defaultValue: "Active" }) : t("fixedAssets.disposed", { defaultValue: "Disposed" })}
+                          {asset.is_active ? t("common.active") : t("fixedAssets.disposed")}
                         </Badge>
                       </TableCell>
                       <TableCell className="text-end">
@@ -425,7 +425,7 @@ export default function AssetsPage() {
                           variant="ghost" 
                           size="sm"
                           onClick={() => handleDepreciateClick(asset.id)}
-                          title={t("fixedAssets.postDepreciation", { defaultValue: "Post Depreciation" })}
+                          title={t("fixedAssets.postDepreciation")}
                         >
                           <Calculator className="h-4 w-4" />
                         </Button>
@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useState, useMemo } from 'react';
 import { useTranslation } from 'react-i18next';
 import type { TFunction } from 'i18next';
 import { useQuery, useMutation } from '@tanstack/react-query';
@@ -37,7 +37,7 @@ import { useIsMobile } from '@/hooks/use-mobile';
 // Bank account form schema factory for i18n validation messages
 const bankAccountSchemaFactory = (t: TFunction) => z.object({
   name: z.string().min(2, t('validation.accountNameMin')),
-  account_id: z.string().min(1, t('validation.accountRequired', 'GL Account is required')),
+  account_id: z.string().min(1, t('validation.accountRequired')),
   account_number: z.string().min(5, t('validation.accountNumberRequired')),
   bank_name: z.string().min(2, t('validation.bankNameRequired')),
   branch: z.string().optional(),
@@ -105,16 +105,16 @@ export default function BankAccountsPage() {
   );
 
   // Account types with translations
-  const accountTypes = [
+  const accountTypes = useMemo(() => [
     { value: 'checking', label: t('banking.checkingAccount'), icon: Wallet },
     { value: 'savings', label: t('banking.savingsAccount'), icon: DollarSign },
     { value: 'credit_card', label: t('banking.creditCard'), icon: CreditCard },
     { value: 'cash', label: t('banking.cash'), icon: DollarSign },
     { value: 'investment', label: t('banking.investment'), icon: TrendingUp },
-  ];
+  ], [t, i18n.language]);
 
   // Comprehensive global currency list with symbols
-  const currencies = [
+  const currencies = useMemo(() => [
   // Major World Currencies
   { code: 'USD', name: t('currencies.USD'), symbol: '$' },
   { code: 'EUR', name: t('currencies.EUR'), symbol: '€' },
@@ -223,7 +223,7 @@ export default function BankAccountsPage() {
   { code: 'VED', name: t('currencies.VED'), symbol: 'Bs' }, // Venezuela
   { code: 'GYD', name: t('currencies.GYD'), symbol: 'G$' }, // Guyana
   { code: 'SRD', name: t('currencies.SRD'), symbol: 'Sr$' }, // Suriname
-];
+], [t, i18n.language]);
 
 // Removed mock data - using real API data only
 
@@ -513,11 +513,11 @@ export default function BankAccountsPage() {
                   name="account_id"
                   render={({ field }) => (
                     <FormItem>
-                      <FormLabel>{`${t('banking.accounts.glAccount', { defaultValue: 'حساب دليل الحسابات' })} *`}</FormLabel>
+                      <FormLabel>{`${t('banking.accounts.glAccount')} *`}</FormLabel>
                       <Select onValueChange={field.onChange} value={field.value}>
                         <FormControl>
                           <SelectTrigger data-testid="select-gl-account">
-                            <SelectValue placeholder={t('banking.accounts.selectGLAccount', { defaultValue: 'اختر الحساب المحاسبي' })} />
+                            <SelectValue placeholder={t('banking.accounts.selectGLAccount')} />
                           </SelectTrigger>
                         </FormControl>
                         <SelectContent>
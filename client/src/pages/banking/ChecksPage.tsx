@@ -1,4 +1,4 @@
-import { useState } from "react";
+import { useState, useMemo } from "react";
 import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import { useTranslation } from "react-i18next";
 import { Plus, Pencil, Trash2, Search, FileCheck, ArrowUpRight, ArrowDownLeft, Eye, ScanLine, Loader2 } from "lucide-react";
@@ -65,7 +65,7 @@ export default function ChecksPage() {
   });
 
   // Comprehensive currency list
-  const currencies = [
+  const currencies = useMemo(() => [
     // Major World Currencies
     { code: 'USD', name: t('currencies.USD') },
     { code: 'EUR', name: t('currencies.EUR') },
@@ -104,7 +104,7 @@ export default function ChecksPage() {
     { code: 'THB', name: t('currencies.THB') },
     { code: 'MYR', name: t('currencies.MYR') },
     { code: 'SGD', name: t('currencies.SGD') },
-  ];
+  ], [t, i18n.language]);
 
   const { data: checks = [], isLoading } = useQuery<CheckWithDetails[]>({
     queryKey: ["/api/checks", { type: activeTab }],
@@ -128,7 +128,7 @@ export default function ChecksPage() {
       resetForm();
       toast({
         title: t("common.success"),
-        description: t("checks.createSuccess", "Check recorded successfully"),
+        description: t("checks.createSuccess"),
       });
     },
     onError: (error: any) => {
@@ -148,7 +148,7 @@ export default function ChecksPage() {
       queryClient.invalidateQueries({ queryKey: ["/api/checks"] });
       toast({
         title: t("common.success"),
-        description: t("checks.statusUpdateSuccess", "Check status updated"),
+        description: t("checks.statusUpdateSuccess"),
       });
     },
   });
@@ -210,7 +210,7 @@ export default function ChecksPage() {
           setIsDialogOpen(true);
           toast({
             title: t("common.success"),
-            description: t("checks.extractSuccess", "Check data extracted successfully. Please verify."),
+            description: t("checks.extractSuccess"),
           });
         }
       };
@@ -220,7 +220,7 @@ export default function ChecksPage() {
       toast({
         variant: "destructive",
         title: t("common.error"),
-        description: t("checks.extractFailed", "Failed to extract check data"),
+        description: t("checks.extractFailed"),
       });
     } finally {
       setIsScanning(false);
@@ -257,9 +257,9 @@ export default function ChecksPage() {
     <PageContainer className="space-y-6 px-4 sm:px-6 md:px-8 py-6">
       <div className="flex flex-col space-y-4 sm:flex-row sm:items-center sm:justify-between sm:space-y-0">
         <div>
-          <h1 className="text-2xl sm:text-3xl font-bold tracking-tight">{t("checks.title", "Checks Management")}</h1>
+          <h1 className="text-2xl sm:text-3xl font-bold tracking-tight">{t("checks.title")}</h1>
           <p className="text-muted-foreground">
-            {t("checks.subtitle", "Manage incoming and outgoing checks")}
+            {t("checks.subtitle")}
           </p>
         </div>
         <div className="flex flex-col sm:flex-row gap-2 w-full sm:w-auto">
@@ -277,7 +277,7 @@ export default function ChecksPage() {
               ) : (
                 <ScanLine className="me-2 h-4 w-4" />
               )}
-              {isScanning ? t("checks.scanning", "Scanning...") : t("checks.scanCheck", "Scan Check (AI)")}
+              {isScanning ? t("checks.scanning") : t("checks.scanCheck")}
             </Button>
           </div>
 
@@ -285,13 +285,13 @@ export default function ChecksPage() {
             <DialogTrigger asChild>
               <Button onClick={resetForm} className="w-full sm:w-auto">
                 <Plus className="me-2 h-4 w-4" />
-                {t("checks.add", "Add Check")}
+                {t("checks.add")}
               </Button>
             </DialogTrigger>
             <DialogContent className="sm:max-w-[600px] max-h-[90vh] overflow-y-auto">
               <DialogHeader>
                 <DialogTitle>
-                  {activeTab === 'receivable' ? t("checks.addReceivable", "Record Received Check") : t("checks.addPayable", "Record Issued Check")}
+                  {activeTab === 'receivable' ? t("checks.addReceivable") : t("checks.addPayable")}
                 </DialogTitle>
               </DialogHeader>
               <form onSubmit={handleSubmit} className="grid grid-cols-1 sm:grid-cols-2 gap-4">
@@ -304,7 +304,7 @@ export default function ChecksPage() {
                   />
                 </div>
                 <div className="space-y-2">
-                  <Label>{t("checks.bankName", "Bank Name")}</Label>
+                  <Label>{t("checks.bankName")}</Label>
                   <Input
                     value={formData.bank_name}
                     onChange={(e) => setFormData({ ...formData, bank_name: e.target.value })}
@@ -312,7 +312,7 @@ export default function ChecksPage() {
                   />
                 </div>
                 <div className="space-y-2">
-                  <Label>{t("common.amount", "Amount")}</Label>
+                  <Label>{t("common.amount")}</Label>
                   <Input
                     type="number"
                     step="0.01"
@@ -322,7 +322,7 @@ export default function ChecksPage() {
                   />
                 </div>
                 <div className="space-y-2">
-                  <Label>{t("common.currency", "Currency")}</Label>
+                  <Label>{t("common.currency")}</Label>
                   <Select
                     value={formData.currency}
                     onValueChange={(val) => setFormData({ ...formData, currency: val })}
@@ -340,7 +340,7 @@ export default function ChecksPage() {
                   </Select>
                 </div>
                 <div className="space-y-2">
-                  <Label>{t("checks.issueDate", "Issue Date")}</Label>
+                  <Label>{t("checks.issueDate")}</Label>
                   <Input
                     type="date"
                     value={formData.issue_date}
@@ -349,7 +349,7 @@ export default function ChecksPage() {
                   />
                 </div>
                 <div className="space-y-2">
-                  <Label>{t("checks.dueDate", "Due Date")}</Label>
+                  <Label>{t("checks.dueDate")}</Label>
                   <Input
                     type="date"
                     value={formData.date}
@@ -358,7 +358,7 @@ export default function ChecksPage() {
                   />
                 </div>
                 <div className="space-y-2 sm:col-span-2">
-                  <Label>{activeTab === 'receivable' ? t("common.customer", "Customer") : t("common.supplier", "Supplier")}</Label>
+                  <Label>{activeTab === 'receivable' ? t("common.customer") : t("common.supplier")}</Label>
                   <Select
                     value={formData.contact_id}
                     onValueChange={(val) => setFormData({ ...formData, contact_id: val })}
@@ -378,7 +378,7 @@ export default function ChecksPage() {
                   </Select>
                 </div>
                 <div className="space-y-2 sm:col-span-2">
-                  <Label>{t("common.description", "Description")}</Label>
+                  <Label>{t("common.description")}</Label>
                   <Input
                     value={formData.description}
                     onChange={(e) => setFormData({ ...formData, description: e.target.value })}
@@ -386,7 +386,7 @@ export default function ChecksPage() {
                 </div>
                 <DialogFooter className="sm:col-span-2 flex flex-col-reverse sm:flex-row sm:justify-end gap-2">
                   <Button type="submit" disabled={createMutation.isPending} className="w-full sm:w-auto">
-                    {t("common.save", "Save")}
+                    {t("common.save")}
                   </Button>
                 </DialogFooter>
               </form>
@@ -398,7 +398,7 @@ export default function ChecksPage() {
         <div className="relative w-72 mb-4">
           <Search className="absolute start-2 top-2.5 h-4 w-4 text-muted-foreground" />
           <Input
-            placeholder={t("common.search", "Search checks...")}
+            placeholder={t("common.search")}
             value={searchTerm}
             onChange={(e) => setSearchTerm(e.target.value)}
             className="ps-8"
@@ -407,8 +407,8 @@ export default function ChecksPage() {
 
         <Tabs defaultValue="receivable" onValueChange={setActiveTab} className="w-full">
           <TabsList className="flex flex-wrap w-full h-auto min-h-10 gap-1 sm:gap-2 mb-4">
-            <TabsTrigger value="receivable">{t("checks.receivable", "Receivable")}</TabsTrigger>
-            <TabsTrigger value="payable">{t("checks.payable", "Payable")}</TabsTrigger>
+            <TabsTrigger value="receivable">{t("checks.receivable")}</TabsTrigger>
+            <TabsTrigger value="payable">{t("checks.payable")}</TabsTrigger>
           </TabsList>
         </Tabs>
 
@@ -418,25 +418,25 @@ export default function ChecksPage() {
               <TableHeader>
                 <TableRow>
                   <TableHead>{t("checks.number", "Check #")}</TableHead>
-                  <TableHead>{t("checks.bank", "Bank")}</TableHead>
-                  <TableHead>{t("common.contact", "Contact")}</TableHead>
-                                    <TableHead>{t("checks.dueDate", "Due Date")}</TableHead>
-                  <TableHead>{t("common.amount", "Amount")}</TableHead>
-                  <TableHead>{t("common.status", "Status")}</TableHead>
-                  <TableHead className="text-end">{t("common.actions", "Actions")}</TableHead>
+                  <TableHead>{t("checks.bank")}</TableHead>
+                  <TableHead>{t("common.contact")}</TableHead>
+                                    <TableHead>{t("checks.dueDate")}</TableHead>
+                  <TableHead>{t("common.amount")}</TableHead>
+                  <TableHead>{t("common.status")}</TableHead>
+                  <TableHead className="text-end">{t("common.actions")}</TableHead>
                 </TableRow>
               </TableHeader>
               <TableBody>
                 {isLoading ? (
                   <TableRow>
                     <TableCell colSpan={7} className="text-center py-8">
-                      {t("common.loading", "Loading...")}
+                      {t("common.loading")}
                     </TableCell>
                   </TableRow>
                 ) : filteredChecks.length === 0 ? (
                   <TableRow>
                     <TableCell colSpan={7} className="text-center py-8 text-muted-foreground">
-                      {t("checks.noChecks", "No checks found")}
+                      {t("checks.noChecks")}
                     </TableCell>
                   </TableRow>
                 ) : (
@@ -480,12 +480,12 @@ export default function ChecksPage() {
                           </Button>
                           {/* Status actions */}
                           {check.status === 'on_hand' && (
-                            <Button variant="ghost" size="icon" title={t("checks.markDeposited", "Mark Deposited")} onClick={() => statusMutation.mutate({ id: check.id, status: 'deposited' })}>
+                            <Button variant="ghost" size="icon" title={t("checks.markDeposited")} onClick={() => statusMutation.mutate({ id: check.id, status: 'deposited' })}>
                               <ArrowUpRight className="h-4 w-4 text-blue-600" />
                             </Button>
                           )}
                           {check.status === 'deposited' && (
-                            <Button variant="ghost" size="icon" title={t("checks.markCleared", "Mark Cleared")} onClick={() => statusMutation.mutate({ id: check.id, status: 'cleared' })}>
+                            <Button variant="ghost" size="icon" title={t("checks.markCleared")} onClick={() => statusMutation.mutate({ id: check.id, status: 'cleared' })}>
                               <FileCheck className="h-4 w-4 text-green-600" />
                             </Button>
                           )}
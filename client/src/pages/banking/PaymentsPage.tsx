@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useState, useMemo } from 'react';
 import { useQuery, useMutation } from '@tanstack/react-query';
 import { queryClient, apiRequest } from '@/lib/queryClient';
 import { useCompanyCurrency } from '@/hooks/use-company-currency';
@@ -125,7 +125,7 @@ export default function PaymentsPage() {
   );
   
   // Localized form schema
-  const paymentSchema = z.object({
+  const paymentSchema = useMemo(() => z.object({
     vendor_id: z.string().min(1, t('validation.selectVendor')),
     description: z.string().min(2, t('validation.descriptionMin2')),
     amount: z.string().min(1, t('validation.amountRequired')),
@@ -134,15 +134,15 @@ export default function PaymentsPage() {
     bank_account_id: z.string().optional(),
     reference: z.string().optional(),
     notes: z.string().optional(),
-  });
+  }), [t, i18n.language]);
   
-  const statusConfig = {
+  const statusConfig = useMemo(() => ({
     pending: { label: t('common.pending'), icon: Clock, color: 'default' },
     scheduled: { label: t('common.scheduled'), icon: Calendar, color: 'secondary' },
     completed: { label: t('common.completed'), icon: CheckCircle, color: 'success' },
     failed: { label: t('common.failed'), icon: XCircle, color: 'destructive' },
     cancelled: { label: t('common.cancelled'), icon: XCircle, color: 'secondary' },
-  };
+  }), [t, i18n.language]);
   
   // Fetch contacts (vendors/suppliers)
   const { data: contacts = [] } = useQuery<any[]>({
@@ -380,7 +380,7 @@ export default function PaymentsPage() {
           <Link href="/reports/ai-analytics?source=payments-form">
             <Button variant="ghost" size={isMobile ? 'sm' : 'default'} className="hidden md:inline-flex">
               <BarChart3 className="h-4 w-4 me-2" />
-              {t('reports.aiAnalytics.title', { defaultValue: 'AI Analytics' })}
+              {t('reports.aiAnalytics.title')}
             </Button>
           </Link>
           <Dialog open={showDialog} onOpenChange={setShowDialog}>
@@ -448,7 +448,7 @@ export default function PaymentsPage() {
                       <div className="flex items-center justify-between">
                         <FormLabel>{t('common.description')}</FormLabel>
                         <Button type="button" size="sm" variant="outline" onClick={onSuggestAI} disabled={aiClassify.isPending}>
-                          {aiClassify.isPending ? t('ai.generating', { defaultValue: 'Generating…' }) : t('ai.suggest', { defaultValue: 'Suggest' })}
+                          {aiClassify.isPending ? t('ai.generating') : t('ai.suggest')}
                         </Button>
                       </div>
                       <FormControl>
@@ -459,10 +459,10 @@ export default function PaymentsPage() {
                       </FormControl>
                       {aiHint && (
                         <div className="text-xs text-muted-foreground mt-1">
-                          {t('ai.suggested', { defaultValue: 'Suggested' })}: <span className="font-medium">{aiHint.category}</span> · {Math.round(aiHint.confidence * 100)}%
+                          {t('ai.suggested')}: <span className="font-medium">{aiHint.category}</span> · {Math.round(aiHint.confidence * 100)}%
                           {aiHint.accounts ? (
                             <>
-                              {' '}· {t('ai.accounts', { defaultValue: 'Accounts' })}: {[
+                              {' '}· {t('ai.accounts')}: {[
                                 ...(aiHint.accounts.debit || []),
                                 ...(aiHint.accounts.credit || []),
                               ].slice(0,3).join(', ')}
@@ -528,11 +528,11 @@ export default function PaymentsPage() {
                     name="bank_account_id"
                     render={({ field }) => (
                       <FormItem>
-                        <FormLabel>{t('banking.payments.paidFromAccount', { defaultValue: 'دُفع من حساب' })}</FormLabel>
+                        <FormLabel>{t('banking.payments.paidFromAccount')}</FormLabel>
                         <Select onValueChange={field.onChange} value={field.value}>
                           <FormControl>
                             <SelectTrigger>
-                              <SelectValue placeholder={t('banking.payments.selectPaidFromAccount', { defaultValue: 'اختر حساب الدفع' })} />
+                              <SelectValue placeholder={t('banking.payments.selectPaidFromAccount')} />
                             </SelectTrigger>
                           </FormControl>
                           <SelectContent>
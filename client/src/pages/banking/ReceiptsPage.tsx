@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useState, useMemo } from 'react';
 import type { TFunction } from 'i18next';
 import { useQuery, useMutation } from '@tanstack/react-query';
 import { queryClient, apiRequest } from '@/lib/queryClient';
@@ -128,12 +128,12 @@ export default function ReceiptsPage() {
            (a.account_subtype === 'cash' || a.account_subtype === 'current_asset')
   );
   
-  const statusConfig = {
+  const statusConfig = useMemo(() => ({
     pending: { label: t('common.pending'), icon: Clock, color: 'default' },
     received: { label: t('statuses.received'), icon: CheckCircle, color: 'success' },
     cleared: { label: t('statuses.cleared'), icon: CheckCircle, color: 'success' },
     bounced: { label: t('statuses.bounced'), icon: XCircle, color: 'destructive' },
-  };
+  }), [t, i18n.language]);
   
   // Fetch contacts (customers)
   const { data: contacts = [] } = useQuery<any[]>({
@@ -371,7 +371,7 @@ export default function ReceiptsPage() {
           <Link href="/reports/ai-analytics?source=receipts-form">
             <Button variant="ghost" size={isMobile ? 'sm' : 'default'} className="hidden md:inline-flex">
               <BarChart3 className="h-4 w-4 me-2" />
-              {t('reports.aiAnalytics.title', { defaultValue: 'AI Analytics' })}
+              {t('reports.aiAnalytics.title')}
             </Button>
           </Link>
           <Dialog open={showDialog} onOpenChange={setShowDialog}>
@@ -439,7 +439,7 @@ export default function ReceiptsPage() {
                       <div className="flex items-center justify-between">
                         <FormLabel>{t('common.description')}</FormLabel>
                         <Button type="button" size="sm" variant="outline" onClick={onSuggestAI} disabled={aiClassify.isPending}>
-                          {aiClassify.isPending ? t('ai.generating', { defaultValue: 'Generating…' }) : t('ai.suggest', { defaultValue: 'Suggest' })}
+                          {aiClassify.isPending ? t('ai.generating') : t('ai.suggest')}
                         </Button>
                       </div>
                       <FormControl>
@@ -450,10 +450,10 @@ export default function ReceiptsPage() {
                       </FormControl>
                       {aiHint && (
                         <div className="text-xs text-muted-foreground mt-1">
-                          {t('ai.suggested', { defaultValue: 'Suggested' })}: <span className="font-medium">{aiHint.category}</span> · {Math.round(aiHint.confidence * 100)}%
+                          {t('ai.suggested')}: <span className="font-medium">{aiHint.category}</span> · {Math.round(aiHint.confidence * 100)}%
                           {aiHint.accounts ? (
                             <>
-                              {' '}· {t('ai.accounts', { defaultValue: 'Accounts' })}: {[
+                              {' '}· {t('ai.accounts')}: {[
                                 ...(aiHint.accounts.debit || []),
                                 ...(aiHint.accounts.credit || []),
                               ].slice(0,3).join(', ')}
@@ -519,11 +519,11 @@ export default function ReceiptsPage() {
                     name="bank_account_id"
                     render={({ field }) => (
                       <FormItem>
-                        <FormLabel>{t('banking.receipts.depositToAccount', { defaultValue: 'إيداع في حساب' })}</FormLabel>
+                        <FormLabel>{t('banking.receipts.depositToAccount')}</FormLabel>
                         <Select onValueChange={field.onChange} value={field.value}>
                           <FormControl>
                             <SelectTrigger>
-                              <SelectValue placeholder={t('banking.receipts.selectDepositAccount', { defaultValue: 'اختر حساب الإيداع' })} />
+                              <SelectValue placeholder={t('banking.receipts.selectDepositAccount')} />
                             </SelectTrigger>
                           </FormControl>
                           <SelectContent>
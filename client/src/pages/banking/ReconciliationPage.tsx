@@ -249,7 +249,7 @@ export default function ReconciliationPage() {
     onSuccess: () => {
   queryClient.invalidateQueries({ queryKey: [suggestionsKey] });
       queryClient.invalidateQueries({ queryKey: ['/api/banking/reconciliation/allocations/recent'] });
-      toast({ title: t('banking.reconciliation.unmatched', 'Unmatched'), description: t('banking.reconciliation.unmatchedDesc', 'The allocation has been removed.') });
+      toast({ title: t('banking.reconciliation.unmatched'), description: t('banking.reconciliation.unmatchedDesc') });
     },
     onError: (error: any) => {
       toast({ title: t('common.error'), description: error.message || 'Failed to unmatch', variant: 'destructive' });
@@ -321,7 +321,7 @@ export default function ReconciliationPage() {
       const preview: any = await autoMatchMutation.mutateAsync(buildAutoMatchPayload(true));
       const wouldCount = (preview?.actions || []).filter((a: any) => a.status === 'would-allocate').length;
       if (wouldCount === 0) {
-        toast({ title: t('banking.reconciliation.noAutoMatches', { defaultValue: 'No auto-matches found' }), description: t('banking.reconciliation.adjustFilters', { defaultValue: 'Try adjusting your filters or date range.' }) });
+        toast({ title: t('banking.reconciliation.noAutoMatches'), description: t('banking.reconciliation.adjustFilters') });
         return;
       }
       setPreviewData(preview);
@@ -333,7 +333,7 @@ export default function ReconciliationPage() {
       } catch {}
       setPreviewOpen(true);
     } catch (e: any) {
-      toast({ title: t('common.error'), description: e?.message || t('banking.reconciliation.autoMatchFailed', { defaultValue: 'Auto-match failed' }), variant: 'destructive' });
+      toast({ title: t('common.error'), description: e?.message || t('banking.reconciliation.autoMatchFailed'), variant: 'destructive' });
     }
   };
 
@@ -360,11 +360,11 @@ export default function ReconciliationPage() {
       const createdCount = Number(result?.allocations_created || 0);
       const createdIds: string[] = Array.isArray(result?.allocation_ids) ? result.allocation_ids : [];
       toast({
-        title: t('banking.reconciliation.autoCompleted', { defaultValue: 'Auto-match completed' }),
-        description: t('banking.reconciliation.autoSummary', { defaultValue: 'Created {count} allocations', count: createdCount }) as string,
+        title: t('banking.reconciliation.autoCompleted'),
+        description: t('banking.reconciliation.autoSummary', { count: createdCount }) as string,
         action: createdIds.length > 0 ? (
           <ToastAction
-            altText={t('common.undo', { defaultValue: 'Undo' }) as string}
+            altText={t('common.undo') as string}
             onClick={async () => {
               try {
                 // Prefer batch undo endpoint when available; fall back to individual deletes if not
@@ -381,18 +381,18 @@ export default function ReconciliationPage() {
                 }
                 queryClient.invalidateQueries({ queryKey: [suggestionsKey] });
                 queryClient.invalidateQueries({ queryKey: ['/api/banking/reconciliation/allocations/recent'] });
-                toast({ title: t('common.undone', { defaultValue: 'Undone' }), description: t('banking.reconciliation.undoAutoMatch', { defaultValue: 'Reverted allocations' }) });
+                toast({ title: t('common.undone'), description: t('banking.reconciliation.undoAutoMatch') });
               } catch (err: any) {
                 toast({ title: t('common.error'), description: err?.message || 'Failed to undo', variant: 'destructive' });
               }
             }}
           >
-            {t('common.undo', { defaultValue: 'Undo' })}
+            {t('common.undo')}
           </ToastAction>
         ) : undefined,
       });
     } catch (e: any) {
-      toast({ title: t('common.error'), description: e?.message || t('banking.reconciliation.autoMatchFailed', { defaultValue: 'Auto-match failed' }), variant: 'destructive' });
+      toast({ title: t('common.error'), description: e?.message || t('banking.reconciliation.autoMatchFailed'), variant: 'destructive' });
     }
   };
 
@@ -413,7 +413,7 @@ export default function ReconciliationPage() {
         },
       }));
     } catch (e) {
-      toast({ title: t('common.error'), description: (e as any)?.message || t('banking.reconciliation.suggestionFailed', { defaultValue: 'Failed to get suggestion' }), variant: 'destructive' });
+      toast({ title: t('common.error'), description: (e as any)?.message || t('banking.reconciliation.suggestionFailed'), variant: 'destructive' });
     }
   };
 
@@ -437,9 +437,9 @@ export default function ReconciliationPage() {
         }
       });
       setAiSuggestions(prev => ({ ...prev, ...map }));
-      toast({ title: t('ai.suggestionsReady', { defaultValue: 'AI suggestions ready' }), description: t('ai.suggestedForN', { defaultValue: 'Generated suggestions for {count} transactions', count: results.length }) });
+      toast({ title: t('ai.suggestionsReady'), description: t('ai.suggestedForN', { count: results.length }) });
     } catch (e) {
-      toast({ title: t('common.error'), description: (e as any)?.message || t('banking.reconciliation.suggestionsFailed', { defaultValue: 'Failed to get suggestions' }), variant: 'destructive' });
+      toast({ title: t('common.error'), description: (e as any)?.message || t('banking.reconciliation.suggestionsFailed'), variant: 'destructive' });
     }
   };
 
@@ -484,9 +484,9 @@ export default function ReconciliationPage() {
               asChild
             >
               {/* anchor child provided by Link */}
-              <a aria-label={t('reports.aiAnalytics.title', { defaultValue: 'AI Analytics' }) as string}>
+              <a aria-label={t('reports.aiAnalytics.title') as string}>
                 <BarChart3 className="h-4 w-4 me-0 sm:me-2" />
-                <span className="hidden sm:inline">{t('reports.aiAnalytics.title', { defaultValue: 'AI Analytics' })}</span>
+                <span className="hidden sm:inline">{t('reports.aiAnalytics.title')}</span>
               </a>
             </Button>
           </Link>
@@ -506,7 +506,7 @@ export default function ReconciliationPage() {
             size={isMobile ? 'sm' : 'default'}
             className="w-full sm:w-auto"
           >
-            <span className="sm:hidden">{t('banking.reconciliation.completeShort', { defaultValue: 'Complete' })}</span>
+            <span className="sm:hidden">{t('banking.reconciliation.completeShort')}</span>
             <span className="hidden sm:inline">{t('banking.reconciliation.completeReconciliation')}</span>
           </Button>
         </div>
@@ -578,12 +578,12 @@ export default function ReconciliationPage() {
     <Card className="overflow-hidden">
       <CardHeader className="pb-3 px-4 pt-4">
       <div className="flex flex-col gap-4">
-            <CardTitle className="text-lg">{t('banking.reconciliation.suggestedMatches', 'Suggested Matches')}</CardTitle>
+            <CardTitle className="text-lg">{t('banking.reconciliation.suggestedMatches')}</CardTitle>
             {/* Filters container: stacked on mobile, dense grid on larger screens */}
             <div className="grid grid-cols-1 sm:grid-cols-2 md:grid-cols-3 xl:grid-cols-4 gap-2 sm:gap-3">
               {/* Presets */}
               <div className="flex flex-col w-full col-span-1 sm:col-span-2 md:col-span-3 xl:col-span-4">
-                <Label className="text-xs text-muted-foreground mb-1">{t('common.presets', { defaultValue: 'Presets' })}</Label>
+                <Label className="text-xs text-muted-foreground mb-1">{t('common.presets')}</Label>
                 <div className="flex flex-col sm:flex-row gap-2 items-stretch sm:items-center flex-wrap">
                   <Select value={activePreset || '__none__'} onValueChange={(name: any) => {
                     const realName = name === '__none__' ? '' : name;
@@ -594,52 +594,52 @@ export default function ReconciliationPage() {
                       <SelectValue placeholder={t('common.select', { defaultValue: 'Select' }) as string} />
                     </SelectTrigger>
                     <SelectContent>
-                      <SelectItem value="__none__">{t('common.none', { defaultValue: 'None' })}</SelectItem>
+                      <SelectItem value="__none__">{t('common.none')}</SelectItem>
                       {Object.keys(presets).map(name => (
                         <SelectItem key={name} value={name}>{name}</SelectItem>
                       ))}
                     </SelectContent>
                   </Select>
                   <Button className="w-full sm:w-auto text-xs" variant="outline" size="sm" onClick={() => {
-                    const name = window.prompt(t('banking.reconciliation.savePresetAs', { defaultValue: 'Save preset as' }) as string, activePreset || 'Default');
+                    const name = window.prompt(t('banking.reconciliation.savePresetAs') as string, activePreset || 'Default');
                     if (!name) return;
                     const next = { ...presets, [name]: currentFilters() };
                     savePresets(next);
                     setActivePreset(name);
-                    toast({ title: t('common.saved', { defaultValue: 'Saved' }), description: name });
-                  }}>{t('common.save', { defaultValue: 'Save' })}</Button>
+                    toast({ title: t('common.saved'), description: name });
+                  }}>{t('common.save')}</Button>
                   <Button className="w-full sm:w-auto text-xs" variant="ghost" size="sm" onClick={() => {
                     if (!activePreset) return;
-                    if (!window.confirm(t('common.deleteConfirm', { defaultValue: 'Delete this preset?' }) as string)) return;
+                    if (!window.confirm(t('common.deleteConfirm') as string)) return;
                     const next = { ...presets };
                     delete next[activePreset];
                     savePresets(next);
                     setActivePreset('');
-                  }}>{t('common.delete', { defaultValue: 'Delete' })}</Button>
+                  }}>{t('common.delete')}</Button>
                 </div>
               </div>
               <div className="flex flex-col w-full">
-                <Label className="text-xs text-muted-foreground">{t('common.type', { defaultValue: 'Type' })}</Label>
+                <Label className="text-xs text-muted-foreground">{t('common.type')}</Label>
                 <Select value={typeFilter} onValueChange={(v: any) => setTypeFilter(v)}>
                   <SelectTrigger className="w-full h-8">
-                    <SelectValue placeholder={t('common.type', { defaultValue: 'Type' }) as string} />
+                    <SelectValue placeholder={t('common.type') as string} />
                   </SelectTrigger>
                   <SelectContent>
-                    <SelectItem value="both">{t('common.all', { defaultValue: 'All' })}</SelectItem>
-                    <SelectItem value="receipts">{t('banking.reconciliation.receipts', { defaultValue: 'Receipts' })}</SelectItem>
-                    <SelectItem value="payments">{t('banking.reconciliation.payments', { defaultValue: 'Payments' })}</SelectItem>
+                    <SelectItem value="both">{t('common.all')}</SelectItem>
+                    <SelectItem value="receipts">{t('banking.reconciliation.receipts')}</SelectItem>
+                    <SelectItem value="payments">{t('banking.reconciliation.payments')}</SelectItem>
                   </SelectContent>
                 </Select>
               </div>
               {/* Customer filter (applies to receipts) */}
               <div className="flex flex-col w-full">
-                <Label className="text-xs text-muted-foreground">{t('sales.customers.customer', { defaultValue: 'Customer' })}</Label>
+                <Label className="text-xs text-muted-foreground">{t('sales.customers.customer')}</Label>
                 <Select value={customerId || '__all__'} onValueChange={(v: any) => setCustomerId(v === '__all__' ? '' : v)}>
                   <SelectTrigger className="w-full h-8">
-                    <SelectValue placeholder={t('common.all', { defaultValue: 'All' }) as string} />
+                    <SelectValue placeholder={t('common.all') as string} />
                   </SelectTrigger>
                   <SelectContent>
-                    <SelectItem value="__all__">{t('common.all', { defaultValue: 'All' })}</SelectItem>
+                    <SelectItem value="__all__">{t('common.all')}</SelectItem>
                     {(Array.isArray(contacts) ? contacts : []).map((c: any) => (
                       <SelectItem key={c.id} value={c.id}>{c.name || c.company || c.email || c.id}</SelectItem>
                     ))}
@@ -648,13 +648,13 @@ export default function ReconciliationPage() {
               </div>
               {/* Vendor filter (applies to payments) */}
               <div className="flex flex-col w-full">
-                <Label className="text-xs text-muted-foreground">{t('purchases.vendors.vendor', { defaultValue: 'Vendor' })}</Label>
+                <Label className="text-xs text-muted-foreground">{t('purchases.vendors.vendor')}</Label>
                 <Select value={vendorId || '__all__'} onValueChange={(v: any) => setVendorId(v === '__all__' ? '' : v)}>
                   <SelectTrigger className="w-full h-8">
-                    <SelectValue placeholder={t('common.all', { defaultValue: 'All' }) as string} />
+                    <SelectValue placeholder={t('common.all') as string} />
                   </SelectTrigger>
                   <SelectContent>
-                    <SelectItem value="__all__">{t('common.all', { defaultValue: 'All' })}</SelectItem>
+                    <SelectItem value="__all__">{t('common.all')}</SelectItem>
                     {(Array.isArray(contacts) ? contacts : []).map((c: any) => (
                       <SelectItem key={c.id} value={c.id}>{c.name || c.company || c.email || c.id}</SelectItem>
                     ))}
@@ -662,54 +662,54 @@ export default function ReconciliationPage() {
                 </Select>
               </div>
               <div className="flex flex-col w-full">
-                <Label className="text-xs text-muted-foreground">{t('common.max', { defaultValue: 'Max' })}</Label>
+                <Label className="text-xs text-muted-foreground">{t('common.max')}</Label>
                 <Input type="number" min={1} max={1000} value={maxRows}
                   onChange={(e) => setMaxRows(Math.max(1, Math.min(1000, parseInt(e.target.value || '0', 10))))}
                   className="h-8 w-full" />
               </div>
               <div className="flex flex-col w-full">
-                <Label className="text-xs text-muted-foreground">{t('banking.reconciliation.maxCandidates', { defaultValue: 'Max candidates' })}</Label>
+                <Label className="text-xs text-muted-foreground">{t('banking.reconciliation.maxCandidates')}</Label>
                 <Input type="number" min={1} max={10} value={maxCandidates}
                   onChange={(e) => setMaxCandidates(Math.max(1, Math.min(10, parseInt(e.target.value || '0', 10))))}
                   className="h-8 w-full" />
               </div>
               <div className="flex flex-col w-full">
-                <Label className="text-xs text-muted-foreground">{t('banking.reconciliation.minScore', { defaultValue: 'Min score' })}</Label>
+                <Label className="text-xs text-muted-foreground">{t('banking.reconciliation.minScore')}</Label>
                 <Input type="number" min={0} max={1000} value={minScore}
                   onChange={(e) => setMinScore(Math.max(0, Math.min(1000, parseInt(e.target.value || '0', 10))))}
                   className="h-8 w-full" />
               </div>
               <div className="flex flex-col w-full">
-                <Label className="text-xs text-muted-foreground">{t('common.from', { defaultValue: 'From' })}</Label>
+                <Label className="text-xs text-muted-foreground">{t('common.from')}</Label>
                 <Input type="date" value={from} onChange={(e) => setFrom(e.target.value)} className="h-8 w-full" />
               </div>
               <div className="flex flex-col w-full">
-                <Label className="text-xs text-muted-foreground">{t('common.to', { defaultValue: 'To' })}</Label>
+                <Label className="text-xs text-muted-foreground">{t('common.to')}</Label>
                 <Input type="date" value={to} onChange={(e) => setTo(e.target.value)} className="h-8 w-full" />
               </div>
               <div className="flex flex-col w-full">
-                <Label className="text-xs text-muted-foreground">{t('banking.reconciliation.amountTolerance', { defaultValue: 'Amount tol.' })}</Label>
+                <Label className="text-xs text-muted-foreground">{t('banking.reconciliation.amountTolerance')}</Label>
                 <Input type="number" step="0.01" min={0} max={10} value={amountTol}
                   onChange={(e) => setAmountTol(Math.max(0, Math.min(10, parseFloat(e.target.value || '0'))))}
                   className="h-8 w-full" />
               </div>
               <div className="flex flex-col w-full">
-                <Label className="text-xs text-muted-foreground">{t('banking.reconciliation.maxDays', { defaultValue: 'Max days' })}</Label>
+                <Label className="text-xs text-muted-foreground">{t('banking.reconciliation.maxDays')}</Label>
                 <Input type="number" min={1} max={365} value={maxDays}
                   onChange={(e) => setMaxDays(Math.max(1, Math.min(365, parseInt(e.target.value || '0', 10))))}
                   className="h-8 w-full" />
               </div>
               <div className="flex items-center gap-2 mt-2">
                 <Checkbox id="preferExact" checked={preferExact} onCheckedChange={(v: any) => setPreferExact(Boolean(v))} />
-                <Label htmlFor="preferExact" className="text-xs text-muted-foreground">{t('banking.reconciliation.preferExact', { defaultValue: 'Prefer exact amount' })}</Label>
+                <Label htmlFor="preferExact" className="text-xs text-muted-foreground">{t('banking.reconciliation.preferExact')}</Label>
               </div>
               <div className="flex items-center gap-2 mt-2">
                 <Checkbox id="sameCurrencyOnly" checked={sameCurrencyOnly} onCheckedChange={(v: any) => setSameCurrencyOnly(Boolean(v))} />
-                <Label htmlFor="sameCurrencyOnly" className="text-xs text-muted-foreground">{t('banking.reconciliation.sameCurrencyOnly', { defaultValue: 'Same currency only' })}</Label>
+                <Label htmlFor="sameCurrencyOnly" className="text-xs text-muted-foreground">{t('banking.reconciliation.sameCurrencyOnly')}</Label>
               </div>
               <div className="flex items-center gap-2 mt-2">
                 <Checkbox id="highOnly" checked={highOnly} onCheckedChange={(v: any) => setHighOnly(Boolean(v))} />
-                <Label htmlFor="highOnly" className="text-xs text-muted-foreground">{t('banking.reconciliation.highOnly', { defaultValue: 'High confidence only' })}</Label>
+                <Label htmlFor="highOnly" className="text-xs text-muted-foreground">{t('banking.reconciliation.highOnly')}</Label>
               </div>
               <div className="mt-2">
                 <Button variant="secondary" size="sm" onClick={() => {
@@ -728,7 +728,7 @@ export default function ReconciliationPage() {
                   setHighOnly(false);
                   try { localStorage.removeItem(LS_KEY); } catch {}
                 }}>
-                  {t('common.reset', { defaultValue: 'Reset' })}
+                  {t('common.reset')}
                 </Button>
               </div>
             </div>
@@ -737,38 +737,38 @@ export default function ReconciliationPage() {
   <CardContent className="space-y-3 px-2 sm:px-4">
           {/* Suggestions summary */}
           <div className="flex items-center gap-3 flex-wrap text-xs text-muted-foreground">
-            <Badge variant="secondary" className="text-xs">{t('banking.reconciliation.receipts', { defaultValue: 'Receipts' })}: {counts.receipts}</Badge>
-            <Badge variant="secondary" className="text-xs">{t('banking.reconciliation.payments', { defaultValue: 'Payments' })}: {counts.payments}</Badge>
-            <Badge variant="outline" className="text-xs">{t('banking.reconciliation.highConfidence', { defaultValue: 'High confidence' })}: {counts.receiptsHigh + counts.paymentsHigh}</Badge>
+            <Badge variant="secondary" className="text-xs">{t('banking.reconciliation.receipts')}: {counts.receipts}</Badge>
+            <Badge variant="secondary" className="text-xs">{t('banking.reconciliation.payments')}: {counts.payments}</Badge>
+            <Badge variant="outline" className="text-xs">{t('banking.reconciliation.highConfidence')}: {counts.receiptsHigh + counts.paymentsHigh}</Badge>
           </div>
           <div className="grid grid-cols-1 md:grid-cols-2 gap-4">
             <div>
-              <h3 className="font-semibold mb-2">{t('banking.reconciliation.customerReceipts', 'Customer Receipts')}</h3>
+              <h3 className="font-semibold mb-2">{t('banking.reconciliation.customerReceipts')}</h3>
               <div className="space-y-2">
                 {(filteredSuggestions?.receipts || []).map((s: any) => {
                   const top = s.suggestions?.[0];
                   return (
                     <div key={s.paymentId} className={`flex items-center justify-between border rounded-md p-2 ${top?.high_confidence ? 'border-emerald-300 bg-emerald-50' : ''}`}>
                       <div>
-                        <div className="text-sm font-medium flex items-center gap-2">{t('banking.reconciliation.receipt', 'Receipt')} {s.receipt_number ? `#${s.receipt_number}` : ''} · {new Date(s.date).toLocaleDateString()}
+                        <div className="text-sm font-medium flex items-center gap-2">{t('banking.reconciliation.receipt')} {s.receipt_number ? `#${s.receipt_number}` : ''} · {new Date(s.date).toLocaleDateString()}
                           {top?.high_confidence ? (
-                            <Badge variant="default" className="bg-emerald-100 text-emerald-800 border-emerald-200 text-[10px]">{t('banking.reconciliation.highConfidence', { defaultValue: 'High confidence' })}</Badge>
+                            <Badge variant="default" className="bg-emerald-100 text-emerald-800 border-emerald-200 text-[10px]">{t('banking.reconciliation.highConfidence')}</Badge>
                           ) : null}
                         </div>
-                        <div className="text-xs text-muted-foreground">{s.customer_name ? `${t('sales.customers.customer', { defaultValue: 'Customer' })}: ${s.customer_name} · ` : ''}{t('common.amount')}: {s.amount.toFixed(2)} · {top ? `${t('sales.invoices.invoice')} ${top.invoice_number || ''}` : t('banking.reconciliation.noCandidate', 'No candidate')}
-                          {top?.currency_mismatch ? <span className="ms-2 text-amber-600">{t('banking.reconciliation.currencyMismatch', { defaultValue: 'Currency mismatch' })}</span> : null}
+                        <div className="text-xs text-muted-foreground">{s.customer_name ? `${t('sales.customers.customer')}: ${s.customer_name} · ` : ''}{t('common.amount')}: {s.amount.toFixed(2)} · {top ? `${t('sales.invoices.invoice')} ${top.invoice_number || ''}` : t('banking.reconciliation.noCandidate')}
+                          {top?.currency_mismatch ? <span className="ms-2 text-amber-600">{t('banking.reconciliation.currencyMismatch')}</span> : null}
                           {typeof top?.total_score === 'number' ? (
                             <Tooltip>
                               <TooltipTrigger asChild>
                                 <span className="ms-2 underline decoration-dotted cursor-help">
-                                  {t('banking.reconciliation.score', { defaultValue: 'score' })}: a:{top?.amount_score ?? 0} + d:{top?.date_score ?? 0} = {top?.total_score}
+                                  {t('banking.reconciliation.score')}: a:{top?.amount_score ?? 0} + d:{top?.date_score ?? 0} = {top?.total_score}
                                 </span>
                               </TooltipTrigger>
                               <TooltipContent side="top">
                                 <div className="max-w-xs text-xs">
-                                  <div className="font-medium mb-1">{t('banking.reconciliation.scoreExplain', { defaultValue: 'Score breakdown' })}</div>
-                                  <div>• a: {t('banking.reconciliation.amountScore', { defaultValue: 'amount score: exact match gets +100' })}</div>
-                                  <div>• d: {t('banking.reconciliation.dateScore', { defaultValue: 'date score: closer dates score higher' })}</div>
+                                  <div className="font-medium mb-1">{t('banking.reconciliation.scoreExplain')}</div>
+                                  <div>• a: {t('banking.reconciliation.amountScore')}</div>
+                                  <div>• d: {t('banking.reconciliation.dateScore')}</div>
                                 </div>
                               </TooltipContent>
                             </Tooltip>
@@ -776,7 +776,7 @@ export default function ReconciliationPage() {
                         </div>
                       </div>
                       {top && (
-                        <Button size="sm" onClick={() => handleQuickMatch(s, top)} disabled={allocateMutation.isPending}>{t('banking.reconciliation.match', 'Match')}</Button>
+                        <Button size="sm" onClick={() => handleQuickMatch(s, top)} disabled={allocateMutation.isPending}>{t('banking.reconciliation.match')}</Button>
                       )}
                     </div>
                   );
@@ -784,32 +784,32 @@ export default function ReconciliationPage() {
               </div>
             </div>
             <div>
-              <h3 className="font-semibold mb-2">{t('banking.reconciliation.vendorPayments', 'Vendor Payments')}</h3>
+              <h3 className="font-semibold mb-2">{t('banking.reconciliation.vendorPayments')}</h3>
               <div className="space-y-2">
                 {(filteredSuggestions?.payments || []).map((s: any) => {
                   const top = s.suggestions?.[0];
                   return (
                     <div key={s.paymentId} className={`flex items-center justify-between border rounded-md p-2 ${top?.high_confidence ? 'border-emerald-300 bg-emerald-50' : ''}`}>
                       <div>
-                        <div className="text-sm font-medium flex items-center gap-2">{t('banking.reconciliation.payment', 'Payment')} {s.payment_number ? `#${s.payment_number}` : ''} · {new Date(s.date).toLocaleDateString()}
+                        <div className="text-sm font-medium flex items-center gap-2">{t('banking.reconciliation.payment')} {s.payment_number ? `#${s.payment_number}` : ''} · {new Date(s.date).toLocaleDateString()}
                           {top?.high_confidence ? (
-                            <Badge variant="default" className="bg-emerald-100 text-emerald-800 border-emerald-200 text-[10px]">{t('banking.reconciliation.highConfidence', { defaultValue: 'High confidence' })}</Badge>
+                            <Badge variant="default" className="bg-emerald-100 text-emerald-800 border-emerald-200 text-[10px]">{t('banking.reconciliation.highConfidence')}</Badge>
                           ) : null}
                         </div>
-                        <div className="text-xs text-muted-foreground">{s.vendor_name ? `${t('purchases.vendors.vendor', { defaultValue: 'Vendor' })}: ${s.vendor_name} · ` : ''}{t('common.amount')}: {s.amount.toFixed(2)} · {top ? `${t('purchases.bills.bill')} ${top.bill_number || ''}` : t('banking.reconciliation.noCandidate', 'No candidate')}
-                          {top?.currency_mismatch ? <span className="ms-2 text-amber-600">{t('banking.reconciliation.currencyMismatch', { defaultValue: 'Currency mismatch' })}</span> : null}
+                        <div className="text-xs text-muted-foreground">{s.vendor_name ? `${t('purchases.vendors.vendor')}: ${s.vendor_name} · ` : ''}{t('common.amount')}: {s.amount.toFixed(2)} · {top ? `${t('purchases.bills.bill')} ${top.bill_number || ''}` : t('banking.reconciliation.noCandidate')}
+                          {top?.currency_mismatch ? <span className="ms-2 text-amber-600">{t('banking.reconciliation.currencyMismatch')}</span> : null}
                           {typeof top?.total_score === 'number' ? (
                             <Tooltip>
                               <TooltipTrigger asChild>
                                 <span className="ms-2 underline decoration-dotted cursor-help">
-                                  {t('banking.reconciliation.score', { defaultValue: 'score' })}: a:{top?.amount_score ?? 0} + d:{top?.date_score ?? 0} = {top?.total_score}
+                                  {t('banking.reconciliation.score')}: a:{top?.amount_score ?? 0} + d:{top?.date_score ?? 0} = {top?.total_score}
                                 </span>
                               </TooltipTrigger>
                               <TooltipContent side="top">
                                 <div className="max-w-xs text-xs">
-                                  <div className="font-medium mb-1">{t('banking.reconciliation.scoreExplain', { defaultValue: 'Score breakdown' })}</div>
-                                  <div>• a: {t('banking.reconciliation.amountScore', { defaultValue: 'amount score: exact match gets +100' })}</div>
-                                  <div>• d: {t('banking.reconciliation.dateScore', { defaultValue: 'date score: closer dates score higher' })}</div>
+                                  <div className="font-medium mb-1">{t('banking.reconciliation.scoreExplain')}</div>
+                                  <div>• a: {t('banking.reconciliation.amountScore')}</div>
+                                  <div>• d: {t('banking.reconciliation.dateScore')}</div>
                                 </div>
                               </TooltipContent>
                             </Tooltip>
@@ -817,7 +817,7 @@ export default function ReconciliationPage() {
                         </div>
                       </div>
                       {top && (
-                        <Button size="sm" onClick={() => handleQuickMatch(s, top)} disabled={allocateMutation.isPending}>{t('banking.reconciliation.match', 'Match')}</Button>
+                        <Button size="sm" onClick={() => handleQuickMatch(s, top)} disabled={allocateMutation.isPending}>{t('banking.reconciliation.match')}</Button>
                       )}
                     </div>
                   );
@@ -832,9 +832,9 @@ export default function ReconciliationPage() {
       <Dialog open={previewOpen} onOpenChange={(open) => { setPreviewOpen(open); if (!open) setSelectedActionKeys(new Set()); }}>
         <DialogContent className="sm:max-w-[600px] max-h-[90vh] overflow-y-auto">
           <DialogHeader>
-            <DialogTitle>{t('banking.reconciliation.autoPreview', { defaultValue: 'Auto-match preview' })}</DialogTitle>
+            <DialogTitle>{t('banking.reconciliation.autoPreview')}</DialogTitle>
             <DialogDescription>
-              {t('banking.reconciliation.autoPreviewDesc', { defaultValue: 'These exact-amount unique matches will be allocated.' })}
+              {t('banking.reconciliation.autoPreviewDesc')}
             </DialogDescription>
           </DialogHeader>
           <div className="flex items-center justify-between mb-2 text-sm">
@@ -851,7 +851,7 @@ export default function ReconciliationPage() {
                   }
                 }}
               />
-              <Label htmlFor="selectAll">{t('common.selectAll', { defaultValue: 'Select all' })}</Label>
+              <Label htmlFor="selectAll">{t('common.selectAll')}</Label>
               <Button
                 variant="ghost"
                 size="sm"
@@ -859,7 +859,7 @@ export default function ReconciliationPage() {
                   const would = (previewData?.actions || []).filter((a: any) => a.status === 'would-allocate' && a.paymentType === 'receipt');
                   setSelectedActionKeys(new Set<string>(would.map((a: any) => actionKeyOf(a))));
                 }}
-              >{t('banking.reconciliation.selectReceipts', { defaultValue: 'Receipts only' })}</Button>
+              >{t('banking.reconciliation.selectReceipts')}</Button>
               <Button
                 variant="ghost"
                 size="sm"
@@ -867,7 +867,7 @@ export default function ReconciliationPage() {
                   const would = (previewData?.actions || []).filter((a: any) => a.status === 'would-allocate' && a.paymentType === 'payment');
                   setSelectedActionKeys(new Set<string>(would.map((a: any) => actionKeyOf(a))));
                 }}
-              >{t('banking.reconciliation.selectPayments', { defaultValue: 'Payments only' })}</Button>
+              >{t('banking.reconciliation.selectPayments')}</Button>
               <Button
                 variant="ghost"
                 size="sm"
@@ -875,10 +875,10 @@ export default function ReconciliationPage() {
                   const would = (previewData?.actions || []).filter((a: any) => a.status === 'would-allocate' && a.high_confidence);
                   setSelectedActionKeys(new Set<string>(would.map((a: any) => actionKeyOf(a))));
                 }}
-              >{t('banking.reconciliation.selectHighConfidence', { defaultValue: 'High confidence only' })}</Button>
+              >{t('banking.reconciliation.selectHighConfidence')}</Button>
             </div>
             <div className="text-muted-foreground">
-              {t('common.selected', { defaultValue: 'Selected' })}: {Array.from(selectedActionKeys).length} / {(previewData?.actions || []).filter((a: any) => a.status === 'would-allocate').length}
+              {t('common.selected')}: {Array.from(selectedActionKeys).length} / {(previewData?.actions || []).filter((a: any) => a.status === 'would-allocate').length}
             </div>
           </div>
           <div className="flex items-center justify-between mb-3 text-xs">
@@ -895,9 +895,9 @@ export default function ReconciliationPage() {
                     return next;
                   });
                 }}
-              >{t('banking.reconciliation.deselectCurrencyMismatch', { defaultValue: 'Deselect currency mismatch' })}</Button>
+              >{t('banking.reconciliation.deselectCurrencyMismatch')}</Button>
               <div className="flex items-center gap-2">
-                <Label>{t('banking.reconciliation.maxDateDiff', { defaultValue: 'Max Δ days' })}</Label>
+                <Label>{t('banking.reconciliation.maxDateDiff')}</Label>
                 <Input
                   className="h-7 w-16"
                   type="number" min={1} max={365}
@@ -916,7 +916,7 @@ export default function ReconciliationPage() {
                       return next;
                     });
                   }}
-                >{t('banking.reconciliation.deselectAbove', { defaultValue: 'Deselect above' })}</Button>
+                >{t('banking.reconciliation.deselectAbove')}</Button>
               </div>
             </div>
           </div>
@@ -928,10 +928,10 @@ export default function ReconciliationPage() {
                     <TableHead className="w-8"></TableHead>
                     <TableHead>{t('common.type')}</TableHead>
                     <TableHead>{t('common.document')}</TableHead>
-                    <TableHead>{t('common.counterparty', { defaultValue: 'Counterparty' })}</TableHead>
+                    <TableHead>{t('common.counterparty')}</TableHead>
                     <TableHead>{t('common.date')}</TableHead>
                     <TableHead>{t('common.status')}</TableHead>
-                    <TableHead>{t('common.notes', { defaultValue: 'Notes' })}</TableHead>
+                    <TableHead>{t('common.notes')}</TableHead>
                     <TableHead className="text-end">{t('common.amount')}</TableHead>
                   </TableRow>
                 </TableHeader>
@@ -954,7 +954,7 @@ export default function ReconciliationPage() {
                       </TableCell>
                       <TableCell>
                         <Badge variant="secondary" className="text-xs">
-                          {a.paymentType === 'receipt' ? t('banking.reconciliation.receipt', 'Receipt') : t('banking.reconciliation.payment', 'Payment')} → {a.documentType === 'invoice' ? t('sales.invoices.invoice', 'Invoice') : t('purchases.bills.bill', 'Bill')}
+                          {a.paymentType === 'receipt' ? t('banking.reconciliation.receipt') : t('banking.reconciliation.payment')} → {a.documentType === 'invoice' ? t('sales.invoices.invoice') : t('purchases.bills.bill')}
                         </Badge>
                       </TableCell>
                       <TableCell>{a.document_ref || a.documentId}</TableCell>
@@ -962,36 +962,36 @@ export default function ReconciliationPage() {
                       <TableCell>{a.date ? new Date(a.date).toLocaleDateString(i18n.language) : '-'}</TableCell>
                       <TableCell>
                         {a.status === 'would-allocate' ? (
-                          <Badge variant="default" className="bg-emerald-100 text-emerald-800 border-emerald-200 text-xs">{t('common.ready', { defaultValue: 'Ready' })}</Badge>
+                          <Badge variant="default" className="bg-emerald-100 text-emerald-800 border-emerald-200 text-xs">{t('common.ready')}</Badge>
                         ) : a.status === 'skipped' ? (
-                          <Badge variant="secondary" className="text-xs">{t('common.skipped', { defaultValue: 'Skipped' })}</Badge>
+                          <Badge variant="secondary" className="text-xs">{t('common.skipped')}</Badge>
                         ) : (
-                          <Badge variant="default" className="text-xs">{t('common.done', { defaultValue: 'Done' })}</Badge>
+                          <Badge variant="default" className="text-xs">{t('common.done')}</Badge>
                         )}
                       </TableCell>
                       <TableCell>
                         <div className="flex items-center gap-2 flex-wrap">
                           {a.currency_mismatch ? (
-                            <Badge variant="secondary" className="text-[10px] bg-amber-100 text-amber-800 border-amber-200">{t('banking.reconciliation.currencyMismatch', { defaultValue: 'Currency mismatch' })}</Badge>
+                            <Badge variant="secondary" className="text-[10px] bg-amber-100 text-amber-800 border-amber-200">{t('banking.reconciliation.currencyMismatch')}</Badge>
                           ) : null}
                           {typeof a.date_diff_days === 'number' ? (
                             <Badge variant="outline" className={`text-[10px] ${Number(a.date_diff_days) <= 7 ? 'border-emerald-300 text-emerald-700' : 'border-amber-300 text-amber-700'}`}>Δ {a.date_diff_days}d</Badge>
                           ) : null}
                           {a.high_confidence ? (
-                            <Badge variant="default" className="text-[10px] bg-emerald-100 text-emerald-800 border-emerald-200">{t('banking.reconciliation.highConfidence', { defaultValue: 'High confidence' })}</Badge>
+                            <Badge variant="default" className="text-[10px] bg-emerald-100 text-emerald-800 border-emerald-200">{t('banking.reconciliation.highConfidence')}</Badge>
                           ) : null}
                           <span className="text-[10px] text-muted-foreground">
-                            {t('banking.reconciliation.why', { defaultValue: 'Why:' })}
+                            {t('banking.reconciliation.why')}
                             {' '}
                             {a.amount_equal
-                              ? t('banking.reconciliation.exactAmount', { defaultValue: 'Exact amount' })
-                              : t('banking.reconciliation.closeAmount', { defaultValue: 'Amount within tolerance' })}
-                            ; {a.currency_mismatch ? t('banking.reconciliation.mismatch', { defaultValue: 'currency mismatch' }) : t('banking.reconciliation.sameCurrency', { defaultValue: 'same currency' })}
+                              ? t('banking.reconciliation.exactAmount')
+                              : t('banking.reconciliation.closeAmount')}
+                            ; {a.currency_mismatch ? t('banking.reconciliation.mismatch') : t('banking.reconciliation.sameCurrency')}
                             ; {a.high_confidence
-                              ? t('banking.reconciliation.withinDays', { defaultValue: 'within {n} days', n: 7 })
-                              : (typeof a.date_diff_days === 'number' ? t('banking.reconciliation.dateDiffN', { defaultValue: 'Δ {n} days', n: Math.abs(a.date_diff_days) }) : '')}
-                            {a.unique ? `; ${t('banking.reconciliation.uniqueCandidate', { defaultValue: 'unique candidate' })}` : ''}
-                            {typeof a.total_score === 'number' ? ` — ${t('banking.reconciliation.score', { defaultValue: 'score' })}: a:${a.amount_score ?? 0} + d:${a.date_score ?? 0} = ${a.total_score}` : ''}
+                              ? t('banking.reconciliation.withinDays', { n: 7 })
+                              : (typeof a.date_diff_days === 'number' ? t('banking.reconciliation.dateDiffN', { n: Math.abs(a.date_diff_days) }) : '')}
+                            {a.unique ? `; ${t('banking.reconciliation.uniqueCandidate')}` : ''}
+                            {typeof a.total_score === 'number' ? ` — ${t('banking.reconciliation.score')}: a:${a.amount_score ?? 0} + d:${a.date_score ?? 0} = ${a.total_score}` : ''}
                           </span>
                         </div>
                       </TableCell>
@@ -1005,7 +1005,7 @@ export default function ReconciliationPage() {
           <DialogFooter>
             <Button variant="outline" onClick={() => setPreviewOpen(false)}>{t('common.cancel')}</Button>
             <Button onClick={confirmAutoReconcile} disabled={Array.from(selectedActionKeys).length === 0}>
-              {t('common.confirm', { defaultValue: 'Confirm' })} ({Array.from(selectedActionKeys).length})
+              {t('common.confirm')} ({Array.from(selectedActionKeys).length})
             </Button>
             <Button
               variant="ghost"
@@ -1039,7 +1039,7 @@ export default function ReconciliationPage() {
                 a.click();
                 URL.revokeObjectURL(url);
               }}
-            >{t('common.export', { defaultValue: 'Export' })}</Button>
+            >{t('common.export')}</Button>
           </DialogFooter>
         </DialogContent>
       </Dialog>
@@ -1047,7 +1047,7 @@ export default function ReconciliationPage() {
       {/* Recent Matches (quick undo) */}
       <Card className="overflow-hidden">
         <CardHeader className="px-4 pt-4 pb-2">
-          <CardTitle className="text-lg">{t('banking.reconciliation.recentMatches', 'Recent Matches')}</CardTitle>
+          <CardTitle className="text-lg">{t('banking.reconciliation.recentMatches')}</CardTitle>
         </CardHeader>
         <CardContent className="p-0">
           <div className="overflow-x-auto">
@@ -1055,11 +1055,11 @@ export default function ReconciliationPage() {
               <Table className="min-w-[450px]">
                 <TableHeader>
                   <TableRow>
-                    <TableHead className="whitespace-nowrap">{t('common.date', { defaultValue: 'Date' })}</TableHead>
-                    <TableHead className="whitespace-nowrap">{t('common.type', { defaultValue: 'Type' })}</TableHead>
-                    <TableHead className="whitespace-nowrap">{t('common.document', { defaultValue: 'Document' })}</TableHead>
-                    <TableHead className="text-end whitespace-nowrap">{t('common.amount', { defaultValue: 'Amount' })}</TableHead>
-                    <TableHead className="text-end whitespace-nowrap">{t('common.actions', { defaultValue: 'Actions' })}</TableHead>
+                    <TableHead className="whitespace-nowrap">{t('common.date')}</TableHead>
+                    <TableHead className="whitespace-nowrap">{t('common.type')}</TableHead>
+                    <TableHead className="whitespace-nowrap">{t('common.document')}</TableHead>
+                    <TableHead className="text-end whitespace-nowrap">{t('common.amount')}</TableHead>
+                    <TableHead className="text-end whitespace-nowrap">{t('common.actions')}</TableHead>
                   </TableRow>
                 </TableHeader>
               <TableBody>
@@ -1068,7 +1068,7 @@ export default function ReconciliationPage() {
                     <TableCell className="whitespace-nowrap">{new Date(row.allocation_date).toLocaleDateString(i18n.language)}</TableCell>
                     <TableCell className="whitespace-nowrap">
                       <Badge variant="secondary" className="text-xs">
-                        {row.payment_type === 'receipt' ? t('banking.reconciliation.receipt', 'Receipt') : t('banking.reconciliation.payment', 'Payment')} → {row.document_type === 'invoice' ? t('sales.invoices.invoice', 'Invoice') : t('purchases.bills.bill', 'Bill')}
+                        {row.payment_type === 'receipt' ? t('banking.reconciliation.receipt') : t('banking.reconciliation.payment')} → {row.document_type === 'invoice' ? t('sales.invoices.invoice') : t('purchases.bills.bill')}
                       </Badge>
                     </TableCell>
                     <TableCell className="whitespace-nowrap">
@@ -1077,7 +1077,7 @@ export default function ReconciliationPage() {
                     <TableCell className="text-end whitespace-nowrap">{formatCurrency(Number(row.allocated_amount))}</TableCell>
                     <TableCell className="text-right whitespace-nowrap">
                       <Button size="sm" variant="outline" onClick={() => unallocateMutation.mutate(row.id)} disabled={unallocateMutation.isPending}>
-                        {t('banking.reconciliation.unmatch', 'Unmatch')}
+                        {t('banking.reconciliation.unmatch')}
                       </Button>
                     </TableCell>
                   </TableRow>
@@ -1103,10 +1103,10 @@ export default function ReconciliationPage() {
                   <TableHeader>
                     <TableRow>
                       <TableHead className="w-8"></TableHead>
-                      <TableHead className="whitespace-nowrap">{t('common.date', { defaultValue: 'Date' })}</TableHead>
-                      <TableHead className="whitespace-nowrap">{t('common.description', { defaultValue: 'Description' })}</TableHead>
-                      <TableHead className="whitespace-nowrap">{t('common.amount', { defaultValue: 'Amount' })}</TableHead>
-                      <TableHead className="whitespace-nowrap">{t('common.status', { defaultValue: 'Status' })}</TableHead>
+                      <TableHead className="whitespace-nowrap">{t('common.date')}</TableHead>
+                      <TableHead className="whitespace-nowrap">{t('common.description')}</TableHead>
+                      <TableHead className="whitespace-nowrap">{t('common.amount')}</TableHead>
+                      <TableHead className="whitespace-nowrap">{t('common.status')}</TableHead>
                     </TableRow>
                   </TableHeader>
                 <TableBody>
@@ -1172,11 +1172,11 @@ export default function ReconciliationPage() {
                 <Link href="/reports/ai-analytics?source=bank-statement">
                   <Button size={isMobile ? 'sm' : 'default'} variant="ghost" className="hidden md:inline-flex">
                     <BarChart3 className="h-4 w-4 mr-2" />
-                    {t('reports.aiAnalytics.title', { defaultValue: 'AI Analytics' })}
+                    {t('reports.aiAnalytics.title')}
                   </Button>
                 </Link>
                 <Button size={isMobile ? 'sm' : 'default'} variant="outline" onClick={handleSuggestAll} disabled={classifyBatch.isPending || unmatchedBankTransactions.length === 0}>
-                  {classifyBatch.isPending ? t('ai.generating', { defaultValue: 'Generating…' }) : t('ai.suggestForAll', { defaultValue: 'Suggest for all' })}
+                  {classifyBatch.isPending ? t('ai.generating') : t('ai.suggestForAll')}
                 </Button>
               </div>
             </div>
@@ -1188,11 +1188,11 @@ export default function ReconciliationPage() {
                   <TableHeader>
                     <TableRow>
                       <TableHead className="w-8"></TableHead>
-                      <TableHead className="whitespace-nowrap">{t('common.date', { defaultValue: 'Date' })}</TableHead>
-                      <TableHead className="whitespace-nowrap">{t('common.description', { defaultValue: 'Description' })}</TableHead>
-                      <TableHead className="whitespace-nowrap">{t('common.amount', { defaultValue: 'Amount' })}</TableHead>
-                      <TableHead className="whitespace-nowrap">{t('common.status', { defaultValue: 'Status' })}</TableHead>
-                      <TableHead className="text-right whitespace-nowrap">{t('common.actions', { defaultValue: 'Actions' })}</TableHead>
+                      <TableHead className="whitespace-nowrap">{t('common.date')}</TableHead>
+                      <TableHead className="whitespace-nowrap">{t('common.description')}</TableHead>
+                      <TableHead className="whitespace-nowrap">{t('common.amount')}</TableHead>
+                      <TableHead className="whitespace-nowrap">{t('common.status')}</TableHead>
+                      <TableHead className="text-right whitespace-nowrap">{t('common.actions')}</TableHead>
                     </TableRow>
                   </TableHeader>
                 <TableBody>
@@ -1211,7 +1211,7 @@ export default function ReconciliationPage() {
                         <div className="font-medium">{transaction.description}</div>
                         {aiSuggestions[transaction.id] && (
                           <div className="text-xs text-muted-foreground mt-1">
-                            {t('ai.suggested', { defaultValue: 'Suggested' })}: <span className="font-medium">{aiSuggestions[transaction.id].category}</span> · {Math.round(aiSuggestions[transaction.id].confidence * 100)}%
+                            {t('ai.suggested')}: <span className="font-medium">{aiSuggestions[transaction.id].category}</span> · {Math.round(aiSuggestions[transaction.id].confidence * 100)}%
                             <span className="ml-2 inline-flex gap-1">
                               <Button
                                 variant="ghost"
@@ -1280,7 +1280,7 @@ export default function ReconciliationPage() {
                       </TableCell>
                       <TableCell className="text-right whitespace-nowrap">
                         <Button size="sm" variant="outline" onClick={() => handleSuggestForRow(transaction)} disabled={classifyOne.isPending}>
-                          {classifyOne.isPending ? t('ai.generating', { defaultValue: 'Generating…' }) : t('ai.suggest', { defaultValue: 'Suggest' })}
+                          {classifyOne.isPending ? t('ai.generating') : t('ai.suggest')}
                         </Button>
                       </TableCell>
                     </TableRow>
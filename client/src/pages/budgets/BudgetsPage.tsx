@@ -148,13 +148,13 @@ export default function BudgetsPage() {
       queryClient.invalidateQueries({ queryKey: ["budgets", fiscalYear] });
       toast({
         title: t('common.success'),
-        description: t('budgets.saveSuccess', { defaultValue: 'Budget saved successfully' }),
+        description: t('budgets.saveSuccess'),
       });
     },
     onError: () => {
       toast({
         title: t('common.error'),
-        description: t('budgets.saveError', { defaultValue: 'Failed to save budget' }),
+        description: t('budgets.saveError'),
         variant: "destructive",
       });
     },
@@ -170,13 +170,13 @@ export default function BudgetsPage() {
       queryClient.invalidateQueries({ queryKey: ["budgets", fiscalYear] });
       toast({
         title: t('common.success'),
-        description: t('budgets.deleteSuccess', { defaultValue: 'Budget deleted successfully' }),
+        description: t('budgets.deleteSuccess'),
       });
     },
     onError: () => {
       toast({
         title: t('common.error'),
-        description: t('budgets.deleteError', { defaultValue: 'Failed to delete budget' }),
+        description: t('budgets.deleteError'),
         variant: "destructive",
       });
     },
@@ -202,7 +202,7 @@ export default function BudgetsPage() {
     onError: (error: Error) => {
       toast({
         title: t('common.error'),
-        description: error.message || t('budgets.copyError', { defaultValue: 'Failed to copy budgets' }),
+        description: error.message || t('budgets.copyError'),
         variant: "destructive",
       });
     },
@@ -376,12 +376,12 @@ export default function BudgetsPage() {
     <div className="space-y-6">
       <div className="flex flex-col space-y-4 sm:flex-row sm:items-center sm:justify-between sm:space-y-0">
         <div>
-          <h1 className="text-2xl sm:text-3xl font-bold tracking-tight">{t('budgets.title', { defaultValue: 'Budget Planning' })}</h1>
-          <p className="text-sm text-muted-foreground">{t('budgets.description', { defaultValue: 'Set annual and monthly budget targets' })}</p>
+          <h1 className="text-2xl sm:text-3xl font-bold tracking-tight">{t('budgets.title')}</h1>
+          <p className="text-sm text-muted-foreground">{t('budgets.description')}</p>
         </div>
         <div className="flex items-center gap-4">
           <div className="flex items-center gap-2">
-            <Label>{t('budgets.fiscalYear', { defaultValue: 'Fiscal Year' })}</Label>
+            <Label>{t('budgets.fiscalYear')}</Label>
             <Select value={fiscalYear} onValueChange={setFiscalYear}>
               <SelectTrigger className="w-[120px]">
                 <SelectValue />
@@ -394,20 +394,20 @@ export default function BudgetsPage() {
             </Select>
           </div>
           <div className="flex items-center gap-2">
-            <Label>{t('budgets.entryMode', { defaultValue: 'Mode' })}</Label>
+            <Label>{t('budgets.entryMode')}</Label>
             <Select value={entryMode} onValueChange={(v) => setEntryMode(v as 'annual' | 'monthly')}>
               <SelectTrigger className="w-[120px]">
                 <SelectValue />
               </SelectTrigger>
               <SelectContent>
-                <SelectItem value="annual">{t('budgets.annual', { defaultValue: 'Annual' })}</SelectItem>
-                <SelectItem value="monthly">{t('budgets.monthly', { defaultValue: 'Monthly' })}</SelectItem>
+                <SelectItem value="annual">{t('budgets.annual')}</SelectItem>
+                <SelectItem value="monthly">{t('budgets.monthly')}</SelectItem>
               </SelectContent>
             </Select>
           </div>
           <Button variant="outline" size="sm" onClick={() => setCopyDialogOpen(true)}>
             <Copy className="h-4 w-4 me-2" />
-            {t('budgets.copyFromYear', { defaultValue: 'Copy Budget' })}
+            {t('budgets.copyFromYear')}
           </Button>
         </div>
       </div>
@@ -418,7 +418,7 @@ export default function BudgetsPage() {
           <CardHeader className="pb-2">
             <CardTitle className="text-sm font-medium text-muted-foreground flex items-center gap-2">
               <TrendingUp className="h-4 w-4 text-green-600" />
-              {t('budgets.totalRevenue', { defaultValue: 'Total Revenue Budget' })}
+              {t('budgets.totalRevenue')}
             </CardTitle>
           </CardHeader>
           <CardContent>
@@ -431,7 +431,7 @@ export default function BudgetsPage() {
           <CardHeader className="pb-2">
             <CardTitle className="text-sm font-medium text-muted-foreground flex items-center gap-2">
               <TrendingDown className="h-4 w-4 text-red-600" />
-              {t('budgets.totalExpense', { defaultValue: 'Total Expense Budget' })}
+              {t('budgets.totalExpense')}
             </CardTitle>
           </CardHeader>
           <CardContent>
@@ -444,7 +444,7 @@ export default function BudgetsPage() {
           <CardHeader className="pb-2">
             <CardTitle className="text-sm font-medium text-muted-foreground flex items-center gap-2">
               <Calculator className="h-4 w-4" />
-              {t('budgets.netBudget', { defaultValue: 'Net Budget' })}
+              {t('budgets.netBudget')}
             </CardTitle>
           </CardHeader>
           <CardContent>
@@ -460,12 +460,12 @@ export default function BudgetsPage() {
         <TabsList>
           <TabsTrigger value="expense" className="gap-2">
             <TrendingDown className="h-4 w-4" />
-            {t('budgets.expenses', { defaultValue: 'Expenses' })}
+            {t('budgets.expenses')}
             <Badge variant="secondary">{expenseAccounts.length}</Badge>
           </TabsTrigger>
           <TabsTrigger value="revenue" className="gap-2">
             <TrendingUp className="h-4 w-4" />
-            {t('budgets.revenue', { defaultValue: 'Revenue' })}
+            {t('budgets.revenue')}
             <Badge variant="secondary">{revenueAccounts.length}</Badge>
           </TabsTrigger>
         </TabsList>
@@ -473,18 +473,18 @@ export default function BudgetsPage() {
         <TabsContent value="expense">
           <Card>
             <CardHeader>
-              <CardTitle>{t('budgets.expenseBudgets', { defaultValue: 'Expense Budgets' })}</CardTitle>
-              <CardDescription>{t('budgets.expenseDesc', { defaultValue: 'Set budget limits for expense accounts' })}</CardDescription>
+              <CardTitle>{t('budgets.expenseBudgets')}</CardTitle>
+              <CardDescription>{t('budgets.expenseDesc')}</CardDescription>
             </CardHeader>
             <CardContent className="p-0">
               <div className="overflow-x-auto">
                 <Table className="min-w-[500px]">
                   <TableHeader>
                     <TableRow>
-                      <TableHead>{t('budgets.accountCode', { defaultValue: 'Code' })}</TableHead>
-                      <TableHead>{t('budgets.accountName', { defaultValue: 'Account' })}</TableHead>
-                      <TableHead>{t('budgets.annualBudget', { defaultValue: 'Annual Budget' })}</TableHead>
-                      <TableHead className="w-[100px]">{t('common.actions', { defaultValue: 'Actions' })}</TableHead>
+                      <TableHead>{t('budgets.accountCode')}</TableHead>
+                      <TableHead>{t('budgets.accountName')}</TableHead>
+                      <TableHead>{t('budgets.annualBudget')}</TableHead>
+                      <TableHead className="w-[100px]">{t('common.actions')}</TableHead>
                     </TableRow>
                   </TableHeader>
                   <TableBody>
@@ -495,7 +495,7 @@ export default function BudgetsPage() {
                     ) : expenseAccounts.length === 0 ? (
                       <TableRow>
                         <TableCell colSpan={4} className="text-center text-muted-foreground py-8">
-                          {t('budgets.noExpenseAccounts', { defaultValue: 'No expense accounts found' })}
+                          {t('budgets.noExpenseAccounts')}
                         </TableCell>
                       </TableRow>
                     ) : (
@@ -511,18 +511,18 @@ export default function BudgetsPage() {
         <TabsContent value="revenue">
           <Card>
             <CardHeader>
-              <CardTitle>{t('budgets.revenueBudgets', { defaultValue: 'Revenue Budgets' })}</CardTitle>
-              <CardDescription>{t('budgets.revenueDesc', { defaultValue: 'Set revenue targets for income accounts' })}</CardDescription>
+              <CardTitle>{t('budgets.revenueBudgets')}</CardTitle>
+              <CardDescription>{t('budgets.revenueDesc')}</CardDescription>
             </CardHeader>
             <CardContent className="p-0">
               <div className="overflow-x-auto">
                 <Table className="min-w-[500px]">
                   <TableHeader>
                     <TableRow>
-                      <TableHead>{t('budgets.accountCode', { defaultValue: 'Code' })}</TableHead>
-                      <TableHead>{t('budgets.accountName', { defaultValue: 'Account' })}</TableHead>
-                      <TableHead>{t('budgets.annualBudget', { defaultValue: 'Annual Budget' })}</TableHead>
-                      <TableHead className="w-[100px]">{t('common.actions', { defaultValue: 'Actions' })}</TableHead>
+                      <TableHead>{t('budgets.accountCode')}</TableHead>
+                      <TableHead>{t('budgets.accountName')}</TableHead>
+                      <TableHead>{t('budgets.annualBudget')}</TableHead>
+                      <TableHead className="w-[100px]">{t('common.actions')}</TableHead>
                     </TableRow>
                   </TableHeader>
                   <TableBody>
@@ -533,7 +533,7 @@ export default function BudgetsPage() {
                     ) : revenueAccounts.length === 0 ? (
                       <TableRow>
                         <TableCell colSpan={4} className="text-center text-muted-foreground py-8">
-                          {t('budgets.noRevenueAccounts', { defaultValue: 'No revenue accounts found' })}
+                          {t('budgets.noRevenueAccounts')}
                         </TableCell>
                       </TableRow>
                     ) : (
@@ -551,15 +551,15 @@ export default function BudgetsPage() {
       <Dialog open={copyDialogOpen} onOpenChange={setCopyDialogOpen}>
         <DialogContent>
           <DialogHeader>
-            <DialogTitle>{t('budgets.copyBudget', { defaultValue: 'Copy Budget' })}</DialogTitle>
+            <DialogTitle>{t('budgets.copyBudget')}</DialogTitle>
             <DialogDescription>
-              {t('budgets.copyBudgetDesc', { defaultValue: 'Copy all budgets from one year to another with optional adjustment.' })}
+              {t('budgets.copyBudgetDesc')}
             </DialogDescription>
           </DialogHeader>
           <div className="grid gap-4 py-4">
             <div className="grid grid-cols-2 gap-4">
               <div className="space-y-2">
-                <Label>{t('budgets.fromYear', { defaultValue: 'From Year' })}</Label>
+                <Label>{t('budgets.fromYear')}</Label>
                 <Select value={copyFromYear} onValueChange={setCopyFromYear}>
                   <SelectTrigger>
                     <SelectValue />
@@ -572,7 +572,7 @@ export default function BudgetsPage() {
                 </Select>
               </div>
               <div className="space-y-2">
-                <Label>{t('budgets.toYear', { defaultValue: 'To Year' })}</Label>
+                <Label>{t('budgets.toYear')}</Label>
                 <Select value={copyToYear} onValueChange={setCopyToYear}>
                   <SelectTrigger>
                     <SelectValue />
@@ -586,7 +586,7 @@ export default function BudgetsPage() {
               </div>
             </div>
             <div className="space-y-2">
-              <Label>{t('budgets.adjustmentPercent', { defaultValue: 'Adjustment %' })}</Label>
+              <Label>{t('budgets.adjustmentPercent')}</Label>
               <div className="flex items-center gap-2">
                 <Input
                   type="number"
@@ -596,7 +596,7 @@ export default function BudgetsPage() {
                   className="max-w-[100px]"
                 />
                 <span className="text-sm text-muted-foreground">
-                  {t('budgets.adjustmentHint', { defaultValue: 'e.g., 5 for 5% increase, -10 for 10% decrease' })}
+                  {t('budgets.adjustmentHint')}
                 </span>
               </div>
             </div>
@@ -606,7 +606,7 @@ export default function BudgetsPage() {
               {t('common.cancel')}
             </Button>
             <Button onClick={handleCopyBudget} disabled={copyBudgetMutation.isPending}>
-              {copyBudgetMutation.isPending ? t('common.copying', { defaultValue: 'Copying...' }) : t('budgets.copyBudget', { defaultValue: 'Copy Budget' })}
+              {copyBudgetMutation.isPending ? t('common.copying') : t('budgets.copyBudget')}
             </Button>
           </DialogFooter>
         </DialogContent>
@@ -616,9 +616,9 @@ export default function BudgetsPage() {
       <AlertDialog open={deleteDialogOpen} onOpenChange={setDeleteDialogOpen}>
         <AlertDialogContent>
           <AlertDialogHeader>
-            <AlertDialogTitle>{t('budgets.deleteBudget', { defaultValue: 'Delete Budget' })}</AlertDialogTitle>
+            <AlertDialogTitle>{t('budgets.deleteBudget')}</AlertDialogTitle>
             <AlertDialogDescription>
-              {t('budgets.deleteConfirm', { defaultValue: 'Are you sure you want to delete this budget?' })}
+              {t('budgets.deleteConfirm')}
             </AlertDialogDescription>
           </AlertDialogHeader>
           <AlertDialogFooter>
@@ -82,7 +82,7 @@ export default function LandedCostDetail() {
       return res.json();
     },
     onSuccess: (data) => {
-      toast({ title: t("common.success"), description: t("inventory.voucherCreated", "Voucher created") });
+      toast({ title: t("common.success"), description: t("inventory.voucherCreated") });
       setLocation(`/inventory/landed-cost/${data.id}`);
     }
   });
@@ -95,7 +95,7 @@ export default function LandedCostDetail() {
     },
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['landed-cost-voucher', id] });
-      toast({ title: t("inventory.allocated", "Allocated"), description: t("inventory.costsDistributed", "Costs have been distributed") });
+      toast({ title: t("inventory.allocated"), description: t("inventory.costsDistributed") });
     }
   });
 
@@ -107,7 +107,7 @@ export default function LandedCostDetail() {
     },
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['landed-cost-voucher', id] });
-      toast({ title: t("inventory.posted", "Posted"), description: t("inventory.landedCostsApplied", "Landed costs applied to inventory") });
+      toast({ title: t("inventory.posted"), description: t("inventory.landedCostsApplied") });
     }
   });
 
@@ -145,7 +145,7 @@ export default function LandedCostDetail() {
       setIsAddBillOpen(false);
       setSelectedBillId("");
       setBillAmount("");
-      toast({ title: t("inventory.billAdded", "Bill Added"), description: t("inventory.freightBillAdded", "Freight bill added to voucher") });
+      toast({ title: t("inventory.billAdded"), description: t("inventory.freightBillAdded") });
     }
   });
 
@@ -161,7 +161,7 @@ export default function LandedCostDetail() {
       queryClient.invalidateQueries({ queryKey: ['landed-cost-voucher', id] });
       setIsAddItemsOpen(false);
       setSelectedMovements([]);
-      toast({ title: t("inventory.itemsAdded", "Items Added"), description: t("inventory.stockMovementsAdded", "Stock movements added for allocation") });
+      toast({ title: t("inventory.itemsAdded"), description: t("inventory.stockMovementsAdded") });
     }
   });
 
@@ -179,10 +179,10 @@ export default function LandedCostDetail() {
           </Button>
           <div>
             <h1 className="text-2xl font-bold">
-              {isNew ? t('inventory.newLandedCostVoucher', { defaultValue: 'New Landed Cost Voucher' }) : `${t('inventory.voucherNumber', { defaultValue: 'Voucher' })} ${voucher?.voucher_number}`}
+              {isNew ? t('inventory.newLandedCostVoucher') : `${t('inventory.voucherNumber', { defaultValue: 'Voucher' })} ${voucher?.voucher_number}`}
             </h1>
             <p className="text-muted-foreground">
-              {isNew ? t('inventory.createAllocationRecord', { defaultValue: 'Create a new allocation record' }) : `${t('common.createdOn', { defaultValue: 'Created on' })} ${format(new Date(voucher?.date || new Date()), 'PP')}`}
+              {isNew ? t('inventory.createAllocationRecord') : `${t('common.createdOn')} ${format(new Date(voucher?.date || new Date()), 'PP')}`}
             </p>
           </div>
         </div>
@@ -191,18 +191,18 @@ export default function LandedCostDetail() {
             <>
               <Button variant="outline" onClick={() => allocateMutation.mutate()} disabled={allocateMutation.isPending}>
                 <Calculator className="mr-2 h-4 w-4" />
-                {t('inventory.allocateCosts', { defaultValue: 'Allocate Costs' })}
+                {t('inventory.allocateCosts')}
               </Button>
               <Button onClick={() => postMutation.mutate()} disabled={postMutation.isPending}>
                 <CheckCircle className="mr-2 h-4 w-4" />
-                {t('inventory.post', { defaultValue: 'Post' })}
+                {t('inventory.post')}
               </Button>
             </>
           )}
           {isNew && (
             <Button onClick={() => createMutation.mutate(formData)} disabled={createMutation.isPending}>
               <Save className="mr-2 h-4 w-4" />
-              {t('inventory.createDraft', { defaultValue: 'Create Draft' })}
+              {t('inventory.createDraft')}
             </Button>
           )}
         </div>
@@ -212,12 +212,12 @@ export default function LandedCostDetail() {
       <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
         <Card className="md:col-span-2">
           <CardHeader>
-            <CardTitle>{t("common.details", "Details")}</CardTitle>
+            <CardTitle>{t("common.details")}</CardTitle>
           </CardHeader>
           <CardContent className="space-y-4">
             <div className="grid grid-cols-1 sm:grid-cols-2 gap-4">
               <div className="space-y-2">
-                <Label>{t("common.date", "Date")}</Label>
+                <Label>{t("common.date")}</Label>
                 <Input 
                   type="date" 
                   value={isNew ? formData.date : format(new Date(voucher.date), 'yyyy-MM-dd')}
@@ -226,7 +226,7 @@ export default function LandedCostDetail() {
                 />
               </div>
               <div className="space-y-2">
-                <Label>{t("inventory.allocationMethod", "Allocation Method")}</Label>
+                <Label>{t("inventory.allocationMethod")}</Label>
                 <Select 
                   value={isNew ? formData.allocation_method : voucher.allocation_method}
                   onValueChange={v => setFormData({...formData, allocation_method: v})}
@@ -236,19 +236,19 @@ export default function LandedCostDetail() {
                     <SelectValue />
                   </SelectTrigger>
                   <SelectContent>
-                    <SelectItem value="value">{t("inventory.byValue", "By Value")}</SelectItem>
-                    <SelectItem value="quantity">{t("inventory.byQuantity", "By Quantity")}</SelectItem>
+                    <SelectItem value="value">{t("inventory.byValue")}</SelectItem>
+                    <SelectItem value="quantity">{t("inventory.byQuantity")}</SelectItem>
                   </SelectContent>
                 </Select>
               </div>
             </div>
             <div className="space-y-2">
-              <Label>{t("common.description", "Description")}</Label>
+              <Label>{t("common.description")}</Label>
               <Input 
                 value={isNew ? formData.description : voucher.description}
                 onChange={e => setFormData({...formData, description: e.target.value})}
                 disabled={!isNew}
-                placeholder={t("inventory.importShipmentPlaceholder", "e.g. Import Shipment #123")}
+                placeholder={t("inventory.importShipmentPlaceholder")}
               />
             </div>
           </CardContent>
@@ -256,25 +256,25 @@ export default function LandedCostDetail() {
 
         <Card>
           <CardHeader>
-            <CardTitle>{t("common.summary", "Summary")}</CardTitle>
+            <CardTitle>{t("common.summary")}</CardTitle>
           </CardHeader>
           <CardContent className="space-y-4">
             <div className="flex justify-between">
-              <span className="text-muted-foreground">{t("common.status", "Status")}</span>
+              <span className="text-muted-foreground">{t("common.status")}</span>
               <Badge variant={isPosted ? 'default' : 'secondary'}>
-                {isNew ? t("common.new", "New") : voucher.status}
+                {isNew ? t("common.new") : voucher.status}
               </Badge>
             </div>
             {!isNew && (
               <>
                 <div className="flex justify-between">
-                  <span className="text-muted-foreground">{t("inventory.totalFreight", "Total Freight")}</span>
+                  <span className="text-muted-foreground">{t("inventory.totalFreight")}</span>
                   <span className="font-medium">
                     {voucher.bills?.reduce((sum: number, b: any) => sum + Number(b.amount), 0).toFixed(2)}
                   </span>
                 </div>
                 <div className="flex justify-between">
-                  <span className="text-muted-foreground">{t("inventory.itemsValue", "Items Value")}</span>
+                  <span className="text-muted-foreground">{t("inventory.itemsValue")}</span>
                   <span className="font-medium">
                     {voucher.items?.reduce((sum: number, i: any) => sum + Number(i.original_cost), 0).toFixed(2)}
                   </span>
@@ -291,28 +291,28 @@ export default function LandedCostDetail() {
           <Card>
             <CardHeader className="flex flex-row items-center justify-between">
               <div>
-                <CardTitle>{t("inventory.freightCustomsBills", "Freight & Customs Bills")}</CardTitle>
-                <CardDescription>{t("inventory.addBillsDescription", "Add bills that represent the extra costs.")}</CardDescription>
+                <CardTitle>{t("inventory.freightCustomsBills")}</CardTitle>
+                <CardDescription>{t("inventory.addBillsDescription")}</CardDescription>
               </div>
               {!isPosted && (
                 <Dialog open={isAddBillOpen} onOpenChange={setIsAddBillOpen}>
                   <DialogTrigger asChild>
-                    <Button variant="outline" size="sm">{t("inventory.addBill", "Add Bill")}</Button>
+                    <Button variant="outline" size="sm">{t("inventory.addBill")}</Button>
                   </DialogTrigger>
                   <DialogContent>
                     <DialogHeader>
-                      <DialogTitle>{t("inventory.addFreightBill", "Add Freight/Customs Bill")}</DialogTitle>
+                      <DialogTitle>{t("inventory.addFreightBill")}</DialogTitle>
                     </DialogHeader>
                     <div className="space-y-4 py-4">
                       <div className="space-y-2">
-                        <Label>{t("inventory.selectBill", "Select Bill")}</Label>
+                        <Label>{t("inventory.selectBill")}</Label>
                         <Select value={selectedBillId} onValueChange={(val) => {
                           setSelectedBillId(val);
                           const bill = availableBills.find(b => b.id === val);
                           if (bill) setBillAmount(bill.total);
                         }}>
                           <SelectTrigger>
-                            <SelectValue placeholder={t("inventory.selectBillPlaceholder", "Select a bill...")} />
+                            <SelectValue placeholder={t("inventory.selectBillPlaceholder")} />
                           </SelectTrigger>
                           <SelectContent>
                             {availableBills.map((bill) => (
@@ -324,7 +324,7 @@ export default function LandedCostDetail() {
                         </Select>
                       </div>
                       <div className="space-y-2">
-                        <Label>{t("inventory.amountToAllocate", "Amount to Allocate")}</Label>
+                        <Label>{t("inventory.amountToAllocate")}</Label>
                         <Input 
                           type="number" 
                           value={billAmount} 
@@ -334,7 +334,7 @@ export default function LandedCostDetail() {
                     </div>
                     <DialogFooter>
                       <Button onClick={() => addBillMutation.mutate()} disabled={!selectedBillId || addBillMutation.isPending}>
-                        {t("inventory.addBill", "Add Bill")}
+                        {t("inventory.addBill")}
                       </Button>
                     </DialogFooter>
                   </DialogContent>
@@ -345,9 +345,9 @@ export default function LandedCostDetail() {
               <Table className="min-w-[400px]">
                 <TableHeader>
                   <TableRow>
-                    <TableHead>{t("inventory.billNumber", "Bill #")}</TableHead>
-                    <TableHead>{t("contacts.supplier", "Supplier")}</TableHead>
-                    <TableHead className="text-end">{t("common.amount", "Amount")}</TableHead>
+                    <TableHead>{t("inventory.billNumber")}</TableHead>
+                    <TableHead>{t("contacts.supplier")}</TableHead>
+                    <TableHead className="text-end">{t("common.amount")}</TableHead>
                   </TableRow>
                 </TableHeader>
                 <TableBody>
@@ -360,7 +360,7 @@ export default function LandedCostDetail() {
                   ))}
                   {(!voucher.bills || voucher.bills.length === 0) && (
                     <TableRow>
-                      <TableCell colSpan={3} className="text-center text-muted-foreground">{t("inventory.noBillsAdded", "No bills added")}</TableCell>
+                      <TableCell colSpan={3} className="text-center text-muted-foreground">{t("inventory.noBillsAdded")}</TableCell>
                     </TableRow>
                   )}
                 </TableBody>
@@ -372,28 +372,28 @@ export default function LandedCostDetail() {
           <Card>
             <CardHeader className="flex flex-row items-center justify-between">
               <div>
-                <CardTitle>{t("inventory.itemsToAllocate", "Items to Allocate")}</CardTitle>
-                <CardDescription>{t("inventory.selectGRNDescription", "Select the stock receipts (GRNs) to apply costs to.")}</CardDescription>
+                <CardTitle>{t("inventory.itemsToAllocate")}</CardTitle>
+                <CardDescription>{t("inventory.selectGRNDescription")}</CardDescription>
               </div>
               {!isPosted && (
                 <Dialog open={isAddItemsOpen} onOpenChange={setIsAddItemsOpen}>
                   <DialogTrigger asChild>
-                    <Button variant="outline" size="sm">{t("inventory.addItems", "Add Items")}</Button>
+                    <Button variant="outline" size="sm">{t("inventory.addItems")}</Button>
                   </DialogTrigger>
                   <DialogContent className="sm:max-w-[800px] max-h-[90vh] overflow-y-auto">
                     <DialogHeader>
-                      <DialogTitle>{t("inventory.selectStockReceipts", "Select Stock Receipts")}</DialogTitle>
+                      <DialogTitle>{t("inventory.selectStockReceipts")}</DialogTitle>
                     </DialogHeader>
                     <div className="py-4 max-h-[60vh] overflow-y-auto">
                       <Table className="min-w-[450px]">
                         <TableHeader>
                           <TableRow>
                             <TableHead className="w-[50px]"></TableHead>
-                            <TableHead>{t("common.date", "Date")}</TableHead>
+                            <TableHead>{t("common.date")}</TableHead>
                             <TableHead>{t("common.item", "Item")}</TableHead>
-                            <TableHead>{t("common.type", "Type")}</TableHead>
-                            <TableHead className="text-end">{t("common.qty", "Qty")}</TableHead>
-                            <TableHead className="text-end">{t("common.cost", "Cost")}</TableHead>
+                            <TableHead>{t("common.type")}</TableHead>
+                            <TableHead className="text-end">{t("common.qty")}</TableHead>
+                            <TableHead className="text-end">{t("common.cost")}</TableHead>
                           </TableRow>
                         </TableHeader>
                         <TableBody>
@@ -420,7 +420,7 @@ export default function LandedCostDetail() {
                     </div>
                     <DialogFooter>
                       <Button onClick={() => addItemsMutation.mutate()} disabled={selectedMovements.length === 0 || addItemsMutation.isPending}>
-                        {t("inventory.addSelectedItems", "Add Selected Items")}
+                        {t("inventory.addSelectedItems")}
                       </Button>
                     </DialogFooter>
                   </DialogContent>
@@ -431,11 +431,11 @@ export default function LandedCostDetail() {
               <Table className="min-w-[450px]">
                 <TableHeader>
                   <TableRow>
-                    <TableHead>{t("items.item", "Item")}</TableHead>
-                    <TableHead className="text-right">{t("common.qty", "Qty")}</TableHead>
-                    <TableHead className="text-right">{t("inventory.originalCost", "Original Cost")}</TableHead>
-                    <TableHead className="text-right">{t("inventory.allocated", "Allocated")}</TableHead>
-                    <TableHead className="text-right">{t("inventory.newUnitCost", "New Unit Cost")}</TableHead>
+                    <TableHead>{t("items.item")}</TableHead>
+                    <TableHead className="text-right">{t("common.qty")}</TableHead>
+                    <TableHead className="text-right">{t("inventory.originalCost")}</TableHead>
+                    <TableHead className="text-right">{t("inventory.allocated")}</TableHead>
+                    <TableHead className="text-right">{t("inventory.newUnitCost")}</TableHead>
                   </TableRow>
                 </TableHeader>
                 <TableBody>
@@ -454,7 +454,7 @@ export default function LandedCostDetail() {
                   ))}
                   {(!voucher.items || voucher.items.length === 0) && (
                     <TableRow>
-                      <TableCell colSpan={5} className="text-center text-muted-foreground">{t("inventory.noItemsAdded", "No items added")}</TableCell>
+                      <TableCell colSpan={5} className="text-center text-muted-foreground">{t("inventory.noItemsAdded")}</TableCell>
                     </TableRow>
                   )}
                 </TableBody>
@@ -38,7 +38,7 @@ export default function LandedCostPage() {
     return (
       <div className="p-6">
         <div className="bg-destructive/15 text-destructive p-4 rounded-md">
-          {t("common.errorLoading", "Error loading vouchers")}: {(error as Error).message}
+          {t("common.errorLoading")}: {(error as Error).message}
         </div>
       </div>
     );
@@ -48,22 +48,22 @@ export default function LandedCostPage() {
     <div className="space-y-6 px-4 sm:px-6 md:px-8 py-6">
       <div className="flex flex-col space-y-4 sm:flex-row sm:items-center sm:justify-between sm:space-y-0">
         <div>
-          <h1 className="text-2xl sm:text-3xl font-bold tracking-tight">{t("inventory.landedCostVouchers", "Landed Cost Vouchers")}</h1>
+          <h1 className="text-2xl sm:text-3xl font-bold tracking-tight">{t("inventory.landedCostVouchers")}</h1>
           <p className="text-muted-foreground">
-            {t("inventory.landedCostDescription", "Allocate freight and customs costs to your inventory.")}
+            {t("inventory.landedCostDescription")}
           </p>
         </div>
         <Link href="/inventory/landed-cost/new">
           <Button className="w-full sm:w-auto">
             <Plus className="me-2 h-4 w-4" />
-            {t("inventory.newVoucher", "New Voucher")}
+            {t("inventory.newVoucher")}
           </Button>
         </Link>
       </div>
 
       <Card>
         <CardHeader>
-          <CardTitle>{t("inventory.vouchers", "Vouchers")}</CardTitle>
+          <CardTitle>{t("inventory.vouchers")}</CardTitle>
         </CardHeader>
         <CardContent>
           {isLoading ? (
@@ -72,18 +72,18 @@ export default function LandedCostPage() {
             </div>
           ) : voucherList.length === 0 ? (
             <div className="text-center py-12 text-muted-foreground">
-              {t("inventory.noLandedCostVouchers", "No landed cost vouchers found. Create one to get started.")}
+              {t("inventory.noLandedCostVouchers")}
             </div>
           ) : (
             <Table className="min-w-[500px]">
               <TableHeader>
                 <TableRow>
                   <TableHead>{t("inventory.voucherNumber", "Voucher #")}</TableHead>
-                  <TableHead>{t("common.date", "Date")}</TableHead>
-                  <TableHead>{t("common.description", "Description")}</TableHead>
-                  <TableHead>{t("inventory.method", "Method")}</TableHead>
-                  <TableHead>{t("common.status", "Status")}</TableHead>
-                  <TableHead className="text-end">{t("common.actions", "Actions")}</TableHead>
+                  <TableHead>{t("common.date")}</TableHead>
+                  <TableHead>{t("common.description")}</TableHead>
+                  <TableHead>{t("inventory.method")}</TableHead>
+                  <TableHead>{t("common.status")}</TableHead>
+                  <TableHead className="text-end">{t("common.actions")}</TableHead>
                 </TableRow>
               </TableHeader>
               <TableBody>
@@ -107,7 +107,7 @@ export default function LandedCostPage() {
                     </TableCell>
                     <TableCell className="text-end">
                       <Link href={`/inventory/landed-cost/${voucher.id}`}>
-                        <Button variant="ghost" size="sm">{t("common.view", "View")}</Button>
+                        <Button variant="ghost" size="sm">{t("common.view")}</Button>
                       </Link>
                     </TableCell>
                   </TableRow>
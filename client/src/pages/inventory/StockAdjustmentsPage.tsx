@@ -336,7 +336,7 @@ export default function StockAdjustmentsPage() {
                   id="notes"
                   value={newAdjustment.notes}
                   onChange={(e) => setNewAdjustment({ ...newAdjustment, notes: e.target.value })}
-                  placeholder={t("inventory.adjustments.reasonPlaceholder", { defaultValue: "Reason for adjustment..." })}
+                  placeholder={t("inventory.adjustments.reasonPlaceholder")}
                 />
               </div>
 
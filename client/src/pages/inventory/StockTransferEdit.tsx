@@ -60,11 +60,11 @@ function TransferItemRow({ index, form, remove, items }: { index: number, form:
         name={`items.${index}.item_id`}
         render={({ field }) => (
           <FormItem className="flex-1">
-            <FormLabel>{t("items.item", "Item")}</FormLabel>
+            <FormLabel>{t("items.item")}</FormLabel>
             <Select onValueChange={field.onChange} value={field.value}>
               <FormControl>
                 <SelectTrigger>
-                  <SelectValue placeholder={t("inventory.selectItem", "Select item")} />
+                  <SelectValue placeholder={t("inventory.selectItem")} />
                 </SelectTrigger>
               </FormControl>
               <SelectContent>
@@ -86,7 +86,7 @@ function TransferItemRow({ index, form, remove, items }: { index: number, form:
           name={`items.${index}.batch_id`}
           render={({ field }) => (
             <FormItem className="w-48">
-              <FormLabel>{t("inventory.batch", "Batch")}</FormLabel>
+              <FormLabel>{t("inventory.batch")}</FormLabel>
               <Select onValueChange={field.onChange} value={field.value || ""}>
                 <FormControl>
                   <SelectTrigger>
@@ -96,7 +96,7 @@ function TransferItemRow({ index, form, remove, items }: { index: number, form:
                 <SelectContent>
                   {batches?.map((batch: any) => (
                     <SelectItem key={batch.id} value={batch.id}>
-                      {batch.batch_number} ({t("inventory.exp", "Exp")}: {batch.expiry_date ? new Date(batch.expiry_date).toLocaleDateString() : t("common.na", "N/A")})
+                      {batch.batch_number} ({t("inventory.exp")}: {batch.expiry_date ? new Date(batch.expiry_date).toLocaleDateString() : t("common.na")})
                     </SelectItem>
                   ))}
                 </SelectContent>
@@ -112,7 +112,7 @@ function TransferItemRow({ index, form, remove, items }: { index: number, form:
         name={`items.${index}.quantity`}
         render={({ field }) => (
           <FormItem className="w-32">
-            <FormLabel>{t("common.quantity", "Quantity")}</FormLabel>
+            <FormLabel>{t("common.quantity")}</FormLabel>
             <FormControl>
               <Input type="number" step="0.01" {...field} />
             </FormControl>
@@ -198,14 +198,14 @@ export default function StockTransferEdit() {
       queryClient.invalidateQueries({ queryKey: ["/api/inventory/transfers"] });
       queryClient.invalidateQueries({ queryKey: [`/api/inventory/transfers/${transferId}`] });
       toast({
-        title: t("inventory.transferUpdated", "Transfer Updated"),
-        description: t("inventory.transferUpdatedDescription", "Stock transfer has been updated successfully."),
+        title: t("inventory.transferUpdated"),
+        description: t("inventory.transferUpdatedDescription"),
       });
       setLocation("/inventory/transfers");
     },
     onError: (error: any) => {
       toast({
-        title: t("common.error", "Error"),
+        title: t("common.error"),
         description: error.message,
         variant: "destructive",
       });
@@ -224,22 +224,22 @@ export default function StockTransferEdit() {
   };
 
   if (transferLoading) {
-    return <div className="p-8">{t("common.loading", "Loading...")}</div>;
+    return <div className="p-8">{t("common.loading")}</div>;
   }
 
   if (!transfer) {
-    return <div className="p-8">{t("common.notFound", "Transfer not found")}</div>;
+    return <div className="p-8">{t("common.notFound")}</div>;
   }
 
   if (transfer.status !== 'draft') {
     return (
       <div className="p-8 text-center">
-        <h2 className="text-2xl font-bold mb-4">{t("inventory.cannotEdit", "Cannot Edit")}</h2>
+        <h2 className="text-2xl font-bold mb-4">{t("inventory.cannotEdit")}</h2>
         <p className="text-muted-foreground mb-4">
-          {t("inventory.onlyDraftEditable", "Only draft transfers can be edited.")}
+          {t("inventory.onlyDraftEditable")}
         </p>
         <Button onClick={() => setLocation("/inventory/transfers")}>
-          {t("common.back", "Back")}
+          {t("common.back")}
         </Button>
       </div>
     );
@@ -248,9 +248,9 @@ export default function StockTransferEdit() {
   return (
     <div className="space-y-6 px-4 sm:px-6 md:px-8 py-6 max-w-4xl mx-auto">
       <div>
-        <h2 className="text-2xl sm:text-3xl font-bold tracking-tight">{t("inventory.editTransfer", "Edit Stock Transfer")}</h2>
+        <h2 className="text-2xl sm:text-3xl font-bold tracking-tight">{t("inventory.editTransfer")}</h2>
         <p className="text-sm md:text-base text-muted-foreground">
-          {t("inventory.editTransferDescription", "Modify the stock transfer details")}
+          {t("inventory.editTransferDescription")}
         </p>
       </div>
 
@@ -258,7 +258,7 @@ export default function StockTransferEdit() {
         <form onSubmit={form.handleSubmit(onSubmit)} className="space-y-8">
           <Card>
             <CardHeader>
-              <CardTitle>{t("inventory.transferDetails", "Transfer Details")}</CardTitle>
+              <CardTitle>{t("inventory.transferDetails")}</CardTitle>
             </CardHeader>
             <CardContent className="grid gap-6 md:grid-cols-2">
               <FormField
@@ -279,7 +279,7 @@ export default function StockTransferEdit() {
                 name="date"
                 render={({ field }) => (
                   <FormItem>
-                    <FormLabel>{t("common.date", "Date")}</FormLabel>
+                    <FormLabel>{t("common.date")}</FormLabel>
                     <FormControl>
                       <Input type="date" {...field} />
                     </FormControl>
@@ -296,7 +296,7 @@ export default function StockTransferEdit() {
                     <Select onValueChange={field.onChange} value={field.value}>
                       <FormControl>
                         <SelectTrigger>
-                          <SelectValue placeholder={t("inventory.selectSource", "Select source")} />
+                          <SelectValue placeholder={t("inventory.selectSource")} />
                         </SelectTrigger>
                       </FormControl>
                       <SelectContent>
@@ -320,7 +320,7 @@ export default function StockTransferEdit() {
                     <Select onValueChange={field.onChange} value={field.value}>
                       <FormControl>
                         <SelectTrigger>
-                          <SelectValue placeholder={t("inventory.selectDestination", "Select destination")} />
+                          <SelectValue placeholder={t("inventory.selectDestination")} />
                         </SelectTrigger>
                       </FormControl>
                       <SelectContent>
@@ -341,7 +341,7 @@ export default function StockTransferEdit() {
                   name="notes"
                   render={({ field }) => (
                     <FormItem>
-                      <FormLabel>{t("common.notes", "Notes")}</FormLabel>
+                      <FormLabel>{t("common.notes")}</FormLabel>
                       <FormControl>
                         <Textarea {...field} />
                       </FormControl>
@@ -355,7 +355,7 @@ export default function StockTransferEdit() {
 
           <Card>
             <CardHeader className="flex flex-row items-center justify-between">
-              <CardTitle>{t("common.items", "Items")}</CardTitle>
+              <CardTitle>{t("common.items")}</CardTitle>
               <Button
                 type="button"
                 variant="outline"
@@ -363,7 +363,7 @@ export default function StockTransferEdit() {
                 onClick={() => append({ item_id: "", quantity: 1 })}
               >
                 <Plus className="me-2 h-4 w-4" />
-                {t("common.addItem", "Add Item")}
+                {t("common.addItem")}
               </Button>
             </CardHeader>
             <CardContent className="space-y-4">
@@ -386,10 +386,10 @@ export default function StockTransferEdit() {
               onClick={() => setLocation("/inventory/transfers")}
               className="w-full sm:w-auto"
             >
-              {t("common.cancel", "Cancel")}
+              {t("common.cancel")}
             </Button>
             <Button type="submit" disabled={updateTransfer.isPending} className="w-full sm:w-auto">
-              {updateTransfer.isPending ? t("common.saving", "Saving...") : t("common.save", "Save Changes")}
+              {updateTransfer.isPending ? t("common.saving") : t("common.save")}
             </Button>
           </div>
         </form>
@@ -60,11 +60,11 @@ function TransferItemRow({ index, form, remove, items }: { index: number, form:
         name={`items.${index}.item_id`}
         render={({ field }) => (
           <FormItem className="flex-1">
-            <FormLabel>{t("items.item", "Item")}</FormLabel>
+            <FormLabel>{t("items.item")}</FormLabel>
             <Select onValueChange={field.onChange} defaultValue={field.value}>
               <FormControl>
                 <SelectTrigger>
-                  <SelectValue placeholder={t("inventory.selectItem", "Select item")} />
+                  <SelectValue placeholder={t("inventory.selectItem")} />
                 </SelectTrigger>
               </FormControl>
               <SelectContent>
@@ -86,7 +86,7 @@ function TransferItemRow({ index, form, remove, items }: { index: number, form:
           name={`items.${index}.batch_id`}
           render={({ field }) => (
             <FormItem className="w-48">
-              <FormLabel>{t("inventory.batch", "Batch")}</FormLabel>
+              <FormLabel>{t("inventory.batch")}</FormLabel>
               <Select onValueChange={field.onChange} defaultValue={field.value}>
                 <FormControl>
                   <SelectTrigger>
@@ -96,7 +96,7 @@ function TransferItemRow({ index, form, remove, items }: { index: number, form:
                 <SelectContent>
                   {batches?.map((batch: any) => (
                     <SelectItem key={batch.id} value={batch.id}>
-                      {batch.batch_number} ({t("inventory.exp", "Exp")}: {batch.expiry_date ? new Date(batch.expiry_date).toLocaleDateString() : t("common.na", "N/A")})
+                      {batch.batch_number} ({t("inventory.exp")}: {batch.expiry_date ? new Date(batch.expiry_date).toLocaleDateString() : t("common.na")})
                     </SelectItem>
                   ))}
                 </SelectContent>
@@ -112,7 +112,7 @@ function TransferItemRow({ index, form, remove, items }: { index: number, form:
         name={`items.${index}.quantity`}
         render={({ field }) => (
           <FormItem className="w-32">
-            <FormLabel>{t("common.quantity", "Quantity")}</FormLabel>
+            <FormLabel>{t("common.quantity")}</FormLabel>
             <FormControl>
               <Input type="number" step="0.01" {...field} />
             </FormControl>
@@ -169,14 +169,14 @@ export default function StockTransferForm() {
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ["/api/inventory/transfers"] });
       toast({
-        title: t("inventory.transferCreated", "Transfer Created"),
-        description: t("inventory.transferCreatedDescription", "Stock transfer has been created successfully."),
+        title: t("inventory.transferCreated"),
+        description: t("inventory.transferCreatedDescription"),
       });
       setLocation("/inventory/transfers");
     },
     onError: (error: any) => {
       toast({
-        title: t("common.error", "Error"),
+        title: t("common.error"),
         description: error.message,
         variant: "destructive",
       });
@@ -199,7 +199,7 @@ export default function StockTransferForm() {
       <div>
         <h2 className="text-2xl sm:text-3xl font-bold tracking-tight">{t("inventory.newTransfer", "New Stock Transfer")}</h2>
         <p className="text-sm md:text-base text-muted-foreground">
-          {t("inventory.createTransferDescription", "Create a new transfer between warehouses")}
+          {t("inventory.createTransferDescription")}
         </p>
       </div>
 
@@ -207,7 +207,7 @@ export default function StockTransferForm() {
         <form onSubmit={form.handleSubmit(onSubmit)} className="space-y-8">
           <Card>
             <CardHeader>
-              <CardTitle>{t("inventory.transferDetails", "Transfer Details")}</CardTitle>
+              <CardTitle>{t("inventory.transferDetails")}</CardTitle>
             </CardHeader>
             <CardContent className="grid gap-6 md:grid-cols-2">
               <FormField
@@ -228,7 +228,7 @@ export default function StockTransferForm() {
                 name="date"
                 render={({ field }) => (
                   <FormItem>
-                    <FormLabel>{t("common.date", "Date")}</FormLabel>
+                    <FormLabel>{t("common.date")}</FormLabel>
                     <FormControl>
                       <Input type="date" {...field} />
                     </FormControl>
@@ -245,7 +245,7 @@ export default function StockTransferForm() {
                     <Select onValueChange={field.onChange} defaultValue={field.value}>
                       <FormControl>
                         <SelectTrigger>
-                          <SelectValue placeholder={t("inventory.selectSource", "Select source")} />
+                          <SelectValue placeholder={t("inventory.selectSource")} />
                         </SelectTrigger>
                       </FormControl>
                       <SelectContent>
@@ -269,7 +269,7 @@ export default function StockTransferForm() {
                     <Select onValueChange={field.onChange} defaultValue={field.value}>
                       <FormControl>
                         <SelectTrigger>
-                          <SelectValue placeholder={t("inventory.selectDestination", "Select destination")} />
+                          <SelectValue placeholder={t("inventory.selectDestination")} />
                         </SelectTrigger>
                       </FormControl>
                       <SelectContent>
@@ -290,7 +290,7 @@ export default function StockTransferForm() {
                   name="notes"
                   render={({ field }) => (
                     <FormItem>
-                      <FormLabel>{t("common.notes", "Notes")}</FormLabel>
+                      <FormLabel>{t("common.notes")}</FormLabel>
                       <FormControl>
                         <Textarea {...field} />
                       </FormControl>
@@ -304,7 +304,7 @@ export default function StockTransferForm() {
 
           <Card>
             <CardHeader className="flex flex-row items-center justify-between">
-              <CardTitle>{t("common.items", "Items")}</CardTitle>
+              <CardTitle>{t("common.items")}</CardTitle>
               <Button
                 type="button"
                 variant="outline"
@@ -312,7 +312,7 @@ export default function StockTransferForm() {
                 onClick={() => append({ item_id: "", quantity: 1 })}
               >
                 <Plus className="me-2 h-4 w-4" />
-                {t("common.addItem", "Add Item")}
+                {t("common.addItem")}
               </Button>
             </CardHeader>
             <CardContent className="space-y-4">
@@ -335,10 +335,10 @@ export default function StockTransferForm() {
               onClick={() => setLocation("/inventory/transfers")}
               className="w-full sm:w-auto"
             >
-              {t("common.cancel", "Cancel")}
+              {t("common.cancel")}
             </Button>
             <Button type="submit" disabled={createTransfer.isPending} className="w-full sm:w-auto">
-              {createTransfer.isPending ? t("common.creating", "Creating...") : t("inventory.createTransfer", "Create Transfer")}
+              {createTransfer.isPending ? t("common.creating") : t("inventory.createTransfer")}
             </Button>
           </div>
         </form>
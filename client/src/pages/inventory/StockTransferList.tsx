@@ -53,7 +53,7 @@ export default function StockTransferList() {
       queryClient.invalidateQueries({ queryKey: ["/api/inventory/transfers"] });
       toast({
         title: t("common.success"),
-        description: t("inventory.transferCompleted", "Stock has been moved successfully."),
+        description: t("inventory.transferCompleted"),
       });
     },
     onError: (error: any) => {
@@ -74,7 +74,7 @@ export default function StockTransferList() {
       queryClient.invalidateQueries({ queryKey: ["/api/inventory/transfers"] });
       toast({
         title: t("common.success"),
-        description: t("inventory.transferDeleted", "Transfer deleted successfully."),
+        description: t("inventory.transferDeleted"),
       });
     },
     onError: (error: any) => {
@@ -87,16 +87,16 @@ export default function StockTransferList() {
   });
 
   if (isLoading) {
-    return <div className="p-8">{t("common.loading", "Loading...")}</div>;
+    return <div className="p-8">{t("common.loading")}</div>;
   }
 
   return (
     <div className="space-y-6 w-full max-w-full min-w-0">
       <div className="flex flex-col space-y-4 sm:flex-row sm:items-center sm:justify-between sm:space-y-0">
         <div className="min-w-0 flex-1">
-          <h1 className="text-2xl sm:text-3xl font-bold tracking-tight truncate">{t("inventory.stockTransfers", "Stock Transfers")}</h1>
+          <h1 className="text-2xl sm:text-3xl font-bold tracking-tight truncate">{t("inventory.stockTransfers")}</h1>
           <p className="text-sm text-muted-foreground truncate">
-            {t("inventory.stockTransfersDescription", "Manage internal stock movements between warehouses")}
+            {t("inventory.stockTransfersDescription")}
           </p>
         </div>
         <Link href="/inventory/transfers/new">
@@ -109,20 +109,20 @@ export default function StockTransferList() {
 
       <Card className="w-full max-w-full overflow-hidden">
         <CardHeader>
-          <CardTitle>{t("inventory.transferHistory", "Transfer History")}</CardTitle>
+          <CardTitle>{t("inventory.transferHistory")}</CardTitle>
         </CardHeader>
         <CardContent className="p-0">
           <div className="overflow-x-auto w-full">
             <Table>
               <TableHeader>
                 <TableRow>
-                  <TableHead className="whitespace-nowrap">{t("common.date", "Date")}</TableHead>
+                  <TableHead className="whitespace-nowrap">{t("common.date")}</TableHead>
                   <TableHead className="whitespace-nowrap">{t("inventory.transferNumber", "Transfer #")}</TableHead>
                   <TableHead className="whitespace-nowrap">{t("inventory.fromWarehouse", "From")}</TableHead>
                   <TableHead className="whitespace-nowrap">{t("inventory.toWarehouse", "To")}</TableHead>
-                  <TableHead className="whitespace-nowrap">{t("common.status", "Status")}</TableHead>
-                  <TableHead className="text-end whitespace-nowrap">{t("common.items", "Items")}</TableHead>
-                  <TableHead className="text-end whitespace-nowrap">{t("common.actions", "Actions")}</TableHead>
+                  <TableHead className="whitespace-nowrap">{t("common.status")}</TableHead>
+                  <TableHead className="text-end whitespace-nowrap">{t("common.items")}</TableHead>
+                  <TableHead className="text-end whitespace-nowrap">{t("common.actions")}</TableHead>
                 </TableRow>
               </TableHeader>
               <TableBody>
@@ -157,7 +157,7 @@ export default function StockTransferList() {
                         </DialogTrigger>
                         <DialogContent className="sm:max-w-[600px] max-h-[90vh] overflow-y-auto">
                           <DialogHeader>
-                            <DialogTitle>{t("inventory.transferDetails", "Transfer Details")}: {transfer.transfer_number}</DialogTitle>
+                            <DialogTitle>{t("inventory.transferDetails")}: {transfer.transfer_number}</DialogTitle>
                           </DialogHeader>
                           <div className="space-y-4">
                             <div className="grid grid-cols-1 sm:grid-cols-2 gap-4 text-sm">
@@ -168,10 +168,10 @@ export default function StockTransferList() {
                                 <span className="font-semibold">{t("inventory.toWarehouse", "To")}:</span> {transfer.to_warehouse.name}
                               </div>
                               <div>
-                                <span className="font-semibold">{t("common.date", "Date")}:</span> {format(new Date(transfer.date), "PP")}
+                                <span className="font-semibold">{t("common.date")}:</span> {format(new Date(transfer.date), "PP")}
                               </div>
                               <div>
-                                <span className="font-semibold">{t("common.status", "Status")}:</span> {String(t(`status.${transfer.status}`, transfer.status))}
+                                <span className="font-semibold">{t("common.status")}:</span> {String(t(`status.${transfer.status}`, transfer.status))}
                               </div>
                             </div>
                             
@@ -179,8 +179,8 @@ export default function StockTransferList() {
                               <TableHeader>
                                 <TableRow>
                                   <TableHead>{t("common.item", "Item")}</TableHead>
-                                  <TableHead>{t("common.sku", "SKU")}</TableHead>
-                                  <TableHead className="text-end">{t("common.quantity", "Quantity")}</TableHead>
+                                  <TableHead>{t("common.sku")}</TableHead>
+                                  <TableHead className="text-end">{t("common.quantity")}</TableHead>
                                 </TableRow>
                               </TableHeader>
                               <TableBody>
@@ -196,7 +196,7 @@ export default function StockTransferList() {
                             
                             {transfer.notes && (
                               <div className="text-sm text-muted-foreground">
-                                <span className="font-semibold text-foreground">{t("common.notes", "Notes")}:</span> {transfer.notes}
+                                <span className="font-semibold text-foreground">{t("common.notes")}:</span> {transfer.notes}
                               </div>
                             )}
                           </div>
@@ -205,7 +205,7 @@ export default function StockTransferList() {
 
                       {transfer.status === 'draft' && (
                         <Link href={`/inventory/transfers/edit/${transfer.id}`}>
-                          <Button size="sm" variant="ghost" title={t("common.edit", "Edit")}>
+                          <Button size="sm" variant="ghost" title={t("common.edit")}>
                             <Pencil className="h-4 w-4" />
                           </Button>
                         </Link>
@@ -214,24 +214,24 @@ export default function StockTransferList() {
                       {transfer.status === 'draft' && (
                         <AlertDialog>
                           <AlertDialogTrigger asChild>
-                            <Button size="sm" variant="ghost" className="text-destructive hover:text-destructive" title={t("common.delete", "Delete")}>
+                            <Button size="sm" variant="ghost" className="text-destructive hover:text-destructive" title={t("common.delete")}>
                               <Trash2 className="h-4 w-4" />
                             </Button>
                           </AlertDialogTrigger>
                           <AlertDialogContent>
                             <AlertDialogHeader>
-                              <AlertDialogTitle>{t("inventory.deleteTransferTitle", "Delete Transfer?")}</AlertDialogTitle>
+                              <AlertDialogTitle>{t("inventory.deleteTransferTitle")}</AlertDialogTitle>
                               <AlertDialogDescription>
-                                {t("inventory.deleteTransferDescription", "This will permanently delete this transfer. This action cannot be undone.")}
+                                {t("inventory.deleteTransferDescription")}
                               </AlertDialogDescription>
                             </AlertDialogHeader>
                             <AlertDialogFooter>
-                              <AlertDialogCancel>{t("common.cancel", "Cancel")}</AlertDialogCancel>
+                              <AlertDialogCancel>{t("common.cancel")}</AlertDialogCancel>
                               <AlertDialogAction 
                                 onClick={() => deleteMutation.mutate(transfer.id)}
                                 className="bg-destructive text-destructive-foreground hover:bg-destructive/90"
                               >
-                                {t("common.delete", "Delete")}
+                                {t("common.delete")}
                               </AlertDialogAction>
                             </AlertDialogFooter>
                           </AlertDialogContent>
@@ -243,20 +243,20 @@ export default function StockTransferList() {
                           <AlertDialogTrigger asChild>
                             <Button size="sm" variant="outline" className="text-green-600 hover:text-green-700">
                               <CheckCircle className="me-2 h-4 w-4" />
-                              {t("approvals.approve", "Approve")}
+                              {t("approvals.approve")}
                             </Button>
                           </AlertDialogTrigger>
                           <AlertDialogContent>
                             <AlertDialogHeader>
-                              <AlertDialogTitle>{t("inventory.approveTransferTitle", "Approve Transfer?")}</AlertDialogTitle>
+                              <AlertDialogTitle>{t("inventory.approveTransferTitle")}</AlertDialogTitle>
                               <AlertDialogDescription>
-                                {t("inventory.approveTransferDescription", "This will immediately move stock from {{from}} to {{to}}. This action cannot be undone.", { from: transfer.from_warehouse.name, to: transfer.to_warehouse.name })}
+                                {t("inventory.approveTransferDescription", { from: transfer.from_warehouse.name, to: transfer.to_warehouse.name })}
                               </AlertDialogDescription>
                             </AlertDialogHeader>
                             <AlertDialogFooter>
-                              <AlertDialogCancel>{t("common.cancel", "Cancel")}</AlertDialogCancel>
+                              <AlertDialogCancel>{t("common.cancel")}</AlertDialogCancel>
                               <AlertDialogAction onClick={() => completeMutation.mutate(transfer.id)}>
-                                {t("inventory.approveAndTransfer", "Approve & Transfer")}
+                                {t("inventory.approveAndTransfer")}
                               </AlertDialogAction>
                             </AlertDialogFooter>
                           </AlertDialogContent>
@@ -269,7 +269,7 @@ export default function StockTransferList() {
               {transfers?.length === 0 && (
                 <TableRow>
                   <TableCell colSpan={7} className="text-center py-8 text-muted-foreground">
-                    {t("inventory.noTransfersFound", "No transfers found")}
+                    {t("inventory.noTransfersFound")}
                   </TableCell>
                 </TableRow>
               )}
@@ -1,6 +1,6 @@
 import { useState } from "react";
 import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
-import { useTranslation } from "react-i18next";
+import { useTypedTranslation } from "@/hooks/useTypedTranslation";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
@@ -14,7 +14,7 @@ import { Badge } from "@/components/ui/badge";
 import { apiRequest } from "@/lib/queryClient";
 
 export default function WarehousesPage() {
-  const { t } = useTranslation();
+  const { t } = useTypedTranslation();
   const { toast } = useToast();
   const queryClient = useQueryClient();
   const [isCreateOpen, setIsCreateOpen] = useState(false);
@@ -83,7 +83,7 @@ export default function WarehousesPage() {
       setEditingWarehouse(null);
       toast({
         title: t("common.success"),
-        description: t("inventory.warehouses.updatedDesc", { defaultValue: "Warehouse updated successfully" }),
+        description: t("inventory.warehouses.updatedDesc"),
       });
     },
     onError: (error: any) => {
@@ -237,9 +237,9 @@ export default function WarehousesPage() {
       <Dialog open={isEditOpen} onOpenChange={setIsEditOpen}>
         <DialogContent className="sm:max-w-[425px] max-h-[90vh] overflow-y-auto">
           <DialogHeader>
-            <DialogTitle>{t("inventory.warehouses.editWarehouse", { defaultValue: "Edit Warehouse" })}</DialogTitle>
+            <DialogTitle>{t("inventory.warehouses.editWarehouse")}</DialogTitle>
             <DialogDescription>
-              {t("inventory.warehouses.editDetails", { defaultValue: "Update warehouse details" })}
+              {t("inventory.warehouses.editDetails")}
             </DialogDescription>
           </DialogHeader>
           {editingWarehouse && (
@@ -88,21 +88,21 @@ export default function JournalForm() {
       }
       if (data.warnings && data.warnings.length > 0) {
         toast({
-          title: t("accounting.journals.aiDraftWarnings", "AI Draft Warnings"),
+          title: t("accounting.journals.aiDraftWarnings"),
           description: data.warnings.join("\n"),
           variant: "default"
         });
       } else {
         toast({
-          title: t("accounting.journals.draftGenerated", "Draft Generated"),
-          description: t("accounting.journals.draftFromDescription", "Journal entry drafted from your description."),
+          title: t("accounting.journals.draftGenerated"),
+          description: t("accounting.journals.draftFromDescription"),
         });
       }
       setIsAiDialogOpen(false);
     },
     onError: (error: any) => {
       toast({
-        title: t("accounting.journals.aiDraftFailed", "AI Draft Failed"),
+        title: t("accounting.journals.aiDraftFailed"),
         description: error.message,
         variant: "destructive",
       });
@@ -198,35 +198,35 @@ export default function JournalForm() {
             <DialogTrigger asChild>
               <Button variant="outline" className="gap-2">
                 <Sparkles className="h-4 w-4 text-purple-500" />
-                {t("accounting.journals.draftWithAI", "Draft with AI")}
+                {t("accounting.journals.draftWithAI")}
               </Button>
             </DialogTrigger>
             <DialogContent>
               <DialogHeader>
-                <DialogTitle>{t("accounting.journals.draftJournalWithAI", "Draft Journal Entry with AI")}</DialogTitle>
+                <DialogTitle>{t("accounting.journals.draftJournalWithAI")}</DialogTitle>
                 <DialogDescription>
-                  {t("accounting.journals.aiDescription", "Describe the transaction in plain language (e.g., \"Bought office supplies for $50 cash\"). AI will select the accounts and amounts for you.")}
+                  {t("accounting.journals.aiDescription")}
                 </DialogDescription>
               </DialogHeader>
               <div className="py-4">
                 <Textarea 
-                  placeholder={t("accounting.journals.aiPlaceholder", "e.g. Paid $1200 for rent via bank transfer")} 
+                  placeholder={t("accounting.journals.aiPlaceholder")} 
                   value={aiPrompt}
                   onChange={(e) => setAiPrompt(e.target.value)}
                   rows={4}
                 />
               </div>
               <DialogFooter>
-                <Button variant="outline" onClick={() => setIsAiDialogOpen(false)}>{t("common.cancel", "Cancel")}</Button>
+                <Button variant="outline" onClick={() => setIsAiDialogOpen(false)}>{t("common.cancel")}</Button>
                 <Button 
                   onClick={() => aiDraftMutation.mutate(aiPrompt)} 
                   disabled={!aiPrompt || aiDraftMutation.isPending}
                   className="gap-2"
                 >
-                  {aiDraftMutation.isPending ? t("accounting.journals.drafting", "Drafting...") : (
+                  {aiDraftMutation.isPending ? t("accounting.journals.drafting") : (
                     <>
                       <Brain className="h-4 w-4" />
-                      {t("accounting.journals.generateDraft", "Generate Draft")}
+                      {t("accounting.journals.generateDraft")}
                     </>
                   )}
                 </Button>
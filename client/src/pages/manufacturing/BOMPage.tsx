@@ -68,7 +68,7 @@ export default function BOMPage() {
       resetForm();
       toast({
         title: t("common.success"),
-        description: t("manufacturing.bomCreateSuccess", "BOM created successfully"),
+        description: t("manufacturing.bomCreateSuccess"),
       });
     },
     onError: (error: any) => {
@@ -90,7 +90,7 @@ export default function BOMPage() {
       resetForm();
       toast({
         title: t("common.success"),
-        description: t("manufacturing.bomUpdateSuccess", "BOM updated successfully"),
+        description: t("manufacturing.bomUpdateSuccess"),
       });
     },
     onError: (error: any) => {
@@ -148,14 +148,14 @@ export default function BOMPage() {
     <PageContainer>
       {/* Responsive Header */}
       <div className="flex flex-col space-y-4 sm:flex-row sm:items-center sm:justify-between sm:space-y-0 mb-6">
-        <h1 className="text-2xl sm:text-3xl font-bold tracking-tight">{t("manufacturing.boms", "Bill of Materials")}</h1>
+        <h1 className="text-2xl sm:text-3xl font-bold tracking-tight">{t("manufacturing.boms")}</h1>
       </div>
 
       <div className="flex flex-col space-y-4 sm:flex-row sm:items-center sm:justify-between sm:space-y-0 mb-6">
         <div className="relative w-full sm:w-72">
           <Search className="absolute start-2 top-2.5 h-4 w-4 text-muted-foreground" />
           <Input
-            placeholder={t("common.search", "Search...")}
+            placeholder={t("common.search")}
             value={searchTerm}
             onChange={(e) => setSearchTerm(e.target.value)}
             className="ps-8"
@@ -168,19 +168,19 @@ export default function BOMPage() {
           <DialogTrigger asChild>
             <Button className="w-full sm:w-auto">
               <Plus className="me-2 h-4 w-4" />
-              {t("manufacturing.addBom", "Add BOM")}
+              {t("manufacturing.addBom")}
             </Button>
           </DialogTrigger>
           <DialogContent className="sm:max-w-[600px] max-h-[90vh] overflow-y-auto">
             <DialogHeader>
               <DialogTitle>
-                {editingId ? t("manufacturing.editBom", "Edit BOM") : t("manufacturing.addBom", "Add BOM")}
+                {editingId ? t("manufacturing.editBom") : t("manufacturing.addBom")}
               </DialogTitle>
             </DialogHeader>
             <form id="bom-form" onSubmit={handleSubmit} className="space-y-4">
               <div className="grid grid-cols-1 sm:grid-cols-2 gap-4">
                 <div className="space-y-2">
-                  <Label>{t("manufacturing.bomName", "BOM Name")}</Label>
+                  <Label>{t("manufacturing.bomName")}</Label>
                   <Input
                     value={formData.name}
                     onChange={(e) => setFormData({ ...formData, name: e.target.value })}
@@ -188,7 +188,7 @@ export default function BOMPage() {
                   />
                 </div>
                 <div className="space-y-2">
-                  <Label>{t("manufacturing.version", "Version")}</Label>
+                  <Label>{t("manufacturing.version")}</Label>
                   <Input
                     value={formData.version}
                     onChange={(e) => setFormData({ ...formData, version: e.target.value })}
@@ -198,7 +198,7 @@ export default function BOMPage() {
               </div>
 
               <div className="space-y-2">
-                <Label>{t("manufacturing.finishedGood", "Finished Good")}</Label>
+                <Label>{t("manufacturing.finishedGood")}</Label>
                 <Select
                   value={formData.item_id}
                   onValueChange={(val) => setFormData({ ...formData, item_id: val })}
@@ -218,7 +218,7 @@ export default function BOMPage() {
 
               <div className="grid grid-cols-1 sm:grid-cols-2 gap-4">
                 <div className="space-y-2">
-                  <Label>{t("manufacturing.laborCost", "Labor Cost")}</Label>
+                  <Label>{t("manufacturing.laborCost")}</Label>
                   <Input
                     type="number"
                     value={formData.labor_cost}
@@ -226,7 +226,7 @@ export default function BOMPage() {
                   />
                 </div>
                 <div className="space-y-2">
-                  <Label>{t("manufacturing.overheadCost", "Overhead Cost")}</Label>
+                  <Label>{t("manufacturing.overheadCost")}</Label>
                   <Input
                     type="number"
                     value={formData.overhead_cost}
@@ -237,10 +237,10 @@ export default function BOMPage() {
             </form>
             <DialogFooter className="flex flex-col-reverse sm:flex-row gap-2">
               <Button type="button" variant="outline" onClick={() => setIsDialogOpen(false)} className="w-full sm:w-auto">
-                {t("common.cancel", "Cancel")}
+                {t("common.cancel")}
               </Button>
               <Button type="submit" form="bom-form" disabled={createMutation.isPending || updateMutation.isPending} className="w-full sm:w-auto">
-                {editingId ? t("common.save", "Save Changes") : t("common.create", "Create BOM")}
+                {editingId ? t("common.save") : t("common.create")}
               </Button>
             </DialogFooter>
           </DialogContent>
@@ -251,24 +251,24 @@ export default function BOMPage() {
         <Table className="min-w-[500px]">
           <TableHeader>
             <TableRow>
-              <TableHead>{t("manufacturing.name", "Name")}</TableHead>
+              <TableHead>{t("manufacturing.name")}</TableHead>
               <TableHead>{t("manufacturing.item", "Item")}</TableHead>
-              <TableHead>{t("manufacturing.version", "Version")}</TableHead>
-              <TableHead>{t("common.status", "Status")}</TableHead>
-              <TableHead className="text-end">{t("common.actions", "Actions")}</TableHead>
+              <TableHead>{t("manufacturing.version")}</TableHead>
+              <TableHead>{t("common.status")}</TableHead>
+              <TableHead className="text-end">{t("common.actions")}</TableHead>
             </TableRow>
           </TableHeader>
           <TableBody>
             {isLoading ? (
               <TableRow>
                 <TableCell colSpan={5} className="text-center py-8">
-                  {t("common.loading", "Loading...")}
+                  {t("common.loading")}
                 </TableCell>
               </TableRow>
             ) : filteredBoms.length === 0 ? (
               <TableRow>
                 <TableCell colSpan={5} className="text-center py-8 text-muted-foreground">
-                  {t("manufacturing.noBoms", "No BOMs found")}
+                  {t("manufacturing.noBoms")}
                 </TableCell>
               </TableRow>
             ) : (
@@ -289,7 +289,7 @@ export default function BOMPage() {
                   <TableCell>{bom.version}</TableCell>
                   <TableCell>
                     <Badge variant={bom.is_active ? "default" : "secondary"}>
-                      {bom.is_active ? t("status.active", "Active") : t("status.inactive", "Inactive")}
+                      {bom.is_active ? t("status.active") : t("status.inactive")}
                     </Badge>
                   </TableCell>
                   <TableCell className="text-end">
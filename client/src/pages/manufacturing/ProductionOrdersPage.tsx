@@ -82,7 +82,7 @@ export default function ProductionOrdersPage() {
       resetForm();
       toast({
         title: t("common.success"),
-        description: t("manufacturing.orderCreateSuccess", "Production order created successfully"),
+        description: t("manufacturing.orderCreateSuccess"),
       });
     },
     onError: (error: any) => {
@@ -104,7 +104,7 @@ export default function ProductionOrdersPage() {
       resetForm();
       toast({
         title: t("common.success"),
-        description: t("manufacturing.orderUpdateSuccess", "Production order updated successfully"),
+        description: t("manufacturing.orderUpdateSuccess"),
       });
     },
     onError: (error: any) => {
@@ -126,7 +126,7 @@ export default function ProductionOrdersPage() {
       setCompletionData({ batch_number: "", expiry_date: "" });
       toast({
         title: t("common.success"),
-        description: t("manufacturing.orderCompleteSuccess", "Production order completed successfully"),
+        description: t("manufacturing.orderCompleteSuccess"),
       });
     },
     onError: (error: any) => {
@@ -200,14 +200,14 @@ export default function ProductionOrdersPage() {
   return (
     <PageContainer>
       <div className="flex flex-col space-y-4 sm:flex-row sm:items-center sm:justify-between sm:space-y-0 mb-6">
-        <h1 className="text-2xl sm:text-3xl font-bold tracking-tight">{t("manufacturing.orders", "Production Orders")}</h1>
+        <h1 className="text-2xl sm:text-3xl font-bold tracking-tight">{t("manufacturing.orders")}</h1>
       </div>
 
       <div className="flex flex-col space-y-4 sm:flex-row sm:items-center sm:justify-between sm:space-y-0 mb-6">
         <div className="relative w-full sm:w-72">
           <Search className="absolute start-2 top-2.5 h-4 w-4 text-muted-foreground" />
           <Input
-            placeholder={t("common.search", "Search...")}
+            placeholder={t("common.search")}
             value={searchTerm}
             onChange={(e) => setSearchTerm(e.target.value)}
             className="ps-8"
@@ -220,19 +220,19 @@ export default function ProductionOrdersPage() {
           <DialogTrigger asChild>
             <Button className="w-full sm:w-auto">
               <Plus className="me-2 h-4 w-4" />
-              {t("manufacturing.addOrder", "Add Order")}
+              {t("manufacturing.addOrder")}
             </Button>
           </DialogTrigger>
           <DialogContent className="sm:max-w-[600px] max-h-[90vh] overflow-y-auto">
             <DialogHeader>
               <DialogTitle>
-                {editingId ? t("manufacturing.editOrder", "Edit Order") : t("manufacturing.addOrder", "Add Order")}
+                {editingId ? t("manufacturing.editOrder") : t("manufacturing.addOrder")}
               </DialogTitle>
             </DialogHeader>
             <form id="production-order-form" onSubmit={handleSubmit} className="space-y-4">
               <div className="grid grid-cols-1 sm:grid-cols-2 gap-4">
                 <div className="space-y-2">
-                  <Label>{t("manufacturing.orderNumber", "Order #")}</Label>
+                  <Label>{t("manufacturing.orderNumber")}</Label>
                   <Input
                     value={formData.order_number}
                     onChange={(e) => setFormData({ ...formData, order_number: e.target.value })}
@@ -240,7 +240,7 @@ export default function ProductionOrdersPage() {
                   />
                 </div>
                 <div className="space-y-2">
-                  <Label>{t("manufacturing.bom", "BOM")}</Label>
+                  <Label>{t("manufacturing.bom")}</Label>
                   <Select
                     value={formData.bom_id}
                     onValueChange={(val) => {
@@ -299,7 +299,7 @@ export default function ProductionOrdersPage() {
 
               <div className="grid grid-cols-1 sm:grid-cols-2 gap-4">
                 <div className="space-y-2">
-                  <Label>{t("manufacturing.startDate", "Start Date")}</Label>
+                  <Label>{t("manufacturing.startDate")}</Label>
                   <Input
                     type="date"
                     value={formData.start_date}
@@ -308,7 +308,7 @@ export default function ProductionOrdersPage() {
                   />
                 </div>
                 <div className="space-y-2">
-                  <Label>{t("manufacturing.dueDate", "Due Date")}</Label>
+                  <Label>{t("manufacturing.dueDate")}</Label>
                   <Input
                     type="date"
                     value={formData.due_date}
@@ -318,7 +318,7 @@ export default function ProductionOrdersPage() {
               </div>
 
               <div className="space-y-2">
-                <Label>{t("common.status", "Status")}</Label>
+                <Label>{t("common.status")}</Label>
                 <Select
                   value={formData.status}
                   onValueChange={(val) => setFormData({ ...formData, status: val })}
@@ -327,20 +327,20 @@ export default function ProductionOrdersPage() {
                     <SelectValue />
                   </SelectTrigger>
                   <SelectContent>
-                    <SelectItem value="planned">{t("status.planned", "Planned")}</SelectItem>
-                    <SelectItem value="in_progress">{t("status.inProgress", "In Progress")}</SelectItem>
-                    <SelectItem value="completed">{t("status.completed", "Completed")}</SelectItem>
-                    <SelectItem value="cancelled">{t("status.cancelled", "Cancelled")}</SelectItem>
+                    <SelectItem value="planned">{t("status.planned")}</SelectItem>
+                    <SelectItem value="in_progress">{t("status.inProgress")}</SelectItem>
+                    <SelectItem value="completed">{t("status.completed")}</SelectItem>
+                    <SelectItem value="cancelled">{t("status.cancelled")}</SelectItem>
                   </SelectContent>
                 </Select>
               </div>
             </form>
             <DialogFooter className="flex flex-col-reverse sm:flex-row gap-2">
               <Button type="button" variant="outline" onClick={() => setIsDialogOpen(false)} className="w-full sm:w-auto">
-                {t("common.cancel", "Cancel")}
+                {t("common.cancel")}
               </Button>
               <Button type="submit" form="production-order-form" disabled={createMutation.isPending || updateMutation.isPending} className="w-full sm:w-auto">
-                {editingId ? t("common.save", "Save Changes") : t("common.create", "Create Order")}
+                {editingId ? t("common.save") : t("common.create")}
               </Button>
             </DialogFooter>
           </DialogContent>
@@ -350,7 +350,7 @@ export default function ProductionOrdersPage() {
         <Dialog open={completionDialogOpen} onOpenChange={setCompletionDialogOpen}>
           <DialogContent>
             <DialogHeader>
-              <DialogTitle>{t("manufacturing.completeOrder", "Complete Production Order")}</DialogTitle>
+              <DialogTitle>{t("manufacturing.completeOrder")}</DialogTitle>
             </DialogHeader>
             <div className="space-y-4 py-4">
               <div className="space-y-2">
@@ -372,10 +372,10 @@ export default function ProductionOrdersPage() {
             </div>
             <div className="flex flex-col-reverse sm:flex-row sm:justify-end gap-2">
               <Button variant="outline" onClick={() => setCompletionDialogOpen(false)} className="w-full sm:w-auto">
-                {t("common.cancel", "Cancel")}
+                {t("common.cancel")}
               </Button>
               <Button onClick={handleConfirmComplete} disabled={completeMutation.isPending} className="w-full sm:w-auto">
-                {t("common.confirm", "Confirm Completion")}
+                {t("common.confirm")}
               </Button>
             </div>
           </DialogContent>
@@ -386,25 +386,25 @@ export default function ProductionOrdersPage() {
         <Table className="min-w-[500px]">
           <TableHeader>
             <TableRow>
-              <TableHead>{t("manufacturing.orderNumber", "Order #")}</TableHead>
+              <TableHead>{t("manufacturing.orderNumber")}</TableHead>
               <TableHead>{t("manufacturing.item", "Item")}</TableHead>
               <TableHead>{t("manufacturing.quantity", "Qty")}</TableHead>
-              <TableHead>{t("manufacturing.dates", "Dates")}</TableHead>
-              <TableHead>{t("common.status", "Status")}</TableHead>
-              <TableHead className="text-end">{t("common.actions", "Actions")}</TableHead>
+              <TableHead>{t("manufacturing.dates")}</TableHead>
+              <TableHead>{t("common.status")}</TableHead>
+              <TableHead className="text-end">{t("common.actions")}</TableHead>
             </TableRow>
           </TableHeader>
           <TableBody>
             {isLoading ? (
               <TableRow>
                 <TableCell colSpan={6} className="text-center py-8">
-                  {t("common.loading", "Loading...")}
+                  {t("common.loading")}
                 </TableCell>
               </TableRow>
             ) : filteredOrders.length === 0 ? (
               <TableRow>
                 <TableCell colSpan={6} className="text-center py-8 text-muted-foreground">
-                  {t("manufacturing.noOrders", "No orders found")}
+                  {t("manufacturing.noOrders")}
                 </TableCell>
               </TableRow>
             ) : (
@@ -435,7 +435,7 @@ export default function ProductionOrdersPage() {
                         variant="ghost"
                         size="icon"
                         onClick={() => handleCompleteClick(order.id)}
-                        title={t("manufacturing.complete", "Complete Order")}
+                        title={t("manufacturing.complete")}
                       >
                         <CheckCircle className="h-4 w-4 text-green-600" />
                       </Button>
@@ -1,5 +1,5 @@
 import { useQuery } from "@tanstack/react-query";
-import { useTranslation } from "react-i18next";
+import { useTypedTranslation } from "@/hooks/useTypedTranslation";
 import PortalLayout from "./PortalLayout";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from "@/components/ui/table";
@@ -9,7 +9,7 @@ import { format } from "date-fns";
 import { apiRequest } from "@/lib/queryClient";
 
 export default function PortalDashboard() {
-  const { t } = useTranslation();
+  const { t } = useTypedTranslation();
   const { data: user } = useQuery({
     queryKey: ['portal-me'],
     queryFn: async () => {
@@ -42,33 +42,33 @@ export default function PortalDashboard() {
     <PortalLayout>
       <div className="space-y-6">
         <div>
-          <h2 className="text-2xl font-bold">{t("portal.welcome", "Welcome")}, {user?.contact_name}</h2>
+          <h2 className="text-2xl font-bold">{t("portal.welcome")}, {user?.contact_name}</h2>
           <p className="text-muted-foreground">{user?.company_name}</p>
         </div>
 
         <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
           <Card>
             <CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2">
-              <CardTitle className="text-sm font-medium">{t("portal.outstandingBalance", "Outstanding Balance")}</CardTitle>
+              <CardTitle className="text-sm font-medium">{t("portal.outstandingBalance")}</CardTitle>
               <DollarSign className="h-4 w-4 text-muted-foreground" />
             </CardHeader>
             <CardContent>
               <div className="text-2xl font-bold">{stats?.outstanding_amount ? `$${Number(stats.outstanding_amount).toFixed(2)}` : '$0.00'}</div>
               <p className="text-xs text-muted-foreground">
-                {t("portal.totalAmountDue", "Total amount due")}
+                {t("portal.totalAmountDue")}
               </p>
             </CardContent>
           </Card>
           
           <Card>
             <CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2">
-              <CardTitle className="text-sm font-medium">{t("portal.recentDocuments", "Recent Documents")}</CardTitle>
+              <CardTitle className="text-sm font-medium">{t("portal.recentDocuments")}</CardTitle>
               <FileText className="h-4 w-4 text-muted-foreground" />
             </CardHeader>
             <CardContent>
               <div className="text-2xl font-bold">{stats?.recent_transactions?.length || 0}</div>
               <p className="text-xs text-muted-foreground">
-                {t("portal.inLast30Days", "In the last 30 days")}
+                {t("portal.inLast30Days")}
               </p>
             </CardContent>
           </Card>
@@ -76,16 +76,16 @@ export default function PortalDashboard() {
 
         <Card>
           <CardHeader>
-            <CardTitle>{t("portal.recentActivity", "Recent Activity")}</CardTitle>
+            <CardTitle>{t("portal.recentActivity")}</CardTitle>
           </CardHeader>
           <CardContent>
             <Table className="min-w-[500px]">
               <TableHeader>
                 <TableRow>
-                  <TableHead>{t("common.number", "Number")}</TableHead>
-                  <TableHead>{t("common.date", "Date")}</TableHead>
-                  <TableHead>{t("common.amount", "Amount")}</TableHead>
-                  <TableHead>{t("common.status", "Status")}</TableHead>
+                  <TableHead>{t("common.number")}</TableHead>
+                  <TableHead>{t("common.date")}</TableHead>
+                  <TableHead>{t("common.amount")}</TableHead>
+                  <TableHead>{t("common.status")}</TableHead>
                 </TableRow>
               </TableHeader>
               <TableBody>
@@ -104,7 +104,7 @@ export default function PortalDashboard() {
                 {(!stats?.recent_transactions || stats.recent_transactions.length === 0) && (
                   <TableRow>
                     <TableCell colSpan={4} className="text-center text-muted-foreground py-8">
-                      {t("portal.noRecentDocuments", "No recent documents found")}
+                      {t("portal.noRecentDocuments")}
                     </TableCell>
                   </TableRow>
                 )}
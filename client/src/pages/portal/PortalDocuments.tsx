@@ -1,5 +1,5 @@
 import { useQuery } from "@tanstack/react-query";
-import { useTranslation } from "react-i18next";
+import { useTypedTranslation } from "@/hooks/useTypedTranslation";
 import PortalLayout from "./PortalLayout";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from "@/components/ui/table";
@@ -10,7 +10,7 @@ import { Button } from "@/components/ui/button";
 import { apiRequest } from "@/lib/queryClient";
 
 export default function PortalDocuments() {
-  const { t } = useTranslation();
+  const { t } = useTypedTranslation();
   const { data: documents, isLoading } = useQuery({
     queryKey: ['portal-documents'],
     queryFn: async () => {
@@ -35,26 +35,26 @@ export default function PortalDocuments() {
       <div className="space-y-6">
         <div className="flex items-center justify-between">
           <div>
-            <h2 className="text-2xl font-bold">{t("portal.documents", "Documents")}</h2>
-            <p className="text-muted-foreground">{t("portal.documentsDescription", "View and download your invoices and bills")}</p>
+            <h2 className="text-2xl font-bold">{t("portal.documents")}</h2>
+            <p className="text-muted-foreground">{t("portal.documentsDescription")}</p>
           </div>
         </div>
 
         <Card>
           <CardHeader>
-            <CardTitle>{t("portal.allDocuments", "All Documents")}</CardTitle>
+            <CardTitle>{t("portal.allDocuments")}</CardTitle>
           </CardHeader>
           <CardContent>
             <Table className="min-w-[500px]">
               <TableHeader>
                 <TableRow>
-                  <TableHead>{t("common.type", "Type")}</TableHead>
-                  <TableHead>{t("common.number", "Number")}</TableHead>
-                  <TableHead>{t("common.date", "Date")}</TableHead>
-                  <TableHead>{t("common.dueDate", "Due Date")}</TableHead>
-                  <TableHead>{t("common.amount", "Amount")}</TableHead>
-                  <TableHead>{t("common.status", "Status")}</TableHead>
-                  <TableHead className="text-end">{t("common.actions", "Actions")}</TableHead>
+                  <TableHead>{t("common.type")}</TableHead>
+                  <TableHead>{t("common.number")}</TableHead>
+                  <TableHead>{t("common.date")}</TableHead>
+                  <TableHead>{t("common.dueDate")}</TableHead>
+                  <TableHead>{t("common.amount")}</TableHead>
+                  <TableHead>{t("common.status")}</TableHead>
+                  <TableHead className="text-end">{t("common.actions")}</TableHead>
                 </TableRow>
               </TableHeader>
               <TableBody>
@@ -84,7 +84,7 @@ export default function PortalDocuments() {
                 {(!documents || !Array.isArray(documents) || documents.length === 0) && (
                   <TableRow>
                     <TableCell colSpan={7} className="text-center text-muted-foreground py-8">
-                      {t("portal.noDocumentsFound", "No documents found")}
+                      {t("portal.noDocumentsFound")}
                     </TableCell>
                   </TableRow>
                 )}
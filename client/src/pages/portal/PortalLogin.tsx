@@ -1,7 +1,7 @@
 import { useState } from "react";
 import { useLocation } from "wouter";
 import { useMutation } from "@tanstack/react-query";
-import { useTranslation } from "react-i18next";
+import { useTypedTranslation } from "@/hooks/useTypedTranslation";
 import { apiRequest } from "@/lib/queryClient";
 import { Card, CardContent, CardHeader, CardTitle, CardDescription } from "@/components/ui/card";
 import { Input } from "@/components/ui/input";
@@ -12,7 +12,7 @@ import { useToast } from "@/hooks/use-toast";
 import { AdBanner } from "@/components/AdBanner";
 
 export default function PortalLogin() {
-  const { t } = useTranslation();
+  const { t } = useTypedTranslation();
   const [, setLocation] = useLocation();
   const { toast } = useToast();
   const [email, setEmail] = useState("");
@@ -28,8 +28,8 @@ export default function PortalLogin() {
     },
     onError: () => {
       toast({
-        title: t("portal.loginFailed", "Login Failed"),
-        description: t("portal.invalidCredentials", "Invalid email or password"),
+        title: t("portal.loginFailed"),
+        description: t("portal.invalidCredentials"),
         variant: "destructive"
       });
     }
@@ -39,21 +39,21 @@ export default function PortalLogin() {
     <div className="min-h-screen flex items-center justify-center bg-gray-50 dark:bg-background px-4 pb-16">
       <Card className="w-full max-w-md">
         <CardHeader className="text-center">
-          <CardTitle className="text-2xl">{t("portal.clientPortal", "Client Portal")}</CardTitle>
-          <CardDescription>{t("portal.signInDescription", "Sign in to view your invoices and statements")}</CardDescription>
+          <CardTitle className="text-2xl">{t("portal.clientPortal")}</CardTitle>
+          <CardDescription>{t("portal.signInDescription")}</CardDescription>
         </CardHeader>
         <CardContent className="space-y-4">
           <div className="space-y-2">
-            <Label>{t("common.email", "Email")}</Label>
+            <Label>{t("common.email")}</Label>
             <Input 
               type="email" 
               value={email} 
               onChange={e => setEmail(e.target.value)} 
-              placeholder={t("portal.emailPlaceholder", "you@company.com")}
+              placeholder={t("portal.emailPlaceholder")}
             />
           </div>
           <div className="space-y-2">
-            <Label>{t("common.password", "Password")}</Label>
+            <Label>{t("common.password")}</Label>
             <Input 
               type="password" 
               value={password} 
@@ -66,7 +66,7 @@ export default function PortalLogin() {
             disabled={loginMutation.isPending}
           >
             {loginMutation.isPending ? <Loader2 className="mr-2 h-4 w-4 animate-spin" /> : null}
-            {t("common.signIn", "Sign In")}
+            {t("common.signIn")}
           </Button>
         </CardContent>
       </Card>
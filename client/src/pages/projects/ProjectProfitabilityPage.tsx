@@ -80,9 +80,9 @@ export default function ProjectProfitabilityPage() {
   };
 
   const getProfitabilityBadge = (profit: number) => {
-    if (profit > 0) return <Badge className="bg-green-100 text-green-800 dark:bg-green-900 dark:text-green-200"><ArrowUpCircle className="h-3 w-3 me-1" />{t("projects.profitable", "رابح")}</Badge>;
-    if (profit < 0) return <Badge className="bg-red-100 text-red-800 dark:bg-red-900 dark:text-red-200"><ArrowDownCircle className="h-3 w-3 me-1" />{t("projects.loss", "خاسر")}</Badge>;
-    return <Badge variant="outline">{t("projects.breakeven", "متعادل")}</Badge>;
+    if (profit > 0) return <Badge className="bg-green-100 text-green-800 dark:bg-green-900 dark:text-green-200"><ArrowUpCircle className="h-3 w-3 me-1" />{t("projects.profitable")}</Badge>;
+    if (profit < 0) return <Badge className="bg-red-100 text-red-800 dark:bg-red-900 dark:text-red-200"><ArrowDownCircle className="h-3 w-3 me-1" />{t("projects.loss")}</Badge>;
+    return <Badge variant="outline">{t("projects.breakeven")}</Badge>;
   };
 
   const getBudgetUtilization = (project: any) => {
@@ -103,7 +103,7 @@ export default function ProjectProfitabilityPage() {
       t("projects.revenue"),
       t("projects.expenses"),
       t("projects.profit"),
-      t("projects.profitMargin", "هامش الربح") + " %"
+      t("projects.profitMargin") + " %"
     ];
 
     const rows = filteredProjects.map((p: any) => {
@@ -148,10 +148,10 @@ export default function ProjectProfitabilityPage() {
       <div className="flex flex-col space-y-4 sm:flex-row sm:items-center sm:justify-between sm:space-y-0">
         <div>
           <h1 className="text-2xl sm:text-3xl font-bold tracking-tight">
-            {t("projects.profitabilityReport", "تقرير ربحية المشاريع")}
+            {t("projects.profitabilityReport")}
           </h1>
           <p className="text-sm text-muted-foreground">
-            {t("projects.profitabilityDesc", "تحليل شامل لربحية جميع المشاريع")}
+            {t("projects.profitabilityDesc")}
           </p>
         </div>
         <Button onClick={exportToCSV} variant="outline">
@@ -166,7 +166,7 @@ export default function ProjectProfitabilityPage() {
           <CardHeader className="pb-2">
             <CardTitle className="text-sm font-medium text-muted-foreground flex items-center gap-2">
               <TrendingUp className="h-4 w-4 text-green-600" />
-              {t("projects.totalRevenue", "إجمالي الإيرادات")}
+              {t("projects.totalRevenue")}
             </CardTitle>
           </CardHeader>
           <CardContent>
@@ -178,7 +178,7 @@ export default function ProjectProfitabilityPage() {
           <CardHeader className="pb-2">
             <CardTitle className="text-sm font-medium text-muted-foreground flex items-center gap-2">
               <TrendingDown className="h-4 w-4 text-red-600" />
-              {t("projects.totalExpenses", "إجمالي المصروفات")}
+              {t("projects.totalExpenses")}
             </CardTitle>
           </CardHeader>
           <CardContent>
@@ -190,7 +190,7 @@ export default function ProjectProfitabilityPage() {
           <CardHeader className="pb-2">
             <CardTitle className="text-sm font-medium text-muted-foreground flex items-center gap-2">
               <DollarSign className="h-4 w-4 text-blue-600" />
-              {t("projects.netProfit", "صافي الربح")}
+              {t("projects.netProfit")}
             </CardTitle>
           </CardHeader>
           <CardContent>
@@ -204,7 +204,7 @@ export default function ProjectProfitabilityPage() {
           <CardHeader className="pb-2">
             <CardTitle className="text-sm font-medium text-muted-foreground flex items-center gap-2">
               <PieChart className="h-4 w-4 text-purple-600" />
-              {t("projects.profitMargin", "هامش الربح")}
+              {t("projects.profitMargin")}
             </CardTitle>
           </CardHeader>
           <CardContent>
@@ -221,7 +221,7 @@ export default function ProjectProfitabilityPage() {
           <CardContent className="flex items-center justify-between p-4">
             <div className="flex items-center gap-2">
               <CheckCircle2 className="h-5 w-5 text-green-600" />
-              <span className="text-sm font-medium">{t("projects.profitableProjects", "مشاريع رابحة")}</span>
+              <span className="text-sm font-medium">{t("projects.profitableProjects")}</span>
             </div>
             <span className="text-2xl font-bold text-green-600">{summary.profitableCount}</span>
           </CardContent>
@@ -231,7 +231,7 @@ export default function ProjectProfitabilityPage() {
           <CardContent className="flex items-center justify-between p-4">
             <div className="flex items-center gap-2">
               <AlertTriangle className="h-5 w-5 text-red-600" />
-              <span className="text-sm font-medium">{t("projects.lossProjects", "مشاريع خاسرة")}</span>
+              <span className="text-sm font-medium">{t("projects.lossProjects")}</span>
             </div>
             <span className="text-2xl font-bold text-red-600">{summary.lossCount}</span>
           </CardContent>
@@ -241,7 +241,7 @@ export default function ProjectProfitabilityPage() {
           <CardContent className="flex items-center justify-between p-4">
             <div className="flex items-center gap-2">
               <Target className="h-5 w-5 text-blue-600" />
-              <span className="text-sm font-medium">{t("projects.activeProjects", "مشاريع نشطة")}</span>
+              <span className="text-sm font-medium">{t("projects.activeProjects")}</span>
             </div>
             <span className="text-2xl font-bold text-blue-600">{summary.activeCount}</span>
           </CardContent>
@@ -253,16 +253,16 @@ export default function ProjectProfitabilityPage() {
         <CardHeader>
           <CardTitle className="flex items-center gap-2">
             <BarChart3 className="h-5 w-5" />
-            {t("projects.profitabilityDetails", "تفاصيل الربحية")}
+            {t("projects.profitabilityDetails")}
           </CardTitle>
         </CardHeader>
         <CardContent>
           <Tabs value={activeTab} onValueChange={setActiveTab}>
             <TabsList className="mb-4">
-              <TabsTrigger value="all">{t("common.all", "الكل")} ({projects?.length || 0})</TabsTrigger>
-              <TabsTrigger value="profitable">{t("projects.profitable", "رابح")} ({summary.profitableCount})</TabsTrigger>
-              <TabsTrigger value="loss">{t("projects.loss", "خاسر")} ({summary.lossCount})</TabsTrigger>
-              <TabsTrigger value="active">{t("projects.active", "نشط")} ({summary.activeCount})</TabsTrigger>
+              <TabsTrigger value="all">{t("common.all")} ({projects?.length || 0})</TabsTrigger>
+              <TabsTrigger value="profitable">{t("projects.profitable")} ({summary.profitableCount})</TabsTrigger>
+              <TabsTrigger value="loss">{t("projects.loss")} ({summary.lossCount})</TabsTrigger>
+              <TabsTrigger value="active">{t("projects.active")} ({summary.activeCount})</TabsTrigger>
             </TabsList>
 
             <div className="overflow-x-auto">
@@ -276,8 +276,8 @@ export default function ProjectProfitabilityPage() {
                     <TableHead className="text-end">{t("projects.revenue")}</TableHead>
                     <TableHead className="text-end">{t("projects.expenses")}</TableHead>
                     <TableHead className="text-end">{t("projects.profit")}</TableHead>
-                    <TableHead>{t("projects.budgetUsage", "استخدام الميزانية")}</TableHead>
-                    <TableHead>{t("projects.profitability", "الربحية")}</TableHead>
+                    <TableHead>{t("projects.budgetUsage")}</TableHead>
+                    <TableHead>{t("projects.profitability")}</TableHead>
                   </TableRow>
                 </TableHeader>
                 <TableBody>
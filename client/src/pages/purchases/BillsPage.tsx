@@ -98,14 +98,14 @@ export default function BillsPage() {
   }), [t]);
 
   
-  const statusConfig = {
+  const statusConfig = useMemo(() => ({
     draft: { label: t('common.draft'), icon: Edit, color: 'secondary' },
     pending: { label: t('common.pending'), icon: Clock, color: 'default' },
     partially_paid: { label: t('common.partiallyPaid'), icon: DollarSign, color: 'warning' },
     paid: { label: t('common.paid'), icon: CheckCircle, color: 'success' },
     overdue: { label: t('common.overdue'), icon: AlertCircle, color: 'destructive' },
     cancelled: { label: t('common.cancelled'), icon: Clock, color: 'secondary' },
-  };
+  }), [t, i18n.language]);
   
   const isMobile = useIsMobile();
   const [activeTab, setActiveTab] = useState('all');
@@ -228,7 +228,7 @@ export default function BillsPage() {
       }
       setPreviewOpen(true);
     } catch (err: any) {
-      toast({ title: t('common.error'), description: err?.message || t('ai.scanFailed', { defaultValue: 'Failed to extract fields.' }), variant: 'destructive' });
+      toast({ title: t('common.error'), description: err?.message || t('ai.scanFailed'), variant: 'destructive' });
     } finally {
       setScanLoading(false);
     }
@@ -257,7 +257,7 @@ export default function BillsPage() {
     if (applyFields.amount && total) form.setValue('amount', total);
     if (applyFields.notes_vendor && extracted?.vendor_name) {
       const prev = form.getValues('notes') || '';
-      form.setValue('notes', `${prev ? prev + '\n' : ''}${t('ai.vendorDetected', { defaultValue: 'Vendor' })}: ${extracted.vendor_name}`.trim());
+      form.setValue('notes', `${prev ? prev + '\n' : ''}${t('ai.vendorDetected')}: ${extracted.vendor_name}`.trim());
     }
     if (applyFields.notes_text && extracted?.notes) {
       const prev = form.getValues('notes') || '';
@@ -266,7 +266,7 @@ export default function BillsPage() {
     setPreviewOpen(false);
     setScanOpen(false);
     setExtracted(null);
-    toast({ title: t('common.success'), description: t('ai.fieldsApplied', { defaultValue: 'Extracted fields applied.' }) });
+    toast({ title: t('common.success'), description: t('ai.fieldsApplied') });
   };
 
   // Helpers to control apply toggles in bulk and defaults
@@ -377,10 +377,10 @@ export default function BillsPage() {
       }
       queryClient.invalidateQueries({ queryKey: ['/api/banking/reconciliation/allocations/recent'] });
       queryClient.invalidateQueries({ queryKey: ['/api/purchases/bills'] });
-      toast({ title: t('common.success'), description: t('banking.unmatchedSuccessfully', { defaultValue: 'Allocation removed' }) });
+      toast({ title: t('common.success'), description: t('banking.unmatchedSuccessfully') });
     },
     onError: (error: any) => {
-      toast({ title: t('common.error'), description: error.message || t('banking.unmatchFailed', { defaultValue: 'Failed to remove allocation' }), variant: 'destructive' });
+      toast({ title: t('common.error'), description: error.message || t('banking.unmatchFailed'), variant: 'destructive' });
     }
   });
 
@@ -735,7 +735,7 @@ export default function BillsPage() {
             <AIIngestDialog
               open={scanOpen}
               onOpenChange={setScanOpen}
-              title={t('ai.pasteInvoiceText', { defaultValue: 'Paste invoice text' })}
+              title={t('ai.pasteInvoiceText')}
               onExtract={handleScanExtract}
               allowPdf
               autoCloseOnExtract
@@ -771,19 +771,19 @@ export default function BillsPage() {
                           bill_date: t('purchases.bills.billDate'),
                           due_date: t('sales.invoices.dueDate'),
                           amount: t('common.amount'),
-                          notes_vendor: t('ai.vendor', { defaultValue: 'Vendor' }),
+                          notes_vendor: t('ai.vendor'),
                           notes_text: t('common.notes'),
                         }}
                         bestMatch={bestSupplierMatch ? {
-                          label: t('ai.vendorMatch',{defaultValue:'Suggested supplier'}),
+                          label: t('ai.vendorMatch'),
                           name: bestSupplierMatch.supplier.name,
-                          actionLabel: t('ai.useSupplier',{defaultValue:'Use supplier'}),
+                          actionLabel: t('ai.useSupplier'),
                           onUse: () => form.setValue('supplier_id', bestSupplierMatch.supplier.id)
                         } : null}
                       />
                       {extracted.meta && (
                         <div className="text-xs text-muted-foreground">
-                          {t('ai.meta',{defaultValue:'Source'})}: {extracted.meta.mode || ''}
+                          {t('ai.meta')}: {extracted.meta.mode || ''}
                           {extracted.meta.provider ? ` • ${extracted.meta.provider}` : ''}
                           {extracted.meta.model ? ` • ${extracted.meta.model}` : ''}
                           {extracted.meta.mime_type ? ` • ${extracted.meta.mime_type}` : ''}
@@ -793,15 +793,15 @@ export default function BillsPage() {
                       )}
                     </>
                   ) : (
-                    <p className="text-muted-foreground">{t('ai.noData', { defaultValue: 'No data to preview.' })}</p>
+                    <p className="text-muted-foreground">{t('ai.noData')}</p>
                   )}
                   <div className="flex items-center gap-3 justify-end">
                     <Button variant="outline" onClick={() => setPreviewOpen(false)}>{t('common.cancel')}</Button>
                     <Button type="button" variant="secondary" onClick={async () => { try { await navigator.clipboard.writeText(JSON.stringify(extracted, null, 2)); setCopied(true); setTimeout(()=>setCopied(false), 1500);} catch {} }}>
-                      {copied ? t('common.copied',{defaultValue:'Copied!'}) : t('ai.copyJson',{defaultValue:'Copy JSON'})}
+                      {copied ? t('common.copied') : t('ai.copyJson')}
                     </Button>
                     <Button type="button" variant="secondary" onClick={() => { try { const blob = new Blob([JSON.stringify(extracted, null, 2)], { type: 'application/json' }); const url = URL.createObjectURL(blob); const a = document.createElement('a'); a.href = url; a.download = 'extraction.json'; a.click(); URL.revokeObjectURL(url); } catch {} }}>
-                      {t('ai.downloadJson',{defaultValue:'Download JSON'})}
+                      {t('ai.downloadJson')}
                     </Button>
                     <Button onClick={applyExtracted}>{t('common.apply')}</Button>
                   </div>
@@ -1003,7 +1003,7 @@ export default function BillsPage() {
             {billAllocLoading ? (
               <p className="text-muted-foreground">{t('common.loading')}</p>
             ) : billAllocations.length === 0 ? (
-              <p className="text-muted-foreground">{t('banking.noAllocations', { defaultValue: 'No allocations yet.' })}</p>
+              <p className="text-muted-foreground">{t('banking.noAllocations')}</p>
             ) : (
               <div className="divide-y border rounded-md">
                 {billAllocations.map((a: any) => {
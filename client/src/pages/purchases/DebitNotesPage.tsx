@@ -1,4 +1,4 @@
-import { useState } from 'react';
+import { useState, useMemo } from 'react';
 import { useTranslation } from 'react-i18next';
 import { useQuery, useMutation } from '@tanstack/react-query';
 import { queryClient, apiRequest } from '@/lib/queryClient';
@@ -74,22 +74,22 @@ export default function DebitNotesPage() {
   const [selectedBillId, setSelectedBillId] = useState('');
   
   // Localized form schema
-  const debitNoteSchema = z.object({
+  const debitNoteSchema = useMemo(() => z.object({
     vendor_id: z.string().min(1, t('validation.selectVendor')),
     bill_id: z.string().min(1, t('validation.selectRelatedBill')),
     amount: z.string().min(1, t('validation.amountRequired')),
     reason: z.string().min(2, t('validation.reasonMin2')),
     notes: z.string().optional(),
     issue_date: z.string().min(1, t('validation.issueDateRequired')),
-  });
+  }), [t, i18n.language]);
   
-  const statusConfig = {
+  const statusConfig = useMemo(() => ({
     draft: { label: t('common.draft'), icon: Edit, color: 'secondary' },
     pending: { label: t('common.pending'), icon: Clock, color: 'default' },
     applied: { label: t('common.applied'), icon: CheckCircle, color: 'success' },
     partially_applied: { label: t('common.partiallyApplied'), icon: MinusCircle, color: 'warning' },
     void: { label: t('common.void'), icon: AlertCircle, color: 'destructive' },
-  };
+  }), [t, i18n.language]);
 
   // Fetch contacts (vendors)
   const { data: contacts = [] } = useQuery<any[]>({
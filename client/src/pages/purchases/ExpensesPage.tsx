@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useState, useMemo } from 'react';
 import { useQuery, useMutation } from '@tanstack/react-query';
 import { queryClient, apiRequest } from '@/lib/queryClient';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
@@ -132,7 +132,7 @@ export default function ExpensesPage() {
   };
   
   // Build schema with localized validation messages
-  const expenseSchema = z.object({
+  const expenseSchema = useMemo(() => z.object({
     description: z.string().min(2, t('validation.descriptionMin2')),
     category: z.string().optional(),
     expense_account_id: z.string().optional(),
@@ -144,14 +144,14 @@ export default function ExpensesPage() {
     reimbursable: z.boolean(),
     notes: z.string().optional(),
     project_id: z.string().optional(),
-  });
+  }), [t, i18n.language]);
   
-  const statusConfig = {
+  const statusConfig = useMemo(() => ({
     pending: { label: t('common.pending'), icon: Clock, color: 'default' },
     submitted: { label: t('common.submitted'), icon: CheckCircle, color: 'success' },
     approved: { label: t('common.approved'), icon: CheckCircle, color: 'success' },
     rejected: { label: t('common.rejected'), icon: XCircle, color: 'destructive' },
-  };
+  }), [t, i18n.language]);
   const { toast } = useToast();
   const { data: projects = [] } = useQuery<any[]>({
     queryKey: ["/api/projects"],
@@ -760,11 +760,11 @@ export default function ExpensesPage() {
                     name="expense_account_id"
                     render={({ field }) => (
                       <FormItem>
-                        <FormLabel>{t('purchases.expenses.expenseAccount', { defaultValue: 'حساب المصروفات' })}</FormLabel>
+                        <FormLabel>{t('purchases.expenses.expenseAccount')}</FormLabel>
                         <Select onValueChange={field.onChange} value={field.value}>
                           <FormControl>
                             <SelectTrigger>
-                              <SelectValue placeholder={t('purchases.expenses.selectExpenseAccount', { defaultValue: 'اختر حساب المصروفات' })} />
+                              <SelectValue placeholder={t('purchases.expenses.selectExpenseAccount')} />
                             </SelectTrigger>
                           </FormControl>
                           <SelectContent>
@@ -848,7 +848,7 @@ export default function ExpensesPage() {
                       <Select onValueChange={field.onChange} defaultValue={field.value}>
                         <FormControl>
                           <SelectTrigger>
-                            <SelectValue placeholder={t('placeholders.selectMethod', 'Select method')} />
+                            <SelectValue placeholder={t('placeholders.selectMethod')} />
                           </SelectTrigger>
                         </FormControl>
                         <SelectContent>
@@ -882,11 +882,11 @@ export default function ExpensesPage() {
                     name="paid_from_account_id"
                     render={({ field }) => (
                       <FormItem>
-                        <FormLabel>{t('purchases.expenses.paidFromAccount', { defaultValue: 'دُفع من حساب' })}</FormLabel>
+                        <FormLabel>{t('purchases.expenses.paidFromAccount')}</FormLabel>
                         <Select onValueChange={field.onChange} value={field.value}>
                           <FormControl>
                             <SelectTrigger>
-                              <SelectValue placeholder={t('purchases.expenses.selectPaidFromAccount', { defaultValue: 'اختر حساب الدفع' })} />
+                              <SelectValue placeholder={t('purchases.expenses.selectPaidFromAccount')} />
                             </SelectTrigger>
                           </FormControl>
                           <SelectContent>
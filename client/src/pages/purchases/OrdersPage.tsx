@@ -1,4 +1,4 @@
-import { useState } from 'react';
+import { useState, useMemo } from 'react';
 import { useQuery, useMutation } from '@tanstack/react-query';
 import { queryClient, apiRequest } from '@/lib/queryClient';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
@@ -71,7 +71,7 @@ export default function PurchaseOrdersPage() {
   const { t, i18n } = useTranslation();
   
   // Build schema with localized validation messages
-  const purchaseOrderSchema = z.object({
+  const purchaseOrderSchema = useMemo(() => z.object({
     supplier_id: z.string().min(1, t('validation.selectSupplier')),
     order_date: z.string().min(1, t('validation.orderDateRequired')),
     expected_date: z.string().min(1, t('validation.deliveryDateRequired')),
@@ -79,22 +79,22 @@ export default function PurchaseOrdersPage() {
     amount: z.string().min(1, t('validation.amountRequired')),
     notes: z.string().optional(),
     project_id: z.string().optional(),
-  });
+  }), [t, i18n.language]);
   
-  const statusConfig = {
+  const statusConfig = useMemo(() => ({
     draft: { label: t('common.draft'), icon: Edit, color: 'secondary' },
     pending: { label: t('common.pending'), icon: Clock, color: 'default' },
     ordered: { label: t('purchases.orders.ordered'), icon: ShoppingCart, color: 'default' },
     received: { label: t('common.received'), icon: CheckCircle, color: 'success' },
     cancelled: { label: t('common.cancelled'), icon: XCircle, color: 'secondary' },
-  };
+  }), [t, i18n.language]);
   
-  const approvalConfig = {
+  const approvalConfig = useMemo(() => ({
     draft: { label: t('common.draft'), color: 'secondary' },
     pending: { label: t('purchases.orders.pendingApproval'), color: 'default' },
     approved: { label: t('common.approved'), color: 'success' },
     rejected: { label: t('common.rejected'), color: 'destructive' },
-  } as const;
+  } as const), [t, i18n.language]);
   const { toast } = useToast();
   const isMobile = useIsMobile();
   const [showDialog, setShowDialog] = useState(false);
@@ -1,6 +1,6 @@
 import { useQuery } from '@tanstack/react-query';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
-import { useTranslation } from 'react-i18next';
+import { useTypedTranslation } from '@/hooks/useTypedTranslation';
 import {
   LineChart,
   Line,
@@ -33,14 +33,14 @@ type ForecastData = {
 };
 
 export default function CashFlowForecast() {
-  const { t } = useTranslation();
+  const { t } = useTypedTranslation();
 
   const { data, isLoading, error } = useQuery<ForecastData>({
     queryKey: ['/api/ai-cfo/forecast/cashflow'],
   });
 
-  if (isLoading) return <div className="p-8">{t("reports.loadingForecast", "Loading forecast...")}</div>;
-  if (error) return <div className="p-8 text-red-500">{t("reports.failedToLoadForecast", "Failed to load forecast")}</div>;
+  if (isLoading) return <div className="p-8">{t("reports.loadingForecast")}</div>;
+  if (error) return <div className="p-8 text-red-500">{t("reports.failedToLoadForecast")}</div>;
 
   const chartData = [
     ...(data?.history || []).map(d => ({ ...d, type: 'Historical' })),
@@ -53,13 +53,13 @@ export default function CashFlowForecast() {
   return (
     <PageContainer>
       <div className="mb-8">
-        <h1 className="text-3xl font-bold tracking-tight">{t('reports.cashFlowForecast', 'AI Cash Flow Forecast')}</h1>
+        <h1 className="text-3xl font-bold tracking-tight">{t('reports.cashFlowForecast')}</h1>
       </div>
       <div className="grid gap-6 md:grid-cols-2 lg:grid-cols-3 mb-8">
         <Card>
           <CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2">
             <CardTitle className="text-sm font-medium">
-              {t('reports.projectedCashIn', 'Projected Cash In (Next 6 Mo)')}
+              {t('reports.projectedCashIn')}
             </CardTitle>
             <TrendingUp className="h-4 w-4 text-green-500" />
           </CardHeader>
@@ -72,7 +72,7 @@ export default function CashFlowForecast() {
         <Card>
           <CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2">
             <CardTitle className="text-sm font-medium">
-              {t('reports.projectedCashOut', 'Projected Cash Out (Next 6 Mo)')}
+              {t('reports.projectedCashOut')}
             </CardTitle>
             <TrendingDown className="h-4 w-4 text-red-500" />
           </CardHeader>
@@ -85,7 +85,7 @@ export default function CashFlowForecast() {
         <Card>
           <CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2">
             <CardTitle className="text-sm font-medium">
-              {t('reports.netForecast', 'Net Forecast')}
+              {t('reports.netForecast')}
             </CardTitle>
             <BrainCircuit className="h-4 w-4 text-blue-500" />
           </CardHeader>
@@ -102,7 +102,7 @@ export default function CashFlowForecast() {
       <div className="grid gap-6 md:grid-cols-3">
         <Card className="md:col-span-2">
           <CardHeader>
-            <CardTitle>{t('reports.cashFlowTrend', 'Cash Flow Trend & Forecast')}</CardTitle>
+            <CardTitle>{t('reports.cashFlowTrend')}</CardTitle>
           </CardHeader>
           <CardContent>
             <div className="h-[400px]">
@@ -127,17 +127,17 @@ export default function CashFlowForecast() {
           <CardHeader>
             <CardTitle className="flex items-center gap-2">
               <BrainCircuit className="h-5 w-5 text-purple-500" />
-              {t('reports.aiInsights', 'AI Insights')}
+              {t('reports.aiInsights')}
             </CardTitle>
           </CardHeader>
           <CardContent className="space-y-4">
             {data?.insights.length === 0 ? (
-              <p className="text-muted-foreground text-sm">{t("reports.noSpecificInsights", "No specific insights at this time.")}</p>
+              <p className="text-muted-foreground text-sm">{t("reports.noSpecificInsights")}</p>
             ) : (
               data?.insights.map((insight, i) => (
                 <Alert key={i} variant={insight.includes("Warning") || insight.includes("Alert") ? "destructive" : "default"}>
                   <AlertTriangle className="h-4 w-4" />
-                  <AlertTitle>{t("reports.insight", "Insight")}</AlertTitle>
+                  <AlertTitle>{t("reports.insight")}</AlertTitle>
                   <AlertDescription>{insight}</AlertDescription>
                 </Alert>
               ))
@@ -273,13 +273,13 @@ export default function ContactStatementPage() {
       
       toast({
         title: t('common.success'),
-        description: t('reports.exportSuccess', { defaultValue: 'تم تصدير التقرير بنجاح' }),
+        description: t('reports.exportSuccess'),
       });
     } catch (error) {
       console.error('PDF export error:', error);
       toast({
         title: t('common.error'),
-        description: t('reports.exportError', { defaultValue: 'فشل في تصدير PDF' }),
+        description: t('reports.exportError'),
         variant: 'destructive',
       });
     } finally {
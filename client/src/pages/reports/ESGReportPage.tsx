@@ -1,6 +1,6 @@
 import { useQuery } from '@tanstack/react-query';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
-import { useTranslation } from 'react-i18next';
+import { useTypedTranslation } from '@/hooks/useTypedTranslation';
 import {
   BarChart,
   Bar,
@@ -35,25 +35,25 @@ type ESGData = {
 const COLORS = ['#0088FE', '#00C49F', '#FFBB28', '#FF8042', '#8884d8'];
 
 export default function ESGReportPage() {
-  const { t } = useTranslation();
+  const { t } = useTypedTranslation();
 
   const { data, isLoading, error } = useQuery<ESGData>({
     queryKey: ['/api/esg/summary'],
   });
 
-  if (isLoading) return <div className="p-8">{t("reports.loadingESGReport", "Loading ESG Report...")}</div>;
-  if (error) return <div className="p-8 text-red-500">{t("reports.failedToLoadESGReport", "Failed to load ESG Report")}</div>;
+  if (isLoading) return <div className="p-8">{t("reports.loadingESGReport")}</div>;
+  if (error) return <div className="p-8 text-red-500">{t("reports.failedToLoadESGReport")}</div>;
 
   return (
     <PageContainer>
       <div className="mb-8">
-        <h1 className="text-3xl font-bold tracking-tight">{t('reports.esgTitle', 'Sustainability & ESG Report')}</h1>
+        <h1 className="text-3xl font-bold tracking-tight">{t('reports.esgTitle')}</h1>
       </div>
       <div className="grid gap-6 md:grid-cols-2 lg:grid-cols-4 mb-8">
         <Card>
           <CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2">
             <CardTitle className="text-sm font-medium">
-              {t('reports.totalCarbon', 'Total Carbon Footprint')}
+              {t('reports.totalCarbon')}
             </CardTitle>
             <Leaf className="h-4 w-4 text-green-500" />
           </CardHeader>
@@ -62,7 +62,7 @@ export default function ESGReportPage() {
               {(data?.total_co2_kg || 0).toLocaleString()} kgCO2e
             </div>
             <p className="text-xs text-muted-foreground">
-              {t('reports.yearToDate', 'Year to Date')}
+              {t('reports.yearToDate')}
             </p>
           </CardContent>
         </Card>
@@ -71,7 +71,7 @@ export default function ESGReportPage() {
         <Card>
           <CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2">
             <CardTitle className="text-sm font-medium">
-              {t('reports.energyUsage', 'Energy Usage')}
+              {t('reports.energyUsage')}
             </CardTitle>
             <Zap className="h-4 w-4 text-yellow-500" />
           </CardHeader>
@@ -84,7 +84,7 @@ export default function ESGReportPage() {
       <div className="grid gap-6 md:grid-cols-2">
         <Card>
           <CardHeader>
-            <CardTitle>{t('reports.emissionsByCategory', 'Emissions by Category')}</CardTitle>
+            <CardTitle>{t('reports.emissionsByCategory')}</CardTitle>
           </CardHeader>
           <CardContent>
             <div className="h-[300px]">
@@ -114,7 +114,7 @@ export default function ESGReportPage() {
 
         <Card>
           <CardHeader>
-            <CardTitle>{t('reports.emissionsTrend', 'Monthly Emissions Trend')}</CardTitle>
+            <CardTitle>{t('reports.emissionsTrend')}</CardTitle>
           </CardHeader>
           <CardContent>
             <div className="h-[300px]">
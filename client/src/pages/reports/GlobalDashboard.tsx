@@ -62,7 +62,7 @@ export default function GlobalDashboard() {
       <div className="mb-8">
         <h1 className="text-3xl font-bold tracking-tight">{t("reports.globalDashboard", "Global Financial Dashboard")}</h1>
         <p className="text-muted-foreground mt-2">
-          {t("reports.globalDashboardDesc", "Consolidated view of all group companies")}
+          {t("reports.globalDashboardDesc")}
         </p>
       </div>
 
@@ -71,7 +71,7 @@ export default function GlobalDashboard() {
         <Card>
           <CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2">
             <CardTitle className="text-sm font-medium">
-              {t("reports.totalCash", "Total Cash Position")}
+              {t("reports.totalCash")}
             </CardTitle>
             <Wallet className="h-4 w-4 text-blue-500" />
           </CardHeader>
@@ -83,7 +83,7 @@ export default function GlobalDashboard() {
         <Card>
           <CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2">
             <CardTitle className="text-sm font-medium">
-              {t("reports.totalRevenue", "Total Revenue (YTD)")}
+              {t("reports.totalRevenue")}
             </CardTitle>
             <TrendingUp className="h-4 w-4 text-green-500" />
           </CardHeader>
@@ -95,7 +95,7 @@ export default function GlobalDashboard() {
         <Card>
           <CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2">
             <CardTitle className="text-sm font-medium">
-              {t("reports.totalExpenses", "Total Expenses (YTD)")}
+              {t("reports.totalExpenses")}
             </CardTitle>
             <TrendingDown className="h-4 w-4 text-red-500" />
           </CardHeader>
@@ -122,16 +122,16 @@ export default function GlobalDashboard() {
       {/* Company Breakdown Table */}
       <Card>
         <CardHeader>
-          <CardTitle>{t("reports.companyBreakdown", "Company Breakdown")}</CardTitle>
+          <CardTitle>{t("reports.companyBreakdown")}</CardTitle>
         </CardHeader>
         <CardContent>
           <Table className="min-w-[450px]">
             <TableHeader>
               <TableRow>
-                <TableHead>{t("common.company", "Company")}</TableHead>
-                <TableHead className="text-right">{t("reports.cash", "Cash")}</TableHead>
-                <TableHead className="text-right">{t("reports.revenue", "Revenue")}</TableHead>
-                <TableHead className="text-right">{t("reports.expenses", "Expenses")}</TableHead>
+                <TableHead>{t("common.company")}</TableHead>
+                <TableHead className="text-right">{t("reports.cash")}</TableHead>
+                <TableHead className="text-right">{t("reports.revenue")}</TableHead>
+                <TableHead className="text-right">{t("reports.expenses")}</TableHead>
                 <TableHead className="text-right">{t("reports.netIncome", "Net Income")}</TableHead>
               </TableRow>
             </TableHeader>
@@ -1,4 +1,4 @@
-import { useState } from 'react';
+import { useState, useMemo } from 'react';
 import { useTranslation } from "react-i18next";
 import { format } from "@/lib/utils";
 import { useQuery, useMutation } from '@tanstack/react-query';
@@ -72,7 +72,7 @@ const emptyInventoryData = {
 export default function InventoryPage() {
   const { t, i18n } = useTranslation();
   const companyCurrency = useCompanyCurrency();
-  const inventoryItemSchema = z.object({
+  const inventoryItemSchema = useMemo(() => z.object({
     sku: z.string().min(1, t('validation.skuRequired')),
     name: z.string().min(2, t('validation.nameMin')),
     category: z.string().min(1, t('validation.categoryRequired')),
@@ -82,7 +82,7 @@ export default function InventoryPage() {
     unitCost: z.string().min(1, t('validation.unitCostRequired')),
     unitPrice: z.string().min(1, t('validation.unitPriceRequired')),
     location: z.string().optional(),
-  });
+  }), [t, i18n.language]);
 
   const { toast } = useToast();
   const isMobile = useIsMobile();
@@ -202,15 +202,15 @@ export default function InventoryPage() {
     console.log(`Creating reorder for ${sku}`);
   };
 
-  const getStatusBadge = (status: string) => {
-    const statusConfig = {
-      in_stock: { label: t('inventory.inStock'), icon: CheckCircle, color: 'success' },
-      low_stock: { label: t('inventory.lowStock'), icon: AlertTriangle, color: 'warning' },
-      critical: { label: t('inventory.critical'), icon: AlertTriangle, color: 'destructive' },
-      out_of_stock: { label: t('inventory.outOfStock'), icon: AlertTriangle, color: 'destructive' },
-      service: { label: t('categories.services'), icon: Package, color: 'secondary' },
-    };
+  const statusConfig = useMemo(() => ({
+    in_stock: { label: t('inventory.inStock'), icon: CheckCircle, color: 'success' },
+    low_stock: { label: t('inventory.lowStock'), icon: AlertTriangle, color: 'warning' },
+    critical: { label: t('inventory.critical'), icon: AlertTriangle, color: 'destructive' },
+    out_of_stock: { label: t('inventory.outOfStock'), icon: AlertTriangle, color: 'destructive' },
+    service: { label: t('categories.services'), icon: Package, color: 'secondary' },
+  }), [t, i18n.language]);
 
+  const getStatusBadge = (status: string) => {
     const config = statusConfig[status as keyof typeof statusConfig];
     if (!config) return null;
     
@@ -461,7 +461,7 @@ export default function InventoryPage() {
             <div className="text-2xl font-bold">{formatCurrency(totalValue)}</div>
             <div className="flex items-center text-xs text-green-600 mt-1">
               <TrendingUp className="h-3 w-3 me-1" />
-              {t('inventory.fromLastMonth', '+8.5% from last month')}
+              {t('inventory.fromLastMonth')}
             </div>
           </CardContent>
         </Card>
@@ -141,15 +141,16 @@ export default function JournalBookPage() {
   };
 
   // Get source type label
+  const labels: Record<string, string> = useMemo(() => ({
+    invoice: t('common.invoice'),
+    bill: t('common.bill'),
+    payment: t('common.payment'),
+    receipt: t('common.receipt'),
+    expense: t('common.expense'),
+    manual: t('accounting.journal.manual'),
+  }), [t, i18n.language]);
+
   const getSourceTypeLabel = (sourceType?: string) => {
-    const labels: Record<string, string> = {
-      invoice: t('common.invoice'),
-      bill: t('common.bill'),
-      payment: t('common.payment'),
-      receipt: t('common.receipt'),
-      expense: t('common.expense'),
-      manual: t('accounting.journal.manual'),
-    };
     return labels[sourceType || 'manual'] || sourceType || t('accounting.journal.manual');
   };
 
@@ -206,7 +206,7 @@ export default function ProfitLossComparisonPage() {
   };
 
   // Comparison rows
-  const comparisonRows = [
+  const comparisonRows = useMemo(() => [
     { 
       label: t('reports.comparison.totalRevenue'), 
       period1: period1Totals.revenue, 
@@ -250,7 +250,7 @@ export default function ProfitLossComparisonPage() {
       isTotal: true,
       highlight: true
     },
-  ];
+  ], [t, i18n.language, period1Totals, period2Totals]);
 
   // Handle print
   const handlePrint = () => window.print();
@@ -1,4 +1,4 @@
-import { useState } from 'react';
+import { useState, useMemo } from 'react';
 import { useTranslation } from 'react-i18next';
 import { useQuery, useMutation } from '@tanstack/react-query';
 import { queryClient, apiRequest } from '@/lib/queryClient';
@@ -66,13 +66,13 @@ type CreditNoteForm = z.infer<ReturnType<typeof getCreditNoteSchema>>;
 export default function CreditNotesPage() {
   const { t, i18n } = useTranslation();
   
-  const statusConfig = {
+  const statusConfig = useMemo(() => ({
     draft: { label: t('common.draft'), icon: Edit, color: 'secondary' },
     pending: { label: t('common.pending'), icon: Clock, color: 'default' },
     applied: { label: t('common.applied'), icon: CheckCircle, color: 'success' },
     partially_applied: { label: t('common.partiallyApplied'), icon: MinusCircle, color: 'warning' },
     void: { label: t('common.void'), icon: AlertCircle, color: 'destructive' },
-  };
+  }), [t, i18n.language]);
   const { toast } = useToast();
   const [activeTab, setActiveTab] = useState('all');
   const [searchTerm, setSearchTerm] = useState('');
@@ -134,7 +134,7 @@ export default function InvoiceDetailPage() {
         filename: `invoice-${invoice?.invoice_number || id}.pdf`,
         download: true,
       });
-      toast({ title: t('common.success'), description: t('sales.invoices.pdfDownloaded', { defaultValue: 'PDF downloaded' }) });
+      toast({ title: t('common.success'), description: t('sales.invoices.pdfDownloaded') });
     } catch (error: any) {
       toast({ title: t('common.error'), description: error?.message || 'Failed to generate PDF', variant: 'destructive' });
     }
@@ -229,23 +229,23 @@ export default function InvoiceDetailPage() {
                 onClick={() => sendInvoice.mutate()}
                 disabled={sendInvoice.isPending}
               >
-                <Send className="h-4 w-4 me-2" /> {t('sales.invoices.send', { defaultValue: 'Send' })}
+                <Send className="h-4 w-4 me-2" /> {t('sales.invoices.send')}
               </Button>
             )}
             
             {/* Download PDF */}
             <Button variant="outline" size="sm" onClick={handleDownloadPDF}>
-              <Download className="h-4 w-4 me-2" /> {t('sales.invoices.downloadPDF', { defaultValue: 'PDF' })}
+              <Download className="h-4 w-4 me-2" /> {t('sales.invoices.downloadPDF')}
             </Button>
             
             {/* Print */}
             <Button variant="outline" size="sm" onClick={handlePrint}>
-              <Printer className="h-4 w-4 me-2" /> {t('common.print', { defaultValue: 'Print' })}
+              <Printer className="h-4 w-4 me-2" /> {t('common.print')}
             </Button>
             
             {/* Duplicate */}
             <Button variant="ghost" size="sm" onClick={handleDuplicate}>
-              <Copy className="h-4 w-4 me-2" /> {t('common.duplicate', { defaultValue: 'Duplicate' })}
+              <Copy className="h-4 w-4 me-2" /> {t('common.duplicate')}
             </Button>
           </div>
         </div>
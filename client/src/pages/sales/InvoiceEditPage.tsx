@@ -272,12 +272,12 @@ export default function InvoiceEditPage() {
 
   const validateForm = (): boolean => {
     const errors: string[] = [];
-    if (!customer) errors.push(t('forms.customerRequired', { defaultValue: 'Customer is required' }));
-    if (!invoiceDate) errors.push(t('forms.invoiceDateRequired', { defaultValue: 'Invoice date is required' }));
-    if (!dueDate) errors.push(t('forms.dueDateRequired', { defaultValue: 'Due date is required' }));
-    if (lineItems.length === 0) errors.push(t('forms.atLeastOneItem', { defaultValue: 'At least one item is required' }));
+    if (!customer) errors.push(t('forms.customerRequired'));
+    if (!invoiceDate) errors.push(t('forms.invoiceDateRequired'));
+    if (!dueDate) errors.push(t('forms.dueDateRequired'));
+    if (lineItems.length === 0) errors.push(t('forms.atLeastOneItem'));
     if (lineItems.some(item => !item.description.trim() || item.rate <= 0)) {
-      errors.push(t('forms.itemsIncomplete', { defaultValue: 'All items must have description and price' }));
+      errors.push(t('forms.itemsIncomplete'));
     }
     setValidationErrors(errors);
     return errors.length === 0;
@@ -292,11 +292,11 @@ export default function InvoiceEditPage() {
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ['/api/sales/invoices'] });
       queryClient.invalidateQueries({ queryKey: ['/api/sales/invoices', id] });
-      toast({ title: t('common.saved'), description: t('sales.invoices.updated', { defaultValue: 'Invoice updated' }) });
+      toast({ title: t('common.saved'), description: t('sales.invoices.updated') });
       navigate(`/sales/invoices/${id}`);
     },
     onError: (error: any) => {
-      toast({ title: t('common.error'), description: error?.message || t('sales.invoices.updateFailed', { defaultValue: 'Failed to update invoice' }), variant: 'destructive' });
+      toast({ title: t('common.error'), description: error?.message || t('sales.invoices.updateFailed'), variant: 'destructive' });
     },
   });
 
@@ -362,7 +362,7 @@ export default function InvoiceEditPage() {
         <Alert>
           <AlertCircle className="h-4 w-4" />
           <AlertDescription>
-            {t('sales.invoices.cannotEditNonDraft', { defaultValue: 'Only draft invoices can be edited. This invoice has already been sent.' })}
+            {t('sales.invoices.cannotEditNonDraft')}
           </AlertDescription>
         </Alert>
         <Button asChild variant="outline">
@@ -385,7 +385,7 @@ export default function InvoiceEditPage() {
             </Link>
           </Button>
           <div>
-            <h1 className="text-2xl font-bold">{t('sales.invoices.editInvoice', { defaultValue: 'Edit Invoice' })}</h1>
+            <h1 className="text-2xl font-bold">{t('sales.invoices.editInvoice')}</h1>
             <p className="text-sm text-muted-foreground">{invoiceNumber}</p>
           </div>
         </div>
@@ -407,7 +407,7 @@ export default function InvoiceEditPage() {
       {/* Invoice Details */}
       <Card>
         <CardHeader>
-          <CardTitle>{t('forms.invoiceDetails', { defaultValue: 'Invoice Details' })}</CardTitle>
+          <CardTitle>{t('forms.invoiceDetails')}</CardTitle>
         </CardHeader>
         <CardContent className="grid gap-4 sm:grid-cols-2 lg:grid-cols-4">
           <div className="space-y-2">
@@ -445,7 +445,7 @@ export default function InvoiceEditPage() {
             <DatePicker value={dueDate} onChange={setDueDate} />
           </div>
           <div className="space-y-2">
-            <Label>{t('forms.poNumber', { defaultValue: 'PO Number' })}</Label>
+            <Label>{t('forms.poNumber')}</Label>
             <Input value={poNumber} onChange={e => setPoNumber(e.target.value)} />
           </div>
           <div className="space-y-2">
@@ -493,7 +493,7 @@ export default function InvoiceEditPage() {
                       <div className="space-y-1">
                         <Select value={item.itemId || ''} onValueChange={(val) => handleItemSelect(item.id, val)}>
                           <SelectTrigger className="text-xs h-8">
-                            <SelectValue placeholder={t('forms.selectProduct', { defaultValue: 'Select product...' })} />
+                            <SelectValue placeholder={t('forms.selectProduct')} />
                           </SelectTrigger>
                           <SelectContent>
                             {items.map(i => <SelectItem key={i.id} value={i.id}>{i.name}</SelectItem>)}
@@ -543,7 +543,7 @@ export default function InvoiceEditPage() {
                           <SelectValue />
                         </SelectTrigger>
                         <SelectContent>
-                          <SelectItem value="0">{t('forms.noTax', { defaultValue: 'No Tax (0%)' })}</SelectItem>
+                          <SelectItem value="0">{t('forms.noTax')}</SelectItem>
                           {taxRates.map(tax => (
                             <SelectItem key={tax.id} value={tax.rate.toString()}>{tax.name}</SelectItem>
                           ))}
@@ -600,7 +600,7 @@ export default function InvoiceEditPage() {
           <Textarea
             value={notes}
             onChange={e => setNotes(e.target.value)}
-            placeholder={t('forms.notesPlaceholder', { defaultValue: 'Additional notes...' })}
+            placeholder={t('forms.notesPlaceholder')}
             rows={3}
           />
         </CardContent>
@@ -71,7 +71,7 @@ export default function InvoicesPage() {
     console.log('Scanned Invoice Data:', data);
     toast({
       title: t("ai.scanSuccess"),
-      description: t("ai.scanRedirect", "Data extracted. Redirecting to creation form..."),
+      description: t("ai.scanRedirect"),
     });
     // TODO: Redirect to /sales/invoices/new with state: { initialData: data }
     // For this demo, we will just alert the user that the feature is ready to be linked.
@@ -1,4 +1,4 @@
-import { useState } from 'react';
+import { useState, useMemo } from 'react';
 import { useTranslation } from 'react-i18next';
 import { useQuery, useMutation } from '@tanstack/react-query';
 import { queryClient, apiRequest } from '@/lib/queryClient';
@@ -66,7 +66,7 @@ type SalesOrderForm = z.infer<ReturnType<typeof salesOrderSchemaFactory>>;
 export default function OrdersPage() {
   const { t, i18n } = useTranslation();
   
-  const statusConfig = {
+  const statusConfig = useMemo(() => ({
     draft: { label: t('common.draft'), icon: Edit, color: 'secondary' },
     pending: { label: t('common.pending'), icon: Clock, color: 'secondary' },
     confirmed: { label: t('sales.orders.confirmed'), icon: CheckCircle, color: 'default' },
@@ -74,21 +74,21 @@ export default function OrdersPage() {
     shipped: { label: t('sales.orders.shipped'), icon: Truck, color: 'success' },
     delivered: { label: t('sales.orders.delivered'), icon: CheckCircle, color: 'success' },
     cancelled: { label: t('common.cancelled'), icon: XCircle, color: 'secondary' },
-  };
+  }), [t, i18n.language]);
   
-  const fulfillmentConfig = {
+  const fulfillmentConfig = useMemo(() => ({
     unfulfilled: { label: t('sales.orders.unfulfilled'), color: 'secondary' },
     partial: { label: t('common.partial'), color: 'warning' },
     fulfilled: { label: t('sales.orders.fulfilled'), color: 'success' },
     pending: { label: t('common.pending'), color: 'secondary' },
-  };
+  }), [t, i18n.language]);
   
-  const paymentStatusConfig = {
+  const paymentStatusConfig = useMemo(() => ({
     pending: { label: t('common.pending'), color: 'secondary' },
     partial: { label: t('common.partial'), color: 'warning' },
     paid: { label: t('common.paid'), color: 'success' },
     refunded: { label: t('common.refunded'), color: 'destructive' },
-  };
+  }), [t, i18n.language]);
   
   const { toast } = useToast();
   const [activeTab, setActiveTab] = useState('all');
@@ -434,11 +434,11 @@ export default function OrdersPage() {
                   name="project_id"
                   render={({ field }) => (
                     <FormItem>
-                      <FormLabel>{t('common.project', { defaultValue: 'Project' })}</FormLabel>
+                      <FormLabel>{t('common.project')}</FormLabel>
                       <Select onValueChange={field.onChange} defaultValue={field.value}>
                         <FormControl>
                           <SelectTrigger>
-                            <SelectValue placeholder={t('common.selectProject', { defaultValue: 'Select Project' })} />
+                            <SelectValue placeholder={t('common.selectProject')} />
                           </SelectTrigger>
                         </FormControl>
                         <SelectContent>
@@ -94,13 +94,13 @@ export default function QuotationsPage() {
   const { t, i18n } = useTranslation();
   const isRTL = i18n.language === 'ar';
   
-  const statusConfig = {
+  const statusConfig = useMemo(() => ({
     draft: { label: t('common.draft'), icon: Edit, color: 'secondary', bgColor: 'bg-gray-100 dark:bg-gray-800' },
     sent: { label: t('common.sent'), icon: Send, color: 'default', bgColor: 'bg-blue-100 dark:bg-blue-900' },
     accepted: { label: t('sales.quotations.accepted'), icon: CheckCircle, color: 'success', bgColor: 'bg-green-100 dark:bg-green-900' },
     rejected: { label: t('sales.quotations.rejected'), icon: XCircle, color: 'destructive', bgColor: 'bg-red-100 dark:bg-red-900' },
     expired: { label: t('sales.quotations.expired'), icon: Clock, color: 'secondary', bgColor: 'bg-orange-100 dark:bg-orange-900' },
-  };
+  }), [t, i18n.language]);
   const { toast } = useToast();
   const { user } = useAuth();
   const [activeTab, setActiveTab] = useState('all');
@@ -69,18 +69,18 @@ type RecurringInvoiceForm = z.infer<ReturnType<typeof recurringInvoiceSchemaFact
 
 export default function RecurringInvoicesPage() {
   const { t, i18n } = useTranslation();
-  const frequencyOptions = [
+  const frequencyOptions = useMemo(() => [
     { value: 'weekly', label: t('sales.recurringInvoices.weekly') },
     { value: 'monthly', label: t('sales.recurringInvoices.monthly') },
     { value: 'quarterly', label: t('sales.recurringInvoices.quarterly') },
     { value: 'yearly', label: t('sales.recurringInvoices.yearly') },
-  ];
+  ], [t, i18n.language]);
   
-  const statusConfig = {
+  const statusConfig = useMemo(() => ({
     active: { label: t('common.active'), icon: CheckCircle, color: 'default' },
     paused: { label: t('common.paused'), icon: Pause, color: 'secondary' },
     completed: { label: t('common.completed'), icon: CheckCircle, color: 'default' },
-  };
+  }), [t, i18n.language]);
   const { toast } = useToast();
   const isMobile = useIsMobile();
   const [activeTab, setActiveTab] = useState('all');
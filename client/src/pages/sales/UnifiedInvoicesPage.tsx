@@ -250,7 +250,7 @@ export default function UnifiedInvoicesPage() {
         download: true,
       });
 
-      toast({ title: t('common.success'), description: t('sales.invoices.pdfDownloaded', { defaultValue: 'PDF downloaded' }) });
+      toast({ title: t('common.success'), description: t('sales.invoices.pdfDownloaded') });
     } catch (error: any) {
       console.error('PDF generation error:', error);
       toast({ title: t('common.error'), description: error?.message || 'Failed to generate PDF', variant: 'destructive' });
@@ -316,10 +316,10 @@ export default function AISettingsPage() {
                 {/* Helper text for local providers */}
                 {(provider === 'ollama' || provider === 'lmstudio' || provider === 'local' || provider === 'custom') && (
                   <p className="text-xs text-muted-foreground mt-1">
-                    {provider === 'ollama' && t('settings.ai.ollamaHint', { defaultValue: 'Default: http://localhost:11434 - Make sure Ollama is running locally' })}
-                    {provider === 'lmstudio' && t('settings.ai.lmstudioHint', { defaultValue: 'Default: http://localhost:1234 - Make sure LM Studio is running with API server enabled' })}
-                    {provider === 'local' && t('settings.ai.localHint', { defaultValue: 'Enter the base URL of your local AI server (OpenAI-compatible API)' })}
-                    {provider === 'custom' && t('settings.ai.customHint', { defaultValue: 'Enter the base URL for any OpenAI-compatible API endpoint' })}
+                    {provider === 'ollama' && t('settings.ai.ollamaHint')}
+                    {provider === 'lmstudio' && t('settings.ai.lmstudioHint')}
+                    {provider === 'local' && t('settings.ai.localHint')}
+                    {provider === 'custom' && t('settings.ai.customHint')}
                   </p>
                 )}
               </div>
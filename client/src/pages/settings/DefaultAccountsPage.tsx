@@ -110,7 +110,7 @@ export default function DefaultAccountsPage() {
       queryClient.invalidateQueries({ queryKey: ['/api/settings/default-accounts'] });
       toast({
         title: t('common.settingsSaved'),
-        description: t('settings.defaultAccountsSaved', 'Default accounts have been saved successfully'),
+        description: t('settings.defaultAccountsSaved'),
       });
     },
     onError: (error: any) => {
@@ -149,9 +149,9 @@ export default function DefaultAccountsPage() {
     <div className="space-y-6 p-6">
       <div className="flex items-center justify-between">
         <div>
-          <h1 className="text-2xl font-bold">{t('settings.defaultAccounts', 'Default Accounts')}</h1>
+          <h1 className="text-2xl font-bold">{t('settings.defaultAccounts')}</h1>
           <p className="text-muted-foreground">
-            {t('settings.defaultAccountsDescription', 'Configure default accounts for automatic journal entries')}
+            {t('settings.defaultAccountsDescription')}
           </p>
         </div>
         <Button onClick={handleSave} disabled={saveMutation.isPending}>
@@ -170,22 +170,22 @@ export default function DefaultAccountsPage() {
           <CardHeader>
             <CardTitle className="flex items-center gap-2">
               <DollarSign className="h-5 w-5 text-green-600" />
-              {t('settings.salesRevenue', 'Sales & Revenue')}
+              {t('settings.salesRevenue')}
             </CardTitle>
             <CardDescription>
-              {t('settings.salesRevenueDesc', 'Accounts used for sales invoices and income')}
+              {t('settings.salesRevenueDesc')}
             </CardDescription>
           </CardHeader>
           <CardContent className="space-y-4">
             <div className="space-y-2">
-              <Label>{t('settings.defaultSalesAccount', 'Default Sales Account')}</Label>
+              <Label>{t('settings.defaultSalesAccount')}</Label>
               <Select value={salesAccount || '__none__'} onValueChange={(v) => setSalesAccount(v === '__none__' ? '' : v)}>
                 <SelectTrigger>
-                  <SelectValue placeholder={t('common.selectAccount', 'Select account')} />
+                  <SelectValue placeholder={t('common.selectAccount')} />
                 </SelectTrigger>
                 <SelectContent>
                   <SelectItem value="__none__">
-                    {t('common.none', 'None')}
+                    {t('common.none')}
                   </SelectItem>
                   {revenueAccounts.map(account => (
                     <SelectItem key={account.id} value={account.id}>
@@ -195,19 +195,19 @@ export default function DefaultAccountsPage() {
                 </SelectContent>
               </Select>
               <p className="text-xs text-muted-foreground">
-                {t('settings.salesAccountHint', 'Used for invoice line items without a specific account')}
+                {t('settings.salesAccountHint')}
               </p>
             </div>
 
             <div className="space-y-2">
-              <Label>{t('settings.defaultReceivableAccount', 'Default Accounts Receivable')}</Label>
+              <Label>{t('settings.defaultReceivableAccount')}</Label>
               <Select value={receivableAccount || '__none__'} onValueChange={(v) => setReceivableAccount(v === '__none__' ? '' : v)}>
                 <SelectTrigger>
-                  <SelectValue placeholder={t('common.selectAccount', 'Select account')} />
+                  <SelectValue placeholder={t('common.selectAccount')} />
                 </SelectTrigger>
                 <SelectContent>
                   <SelectItem value="__none__">
-                    {t('common.none', 'None')}
+                    {t('common.none')}
                   </SelectItem>
                   {receivableAccts.length > 0 ? receivableAccts.map(account => (
                     <SelectItem key={account.id} value={account.id}>
@@ -221,7 +221,7 @@ export default function DefaultAccountsPage() {
                 </SelectContent>
               </Select>
               <p className="text-xs text-muted-foreground">
-                {t('settings.receivableAccountHint', 'Used for customer invoice balances')}
+                {t('settings.receivableAccountHint')}
               </p>
             </div>
           </CardContent>
@@ -232,22 +232,22 @@ export default function DefaultAccountsPage() {
           <CardHeader>
             <CardTitle className="flex items-center gap-2">
               <ShoppingCart className="h-5 w-5 text-orange-600" />
-              {t('settings.purchasesExpenses', 'Purchases & Expenses')}
+              {t('settings.purchasesExpenses')}
             </CardTitle>
             <CardDescription>
-              {t('settings.purchasesExpensesDesc', 'Accounts used for bills and expenses')}
+              {t('settings.purchasesExpensesDesc')}
             </CardDescription>
           </CardHeader>
           <CardContent className="space-y-4">
             <div className="space-y-2">
-              <Label>{t('settings.defaultPurchaseAccount', 'Default Purchase Account (COGS)')}</Label>
+              <Label>{t('settings.defaultPurchaseAccount')}</Label>
               <Select value={purchaseAccount || '__none__'} onValueChange={(v) => setPurchaseAccount(v === '__none__' ? '' : v)}>
                 <SelectTrigger>
-                  <SelectValue placeholder={t('common.selectAccount', 'Select account')} />
+                  <SelectValue placeholder={t('common.selectAccount')} />
                 </SelectTrigger>
                 <SelectContent>
                   <SelectItem value="__none__">
-                    {t('common.none', 'None')}
+                    {t('common.none')}
                   </SelectItem>
                   {cogsAccounts.length > 0 ? cogsAccounts.map(account => (
                     <SelectItem key={account.id} value={account.id}>
@@ -261,19 +261,19 @@ export default function DefaultAccountsPage() {
                 </SelectContent>
               </Select>
               <p className="text-xs text-muted-foreground">
-                {t('settings.purchaseAccountHint', 'Used for bill line items without a specific account')}
+                {t('settings.purchaseAccountHint')}
               </p>
             </div>
 
             <div className="space-y-2">
-              <Label>{t('settings.defaultPayableAccount', 'Default Accounts Payable')}</Label>
+              <Label>{t('settings.defaultPayableAccount')}</Label>
               <Select value={payableAccount || '__none__'} onValueChange={(v) => setPayableAccount(v === '__none__' ? '' : v)}>
                 <SelectTrigger>
-                  <SelectValue placeholder={t('common.selectAccount', 'Select account')} />
+                  <SelectValue placeholder={t('common.selectAccount')} />
                 </SelectTrigger>
                 <SelectContent>
                   <SelectItem value="__none__">
-                    {t('common.none', 'None')}
+                    {t('common.none')}
                   </SelectItem>
                   {payableAccts.length > 0 ? payableAccts.map(account => (
                     <SelectItem key={account.id} value={account.id}>
@@ -287,19 +287,19 @@ export default function DefaultAccountsPage() {
                 </SelectContent>
               </Select>
               <p className="text-xs text-muted-foreground">
-                {t('settings.payableAccountHint', 'Used for supplier bill balances')}
+                {t('settings.payableAccountHint')}
               </p>
             </div>
 
             <div className="space-y-2">
-              <Label>{t('settings.defaultExpenseAccount', 'Default Expense Account')}</Label>
+              <Label>{t('settings.defaultExpenseAccount')}</Label>
               <Select value={expenseAccount || '__none__'} onValueChange={(v) => setExpenseAccount(v === '__none__' ? '' : v)}>
                 <SelectTrigger>
-                  <SelectValue placeholder={t('common.selectAccount', 'Select account')} />
+                  <SelectValue placeholder={t('common.selectAccount')} />
                 </SelectTrigger>
                 <SelectContent>
                   <SelectItem value="__none__">
-                    {t('common.none', 'None')}
+                    {t('common.none')}
                   </SelectItem>
                   {expenseAccounts.map(account => (
                     <SelectItem key={account.id} value={account.id}>
@@ -309,7 +309,7 @@ export default function DefaultAccountsPage() {
                 </SelectContent>
               </Select>
               <p className="text-xs text-muted-foreground">
-                {t('settings.expenseAccountHint', 'Used for general expenses without a specific account')}
+                {t('settings.expenseAccountHint')}
               </p>
             </div>
           </CardContent>
@@ -320,22 +320,22 @@ export default function DefaultAccountsPage() {
           <CardHeader>
             <CardTitle className="flex items-center gap-2">
               <Package className="h-5 w-5 text-blue-600" />
-              {t('settings.inventory', 'Inventory')}
+              {t('settings.inventory')}
             </CardTitle>
             <CardDescription>
-              {t('settings.inventoryDesc', 'Accounts used for inventory tracking')}
+              {t('settings.inventoryDesc')}
             </CardDescription>
           </CardHeader>
           <CardContent className="space-y-4">
             <div className="space-y-2">
-              <Label>{t('settings.defaultInventoryAccount', 'Default Inventory Account')}</Label>
+              <Label>{t('settings.defaultInventoryAccount')}</Label>
               <Select value={inventoryAccount || '__none__'} onValueChange={(v) => setInventoryAccount(v === '__none__' ? '' : v)}>
                 <SelectTrigger>
-                  <SelectValue placeholder={t('common.selectAccount', 'Select account')} />
+                  <SelectValue placeholder={t('common.selectAccount')} />
                 </SelectTrigger>
                 <SelectContent>
                   <SelectItem value="__none__">
-                    {t('common.none', 'None')}
+                    {t('common.none')}
                   </SelectItem>
                   {inventoryAccounts.length > 0 ? inventoryAccounts.map(account => (
                     <SelectItem key={account.id} value={account.id}>
@@ -349,7 +349,7 @@ export default function DefaultAccountsPage() {
                 </SelectContent>
               </Select>
               <p className="text-xs text-muted-foreground">
-                {t('settings.inventoryAccountHint', 'Used for inventory items without a specific account')}
+                {t('settings.inventoryAccountHint')}
               </p>
             </div>
           </CardContent>
@@ -360,22 +360,22 @@ export default function DefaultAccountsPage() {
           <CardHeader>
             <CardTitle className="flex items-center gap-2">
               <Landmark className="h-5 w-5 text-purple-600" />
-              {t('settings.banking', 'Banking')}
+              {t('settings.banking')}
             </CardTitle>
             <CardDescription>
-              {t('settings.bankingDesc', 'Default accounts for payments and receipts')}
+              {t('settings.bankingDesc')}
             </CardDescription>
           </CardHeader>
           <CardContent className="space-y-4">
             <div className="space-y-2">
-              <Label>{t('settings.defaultBankAccount', 'Default Bank Account')}</Label>
+              <Label>{t('settings.defaultBankAccount')}</Label>
               <Select value={bankAccount || '__none__'} onValueChange={(v) => setBankAccount(v === '__none__' ? '' : v)}>
                 <SelectTrigger>
-                  <SelectValue placeholder={t('common.selectAccount', 'Select account')} />
+                  <SelectValue placeholder={t('common.selectAccount')} />
                 </SelectTrigger>
                 <SelectContent>
                   <SelectItem value="__none__">
-                    {t('common.none', 'None')}
+                    {t('common.none')}
                   </SelectItem>
                   {bankAccounts.map(account => (
                     <SelectItem key={account.id} value={account.id}>
@@ -385,19 +385,19 @@ export default function DefaultAccountsPage() {
                 </SelectContent>
               </Select>
               <p className="text-xs text-muted-foreground">
-                {t('settings.bankAccountHint', 'Used for bank transfers and payments')}
+                {t('settings.bankAccountHint')}
               </p>
             </div>
 
             <div className="space-y-2">
-              <Label>{t('settings.defaultCashAccount', 'Default Cash Account')}</Label>
+              <Label>{t('settings.defaultCashAccount')}</Label>
               <Select value={cashAccount || '__none__'} onValueChange={(v) => setCashAccount(v === '__none__' ? '' : v)}>
                 <SelectTrigger>
-                  <SelectValue placeholder={t('common.selectAccount', 'Select account')} />
+                  <SelectValue placeholder={t('common.selectAccount')} />
                 </SelectTrigger>
                 <SelectContent>
                   <SelectItem value="__none__">
-                    {t('common.none', 'None')}
+                    {t('common.none')}
                   </SelectItem>
                   {cashAccounts.map(account => (
                     <SelectItem key={account.id} value={account.id}>
@@ -407,7 +407,7 @@ export default function DefaultAccountsPage() {
                 </SelectContent>
               </Select>
               <p className="text-xs text-muted-foreground">
-                {t('settings.cashAccountHint', 'Used for cash payments and receipts')}
+                {t('settings.cashAccountHint')}
               </p>
             </div>
           </CardContent>
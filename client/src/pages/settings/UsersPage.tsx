@@ -61,12 +61,12 @@ export default function UsersPage() {
   const { t, i18n } = useTranslation();
   const { canManageUsers, canDeleteUsers, userRole } = usePermissions();
   
-  const statusConfig = {
+  const statusConfig = useMemo(() => ({
     active: { label: t('common.active'), icon: CheckCircle, color: 'default' },
     inactive: { label: t('common.inactive'), icon: XCircle, color: 'secondary' },
     invited: { label: t('users.invited'), icon: Mail, color: 'default' },
     pending: { label: t('common.pending'), icon: AlertCircle, color: 'secondary' },
-  };
+  }), [t, i18n.language]);
   const { toast } = useToast();
   const queryClient = useQueryClient();
   const [activeTab, setActiveTab] = useState('users');
@@ -611,11 +611,11 @@ export default function UsersPage() {
                   <SelectValue placeholder={t('users.selectRole')} />
                 </SelectTrigger>
                 <SelectContent>
-                  <SelectItem value="owner">{t('roles.owner', 'Owner')}</SelectItem>
-                  <SelectItem value="admin">{t('roles.admin', 'Admin')}</SelectItem>
-                  <SelectItem value="accountant">{t('roles.accountant', 'Accountant')}</SelectItem>
-                  <SelectItem value="sales">{t('roles.sales', 'Sales')}</SelectItem>
-                  <SelectItem value="viewer">{t('roles.viewer', 'Viewer')}</SelectItem>
+                  <SelectItem value="owner">{t('roles.owner')}</SelectItem>
+                  <SelectItem value="admin">{t('roles.admin')}</SelectItem>
+                  <SelectItem value="accountant">{t('roles.accountant')}</SelectItem>
+                  <SelectItem value="sales">{t('roles.sales')}</SelectItem>
+                  <SelectItem value="viewer">{t('roles.viewer')}</SelectItem>
                 </SelectContent>
               </Select>
             </div>
@@ -700,11 +700,11 @@ export default function UsersPage() {
                   <SelectValue placeholder={t('users.selectRole')} />
                 </SelectTrigger>
                 <SelectContent>
-                  <SelectItem value="owner">{t('roles.owner', 'Owner')}</SelectItem>
-                  <SelectItem value="admin">{t('roles.admin', 'Admin')}</SelectItem>
-                  <SelectItem value="accountant">{t('roles.accountant', 'Accountant')}</SelectItem>
-                  <SelectItem value="sales">{t('roles.sales', 'Sales')}</SelectItem>
-                  <SelectItem value="viewer">{t('roles.viewer', 'Viewer')}</SelectItem>
+                  <SelectItem value="owner">{t('roles.owner')}</SelectItem>
+                  <SelectItem value="admin">{t('roles.admin')}</SelectItem>
+                  <SelectItem value="accountant">{t('roles.accountant')}</SelectItem>
+                  <SelectItem value="sales">{t('roles.sales')}</SelectItem>
+                  <SelectItem value="viewer">{t('roles.viewer')}</SelectItem>
                 </SelectContent>
               </Select>
             </div>
@@ -0,0 +1,8 @@
+"""Python tooling for the client translation files.
+
+Shared modules that load, validate and rewrite ``client/src/locales``, run
+through one entry point: ``python -m i18n <command>`` (see :mod:`i18n.cli`).
+Key additions, renames and removals are written as declarative patches in
+``i18n/patches/`` and applied once each by ``i18n patch`` (see
+:mod:`i18n.patch`).
+"""
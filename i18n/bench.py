@@ -0,0 +1,311 @@
+"""Benchmarks for the locale toolchain on synthetic corpora.
+
+Generates locale trees and TSX sources of a given size (key count, nesting
+depth, duplicate-value rate, value length, language count, file count) into
+a temporary directory and times each toolchain operation on them:
+
+    parse    json.loads of every locale file
+    dump     serializing every tree the way write_locale does
+    merge    deep_merge of every tree into an empty one
+    flatten  flatten() of every tree
+    model    building the compact model (i18n.model) from every file
+    diff     the coverage status matrix over all languages
+    export   XLIFF and PO export for every non-source language
+    scan     lexing every TSX file and collecting t() calls
+    rewrite  planning and applying the fallback-stripping codemod
+
+Each operation runs ``--repeat`` times and the minimum and median are kept.
+The memory held by all locales as dict trees and as the compact model is
+recorded with the corpus sizes.
+Results are written as JSON (by default ``i18n-reports/bench/<commit>.json``)
+so two commits can be compared with ``--compare OLD.json``.
+
+Usage: python -m i18n.bench [--scale small,medium,large] [--keys N ...] [--compare FILE]
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from . import profiling
+from .paths import LANGUAGES, REFERENCE_LANG, ROOT, SOURCE_LANG, locale_path
+from .store import deep_merge, dump_locale, flatten
+
+DEFAULT_OUT = ROOT / "i18n-reports" / "bench"
+OPERATIONS = ["parse", "dump", "merge", "flatten", "model", "diff", "export", "scan", "rewrite"]
+
+# Roughly today's tree, the size expected for the next releases, and a stress size.
+SCALES = {
+    "small": dict(keys=4500, depth=4, duplicates=0.15, value_length=4, languages=17, files=240),
+    "medium": dict(keys=10000, depth=5, duplicates=0.15, value_length=5, languages=24, files=400),
+    "large": dict(keys=20000, depth=6, duplicates=0.15, value_length=6, languages=30, files=600),
+}
+REGRESSION = 1.2
+
+_SYLLABLES = ["ka", "lo", "mi", "ren", "sta", "tor", "vel", "nu", "pra", "dex", "ion", "ul"]
+
+
+def _word(rng):
+    return "".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(1, 3)))
+
+
+def _text(rng, length):
+    words = [_word(rng) for _ in range(max(1, int(rng.gauss(length, length / 3))))]
+    if rng.random() < 0.05:
+        words.insert(rng.randrange(len(words)), "{{count}}")
+    return " ".join(words).capitalize()
+
+
+def generate_source(keys, depth, duplicates, value_length, seed=0):
+    """Return an English tree with ``keys`` leaves.
+
+    Namespaces and intermediate groups are drawn from small pools so that
+    siblings share prefixes the way real feature namespaces do; ``duplicates``
+    is the share of values that repeat an earlier one ("Save", "Cancel"...).
+    """
+    rng = random.Random(seed)
+    namespaces = [f"{_word(rng)}{n}" for n in range(max(4, int(keys ** 0.5 / 2)))]
+    groups = [f"group{n}" for n in range(8)]
+    values = []
+    tree = {}
+    for n in range(keys):
+        node = tree.setdefault(rng.choice(namespaces), {})
+        for _ in range(rng.randint(0, max(0, depth - 2))):
+            node = node.setdefault(rng.choice(groups), {})
+        if values and rng.random() < duplicates:
+            value = rng.choice(values)
+        elif rng.random() < 0.002:
+            value = [_text(rng, value_length * 3) for _ in range(rng.randint(2, 5))]
+        else:
+            value = _text(rng, value_length)
+            values.append(value)
+        node[f"key{n}"] = value
+    return tree
+
+
+def translate(tree, lang, coverage, seed=0):
+    """Return a copy of ``tree`` with ``coverage`` of its leaves "translated"."""
+    rng = random.Random(f"{seed}:{lang}")
+
+    def walk(node):
+        out = {}
+        for key, value in node.items():
+            if isinstance(value, dict):
+                child = walk(value)
+                if child:
+                    out[key] = child
+            elif rng.random() < coverage:
+                if isinstance(value, list):
+                    out[key] = [f"{lang}: {item}" for item in value]
+                else:
+                    out[key] = f"{lang}: {value}" if rng.random() > 0.03 else value
+        return out
+
+    return walk(tree)
+
+
+def generate_tsx(index, keys, calls, rng):
+    """Return one page-sized component using ``calls`` keys from ``keys``."""
+    lines = [
+        "import { useState } from 'react';",
+        "import { useTranslation } from 'react-i18next';",
+        "",
+        f"export default function Page{index}() {{",
+        "  const { t } = useTranslation();",
+        "  const [open, setOpen] = useState(false);",
+        "  return (",
+        '    <div className="page">',
+    ]
+    for _ in range(calls):
+        key = rng.choice(keys)
+        roll = rng.random()
+        if roll < 0.3:
+            lines.append(f"      <span>{{t('{key}', '{_text(rng, 3)}')}}</span>")
+        elif roll < 0.4:
+            lines.append(f"      <p title={{`${{t('{key}')}} ${{open}}`}}>Static text</p>")
+        else:
+            lines.append(f"      <Button onClick={{() => setOpen(!open)}}>{{t('{key}')}}</Button>")
+    lines += ["    </div>", "  );", "}", ""]
+    return "\n".join(lines)
+
+
+def write_corpus(out_dir, keys, depth, duplicates, value_length, languages, files, seed=0):
+    """Write ``<out>/locales/<lang>/translation.json`` and ``<out>/src/*.tsx``."""
+    out_dir = Path(out_dir)
+    source = generate_source(keys, depth, duplicates, value_length, seed)
+    langs = (LANGUAGES + [f"x{n:02d}" for n in range(languages)])[:languages]
+    locales_dir = out_dir / "locales"
+    for lang in langs:
+        tree = source if lang == SOURCE_LANG else translate(
+            source, lang, 1.0 if lang == REFERENCE_LANG else 0.6, seed)
+        path = locale_path(lang, locales_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(dump_locale(tree), encoding="utf-8")
+
+    rng = random.Random(seed)
+    dotted_keys = [k for k, v in flatten(source).items() if isinstance(v, str)]
+    src_dir = out_dir / "src"
+    src_dir.mkdir(parents=True, exist_ok=True)
+    for n in range(files):
+        (src_dir / f"Page{n}.tsx").write_text(
+            generate_tsx(n, dotted_keys, rng.randint(10, 60), rng), encoding="utf-8")
+    return langs, locales_dir, src_dir
+
+
+def _time(fn, repeat):
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - started)
+    return {"min": min(runs), "median": statistics.median(runs), "runs": runs}
+
+
+def run_scale(params, repeat=3, ops=OPERATIONS, seed=0):
+    """Generate one corpus and return ``{op: timing}``."""
+    # Imported here so the generator alone does not pull in NumPy and the lexer.
+    from . import codemod, coverage, po, xliff
+    from .lexer import lex, t_calls
+    from .model import KeyTable, Locale, measure
+
+    with tempfile.TemporaryDirectory(prefix="i18n-bench-") as tmp:
+        tmp = Path(tmp)
+        langs, locales_dir, src_dir = write_corpus(tmp, seed=seed, **params)
+        raw = {lang: locale_path(lang, locales_dir).read_bytes() for lang in langs}
+        trees = {lang: json.loads(data) for lang, data in raw.items()}
+        sources = [p.read_text(encoding="utf-8") for p in sorted(src_dir.glob("*.tsx"))]
+        targets = [lang for lang in langs if lang != SOURCE_LANG]
+
+        def scan():
+            for src in sources:
+                t_calls(lex(src))
+
+        def rewrite():
+            for src in sources:
+                edits, _ = codemod.plan_source(src, lex(src))
+                codemod.apply_edits(src, edits)
+
+        def model():
+            table = KeyTable()
+            return [Locale.from_tree(table, lang, json.loads(data)) for lang, data in raw.items()]
+
+        def export():
+            xliff.export(targets, tmp / "xliff", locales_dir)
+            po.export(targets, tmp / "po", locales_dir)
+
+        actions = {
+            "parse": lambda: [json.loads(data) for data in raw.values()],
+            "dump": lambda: [dump_locale(tree) for tree in trees.values()],
+            "merge": lambda: [deep_merge(tree, {}) for tree in trees.values()],
+            "flatten": lambda: [flatten(tree) for tree in trees.values()],
+            "model": model,
+            "diff": lambda: coverage.build_matrix(trees, langs),
+            "export": export,
+            "scan": scan,
+            "rewrite": rewrite,
+        }
+        results = {}
+        for op in ops:
+            results[op] = _time(actions[op], repeat)
+        results["_corpus"] = {
+            "locale_bytes": sum(len(data) for data in raw.values()),
+            "source_bytes": sum(len(src.encode("utf-8")) for src in sources),
+            "tree_memory": measure(lambda: [json.loads(data) for data in raw.values()])[1],
+            "model_memory": measure(model)[1],
+        }
+        return results
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+            text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(old, new):
+    """Return rows ``(scale, op, old_s, new_s, ratio)`` for shared entries."""
+    before = {(r["scale"], op): t["min"] for r in old["results"]
+              for op, t in r["ops"].items() if not op.startswith("_")}
+    rows = []
+    for result in new["results"]:
+        for op, timing in result["ops"].items():
+            key = (result["scale"], op)
+            if key in before and before[key] > 0:
+                rows.append((*key, before[key], timing["min"], timing["min"] / before[key]))
+    return rows
+
+
+@profiling.command("bench")
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", default="small,medium,large",
+                        help=f"comma-separated presets: {', '.join(SCALES)}")
+    for name in ("keys", "depth", "languages", "files", "value_length"):
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int,
+                            help="override for a single custom scale")
+    parser.add_argument("--duplicates", type=float, help="share of repeated values (0-1)")
+    parser.add_argument("--ops", default=",".join(OPERATIONS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="result file (default: i18n-reports/bench/<commit>.json)")
+    parser.add_argument("--compare", help="earlier result file to compare against")
+    args = parser.parse_args(argv)
+
+    overrides = {name: getattr(args, name) for name in SCALES["small"]
+                 if getattr(args, name) is not None}
+    if overrides:
+        scales = {"custom": {**SCALES["small"], **overrides}}
+    else:
+        scales = {name: SCALES[name] for name in args.scale.split(",")}
+    ops = [op for op in args.ops.split(",") if op]
+    unknown = set(ops) - set(OPERATIONS)
+    if unknown:
+        parser.error(f"unknown operations: {', '.join(sorted(unknown))}")
+
+    commit = _commit()
+    report = {
+        "commit": commit,
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": args.repeat,
+        "results": [],
+    }
+    for name, params in scales.items():
+        print(f"{name}: {params['keys']} keys x {params['languages']} languages, "
+              f"{params['files']} files")
+        timings = run_scale(params, args.repeat, ops, args.seed)
+        for op in ops:
+            print(f"  {op:<8} {timings[op]['min'] * 1000:9.1f} ms")
+        report["results"].append({"scale": name, "params": params, "ops": timings})
+
+    out = Path(args.out) if args.out else DEFAULT_OUT / f"{commit}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"Wrote {out}")
+
+    if args.compare:
+        old = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        slower = 0
+        for scale, op, before, after, ratio in compare(old, report):
+            flag = "  SLOWER" if ratio > REGRESSION else ""
+            slower += bool(flag)
+            print(f"  {scale:<7} {op:<8} {before * 1000:9.1f} -> {after * 1000:9.1f} ms "
+                  f"({ratio:.2f}x){flag}")
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Build compact per-locale bundles for shipping.
+
+Writes ``<out>/<lang>.json`` for every language: the same tree as the source
+file, serialized without indentation. Parsing a minified bundle is what the
+app pays for at startup, so this is the format to measure and ship.
+
+With ``--resolve`` each bundle is the language's complete table instead,
+English (or a regional chain given with ``--chain ur:ar``) filled in for the
+keys it lacks (see :mod:`i18n.fallback`), and ``<out>/<lang>.coverage.json``
+lists the keys that came from each fallback. Such bundles need no fallback
+language at runtime.
+
+Usage: python -m i18n.bundle [--out dist/locales] [--resolve [--chain LANG:FALLBACK]] [lang ...]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from . import fallback, profiling
+from .paths import LANGUAGES, ROOT
+from .session import Session
+
+DEFAULT_OUT = ROOT / "dist" / "locales"
+
+
+def write_bundle(tree, path):
+    data = json.dumps(tree, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    with profiling.phase("bundle", path):
+        path.write_bytes(data)
+    return len(data)
+
+
+def add_arguments(parser):
+    parser.add_argument("langs", nargs="*", help="languages (default: all)")
+    parser.add_argument("--out", default=DEFAULT_OUT, help="output directory")
+    parser.add_argument("--resolve", action="store_true",
+                        help="fill each bundle from its fallback chain; write coverage files")
+    parser.add_argument("--chain", action="append", metavar="LANG:FALLBACK",
+                        help="regional fallback before English, e.g. ur:ar (repeatable)")
+
+
+def run(args, session):
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    sizes = {}
+    filled = {}
+    if args.resolve:
+        try:
+            chains = fallback.parse_chains(args.chain)
+        except ValueError as e:
+            raise SystemExit(f"bundle: {e}")
+    for lang in args.langs or LANGUAGES:
+        if not args.resolve:
+            sizes[lang] = write_bundle(session.tree(lang), out / f"{lang}.json")
+            continue
+        chain = fallback.chain_of(lang, chains)
+        with profiling.phase("resolve", lang):
+            tree, coverage = fallback.resolve(lang, session.locales(chain), chains)
+        sizes[lang] = write_bundle(tree, out / f"{lang}.json")
+        write_bundle(coverage, out / f"{lang}.coverage.json")
+        filled[lang] = coverage
+    print(f"Wrote {len(sizes)} bundles ({sum(sizes.values()) / 1024:.0f} KB) to {out}")
+    for lang, coverage in filled.items():
+        taken = ", ".join(f"{len(keys)} from {source}"
+                          for source, keys in coverage["fallback"].items() if keys)
+        print(f"  {lang}: {coverage['keys']} keys" + (f" ({taken})" if taken else ""))
+    return sizes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, "bundle"):
+        run(args, Session())
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,286 @@
+"""CI checks over usage, placeholders and coverage, optionally only for a diff.
+
+Checks, for the files and keys in scope:
+
+* usage - ``t()`` keys used by TSX sources that are missing from English
+  (error), hard-coded text in those sources and English keys nothing uses
+  (warnings);
+* placeholders - ``{{name}}`` placeholders in a translation that English
+  does not have (error), or English ones a translation drops (warning);
+* coverage - in-scope English keys missing from other locales (warning).
+
+Without ``--since`` everything is in scope. With ``--since REF`` the scope
+is what changed against ``REF`` (committed, staged, unstaged and untracked):
+changed TSX files; for each changed locale, the keys whose byte spans the
+diff hunks touch, on both the old and the new side (see :mod:`i18n.jsontok`);
+and their dependents - a changed English key brings in its translations in
+every locale and the TSX files that reference it, so removing a key still
+flags the pages that use it. A typical PR check then reads a handful of
+files instead of the whole corpus.
+
+Exits 1 when there are errors.
+
+Usage: python -m i18n.check [--since REF] [--warnings]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from . import jsontok, profiling, scan, tokencache
+from .exchange import placeholders
+from .paths import CLIENT_SRC, LANGUAGES, LOCALES_DIR, ROOT, SOURCE_LANG, locale_exists
+from .model import Locale, leaves
+from .session import Session
+from .store import dotted, get_path
+
+_HUNK = re.compile(rb"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@", re.M)
+
+
+def _git(*args):
+    return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, check=True).stdout
+
+
+def changed_files(ref):
+    """Repository-relative paths changed since ``ref``, including untracked files."""
+    names = _git("diff", "--name-only", ref, "--").decode().splitlines()
+    names += _git("ls-files", "--others", "--exclude-standard", "--",
+                  str(CLIENT_SRC.relative_to(ROOT))).decode().splitlines()
+    return list(dict.fromkeys(names))
+
+
+def _hunks(ref, rel):
+    """Return ``(old_line_ranges, new_line_ranges)`` of the diff of ``rel``."""
+    old, new = [], []
+    for match in _HUNK.finditer(_git("diff", "-U0", ref, "--", rel)):
+        a, b, c, d = (int(g) if g is not None else 1 for g in match.groups())
+        if b:
+            old.append((a, a + b - 1))
+        if d:
+            new.append((c, c + d - 1))
+    return old, new
+
+
+def _spans(data, lines):
+    starts = jsontok.line_starts(data)
+    return [jsontok.byte_range(starts, first, last, len(data)) for first, last in lines]
+
+
+def changed_keys(ref, rel):
+    """Key paths of a locale file whose spans the diff against ``ref`` touches."""
+    path = ROOT / rel
+    try:
+        old = _git("show", f"{ref}:{rel}")
+    except subprocess.CalledProcessError:
+        old = None
+    new = path.read_bytes() if path.exists() else None
+    if old is None or new is None:
+        # Added or deleted file: every key it has (or had) changed.
+        return {leaf.path for leaf in jsontok.leaves(new or old)}
+    old_lines, new_lines = _hunks(ref, rel)
+    keys = set()
+    for data, lines in ((old, old_lines), (new, new_lines)):
+        spans = list(jsontok.leaves(data))
+        keys.update(leaf.path for leaf in jsontok.overlapping(spans, _spans(data, lines)))
+    return keys
+
+
+class Scope:
+    """Files and keys to check; ``None`` means everything."""
+
+    def __init__(self, sources=None, keys=None):
+        self.sources = sources
+        self.keys = keys
+
+    @classmethod
+    def since(cls, ref, locales_dir=LOCALES_DIR):
+        sources, keys = set(), {}
+        locales_rel = Path(locales_dir).resolve().relative_to(ROOT)
+        for rel in changed_files(ref):
+            path = Path(rel)
+            if path.suffix in tokencache.SOURCE_SUFFIXES and not rel.endswith(".d.ts") \
+                    and path.is_relative_to(CLIENT_SRC.relative_to(ROOT)):
+                if (ROOT / rel).exists():
+                    sources.add(ROOT / rel)
+            elif path.suffix == ".json" and path.parent.parent == locales_rel \
+                    and path.name != "index.json":
+                # A shard's keys are relative to its namespace.
+                prefix = () if path.name == "translation.json" else (path.stem,)
+                with profiling.phase("diff", rel):
+                    keys.setdefault(path.parent.name, set()).update(
+                        prefix + key for key in changed_keys(ref, rel))
+        return cls(sources, keys)
+
+    def key_paths(self):
+        """Union of changed key paths over all locales."""
+        return set().union(*self.keys.values()) if self.keys else set()
+
+
+def dependents(key_paths, roots=(CLIENT_SRC,)):
+    """TSX sources that mention any of ``key_paths`` as a string literal."""
+    needles = [dotted(path).encode("utf-8") for path in key_paths]
+    if not needles:
+        return set()
+    found = set()
+    for root in roots:
+        for path in tokencache.iter_sources(root):
+            data = path.read_bytes()
+            if any(needle in data for needle in needles):
+                found.add(path)
+    return found
+
+
+class Report:
+    def __init__(self):
+        self.errors = []
+        self.warnings = []
+
+    def error(self, message):
+        self.errors.append(message)
+
+    def warn(self, message):
+        self.warnings.append(message)
+
+
+def check_usage(usage, source_flat, report, key_filter=None, files=None):
+    """Report missing keys and hard-coded text in ``files`` (default: all
+    scanned files), missing keys in ``key_filter`` wherever they are used,
+    and keys of ``key_filter`` that nothing uses."""
+    for key, sites in sorted(scan.missing_keys(usage, source_flat).items()):
+        if files is not None and (key_filter is None or key not in key_filter):
+            sites = [site for site in sites if site[0] in files]
+        if sites:
+            rel, line = sites[0]
+            report.error(f"{rel}:{line}: {key} is missing from {SOURCE_LANG}")
+    for rel, line, text in usage.hardcoded:
+        if files is None or rel in files:
+            report.warn(f"{rel}:{line}: hard-coded {text!r}")
+    if key_filter is not None:
+        for key in scan.unused_keys(usage, key_filter & source_flat):
+            report.warn(f"{key} is not used by any source")
+
+
+def check_placeholders(trees, paths, report):
+    source = trees.get(SOURCE_LANG, {})
+    for lang, tree in trees.items():
+        if lang == SOURCE_LANG:
+            continue
+        for path, value in _leaves(tree, paths):
+            expected = _get(source, path)
+            if expected is None:
+                continue
+            want = {_normalize(p) for p in placeholders(expected)}
+            have = {_normalize(p) for p in placeholders(value)}
+            key = dotted(path)
+            for name in sorted(have - want):
+                report.error(f"{lang}: {key} has {name} which {SOURCE_LANG} does not")
+            for name in sorted(want - have):
+                report.warn(f"{lang}: {key} drops {name}")
+
+
+def check_coverage(trees, paths, report):
+    source = trees.get(SOURCE_LANG, {})
+    for lang, tree in trees.items():
+        if lang == SOURCE_LANG:
+            continue
+        missing = [path for path, _ in _leaves(source, paths) if _get(tree, path) is None]
+        if missing:
+            shown = ", ".join(dotted(p) for p in missing[:3])
+            more = f" and {len(missing) - 3} more" if len(missing) > 3 else ""
+            report.warn(f"{lang}: {len(missing)} keys missing ({shown}{more})")
+
+
+def _normalize(placeholder):
+    return "{{" + placeholder[2:-2].strip() + "}}"
+
+
+def _get(tree, path):
+    if isinstance(tree, Locale):
+        return tree.get(path)
+    value = get_path(tree, path)
+    return None if isinstance(value, dict) else value
+
+
+def _leaves(tree, paths):
+    if paths is None:
+        yield from leaves(tree)
+        return
+    for path in paths:
+        value = _get(tree, path)
+        if value is not None:
+            yield path, value
+
+
+def run_checks(scope, session):
+    report = Report()
+    source_flat = {dotted(path) for path in session.locale(SOURCE_LANG).paths()}
+    key_paths = None if scope.keys is None else scope.key_paths()
+
+    if scope.sources is None:
+        check_usage(scan.build(), source_flat, report, source_flat)
+    else:
+        # Changed sources are checked in full; their dependents (sources
+        # using a changed English key) only for those keys. Whether a key
+        # is unused is decided on the dependents, which are every source
+        # that could use it.
+        changed_source = {dotted(p) for p in scope.keys.get(SOURCE_LANG, ())}
+        with profiling.phase("dependents"):
+            sources = scope.sources | dependents(scope.keys.get(SOURCE_LANG, ()))
+        usage = scan.build(sorted(sources)) if sources else scan.Usage()
+        files = {scan._relative(path) for path in scope.sources}
+        check_usage(usage, source_flat, report, changed_source, files)
+
+    if key_paths is None or key_paths:
+        # A changed English key affects every translation of it; a changed
+        # translation only needs its own locale.
+        langs = LANGUAGES if key_paths is None or SOURCE_LANG in scope.keys \
+            else [SOURCE_LANG, *scope.keys]
+        trees = {lang: session.locale(lang) for lang in langs
+                 if locale_exists(lang, session.locales_dir)}
+        with profiling.phase("placeholders"):
+            check_placeholders(trees, key_paths, report)
+        with profiling.phase("coverage"):
+            check_coverage(trees, key_paths, report)
+    return report
+
+
+def add_arguments(parser):
+    parser.add_argument("--since", metavar="REF", help="only check what changed since REF")
+    parser.add_argument("--warnings", action="store_true", help="print warnings too")
+
+
+def run(args, session):
+    if args.since:
+        scope = Scope.since(args.since, session.locales_dir)
+        langs = ", ".join(f"{lang} ({len(keys)})" for lang, keys in scope.keys.items())
+        print(f"Since {args.since}: {len(scope.sources)} source files; "
+              f"changed keys in {langs or 'no locales'}")
+    else:
+        scope = Scope()
+    report = run_checks(scope, session)
+    for message in report.errors:
+        print(f"  error: {message}")
+    if args.warnings:
+        for message in report.warnings:
+            print(f"  warning: {message}")
+    print(f"{len(report.errors)} errors, {len(report.warnings)} warnings")
+    if report.errors:
+        raise SystemExit(1)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, "check"):
+        run(args, Session())
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""The ``i18n`` command: one entry point for the translation tooling.
+
+    python -m i18n <command> [args] [+ <command> [args] ...]
+
+Commands are imported only when they run, so ``i18n status`` does not pay
+for NumPy, the lexer or the XML libraries. Several commands can be chained
+with ``+``; they share one set of parsed locale trees, which is written back
+once at the end::
+
+    python -m i18n merge fragments/privacy.json + sync --prune + bundle
+
+Global options (before the first command): ``--locales DIR`` and the
+profiling flags ``--profile``, ``--profile-out DIR``, ``--cprofile``, which
+then cover the whole chain.
+"""
+
+import argparse
+import importlib
+import sys
+
+from . import profiling
+from .paths import LANGUAGES, LOCALES_DIR, SOURCE_LANG
+from .session import Session
+from .shards import files
+
+# name -> (module, summary). Modules with add_arguments()/run() share the
+# session; the others are run through their own main() on the files on disk.
+COMMANDS = {
+    "status": ("i18n.cli", "key counts and coverage per locale"),
+    "merge": ("i18n.merge", "merge JSON/YAML fragments into the locales"),
+    "patch": ("i18n.patch", "apply pending declarative patches from i18n/patches"),
+    "rekey": ("i18n.rekey", "rename or move keys in every locale and call site at once"),
+    "localize": ("i18n.localize", "replace hard-coded TSX text with t() calls"),
+    "keyof": ("i18n.textindex", "which keys hold an English text; list duplicate texts"),
+    "scan": ("i18n.scan", "index t() usage; list missing, unused and hard-coded text"),
+    "dynkeys": ("i18n.dynkeys", "infer the key families dynamic t() calls can produce"),
+    "grep": ("i18n.query", "find keys (prefix, glob, regex) or values in every locale"),
+    "check": ("i18n.check", "CI checks (usage, placeholders, coverage); --since REF"),
+    "sync": ("i18n.sync", "compare key sets with en; prune dead keys"),
+    "normalize": ("i18n.normalize", "put every locale file in English key order"),
+    "keytypes": ("i18n.keytypes", "generate the TypeScript key union and key constants"),
+    "shard": ("i18n.shards", "split locales into per-namespace files, or join them back"),
+    "mergedriver": ("i18n.mergedriver", "git merge driver for translation.json; --install"),
+    "export": ("i18n.cli", "export XLIFF or PO files for translators"),
+    "import": ("i18n.cli", "import translated XLIFF or PO files"),
+    "db": ("i18n.db", "mirror the locales into SQLite; query missing keys, notes"),
+    "bundle": ("i18n.bundle", "write compact per-locale bundles"),
+    "pack": ("i18n.pack", "write binary locale packs for the native apps"),
+    "legal": ("i18n.legal", "pre-render the legal pages to per-locale HTML fragments"),
+    "inline": ("i18n.inline", "per-locale source overlays with static t() calls inlined"),
+    "bench": ("i18n.bench", "benchmark the toolchain on synthetic corpora"),
+    "model": ("i18n.model", "memory of the locales as dict trees and as the compact model"),
+    "coverage": ("i18n.coverage", "write the coverage matrix reports"),
+    "codemod": ("i18n.codemod", "strip inline t() fallbacks"),
+    "memoize": ("i18n.memoize", "memoize translated schemas and config objects"),
+    "tokens": ("i18n.tokencache", "warm or clear the TSX token cache"),
+    "watch": ("i18n.watch", "re-check usage and keys on every save"),
+}
+CHAIN = "+"
+
+
+class _Status:
+    @staticmethod
+    def add_arguments(parser):
+        parser.add_argument("langs", nargs="*", help="languages (default: all)")
+
+    @staticmethod
+    def run(args, session):
+        source = set(session.locale(SOURCE_LANG).paths())
+        print(f"{'lang':<6}{'keys':>7}{'of en':>8}{'extra':>7}{'KB':>7}")
+        for lang in args.langs or LANGUAGES:
+            leaves = set(session.locale(lang).paths())
+            size = sum(p.stat().st_size for p, _ in files(lang, session.locales_dir)
+                       if p.exists()) / 1024
+            print(f"{lang:<6}{len(leaves):>7}{len(leaves & source):>8}"
+                  f"{len(leaves - source):>7}{size:>7.0f}")
+
+
+class _Export:
+    @staticmethod
+    def add_arguments(parser):
+        parser.add_argument("langs", nargs="*", help="languages (default: the vendor languages)")
+        parser.add_argument("--format", choices=("xliff", "po"), default="xliff")
+        parser.add_argument("--out", help="output directory")
+
+    @staticmethod
+    def run(args, session):
+        module = importlib.import_module(f"i18n.{args.format}")
+        from .db import load_annotations
+        from .exchange import VENDOR_LANGUAGES
+
+        notes = load_annotations()["notes"]
+        session.flush()
+        out = args.out or module.DEFAULT_OUT
+        counts = module.export(args.langs or VENDOR_LANGUAGES, out, session.locales_dir, notes)
+        print(f"Exported {sum(counts.values())} entries for {len(counts)} languages to {out}")
+
+
+class _Import:
+    @staticmethod
+    def add_arguments(parser):
+        parser.add_argument("files", nargs="+", help=".xlf or .po files")
+
+    @staticmethod
+    def run(args, session):
+        session.flush()
+        for suffix, name in ((".xlf", "xliff"), (".po", "po")):
+            files = [f for f in args.files if f.endswith(suffix)]
+            if not files:
+                continue
+            module = importlib.import_module(f"i18n.{name}")
+            for lang, count in module.import_files(files, session.locales_dir).items():
+                print(f"Imported {count} keys into {lang}")
+        session.invalidate()
+
+
+_BUILTINS = {"status": _Status, "export": _Export, "import": _Import}
+
+
+def _load(name):
+    module_name, _ = COMMANDS[name]
+    if module_name == __name__:
+        return _BUILTINS[name]
+    return importlib.import_module(module_name)
+
+
+def split_chain(argv):
+    """Split ``argv`` into ``[[command, *args], ...]`` at ``+`` tokens."""
+    steps = [[]]
+    for arg in argv:
+        if arg == CHAIN:
+            steps.append([])
+        else:
+            steps[-1].append(arg)
+    return [step for step in steps if step]
+
+
+def run_step(step, session):
+    name, argv = step[0], step[1:]
+    command = _load(name)
+    if hasattr(command, "add_arguments"):
+        parser = argparse.ArgumentParser(prog=f"i18n {name}", description=COMMANDS[name][1])
+        command.add_arguments(parser)
+        command.run(parser.parse_args(argv), session)
+        return 0
+    # Standalone tools read and write the files themselves.
+    session.flush()
+    status = command.main(argv) or 0
+    session.invalidate()
+    return status
+
+
+def _parser():
+    epilog = "commands:\n" + "\n".join(
+        f"  {name:<12} {summary}" for name, (_, summary) in COMMANDS.items()
+    ) + f"\n\nChain commands with '{CHAIN}'; see 'i18n <command> --help'."
+    parser = argparse.ArgumentParser(
+        prog="i18n", description="Translation tooling for client/src/locales.",
+        epilog=epilog, formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--locales", default=LOCALES_DIR, help="locales directory")
+    profiling.add_arguments(parser)
+    parser.add_argument("command", choices=COMMANDS, metavar="command")
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    parser = _parser()
+    args = parser.parse_args(argv)
+    steps = split_chain([args.command] + args.args)
+    for step in steps:
+        if step[0] not in COMMANDS:
+            parser.error(f"unknown command {step[0]!r} (choose from {', '.join(COMMANDS)})")
+
+    with profiling.session(args, " + ".join(step[0] for step in steps)):
+        session = Session(args.locales)
+        status = 0
+        for step in steps:
+            with profiling.phase(step[0]):
+                status = run_step(step, session) or status
+        session.flush()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
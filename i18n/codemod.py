@@ -0,0 +1,234 @@
+"""Strip inline English fallbacks from t() calls across client/src.
+
+Rewrites
+
+    t('key', 'Fallback')                      -> t('key')
+    t('key', { defaultValue: 'Fallback' })    -> t('key')
+    t('key', { count, defaultValue: '...' })  -> t('key', { count })
+
+for single-, double- and back-quoted literals, on one line or spread over
+several. Before anything is written, every stripped key is checked against
+the English locale; keys that are missing there get the fallback text added
+to ``en/translation.json`` so no copy is lost. Call sites are left alone and
+reported when the fallback is not a plain literal (template substitutions,
+variables), when a missing key has different fallbacks at different sites,
+or when the fallback for a missing key is Arabic (it is added to ``ar`` and
+the English text still has to be written).
+
+Files are analysed in parallel from the shared token cache.
+
+Usage: python -m i18n.codemod [--dry-run] [--jobs N] [path ...]
+"""
+
+import argparse
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from . import profiling, tokencache
+from .exchange import set_path
+from .lexer import T_CALL, line_index, split_args, string_value
+from .paths import LOCALES_DIR, REFERENCE_LANG, ROOT, SOURCE_LANG
+from .store import flatten, get_path, load_locale, write_locale
+
+_DEFAULT_VALUE = re.compile(r"^defaultValue\s*:\s*(.+)$", re.S)
+_ARABIC = re.compile(r"[\u0600-\u06ff]")
+
+
+def _fallback_edit(src, call):
+    """Return ``(start, end, replacement, fallback)`` or a skip reason."""
+    _, start, end, key = call
+    if key is None or src[end - 1] != ")":
+        return None
+    open_paren = src.index("(", start)
+    args = split_args(src, open_paren, end - 1)
+    if len(args) < 2:
+        return None
+    first_end = args[0][1]
+    arg_start, arg_end = args[1]
+    arg = src[arg_start:arg_end]
+
+    if arg[0] in "'\"`":
+        fallback = string_value(arg)
+        if fallback is None:
+            return "fallback is not a plain string literal"
+        return first_end, arg_end, "", fallback
+
+    if not (arg.startswith("{") and arg.endswith("}")):
+        return None
+    props = split_args(src, arg_start, arg_end - 1)
+    for n, (prop_start, prop_end) in enumerate(props):
+        match = _DEFAULT_VALUE.match(src[prop_start:prop_end])
+        if not match:
+            continue
+        fallback = string_value(match.group(1).strip())
+        if fallback is None:
+            return "defaultValue is not a plain string literal"
+        if len(props) == 1:
+            return first_end, arg_end, "", fallback
+        if n + 1 < len(props):
+            return prop_start, props[n + 1][0], "", fallback
+        # Last property: take the comma before it, keep a trailing comma if any.
+        return props[n - 1][1], prop_end, "", fallback
+    return None
+
+
+def plan_file(path):
+    """Return ``(path, edits, skipped)`` for one source file.
+
+    ``edits`` are ``(start, end, replacement, key, fallback)``; ``skipped`` are
+    ``(line, key, reason)``.
+    """
+    src, tokens = tokencache.load(path)
+    edits, skipped = plan_source(src, tokens)
+    return str(path), edits, skipped
+
+
+def plan_source(src, tokens):
+    """Return ``(edits, skipped)`` for already-lexed source text."""
+    line_of = line_index(src)
+    edits = []
+    skipped = []
+    last_end = -1
+    for tok in tokens:
+        if tok[0] != T_CALL:
+            continue
+        result = _fallback_edit(src, tok)
+        if result is None:
+            continue
+        if isinstance(result, str):
+            skipped.append((line_of(tok[1]), tok[3], result))
+            continue
+        start, end, replacement, fallback = result
+        if start < last_end:
+            # Nested inside a call we are already rewriting; next run gets it.
+            continue
+        edits.append((start, end, replacement, tok[3], fallback))
+        last_end = end
+    return edits, skipped
+
+
+def apply_edits(src, edits):
+    out = []
+    pos = 0
+    for start, end, replacement, *_ in sorted(edits):
+        out.append(src[pos:start])
+        out.append(replacement)
+        pos = end
+    out.append(src[pos:])
+    return "".join(out)
+
+
+def _key_state(source, flat, key, lang=SOURCE_LANG):
+    """Return "present", "missing" or a reason the key cannot be migrated."""
+    if key in flat or f"{key}_one" in flat or f"{key}_other" in flat:
+        return "present"
+    path = tuple(key.split("."))
+    node = get_path(source, path)
+    if isinstance(node, dict):
+        return f"'{key}' is a namespace in {lang}, not a string"
+    for i in range(1, len(path)):
+        if isinstance(get_path(source, path[:i]), (str, list)):
+            return f"'{'.'.join(path[:i])}' is already a string in {lang}"
+    return "missing"
+
+
+def run(paths, dry_run=False, jobs=None, locales_dir=LOCALES_DIR):
+    paths = [Path(p) for p in paths]
+    tokencache.warm(paths, jobs)
+    with profiling.phase("plan"), ProcessPoolExecutor(max_workers=jobs) as pool:
+        plans = list(pool.map(plan_file, paths, chunksize=8))
+
+    source = load_locale(SOURCE_LANG, locales_dir)
+    reference = load_locale(REFERENCE_LANG, locales_dir)
+    flat = flatten(source)
+    reference_flat = flatten(reference)
+    migrated = {}
+    reference_added = {}
+    conflicts = {}
+    report = {"files": 0, "calls": 0, "migrated": migrated, "reference": reference_added,
+              "skipped": [], "conflicts": conflicts}
+
+    # A missing key is only migrated when every call site agrees on its text;
+    # otherwise adding it would change what the other sites display.
+    candidates = {}
+    for _, edits, _ in plans:
+        for edit in edits:
+            if edit[3] not in flat:
+                candidates.setdefault(edit[3], set()).add(edit[4])
+
+    for path, edits, skipped in plans:
+        rel = Path(path).relative_to(ROOT) if Path(path).is_relative_to(ROOT) else Path(path)
+        report["skipped"] += [(str(rel), line, key, reason) for line, key, reason in skipped]
+        keep = []
+        for edit in edits:
+            key, fallback = edit[3], edit[4]
+            state = "present" if key in migrated else _key_state(source, flat, key)
+            if state == "missing" and len(candidates[key]) > 1:
+                conflicts.setdefault(key, set()).add(str(rel))
+                continue
+            if state == "missing" and _ARABIC.search(fallback):
+                reference_state = _key_state(reference, reference_flat, key, REFERENCE_LANG)
+                if reference_state not in ("present", "missing"):
+                    # Adding it would replace a string, or a namespace, in ar.
+                    report["skipped"].append((str(rel), None, key, reference_state))
+                    continue
+                if reference_state == "missing":
+                    reference_added[key] = fallback
+                    reference_flat[key] = fallback
+                    set_path(reference, tuple(key.split(".")), fallback)
+                report["skipped"].append(
+                    (str(rel), None, key, f"Arabic fallback; needs English text in {SOURCE_LANG}")
+                )
+                continue
+            if state == "missing":
+                migrated[key] = fallback
+                set_path(source, tuple(key.split(".")), fallback)
+                flat[key] = fallback
+            elif state != "present":
+                report["skipped"].append((str(rel), None, key, state))
+                continue
+            keep.append(edit)
+        if not keep:
+            continue
+        report["files"] += 1
+        report["calls"] += len(keep)
+        if not dry_run:
+            with profiling.phase("rewrite", path):
+                src = Path(path).read_text(encoding="utf-8")
+                Path(path).write_text(apply_edits(src, keep), encoding="utf-8")
+
+    if not dry_run:
+        if migrated:
+            write_locale(SOURCE_LANG, source, locales_dir)
+        if reference_added:
+            write_locale(REFERENCE_LANG, reference, locales_dir)
+    return report
+
+
+@profiling.command("codemod")
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="files to rewrite (default: all of client/src)")
+    parser.add_argument("--dry-run", action="store_true", help="report without writing")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes")
+    args = parser.parse_args(argv)
+
+    paths = args.paths or list(tokencache.iter_sources())
+    report = run(paths, args.dry_run, args.jobs)
+
+    verb = "Would strip" if args.dry_run else "Stripped"
+    print(f"{verb} {report['calls']} fallbacks in {report['files']} files; "
+          f"{len(report['migrated'])} keys added to {SOURCE_LANG}, "
+          f"{len(report['reference'])} to {REFERENCE_LANG}")
+    for key, files in report["conflicts"].items():
+        print(f"  conflict: {key} has different fallbacks in {', '.join(sorted(files))}")
+    for path, line, key, reason in report["skipped"]:
+        where = f"{path}:{line}" if line else path
+        print(f"  skipped {where}: {key or '<dynamic>'} - {reason}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""Translation coverage matrix and missing-key reports.
+
+Builds a keys x locales status matrix over the flattened locale files and
+writes, in one pass:
+
+* ``<lang>.csv`` - every English key that is not translated in that language,
+* ``namespaces.csv`` - coverage percentage per top-level namespace,
+* ``summary.json`` - per-language counts and coverage.
+
+Usage: python -m i18n.coverage [--out i18n-reports/coverage] [lang ...]
+"""
+
+import argparse
+import csv
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from . import profiling
+from .model import leaves
+from .paths import LANGUAGES, LOCALES_DIR, ROOT, SOURCE_LANG, locale_exists
+from .session import Session
+from .store import dotted
+
+MISSING = 0
+IDENTICAL = 1
+TRANSLATED = 2
+ORPHAN = 3
+ABSENT = 4
+STATUS_NAMES = ["missing", "identical", "translated", "orphan", "absent"]
+
+DEFAULT_OUT = ROOT / "i18n-reports" / "coverage"
+
+# Product and vendor names that stay in English in every language.
+BRAND_NAMES = {"Log & Ledger", "Firebase", "Google", "Gmail", "WhatsApp", "ZATCA"}
+# Subtrees made up entirely of such names (AI provider picker).
+BRAND_PREFIXES = [("common", "providers")]
+
+_INTERPOLATION = re.compile(r"\{\{[^}]*\}\}")
+_LETTER = re.compile(r"[^\W\d_]")
+_URL_OR_EMAIL = re.compile(r"^(https?://\S+|[\w.+-]+@[\w-]+\.[\w.]+)$")
+# IBANs, SWIFT/BIC codes, ISO currency codes, date masks, sample references.
+_CODE = re.compile(r"^[A-Z0-9][A-Z0-9 /_.:,-]*$")
+
+
+def is_intentionally_identical(path, value):
+    """True when a value is expected to read the same in every language."""
+    if not isinstance(value, str):
+        return False
+    text = _INTERPOLATION.sub("", value).strip()
+    if not _LETTER.search(text):
+        return True
+    if text in BRAND_NAMES or _URL_OR_EMAIL.match(text):
+        return True
+    if any(path[: len(prefix)] == prefix for prefix in BRAND_PREFIXES):
+        return True
+    if _CODE.match(text) and (len(text) <= 5 or re.search(r"[\d/-]", text)):
+        return True
+    leaf = path[-1]
+    return leaf.endswith(("Placeholder", "Example")) and bool(re.search(r"\d", text))
+
+
+def _is_sync_placeholder(path, value, source_value):
+    # sync-all-translations.js fills new keys with the key name itself.
+    return value == path[-1] and source_value != value
+
+
+def build_matrix(trees, langs):
+    """Return ``(paths, matrix, source_values)``.
+
+    ``matrix[i, j]`` is the status of ``paths[i]`` in ``langs[j]``. Rows start
+    with the source keys in source order, followed by orphans (keys that only
+    exist in translations); an orphan is ``ABSENT`` where a locale lacks it,
+    not ``MISSING``.
+    """
+    source = dict(leaves(trees.get(SOURCE_LANG, {})))
+    index = {path: i for i, path in enumerate(source)}
+    paths = list(source)
+    per_lang = []
+    for lang in langs:
+        cells = dict(leaves(trees.get(lang, {})))
+        for path in cells:
+            if path not in index:
+                index[path] = len(paths)
+                paths.append(path)
+        per_lang.append(cells)
+
+    source_values = _object_array(source.values(), len(paths))
+    in_source = np.zeros(len(paths), dtype=bool)
+    in_source[: len(source)] = True
+    intentional = np.fromiter(
+        (is_intentionally_identical(p, v) for p, v in zip(paths, source_values)),
+        dtype=bool,
+        count=len(paths),
+    )
+
+    matrix = np.repeat(np.where(in_source, MISSING, ABSENT).astype(np.uint8)[:, None],
+                       len(langs), axis=1)
+    for j, (lang, cells) in enumerate(zip(langs, per_lang)):
+        rows = np.fromiter((index[p] for p in cells), dtype=np.intp, count=len(cells))
+        values = np.empty(len(paths), dtype=object)
+        for i, value in zip(rows, cells.values()):
+            values[i] = value
+        present = np.zeros(len(paths), dtype=bool)
+        present[rows] = True
+
+        column = matrix[:, j]
+        column[present] = TRANSLATED
+        if lang != SOURCE_LANG:
+            same = present & in_source & (values == source_values)
+            column[same & ~intentional] = IDENTICAL
+            placeholder = [
+                i for i in rows
+                if in_source[i] and _is_sync_placeholder(paths[i], values[i], source_values[i])
+            ]
+            column[placeholder] = MISSING
+        column[present & ~in_source] = ORPHAN
+    return paths, matrix, source_values
+
+
+def _object_array(items, size):
+    # Element-wise so list leaves are not broadcast into extra dimensions.
+    array = np.empty(size, dtype=object)
+    for i, value in enumerate(items):
+        array[i] = value
+    return array
+
+
+def source_rows(matrix):
+    """Boolean vector of the rows of ``matrix`` that are source keys."""
+    return ~np.isin(matrix, (ORPHAN, ABSENT)).all(axis=1)
+
+
+def namespace_coverage(paths, matrix, langs):
+    """Return ``{namespace: {lang: percent}}`` over source keys."""
+    namespaces = np.array([p[0] for p in paths], dtype=object)
+    in_source = source_rows(matrix)
+    result = {}
+    for ns in dict.fromkeys(namespaces):
+        rows = (namespaces == ns) & in_source
+        total = int(rows.sum())
+        if not total:
+            continue
+        translated = (matrix[rows] == TRANSLATED).sum(axis=0)
+        result[ns] = {
+            lang: round(100.0 * int(n) / total, 1) for lang, n in zip(langs, translated)
+        }
+    return result
+
+
+def write_reports(trees, langs, out_dir):
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with profiling.phase("diff"):
+        paths, matrix, source_values = build_matrix(trees, langs)
+    keys = [dotted(p) for p in paths]
+    in_source = source_rows(matrix)
+    source_count = int(in_source.sum())
+
+    summary = {"sourceLanguage": SOURCE_LANG, "sourceKeys": source_count, "languages": {}}
+    for j, lang in enumerate(langs):
+        column = matrix[:, j]
+        counts = np.bincount(column, minlength=len(STATUS_NAMES))
+        summary["languages"][lang] = {
+            **{name: int(n) for name, n in zip(STATUS_NAMES, counts)},
+            "coverage": round(100.0 * int(counts[TRANSLATED]) / source_count, 1)
+            if source_count else 0.0,
+        }
+        if lang == SOURCE_LANG:
+            continue
+        values = dict(leaves(trees.get(lang, {})))
+        csv_path = out_dir / f"{lang}.csv"
+        with profiling.phase("report", csv_path), \
+                open(csv_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+            writer.writerow(["Key", "English", lang, "Status"])
+            for i in np.flatnonzero((column != TRANSLATED) & in_source):
+                source_value = source_values[i]
+                writer.writerow([
+                    keys[i],
+                    _cell(source_value),
+                    _cell(values.get(paths[i])),
+                    STATUS_NAMES[column[i]],
+                ])
+
+    coverage = namespace_coverage(paths, matrix, langs)
+    with open(out_dir / "namespaces.csv", "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Namespace"] + langs)
+        for ns, row in coverage.items():
+            writer.writerow([ns] + [row[lang] for lang in langs])
+
+    summary["namespaces"] = coverage
+    with open(out_dir / "summary.json", "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    return summary
+
+
+def _cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+@profiling.command("coverage")
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("langs", nargs="*", help="languages to report (default: all)")
+    parser.add_argument("--out", default=DEFAULT_OUT, help="output directory")
+    parser.add_argument("--locales", default=LOCALES_DIR, help="locales directory")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    langs = args.langs or LANGUAGES
+    if SOURCE_LANG not in langs:
+        langs = [SOURCE_LANG] + langs
+    session = Session(args.locales)
+    trees = {lang: session.locale(lang) for lang in langs
+             if locale_exists(lang, args.locales)}
+    summary = write_reports(trees, [lang for lang in langs if lang in trees], args.out)
+
+    for lang, stats in summary["languages"].items():
+        if lang == SOURCE_LANG:
+            continue
+        print(
+            f"{lang}: {stats['coverage']:5.1f}%  missing {stats['missing']:5d}  "
+            f"identical {stats['identical']:4d}  orphan {stats['orphan']:5d}"
+        )
+    print(f"Wrote reports to {args.out} in {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
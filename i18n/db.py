@@ -0,0 +1,375 @@
+"""SQLite store for keys, per-locale values, status and translator notes.
+
+The JSON files stay what the app loads; the database is a queryable mirror
+that tools can read and update with indexed SQL instead of parsing and
+rewriting 17 nested files. It lives in the untracked ``.i18n-cache`` and can
+be rebuilt at any time with ``import``. What only people write - translator
+notes and statuses set by hand such as ``review`` - is kept in the tracked
+``i18n/annotations.json`` as well, and ``import`` applies it to the
+database, so it is committed and shared like the locales::
+
+    namespaces(id, name)
+    keys(id, key, path, namespace_id, note)
+    translations(key_id, locale, value, is_json, position, status, modified)
+
+``key`` is the dotted key (indexed, so ``reports.*`` is a range scan),
+``path`` the JSON array of segments, since a few keys contain dots.
+Values are stored as text; ``is_json`` marks the legal pages' ``points``
+lists, which are stored JSON-encoded. ``position`` keeps each locale's
+document order, so ``export`` gives back exactly the trees ``import`` read,
+key order included. ``status`` is the coverage status (``source`` for English,
+then ``translated``, ``identical``, ``missing`` or ``orphan``; tools may set
+others such as ``review``, which take precedence). ``modified`` changes
+only when a value does.
+
+Usage:
+    python -m i18n.db import [lang ...]
+    python -m i18n.db export [lang ...]
+    python -m i18n.db missing LANG [PREFIX]
+    python -m i18n.db note KEY [TEXT]
+    python -m i18n.db status LANG KEY [STATUS]
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from . import profiling
+from .coverage import STATUS_NAMES, build_matrix
+from .model import leaves
+from .paths import LANGUAGES, ROOT, SOURCE_LANG
+from .session import Session
+from .store import dotted, unflatten
+
+DEFAULT_DB = ROOT / ".i18n-cache" / "translations.sqlite"
+ANNOTATIONS = Path(__file__).resolve().parent / "annotations.json"
+# Statuses import computes; any other status is an annotation.
+DERIVED_STATUSES = frozenset({"source", *STATUS_NAMES})
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS namespaces (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS keys (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL,
+    path TEXT NOT NULL UNIQUE,
+    namespace_id INTEGER NOT NULL REFERENCES namespaces(id),
+    note TEXT
+);
+CREATE TABLE IF NOT EXISTS translations (
+    key_id INTEGER NOT NULL REFERENCES keys(id) ON DELETE CASCADE,
+    locale TEXT NOT NULL,
+    value TEXT NOT NULL,
+    is_json INTEGER NOT NULL DEFAULT 0,
+    position INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    modified TEXT NOT NULL,
+    PRIMARY KEY (key_id, locale)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS keys_key ON keys(key);
+CREATE INDEX IF NOT EXISTS keys_namespace ON keys(namespace_id);
+CREATE INDEX IF NOT EXISTS translations_locale ON translations(locale, position);
+CREATE INDEX IF NOT EXISTS translations_status ON translations(locale, status);
+"""
+
+
+def _encode(value):
+    if isinstance(value, str):
+        return value, 0
+    return json.dumps(value, ensure_ascii=False), 1
+
+
+def _decode(value, is_json):
+    return json.loads(value) if is_json else value
+
+
+def load_annotations(path=ANNOTATIONS):
+    """``{"notes": {key: note}, "status": {lang: {key: status}}}``."""
+    path = Path(path)
+    annotations = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    return {"notes": annotations.get("notes", {}), "status": annotations.get("status", {})}
+
+
+def write_annotations(annotations, path=ANNOTATIONS):
+    data = {
+        "notes": dict(sorted(annotations["notes"].items())),
+        "status": {lang: dict(sorted(keys.items()))
+                   for lang, keys in sorted(annotations["status"].items()) if keys},
+    }
+    Path(path).write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n",
+                          encoding="utf-8")
+
+
+def prefix_range(prefix):
+    """``(low, high)`` such that keys under ``prefix.`` sort in ``[low, high)``."""
+    return prefix + ".", prefix + "/"  # "/" sorts right after "."
+
+
+class Store:
+    """A connection to the translations database.
+
+    Use as a context manager for one transaction: everything inside is
+    committed together, or rolled back on an exception.
+    """
+
+    def __init__(self, path=DEFAULT_DB):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.conn.commit()
+        else:
+            self.conn.rollback()
+
+    def close(self):
+        self.conn.close()
+
+    def _namespace_id(self, name, cache):
+        if name not in cache:
+            self.conn.execute("INSERT OR IGNORE INTO namespaces(name) VALUES (?)", (name,))
+            cache[name] = self.conn.execute(
+                "SELECT id FROM namespaces WHERE name = ?", (name,)).fetchone()[0]
+        return cache[name]
+
+    def key_ids(self, paths):
+        """Return ``{path: key_id}``, creating keys that do not exist yet."""
+        ids = {}
+        namespaces = {}
+        existing = dict(self.conn.execute("SELECT path, id FROM keys"))
+        for path in paths:
+            encoded = json.dumps(list(path), ensure_ascii=False)
+            key_id = existing.get(encoded)
+            if key_id is None:
+                key_id = self.conn.execute(
+                    "INSERT INTO keys(key, path, namespace_id) VALUES (?, ?, ?)",
+                    (dotted(path), encoded, self._namespace_id(path[0], namespaces)),
+                ).lastrowid
+            ids[path] = key_id
+        return ids
+
+    def import_trees(self, trees):
+        """Replace the stored values of every locale in ``trees``.
+
+        Statuses come from the coverage matrix, so English should be among
+        ``trees`` (or already imported) for them to be meaningful.
+        """
+        langs = list(trees)
+        if SOURCE_LANG not in trees:
+            trees = {SOURCE_LANG: self.export_tree(SOURCE_LANG), **trees}
+            langs = [SOURCE_LANG, *langs]
+        with profiling.phase("diff"):
+            paths, matrix, _ = build_matrix(trees, langs)
+        row = {path: i for i, path in enumerate(paths)}
+        ids = self.key_ids(paths)
+        now = time.strftime("%Y-%m-%dT%H:%M:%S")
+        counts = {}
+        for j, lang in enumerate(langs):
+            if lang in counts:
+                continue
+            with profiling.phase("db import", lang):
+                rows = []
+                for position, (path, value) in enumerate(leaves(trees[lang])):
+                    text, is_json = _encode(value)
+                    status = "source" if lang == SOURCE_LANG else STATUS_NAMES[matrix[row[path], j]]
+                    rows.append((ids[path], lang, text, is_json, position, status, now))
+                self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS seen (key_id INTEGER PRIMARY KEY)")
+                self.conn.execute("DELETE FROM seen")
+                self.conn.executemany("INSERT INTO seen VALUES (?)", ((r[0],) for r in rows))
+                self.conn.execute(
+                    "DELETE FROM translations WHERE locale = ? "
+                    "AND key_id NOT IN (SELECT key_id FROM seen)", (lang,))
+                self.conn.executemany(
+                    """INSERT INTO translations
+                           (key_id, locale, value, is_json, position, status, modified)
+                       VALUES (?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT (key_id, locale) DO UPDATE SET
+                           modified = CASE WHEN value IS excluded.value AND is_json = excluded.is_json
+                                           THEN modified ELSE excluded.modified END,
+                           value = excluded.value,
+                           is_json = excluded.is_json,
+                           position = excluded.position,
+                           status = excluded.status""",
+                    rows,
+                )
+            counts[lang] = len(rows)
+        self.conn.execute(
+            "DELETE FROM keys WHERE id NOT IN (SELECT DISTINCT key_id FROM translations)")
+        return counts
+
+    def export_tree(self, lang):
+        """Rebuild ``lang``'s nested tree in its original key order."""
+        rows = self.conn.execute(
+            """SELECT k.path, t.value, t.is_json FROM translations t
+               JOIN keys k ON k.id = t.key_id
+               WHERE t.locale = ? ORDER BY t.position""", (lang,))
+        return unflatten((tuple(json.loads(path)), _decode(value, is_json))
+                         for path, value, is_json in rows)
+
+    def locales(self):
+        return [lang for (lang,) in self.conn.execute(
+            "SELECT DISTINCT locale FROM translations")]
+
+    def values(self, key):
+        """``{locale: value}`` for one dotted key."""
+        rows = self.conn.execute(
+            """SELECT t.locale, t.value, t.is_json FROM translations t
+               JOIN keys k ON k.id = t.key_id WHERE k.key = ?""", (key,))
+        return {lang: _decode(value, is_json) for lang, value, is_json in rows}
+
+    def missing(self, lang, prefix=None):
+        """English keys (under ``prefix``) that ``lang`` lacks or only has as a placeholder."""
+        sql = """SELECT k.key FROM keys k
+                 JOIN translations s ON s.key_id = k.id AND s.locale = ?
+                 LEFT JOIN translations t ON t.key_id = k.id AND t.locale = ?
+                 WHERE (t.key_id IS NULL OR t.status = 'missing')"""
+        params = [SOURCE_LANG, lang]
+        if prefix:
+            low, high = prefix_range(prefix)
+            sql += " AND (k.key = ? OR (k.key >= ? AND k.key < ?))"
+            params += [prefix, low, high]
+        return [key for (key,) in self.conn.execute(sql + " ORDER BY s.position", params)]
+
+    def set_value(self, lang, path, value, status="translated"):
+        """Insert or update one value; new keys go to the end of the locale."""
+        key_id = self.key_ids([tuple(path)])[tuple(path)]
+        text, is_json = _encode(value)
+        position = self.conn.execute(
+            "SELECT COALESCE(MAX(position) + 1, 0) FROM translations WHERE locale = ?",
+            (lang,)).fetchone()[0]
+        self.conn.execute(
+            """INSERT INTO translations (key_id, locale, value, is_json, position, status, modified)
+               VALUES (?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT (key_id, locale) DO UPDATE SET
+                   value = excluded.value, is_json = excluded.is_json,
+                   status = excluded.status, modified = excluded.modified""",
+            (key_id, lang, text, is_json, position, status, time.strftime("%Y-%m-%dT%H:%M:%S")),
+        )
+
+    def set_note(self, key, note):
+        return self.conn.execute("UPDATE keys SET note = ? WHERE key = ?", (note, key)).rowcount
+
+    def status(self, lang, key):
+        row = self.conn.execute(
+            """SELECT t.status FROM translations t JOIN keys k ON k.id = t.key_id
+               WHERE t.locale = ? AND k.key = ?""", (lang, key)).fetchone()
+        return row[0] if row else None
+
+    def set_status(self, lang, key, status):
+        return self.conn.execute(
+            """UPDATE translations SET status = ? WHERE locale = ?
+               AND key_id IN (SELECT id FROM keys WHERE key = ?)""", (status, lang, key)).rowcount
+
+    def apply_annotations(self, annotations, langs=None):
+        """Set the notes and the hand-set statuses (of ``langs``) from ``annotations``."""
+        self.conn.execute("UPDATE keys SET note = NULL")
+        self.conn.executemany("UPDATE keys SET note = ? WHERE key = ?",
+                              ((note, key) for key, note in annotations["notes"].items()))
+        for lang, statuses in annotations["status"].items():
+            if langs is None or lang in langs:
+                for key, status in statuses.items():
+                    self.set_status(lang, key, status)
+
+    def notes(self):
+        """``{dotted_key: note}`` for keys that have one (feeds the XLIFF/PO exports)."""
+        return dict(self.conn.execute("SELECT key, note FROM keys WHERE note IS NOT NULL"))
+
+
+def add_arguments(parser):
+    parser.add_argument("--db", default=DEFAULT_DB, help="database file")
+    parser.add_argument("--annotations", default=ANNOTATIONS,
+                        help="tracked file of notes and hand-set statuses")
+    sub = parser.add_subparsers(dest="action", required=True)
+    imp = sub.add_parser("import", help="load locale files into the database")
+    imp.add_argument("langs", nargs="*", help="languages (default: all)")
+    exp = sub.add_parser("export", help="write the database back to the locale files")
+    exp.add_argument("langs", nargs="*", help="languages (default: all in the database)")
+    mis = sub.add_parser("missing", help="English keys a language lacks")
+    mis.add_argument("lang")
+    mis.add_argument("prefix", nargs="?", help="only keys under this dotted prefix")
+    note = sub.add_parser("note", help="show or set a translator note")
+    note.add_argument("key")
+    note.add_argument("text", nargs="?")
+    status = sub.add_parser("status", help="show or set a key's status in one language")
+    status.add_argument("lang")
+    status.add_argument("key")
+    status.add_argument("status", nargs="?",
+                        help="e.g. review; a computed status (translated, ...) clears it")
+
+
+def run(args, session):
+    store = Store(args.db)
+    try:
+        with store:
+            if args.action == "import":
+                langs = args.langs or LANGUAGES
+                counts = store.import_trees(session.locales(langs))
+                store.apply_annotations(load_annotations(args.annotations), set(counts))
+                print(f"Imported {sum(counts.values())} values for {len(counts)} languages "
+                      f"into {args.db}")
+            elif args.action == "export":
+                langs = args.langs or store.locales()
+                for lang in langs:
+                    session.replace(lang, store.export_tree(lang))
+                print(f"Exported {len(langs)} languages from {args.db}")
+            elif args.action == "missing":
+                keys = store.missing(args.lang, args.prefix)
+                for key in keys:
+                    print(f"  {key}")
+                print(f"{len(keys)} keys missing in {args.lang}")
+            elif args.action == "note":
+                annotations = load_annotations(args.annotations)
+                if args.text is None:
+                    print(annotations["notes"].get(args.key, ""))
+                elif not store.set_note(args.key, args.text):
+                    raise SystemExit(f"unknown key {args.key!r} (run 'i18n db import' first?)")
+                else:
+                    annotations["notes"][args.key] = args.text
+                    write_annotations(annotations, args.annotations)
+            elif args.status is None:
+                print(store.status(args.lang, args.key) or "")
+            else:
+                annotations = load_annotations(args.annotations)
+                overrides = annotations["status"].setdefault(args.lang, {})
+                if args.status in DERIVED_STATUSES:
+                    # Back to the computed status: re-import the language.
+                    overrides.pop(args.key, None)
+                    store.import_trees(session.locales([args.lang]))
+                    store.apply_annotations(annotations, {args.lang})
+                else:
+                    if not store.set_status(args.lang, args.key, args.status):
+                        raise SystemExit(f"{args.lang} has no key {args.key!r} in {args.db}")
+                    overrides[args.key] = args.status
+                write_annotations(annotations, args.annotations)
+    finally:
+        store.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, f"db {args.action}"):
+        session = Session()
+        run(args, session)
+        session.flush()
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,427 @@
+"""Infer which keys the dynamic ``t()`` calls can produce.
+
+A call like ``t(`audit.severity.${entry.severity}`)`` hides its keys from
+the usage index, which made pruning and namespace splitting unsafe. For
+each dynamic call this module works out a *key family*: the template's
+literal parts with each ``${...}`` replaced by the finite set of values
+the expression can take, found, in order, from
+
+* the loop it is bound in: ``['a', 'b'].map((x) => ...)``,
+  ``LIST.map(x => ...)`` with ``const LIST = ['a', 'b']``, and
+  ``Object.keys(OBJ)`` / ``Object.entries(OBJ).map(([x, ...]) => ...)``
+  over an object literal in the same file;
+* a typed parameter or property: ``x: Status`` with
+  ``type Status = 'a' | 'b'`` or ``enum Status {...}``, an inline union,
+  or a zod ``x: z.enum([...])`` - in the file first, then anywhere in
+  client/src and shared/ (by property name).
+
+A call whose key is not a template gets the key-like string values of the
+object it indexes (``t(labels[x])``, ``const key = labels[x]``), the
+literal arguments passed for it when it is a parameter of a function in the
+file, or else the key-like literals assigned to that property or variable
+(``label: 'nav.home'`` for ``t(item.label)``).
+
+Only domains found in the file itself are taken as exact. When a domain
+comes from elsewhere in the project, or none is found, the family reaches
+every key matching its pattern (``audit.severity.*``), which keeps pruning
+conservative. Calls with no literal part and no domain are unbounded: they
+could produce any key.
+
+Usage: python -m i18n.dynkeys [--open] [path ...]
+"""
+
+import argparse
+import re
+import sys
+from itertools import product
+from pathlib import Path
+from typing import NamedTuple
+
+from . import profiling, tokencache
+from .lexer import T_CALL, code_mask, line_index, match_bracket, split_args, string_value
+from .paths import CLIENT_SRC, ROOT
+
+SHARED = ROOT / "shared"
+
+_IDENT = r"[A-Za-z_$][\w$]*"
+_LITERAL = re.compile(r"""(['"])((?:\\.|(?!\1).)*)\1""")
+# The declaration patterns start at the keyword or the colon rather than
+# at the name: a pattern opening with an identifier is tried at every word
+# of every file, which made the project-wide pass take over a second.
+_UNION_ALIAS = re.compile(rf"\btype\s+({_IDENT})\s*=\s*((?:\s*\|?\s*['\"][^'\"]*['\"])+)\s*;?")
+_ENUM = re.compile(rf"\benum\s+({_IDENT})\s*\{{([^}}]*)\}}")
+_ZOD_ENUM = re.compile(r":\s*z\.enum\(\s*\[([^\]]*)\]")
+# At least two members: ``status: 'active'`` is an object literal value, not a type.
+_PROP_UNION = re.compile(
+    r":\s*\|?\s*((?:['\"][^'\"]*['\"]\s*\|\s*)+['\"][^'\"]*['\"])\s*[;,\n)]")
+_NAME_BEFORE = re.compile(rf"({_IDENT})\??\s*\Z")
+_KEYLIKE = re.compile(r"^[A-Za-z_][\w-]*(?:\.[\w-]+)+$")
+
+
+class Family(NamedTuple):
+    rel: str
+    line: int
+    pattern: str        # glob, ``*`` for each open part
+    keys: tuple         # expanded keys, or () when the family is open
+    source: str         # how the domain was found
+
+    @property
+    def open(self):
+        return not self.keys
+
+    @property
+    def exact(self):
+        """The keys come from this file's own types, loops or literals.
+
+        A domain borrowed from a same-named property elsewhere in the project,
+        or from function arguments some of which are not literals, may be
+        incomplete, so such families also reach their whole pattern.
+        """
+        return bool(self.keys) and "project" not in self.source
+
+    @property
+    def unbounded(self):
+        return not self.exact and self.pattern.strip("*.") == ""
+
+
+def _literals(text):
+    return [m.group(2) for m in _LITERAL.finditer(text)]
+
+
+def _unions(src):
+    """``{type_name: values}`` for string-literal unions and enums in ``src``."""
+    types = {name: _literals(body) for name, body in _UNION_ALIAS.findall(src)}
+    for name, body in _ENUM.findall(src):
+        values = _literals(body)
+        if not values:
+            values = [item.split("=")[0].strip() for item in body.split(",") if item.strip()]
+        types[name] = values
+    return types
+
+
+def _properties(src, types):
+    """``{property_or_param_name: values}`` from zod enums and typed declarations."""
+    props = {}
+    patterns = [_ZOD_ENUM, _PROP_UNION]
+    if types:
+        names = "|".join(map(re.escape, sorted(types, key=len, reverse=True)))
+        patterns.append(re.compile(rf":\s*({names})\b(?![\w$.\[<])"))
+    for pattern in patterns:
+        for match in pattern.finditer(src):
+            name = _NAME_BEFORE.search(src, max(0, match.start() - 80), match.start())
+            if name is None:
+                continue
+            body = match.group(1)
+            values = types[body] if body in types else _literals(body)
+            props.setdefault(name.group(1), set()).update(values)
+    return props
+
+
+_project = None
+
+
+def project_domains():
+    """Property domains across client/src and shared/ (computed once per process)."""
+    global _project
+    if _project is None:
+        sources = [p for root in (CLIENT_SRC, SHARED) if root.exists()
+                   for p in tokencache.iter_sources(root)]
+        texts = [p.read_text(encoding="utf-8", errors="replace") for p in sources]
+        types = {}
+        for text in texts:
+            types.update(_unions(text))
+        _project = {}
+        for text in texts:
+            for name, values in _properties(text, types).items():
+                _project.setdefault(name, set()).update(values)
+    return _project
+
+
+def _object_items(src, masked, name):
+    """``[(key, value_source)]`` of ``const name ... = { ... }`` in ``src``."""
+    match = re.search(rf"\b(?:const|let|var)\s+{re.escape(name)}\b[^=;]*=\s*\{{", masked)
+    if not match:
+        return None
+    open_brace = match.end() - 1
+    close = match_bracket(masked, open_brace)
+    if close is None:
+        return None
+    items = []
+    for start, end in split_args(src, open_brace, close - 1):
+        head, _, value = src[start:end].partition(":")
+        head = head.strip()
+        key = string_value(head) if head[:1] in "'\"" else head
+        if key and (head[:1] in "'\"" or re.fullmatch(_IDENT, key)):
+            items.append((key, value.strip()))
+    return items or None
+
+
+def _object_keys(src, masked, name):
+    items = _object_items(src, masked, name)
+    return [key for key, _ in items] if items else None
+
+
+def _object_values(src, masked, name):
+    """Key-like string values of the object literal ``name``."""
+    values = [string_value(value) for _, value in _object_items(src, masked, name) or ()]
+    return [v for v in values if v and _KEYLIKE.match(v)] or None
+
+
+def _array_values(src, expr):
+    """String items of an array literal, or of ``const expr = [...]``."""
+    if expr.startswith("["):
+        return _literals(expr) or None
+    match = re.search(rf"\b(?:const|let|var)\s+{re.escape(expr)}\b[^=;]*=\s*\[([^\]]*)\]", src)
+    if match:
+        return _literals(match.group(1)) or None
+    return None
+
+
+def _loop_domain(src, masked, before, name):
+    """Domain of ``name`` when it is a ``.map``/``.forEach``/``for..of`` variable."""
+    loop = re.compile(
+        rf"((?:Object\.(?:keys|entries)\(\s*{_IDENT}\s*\))|\[[^\]]*\]|{_IDENT}(?:\.{_IDENT})*)"
+        rf"\s*\.(?:map|forEach|filter|flatMap)\(\s*\(?\s*(\[\s*)?{re.escape(name)}\b"
+    )
+    matches = list(loop.finditer(before))
+    for_of = list(re.finditer(
+        rf"for\s*\(\s*(?:const|let)\s+(\[\s*)?{re.escape(name)}\b[^)]*?\bof\s+"
+        rf"((?:Object\.(?:keys|entries)\(\s*{_IDENT}\s*\))|{_IDENT})", before))
+    candidates = [(m.start(), m.group(1), m.group(2)) for m in matches]
+    candidates += [(m.start(), m.group(2), m.group(1)) for m in for_of]
+    if not candidates:
+        return None
+    _, source, destructured = max(candidates)
+    object_call = re.match(rf"Object\.(keys|entries)\(\s*({_IDENT})\s*\)", source)
+    if object_call:
+        if object_call.group(1) == "entries" and not destructured:
+            return None
+        return _object_keys(src, masked, object_call.group(2))
+    if destructured:
+        return None
+    return _array_values(src, source)
+
+
+def _typed_domain(src, name, file_props):
+    values = file_props.get(name)
+    if values:
+        return sorted(values), "type"
+    values = project_domains().get(name)
+    if values:
+        return sorted(values), "project type"
+    return None, None
+
+
+def expression_domain(src, masked, pos, expr, file_props):
+    """``(values, source)`` for a ``${expr}`` substitution at ``pos``."""
+    expr = expr.strip()
+    if not re.fullmatch(rf"{_IDENT}(?:\??\.{_IDENT})*", expr):
+        return None, "expression"
+    name = re.split(r"\??\.", expr)[-1]
+    if "." not in expr:
+        values = _loop_domain(src, masked, src[:pos], expr)
+        if values:
+            return values, "loop"
+        values, complete = _parameter_values(src, masked, expr)
+        if values:
+            return values, "arguments" if complete else "project arguments"
+    return _typed_domain(src, name, file_props)
+
+
+def _call_arguments(src, masked, function, index, skip=None):
+    """``(literals, complete)`` passed at ``index`` in calls of ``function``.
+
+    ``complete`` is False when some call passes something other than a
+    string literal there; a call leaving the argument out is fine (the
+    default applies).
+    """
+    found = []
+    complete = True
+    for call in re.finditer(rf"(?<![\w$.]){re.escape(function)}\s*\(", masked):
+        if skip is not None and call.start() <= skip <= call.end():
+            continue
+        end = match_bracket(masked, call.end() - 1)
+        if end is None:
+            continue
+        args = split_args(src, call.end() - 1, end - 1)
+        if index < len(args):
+            value = string_value(src[slice(*args[index])])
+            if value is None:
+                complete = False
+            else:
+                found.append(value)
+    return found, complete
+
+
+def _parameter_values(src, masked, name):
+    """``(literals, complete)`` for parameter ``name`` of a function in the file.
+
+    The literals are its default value and the literal arguments passed for
+    it; calls are searched in the file and, for an exported function, in
+    the rest of client/src.
+    """
+    declaration = re.compile(
+        rf"(export\s+)?(?:function\s+({_IDENT})\s*\(|\b(?:const|let)\s+({_IDENT})\s*=\s*(?:async\s*)?\()")
+    for match in declaration.finditer(masked):
+        function = match.group(2) or match.group(3)
+        close = match_bracket(masked, match.end() - 1)
+        if close is None:
+            continue
+        params = split_args(masked, match.end() - 1, close - 1)
+        names = [masked[a:b].split(":")[0].split("=")[0].strip() for a, b in params]
+        if name not in names:
+            continue
+        index = names.index(name)
+        found = []
+        default = re.search(r"=\s*(['\"].*)$", src[slice(*params[index])], re.S)
+        if default:
+            found += _literals(default.group(1))[:1]
+        values, complete = _call_arguments(src, masked, function, index, skip=match.end())
+        found += values
+        if match.group(1):
+            for path in tokencache.iter_sources(CLIENT_SRC):
+                other, tokens = tokencache.load(path)
+                if other == src or f"{function}(" not in other:
+                    continue
+                values, others_complete = _call_arguments(
+                    other, code_mask(other, tokens), function, index)
+                found += values
+                complete = complete and others_complete
+        return list(dict.fromkeys(found)), complete
+    return [], False
+
+
+def variable_domain(src, masked, expr):
+    """``(keys, source)`` for a ``t(expr)`` call whose key is not a literal."""
+    expr = expr.strip()
+    lookup = re.fullmatch(rf"({_IDENT})\[.*\]", expr, re.S)
+    if lookup:
+        return _object_values(src, masked, lookup.group(1)), "lookup"
+    name = re.split(r"\??\.", expr)[-1]
+    if not re.fullmatch(_IDENT, name):
+        return None, "expression"
+    if "." not in expr:
+        alias = re.search(rf"\b(?:const|let)\s+{re.escape(name)}\s*=\s*({_IDENT})\[", masked)
+        if alias:
+            return _object_values(src, masked, alias.group(1)), "lookup"
+        values, complete = _parameter_values(src, masked, name)
+        keys = [value for value in values if _KEYLIKE.match(value)]
+        if keys:
+            return keys, "arguments" if complete else "project arguments"
+    found = []
+    for match in re.finditer(rf"\b{re.escape(name)}\s*(?::|=(?![=>]))\s*([^,;\n}}]+)", src):
+        found += [v for v in _literals(match.group(1)) if _KEYLIKE.match(v)]
+    return list(dict.fromkeys(found)) or None, "literals"
+
+
+def _template_parts(body):
+    """Split a template body into literal text and ``${...}`` expressions."""
+    parts = []
+    i = 0
+    while True:
+        start = body.find("${", i)
+        if start < 0:
+            parts.append(("text", body[i:]))
+            return parts
+        parts.append(("text", body[i:start]))
+        depth, j = 1, start + 2
+        while j < len(body) and depth:
+            depth += {"{": 1, "}": -1}.get(body[j], 0)
+            j += 1
+        parts.append(("expr", body[start + 2:j - 1]))
+        i = j
+
+
+def analyze_source(src, tokens, rel):
+    """Return a :class:`Family` for every dynamic ``t()`` call in ``src``."""
+    line_of = line_index(src)
+    file_props = _properties(src, _unions(src))
+    masked = code_mask(src, tokens)
+    families = []
+    for kind, start, end, value in tokens:
+        if kind != T_CALL or value is not None:
+            continue
+        open_paren = src.index("(", start)
+        if src[end - 1:end] != ")":
+            continue
+        args = split_args(src, open_paren, end - 1)
+        if not args:
+            continue
+        arg_start, arg_end = args[0]
+        arg = src[arg_start:arg_end]
+        line = line_of(start)
+        if arg.startswith("`") and arg.endswith("`"):
+            parts = _template_parts(arg[1:-1])
+            domains, sources = [], []
+            for kind, text in parts:
+                if kind == "text":
+                    domains.append([text])
+                    continue
+                values, source = expression_domain(src, masked, arg_start, text, file_props)
+                domains.append(values)
+                sources.append(source if values else "open")
+            pattern = "".join(d[0] if k == "text" else "*" for (k, _), d in
+                              zip(parts, [d or ["*"] for d in domains]))
+            if all(domains):
+                keys = tuple("".join(combo) for combo in product(*domains))
+                families.append(Family(rel, line, pattern, keys, "+".join(sources)))
+            else:
+                families.append(Family(rel, line, pattern, (), "open"))
+            continue
+        keys, source = variable_domain(src, masked, arg)
+        families.append(Family(rel, line, "*", tuple(keys or ()), source if keys else "unbounded"))
+    return families
+
+
+def analyze_file(path):
+    src, tokens = tokencache.load(path)
+    if not any(kind == T_CALL and value is None for kind, _, _, value in tokens):
+        return []
+    from .scan import _relative
+
+    return analyze_source(src, tokens, _relative(path))
+
+
+def glob_regex(pattern):
+    """Compile a family pattern; ``*`` matches any run of characters."""
+    return re.compile("".join(".*" if part == "*" else re.escape(part)
+                              for part in re.split(r"(\*)", pattern)) + r"\Z")
+
+
+def add_arguments(parser):
+    parser.add_argument("paths", nargs="*", help="files (default: all of client/src)")
+    parser.add_argument("--open", action="store_true",
+                        help="only list calls not resolved to an exact key set")
+
+
+def run(args, session=None):
+    paths = [Path(p) for p in args.paths] or list(tokencache.iter_sources(CLIENT_SRC))
+    families = []
+    with profiling.phase("dynkeys"):
+        for path in paths:
+            families += analyze_file(path)
+    for family in families:
+        if args.open and family.exact:
+            continue
+        domain = f"{len(family.keys)} keys" if family.keys else "open"
+        print(f"  {family.rel}:{family.line}: {family.pattern}  [{domain}; {family.source}]")
+    exact = sum(1 for f in families if f.exact)
+    unbounded = sum(1 for f in families if f.unbounded)
+    print(f"{len(families)} dynamic calls: {exact} resolved to exact key sets, "
+          f"{len(families) - exact - unbounded} reach a key prefix, {unbounded} unbounded")
+    return families
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, "dynkeys"):
+        run(args)
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
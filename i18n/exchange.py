@@ -0,0 +1,133 @@
+"""Shared pieces of the vendor exchange formats (XLIFF and PO).
+
+Both formats are exported from a single walk over the English tree and carry
+the same metadata per key: the dotted key, the English source, the Arabic
+reference translation, an optional translator note and the ``{{...}}``
+interpolation placeholders.
+"""
+
+import re
+
+from .paths import LANGUAGES, LOCALES_DIR, REFERENCE_LANG, SOURCE_LANG
+from .store import dotted, get_path, iter_leaves, load_locale, write_locale
+
+# Languages sent to translation vendors: everything except en and ar.
+VENDOR_LANGUAGES = [lang for lang in LANGUAGES if lang not in (SOURCE_LANG, REFERENCE_LANG)]
+
+PLACEHOLDER = re.compile(r"\{\{\s*[^{}]+?\s*\}\}")
+
+PLURAL_SUFFIXES = ("zero", "one", "two", "few", "many", "other")
+
+# gettext Plural-Forms header and the matching i18next suffixes, in msgstr order.
+_TWO_FORMS = ("nplurals=2; plural=(n != 1);", ("one", "other"))
+_ZERO_ONE_FORMS = ("nplurals=2; plural=(n > 1);", ("one", "other"))
+_ONE_FORM = ("nplurals=1; plural=0;", ("other",))
+PLURAL_FORMS = {
+    "ar": (
+        "nplurals=6; plural=(n==0 ? 0 : n==1 ? 1 : n==2 ? 2 : "
+        "n%100>=3 && n%100<=10 ? 3 : n%100>=11 ? 4 : 5);",
+        ("zero", "one", "two", "few", "many", "other"),
+    ),
+    "ru": (
+        "nplurals=3; plural=(n%10==1 && n%100!=11 ? 0 : n%10>=2 && n%10<=4 && "
+        "(n%100<10 || n%100>=20) ? 1 : 2);",
+        ("one", "few", "many"),
+    ),
+    "fr": _ZERO_ONE_FORMS,
+    "pt": _ZERO_ONE_FORMS,
+    "hi": _ZERO_ONE_FORMS,
+    "bn": _ZERO_ONE_FORMS,
+    "tl": _ZERO_ONE_FORMS,
+    "zh": _ONE_FORM,
+    "ja": _ONE_FORM,
+    "ko": _ONE_FORM,
+    "id": _ONE_FORM,
+    "ms": _ONE_FORM,
+}
+
+
+def plural_forms(lang):
+    return PLURAL_FORMS.get(lang, _TWO_FORMS)
+
+
+def placeholders(text):
+    if not isinstance(text, str):
+        return []
+    return list(dict.fromkeys(PLACEHOLDER.findall(text)))
+
+
+def plural_split(path):
+    """Return ``(base_path, category)`` for ``key_one``-style leaves, else None."""
+    base, sep, suffix = path[-1].rpartition("_")
+    if sep and base and suffix in PLURAL_SUFFIXES:
+        return path[:-1] + (base,), suffix
+    return None
+
+
+class KeyResolver:
+    """Maps exported dotted keys back to key paths.
+
+    Keys may contain dots, so the English tree is the authority; anything it
+    does not know is split on dots.
+    """
+
+    def __init__(self, source_tree):
+        self._paths = {dotted(path): path for path, _ in iter_leaves(source_tree)}
+
+    def resolve(self, key):
+        return self._paths.get(key) or tuple(key.split("."))
+
+
+def source_rows(source_tree, reference_tree=None, notes=None):
+    """Yield ``(path, source, reference, note)`` for every English leaf."""
+    reference = dict(iter_leaves(reference_tree)) if reference_tree else {}
+    notes = notes or {}
+    for path, value in iter_leaves(source_tree):
+        yield path, value, reference.get(path), notes.get(dotted(path))
+
+
+def set_path(tree, path, value):
+    node = tree
+    for part in path[:-1]:
+        child = node.get(part)
+        if not isinstance(child, dict):
+            child = node[part] = {}
+        node = child
+    node[path[-1]] = value
+
+
+def merge_items(targets, current):
+    """A list value from per-item ``targets`` (None: not translated).
+
+    Untranslated items keep the locale's ``current`` ones; if one has no
+    current item either, None: the list is left as it is rather than given
+    empty items.
+    """
+    current = current if isinstance(current, list) else []
+    merged = []
+    for i, target in enumerate(targets):
+        if not target:
+            target = current[i] if i < len(current) else None
+            if not target:
+                return None
+        merged.append(target)
+    return merged
+
+
+def apply_translations(lang, items, locales_dir=LOCALES_DIR):
+    """Write ``(path, value)`` pairs into a locale file; returns the count.
+
+    A list value may hold None for untranslated items (see :func:`merge_items`).
+    """
+    tree = load_locale(lang, locales_dir)
+    count = 0
+    for path, value in items:
+        if isinstance(value, list):
+            value = merge_items(value, get_path(tree, path))
+            if value is None:
+                continue
+        set_path(tree, path, value)
+        count += 1
+    if count:
+        write_locale(lang, tree, locales_dir)
+    return count
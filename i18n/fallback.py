@@ -0,0 +1,108 @@
+"""Materialize each locale's fallback chain at build time.
+
+Most translations hold about half of English's keys and i18n.ts sets
+``fallbackLng: 'en'``, so every untranslated key costs a miss in the
+user's language, a second lookup in English, and English shipped to every
+user. :func:`resolve` computes a language's effective table instead:
+
+* each English key takes the first value along the language's chain -
+  the language itself, then any regional fallbacks (``ur`` -> ``ar`` with
+  ``--chain ur:ar``), then English;
+* keys only the language has (no English counterpart) are kept;
+* plural keys get every category the language needs (``exchange.plural_forms``):
+  a category the chain does not have takes the ``_other`` form found, so
+  i18next's plural resolution never misses either.
+
+Alongside the table, :func:`resolve` reports where each key came from: the
+coverage map lists, per fallback language, the keys taken from it (keys
+not listed are translated). ``i18n bundle --resolve`` writes both, so the
+runtime can load one complete table per language with fallback turned off.
+
+Usage: python -m i18n bundle --resolve [--chain LANG:FALLBACK ...] [lang ...]
+"""
+
+from .exchange import plural_forms, plural_split
+from .model import leaves
+from .paths import SOURCE_LANG
+from .store import dotted, unflatten
+
+
+def parse_chains(specs):
+    """``{"ur": ["ar"]}`` from ``["ur:ar", ...]`` (``ur:ar,fa`` for several)."""
+    chains = {}
+    for spec in specs or ():
+        lang, sep, rest = spec.partition(":")
+        if not sep or not lang or not rest:
+            raise ValueError(f"bad fallback chain {spec!r} (expected LANG:FALLBACK[,FALLBACK...])")
+        chains[lang] = [fallback for fallback in rest.split(",") if fallback]
+    return chains
+
+
+def chain_of(lang, chains):
+    """The languages searched for ``lang``, in order, ending with English."""
+    chain = [lang]
+    for fallback in chains.get(lang, ()):
+        if fallback not in chain and fallback != SOURCE_LANG:
+            chain.append(fallback)
+    if SOURCE_LANG not in chain:
+        chain.append(SOURCE_LANG)
+    return chain
+
+
+def _plural_fill(lang, cells, sources):
+    """Add the plural categories ``lang`` needs that no locale supplied."""
+    categories = plural_forms(lang)[1]
+    bases = {}
+    for path in cells:
+        plural = plural_split(path)
+        if plural is not None:
+            bases.setdefault(plural[0], {})[plural[1]] = path
+    for base, forms in bases.items():
+        other = forms.get("other") or next(iter(forms.values()))
+        for category in categories:
+            if category not in forms:
+                path = base[:-1] + (f"{base[-1]}_{category}",)
+                cells[path] = cells[other]
+                sources[path] = sources[other]
+
+
+def resolve(lang, locales, chains=None):
+    """Return ``(tree, coverage)`` for ``lang``.
+
+    ``locales`` maps languages to trees or :class:`i18n.model.Locale`
+    objects and must hold every language of the chain. ``coverage`` is
+    ``{"chain": [...], "keys": n, "fallback": {lang: [dotted keys]}}``.
+    """
+    chain = chain_of(lang, chains or {})
+    tables = {}
+    for source in chain:
+        tables[source] = dict(leaves(locales[source])) if source in locales else {}
+    cells = {}
+    sources = {}
+    # English's order first, then what only the language has.
+    order = list(tables[SOURCE_LANG])
+    order += [path for path in tables[lang] if path not in tables[SOURCE_LANG]]
+    for path in order:
+        for source in chain:
+            value = tables[source].get(path)
+            if value is not None:
+                cells[path] = value
+                sources[path] = source
+                break
+    _plural_fill(lang, cells, sources)
+
+    # A key that is a namespace in one locale and a text in another cannot
+    # be placed both ways; the language's own shape wins, then the first.
+    own = {path[:i] for path in cells if sources[path] == lang for i in range(1, len(path))}
+    placed = {}
+    for path, value in cells.items():
+        if sources[path] != lang and (
+                path in own or any(path[:i] in placed for i in range(1, len(path)))):
+            continue
+        placed[path] = value
+    fallback = {source: [] for source in chain[1:]}
+    for path in placed:
+        if sources[path] != lang:
+            fallback[sources[path]].append(dotted(path))
+    coverage = {"chain": chain, "keys": len(placed), "fallback": fallback}
+    return unflatten(placed.items()), coverage
@@ -0,0 +1,198 @@
+"""Build per-locale source variants with static t() calls inlined.
+
+Almost every ``t()`` call in client/src takes a literal key and nothing
+else, yet each one does a nested-path lookup in a resource tree holding all
+17 languages at runtime. For each locale this stage writes:
+
+* ``<out>/<lang>/src/...`` - every source file that had something to
+  inline, with ``t('common.save')`` replaced by the string literal
+  ``"Save"`` (or the locale's text). It is an overlay: files not listed
+  are used unchanged from client/src;
+* ``<out>/<lang>/translation.json`` - the locale's tree with English
+  filled in where it has no value, the only resource i18next needs for the
+  calls that stay dynamic;
+* ``<out>/<lang>/src/lib/locale-resources.ts`` - in place of the module
+  that loads every locale, one importing just that resource and pinning
+  the language, so a locale build carries its own strings only.
+
+A call is inlined only when it is ``t('key')`` / ``i18n.t('key')`` with no
+options, and the key is a plain string leaf (in the locale, or in English
+as i18next's ``fallbackLng`` would give) without ``{{interpolation}}`` or
+``$t()`` nesting. Everything else - options, plurals, object values,
+template keys, missing keys - is left as a ``t()`` call.
+
+The overlay is built with Vite; with ``I18N_LOCALE`` set, ``vite.config.ts``
+loads each client/src file from ``dist/inline/<lang>/src`` when the overlay
+has it, and writes the build to ``dist/inline/<lang>/public``::
+
+    python -m i18n inline ar && I18N_LOCALE=ar npx vite build
+
+Usage: python -m i18n.inline [--out dist/inline] [--jobs N] [lang ...]
+"""
+
+import argparse
+import copy
+import json
+import os
+import shutil
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from . import profiling, tokencache
+from .codemod import apply_edits
+from .lexer import T_CALL, split_args
+from .paths import CLIENT_SRC, LANGUAGES, ROOT, SOURCE_LANG
+from .scan import _PLURAL_SUFFIXES
+from .session import Session
+from .store import deep_merge, dump_locale, get_path
+
+DEFAULT_OUT = ROOT / "dist" / "inline"
+RESOURCES_MODULE = CLIENT_SRC / "lib" / "locale-resources.ts"
+_I18N_PREFIX = "i18n."
+
+
+def plan_source(src, tokens):
+    """Return ``[(start, end, key)]`` for calls that may be inlined."""
+    calls = []
+    for kind, start, end, key in tokens:
+        if kind != T_CALL or key is None or src[end - 1:end] != ")":
+            continue
+        open_paren = src.index("(", start)
+        if len(split_args(src, open_paren, end - 1)) != 1:
+            continue
+        if src[max(0, start - len(_I18N_PREFIX)):start] == _I18N_PREFIX:
+            start -= len(_I18N_PREFIX)
+        calls.append((start, end, key))
+    return calls
+
+
+def plan_file(path):
+    src, tokens = tokencache.load(path)
+    return str(path), src, plan_source(src, tokens)
+
+
+def inline_value(tree, source_tree, key):
+    """The text to inline for ``key``, or ``(None, reason)``."""
+    path = tuple(key.split("."))
+    value = get_path(tree, path)
+    if value is None:
+        value = get_path(source_tree, path)
+    if value is None:
+        plural = [path[:-1] + (path[-1] + suffix,) for suffix in _PLURAL_SUFFIXES]
+        if any(get_path(t, p) is not None for t in (tree, source_tree) for p in plural):
+            return None, "plural"
+        return None, "missing"
+    if not isinstance(value, str):
+        return None, "not a string"
+    if "{{" in value or "$t(" in value:
+        return None, "interpolation"
+    return value, None
+
+
+def _literal(value):
+    return json.dumps(value, ensure_ascii=False)
+
+
+def resources_source(lang, resource):
+    """``lib/locale-resources.ts`` for a build of ``lang`` alone.
+
+    ``resource`` is the path of its translation.json relative to client/src/lib:
+    Vite serves the overlay file in place of the original one.
+    """
+    return (
+        f"// Generated by `python -m i18n inline` for {lang}. Do not edit.\n"
+        f"import translation from {_literal(resource)};\n"
+        "\n"
+        "export function loadResources(_codes: string[]) {\n"
+        f"  return {{ {_literal(lang)}: {{ translation }} }};\n"
+        "}\n"
+        "\n"
+        f"export const pinnedLanguage: string | undefined = {_literal(lang)};\n"
+    )
+
+
+def build_locale(lang, plans, trees, out):
+    """Write one locale's overlay; returns ``(files, inlined, kept_reasons)``."""
+    source_tree = trees[SOURCE_LANG]
+    tree = trees.get(lang, {})
+    lang_dir = Path(out) / lang
+    # Files that no longer inline anything must not shadow client/src.
+    shutil.rmtree(lang_dir / "src", ignore_errors=True)
+    cache = {}
+    inlined = 0
+    kept = Counter()
+    files = 0
+    for path, src, calls in plans:
+        edits = []
+        for start, end, key in calls:
+            if key not in cache:
+                cache[key] = inline_value(tree, source_tree, key)
+            value, reason = cache[key]
+            if value is None:
+                kept[reason] += 1
+                continue
+            edits.append((start, end, _literal(value)))
+        if not edits:
+            continue
+        target = lang_dir / "src" / Path(path).relative_to(CLIENT_SRC)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with profiling.phase("inline", target):
+            target.write_text(apply_edits(src, edits), encoding="utf-8")
+        inlined += len(edits)
+        files += 1
+    resource = deep_merge(tree, copy.deepcopy(source_tree)) if lang != SOURCE_LANG else tree
+    with profiling.phase("write", lang_dir / "translation.json"):
+        (lang_dir / "translation.json").write_text(dump_locale(resource), encoding="utf-8")
+
+    module = lang_dir / "src" / RESOURCES_MODULE.relative_to(CLIENT_SRC)
+    module.parent.mkdir(parents=True, exist_ok=True)
+    relative = Path(os.path.relpath(lang_dir.resolve() / "translation.json", RESOURCES_MODULE.parent))
+    with profiling.phase("write", module):
+        module.write_text(resources_source(lang, relative.as_posix()), encoding="utf-8")
+    return files, inlined, kept
+
+
+def add_arguments(parser):
+    parser.add_argument("langs", nargs="*", help="languages (default: all)")
+    parser.add_argument("--out", default=DEFAULT_OUT, help="output directory")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes for lexing")
+
+
+def run(args, session):
+    paths = list(tokencache.iter_sources(CLIENT_SRC))
+    tokencache.warm(paths, args.jobs)
+    with profiling.phase("plan"):
+        if args.jobs == 1:
+            plans = [plan_file(p) for p in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+                plans = list(pool.map(plan_file, paths, chunksize=16))
+    plans = [plan for plan in plans if plan[2]]
+    calls = sum(len(plan[2]) for plan in plans)
+    print(f"{calls} static t() calls without options in {len(plans)} files")
+
+    langs = args.langs or LANGUAGES
+    trees = session.trees(list(dict.fromkeys([SOURCE_LANG, *langs])))
+    for lang in langs:
+        files, inlined, kept = build_locale(lang, plans, trees, args.out)
+        reasons = ", ".join(f"{n} {reason}" for reason, n in kept.most_common())
+        print(f"  {lang}: inlined {inlined} calls in {files} files"
+              + (f"; kept {reasons}" if reasons else ""))
+    print(f"Wrote {len(langs)} locale overlays to {args.out}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, "inline"):
+        run(args, Session())
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""Streaming JSON tokenizer that keeps byte offsets.
+
+``json.load`` forgets where things are in the file; tools that work from a
+diff or report a location need the byte span of each key. This tokenizer
+walks the raw UTF-8 bytes once and yields one :class:`Leaf` per leaf in
+document order, with the same leaf rule as :func:`i18n.store.iter_leaves`
+(objects nest, everything else, including the ``points`` arrays, is a leaf).
+Values are decoded only when asked for.
+
+    >>> [(leaf.path, leaf.value) for leaf in leaves(b'{"a": {"b": "x"}}')]
+    [(('a', 'b'), 'x')]
+"""
+
+import bisect
+import json
+import re
+from typing import NamedTuple
+
+_WS = re.compile(rb"[ \t\r\n]*")
+_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"', re.S)
+_SCALAR = re.compile(rb"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null")
+
+
+class Leaf(NamedTuple):
+    """``start`` is the opening quote of the key, ``end`` the end of the value."""
+
+    path: tuple
+    start: int
+    value_start: int
+    end: int
+    data: bytes
+
+    @property
+    def value(self):
+        return json.loads(self.data[self.value_start:self.end])
+
+
+class JSONSyntaxError(ValueError):
+    def __init__(self, message, pos):
+        super().__init__(f"{message} at byte {pos}")
+        self.pos = pos
+
+
+def _skip(data, pos):
+    return _WS.match(data, pos).end()
+
+
+def _string(data, pos):
+    match = _STRING.match(data, pos)
+    if match is None:
+        raise JSONSyntaxError("expected a string", pos)
+    return match.end()
+
+
+def _skip_value(data, pos):
+    """Return the end of the value starting at ``pos`` (arrays and objects whole)."""
+    first = data[pos:pos + 1]
+    if first == b'"':
+        return _string(data, pos)
+    if first not in (b"[", b"{"):
+        match = _SCALAR.match(data, pos)
+        if match is None:
+            raise JSONSyntaxError("expected a value", pos)
+        return match.end()
+    depth = 0
+    while pos < len(data):
+        char = data[pos:pos + 1]
+        if char == b'"':
+            pos = _string(data, pos)
+            continue
+        if char in (b"[", b"{"):
+            depth += 1
+        elif char in (b"]", b"}"):
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+        pos += 1
+    raise JSONSyntaxError("unterminated value", pos)
+
+
+def leaves(data):
+    """Yield a :class:`Leaf` for every leaf of the JSON object in ``data``."""
+    pos = _skip(data, 0)
+    if data[pos:pos + 1] != b"{":
+        raise JSONSyntaxError("expected an object", pos)
+    pos += 1
+    path = []
+    while True:
+        pos = _skip(data, pos)
+        char = data[pos:pos + 1]
+        if char == b"}":
+            pos += 1
+            if not path:
+                return
+            path.pop()
+            pos = _skip(data, pos)
+            if data[pos:pos + 1] == b",":
+                pos += 1
+            continue
+        if char == b",":
+            pos += 1
+            continue
+        key_start = pos
+        pos = _string(data, pos)
+        key = json.loads(data[key_start:pos])
+        pos = _skip(data, pos)
+        if data[pos:pos + 1] != b":":
+            raise JSONSyntaxError("expected ':'", pos)
+        pos = _skip(data, pos + 1)
+        if data[pos:pos + 1] == b"{":
+            path.append(key)
+            pos += 1
+            continue
+        end = _skip_value(data, pos)
+        yield Leaf((*path, key), key_start, pos, end, data)
+        pos = end
+
+
+def line_starts(data):
+    """Byte offset of the start of every line (1-based line n is index n - 1)."""
+    starts = [0]
+    pos = data.find(b"\n")
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = data.find(b"\n", pos + 1)
+    return starts
+
+
+def byte_range(starts, first_line, last_line, size):
+    """Byte span ``[start, end)`` covering 1-based lines ``first_line..last_line``."""
+    start = starts[min(first_line, len(starts)) - 1]
+    end = starts[last_line] if last_line < len(starts) else size
+    return start, end
+
+
+def overlapping(spans, ranges):
+    """Return leaves from ``spans`` (sorted by start) that overlap any byte range."""
+    starts = [leaf.start for leaf in spans]
+    hit = {}
+    for start, end in ranges:
+        i = max(bisect.bisect_right(starts, start) - 1, 0)
+        while i < len(spans) and spans[i].start < end:
+            if spans[i].end > start:
+                hit[spans[i].path] = spans[i]
+            i += 1
+    return list(hit.values())
@@ -0,0 +1,200 @@
+"""Generate TypeScript key types and key constants from the English locale.
+
+Nothing checks a key until i18next misses it at runtime and falls back to
+the key itself. This writes two files under ``client/src/lib/generated/``:
+
+* ``i18n-keys.d.ts`` - ``TranslationKey``, the union of every English key
+  (plural forms under their base key, as ``t()`` is called), and
+  ``TranslationParams``, the ``{{...}}`` interpolation values each key takes
+  (``count: number`` for plurals, ``string | number`` otherwise), with
+  ``TranslationParamsOf<K>``. ``useTypedTranslation``
+  (``client/src/hooks/useTypedTranslation.ts``) types ``t`` with them, so a
+  page using it gets a compile error for a key English lacks;
+* ``i18n-key-names.ts`` - one ``export const`` per key name
+  (``reports__tax__title = "reports.tax.title"``) for code that passes keys
+  around (column and status maps); a name that does not exist is a compile
+  error. These are key names, not texts: the locales are still imported
+  whole by ``client/src/lib/i18n.ts``, and tree-shaking this module drops
+  nothing from them.
+
+i18next's ``t`` is not typed globally (``CustomTypeOptions``): client/src
+still calls keys missing from English (see ``i18n status``) and builds
+others at runtime, and would not compile. Pages move to the typed hook once
+the keys they use exist.
+
+Both files start with a fingerprint of the key set and the parameters. A
+run whose fingerprint matches the files on disk writes nothing, so editing
+an English text does not touch them (nor invalidate ``tsc --incremental``
+or the dev server); only adding, removing or re-parameterizing keys does.
+``--check`` exits with 1 when the files are out of date, for CI, and
+``i18n watch --types`` regenerates them whenever en changes.
+
+Usage: python -m i18n.keytypes [--out DIR] [--check]
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+from . import profiling
+from .exchange import placeholders, plural_split
+from .paths import CLIENT_SRC, SOURCE_LANG
+from .session import Session
+from .store import dotted, iter_leaves
+
+DEFAULT_OUT = CLIENT_SRC / "lib" / "generated"
+TYPES_FILE = "i18n-keys.d.ts"
+CONSTANTS_FILE = "i18n-key-names.ts"
+FORMAT_VERSION = 2
+
+_IDENTIFIER_CHARS = re.compile(r"[^A-Za-z0-9_$]")
+_FINGERPRINT = re.compile(r"^// fingerprint: ([0-9a-f]+)$", re.M)
+
+
+def _param_name(placeholder):
+    # {{name}}, {{name, format}}, {{- name}} (unescaped)
+    return placeholder[2:-2].split(",", 1)[0].strip().lstrip("-").strip()
+
+
+def key_params(tree):
+    """``{dotted key: {param: ts type}}`` in document order, plurals merged."""
+    keys = {}
+    for path, value in iter_leaves(tree):
+        plural = plural_split(path)
+        if plural is not None:
+            path = plural[0]
+        params = keys.setdefault(dotted(path), {})
+        if plural is not None:
+            params["count"] = "number"
+        for placeholder in placeholders(value):
+            name = _param_name(placeholder)
+            if name:
+                params.setdefault(name, "number" if name == "count" else "string | number")
+    return keys
+
+
+def fingerprint(keys):
+    digest = hashlib.sha1(f"v{FORMAT_VERSION}".encode())
+    for key, params in keys.items():
+        digest.update(json.dumps([key, params], ensure_ascii=False).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def identifiers(keys):
+    """A distinct JavaScript identifier per key (segments joined by ``__``)."""
+    names = {}
+    taken = set()
+    for key in keys:
+        name = "__".join(_IDENTIFIER_CHARS.sub("_", part) for part in key.split("."))
+        if name[0].isdigit():
+            name = "_" + name
+        candidate, n = name, 2
+        while candidate in taken:
+            candidate, n = f"{name}_{n}", n + 1
+        taken.add(candidate)
+        names[key] = candidate
+    return names
+
+
+def _literal(text):
+    return json.dumps(text, ensure_ascii=False)
+
+
+def _property(name):
+    return name if re.fullmatch(r"[A-Za-z_$][\w$]*", name) else _literal(name)
+
+
+def render_types(keys, stamp):
+    lines = [
+        f"// fingerprint: {stamp}",
+        f"// Generated by `python -m i18n keytypes` from locales/{SOURCE_LANG}. Do not edit.",
+        "",
+        "export type TranslationKey =",
+    ]
+    lines += [f"  | {_literal(key)}" for key in keys]
+    lines[-1] += ";"
+    lines += ["", "export interface TranslationParams {"]
+    for key, params in keys.items():
+        if params:
+            fields = "; ".join(f"{_property(name)}: {kind}" for name, kind in params.items())
+            lines.append(f"  {_literal(key)}: {{ {fields} }};")
+    lines += [
+        "}",
+        "",
+        "export type TranslationParamsOf<K extends TranslationKey> =",
+        "  K extends keyof TranslationParams ? TranslationParams[K] : Record<string, never>;",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def render_constants(keys, stamp):
+    lines = [
+        f"// fingerprint: {stamp}",
+        f"// Generated by `python -m i18n keytypes` from locales/{SOURCE_LANG}. Do not edit.",
+        "// Key names, not texts: referencing a key English lacks fails to compile.",
+        "",
+    ]
+    lines += [f"export const {name} = {_literal(key)};" for key, name in identifiers(keys).items()]
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _stamp_of(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            match = _FINGERPRINT.match(f.readline())
+    except OSError:
+        return None
+    return match.group(1) if match else None
+
+
+def generate(tree, out=DEFAULT_OUT, check=False):
+    """Write the files if the key set changed; returns ``(stamp, stale files, keys)``."""
+    out = Path(out)
+    keys = key_params(tree)
+    stamp = fingerprint(keys)
+    files = {out / TYPES_FILE: render_types, out / CONSTANTS_FILE: render_constants}
+    stale = [path for path in files if _stamp_of(path) != stamp]
+    if stale and not check:
+        out.mkdir(parents=True, exist_ok=True)
+        for path in stale:
+            with profiling.phase("write", path):
+                path.write_text(files[path](keys, stamp), encoding="utf-8")
+    return stamp, stale, len(keys)
+
+
+def add_arguments(parser):
+    parser.add_argument("--out", default=DEFAULT_OUT, help="output directory")
+    parser.add_argument("--check", action="store_true",
+                        help="only report whether the files are current; exit 1 if not")
+
+
+def run(args, session):
+    with profiling.phase("keytypes"):
+        stamp, stale, count = generate(session.tree(SOURCE_LANG), args.out, args.check)
+    if not stale:
+        print(f"{count} keys; {args.out} is up to date ({stamp[:12]})")
+    elif args.check:
+        raise SystemExit(f"keytypes: {args.out} is out of date; run 'python -m i18n keytypes'")
+    else:
+        print(f"{count} keys; wrote {', '.join(p.name for p in stale)} ({stamp[:12]})")
+    return stale
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, "keytypes"):
+        run(args, Session())
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,271 @@
+"""Pre-render the legal pages into per-locale HTML fragments.
+
+The Terms, Privacy and Disclaimer pages are long-form documents - hundreds
+of paragraphs, ``items`` lists and inline ``<strong>`` - that used to live in
+translation.json, so every user downloaded and parsed all three in every
+language at startup. They are kept as per-locale source documents instead::
+
+    client/content/legal/<lang>/<document>.json    the page's former subtree
+
+``i18n legal extract`` moves the ``termsPage``, ``privacyPage`` and
+``disclaimerPage`` namespaces out of the locales into those files (merging
+into a document that already exists), so text added with ``i18n merge``
+can be moved the same way.
+
+``i18n legal build`` renders every document into ``client/public/legal``
+(copied into ``dist/public/legal`` by ``vite build``):
+
+* each language's document is completed from English key by key
+  (:func:`i18n.fallback.resolve`);
+* every text is escaped, and only the inline tags in ``ALLOWED_TAGS`` are
+  kept, without attributes, so a fragment is safe to inject as HTML;
+* the result is written as ``<document>.<lang>.<hash>.json``, named after
+  its content, so it can be cached forever;
+* ``manifest.json`` maps documents and languages to files; a language with
+  no document of its own uses English's.
+
+The pages fetch the manifest and their one document when they open
+(``client/src/hooks/useLegalDocument.tsx``). The manifest also records a
+digest of each fragment's sources; a build re-renders only the fragments
+whose sources changed and removes files no longer referenced.
+
+Usage: python -m i18n.legal [extract|build] [--out DIR] [--force] [lang ...]
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import re
+import sys
+from pathlib import Path
+
+from . import profiling
+from .fallback import resolve
+from .model import leaves
+from .paths import LANGUAGES, LEGAL_DIR, ROOT, SOURCE_LANG, locale_exists
+from .session import Session
+from .store import dotted, dump_locale, unflatten
+
+DEFAULT_OUT = ROOT / "client" / "public" / "legal"
+MANIFEST = "manifest.json"
+RENDER_VERSION = 1
+
+# document -> the namespace it replaces in translation.json
+DOCUMENTS = {
+    "terms": "termsPage",
+    "privacy": "privacyPage",
+    "disclaimer": "disclaimerPage",
+}
+ALLOWED_TAGS = frozenset({"strong", "em", "b", "i", "br"})
+VOID_TAGS = frozenset({"br"})
+
+_MARKUP = re.compile(r"<[^<>]*>")
+_TAG = re.compile(r"<(/?)([A-Za-z]+)\b[^>]*>")
+
+
+class LegalError(ValueError):
+    pass
+
+
+def source_path(document, lang, legal_dir=LEGAL_DIR):
+    return Path(legal_dir) / lang / f"{document}.json"
+
+
+def sanitize(text, where=""):
+    """``text`` as an HTML fragment: escaped, with only the allowed tags kept.
+
+    Attributes are dropped; any other markup is escaped and so shows as
+    text. Allowed tags must nest properly; ``{{...}}`` placeholders pass
+    through for the page to fill.
+    """
+    out = []
+    stack = []
+    pos = 0
+    for match in _MARKUP.finditer(text):
+        out.append(html.escape(text[pos:match.start()], quote=False))
+        pos = match.end()
+        tag = _TAG.fullmatch(match.group())
+        name = tag.group(2).lower() if tag else None
+        if name not in ALLOWED_TAGS:
+            out.append(html.escape(match.group(), quote=False))
+            continue
+        closing = tag.group(1)
+        if name in VOID_TAGS:
+            out.append(f"<{name}>")
+        elif not closing:
+            stack.append(name)
+            out.append(f"<{name}>")
+        elif stack and stack[-1] == name:
+            stack.pop()
+            out.append(f"</{name}>")
+        else:
+            raise LegalError(f"{where}: unexpected </{name}>")
+    out.append(html.escape(text[pos:], quote=False))
+    if stack:
+        raise LegalError(f"{where}: <{stack[-1]}> is not closed")
+    return "".join(out)
+
+
+def _render_value(value, where):
+    if isinstance(value, str):
+        return sanitize(value, where)
+    if isinstance(value, list):
+        return [_render_value(item, f"{where}[{i}]") for i, item in enumerate(value)]
+    if isinstance(value, dict):
+        return {key: _render_value(item, f"{where}.{key}") for key, item in value.items()}
+    return value
+
+
+def render(document, lang, tree, english):
+    """The fragment of ``lang``'s document as compact JSON bytes."""
+    resolved, _ = resolve(lang, {lang: tree or {}, SOURCE_LANG: english})
+    cells = [(path, _render_value(value, f"{lang}/{document}.json: {dotted(path)}"))
+             for path, value in leaves(resolved)]
+    return json.dumps(unflatten(cells), ensure_ascii=False,
+                      separators=(",", ":")).encode("utf-8")
+
+
+def _read_source(path):
+    try:
+        with profiling.phase("load", path):
+            data = path.read_bytes()
+    except FileNotFoundError:
+        return None, None
+    return data, json.loads(data)
+
+
+def read_manifest(out):
+    try:
+        with open(Path(out) / MANIFEST, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return {}
+    return manifest["documents"] if manifest.get("version") == RENDER_VERSION else {}
+
+
+def build(langs=None, out=DEFAULT_OUT, legal_dir=LEGAL_DIR, force=False):
+    """Render the documents that changed; returns ``(rendered, kept)`` names.
+
+    ``langs`` limits the languages rendered; the others keep their manifest
+    entries.
+    """
+    out = Path(out)
+    previous = read_manifest(out)
+    documents = {}
+    rendered = []
+    kept = []
+    for document in DOCUMENTS:
+        english_data, english = _read_source(source_path(document, SOURCE_LANG, legal_dir))
+        if english is None:
+            raise LegalError(f"{source_path(document, SOURCE_LANG, legal_dir)} does not exist; "
+                             f"run 'python -m i18n legal extract' first")
+        entries = documents[document] = {}
+        for lang in LANGUAGES:
+            data, tree = (english_data, english) if lang == SOURCE_LANG else \
+                _read_source(source_path(document, lang, legal_dir))
+            if data is None:
+                continue
+            entry = previous.get(document, {}).get(lang)
+            if langs and lang not in langs:
+                if entry is not None:
+                    entries[lang] = entry
+                continue
+            digest = hashlib.sha1(f"v{RENDER_VERSION}".encode())
+            digest.update(data)
+            digest.update(english_data)
+            source = digest.hexdigest()
+            if not force and entry is not None and entry["source"] == source \
+                    and (out / entry["file"]).exists():
+                entries[lang] = entry
+                kept.append(entry["file"])
+                continue
+            fragment = render(document, lang, tree, english)
+            name = f"{document}.{lang}.{hashlib.sha1(fragment).hexdigest()[:10]}.json"
+            out.mkdir(parents=True, exist_ok=True)
+            with profiling.phase("write", out / name):
+                (out / name).write_bytes(fragment)
+            entries[lang] = {"file": name, "source": source, "size": len(fragment)}
+            rendered.append(name)
+
+    manifest = {"version": RENDER_VERSION, "documents": documents}
+    text = json.dumps(manifest, indent=2, ensure_ascii=False) + "\n"
+    path = out / MANIFEST
+    if not path.exists() or path.read_text(encoding="utf-8") != text:
+        with profiling.phase("write", path):
+            path.write_text(text, encoding="utf-8")
+    referenced = {entry["file"] for entries in documents.values() for entry in entries.values()}
+    for stale in out.glob("*.json"):
+        if stale.name != MANIFEST and stale.name not in referenced:
+            stale.unlink()
+    return rendered, kept
+
+
+def extract(session, langs=None, legal_dir=LEGAL_DIR):
+    """Move the legal namespaces out of the locales; returns ``{lang: [documents]}``."""
+    moved = {}
+    namespaces = set(DOCUMENTS.values())
+    for lang in langs or LANGUAGES:
+        if not locale_exists(lang, session.locales_dir):
+            continue
+        tree = session.tree(lang, namespaces=namespaces)
+        for document, namespace in DOCUMENTS.items():
+            subtree = tree.get(namespace)
+            if not isinstance(subtree, dict):
+                continue
+            path = source_path(document, lang, legal_dir)
+            _, existing = _read_source(path)
+            if existing is not None:
+                cells = dict(leaves(existing))
+                cells.update(leaves(subtree))
+                subtree = unflatten(cells.items())
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with profiling.phase("write", path):
+                path.write_text(dump_locale(subtree), encoding="utf-8")
+            del tree[namespace]
+            session.mark(lang)
+            moved.setdefault(lang, []).append(document)
+    return moved
+
+
+def add_arguments(parser):
+    parser.add_argument("action", nargs="?", choices=("build", "extract"), default="build",
+                        help="render the fragments (default), or move the legal "
+                             "namespaces out of the locales")
+    parser.add_argument("langs", nargs="*", help="languages (default: all)")
+    parser.add_argument("--out", default=DEFAULT_OUT, help="output directory of the fragments")
+    parser.add_argument("--force", action="store_true", help="re-render every fragment")
+
+
+def run(args, session):
+    try:
+        if args.action == "extract":
+            moved = extract(session, args.langs)
+            for lang, documents in moved.items():
+                print(f"{lang}: moved {', '.join(documents)} to {LEGAL_DIR.relative_to(ROOT)}/{lang}")
+            if not moved:
+                print("No legal namespaces left in the locales")
+            return moved
+        with profiling.phase("legal"):
+            rendered, kept = build(args.langs, args.out, force=args.force)
+    except LegalError as e:
+        raise SystemExit(f"legal: {e}")
+    print(f"Rendered {len(rendered)} fragments, {len(kept)} unchanged, in {args.out}")
+    return rendered
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, "legal"):
+        session = Session()
+        run(args, session)
+        session.flush()
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
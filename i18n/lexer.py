@@ -0,0 +1,465 @@
+"""A small TSX lexer for the localization tools.
+
+It does not build an AST. It walks the source once and reports the spans
+the i18n tools care about:
+
+* ``STRING`` - quoted string literals in code,
+* ``JSX_ATTR`` - quoted string literals inside a ``<Tag ...>``: attribute
+  values (``title="Due date"``),
+* ``TEMPLATE`` - backtick template literals,
+* ``JSX_TEXT`` - text between JSX tags (whitespace-only runs are skipped),
+* ``T_CALL`` - ``t(...)`` / ``i18n.t(...)`` calls; the value is the static
+  key when the first argument is a plain string literal, else ``None``.
+
+Tokens are ``(kind, start, end, value)`` tuples with character offsets into
+the decoded source, in the order they start. String values are the raw
+source between the quotes (escapes are not decoded) so that rewriters can
+splice them back unchanged.
+"""
+
+import bisect
+
+STRING = 1
+TEMPLATE = 2
+JSX_TEXT = 3
+T_CALL = 4
+JSX_ATTR = 5
+KIND_NAMES = {STRING: "string", TEMPLATE: "template", JSX_TEXT: "jsx_text", T_CALL: "t_call",
+              JSX_ATTR: "jsx_attr"}
+
+# Bump when the token format or lexing rules change; cached streams from an
+# older version are ignored.
+LEXER_VERSION = 2
+
+_IDENT_START = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_$")
+_IDENT = _IDENT_START | set("0123456789")
+# After these, `<` opens a JSX element and `/` starts a regex literal.
+_EXPR_START_PUNCT = set("(,=:[!&|?{};+-*%<>~^")
+_EXPR_START_WORDS = {"return", "typeof", "case", "do", "else", "in", "of", "new",
+                     "delete", "void", "throw", "yield", "await", "=>"}
+
+# Stack frames
+_JS = "js"            # plain code inside `{ ... }`
+_EXPR = "expr"        # `{ ... }` embedded in JSX
+_TAG = "tag"          # inside `<Tag ...>`
+_CHILDREN = "children"  # between `<Tag>` and `</Tag>`
+
+
+def _skip_string(src, i, quote):
+    n = len(src)
+    i += 1
+    while i < n:
+        c = src[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == quote or c == "\n":
+            return i + 1
+        i += 1
+    return n
+
+
+def _skip_template(src, i):
+    """Return the index after the closing backtick, skipping ``${...}``."""
+    n = len(src)
+    i += 1
+    while i < n:
+        c = src[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == "`":
+            return i + 1
+        if c == "$" and i + 1 < n and src[i + 1] == "{":
+            i = _skip_braces(src, i + 1)
+            continue
+        i += 1
+    return n
+
+
+def _skip_braces(src, i):
+    """``src[i]`` is ``{``; return the index after the matching ``}``."""
+    n = len(src)
+    depth = 0
+    while i < n:
+        c = src[i]
+        if c in "'\"":
+            i = _skip_string(src, i, c)
+            continue
+        if c == "`":
+            i = _skip_template(src, i)
+            continue
+        if c == "/" and i + 1 < n and src[i + 1] in "/*":
+            i = _skip_comment(src, i)
+            continue
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return n
+
+
+def _skip_comment(src, i):
+    if src[i + 1] == "/":
+        end = src.find("\n", i)
+        return len(src) if end < 0 else end
+    end = src.find("*/", i + 2)
+    return len(src) if end < 0 else end + 2
+
+
+def _skip_regex(src, i):
+    n = len(src)
+    i += 1
+    in_class = False
+    while i < n:
+        c = src[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == "\n":
+            return i
+        if c == "[":
+            in_class = True
+        elif c == "]":
+            in_class = False
+        elif c == "/" and not in_class:
+            i += 1
+            while i < n and src[i] in _IDENT:
+                i += 1
+            return i
+        i += 1
+    return n
+
+
+def lex(src, jsx=True):
+    """Return the token list for a TS/TSX source string."""
+    tokens = []
+    n = len(src)
+    stack = [_JS]
+    # Open parens: index into `tokens` of the T_CALL they belong to, or None.
+    parens = []
+    prev = ""  # last significant token in code mode, for `<` and `/` decisions
+    i = 0
+
+    while i < n:
+        mode = stack[-1]
+
+        if mode == _CHILDREN:
+            j = i
+            while j < n and src[j] not in "<{":
+                j += 1
+            if j > i:
+                text = src[i:j]
+                stripped = text.strip()
+                if stripped:
+                    start = i + text.index(stripped[0])
+                    tokens.append((JSX_TEXT, start, start + len(stripped), stripped))
+            if j >= n:
+                break
+            if src[j] == "{":
+                stack.append(_EXPR)
+                prev = "{"
+                i = j + 1
+            elif src.startswith("</", j):
+                end = src.find(">", j)
+                stack.pop()
+                i = n if end < 0 else end + 1
+                if stack[-1] in (_JS, _EXPR):
+                    prev = ")"
+            else:
+                stack.append(_TAG)
+                i = j + 1
+            continue
+
+        if mode == _TAG:
+            c = src[i]
+            if c in "'\"":
+                end = _skip_string(src, i, c)
+                tokens.append((JSX_ATTR, i, end, src[i + 1:end - 1]))
+                i = end
+            elif c == "{":
+                stack.append(_EXPR)
+                prev = "{"
+                i += 1
+            elif c == "/" and i + 1 < n and src[i + 1] == ">":
+                stack.pop()
+                i += 2
+                if stack[-1] in (_JS, _EXPR):
+                    prev = ")"
+            elif c == ">":
+                stack[-1] = _CHILDREN
+                i += 1
+            else:
+                i += 1
+            continue
+
+        # Code mode (_JS or _EXPR)
+        c = src[i]
+        if c in " \t\r\n":
+            i += 1
+            continue
+        if c == "/" and i + 1 < n and src[i + 1] in "/*":
+            i = _skip_comment(src, i)
+            continue
+        if c in "'\"":
+            end = _skip_string(src, i, c)
+            tokens.append((STRING, i, end, src[i + 1:end - 1]))
+            prev = "str"
+            i = end
+            continue
+        if c == "`":
+            end = _skip_template(src, i)
+            tokens.append((TEMPLATE, i, end, src[i + 1:end - 1]))
+            tokens.extend(_substitution_tokens(src, i, end, jsx))
+            prev = "str"
+            i = end
+            continue
+        if c in _IDENT_START:
+            j = i + 1
+            while j < n and src[j] in _IDENT:
+                j += 1
+            word = src[i:j]
+            k = j
+            while k < n and src[k] in " \t":
+                k += 1
+            if word == "t" and k < n and src[k] == "(" and (i == 0 or src[i - 1] not in _IDENT):
+                before = src[i - 1] if i else ""
+                if before != "." or src[max(0, i - 5):i] == "i18n.":
+                    tokens.append((T_CALL, i, k + 1, _static_key(src, k + 1)))
+                    parens.append(len(tokens) - 1)
+                    prev = "("
+                    i = k + 1
+                    continue
+            prev = word
+            i = j
+            continue
+        if c.isdigit():
+            j = i + 1
+            while j < n and (src[j] in _IDENT or src[j] == "."):
+                j += 1
+            prev = "num"
+            i = j
+            continue
+        if c == "(":
+            parens.append(None)
+        elif c == ")":
+            if parens:
+                owner = parens.pop()
+                if owner is not None:
+                    kind, start, _, key = tokens[owner]
+                    tokens[owner] = (kind, start, i + 1, key)
+        elif c == "{":
+            stack.append(_JS)
+        elif c == "}":
+            if len(stack) > 1:
+                stack.pop()
+            i += 1
+            prev = "}" if stack[-1] in (_JS, _EXPR) else prev
+            continue
+        elif c == "=" and i + 1 < n and src[i + 1] == ">":
+            prev = "=>"
+            i += 2
+            continue
+        elif c == "<" and jsx and _opens_jsx(src, i, prev):
+            stack.append(_TAG)
+            i += 1
+            continue
+        elif c == "/" and (prev in _EXPR_START_WORDS or prev in _EXPR_START_PUNCT or prev == ""):
+            i = _skip_regex(src, i)
+            prev = "regex"
+            continue
+        prev = c
+        i += 1
+
+    tokens.sort(key=lambda tok: tok[1])
+    return tokens
+
+
+def _substitution_tokens(src, start, end, jsx):
+    """Lex the ``${...}`` expressions of the template at ``src[start:end]``."""
+    tokens = []
+    i = start + 1
+    while i < end:
+        c = src[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == "$" and src[i + 1:i + 2] == "{":
+            close = _skip_braces(src, i + 1)
+            inner = lex(src[i + 2:close - 1], jsx)
+            tokens.extend((kind, s + i + 2, e + i + 2, value) for kind, s, e, value in inner)
+            i = close
+            continue
+        i += 1
+    return tokens
+
+
+def _opens_jsx(src, i, prev):
+    if not (prev in _EXPR_START_PUNCT or prev in _EXPR_START_WORDS or prev == ""):
+        return False
+    nxt = src[i + 1:i + 2]
+    return nxt == ">" or nxt in _IDENT_START
+
+
+def _static_key(src, i):
+    """Return the first argument of a call if it is a plain string literal."""
+    n = len(src)
+    while i < n and src[i] in " \t\r\n":
+        i += 1
+    if i >= n or src[i] not in "'\"`":
+        return None
+    quote = src[i]
+    end = _skip_template(src, i) if quote == "`" else _skip_string(src, i, quote)
+    value = src[i + 1:end - 1]
+    if quote == "`" and "${" in value:
+        return None
+    return value
+
+
+def line_index(src):
+    """Return a function mapping a character offset to a 1-based line."""
+    starts = [0]
+    pos = src.find("\n")
+    while pos >= 0:
+        starts.append(pos + 1)
+        pos = src.find("\n", pos + 1)
+    return lambda offset: bisect.bisect_right(starts, offset)
+
+
+def t_calls(tokens):
+    return [tok for tok in tokens if tok[0] == T_CALL]
+
+
+def jsx_texts(tokens):
+    return [tok for tok in tokens if tok[0] == JSX_TEXT]
+
+
+def split_args(src, open_paren, close_paren):
+    """Return ``(start, end)`` spans of the top-level comma-separated items
+    between ``src[open_paren]`` and ``src[close_paren]`` (exclusive).
+
+    Works for call arguments as well as object literal properties; spans are
+    stripped of surrounding whitespace and an empty trailing item is dropped.
+    """
+    spans = []
+    depth = 0
+    i = item_start = open_paren + 1
+    while i < close_paren:
+        c = src[i]
+        if c in "'\"":
+            i = _skip_string(src, i, c)
+            continue
+        if c == "`":
+            i = _skip_template(src, i)
+            continue
+        if c == "/" and src[i + 1:i + 2] in ("/", "*"):
+            i = _skip_comment(src, i)
+            continue
+        if c in "([{":
+            depth += 1
+        elif c in ")]}":
+            depth -= 1
+        elif c == "," and depth == 0:
+            spans.append((item_start, i))
+            item_start = i + 1
+        i += 1
+    spans.append((item_start, close_paren))
+    result = []
+    for start, end in spans:
+        while start < end and src[start] in " \t\r\n":
+            start += 1
+        while end > start and src[end - 1] in " \t\r\n":
+            end -= 1
+        result.append((start, end))
+    if result and result[-1][0] == result[-1][1]:
+        result.pop()
+    return result
+
+
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+
+
+def string_value(literal):
+    """Decode a JS string literal (quotes included); ``None`` if it is not a
+    plain literal, e.g. a template with substitutions."""
+    if len(literal) < 2 or literal[0] not in "'\"`" or literal[-1] != literal[0]:
+        return None
+    body = literal[1:-1]
+    if literal[0] == "`" and "${" in body:
+        return None
+    out = []
+    i = 0
+    while i < len(body):
+        c = body[i]
+        if c != "\\":
+            out.append(c)
+            i += 1
+            continue
+        nxt = body[i + 1:i + 2]
+        if nxt == "u" and body[i + 2:i + 3] == "{":
+            close = body.index("}", i)
+            out.append(chr(int(body[i + 3:close], 16)))
+            i = close + 1
+        elif nxt == "u":
+            out.append(chr(int(body[i + 2:i + 6], 16)))
+            i += 6
+        elif nxt == "x":
+            out.append(chr(int(body[i + 2:i + 4], 16)))
+            i += 4
+        elif nxt == "\n":
+            i += 2
+        else:
+            out.append(_ESCAPES.get(nxt, nxt))
+            i += 2
+    return "".join(out)
+
+
+def code_mask(src, tokens):
+    """Return ``src`` with literal, comment and JSX text spans blanked out.
+
+    Offsets are preserved, so bracket matching and declaration regexes can
+    run over the result without tripping on quotes or braces inside strings.
+    Newlines are kept to preserve line numbers.
+    """
+    chars = list(src)
+    for kind, start, end, _ in tokens:
+        if kind == T_CALL:
+            continue
+        inner_start, inner_end = (start, end) if kind == JSX_TEXT else (start + 1, end - 1)
+        for i in range(inner_start, inner_end):
+            if chars[i] != "\n":
+                chars[i] = " "
+    masked = "".join(chars)
+    i = masked.find("/")
+    while 0 <= i < len(masked) - 1:
+        if masked[i + 1] in "/*":
+            end = _skip_comment(masked, i)
+            for j in range(i, end):
+                if chars[j] != "\n":
+                    chars[j] = " "
+            i = end
+        else:
+            i += 1
+        i = masked.find("/", i)
+    return "".join(chars)
+
+
+def match_bracket(masked, i):
+    """Index after the bracket closing the one at ``masked[i]``."""
+    pairs = {"(": ")", "[": "]", "{": "}"}
+    stack = []
+    n = len(masked)
+    while i < n:
+        c = masked[i]
+        if c in pairs:
+            stack.append(pairs[c])
+        elif c in ")]}":
+            if not stack or stack.pop() != c:
+                return i + 1
+            if not stack:
+                return i + 1
+        i += 1
+    return n
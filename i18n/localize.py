@@ -0,0 +1,160 @@
+"""Replace hard-coded UI text in TSX files with t() calls.
+
+Takes a mapping of English text to translation key (JSON or YAML)::
+
+    {"Input Tax": "reports.tax.inputTax", "Due Date": "common.dueDate"}
+
+and rewrites, in the given files:
+
+* JSX text whose whole (whitespace-normalized) content is a mapped text:
+  ``<th>Due Date</th>`` -> ``<th>{t('common.dueDate')}</th>``;
+* visible attribute strings (``placeholder``, ``title``, ``alt``,
+  ``aria-label``, ``label``, ``data-label``):
+  ``title="Due Date"`` -> ``title={t('common.dueDate')}``;
+* with ``--strings``, any other string literal equal to a mapped text
+  (``label: 'Due Date'`` in column and status maps) -> ``t('common.dueDate')``.
+
+With ``--auto`` the mapping is optional: every JSX text and visible
+attribute is looked up in the English reverse index (:mod:`i18n.textindex`)
+and reuses the best existing key; only text with no match gets a new key,
+under the namespace the file already uses most. An explicit mapping still
+wins where its key exists.
+
+Matching uses the lexer, so text inside comments, other strings or longer
+sentences is never touched. Keys missing from the English file are added
+with the mapped text. Files without a ``t`` from ``useTranslation`` (or
+``useTypedTranslation``) are reported and left alone. Translated objects
+built in component bodies are then memoized (see :mod:`i18n.memoize`)
+unless ``--no-memoize`` is given.
+
+Usage: python -m i18n.localize (--map MAPPING | --auto) [--strings] [--dry-run] FILE [FILE ...]
+"""
+
+import argparse
+import copy
+import re
+import sys
+from pathlib import Path
+
+from . import profiling, tokencache
+from .codemod import apply_edits
+from .exchange import set_path
+from .lexer import JSX_ATTR, JSX_TEXT, STRING, T_CALL, string_value
+from .merge import read_fragment
+from .paths import SOURCE_LANG
+from .scan import defined
+from .session import Session
+from .store import flatten
+from .textindex import Resolver, TextIndex
+
+_ATTRIBUTE = re.compile(r"(?:placeholder|title|alt|aria-label|label|data-label)\s*=\s*$")
+_HAS_T = re.compile(r"\{\s*(?:[\w$]+\s*,\s*)*t\s*(?:,[^}]*)?\}\s*=\s*use(?:Typed)?Translation\(")
+
+
+def _call(key):
+    quote = '"' if "'" in key else "'"
+    return f"t({quote}{key}{quote})"
+
+
+def plan_source(src, tokens, mapping, strings=False):
+    """Return ``[(start, end, replacement, key, text)]`` for one file."""
+    edits = []
+    for kind, start, end, value in tokens:
+        if kind == JSX_TEXT:
+            raw = src[start:end]
+            text = " ".join(raw.split())
+            key = mapping.get(text)
+            if key is None:
+                continue
+            lead = len(raw) - len(raw.lstrip())
+            trail = len(raw) - len(raw.rstrip())
+            edits.append((start + lead, end - trail, f"{{{_call(key)}}}", key, text))
+        elif kind == JSX_ATTR:
+            # The lexer saw it inside a tag; the name before it says if it shows.
+            if _ATTRIBUTE.search(src[max(0, start - 24):start]):
+                text = string_value(src[start:end])
+                key = mapping.get(text)
+                if key is not None:
+                    edits.append((start, end, f"{{{_call(key)}}}", key, text))
+        elif kind == STRING and src[start] in "'\"":
+            text = string_value(src[start:end])
+            if strings and not src[:start].rstrip().endswith(("import", "from", "(")):
+                # Code strings are only ever mapped to existing keys: a
+                # resolver would otherwise mint keys for 'POST' or 'utf-8'.
+                key = getattr(mapping, "existing", mapping.get)(text)
+                if key is not None:
+                    edits.append((start, end, _call(key), key, text))
+    return edits
+
+
+def add_arguments(parser):
+    parser.add_argument("files", nargs="+", help="TSX files to rewrite")
+    parser.add_argument("--map", help="JSON/YAML mapping of text to key")
+    parser.add_argument("--auto", action="store_true",
+                        help="resolve text to existing English keys; mint keys only for the rest")
+    parser.add_argument("--strings", action="store_true",
+                        help="also replace matching string literals in code")
+    parser.add_argument("--no-memoize", action="store_true",
+                        help="do not wrap translated objects in useMemo afterwards")
+    parser.add_argument("--dry-run", action="store_true", help="report without writing")
+
+
+def run(args, session):
+    if not args.map and not args.auto:
+        raise SystemExit("localize: give --map, --auto or both")
+    mapping = read_fragment(args.map) if args.map else {}
+    source = session.tree(SOURCE_LANG)
+    if args.dry_run:
+        source = copy.deepcopy(source)
+    flat = flatten(source)
+    index = TextIndex(source) if args.auto else None
+    changed = []
+    for path in args.files:
+        with profiling.phase("localize", path):
+            src, tokens = tokencache.load(path)
+            if not _HAS_T.search(src):
+                print(f"  {path}: no t from useTranslation(); skipped")
+                continue
+            resolver = mapping
+            if index is not None:
+                used = [value for kind, _, _, value in tokens if kind == T_CALL and value]
+                resolver = Resolver.for_file(index, path, used, mapping)
+            edits = plan_source(src, tokens, resolver, args.strings)
+            if not edits:
+                continue
+            for _, _, _, key, text in edits:
+                if not defined(key, flat):
+                    flat[key] = text
+                    set_path(source, tuple(key.split(".")), text)
+                    if not args.dry_run:
+                        session.mark(SOURCE_LANG)
+                    print(f"  added {SOURCE_LANG} {key} = {text!r}")
+            print(f"{path}: {len(edits)} replacements")
+            if not args.dry_run:
+                Path(path).write_text(apply_edits(src, edits), encoding="utf-8")
+                changed.append(path)
+    if changed and not args.no_memoize:
+        from . import memoize
+
+        findings, _ = memoize.run(changed, write=True)
+        for finding in findings:
+            if finding.status == "auto":
+                print(f"  memoized {finding}")
+    return changed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, "localize"):
+        session = Session()
+        run(args, session)
+        session.flush()
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
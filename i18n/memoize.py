@@ -0,0 +1,416 @@
+"""Find and memoize translated objects that are rebuilt on every render.
+
+Localizing a module-level zod schema or status map means moving it inside
+the component so it can call ``t()``, which then rebuilds it on every render
+(and, for maps declared inside helpers like ``getStatusBadge``, on every
+call). The analyzer reports each ``const`` in a component whose initializer
+is a zod schema, object literal or array literal containing ``t()`` calls.
+
+With ``--write``, safe cases are rewritten:
+
+* a declaration in the component body is wrapped in
+  ``useMemo(() => ..., [t, i18n.language])``;
+* a declaration at the top of a helper function declared in the component
+  body is hoisted in front of that helper and wrapped the same way.
+
+Local values the initializer reads are added to the dependency list. Cases
+that cannot be rewritten mechanically (declared inside callbacks or loops,
+reading the helper's own parameters, after an early ``return``) are only
+reported.
+
+Usage: python -m i18n.memoize [--write] [path ...]
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+from . import profiling, tokencache
+from .lexer import T_CALL, code_mask, line_index, match_bracket
+from .paths import CLIENT_SRC, ROOT
+
+_FUNCTION_COMPONENT = re.compile(
+    r"^[ \t]*(?:export\s+)?(?:default\s+)?function\s+([A-Z][\w$]*)\s*(?:<[^>]*>)?\s*\(", re.M
+)
+_ARROW_COMPONENT = re.compile(
+    r"^[ \t]*(?:export\s+)?const\s+([A-Z][\w$]*)\s*(?::[^=\n]+)?=\s*\(", re.M
+)
+_DECLARATION = re.compile(
+    r"(?<![\w$.])(?:const|let)\s+([A-Za-z_$][\w$]*)\s*(?::\s*[^=;\n]+?)?\s*=(?![=>])\s*"
+)
+_BINDING = re.compile(r"(?<![\w$.])(?:const|let|var)\s+(\{[^=]*\}|\[[^=]*\]|[A-Za-z_$][\w$]*)")
+_FUNCTION_NAME = re.compile(r"(?<![\w$.])function\s+([A-Za-z_$][\w$]*)")
+_IDENTIFIER = re.compile(r"(?<![\w$.])([A-Za-z_$][\w$]*)")
+_OBJECT_KEY = re.compile(r"([{,]\s*)([A-Za-z_$][\w$]*)(\s*:)")
+_HELPER = re.compile(
+    r"^(?:const|let)\s+([A-Za-z_$][\w$]*)\s*(?::[^=]+)?=\s*(?:async\s*)?(?:\([^)]*\)|[A-Za-z_$][\w$]*)"
+    r"\s*(?::[^=]+)?=>\s*\{|^(?:async\s+)?function\s+([A-Za-z_$][\w$]*)\s*\("
+)
+# Helpers called while rendering; event handlers (export, submit) build their
+# objects once per click and are better left alone.
+_RENDER_HELPER = re.compile(r"^(?:get|render)[A-Z]")
+_REACT_IMPORT = re.compile(r"import\s+(?:(\w+)\s*,\s*)?\{([^}]*)\}\s*from\s*(['\"])react\3")
+_DEFAULT_REACT_IMPORT = re.compile(r"import\s+(?:\*\s+as\s+)?(\w+)\s+from\s*(['\"])react\2")
+_BARE_USE_MEMO = re.compile(r"(?<![\w$.])useMemo\(\(\) =>")
+_IMPORT_STATEMENT = re.compile(
+    r"^import\s+(?:[^;'\"]*?\sfrom\s*)?(['\"])[^'\"\n]+\1[ \t]*;?[ \t]*\n", re.M
+)
+_USE_TRANSLATION = re.compile(r"const\s*\{\s*t\s*\}\s*=\s*use(?:Typed)?Translation\(")
+
+_CONTINUATION = tuple(".?:+-*/|&=,(")
+_NOT_DEPENDENCIES = {
+    "t", "i18n", "true", "false", "null", "undefined", "new", "typeof", "as", "keyof",
+    "return", "function", "const", "let", "var", "if", "else", "this", "void", "in", "of",
+    "z", "Math", "Number", "String", "Boolean", "Date", "Object", "Array", "JSON",
+}
+
+
+class Finding:
+    def __init__(self, path, line, name, kind, scope, status, detail=""):
+        self.path = path
+        self.line = line
+        self.name = name
+        self.kind = kind
+        self.scope = scope
+        self.status = status
+        self.detail = detail
+
+    def __str__(self):
+        detail = f" ({self.detail})" if self.detail else ""
+        return f"{self.path}:{self.line}: {self.name} [{self.kind}, {self.scope}] {self.status}{detail}"
+
+
+def _statement_end(masked, i):
+    """End (exclusive, before any ``;``) of the expression starting at ``i``."""
+    n = len(masked)
+    while i < n:
+        c = masked[i]
+        if c in "([{":
+            i = match_bracket(masked, i)
+            continue
+        if c == ";" or c in ")]}":
+            return i
+        if c == "\n":
+            before = masked[:i].rstrip()
+            after = masked[i:].lstrip()
+            if not before.endswith(_CONTINUATION + (">",)) and not after.startswith(_CONTINUATION):
+                return i
+        i += 1
+    return n
+
+
+def _components(masked):
+    """Yield ``(name, params_start, body_start, body_end)``."""
+    for pattern in (_FUNCTION_COMPONENT, _ARROW_COMPONENT):
+        for match in pattern.finditer(masked):
+            params_start = match.end() - 1
+            params_end = match_bracket(masked, params_start)
+            rest = masked[params_end:params_end + 200]
+            if pattern is _ARROW_COMPONENT:
+                arrow = re.match(r"\s*(?::[^=]+)?=>\s*\{", rest)
+                if not arrow:
+                    continue
+                body_start = params_end + arrow.end() - 1
+            else:
+                brace = rest.find("{")
+                if brace < 0:
+                    continue
+                body_start = params_end + brace
+            yield match.group(1), params_start, body_start, match_bracket(masked, body_start)
+
+
+def _bindings(text):
+    names = set()
+    for match in _BINDING.finditer(text):
+        target = match.group(1)
+        if target[0] in "{[":
+            target = _OBJECT_KEY.sub(r"\1", target.replace("...", ""))
+            names.update(_IDENTIFIER.findall(target))
+        else:
+            names.add(target)
+    names.update(_FUNCTION_NAME.findall(text))
+    return names
+
+
+def _free_names(init):
+    init = _OBJECT_KEY.sub(r"\1\3", init)
+    return {name for name in _IDENTIFIER.findall(init) if name not in _NOT_DEPENDENCIES}
+
+
+def _openers(masked, start, end):
+    """Return positions of brackets open at ``end`` scanning from ``start``."""
+    stack = []
+    for i in range(start, end):
+        c = masked[i]
+        if c in "([{":
+            stack.append(i)
+        elif c in ")]}" and stack:
+            stack.pop()
+    return stack
+
+
+def _kind(init):
+    if init.startswith("z."):
+        return "zod schema"
+    if init.startswith("{"):
+        return "config object"
+    if init.startswith("["):
+        return "config array"
+    return None
+
+
+def _line_start(src, i):
+    return src.rfind("\n", 0, i) + 1
+
+
+def _indent(src, i):
+    start = _line_start(src, i)
+    return src[start:i] if not src[start:i].strip() else re.match(r"[ \t]*", src[start:]).group(0)
+
+
+def _memo(init, deps):
+    body = f"({init})" if init.startswith("{") else init
+    return f"useMemo(() => {body}, [{', '.join(deps)}])"
+
+
+def analyze(path):
+    """Return ``(src, findings, edits, needs)`` for one file.
+
+    ``edits`` are ``(start, end, replacement)`` for the safe rewrites and
+    ``needs`` tells the caller which imports/destructuring they depend on.
+    """
+    src, tokens = tokencache.load(path)
+    masked = code_mask(src, tokens)
+    line_of = line_index(src)
+    calls = [tok[1] for tok in tokens if tok[0] == T_CALL]
+    rel = str(Path(path).resolve().relative_to(ROOT)) if Path(path).resolve().is_relative_to(ROOT) else str(path)
+    findings = []
+    edits = []
+    needs = set()
+
+    for component, params_start, body_start, body_end in _components(masked):
+        body_locals = _bindings(masked[params_start:body_end])
+        has_i18n = "i18n" in body_locals or re.search(r"\bimport\s+i18n\b", masked)
+        for decl in _DECLARATION.finditer(masked, body_start + 1, body_end - 1):
+            init_start = decl.end()
+            init_end = _statement_end(masked, init_start)
+            init = src[init_start:init_end].rstrip()
+            init_end = init_start + len(init)
+            if not any(init_start <= c < init_end for c in calls):
+                continue
+            kind = _kind(masked[init_start:init_end])
+            if masked.startswith("useMemo(", init_start) or masked.startswith("React.useMemo(", init_start):
+                findings.append(Finding(rel, line_of(decl.start()), decl.group(1), "memoized",
+                                        component, "ok"))
+                continue
+            if kind is None:
+                continue
+
+            name = decl.group(1)
+            line = line_of(decl.start())
+            openers = _openers(masked, body_start + 1, decl.start())
+            free = _free_names(masked[init_start:init_end])
+
+            if not openers:
+                scope = "component body"
+                insert_at = None
+            elif len(openers) == 1 and masked[openers[0]] == "{":
+                helper_start = _statement_start(masked, body_start, openers[0])
+                helper_text = masked[helper_start:openers[0] + 1].strip()
+                helper = _HELPER.match(helper_text)
+                if not helper:
+                    findings.append(Finding(rel, line, name, kind, component, "manual",
+                                            "declared inside a block or callback"))
+                    continue
+                if not _RENDER_HELPER.match(helper.group(1) or helper.group(2)):
+                    continue
+                helper_end = match_bracket(masked, openers[0])
+                helper_locals = _bindings(masked[helper_start:helper_end]) - {name}
+                params = re.search(r"\(([^)]*)\)|([A-Za-z_$][\w$]*)\s*(?::[^=]+)?=>", helper_text)
+                if params:
+                    helper_locals |= set(_IDENTIFIER.findall(_OBJECT_KEY.sub(r"\1", params.group(0))))
+                clash = free & helper_locals
+                if clash:
+                    findings.append(Finding(rel, line, name, kind, component, "manual",
+                                            f"reads {', '.join(sorted(clash))} from the helper"))
+                    continue
+                declared = re.findall(rf"(?<![\w$.])(?:const|let|var|function)\s+{re.escape(name)}\b",
+                                      masked[body_start:body_end])
+                if len(declared) > 1:
+                    findings.append(Finding(rel, line, name, kind, component, "manual",
+                                            "name already used in the component"))
+                    continue
+                scope = "helper"
+                insert_at = _line_start(src, helper_start)
+            else:
+                findings.append(Finding(rel, line, name, kind, component, "manual",
+                                        "declared inside a block or callback"))
+                continue
+
+            anchor = decl.start() if insert_at is None else insert_at
+            if re.search(r"(?<![\w$.])return\b", _top_level(masked, body_start + 1, anchor)):
+                findings.append(Finding(rel, line, name, kind, component, "manual",
+                                        "early return before it; hooks must run unconditionally"))
+                continue
+            local_deps = sorted((free & body_locals) - {name})
+            later = [dep for dep in local_deps
+                     if not _bindings(masked[params_start:anchor]) & {dep}]
+            if later:
+                findings.append(Finding(rel, line, name, kind, component, "manual",
+                                        f"reads {', '.join(later)} declared after it"))
+                continue
+
+            deps = ["t", "i18n.language"] if has_i18n or _USE_TRANSLATION.search(
+                masked, body_start, body_end) else ["t"]
+            deps += [dep for dep in local_deps if dep not in ("t", "i18n")]
+            if "i18n.language" in deps and not has_i18n:
+                needs.add(("i18n", body_start, body_end))
+            needs.add(("useMemo",))
+
+            if insert_at is None:
+                edits.append((init_start, init_end, _memo(init, deps)))
+            else:
+                stmt_end = init_end + (1 if src[init_end:init_end + 1] == ";" else 0)
+                remove_start = _line_start(src, decl.start())
+                remove_end = stmt_end
+                while remove_end < len(src) and src[remove_end] in " \t":
+                    remove_end += 1
+                if src[remove_end:remove_end + 1] == "\n":
+                    remove_end += 1
+                # Swallow one blank line after the declaration as well.
+                blank = re.match(r"[ \t]*\n", src[remove_end:])
+                if blank:
+                    remove_end += blank.end()
+                outer = _indent(src, helper_start)
+                inner = _indent(src, decl.start())
+                lines = init.split("\n")
+                shift = len(inner) - len(outer)
+                lines = [lines[0]] + [
+                    ln[shift:] if shift > 0 and ln[:shift].strip() == "" else ln for ln in lines[1:]
+                ]
+                head = src[decl.start():init_start]
+                hoisted = f"{outer}{head}{_memo(chr(10).join(lines), deps)};\n\n"
+                edits.append((remove_start, remove_end, ""))
+                edits.append((insert_at, insert_at, hoisted))
+            findings.append(Finding(rel, line, name, kind, component, "auto",
+                                    "hoisted out of helper" if insert_at is not None else ""))
+    return src, findings, edits, needs
+
+
+def _statement_start(masked, body_start, pos):
+    """Start of the component-level statement containing ``pos``."""
+    i = pos
+    depth = 0
+    while i > body_start + 1:
+        i -= 1
+        c = masked[i]
+        if c in ")]}":
+            depth += 1
+        elif c in "([{":
+            depth -= 1
+        elif depth == 0 and c == ";":
+            break
+        elif depth == 0 and c == "\n" and re.match(r"\s*(?:const|let|function|async)\b",
+                                                    masked[i + 1:pos]):
+            nxt = re.match(r"\s*", masked[i + 1:]).end()
+            return i + 1 + nxt
+    return i + 1 + re.match(r"\s*", masked[i + 1:]).end()
+
+
+def _top_level(masked, start, end):
+    """Text of ``masked[start:end]`` with everything inside brackets removed."""
+    out = []
+    depth = 0
+    for c in masked[start:end]:
+        if c in "([{":
+            depth += 1
+        elif c in ")]}":
+            depth -= 1
+        elif depth == 0:
+            out.append(c)
+    return "".join(out)
+
+
+def _apply(src, edits, needs):
+    for need in needs:
+        if need[0] == "i18n":
+            body = src[need[1]:need[2]]
+            match = _USE_TRANSLATION.search(body)
+            if match:
+                edits.append((need[1] + match.start(), need[1] + match.end(),
+                              match.group(0).replace("{ t }", "{ t, i18n }").replace("{t}", "{ t, i18n }")))
+    out = []
+    pos = 0
+    for start, end, replacement in sorted(edits):
+        out.append(src[pos:start])
+        out.append(replacement)
+        pos = max(pos, end)
+    out.append(src[pos:])
+    src = "".join(out)
+    if ("useMemo",) in needs:
+        src = _import_use_memo(src)
+    return src
+
+
+def _import_use_memo(src):
+    match = _REACT_IMPORT.search(src)
+    if match:
+        names = [n.strip() for n in match.group(2).split(",") if n.strip()]
+        if "useMemo" in names:
+            return src
+        inner = match.group(2)
+        pad = " " if inner.startswith(" ") else ""
+        new_inner = f"{pad}{', '.join(names + ['useMemo'])}{pad}"
+        start = match.start(2)
+        return src[:start] + new_inner + src[match.end(2):]
+    default = _DEFAULT_REACT_IMPORT.search(src)
+    if default:
+        # Only the bare calls this tool wrote; React.useMemo( is left alone.
+        return _BARE_USE_MEMO.sub(f"{default.group(1)}.useMemo(() =>", src)
+    # A new import goes after the last one, in the file's quote and semicolon style.
+    imports = list(_IMPORT_STATEMENT.finditer(src))
+    if not imports:
+        return "import { useMemo } from 'react';\n" + src
+    last = imports[-1]
+    quote = imports[0].group(1)
+    semicolon = ";" if last.group(0).rstrip().endswith(";") else ""
+    line = f"import {{ useMemo }} from {quote}react{quote}{semicolon}\n"
+    return src[:last.end()] + line + src[last.end():]
+
+
+def run(paths, write=False):
+    findings = []
+    changed = []
+    for path in paths:
+        with profiling.phase("analyze", path):
+            src, found, edits, needs = analyze(path)
+        findings += found
+        if write and edits:
+            Path(path).write_text(_apply(src, edits, needs), encoding="utf-8")
+            changed.append(path)
+    return findings, changed
+
+
+@profiling.command("memoize")
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="files to check (default: all .tsx in client/src)")
+    parser.add_argument("--write", action="store_true", help="rewrite the safe cases")
+    args = parser.parse_args(argv)
+
+    paths = args.paths or [p for p in tokencache.iter_sources(CLIENT_SRC, (".tsx",))]
+    findings, changed = run(paths, args.write)
+    for finding in findings:
+        if finding.kind != "memoized":
+            print(finding)
+    auto = sum(1 for f in findings if f.status == "auto")
+    manual = sum(1 for f in findings if f.status == "manual")
+    verb = "Rewrote" if args.write else "Can rewrite"
+    print(f"{verb} {auto} declarations in {len(changed) if args.write else len({f.path for f in findings if f.status == 'auto'})} "
+          f"files; {manual} need manual attention")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""Merge JSON (or YAML) fragments into the locale files.
+
+A fragment maps languages to partial trees::
+
+    {"en": {"items": {"units": {"piece": "Piece"}}}, "ar": {...}}
+
+or, with ``--lang``, is a bare partial tree for that one language. Existing
+values are kept unless ``--overwrite`` is given, so re-running a fragment is
+harmless. A fragment key that would replace a whole namespace with a string
+(or the other way round) is reported and skipped.
+
+Usage: python -m i18n.merge [--overwrite] [--lang LANG] [--dry-run] FILE [FILE ...]
+"""
+
+import argparse
+import copy
+import json
+import sys
+from pathlib import Path
+
+from . import profiling
+from .exchange import set_path
+from .session import Session
+from .store import dotted, get_path, iter_leaves
+
+
+def read_fragment(path):
+    """Load a ``.json`` or ``.yaml``/``.yml`` file."""
+    path = Path(path)
+    with profiling.phase("load", path):
+        text = path.read_text(encoding="utf-8")
+        if path.suffix in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise SystemExit(f"{path}: reading YAML needs PyYAML (pip install pyyaml)")
+            return yaml.safe_load(text) or {}
+        return json.loads(text)
+
+
+def merge_tree(fragment, tree, overwrite=False):
+    """Merge ``fragment`` into ``tree`` in place.
+
+    Returns ``(added, changed, conflicts)``; ``conflicts`` are dotted keys
+    whose shape (namespace vs string) differs between the two trees.
+    """
+    added = changed = 0
+    conflicts = []
+    for path, value in iter_leaves(fragment):
+        current = get_path(tree, path)
+        if isinstance(current, dict) or any(
+            isinstance(get_path(tree, path[:i]), (str, list)) for i in range(1, len(path))
+        ):
+            conflicts.append(dotted(path))
+            continue
+        if current is None:
+            added += 1
+        elif current != value and overwrite:
+            changed += 1
+        else:
+            continue
+        set_path(tree, path, value)
+    return added, changed, conflicts
+
+
+def add_arguments(parser):
+    parser.add_argument("files", nargs="+", help="fragment files, applied in order")
+    parser.add_argument("--lang", help="the files are bare trees for this language")
+    parser.add_argument("--overwrite", action="store_true", help="replace existing values")
+    parser.add_argument("--dry-run", action="store_true", help="report without writing")
+
+
+def run(args, session):
+    totals = {}
+    for path in args.files:
+        fragment = read_fragment(path)
+        per_lang = {args.lang: fragment} if args.lang else fragment
+        for lang, subtree in per_lang.items():
+            # A sharded locale only reads the namespaces the fragment touches.
+            tree = session.tree(lang, namespaces=set(subtree))
+            if args.dry_run:
+                tree = copy.deepcopy(tree)
+            with profiling.phase("merge", path):
+                added, changed, conflicts = merge_tree(subtree, tree, args.overwrite)
+            if (added or changed) and not args.dry_run:
+                session.mark(lang)
+            total = totals.setdefault(lang, [0, 0])
+            total[0] += added
+            total[1] += changed
+            for key in conflicts:
+                print(f"  {path}: {lang} {key} conflicts with an existing key; skipped")
+    for lang, (added, changed) in totals.items():
+        print(f"{lang}: {added} added, {changed} changed")
+    return totals
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, "merge"):
+        session = Session()
+        run(args, session)
+        session.flush()
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
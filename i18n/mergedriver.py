@@ -0,0 +1,236 @@
+"""Git merge driver that merges translation.json files key by key.
+
+Branches that add keys to the end of the same namespace conflict on every
+merge when git compares lines, and hand-resolved conflicts have left
+duplicate keys behind. This driver parses the base, ours and theirs with
+the streaming tokenizer (:mod:`i18n.jsontok`) and merges each dotted key on
+its own:
+
+* a key changed on one side only takes that side's value (or deletion);
+* a key added on one side is added; added on both with the same value, kept;
+* only a key given different values on both sides - or changed on one side
+  and deleted on the other, or turned into a namespace on one side - is a
+  conflict.
+
+The result is written in canonical form: ours' order with keys from theirs
+inserted after the key that precedes them there, and for translations
+English's order as ``i18n normalize`` writes it. Conflicting keys are
+written between the usual ``<<<<<<<``/``=======``/``>>>>>>>`` lines (ours'
+line, then theirs'), and the driver exits with 1 so git reports the file as
+conflicted; everything else in the file is already merged.
+
+Git runs it through ``.gitattributes`` (``merge=i18n-json``); the driver
+itself is configured per clone with ``python -m i18n.mergedriver --install``,
+which runs::
+
+    git config merge.i18n-json.driver "python -m i18n.mergedriver %O %A %B %P -L %L"
+
+Usage: python -m i18n.mergedriver BASE OURS THEIRS [PATH] [-L SIZE] | --install
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from . import jsontok, profiling
+from .paths import LOCALES_DIR, ROOT, SOURCE_LANG, locale_path
+from .store import dump_locale, iter_leaves, unflatten
+
+DRIVER = "i18n-json"
+_MISSING = object()
+_CONFLICT = "\u0000conflict-{}"
+
+
+def read_leaves(path):
+    """``{path: raw value bytes}`` in document order (a later duplicate wins)."""
+    data = Path(path).read_bytes()
+    if not data.strip():
+        return {}
+    return {leaf.path: data[leaf.value_start:leaf.end] for leaf in jsontok.leaves(data)}
+
+
+def _same(a, b):
+    if a is _MISSING or b is _MISSING:
+        return a is b
+    return a == b or json.loads(a) == json.loads(b)
+
+
+def merge_leaves(base, ours, theirs):
+    """Return ``(merged, conflicts)``.
+
+    ``merged`` maps path to raw value bytes in output order; ``conflicts``
+    maps path to ``(ours, theirs)``, either of which may be ``None`` for a
+    deletion.
+    """
+    merged = {}
+    conflicts = {}
+    for path, mine in ours.items():
+        other = theirs.get(path, _MISSING)
+        old = base.get(path, _MISSING)
+        if _same(mine, other) or _same(other, old):
+            merged[path] = mine
+        elif _same(mine, old):
+            if other is not _MISSING:
+                merged[path] = other
+        else:
+            merged[path] = mine
+            conflicts[path] = (mine, None if other is _MISSING else other)
+
+    # Keys only theirs has: added there (kept after the key that precedes
+    # them in theirs), or deleted here.
+    inserts = {}
+    previous = None
+    for path, other in theirs.items():
+        if path in ours:
+            previous = path
+            continue
+        old = base.get(path, _MISSING)
+        if old is _MISSING or not _same(other, old):
+            if old is not _MISSING:
+                conflicts[path] = (None, other)
+            inserts.setdefault(previous, []).append((path, other))
+    result = dict(inserts.get(None, ()))
+    for path, value in merged.items():
+        result[path] = value
+        result.update(inserts.get(path, ()))
+
+    # A key that is a text on one side and a namespace on the other.
+    paths = sorted(result)
+    for shorter, longer in zip(paths, paths[1:]):
+        if longer[:len(shorter)] == shorter:
+            conflicts.setdefault(shorter, (ours.get(shorter), theirs.get(shorter)))
+    return result, conflicts
+
+
+def _english_order(path):
+    """Rank of each English key when ``path`` is a translation, else None.
+
+    A shard (``<lang>/<namespace>.json``) is ordered like English's shard.
+    """
+    path = Path(path)
+    if path.name == "index.json" or path.parent.name == SOURCE_LANG:
+        return None
+    source = path.parent.parent / SOURCE_LANG / path.name
+    if not source.exists() and path.name == "translation.json":
+        source = locale_path(SOURCE_LANG, LOCALES_DIR)
+    if not source.exists():
+        return None
+    try:
+        tree = json.loads(source.read_bytes())
+    except ValueError:
+        return None
+    return {p: rank for rank, (p, _) in enumerate(iter_leaves(tree))}
+
+
+def _marker_line(indent, key, raw, comma):
+    value = json.dumps(json.loads(raw), ensure_ascii=False)
+    return f"{indent}{json.dumps(key, ensure_ascii=False)}: {value}{comma}\n"
+
+
+def render(merged, conflicts, order=None, marker_size=7):
+    """The merged file's text, conflicting keys between conflict markers."""
+    from .normalize import canonical
+
+    paths = set(merged)
+    # A text clashing with a namespace cannot sit in the tree; the namespace
+    # stays and the text is shown in a marker block after the document.
+    shapes = [p for p in conflicts
+              if any(q[:len(p)] == p and q != p for q in paths)]
+    sentinels = {}
+    leaves = []
+    for path, raw in merged.items():
+        if path in shapes:
+            continue
+        if path in conflicts:
+            value = _CONFLICT.format(len(sentinels))
+            sentinels[json.dumps(value)] = path
+        else:
+            value = json.loads(raw)
+        leaves.append((path, value))
+    tree = unflatten(leaves)
+    if order is not None:
+        tree = canonical(tree, order)
+    text = dump_locale(tree)
+    if not conflicts:
+        return text
+
+    out = []
+    for line in text.splitlines(keepends=True):
+        body = line.rstrip("\n")
+        comma = "," if body.endswith(",") else ""
+        _, sep, value = body.rstrip(",").rpartition(": ")
+        path = sentinels.get(value) if sep else None
+        if path is None:
+            out.append(line)
+            continue
+        indent = line[:len(line) - len(line.lstrip())]
+        mine, other = conflicts[path]
+        out.append("<" * marker_size + " ours\n")
+        if mine is not None:
+            out.append(_marker_line(indent, path[-1], mine, comma))
+        out.append("=" * marker_size + "\n")
+        if other is not None:
+            out.append(_marker_line(indent, path[-1], other, comma))
+        out.append(">" * marker_size + " theirs\n")
+    for path in shapes:
+        mine, other = conflicts[path]
+        key = ".".join(path)
+        out.append(f"{'<' * marker_size} ours\n")
+        out.append(_marker_line("", key, mine, "") if mine is not None else f"{key} is a namespace\n")
+        out.append("=" * marker_size + "\n")
+        out.append(_marker_line("", key, other, "") if other is not None else f"{key} is a namespace\n")
+        out.append(f"{'>' * marker_size} theirs\n")
+    return "".join(out)
+
+
+def merge_files(base, ours, theirs, path=None, marker_size=7):
+    """Merge into the ``ours`` file as git expects; returns the conflicts."""
+    with profiling.phase("parse"):
+        leaves = [read_leaves(p) for p in (base, ours, theirs)]
+    with profiling.phase("merge"):
+        merged, conflicts = merge_leaves(*leaves)
+        order = _english_order(path) if path else None
+        text = render(merged, conflicts, order, marker_size)
+    Path(ours).write_text(text, encoding="utf-8")
+    return conflicts
+
+
+def install():
+    command = "python -m i18n.mergedriver %O %A %B %P -L %L"
+    subprocess.run(["git", "config", f"merge.{DRIVER}.name",
+                    "translation.json merged by key"], cwd=ROOT, check=True)
+    subprocess.run(["git", "config", f"merge.{DRIVER}.driver", command], cwd=ROOT, check=True)
+    print(f"Configured merge.{DRIVER}.driver = {command}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", metavar="BASE OURS THEIRS [PATH]")
+    parser.add_argument("-L", "--marker-size", type=int, default=7, help="conflict marker length")
+    parser.add_argument("--install", action="store_true",
+                        help="register the driver in this clone's git config")
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if args.install:
+        install()
+        return 0
+    if len(args.files) not in (3, 4):
+        parser.error("give BASE OURS THEIRS [PATH]")
+    with profiling.session(args, "mergedriver"):
+        try:
+            conflicts = merge_files(*args.files, marker_size=args.marker_size)
+        except (jsontok.JSONSyntaxError, ValueError) as e:
+            # Leave the file to git's own merge result handling.
+            print(f"i18n merge driver: {e}", file=sys.stderr)
+            return 2
+        name = args.files[3] if len(args.files) == 4 else args.files[1]
+        for path in conflicts:
+            print(f"CONFLICT (content): {name}: {'.'.join(path)}", file=sys.stderr)
+        return 1 if conflicts else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""Compact in-memory form of the locale files.
+
+Parsed as nested dicts, the 17 locales cost several times their 2 MB on
+disk: every locale re-creates the same key strings and path tuples, and
+every namespace is a hash table. Here a locale is a few flat columns
+instead:
+
+* a :class:`KeyTable` shared by all locales interns each key path once (its
+  segments with :func:`sys.intern`) and numbers it;
+* a :class:`Locale` stores, in document order, the key ids (``array('I')``),
+  the end offsets of the values in one UTF-8 buffer (``array('I')``) and a
+  byte per value marking the few non-string leaves (the legal pages'
+  ``points`` lists), which are kept as JSON. A per-locale ``array('i')``
+  maps key id to position for lookups.
+
+Values are decoded only when read, and :meth:`Locale.tree` rebuilds the
+nested dict only for callers that need one (to modify it, or to hand it to
+``json.dumps``). :meth:`i18n.session.Session.locale` returns these for the
+commands that only read, so ``i18n status``, ``sync``, ``check`` and the
+coverage reports no longer hold a dict tree per language.
+
+``python -m i18n.model`` loads every locale both ways and prints the memory
+each takes (measured with :mod:`tracemalloc`).
+
+Usage: python -m i18n.model [--locales DIR] [lang ...]
+"""
+
+import argparse
+import json
+import sys
+import tracemalloc
+from array import array
+
+from . import profiling
+from .paths import LANGUAGES, LOCALES_DIR, locale_exists
+from .shards import files
+from .store import iter_leaves, load_locale, unflatten
+
+_STRING = 0
+_JSON = 1
+
+
+class KeyTable:
+    """Key paths shared by every locale, numbered in first-seen order."""
+
+    __slots__ = ("paths", "ids")
+
+    def __init__(self):
+        self.paths = []
+        self.ids = {}
+
+    def intern(self, path):
+        key_id = self.ids.get(path)
+        if key_id is None:
+            path = tuple(map(sys.intern, path))
+            key_id = self.ids[path] = len(self.paths)
+            self.paths.append(path)
+        return key_id
+
+    def __len__(self):
+        return len(self.paths)
+
+
+class Locale:
+    """One language's leaves as columns over a shared :class:`KeyTable`."""
+
+    __slots__ = ("table", "lang", "keys", "ends", "kinds", "buffer", "_positions")
+
+    def __init__(self, table, lang, keys, ends, kinds, buffer):
+        self.table = table
+        self.lang = lang
+        self.keys = keys
+        self.ends = ends
+        self.kinds = kinds
+        self.buffer = buffer
+        self._positions = None
+
+    @classmethod
+    def from_tree(cls, table, lang, tree):
+        keys = array("I")
+        ends = array("I")
+        kinds = bytearray()
+        chunks = []
+        size = 0
+        for path, value in iter_leaves(tree):
+            if isinstance(value, str):
+                data = value.encode("utf-8")
+                kinds.append(_STRING)
+            else:
+                data = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                kinds.append(_JSON)
+            keys.append(table.intern(path))
+            chunks.append(data)
+            size += len(data)
+            ends.append(size)
+        return cls(table, lang, keys, ends, bytes(kinds), b"".join(chunks))
+
+    @classmethod
+    def load(cls, table, lang, locales_dir=LOCALES_DIR):
+        return cls.from_tree(table, lang, load_locale(lang, locales_dir))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _value(self, i):
+        data = self.buffer[self.ends[i - 1] if i else 0:self.ends[i]]
+        return data.decode("utf-8") if self.kinds[i] == _STRING else json.loads(data)
+
+    def _position(self, path):
+        key_id = self.table.ids.get(path)
+        if key_id is None:
+            return -1
+        positions = self._positions
+        if positions is None or len(positions) <= key_id:
+            positions = self._positions = array("i", [-1]) * len(self.table)
+            for i, k in enumerate(self.keys):
+                positions[k] = i
+        return positions[key_id]
+
+    def __contains__(self, path):
+        return self._position(path) >= 0
+
+    def get(self, path, default=None):
+        i = self._position(path)
+        return default if i < 0 else self._value(i)
+
+    def paths(self):
+        """Key paths in document order."""
+        table = self.table.paths
+        return [table[k] for k in self.keys]
+
+    def leaves(self):
+        """Yield ``(path_tuple, value)`` in document order, like ``iter_leaves``."""
+        table = self.table.paths
+        for i, key_id in enumerate(self.keys):
+            yield table[key_id], self._value(i)
+
+    def tree(self):
+        """A new nested dict with the locale's content."""
+        return unflatten(self.leaves())
+
+    def nbytes(self):
+        """Bytes held by the columns (the shared key table not counted)."""
+        positions = self._positions
+        return (len(self.buffer) + len(self.kinds) + self.keys.itemsize * len(self.keys)
+                + self.ends.itemsize * len(self.ends)
+                + (positions.itemsize * len(positions) if positions is not None else 0))
+
+
+def leaves(tree_or_locale):
+    """``(path, value)`` pairs of a nested dict tree or a :class:`Locale`."""
+    if isinstance(tree_or_locale, Locale):
+        return tree_or_locale.leaves()
+    return iter_leaves(tree_or_locale)
+
+
+def measure(load):
+    tracemalloc.start()
+    try:
+        result = load()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("langs", nargs="*", help="languages (default: all)")
+    parser.add_argument("--locales", default=LOCALES_DIR, help="locales directory")
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, "model"):
+        langs = [lang for lang in args.langs or LANGUAGES if locale_exists(lang, args.locales)]
+        disk = sum(path.stat().st_size for lang in langs for path, _ in files(lang, args.locales))
+
+        def load_trees():
+            return {lang: load_locale(lang, args.locales) for lang in langs}
+
+        def load_compact():
+            table = KeyTable()
+            return table, [Locale.load(table, lang, args.locales) for lang in langs]
+
+        trees, tree_bytes, _ = measure(load_trees)
+        cells = sum(1 for tree in trees.values() for _ in iter_leaves(tree))
+        del trees
+        (table, locales), compact_bytes, peak = measure(load_compact)
+        mb = 1024 * 1024
+        print(f"{len(langs)} locales, {cells} cells, {len(table)} distinct keys, "
+              f"{disk / mb:.1f} MB on disk")
+        print(f"  dict trees     {tree_bytes / mb:7.1f} MB")
+        print(f"  compact model  {compact_bytes / mb:7.1f} MB "
+              f"(columns {sum(l.nbytes() for l in locales) / mb:.1f} MB, "
+              f"peak while loading {peak / mb:.1f} MB)")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""Rewrite every locale file in English key order.
+
+The locale files drifted apart: ``deep_merge`` appends new keys at the end
+of their namespace, and sync-all-translations.js follows Arabic's order, so
+the same key sits at a different place in every file and a line diff
+between two locales shows nothing useful. This pass puts each file in a
+canonical order:
+
+* keys English has come in English's order (namespaces included);
+* keys English lacks (orphans) follow the English keys of their namespace
+  in their current order, and namespaces English lacks come last.
+
+Files are processed in parallel, one worker per locale; a file whose bytes
+would not change is not written. The pass also reports keys that occur
+more than once in a file (``json.load`` keeps the last, so the earlier ones
+are dead text) - the rewrite drops them. ``--check`` writes nothing and
+exits with 1 if any file is out of order, for CI.
+
+Usage: python -m i18n.normalize [--check] [--jobs N] [lang ...]
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from . import jsontok, profiling
+from .paths import LANGUAGES, LOCALES_DIR, SOURCE_LANG, locale_exists
+from .session import Session
+from .shards import files
+from .store import iter_leaves, load_locale, render_locale, unflatten
+
+
+def canonical(tree, order):
+    """``tree`` rebuilt with the paths in ``order`` (``{path: rank}``) first."""
+    leaves = list(iter_leaves(tree))
+    unranked = len(order)
+    ranked = sorted(range(len(leaves)),
+                    key=lambda i: (order.get(leaves[i][0], unranked), i))
+    return unflatten(leaves[i] for i in ranked)
+
+
+def normalize_file(lang, order, locales_dir=LOCALES_DIR, write=True):
+    """Return ``(lang, changed, orphans, duplicates)`` for one locale."""
+    raw = {}
+    counts = Counter()
+    tree = {}
+    # One file, or one per namespace when the locale is sharded.
+    for path, prefix in files(lang, locales_dir):
+        data = raw[path] = path.read_bytes()
+        counts.update(prefix + leaf.path for leaf in jsontok.leaves(data))
+        if prefix:
+            tree[prefix[0]] = json.loads(data)
+        else:
+            tree = json.loads(data)
+    # A repeated key may hold an object: its leaves are dead without repeating.
+    kept = {path for path, _ in iter_leaves(tree)}
+    duplicates = sorted(p for p, n in counts.items() if n > 1 or p not in kept)
+    out, _ = render_locale(lang, canonical(tree, order) if order is not None else tree,
+                           locales_dir)
+    out = {path: text for path, text in out.items() if raw.get(path) != text.encode("utf-8")}
+    orphans = 0 if order is None else sum(1 for p in kept if p not in order)
+    if write:
+        for path, text in out.items():
+            with profiling.phase("write", path):
+                path.write_text(text, encoding="utf-8")
+    return lang, bool(out), orphans, duplicates
+
+
+def normalize(langs, locales_dir=LOCALES_DIR, write=True, jobs=None):
+    """Normalize ``langs`` in parallel; English sets the order."""
+    source = load_locale(SOURCE_LANG, locales_dir)
+    order = {path: rank for rank, (path, _) in enumerate(iter_leaves(source))}
+    langs = [lang for lang in langs if locale_exists(lang, locales_dir)]
+    # English only gets its formatting normalized: its order is the canon.
+    tasks = [(lang, None if lang == SOURCE_LANG else order) for lang in langs]
+    if jobs == 1:
+        return [normalize_file(lang, o, locales_dir, write) for lang, o in tasks]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        run = partial(normalize_file, locales_dir=locales_dir, write=write)
+        return list(pool.map(run, *zip(*tasks)))
+
+
+def add_arguments(parser):
+    parser.add_argument("langs", nargs="*", help="languages (default: all)")
+    parser.add_argument("--check", action="store_true",
+                        help="only report files out of order; exit 1 if there are any")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes")
+
+
+def run(args, session):
+    # Pending changes of a chain are written first: the workers read the files.
+    session.flush()
+    with profiling.phase("normalize"):
+        results = normalize(args.langs or LANGUAGES, session.locales_dir,
+                            write=not args.check, jobs=args.jobs)
+    session.invalidate()
+    unordered = 0
+    for lang, changed, orphans, duplicates in results:
+        unordered += changed
+        notes = []
+        if orphans:
+            notes.append(f"{orphans} orphans at the end of their namespaces")
+        if duplicates:
+            shown = ", ".join(".".join(p) for p in duplicates[:3])
+            notes.append(f"{len(duplicates)} duplicate keys ({shown})")
+        state = ("out of order" if args.check else "rewritten") if changed else "canonical"
+        print(f"{lang}: {state}" + (f"; {'; '.join(notes)}" if notes else ""))
+    if args.check and unordered:
+        raise SystemExit(f"normalize: {unordered} files are not in canonical order")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, "normalize"):
+        run(args, Session())
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
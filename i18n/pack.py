@@ -0,0 +1,186 @@
+"""Write compact binary locale packs for the Capacitor apps.
+
+The Android and iOS shells ship the web bundle with every locale inlined;
+a pack holds one language in a form the app can query without parsing it
+(the layout follows gettext's ``.mo`` files). All integers are
+little-endian ``uint32`` and every section starts on a 4-byte boundary, so
+the reader (``client/src/lib/localePack.ts``) views the sections as typed
+arrays over the fetched ``ArrayBuffer``::
+
+    header    magic "I18P", version u16, flags u16, count, hashes offset,
+              entries offset, strings offset, strings size, language (4 bytes)
+    hashes    count x FNV-1a of the UTF-8 dotted key, ascending
+    entries   count x (djb2 of the key, value offset, value size | kind)
+              in the same order as the hashes
+    strings   UTF-8 values; equal values are stored once
+
+Keys themselves are not stored - dotted, they would outweigh the values of
+most languages. A lookup binary-searches the FNV-1a hashes and takes the
+entry whose djb2 hash also matches; the packer refuses a locale in which
+two keys share both hashes, so a key in the pack is always found exactly.
+Only the value found is decoded. The high bit of the value size marks a
+non-string leaf (the legal pages' ``points`` lists), stored as JSON.
+
+Packs are written to ``dist/public/locales/<lang>.i18p``: run this after
+``vite build`` (which empties ``dist/public``) and before ``cap sync``, and
+bundle only the packs an app needs; the others can be fetched on demand.
+
+Usage: python -m i18n.pack [--out DIR] [--check] [lang ...]
+"""
+
+import argparse
+import json
+import struct
+import sys
+from array import array
+from functools import lru_cache
+from pathlib import Path
+
+from . import profiling
+from .model import leaves
+from .paths import LANGUAGES, ROOT, locale_exists
+from .session import Session
+from .store import dotted
+
+DEFAULT_OUT = ROOT / "dist" / "public" / "locales"
+SUFFIX = ".i18p"
+MAGIC = b"I18P"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIIII4s")
+JSON_KIND = 0x80000000
+
+_FNV_OFFSET = 0x811C9DC5
+_FNV_PRIME = 0x01000193
+
+
+class PackError(ValueError):
+    pass
+
+
+def fnv1a(data):
+    h = _FNV_OFFSET
+    for byte in data:
+        h = ((h ^ byte) * _FNV_PRIME) & 0xFFFFFFFF
+    return h
+
+
+def djb2(data):
+    h = 5381
+    for byte in data:
+        h = ((h * 33) ^ byte) & 0xFFFFFFFF
+    return h
+
+
+@lru_cache(maxsize=None)
+def key_hashes(key):
+    """Both hashes of a dotted key (the locales share most keys)."""
+    data = key.encode("utf-8")
+    return fnv1a(data), djb2(data)
+
+
+def _align(size):
+    return (size + 3) & ~3
+
+
+def build(lang, items):
+    """The pack for ``(path, value)`` leaves, as bytes."""
+    entries = {}
+    for path, value in items:
+        key = dotted(path)
+        if isinstance(value, str):
+            data, kind = value.encode("utf-8"), 0
+        else:
+            data = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            kind = JSON_KIND
+        if len(data) >= JSON_KIND:
+            raise PackError(f"{lang}: value of {key} is too large")
+        hashes = key_hashes(key)
+        other = entries.setdefault(hashes, (key, data, kind))[0]
+        if other != key:
+            raise PackError(f"{lang}: keys {other} and {key} have the same hashes")
+
+    strings = bytearray()
+    stored = {}
+    hashes = array("I")
+    table = array("I")
+    for (h, check), (_, data, kind) in sorted(entries.items()):
+        value_offset = stored.get(data)
+        if value_offset is None:
+            value_offset = stored[data] = len(strings)
+            strings += data
+        hashes.append(h)
+        table.extend((check, value_offset, len(data) | kind))
+    if sys.byteorder != "little":
+        hashes.byteswap()
+        table.byteswap()
+
+    hashes_offset = HEADER.size
+    entries_offset = hashes_offset + 4 * len(hashes)
+    strings_offset = entries_offset + 4 * len(table)
+    header = HEADER.pack(MAGIC, VERSION, 0, len(entries), hashes_offset, entries_offset,
+                         strings_offset, len(strings), lang.encode("ascii")[:4])
+    padding = b"\0" * (_align(len(strings)) - len(strings))
+    return header + hashes.tobytes() + table.tobytes() + bytes(strings) + padding
+
+
+def read(data):
+    """``{(fnv1a, djb2): value}`` of a pack (for checks)."""
+    magic, version, _, count, hashes_offset, entries_offset, strings_offset, size, _ = \
+        HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise PackError(f"not a version {VERSION} locale pack")
+    hashes = array("I", data[hashes_offset:hashes_offset + 4 * count])
+    table = array("I", data[entries_offset:entries_offset + 12 * count])
+    if sys.byteorder != "little":
+        hashes.byteswap()
+        table.byteswap()
+    strings = data[strings_offset:strings_offset + size]
+    out = {}
+    for i, h in enumerate(hashes):
+        check, value_offset, value_size = table[3 * i:3 * i + 3]
+        value = strings[value_offset:value_offset + (value_size & ~JSON_KIND)]
+        out[h, check] = json.loads(value) if value_size & JSON_KIND else value.decode("utf-8")
+    return out
+
+
+def add_arguments(parser):
+    parser.add_argument("langs", nargs="*", help="languages (default: all)")
+    parser.add_argument("--out", default=DEFAULT_OUT, help="output directory")
+    parser.add_argument("--check", action="store_true",
+                        help="read every pack back and compare it with its locale")
+
+
+def run(args, session):
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    sizes = {}
+    for lang in args.langs or LANGUAGES:
+        if not locale_exists(lang, session.locales_dir):
+            continue
+        locale = session.locale(lang)
+        path = out / f"{lang}{SUFFIX}"
+        with profiling.phase("pack", path):
+            data = build(lang, leaves(locale))
+            path.write_bytes(data)
+        if args.check:
+            expected = {key_hashes(dotted(p)): v for p, v in leaves(locale)}
+            if read(data) != expected:
+                raise SystemExit(f"pack: {path} does not read back as {lang}")
+        sizes[lang] = len(data)
+    print(f"Wrote {len(sizes)} packs ({sum(sizes.values()) / 1024:.0f} KB) to {out}")
+    return sizes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, "pack"):
+        run(args, Session())
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,313 @@
+"""Declarative locale patches and the ledger of applied patches.
+
+Patches live in ``i18n/patches/`` as ``NNNN-description.json`` (or
+``.yaml``) and are applied in file-name order. Each holds a list of
+operations::
+
+    {
+      "description": "Privacy page copy",
+      "operations": [
+        {"op": "add", "lang": "en", "tree": {"privacyPage": {"title": "Privacy Policy"}}},
+        {"op": "add", "key": "common.retry", "values": {"en": "Retry", "ar": "إعادة المحاولة"}},
+        {"op": "set", "key": "common.save", "values": {"en": "Save changes"}},
+        {"op": "rename", "key": "reports.tax.rate", "to": "taxRate"},
+        {"op": "move", "key": "trialBalancePage", "to": "reports.trialBalance"},
+        {"op": "delete", "key": "legacy.banner", "langs": ["fr", "de"]}
+      ]
+    }
+
+``add`` never overwrites an existing value; ``set`` does. ``rename``
+changes the last segment of a key or namespace, ``move`` puts it anywhere.
+``rename``, ``move`` and ``delete`` apply to every locale unless ``langs``
+narrows them; a missing key in some locale is not an error. Keys are dotted
+strings, or lists of segments for the few keys that contain dots.
+
+A patch is applied to all locales at once and only if every operation
+succeeds. ``patches/ledger.json`` records each applied patch with the
+SHA-256 of its file, so a run only reads patches it has not seen; already
+applied ones are not re-read unless ``--verify`` asks to check that they
+were not edited afterwards.
+
+Usage: python -m i18n.patch [--list] [--verify] [--dry-run] [--dir DIR]
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+
+from . import profiling
+from .exchange import set_path
+from .merge import read_fragment
+from .paths import LANGUAGES
+from .session import Session
+from .store import dotted, get_path, iter_leaves
+
+PATCH_DIR = Path(__file__).resolve().parent / "patches"
+LEDGER_NAME = "ledger.json"
+PATCH_SUFFIXES = (".json", ".yaml", ".yml")
+
+
+class PatchError(Exception):
+    pass
+
+
+def patch_files(patch_dir=PATCH_DIR):
+    """Return patch files in application order."""
+    return sorted(
+        p for p in Path(patch_dir).iterdir()
+        if p.suffix in PATCH_SUFFIXES and p.name != LEDGER_NAME and p.name[:1].isdigit()
+    )
+
+
+def load_ledger(patch_dir=PATCH_DIR):
+    path = Path(patch_dir) / LEDGER_NAME
+    if not path.exists():
+        return {}
+    entries = json.loads(path.read_text(encoding="utf-8"))["applied"]
+    return {entry["patch"]: entry for entry in entries}
+
+
+def write_ledger(ledger, patch_dir=PATCH_DIR):
+    path = Path(patch_dir) / LEDGER_NAME
+    entries = sorted(ledger.values(), key=lambda entry: entry["patch"])
+    path.write_text(json.dumps({"applied": entries}, indent=2, ensure_ascii=False) + "\n",
+                    encoding="utf-8")
+
+
+def file_hash(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _key(value):
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, str) and value:
+        return tuple(value.split("."))
+    raise PatchError(f"bad key {value!r}")
+
+
+def _shape_conflict(tree, path):
+    """Return the dotted prefix of ``path`` that is a string in ``tree``, if any."""
+    for i in range(1, len(path)):
+        if isinstance(get_path(tree, path[:i]), (str, list)):
+            return dotted(path[:i])
+    return None
+
+
+def _pop(tree, path):
+    """Remove and return the value at ``path``; prune emptied namespaces."""
+    nodes = [tree]
+    for part in path[:-1]:
+        node = nodes[-1].get(part)
+        if not isinstance(node, dict):
+            return None
+        nodes.append(node)
+    value = nodes[-1].pop(path[-1], None)
+    if value is not None:
+        for depth in range(len(path) - 1, 0, -1):
+            if nodes[depth]:
+                break
+            del nodes[depth - 1][path[depth - 1]]
+    return value
+
+
+class _Patch:
+    """Applies one patch's operations to copy-on-write locale trees."""
+
+    def __init__(self, session, langs):
+        self.session = session
+        self.langs = langs
+        self.trees = {}
+        self.changed = set()
+        self.stats = {"added": 0, "set": 0, "skipped": 0, "renamed": 0, "moved": 0, "deleted": 0}
+
+    def tree(self, lang):
+        if lang not in self.trees:
+            self.trees[lang] = copy.deepcopy(self.session.tree(lang))
+        return self.trees[lang]
+
+    def _write(self, lang, path, value, overwrite):
+        if lang not in self.langs:
+            raise PatchError(f"unknown language {lang!r}")
+        tree = self.tree(lang)
+        conflict = _shape_conflict(tree, path)
+        current = get_path(tree, path)
+        if conflict or isinstance(current, dict) != isinstance(value, dict) and current is not None:
+            raise PatchError(f"{lang}: {dotted(path)} conflicts with {conflict or dotted(path)}")
+        if current is not None and not overwrite:
+            self.stats["skipped"] += 1
+            return
+        set_path(tree, path, value)
+        self.changed.add(lang)
+        self.stats["set" if current is not None else "added"] += 1
+
+    def add(self, op, overwrite=False):
+        if "tree" in op:
+            lang = op.get("lang")
+            if lang is None:
+                raise PatchError("'tree' operations need a 'lang'")
+            prefix = _key(op["key"]) if "key" in op else ()
+            for path, value in iter_leaves(op["tree"]):
+                self._write(lang, prefix + path, value, overwrite)
+            return
+        path = _key(op.get("key"))
+        values = op.get("values")
+        if values is None:
+            if "lang" not in op or "value" not in op:
+                raise PatchError(f"{dotted(path)}: give 'values' or 'lang' and 'value'")
+            values = {op["lang"]: op["value"]}
+        for lang, value in values.items():
+            self._write(lang, path, value, overwrite)
+
+    def relocate(self, op, kind):
+        path = _key(op.get("key"))
+        if kind == "rename":
+            if "." in op["to"]:
+                raise PatchError(f"rename {dotted(path)}: 'to' is a single segment; use move")
+            target = path[:-1] + (op["to"],)
+        else:
+            target = _key(op["to"])
+        for lang in op.get("langs", self.langs):
+            tree = self.tree(lang)
+            if get_path(tree, path) is None:
+                continue
+            if get_path(tree, target) is not None or _shape_conflict(tree, target):
+                raise PatchError(f"{lang}: cannot {kind} {dotted(path)} to {dotted(target)}; "
+                                 "the target exists")
+            set_path(tree, target, _pop(tree, path))
+            self.changed.add(lang)
+            self.stats["renamed" if kind == "rename" else "moved"] += 1
+
+    def delete(self, op):
+        path = _key(op.get("key"))
+        for lang in op.get("langs", self.langs):
+            if _pop(self.tree(lang), path) is not None:
+                self.changed.add(lang)
+                self.stats["deleted"] += 1
+
+    def apply(self, operations):
+        for n, op in enumerate(operations, 1):
+            kind = op.get("op")
+            try:
+                if kind in ("add", "set"):
+                    self.add(op, overwrite=kind == "set")
+                elif kind in ("rename", "move"):
+                    self.relocate(op, kind)
+                elif kind == "delete":
+                    self.delete(op)
+                else:
+                    raise PatchError(f"unknown op {kind!r}")
+            except (KeyError, TypeError) as e:
+                raise PatchError(f"operation {n} ({kind}): malformed ({e})") from None
+            except PatchError as e:
+                raise PatchError(f"operation {n} ({kind}): {e}") from None
+
+    def commit(self):
+        # Only the locales an operation changed; the rest were only looked at.
+        for lang in sorted(self.changed):
+            self.session.replace(lang, self.trees[lang])
+
+
+def apply_patch(path, session, langs=LANGUAGES):
+    """Apply one patch file to ``session``; returns the operation counts."""
+    patch = read_fragment(path)
+    runner = _Patch(session, langs)
+    with profiling.phase("patch", path):
+        runner.apply(patch.get("operations", []))
+    runner.commit()
+    return runner.stats
+
+
+def pending(patch_dir=PATCH_DIR):
+    """Return ``(patches not in the ledger, ledger)``; applied ones are not read."""
+    ledger = load_ledger(patch_dir)
+    return [p for p in patch_files(patch_dir) if p.name not in ledger], ledger
+
+
+def verify(patch_dir=PATCH_DIR):
+    """Return names of applied patches whose file changed or disappeared."""
+    ledger = load_ledger(patch_dir)
+    drifted = []
+    for name, entry in ledger.items():
+        path = Path(patch_dir) / name
+        if not path.exists() or file_hash(path) != entry["sha256"]:
+            drifted.append(name)
+    return drifted
+
+
+def run_pending(session, patch_dir=PATCH_DIR, dry_run=False):
+    """Apply every pending patch in order, stopping at the first failure.
+
+    Returns ``(applied_names, failed_name_or_None)``.
+    """
+    todo, ledger = pending(patch_dir)
+    applied = []
+    failed = None
+    for path in todo:
+        try:
+            stats = apply_patch(path, session)
+        except PatchError as e:
+            print(f"{path.name}: {e}; not applied")
+            failed = path.name
+            break
+        summary = ", ".join(f"{n} {kind}" for kind, n in stats.items() if n)
+        print(f"{path.name}: {summary or 'no changes'}")
+        ledger[path.name] = {"patch": path.name, "sha256": file_hash(path),
+                             "applied": time.strftime("%Y-%m-%d")}
+        applied.append(path.name)
+    if applied and not dry_run:
+        session.flush()
+        write_ledger(ledger, patch_dir)
+    return applied, failed
+
+
+def add_arguments(parser):
+    parser.add_argument("--dir", default=PATCH_DIR, help="patch directory")
+    parser.add_argument("--list", action="store_true", help="show applied and pending patches")
+    parser.add_argument("--verify", action="store_true",
+                        help="check applied patches were not edited since")
+    parser.add_argument("--dry-run", action="store_true", help="report without writing")
+
+
+def run(args, session):
+    if args.list:
+        todo, ledger = pending(args.dir)
+        for name, entry in sorted(ledger.items()):
+            print(f"  applied {entry['applied']}  {name}")
+        for path in todo:
+            print(f"  pending             {path.name}")
+        return []
+    if args.verify:
+        drifted = verify(args.dir)
+        for name in drifted:
+            print(f"  {name} changed after it was applied; add a new patch instead")
+        if drifted:
+            raise SystemExit(1)
+    if args.dry_run:
+        # Work on a throwaway session so nothing reaches the files.
+        session = Session(session.locales_dir)
+    applied, failed = run_pending(session, args.dir, args.dry_run)
+    if not applied and not failed:
+        print("No pending patches")
+    if failed:
+        raise SystemExit(1)
+    return applied
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, "patch"):
+        run(args, Session())
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
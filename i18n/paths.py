@@ -0,0 +1,32 @@
+"""Well-known locations and language lists used across the i18n tooling."""
+
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CLIENT_SRC = ROOT / "client" / "src"
+LOCALES_DIR = CLIENT_SRC / "locales"
+# Source documents of the legal pages (see i18n.legal)
+LEGAL_DIR = ROOT / "client" / "content" / "legal"
+
+# Same order as the `languages` list in client/src/lib/i18n.ts
+LANGUAGES = [
+    "en", "ar", "fr", "es", "de", "zh", "ja", "ko", "ru",
+    "hi", "ur", "tl", "bn", "ms", "tr", "pt", "id",
+]
+
+SOURCE_LANG = "en"
+REFERENCE_LANG = "ar"
+
+
+def locale_path(lang, locales_dir=LOCALES_DIR):
+    return Path(locales_dir) / lang / "translation.json"
+
+
+def index_path(lang, locales_dir=LOCALES_DIR):
+    """The namespace index of a language split into shards (see i18n.shards)."""
+    return Path(locales_dir) / lang / "index.json"
+
+
+def locale_exists(lang, locales_dir=LOCALES_DIR):
+    """Whether ``lang`` has a locale, in either on-disk layout."""
+    return locale_path(lang, locales_dir).exists() or index_path(lang, locales_dir).exists()
@@ -0,0 +1,268 @@
+"""gettext PO export and import for translation vendors.
+
+Every key becomes one entry with the dotted key as ``msgctxt`` and the
+English text as ``msgid``. The Arabic reference, translator note and
+placeholders are written as extracted comments (``#.``). i18next plural
+families (``key_one``/``key_other``) are folded into a single
+``msgid``/``msgid_plural`` entry using the language's Plural-Forms. Array
+items (the legal pages' ``points``) are exported as ``key[0]``, ``key[1]``...
+
+Both directions stream: export writes entries as it walks the English tree,
+import parses line by line.
+
+Usage:
+    python -m i18n.po export [--out i18n-reports/po] [lang ...]
+    python -m i18n.po import FILE [FILE ...]
+"""
+
+import argparse
+import re
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+
+from . import profiling
+from .exchange import (
+    VENDOR_LANGUAGES,
+    KeyResolver,
+    apply_translations,
+    placeholders,
+    plural_forms,
+    plural_split,
+    source_rows,
+)
+from .paths import LOCALES_DIR, REFERENCE_LANG, ROOT, SOURCE_LANG
+from .store import dotted, get_path, iter_leaves, load_locale
+
+DEFAULT_OUT = ROOT / "i18n-reports" / "po"
+
+_ITEM_SUFFIX = re.compile(r"^(.*)\[(\d+)\]$")
+_ESCAPES = {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\t": "\\t", "\r": "\\r"}
+_UNESCAPES = {"\\": "\\", '"': '"', "n": "\n", "t": "\t", "r": "\r"}
+
+
+def _quote(text):
+    return '"' + "".join(_ESCAPES.get(c, c) for c in text) + '"'
+
+
+def _unquote(text):
+    text = text.strip()[1:-1]
+    return re.sub(r"\\(.)", lambda m: _UNESCAPES.get(m.group(1), m.group(1)), text)
+
+
+class _Writer:
+    def __init__(self, stream, lang):
+        self.stream = stream
+        self.lang = lang
+        self.entries = 0
+        header, self.categories = plural_forms(lang)
+        stream.write('msgid ""\nmsgstr ""\n')
+        for line in (
+            "Content-Type: text/plain; charset=UTF-8",
+            "Content-Transfer-Encoding: 8bit",
+            f"Language: {lang}",
+            f"Plural-Forms: {header}",
+            f"X-Source-Language: {SOURCE_LANG}",
+        ):
+            stream.write(_quote(line + "\n") + "\n")
+
+    def _comments(self, texts, reference, note):
+        if reference is not None:
+            ref = "\n".join(reference) if isinstance(reference, list) else str(reference)
+            for line in ref.splitlines() or [""]:
+                self.stream.write(f"#. {REFERENCE_LANG}: {line}\n")
+        if note:
+            self.stream.write(f"#. note: {note}\n")
+        names = [p for text in texts for p in placeholders(text)]
+        if names:
+            self.stream.write(f"#. placeholders: {', '.join(dict.fromkeys(names))}\n")
+
+    def entry(self, context, source, target, reference=None, note=None):
+        self.entries += 1
+        self.stream.write("\n")
+        self._comments([source], reference, note)
+        self.stream.write(f"msgctxt {_quote(context)}\nmsgid {_quote(source)}\n")
+        self.stream.write(f"msgstr {_quote(target or '')}\n")
+
+    def plural_entry(self, context, sources, targets, reference=None, note=None):
+        """``sources``/``targets`` map plural category to text."""
+        self.entries += 1
+        self.stream.write("\n")
+        self._comments(list(sources.values()), reference, note)
+        singular = sources.get("one", sources.get("other", ""))
+        plural = sources.get("other", singular)
+        self.stream.write(f"msgctxt {_quote(context)}\n")
+        self.stream.write(f"msgid {_quote(singular)}\nmsgid_plural {_quote(plural)}\n")
+        for i, category in enumerate(self.categories):
+            self.stream.write(f"msgstr[{i}] {_quote(targets.get(category) or '')}\n")
+
+
+def _plural_families(source):
+    """Return ``{base_path: {category: path}}`` for complete plural families."""
+    families = {}
+    for path, _ in iter_leaves(source):
+        split = plural_split(path)
+        if split:
+            families.setdefault(split[0], {})[split[1]] = path
+    return {base: members for base, members in families.items()
+            if "one" in members and "other" in members}
+
+
+def export(langs=VENDOR_LANGUAGES, out_dir=DEFAULT_OUT, locales_dir=LOCALES_DIR, notes=None):
+    """Write ``<out_dir>/<lang>.po`` for every language in one pass."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    source = load_locale(SOURCE_LANG, locales_dir)
+    reference = load_locale(REFERENCE_LANG, locales_dir)
+    targets = {lang: dict(iter_leaves(load_locale(lang, locales_dir))) for lang in langs}
+    families = _plural_families(source)
+    family_of = {path: base for base, members in families.items() for path in members.values()}
+    source_leaves = dict(iter_leaves(source))
+    reference_leaves = dict(iter_leaves(reference))
+
+    with profiling.phase("export"), ExitStack() as stack:
+        writers = {}
+        for lang in langs:
+            stream = stack.enter_context(open(out_dir / f"{lang}.po", "w", encoding="utf-8"))
+            writers[lang] = _Writer(stream, lang)
+        for path, value, ref, note in source_rows(source, reference, notes):
+            base = family_of.get(path)
+            if base is not None:
+                members = families[base]
+                # Emit the family once, at the position of its "one" form.
+                if path != members["one"]:
+                    continue
+                sources = {cat: source_leaves[p] for cat, p in members.items()}
+                for lang, writer in writers.items():
+                    lang_targets = {cat: targets[lang].get(base[:-1] + (f"{base[-1]}_{cat}",))
+                                    for cat in writer.categories}
+                    writer.plural_entry(dotted(base), sources, lang_targets,
+                                        reference_leaves.get(path), note)
+                continue
+            key = dotted(path)
+            for lang, writer in writers.items():
+                target = targets[lang].get(path)
+                if isinstance(value, list):
+                    target = target if isinstance(target, list) else []
+                    refs = ref if isinstance(ref, list) else []
+                    for i, item in enumerate(value):
+                        writer.entry(f"{key}[{i}]", item,
+                                     target[i] if i < len(target) else None,
+                                     refs[i] if i < len(refs) else None, note)
+                else:
+                    writer.entry(key, str(value), target if isinstance(target, str) else None,
+                                 ref, note)
+    return {lang: writer.entries for lang, writer in writers.items()}
+
+
+def read(path):
+    """Yield ``(lang, context, msgstrs)`` per entry; ``msgstrs`` is a list
+    indexed like ``msgstr[n]`` (a single item for non-plural entries)."""
+    lang = None
+    entry = {}
+    field = None
+
+    def flush():
+        nonlocal lang
+        if "msgid" not in entry:
+            return None
+        if entry.get("msgid") == "" and "msgctxt" not in entry:
+            match = re.search(r"^Language: *(\S+)", entry.get("msgstr", {}).get(0, ""), re.M)
+            if match:
+                lang = match.group(1)
+            return None
+        strs = entry.get("msgstr", {})
+        return lang, entry.get("msgctxt"), [strs.get(i, "") for i in range(len(strs))]
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line.strip() or line.startswith("#"):
+                if line.strip() == "" and entry:
+                    item = flush()
+                    if item:
+                        yield item
+                    entry, field = {}, None
+                continue
+            if line.startswith('"'):
+                if field is not None:
+                    name, index = field
+                    if name == "msgstr":
+                        entry["msgstr"][index] += _unquote(line)
+                    else:
+                        entry[name] += _unquote(line)
+                continue
+            keyword, _, rest = line.partition(" ")
+            match = re.match(r"msgstr\[(\d+)\]$", keyword)
+            if match or keyword == "msgstr":
+                index = int(match.group(1)) if match else 0
+                entry.setdefault("msgstr", {})[index] = _unquote(rest)
+                field = ("msgstr", index)
+            elif keyword in ("msgctxt", "msgid", "msgid_plural"):
+                entry[keyword] = _unquote(rest)
+                field = (keyword, None)
+    if entry:
+        item = flush()
+        if item:
+            yield item
+
+
+def import_files(paths, locales_dir=LOCALES_DIR):
+    """Merge translated entries from PO files into the locale files."""
+    source = load_locale(SOURCE_LANG, locales_dir)
+    resolver = KeyResolver(source)
+    families = _plural_families(source)
+    counts = {}
+    for path in paths:
+        items = {}
+        lists = {}
+        lang = None
+        with profiling.phase("import", path):
+            for lang, context, strs in read(path):
+                if not context or not any(strs):
+                    continue
+                item = _ITEM_SUFFIX.match(context)
+                if item:
+                    key_path = resolver.resolve(item.group(1))
+                    lists.setdefault(key_path, {})[int(item.group(2))] = strs[0]
+                    continue
+                base = resolver.resolve(context)
+                if base in families:
+                    for category, text in zip(plural_forms(lang)[1], strs):
+                        if text:
+                            items[base[:-1] + (f"{base[-1]}_{category}",)] = text
+                elif strs[0]:
+                    items[base] = strs[0]
+            for key_path, parts in lists.items():
+                size = len(get_path(source, key_path) or ()) or max(parts) + 1
+                items[key_path] = [parts.get(i) for i in range(size)]
+        if lang and items:
+            counts[lang] = counts.get(lang, 0) + apply_translations(
+                lang, items.items(), locales_dir
+            )
+    return counts
+
+
+@profiling.command("po")
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    exp = sub.add_parser("export", help="write one .po per language")
+    exp.add_argument("langs", nargs="*", help="languages (default: the 15 vendor languages)")
+    exp.add_argument("--out", default=DEFAULT_OUT)
+    imp = sub.add_parser("import", help="merge translated .po files into the locales")
+    imp.add_argument("files", nargs="+")
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        counts = export(args.langs or VENDOR_LANGUAGES, args.out)
+        print(f"Exported {sum(counts.values())} entries for {len(counts)} languages to {args.out}")
+    else:
+        counts = import_files(args.files)
+        for lang, count in counts.items():
+            print(f"Imported {count} keys into {lang}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
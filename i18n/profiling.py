@@ -0,0 +1,279 @@
+"""Per-phase timing, memory and I/O instrumentation for the i18n commands.
+
+Library code marks its phases with ``profiling.phase(name, file)``; that is
+a no-op unless a command was started with ``--profile``. Each phase records
+wall time, peak RSS and bytes read/written (from ``/proc/self/io``, so it
+counts everything the process reads, not just what we remember to count).
+Phases nest: a phase's numbers include its children.
+
+``--profile`` prints an aggregated table at the end of the run.
+``--profile-out DIR`` additionally writes ``<command>.json`` with every
+record and ``<command>.folded``, a sampled call-stack profile in the
+collapsed format flamegraph.pl and speedscope read (stacks are prefixed
+with the phases active at the time). ``--cprofile`` adds a deterministic
+``<command>.prof`` for pstats/snakeviz. Only the main process is sampled;
+work done in ``--jobs`` worker processes shows up as wall time only.
+
+A command enables the flags either by adding them to its parser
+(:func:`add_arguments`) and running inside :func:`session`, or by
+decorating its ``main(argv)`` with :func:`command`.
+
+Peak RSS is per phase on Linux (the high-water mark is reset through
+``/proc/self/clear_refs`` when a phase starts); elsewhere it is the process
+peak so far.
+"""
+
+import argparse
+import cProfile
+import functools
+import json
+import resource
+import signal
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+from .paths import ROOT
+
+DEFAULT_OUT = ROOT / "i18n-reports" / "profile"
+SAMPLE_INTERVAL = 0.002
+
+_active = None
+
+
+def _read_io():
+    try:
+        with open("/proc/self/io", "rb") as f:
+            fields = dict(line.split(b":") for line in f.read().splitlines())
+        return int(fields[b"rchar"]), int(fields[b"wchar"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _read_hwm():
+    """Return the resident-set high-water mark in bytes."""
+    try:
+        with open("/proc/self/status", "rb") as f:
+            for line in f:
+                if line.startswith(b"VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _reset_hwm():
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+class _Frame:
+    __slots__ = ("name", "file", "started", "io", "peak")
+
+    def __init__(self, name, file):
+        self.name = name
+        self.file = file
+        self.started = time.perf_counter()
+        self.io = _read_io()
+        self.peak = 0
+
+
+class Profiler:
+    """Collects phase records and, optionally, sampled stacks and cProfile data."""
+
+    def __init__(self, sample=False, cprofile=False, interval=SAMPLE_INTERVAL):
+        self.records = {}
+        self.stack = []
+        self.samples = Counter() if sample else None
+        self.cprofile = cProfile.Profile() if cprofile else None
+        self.interval = interval
+        self.started = None
+        self.wall = 0.0
+
+    # -- phases -------------------------------------------------------------
+
+    @contextmanager
+    def phase(self, name, file=None):
+        hwm = _read_hwm()
+        for frame in self.stack:
+            frame.peak = max(frame.peak, hwm)
+        _reset_hwm()
+        frame = _Frame(name, str(file) if file is not None else None)
+        self.stack.append(frame)
+        try:
+            yield frame
+        finally:
+            elapsed = time.perf_counter() - frame.started
+            frame.peak = max(frame.peak, _read_hwm())
+            io = _read_io()
+            self.stack.pop()
+            for parent in self.stack:
+                parent.peak = max(parent.peak, frame.peak)
+            record = self.records.setdefault((name, frame.file), [0, 0.0, 0, 0, 0])
+            record[0] += 1
+            record[1] += elapsed
+            record[2] = max(record[2], frame.peak)
+            if io and frame.io:
+                record[3] += io[0] - frame.io[0]
+                record[4] += io[1] - frame.io[1]
+
+    # -- sampling -----------------------------------------------------------
+
+    def _sample(self, signum, frame):
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{Path(code.co_filename).name}:{code.co_name}")
+            frame = frame.f_back
+        phases = [f"[{f.name}]" for f in self.stack]
+        self.samples[";".join(phases + stack[::-1])] += 1
+
+    def start(self):
+        self.started = time.perf_counter()
+        if self.samples is not None and hasattr(signal, "setitimer"):
+            signal.signal(signal.SIGPROF, self._sample)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        if self.cprofile is not None:
+            self.cprofile.enable()
+
+    def stop(self):
+        if self.cprofile is not None:
+            self.cprofile.disable()
+        if self.samples is not None and hasattr(signal, "setitimer"):
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, signal.SIG_DFL)
+        self.wall = time.perf_counter() - self.started
+
+    # -- output -------------------------------------------------------------
+
+    def phases(self):
+        """Return ``{phase: [calls, files, wall, peak, read, written]}``."""
+        totals = {}
+        for (name, file), (calls, wall, peak, read, written) in self.records.items():
+            row = totals.setdefault(name, [0, 0, 0.0, 0, 0, 0])
+            row[0] += calls
+            row[1] += file is not None
+            row[2] += wall
+            row[3] = max(row[3], peak)
+            row[4] += read
+            row[5] += written
+        return totals
+
+    def report(self, stream=sys.stderr, top=10):
+        print(f"\nProfile ({self.wall * 1000:.0f} ms total, peak RSS "
+              f"{_read_hwm() / 2**20:.1f} MB at exit)", file=stream)
+        print(f"{'phase':<16}{'calls':>7}{'files':>7}{'wall ms':>11}{'peak MB':>10}"
+              f"{'read KB':>11}{'written KB':>12}", file=stream)
+        for name, (calls, files, wall, peak, read, written) in sorted(
+                self.phases().items(), key=lambda item: -item[1][2]):
+            print(f"{name:<16}{calls:>7}{files:>7}{wall * 1000:>11.1f}{peak / 2**20:>10.1f}"
+                  f"{read / 1024:>11.0f}{written / 1024:>12.0f}", file=stream)
+        per_file = sorted(((wall, name, file) for (name, file), (_, wall, *_) in self.records.items()
+                           if file is not None), reverse=True)[:top]
+        if per_file:
+            print("slowest files:", file=stream)
+            for wall, name, file in per_file:
+                print(f"  {wall * 1000:9.1f} ms  {name:<10} {_relative(file)}", file=stream)
+
+    def dump(self, out_dir, label):
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        written = []
+        records = [
+            {"phase": name, "file": _relative(file) if file else None, "calls": calls,
+             "wall": wall, "peakRss": peak, "bytesRead": read, "bytesWritten": written_}
+            for (name, file), (calls, wall, peak, read, written_) in self.records.items()
+        ]
+        path = out_dir / f"{label}.json"
+        path.write_text(json.dumps({"wall": self.wall, "records": records}, indent=2) + "\n",
+                        encoding="utf-8")
+        written.append(path)
+        if self.samples:
+            path = out_dir / f"{label}.folded"
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, count in self.samples.most_common():
+                    f.write(f"{stack} {count}\n")
+            written.append(path)
+        if self.cprofile is not None:
+            path = out_dir / f"{label}.prof"
+            self.cprofile.dump_stats(path)
+            written.append(path)
+        return written
+
+
+def _relative(file):
+    try:
+        return str(Path(file).resolve().relative_to(ROOT))
+    except ValueError:
+        return str(file)
+
+
+def phase(name, file=None):
+    """Context manager marking a phase; free when profiling is off."""
+    if _active is None:
+        return nullcontext()
+    return _active.phase(name, file)
+
+
+def active():
+    return _active
+
+
+def add_arguments(parser):
+    group = parser.add_argument_group("profiling")
+    group.add_argument("--profile", action="store_true",
+                       help="print per-phase time, peak RSS and I/O at the end")
+    group.add_argument("--profile-out", metavar="DIR",
+                       help="also write phase records and sampled stacks (.folded) to DIR")
+    group.add_argument("--cprofile", action="store_true",
+                       help="also write a cProfile .prof (implies --profile)")
+
+
+@contextmanager
+def session(args, label):
+    """Profile the enclosed block if ``args`` asked for it."""
+    global _active
+    enabled = getattr(args, "profile", False) or getattr(args, "profile_out", None) \
+        or getattr(args, "cprofile", False)
+    if not enabled or _active is not None:
+        # Nested sessions (chained commands) report through the outer one.
+        yield _active
+        return
+    out_dir = getattr(args, "profile_out", None) or (DEFAULT_OUT if args.cprofile else None)
+    profiler = Profiler(sample=out_dir is not None, cprofile=args.cprofile)
+    _active = profiler
+    profiler.start()
+    try:
+        with profiler.phase(label):
+            yield profiler
+    finally:
+        profiler.stop()
+        _active = None
+        profiler.report()
+        if out_dir is not None:
+            for path in profiler.dump(out_dir, label.replace(" ", "-")):
+                print(f"Wrote {_relative(path)}", file=sys.stderr)
+
+
+def command(label):
+    """Decorate a command's ``main(argv)`` to take the profiling flags.
+
+    The flags are taken out of ``argv`` before ``main`` parses the rest, and
+    ``main`` runs inside :func:`session`.
+    """
+    def decorate(main):
+        @functools.wraps(main)
+        def wrapper(argv=None):
+            parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+            add_arguments(parser)
+            args, rest = parser.parse_known_args(sys.argv[1:] if argv is None else argv)
+            with session(args, label):
+                return main(rest)
+        return wrapper
+    return decorate
@@ -0,0 +1,365 @@
+"""Find keys and values across every locale: ``i18n grep``.
+
+The index holds one cell per (locale, key) with its value and the byte
+span of the entry in that locale's file (from :mod:`i18n.jsontok`):
+
+* a prefix trie over key segments answers ``reports.tax`` (every key under
+  it) and ``reports.ta`` (a partial last segment) without a scan; globs
+  use the trie for their literal prefix and match the rest;
+* a trigram index over case-folded values narrows substring queries (and
+  regexes with a literal run of three or more characters) to the few cells
+  that contain every trigram before checking them.
+
+Building reads all 17 files once; the built index is pickled under
+``.i18n-cache/query/`` keyed by the files' SHA-1, so later queries load it
+warm and answer in milliseconds.
+
+Usage:
+    python -m i18n.query reports.tax            # keys under a prefix
+    python -m i18n.query 'settings.*.title'     # glob
+    python -m i18n.query -E 'Page\\.title$'      # key regex
+    python -m i18n.query --value 'in stock'     # value substring (-E: regex)
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import pickle
+import re
+import sys
+import time
+from array import array
+from pathlib import Path
+
+from . import jsontok, profiling
+from .paths import LANGUAGES, LOCALES_DIR, ROOT, locale_exists
+from .shards import files as locale_files
+from .store import dotted
+
+CACHE_DIR = ROOT / ".i18n-cache" / "query"
+INDEX_VERSION = 2
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+
+class Trie:
+    """Key segments -> child nodes; each node lists the key ids ending there."""
+
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children = {}
+        self.ids = []
+
+    def insert(self, path, key_id):
+        node = self
+        for part in path:
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = Trie()
+            node = child
+        node.ids.append(key_id)
+
+    def node(self, path):
+        node = self
+        for part in path:
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def collect(self):
+        """Every key id at or below this node, in insertion order per level."""
+        ids = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            ids += node.ids
+            stack += reversed(node.children.values())
+        return ids
+
+    def prefix(self, text):
+        """Key ids under ``text``: whole segments, the last one possibly partial."""
+        *parents, last = text.split(".")
+        node = self.node(parents)
+        if node is None:
+            return []
+        ids = []
+        for name, child in node.children.items():
+            if name.startswith(last):
+                ids += child.collect()
+        return ids
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _literal_runs(pattern):
+    """Literal substrings every match of ``pattern`` must contain (best effort)."""
+    try:
+        import re._parser as parser
+    except ImportError:  # Python < 3.11
+        import sre_parse as parser
+    try:
+        parsed = parser.parse(pattern)
+    except re.error:
+        return []
+    if any(op is parser.BRANCH for op, _ in parsed):
+        return []
+    runs, current = [], []
+    for op, arg in parsed:
+        if op is parser.LITERAL:
+            current.append(chr(arg))
+            continue
+        if op is not parser.AT:
+            runs.append("".join(current))
+            current = []
+    runs.append("".join(current))
+    return [run for run in runs if len(run) >= 3]
+
+
+class Index:
+    def __init__(self, langs, files):
+        self.langs = list(langs)
+        self.files = [str(f) for f in files]
+        self.keys = []          # key id -> path tuple
+        self.key_cells = []     # key id -> [cell id, ...]
+        self.cell_key = array("I")
+        self.cell_lang = array("B")
+        self.cell_file = array("H")
+        self.cell_start = array("I")
+        self.cell_end = array("I")
+        self.cell_value = []    # raw JSON text of the value
+        self.folded = []        # case-folded searchable text
+        self.trie = Trie()
+        self.trigrams = {}      # trigram -> array of cell ids
+
+    @classmethod
+    def build(cls, langs=LANGUAGES, locales_dir=LOCALES_DIR):
+        present = [lang for lang in langs if locale_exists(lang, locales_dir)]
+        # A sharded locale contributes one file per namespace.
+        files = [(lang_id, path, prefix) for lang_id, lang in enumerate(present)
+                 for path, prefix in locale_files(lang, locales_dir)]
+        index = cls(present, [path for _, path, _ in files])
+        key_ids = {}
+        with profiling.phase("index"):
+            for file_id, (lang_id, path, prefix) in enumerate(files):
+                data = path.read_bytes()
+                for leaf in jsontok.leaves(data):
+                    key = prefix + leaf.path
+                    key_id = key_ids.get(key)
+                    if key_id is None:
+                        key_id = key_ids[key] = len(index.keys)
+                        index.keys.append(key)
+                        index.key_cells.append([])
+                        index.trie.insert(key, key_id)
+                    cell = len(index.cell_value)
+                    index.key_cells[key_id].append(cell)
+                    index.cell_key.append(key_id)
+                    index.cell_lang.append(lang_id)
+                    index.cell_file.append(file_id)
+                    index.cell_start.append(leaf.start)
+                    index.cell_end.append(leaf.end)
+                    raw = data[leaf.value_start:leaf.end].decode("utf-8")
+                    index.cell_value.append(raw)
+                    value = leaf.value
+                    text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+                    index.folded.append(text.casefold())
+            postings = {}
+            for cell, text in enumerate(index.folded):
+                for gram in _trigrams(text):
+                    postings.setdefault(gram, []).append(cell)
+            index.trigrams = {gram: array("I", cells) for gram, cells in postings.items()}
+        return index
+
+    def state(self):
+        """Plain data to cache; the trie is rebuilt from ``keys`` on load.
+
+        Only builtins and arrays are pickled, so the cache does not depend
+        on whether this module ran as ``__main__``.
+        """
+        return {name: value for name, value in vars(self).items() if name != "trie"}
+
+    @classmethod
+    def from_state(cls, state):
+        index = cls.__new__(cls)
+        vars(index).update(state)
+        index.trie = Trie()
+        for key_id, path in enumerate(index.keys):
+            index.trie.insert(path, key_id)
+        return index
+
+    # -- key queries ---------------------------------------------------------
+
+    def keys_prefix(self, prefix):
+        return self.trie.prefix(prefix)
+
+    def keys_glob(self, pattern):
+        literal = _GLOB_CHARS.split(pattern, 1)[0]
+        candidates = self.trie.prefix(literal) if literal else range(len(self.keys))
+        regex = re.compile(fnmatch.translate(pattern))
+        return [k for k in candidates if regex.match(dotted(self.keys[k]))]
+
+    def keys_regex(self, pattern, flags=0):
+        regex = re.compile(pattern, flags)
+        return [k for k, path in enumerate(self.keys) if regex.search(dotted(path))]
+
+    # -- value queries -------------------------------------------------------
+
+    def _candidates(self, needles):
+        """Cells containing every trigram of every needle, or None for all."""
+        grams = set()
+        for needle in needles:
+            grams |= _trigrams(needle.casefold())
+        if not grams:
+            return None
+        lists = sorted((self.trigrams.get(g, ()) for g in grams), key=len)
+        cells = set(lists[0])
+        for cells_with in lists[1:]:
+            if not cells:
+                break
+            cells.intersection_update(cells_with)
+        return sorted(cells)
+
+    def values_substring(self, text):
+        needle = text.casefold()
+        candidates = self._candidates([text])
+        cells = range(len(self.folded)) if candidates is None else candidates
+        return [c for c in cells if needle in self.folded[c]]
+
+    def values_regex(self, pattern, flags=0):
+        regex = re.compile(pattern, flags)
+        # Trigrams are case-folded, so the candidates are a superset either way.
+        candidates = self._candidates(_literal_runs(pattern))
+        cells = range(len(self.folded)) if candidates is None else candidates
+        return [c for c in cells if regex.search(self._text(c))]
+
+    def _text(self, cell):
+        value = json.loads(self.cell_value[cell])
+        return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+
+    # -- results -------------------------------------------------------------
+
+    def cell(self, cell):
+        """``(lang, file, start, end, value)`` for one cell."""
+        return (self.langs[self.cell_lang[cell]], self.files[self.cell_file[cell]],
+                self.cell_start[cell],
+                self.cell_end[cell], json.loads(self.cell_value[cell]))
+
+    def results(self, key_ids, langs=None):
+        """``{dotted_key: [(lang, file, start, end, value), ...]}`` for key ids."""
+        out = {}
+        for key_id in key_ids:
+            cells = [self.cell(c) for c in self.key_cells[key_id]]
+            out[dotted(self.keys[key_id])] = [c for c in cells if not langs or c[0] in langs]
+        return out
+
+    def cell_keys(self, cells):
+        return list(dict.fromkeys(self.cell_key[c] for c in cells))
+
+
+def _fingerprint(files):
+    digest = hashlib.sha1(f"v{INDEX_VERSION}".encode())
+    for path in files:
+        digest.update(str(path).encode())
+        digest.update(hashlib.sha1(Path(path).read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def load_index(langs=LANGUAGES, locales_dir=LOCALES_DIR, cache_dir=CACHE_DIR):
+    """Return an :class:`Index`, from the on-disk cache when the files are unchanged."""
+    files = [path for lang in langs if locale_exists(lang, locales_dir)
+             for path, _ in locale_files(lang, locales_dir)]
+    entry = Path(cache_dir) / f"{_fingerprint(files)}.pickle"
+    try:
+        with profiling.phase("load index", entry), open(entry, "rb") as f:
+            return Index.from_state(pickle.load(f))
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError):
+        pass
+    index = Index.build(langs, locales_dir)
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    for stale in entry.parent.glob("*.pickle"):
+        stale.unlink()
+    tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(index.state(), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, entry)
+    return index
+
+
+def search(index, pattern, value=False, regex=False, ignore_case=False, langs=None):
+    """Return matching key ids for a key or value query (values in ``langs`` only)."""
+    flags = re.IGNORECASE if ignore_case else 0
+    if value:
+        cells = index.values_regex(pattern, flags) if regex else index.values_substring(pattern)
+        if langs:
+            wanted = {i for i, lang in enumerate(index.langs) if lang in langs}
+            cells = [c for c in cells if index.cell_lang[c] in wanted]
+        return index.cell_keys(cells)
+    if regex:
+        return index.keys_regex(pattern, flags)
+    if _GLOB_CHARS.search(pattern):
+        return index.keys_glob(pattern)
+    return index.keys_prefix(pattern)
+
+
+def _relative(path):
+    path = Path(path)
+    return path.relative_to(ROOT) if path.is_relative_to(ROOT) else path
+
+
+def add_arguments(parser):
+    parser.add_argument("pattern", help="key prefix or glob; with --value, text to find")
+    parser.add_argument("-E", "--regex", action="store_true", help="pattern is a regex")
+    parser.add_argument("-v", "--value", action="store_true", help="search values, not keys")
+    parser.add_argument("-i", "--ignore-case", action="store_true", help="case-insensitive regex")
+    parser.add_argument("--lang", action="append", help="only show these languages")
+    parser.add_argument("--limit", type=int, default=50, help="keys to show (0: all)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+
+
+def run(args, session=None):
+    # The index reads the files, so pending edits from a chain go first.
+    if session is not None:
+        session.flush()
+    started = time.perf_counter()
+    index = load_index(locales_dir=session.locales_dir if session else LOCALES_DIR)
+    loaded = time.perf_counter()
+    key_ids = search(index, args.pattern, args.value, args.regex, args.ignore_case, args.lang)
+    elapsed = (time.perf_counter() - loaded) * 1000
+    shown = key_ids[:args.limit] if args.limit else key_ids
+    results = index.results(shown, args.lang)
+    if args.json:
+        print(json.dumps({key: [{"lang": lang, "file": str(_relative(file)), "start": start,
+                                 "end": end, "value": value}
+                                for lang, file, start, end, value in cells]
+                          for key, cells in results.items()}, ensure_ascii=False, indent=2))
+        return results
+    for key, cells in results.items():
+        print(key)
+        for lang, file, start, end, value in cells:
+            text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+            if len(text) > 100:
+                text = text[:97] + "..."
+            print(f"  {lang:<3} {_relative(file)}:{start}  {text}")
+    more = f", showing {len(shown)}" if len(shown) < len(key_ids) else ""
+    print(f"{len(key_ids)} keys{more} ({len(index.cell_value)} cells; "
+          f"index {(loaded - started) * 1000:.0f} ms, query {elapsed:.1f} ms)")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, "grep"):
+        run(args)
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
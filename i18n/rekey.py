@@ -0,0 +1,358 @@
+"""Rename or move keys in every locale and every t() call site at once.
+
+Takes a batch of moves, on the command line or in a JSON/YAML mapping::
+
+    python -m i18n.rekey 'reports.tax.*' 'tax.*' common.tax tax.label
+    python -m i18n.rekey --map moves.yaml     # {"reports.tax.*": "tax.*", ...}
+
+A move applies to the key and everything under it, so ``reports.tax`` and
+``reports.tax.*`` are the same move; plural forms (``_one``, ``_other``)
+follow their base key. Moves are simultaneous: each key is moved at most
+once, by the longest source that covers it.
+
+Rewritten are:
+
+* every locale file - leaves keep their document order, and a moved leaf
+  lands in its target namespace (created where the first moved leaf was);
+  ``$t(key)`` references inside values are updated too;
+* every string literal in client/src equal to a moved key - the keys of
+  static ``t()`` calls and the key literals dynamic calls pick from;
+* the literal head of template keys (``t(`reports.tax.${x}`)``) when the
+  namespace the template builds on moves as a whole.
+
+Nothing is written until the whole batch has been checked. Conflicts are
+reported and abort the run: a target that already holds a different value
+(an equal value is merged), two keys moved onto one target with different
+values, a target that would be both a leaf and a namespace, and a dynamic
+call (see :mod:`i18n.dynkeys`) that can reach a moved key but whose
+template cannot be rewritten. The files are then replaced together: all
+new contents are written next to their originals first, then renamed over
+them, and the originals are put back if any rename fails.
+
+Usage: python -m i18n.rekey [--map MAPPING] [--dry-run] [OLD NEW ...]
+"""
+
+import argparse
+import os
+import re
+import sys
+from pathlib import Path
+
+from . import profiling, scan, tokencache
+from .codemod import apply_edits
+from .dynkeys import glob_regex
+from .exchange import set_path
+from .lexer import JSX_ATTR, STRING, T_CALL, TEMPLATE, line_index, split_args
+from .merge import read_fragment
+from .model import leaves
+from .paths import CLIENT_SRC, LANGUAGES
+from .scan import _PLURAL_SUFFIXES
+from .session import Session
+from .store import dotted, render_locale
+
+_NESTED = re.compile(r"\$t\(\s*([^,)\s]+)")
+
+
+class RekeyError(Exception):
+    pass
+
+
+def _path(key):
+    key = key[:-2] if key.endswith(".*") else key
+    if not key or key.startswith(".") or key.endswith(".") or "*" in key:
+        raise RekeyError(f"bad key {key!r}")
+    return tuple(key.split("."))
+
+
+def parse_moves(pairs):
+    """``{source_path: target_path}`` from ``(old, new)`` pairs."""
+    moves = {}
+    for old, new in pairs:
+        if old.endswith(".*") != new.endswith(".*"):
+            raise RekeyError(f"{old} -> {new}: use '.*' on both sides or neither")
+        source, target = _path(old), _path(new)
+        if source in moves and moves[source] != target:
+            raise RekeyError(f"{old} is moved twice ({dotted(moves[source])}, {new})")
+        if source != target:
+            moves[source] = target
+    if not moves:
+        raise RekeyError("no moves given")
+    return moves
+
+
+class Rekey:
+    """Maps old key paths to new ones for a batch of moves."""
+
+    def __init__(self, moves):
+        self.moves = moves
+        self.depths = sorted({len(source) for source in moves}, reverse=True)
+
+    def path(self, path):
+        """New path for ``path`` (a leaf or namespace), or None if it stays."""
+        for depth in self.depths:
+            target = self.moves.get(path[:depth])
+            if target is not None and len(path) >= depth:
+                return target + path[depth:]
+        return None
+
+    def leaf(self, path):
+        """Like :meth:`path`, also moving ``name_one`` with a moved ``name``."""
+        moved = self.path(path)
+        if moved is not None:
+            return moved
+        for suffix in _PLURAL_SUFFIXES:
+            if path[-1].endswith(suffix):
+                base = path[:-1] + (path[-1][: -len(suffix)],)
+                moved = self.path(base)
+                if moved is not None:
+                    return moved[:-1] + (moved[-1] + suffix,)
+        return None
+
+    def key(self, key):
+        moved = self.leaf(tuple(key.split(".")))
+        return dotted(moved) if moved is not None else None
+
+    def nested(self, value):
+        """``value`` with ``$t(key)`` references to moved keys updated."""
+        if "$t(" not in value:
+            return value
+        return _NESTED.sub(lambda m: m.group(0).replace(m.group(1), self.key(m.group(1)) or m.group(1)),
+                           value)
+
+
+def _rewrite_value(rekey, value):
+    if isinstance(value, str):
+        return rekey.nested(value)
+    if isinstance(value, list):
+        return [_rewrite_value(rekey, item) for item in value]
+    if isinstance(value, dict):
+        return {k: _rewrite_value(rekey, v) for k, v in value.items()}
+    return value
+
+
+def rekey_tree(rekey, locale, lang, conflicts):
+    """Return ``(new_tree, moved, merged)`` for one locale (a tree or a
+    compact :class:`~i18n.model.Locale`); conflicts are appended."""
+    cells = {}
+    moved = merged = 0
+    order = []
+    before = len(conflicts)
+    for path, value in leaves(locale):
+        target = rekey.leaf(path)
+        new_path = target if target is not None else path
+        value = _rewrite_value(rekey, value)
+        if new_path in cells:
+            other_value, other_path = cells[new_path]
+            if other_value != value:
+                source, other = (path, other_path) if target is not None else (other_path, path)
+                conflicts.append(f"{lang}: {dotted(source)} -> {dotted(new_path)} clashes with "
+                                 f"{dotted(other)}, which has a different value")
+            else:
+                merged += 1
+            continue
+        cells[new_path] = (value, path)
+        order.append(new_path)
+        moved += target is not None
+    ordered = sorted(cells)
+    for shorter, longer in zip(ordered, ordered[1:]):
+        if longer[:len(shorter)] == shorter:
+            conflicts.append(f"{lang}: {dotted(shorter)} would be both a text and a namespace "
+                             f"(from {dotted(cells[shorter][1])} and {dotted(cells[longer][1])})")
+    new_tree = {}
+    if len(conflicts) == before:
+        for path in order:
+            set_path(new_tree, path, cells[path][0])
+    return new_tree, moved, merged
+
+
+def _template_edit(rekey, src, token):
+    """Edit for a template key whose head namespace moves, or None."""
+    _, start, end, _ = token
+    body = src[start + 1:end - 1]
+    head = body.split("${", 1)[0]
+    if "." not in head:
+        return None
+    namespace = tuple(head.rsplit(".", 1)[0].split("."))
+    target = rekey.path(namespace)
+    if target is None:
+        return None
+    rest = head[len(dotted(namespace)):]
+    return start + 1, start + 1 + len(head), dotted(target) + rest
+
+
+def plan_source(rekey, src, tokens):
+    """``(edits, calls)`` for one file; ``calls`` are the offsets of the
+    dynamic ``t()`` calls whose template key was rewritten."""
+    edits = []
+    calls = []
+    first_args = {}
+    for kind, start, end, value in tokens:
+        if kind == T_CALL and value is None and src[end - 1:end] == ")":
+            args = split_args(src, src.index("(", start), end - 1)
+            if args:
+                first_args[args[0][0]] = start
+    for token in tokens:
+        kind, start, end, value = token
+        if kind in (STRING, JSX_ATTR) and value and "." in value:
+            new = rekey.key(value)
+            if new is not None:
+                quote = src[start]
+                edits.append((start, end, f"{quote}{new}{quote}"))
+        elif kind == TEMPLATE and "${" not in src[start:end]:
+            new = rekey.key(value) if value and "." in value else None
+            if new is not None:
+                edits.append((start, end, f"`{new}`"))
+        elif kind == TEMPLATE and start in first_args:
+            edit = _template_edit(rekey, src, token)
+            if edit is not None:
+                edits.append(edit)
+                calls.append(first_args[start])
+    return edits, calls
+
+
+def _unreached(rekey, usage, moved_keys, rewritten):
+    """Dynamic calls that reach a moved key but are not rewritten."""
+    conflicts = []
+    for family in usage.families:
+        if family.pattern == "*" or (family.rel, family.line) in rewritten:
+            continue
+        if family.exact:
+            hit = next((key for key in family.keys if key in moved_keys), None)
+        else:
+            regex = glob_regex(family.pattern)
+            hit = next((key for key in moved_keys if regex.match(key)), None)
+        if hit is not None:
+            conflicts.append(f"{family.rel}:{family.line}: t(`{family.pattern}`) can reach "
+                             f"{hit}; move its whole namespace or rewrite the call by hand")
+    return conflicts
+
+
+def commit(files):
+    """Replace every ``path`` with its new text, all or nothing.
+
+    A text of None deletes the file (a shard whose namespace moved away)
+    once everything else is in place.
+    """
+    staged = []
+    try:
+        for path, text in files.items():
+            if text is None:
+                continue
+            temp = path.with_name(f".{path.name}.rekey")
+            temp.write_text(text, encoding="utf-8")
+            staged.append((path, temp))
+    except OSError:
+        for _, temp in staged:
+            temp.unlink(missing_ok=True)
+        raise
+    originals = {path: path.read_bytes() for path, _ in staged if path.exists()}
+    done = []
+    try:
+        for path, temp in staged:
+            os.replace(temp, path)
+            done.append(path)
+    except OSError:
+        for path in done:
+            if path in originals:
+                path.write_bytes(originals[path])
+            else:
+                path.unlink(missing_ok=True)
+        for path, temp in staged:
+            temp.unlink(missing_ok=True)
+        raise
+    for path, text in files.items():
+        if text is None:
+            path.unlink(missing_ok=True)
+
+
+def plan(moves, session, langs=LANGUAGES):
+    """Check a batch of moves; returns ``(files, stats, conflicts)``."""
+    rekey = Rekey(moves)
+    conflicts = []
+    files = {}
+    stats = {"keys": 0, "merged": 0, "locales": 0, "sources": 0, "call sites": 0}
+    moved_keys = set()
+    for lang in langs:
+        locale = session.locale(lang)
+        with profiling.phase("rekey", lang):
+            new_tree, moved, merged = rekey_tree(rekey, locale, lang, conflicts)
+        if moved or merged:
+            moved_keys.update(dotted(path) for path in locale.paths()
+                              if rekey.leaf(path) is not None)
+            out, stale = render_locale(lang, new_tree, session.locales_dir)
+            files.update(out)
+            files.update(dict.fromkeys(stale))
+            stats["locales"] += 1
+            stats["keys"] += moved
+            stats["merged"] += merged
+    for path in moves:
+        if not any(key == dotted(path) or key.startswith(dotted(path) + ".") for key in moved_keys):
+            print(f"  {dotted(path)} is not in any locale; call sites are still rewritten")
+
+    usage = scan.build()
+    rewritten = set()
+    with profiling.phase("sources"):
+        for source in tokencache.iter_sources(CLIENT_SRC):
+            src, tokens = tokencache.load(source)
+            edits, calls = plan_source(rekey, src, tokens)
+            if not edits:
+                continue
+            line_of = line_index(src)
+            rewritten.update((scan._relative(source), line_of(start)) for start in calls)
+            files[source] = apply_edits(src, edits)
+            stats["sources"] += 1
+            stats["call sites"] += len(edits)
+    conflicts += _unreached(rekey, usage, moved_keys, rewritten)
+    return files, stats, conflicts
+
+
+def add_arguments(parser):
+    parser.add_argument("pairs", nargs="*", help="OLD NEW pairs (a trailing .* moves a namespace)")
+    parser.add_argument("--map", help="JSON/YAML mapping of old key to new key")
+    parser.add_argument("--dry-run", action="store_true", help="check and report without writing")
+
+
+def run(args, session):
+    if len(args.pairs) % 2:
+        raise SystemExit("rekey: give OLD NEW pairs")
+    pairs = list(zip(args.pairs[::2], args.pairs[1::2]))
+    if args.map:
+        pairs += list(read_fragment(args.map).items())
+    try:
+        moves = parse_moves(pairs)
+    except RekeyError as e:
+        raise SystemExit(f"rekey: {e}")
+    # Changes made earlier in a chain are written first: the locale files
+    # (or the changed shards) are replaced as a whole below.
+    session.flush()
+    files, stats, conflicts = plan(moves, session)
+    for conflict in conflicts:
+        print(f"  conflict: {conflict}")
+    if conflicts:
+        raise SystemExit(f"rekey: {len(conflicts)} conflicts; nothing written")
+    print(f"{stats['keys']} keys moved in {stats['locales']} locales"
+          + (f" ({stats['merged']} merged into equal targets)" if stats["merged"] else "")
+          + f", {stats['call sites']} references in {stats['sources']} source files")
+    if args.dry_run:
+        for path, text in files.items():
+            print(f"  would {'write' if text is not None else 'delete'} {scan._relative(path)}")
+        return files
+    with profiling.phase("commit"):
+        commit({Path(path): text for path, text in files.items()})
+    session.invalidate()
+    return files
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, "rekey"):
+        run(args, Session())
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""Usage index of translation keys in client/src.
+
+Collects every static ``t('key')`` call with its file and line, the calls
+whose key is computed at runtime, and hard-coded user-visible text (JSX text
+and ``placeholder``/``title``/``alt``/``aria-label``/``label`` attribute
+strings) that still needs localizing. Each dynamic call is recorded with
+the key family it can produce (see :mod:`i18n.dynkeys`), so keys reached
+only through ``t(`audit.severity.${level}`)`` count as used. From the index
+it reports keys used in code but missing from the English file and English
+keys nothing uses.
+
+The index is written to ``i18n-reports/usage.json`` with ``--json``.
+
+Usage: python -m i18n.scan [--missing] [--unused] [--hardcoded] [--json [PATH]] [path ...]
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+from . import dynkeys, profiling, tokencache
+from .lexer import JSX_ATTR, JSX_TEXT, T_CALL, line_index
+from .paths import CLIENT_SRC, ROOT, SOURCE_LANG
+from .store import flatten, load_locale
+
+DEFAULT_OUT = ROOT / "i18n-reports" / "usage.json"
+
+_LETTERS = re.compile(r"[A-Za-zÀ-ɏ؀-ۿ]{2,}")
+_VISIBLE_ATTRIBUTE = re.compile(r"(?:placeholder|title|alt|aria-label|label)\s*=\s*$")
+_PLURAL_SUFFIXES = ("_zero", "_one", "_two", "_few", "_many", "_other")
+
+
+class Usage:
+    """Key -> call sites, plus dynamic calls and hard-coded strings."""
+
+    def __init__(self):
+        self.keys = {}
+        self.dynamic = []
+        self.families = []
+        self.hardcoded = []
+        self.files = 0
+        self._reach = None
+
+    def add_file(self, rel, keys, dynamic, hardcoded, families=()):
+        self.files += 1
+        for key, line in keys:
+            self.keys.setdefault(key, []).append((rel, line))
+        self.dynamic += [(rel, line) for line in dynamic]
+        self.families += families
+        self.hardcoded += [(rel, line, text) for line, text in hardcoded]
+        self._reach = None
+
+    def remove_file(self, rel):
+        """Drop everything recorded for ``rel`` (used by incremental updates)."""
+        for key in list(self.keys):
+            sites = [site for site in self.keys[key] if site[0] != rel]
+            if sites:
+                self.keys[key] = sites
+            else:
+                del self.keys[key]
+        self.dynamic = [site for site in self.dynamic if site[0] != rel]
+        self.families = [family for family in self.families if family.rel != rel]
+        self.hardcoded = [site for site in self.hardcoded if site[0] != rel]
+        self._reach = None
+
+    @property
+    def unbounded(self):
+        """Dynamic calls that could produce any key."""
+        return [family for family in self.families if family.unbounded]
+
+    def uses(self, key):
+        """``reaches`` for ``key`` or, for a plural form, its base key."""
+        if self.reaches(key):
+            return True
+        for suffix in _PLURAL_SUFFIXES:
+            if key.endswith(suffix):
+                return self.reaches(key[: -len(suffix)])
+        return False
+
+    def reaches(self, key):
+        """True if a static call uses ``key`` or a dynamic call can produce it."""
+        if key in self.keys:
+            return True
+        if self._reach is None:
+            exact = set()
+            patterns = set()
+            for family in self.families:
+                if family.exact:
+                    exact.update(family.keys)
+                elif not family.unbounded:
+                    patterns.add(family.pattern)
+            regex = "|".join(dynkeys.glob_regex(p).pattern for p in sorted(patterns))
+            self._reach = (exact, re.compile(regex) if regex else None)
+        exact, regex = self._reach
+        return key in exact or bool(regex and regex.match(key))
+
+    def to_json(self):
+        return {
+            "files": self.files,
+            "keys": {key: [f"{rel}:{line}" for rel, line in sites]
+                     for key, sites in sorted(self.keys.items())},
+            "dynamic": [{"site": f"{family.rel}:{family.line}", "pattern": family.pattern,
+                         "keys": list(family.keys), "source": family.source}
+                        for family in self.families],
+            "hardcoded": [{"site": f"{rel}:{line}", "text": text}
+                          for rel, line, text in self.hardcoded],
+        }
+
+
+def _relative(path):
+    path = Path(path).resolve()
+    return str(path.relative_to(ROOT)) if path.is_relative_to(ROOT) else str(path)
+
+
+def scan_source(src, tokens):
+    """Return ``(keys, dynamic, hardcoded)`` for lexed source text."""
+    line_of = line_index(src)
+    keys = []
+    dynamic = []
+    hardcoded = []
+    for kind, start, end, value in tokens:
+        if kind == T_CALL:
+            if value is None:
+                dynamic.append(line_of(start))
+            else:
+                keys.append((value, line_of(start)))
+        elif kind == JSX_TEXT:
+            text = " ".join(src[start:end].split())
+            if _LETTERS.search(text):
+                hardcoded.append((line_of(start), text))
+        elif kind == JSX_ATTR and _LETTERS.search(value or ""):
+            if _VISIBLE_ATTRIBUTE.search(src[max(0, start - 24):start]):
+                hardcoded.append((line_of(start), value))
+    return keys, dynamic, hardcoded
+
+
+def scan_file(path):
+    src, tokens = tokencache.load(path)
+    rel = _relative(path)
+    keys, dynamic, hardcoded = scan_source(src, tokens)
+    families = dynkeys.analyze_source(src, tokens, rel) if dynamic else []
+    return rel, keys, dynamic, hardcoded, families
+
+
+def build(paths=None, jobs=None):
+    """Return a :class:`Usage` for ``paths`` (default: all of client/src)."""
+    paths = [Path(p) for p in paths] if paths else list(tokencache.iter_sources(CLIENT_SRC))
+    with profiling.phase("lex"):
+        tokencache.warm(paths, jobs)
+    usage = Usage()
+    with profiling.phase("scan"):
+        for path in paths:
+            usage.add_file(*scan_file(path))
+    return usage
+
+
+def defined(key, flat):
+    """True if i18next would find ``key`` (directly or as a plural family)."""
+    return key in flat or any(key + suffix in flat for suffix in _PLURAL_SUFFIXES)
+
+
+def missing_keys(usage, flat):
+    return {key: sites for key, sites in usage.keys.items() if not defined(key, flat)}
+
+
+def unused_keys(usage, flat):
+    return [key for key in flat if not usage.uses(key)]
+
+
+def add_arguments(parser):
+    parser.add_argument("paths", nargs="*", help="files to scan (default: all of client/src)")
+    parser.add_argument("--missing", action="store_true", help="list keys missing from en")
+    parser.add_argument("--unused", action="store_true", help="list en keys nothing uses")
+    parser.add_argument("--hardcoded", action="store_true", help="list hard-coded text")
+    parser.add_argument("--json", nargs="?", const=DEFAULT_OUT, help="write the usage index")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes")
+
+
+def run(args, session=None):
+    usage = build(args.paths, args.jobs)
+    source = session.tree(SOURCE_LANG) if session else load_locale(SOURCE_LANG)
+    flat = flatten(source)
+    missing = missing_keys(usage, flat)
+    unused = unused_keys(usage, flat)
+    calls = sum(len(sites) for sites in usage.keys.values())
+    print(f"{usage.files} files: {calls} t() calls on {len(usage.keys)} keys, "
+          f"{len(usage.dynamic)} dynamic ({len(usage.unbounded)} unbounded), "
+          f"{len(usage.hardcoded)} hard-coded strings; "
+          f"{len(missing)} keys missing from {SOURCE_LANG}, {len(unused)} unused")
+    if args.missing:
+        for key, sites in sorted(missing.items()):
+            rel, line = sites[0]
+            more = f" (+{len(sites) - 1})" if len(sites) > 1 else ""
+            print(f"  missing {key}  {rel}:{line}{more}")
+    if args.unused:
+        for key in unused:
+            print(f"  unused {key}")
+    if args.hardcoded:
+        for rel, line, text in usage.hardcoded:
+            print(f"  {rel}:{line}: {text}")
+    if args.json:
+        out = Path(args.json)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(usage.to_json(), indent=2, ensure_ascii=False) + "\n",
+                       encoding="utf-8")
+        print(f"Wrote {out}")
+    return usage
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, "scan"):
+        run(args)
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
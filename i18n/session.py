@@ -0,0 +1,126 @@
+"""Locale trees shared by the commands of one ``i18n`` invocation.
+
+Chained commands (``i18n merge a.json + sync + bundle``) read and modify
+the same parsed trees; files are only written when the chain finishes, or
+before a command that reads the locale files from disk itself. Commands
+that only read ask for :meth:`Session.locale` instead, the compact form of
+:mod:`i18n.model`; a nested dict is only built for a language when a
+command asks for its :meth:`Session.tree`.
+
+For a language split into shards (:mod:`i18n.shards`), ``tree(lang,
+namespaces)`` reads only the namespaces asked for; the tree grows when a
+later command needs more, and flushing writes only the shards that changed.
+"""
+
+from .model import KeyTable, Locale
+from .paths import LANGUAGES, LOCALES_DIR, locale_exists
+from .shards import is_sharded, read_index
+from .store import load_locale, write_locale
+
+
+class Session:
+    def __init__(self, locales_dir=LOCALES_DIR):
+        self.locales_dir = locales_dir
+        self._trees = {}
+        self._locales = {}
+        self._keys = KeyTable()
+        self._dirty = set()
+        self._partial = {}      # lang -> namespaces loaded so far (shards only)
+
+    def tree(self, lang, namespaces=None):
+        """Return the parsed tree for ``lang`` (``{}`` if it has no file yet).
+
+        With ``namespaces``, a sharded locale may hold only those: the caller
+        must not look outside them.
+        """
+        tree = self._trees.get(lang)
+        loaded = self._partial.get(lang)
+        if tree is not None and loaded is None:
+            return tree
+        if tree is None:
+            # The caller may modify the tree, so the compact copy is dropped.
+            compact = self._locales.pop(lang, None)
+            if compact is not None:
+                tree = self._trees[lang] = compact.tree()
+                return tree
+            if not locale_exists(lang, self.locales_dir):
+                tree = self._trees[lang] = {}
+                return tree
+            if not is_sharded(lang, self.locales_dir):
+                tree = self._trees[lang] = load_locale(lang, self.locales_dir)
+                return tree
+            tree = self._trees[lang] = {}
+            loaded = self._partial[lang] = set()
+        wanted = None if namespaces is None else set(namespaces) - loaded
+        if wanted is None or wanted:
+            self._extend(lang, tree, loaded, wanted)
+        return tree
+
+    def _extend(self, lang, tree, loaded, wanted):
+        """Read more shards into the partial ``tree``, keeping the index order."""
+        extra = load_locale(lang, self.locales_dir, wanted)
+        if wanted is None:
+            # Everything else is read; namespaces the session already holds
+            # (and may have changed) win over the files.
+            extra = {ns: tree[ns] if ns in loaded else sub for ns, sub in extra.items()
+                     if ns in tree or ns not in loaded}
+            extra.update((ns, sub) for ns, sub in tree.items() if ns not in extra)
+            del self._partial[lang]
+        else:
+            loaded.update(wanted)
+            if not extra:
+                return
+            order = {ns: i for i, ns in enumerate(read_index(lang, self.locales_dir))}
+            extra.update(tree)
+            extra = dict(sorted(extra.items(), key=lambda item: order.get(item[0], len(order))))
+        tree.clear()
+        tree.update(extra)
+
+    def trees(self, langs=LANGUAGES):
+        return {lang: self.tree(lang) for lang in langs}
+
+    def locale(self, lang):
+        """Read-only compact view of ``lang`` (an empty one if it has no file)."""
+        if lang in self._trees:
+            return Locale.from_tree(self._keys, lang, self.tree(lang))
+        compact = self._locales.get(lang)
+        if compact is None:
+            if locale_exists(lang, self.locales_dir):
+                compact = Locale.load(self._keys, lang, self.locales_dir)
+            else:
+                compact = Locale.from_tree(self._keys, lang, {})
+            self._locales[lang] = compact
+        return compact
+
+    def locales(self, langs=LANGUAGES):
+        return {lang: self.locale(lang) for lang in langs}
+
+    def replace(self, lang, tree):
+        self._trees[lang] = tree
+        self._locales.pop(lang, None)
+        self._partial.pop(lang, None)
+        self._dirty.add(lang)
+
+    def mark(self, lang):
+        """Record that ``lang``'s tree was modified in place."""
+        self._dirty.add(lang)
+
+    @property
+    def dirty(self):
+        return sorted(self._dirty)
+
+    def flush(self):
+        """Write every modified tree; returns ``{lang: bytes_written}``."""
+        written = {}
+        for lang in sorted(self._dirty):
+            written[lang] = write_locale(lang, self._trees[lang], self.locales_dir,
+                                         self._partial.get(lang))
+        self._dirty.clear()
+        return written
+
+    def invalidate(self):
+        """Forget parsed trees so the next access re-reads the files."""
+        self.flush()
+        self._trees.clear()
+        self._locales.clear()
+        self._partial.clear()
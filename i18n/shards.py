@@ -0,0 +1,208 @@
+"""Optional per-namespace layout of the locale files.
+
+A language is stored either as one ``<lang>/translation.json`` or, once
+split, as one file per top-level namespace::
+
+    client/src/locales/ar/index.json        {"namespaces": {"app": "app.json", ...}}
+    client/src/locales/ar/app.json          the "app" subtree
+    client/src/locales/ar/footer.json       ...
+
+The index lists the namespaces in document order and is authoritative: a
+shard it does not list is ignored. Shards hold the namespace's subtree
+itself (not wrapped in its key), which is what i18next's backends load per
+namespace at runtime.
+
+:func:`i18n.store.load_locale` and :func:`i18n.store.write_locale` read and
+write either layout, so the tooling does not care which one a language
+uses. With shards they only open what an operation touches: asked for some
+namespaces, the loader reads just those shards, and the writer rewrites only
+the shards whose text changed (and the index when the set of namespaces
+did). :meth:`i18n.session.Session.tree` takes the namespaces an operation
+needs, so ``i18n merge`` of a footer fragment reads and writes
+``footer.json`` alone.
+
+``i18n shard split`` and ``i18n shard join`` convert between the layouts;
+the content is unchanged either way. The app reads both:
+``client/src/lib/i18n.ts`` globs ``locales/*/*.json`` and assembles a split
+language from its index.
+
+Usage: python -m i18n.shards {split,join} [lang ...]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from . import profiling, store
+from .paths import LANGUAGES, LOCALES_DIR, index_path, locale_path
+
+INDEX = "index.json"
+
+
+class ShardError(ValueError):
+    pass
+
+
+def is_sharded(lang, locales_dir=LOCALES_DIR):
+    return index_path(lang, locales_dir).exists()
+
+
+def shard_name(namespace):
+    if not namespace or namespace in (".", "..") or "/" in namespace or "\\" in namespace \
+            or f"{namespace}.json" == INDEX:
+        raise ShardError(f"namespace {namespace!r} cannot be stored as a shard")
+    return f"{namespace}.json"
+
+
+def read_index(lang, locales_dir=LOCALES_DIR):
+    """``{namespace: file name}`` in document order."""
+    path = index_path(lang, locales_dir)
+    with profiling.phase("load", path), open(path, encoding="utf-8") as f:
+        return json.load(f)["namespaces"]
+
+
+def _index_text(namespaces):
+    return json.dumps({"namespaces": namespaces}, indent=2, ensure_ascii=False) + "\n"
+
+
+def files(lang, locales_dir=LOCALES_DIR, namespaces=None):
+    """``[(path, key prefix), ...]`` of the files holding ``lang``'s keys.
+
+    For the single-file layout that is ``translation.json`` with no prefix;
+    with shards, each shard (of ``namespaces`` only, if given) and its
+    namespace.
+    """
+    if not is_sharded(lang, locales_dir):
+        return [(locale_path(lang, locales_dir), ())]
+    directory = Path(locales_dir) / lang
+    return [(directory / name, (namespace,))
+            for namespace, name in read_index(lang, locales_dir).items()
+            if namespaces is None or namespace in namespaces]
+
+
+def load(lang, locales_dir=LOCALES_DIR, namespaces=None):
+    """The tree of a sharded language, with only ``namespaces`` if given."""
+    tree = {}
+    for path, (namespace,) in files(lang, locales_dir, namespaces):
+        with profiling.phase("load", path), open(path, encoding="utf-8") as f:
+            tree[namespace] = json.load(f)
+    return tree
+
+
+def render(lang, tree, locales_dir=LOCALES_DIR, namespaces=None):
+    """``({path: text}, [stale paths])`` that bring the shards up to ``tree``.
+
+    ``namespaces`` is the set the tree was loaded with (None: all of them);
+    namespaces outside it are left alone, and those in it that the tree no
+    longer has are deleted; a whole tree also orders the index. Only shards
+    whose text differs are returned.
+    """
+    directory = Path(locales_dir) / lang
+    current = read_index(lang, locales_dir) if is_sharded(lang, locales_dir) else {}
+    index = {}
+    out = {}
+    stale = []
+    for namespace, name in current.items():
+        if namespace in tree or (namespaces is not None and namespace not in namespaces):
+            index[namespace] = name
+        else:
+            stale.append(directory / name)
+    for namespace, subtree in tree.items():
+        if not isinstance(subtree, dict):
+            raise ShardError(f"{lang}: top-level key {namespace!r} is not a namespace")
+        name = index.setdefault(namespace, shard_name(namespace))
+        path = directory / name
+        text = store.dump_locale(subtree)
+        try:
+            unchanged = path.read_bytes() == text.encode("utf-8")
+        except FileNotFoundError:
+            unchanged = False
+        if not unchanged:
+            out[path] = text
+    if namespaces is None:
+        # A whole tree also sets the order of the namespaces (normalize).
+        index = {namespace: index[namespace] for namespace in tree}
+    if list(index.items()) != list(current.items()):
+        out[index_path(lang, locales_dir)] = _index_text(index)
+    return out, stale
+
+
+def write(lang, tree, locales_dir=LOCALES_DIR, namespaces=None):
+    """Write the changed shards of ``tree``; returns the bytes written."""
+    out, stale = render(lang, tree, locales_dir, namespaces)
+    written = 0
+    for path, text in out.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with profiling.phase("write", path):
+            data = text.encode("utf-8")
+            path.write_bytes(data)
+        written += len(data)
+    for path in stale:
+        path.unlink(missing_ok=True)
+    return written
+
+
+def split(lang, locales_dir=LOCALES_DIR):
+    """Convert ``lang`` to shards; returns the number of namespaces."""
+    path = locale_path(lang, locales_dir)
+    tree = store.load_locale(lang, locales_dir)
+    for namespace in tree:
+        shard_name(namespace)
+    write(lang, tree, locales_dir)
+    path.unlink()
+    return len(tree)
+
+
+def join(lang, locales_dir=LOCALES_DIR):
+    """Convert ``lang`` back to one ``translation.json``."""
+    directory = Path(locales_dir) / lang
+    names = read_index(lang, locales_dir)
+    tree = load(lang, locales_dir)
+    path = locale_path(lang, locales_dir)
+    with profiling.phase("write", path):
+        path.write_text(store.dump_locale(tree), encoding="utf-8")
+    for name in names.values():
+        (directory / name).unlink(missing_ok=True)
+    index_path(lang, locales_dir).unlink()
+    return len(tree)
+
+
+def add_arguments(parser):
+    parser.add_argument("action", choices=("split", "join"),
+                        help="split into per-namespace files, or join them back")
+    parser.add_argument("langs", nargs="*", help="languages (default: all)")
+
+
+def run(args, session):
+    # Pending changes are written in the current layout first.
+    session.flush()
+    for lang in args.langs or LANGUAGES:
+        sharded = is_sharded(lang, session.locales_dir)
+        if args.action == "split" and not sharded and locale_path(lang, session.locales_dir).exists():
+            print(f"{lang}: split into {split(lang, session.locales_dir)} namespaces")
+        elif args.action == "join" and sharded:
+            print(f"{lang}: joined {join(lang, session.locales_dir)} namespaces")
+    session.invalidate()
+
+
+def main(argv=None):
+    # The session loads through i18n.store, which imports this module.
+    from .session import Session
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, "shards"):
+        try:
+            run(args, Session())
+        except ShardError as e:
+            print(f"shards: {e}", file=sys.stderr)
+            return 1
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
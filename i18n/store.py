@@ -0,0 +1,118 @@
+"""Loading, flattening and writing the nested ``translation.json`` files.
+
+Leaves are strings, or lists of strings for the legal pages' ``points``.
+Key paths are kept as tuples internally because a handful of keys contain
+dots themselves (``toast.descriptions.New contact has been added ...``), so a
+dotted string is only used for display and for lookups that i18next would do.
+
+A language may also be split into one file per namespace (:mod:`i18n.shards`);
+:func:`load_locale` and :func:`write_locale` handle both layouts.
+"""
+
+import json
+
+from . import profiling, shards
+from .paths import LANGUAGES, LOCALES_DIR, locale_exists, locale_path
+
+
+def load_locale(lang, locales_dir=LOCALES_DIR, namespaces=None):
+    """Parse ``lang``'s tree; a sharded locale reads only ``namespaces`` if given."""
+    if shards.is_sharded(lang, locales_dir):
+        return shards.load(lang, locales_dir, namespaces)
+    path = locale_path(lang, locales_dir)
+    with profiling.phase("load", path), open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_locales(langs=LANGUAGES, locales_dir=LOCALES_DIR):
+    """Return ``{lang: tree}`` for every language that has a locale."""
+    trees = {}
+    for lang in langs:
+        if locale_exists(lang, locales_dir):
+            trees[lang] = load_locale(lang, locales_dir)
+    return trees
+
+
+def dump_locale(tree):
+    """Serialize a tree the way the locale files are formatted on disk."""
+    return json.dumps(tree, indent=2, ensure_ascii=False) + "\n"
+
+
+def render_locale(lang, tree, locales_dir=LOCALES_DIR, namespaces=None):
+    """``({path: text}, [stale paths])`` to write ``tree`` in ``lang``'s layout."""
+    if shards.is_sharded(lang, locales_dir):
+        return shards.render(lang, tree, locales_dir, namespaces)
+    return {locale_path(lang, locales_dir): dump_locale(tree)}, []
+
+
+def write_locale(lang, tree, locales_dir=LOCALES_DIR, namespaces=None):
+    """Write ``tree``; ``namespaces`` is what a partially loaded tree holds."""
+    if shards.is_sharded(lang, locales_dir):
+        return shards.write(lang, tree, locales_dir, namespaces)
+    path = locale_path(lang, locales_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with profiling.phase("write", path):
+        text = dump_locale(tree)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+    return len(text.encode("utf-8"))
+
+
+def iter_leaves(tree):
+    """Yield ``(path_tuple, value)`` for every leaf in document order."""
+    stack = [((), iter(tree.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            path = prefix + (key,)
+            if isinstance(value, dict):
+                stack.append((path, iter(value.items())))
+                break
+            yield path, value
+        else:
+            stack.pop()
+
+
+def dotted(path):
+    return ".".join(path)
+
+
+def flatten(tree):
+    """Return ``{dotted_key: value}`` in document order."""
+    return {dotted(path): value for path, value in iter_leaves(tree)}
+
+
+def unflatten(leaves):
+    """Rebuild a nested tree from ``(path_tuple, value)`` pairs."""
+    tree = {}
+    for path, value in leaves:
+        node = tree
+        for part in path[:-1]:
+            node = node.setdefault(part, {})
+        node[path[-1]] = value
+    return tree
+
+
+def get_path(tree, path, default=None):
+    node = tree
+    for part in path:
+        if not isinstance(node, dict) or part not in node:
+            return default
+        node = node[part]
+    return node
+
+
+def deep_merge(source, destination):
+    """Merge ``source`` into ``destination`` in place, overwriting leaves."""
+    stack = [(source, destination)]
+    while stack:
+        src, dst = stack.pop()
+        for key, value in src.items():
+            if isinstance(value, dict):
+                node = dst.get(key)
+                if not isinstance(node, dict):
+                    node = dst[key] = {}
+                stack.append((value, node))
+            else:
+                dst[key] = value
+    return destination
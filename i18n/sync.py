@@ -0,0 +1,91 @@
+"""Compare every locale's key set with English and prune dead keys.
+
+Reports, per language, how many English keys are missing and how many keys
+exist only in that language. With ``--prune``, keys that are neither in the
+English file nor used anywhere in client/src are removed (Arabic carries
+many keys English lacks that the pages do use; those are kept). A key
+counts as used when a static call names it (a plural form such as ``_few``
+counts as its base key) or a dynamic call's key family can produce it;
+pruning is refused while some dynamic call is unbounded, unless
+``--allow-unbounded`` is given. Missing keys are not filled: i18next falls
+back to English at runtime and the coverage report tracks them.
+
+Usage: python -m i18n.sync [--prune [--allow-unbounded]] [--dry-run] [lang ...]
+"""
+
+import argparse
+import sys
+
+from . import profiling
+from .paths import LANGUAGES, SOURCE_LANG
+from .session import Session
+from .store import dotted
+
+
+def _prune(tree, dead):
+    """Remove the leaf paths in ``dead`` and any namespaces left empty."""
+    for path in dead:
+        nodes = [tree]
+        for part in path[:-1]:
+            nodes.append(nodes[-1][part])
+        del nodes[-1][path[-1]]
+        for depth in range(len(path) - 1, 0, -1):
+            if nodes[depth]:
+                break
+            del nodes[depth - 1][path[depth - 1]]
+
+
+def add_arguments(parser):
+    parser.add_argument("langs", nargs="*", help="languages (default: all but en)")
+    parser.add_argument("--prune", action="store_true",
+                        help="remove keys missing from en that nothing uses")
+    parser.add_argument("--allow-unbounded", action="store_true",
+                        help="prune even if some dynamic t() call could produce any key")
+    parser.add_argument("--dry-run", action="store_true", help="report without writing")
+
+
+def run(args, session):
+    langs = [lang for lang in (args.langs or LANGUAGES) if lang != SOURCE_LANG]
+    source = set(session.locale(SOURCE_LANG).paths())
+    usage = None
+    if args.prune:
+        from .scan import build
+
+        usage = build()
+        if usage.unbounded and not args.allow_unbounded:
+            for family in usage.unbounded:
+                print(f"  {family.rel}:{family.line}: t() key could be anything")
+            raise SystemExit(f"sync: {len(usage.unbounded)} unbounded dynamic calls; "
+                             "not pruning (use --allow-unbounded to prune anyway)")
+    totals = {}
+    for lang in langs:
+        leaves = session.locale(lang).paths()
+        present = set(leaves)
+        missing = len(source - present)
+        orphans = [path for path in leaves if path not in source]
+        dead = [path for path in orphans if usage is not None and not usage.uses(dotted(path))]
+        if dead and not args.dry_run:
+            with profiling.phase("prune", lang):
+                _prune(session.tree(lang), dead)
+            session.mark(lang)
+        totals[lang] = (missing, len(orphans), len(dead))
+        pruned = f", {len(dead)} pruned" if args.prune else ""
+        print(f"{lang}: {missing} missing, {len(orphans)} only in {lang}{pruned}")
+    return totals
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, "sync"):
+        session = Session()
+        run(args, session)
+        session.flush()
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
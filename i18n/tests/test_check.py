@@ -0,0 +1,79 @@
+"""The byte-offset JSON tokenizer and ``i18n check --since``."""
+
+import json
+import subprocess
+
+import pytest
+
+from i18n import check, jsontok
+
+
+def test_leaves_have_byte_spans():
+    data = ('{\n  "a": {\n    "b": "مرحبا \\"x\\"",\n    "n": 1\n  },\n'
+            '  "points": ["one", "two"],\n  "c": {"d": null}\n}\n').encode("utf-8")
+    found = list(jsontok.leaves(data))
+    assert [leaf.path for leaf in found] == [("a", "b"), ("a", "n"), ("points",), ("c", "d")]
+    assert [leaf.value for leaf in found] == ['مرحبا "x"', 1, ["one", "two"], None]
+    # Offsets are in bytes, from the key's opening quote to the end of the value.
+    assert data[found[0].start:found[0].end] == '"b": "مرحبا \\"x\\""'.encode("utf-8")
+    assert data[found[2].value_start:found[2].end] == b'["one", "two"]'
+
+
+def test_leaves_reject_malformed_input():
+    with pytest.raises(jsontok.JSONSyntaxError) as error:
+        list(jsontok.leaves(b'{"a" "b"}'))
+    assert error.value.pos == 5
+    with pytest.raises(jsontok.JSONSyntaxError):
+        list(jsontok.leaves(b'["a"]'))
+
+
+def test_overlapping_maps_lines_to_leaves():
+    data = b'{\n  "a": "1",\n  "b": {\n    "c": "2",\n    "d": "3"\n  }\n}\n'
+    spans = list(jsontok.leaves(data))
+    starts = jsontok.line_starts(data)
+    assert starts[:2] == [0, 2]
+    ranges = [jsontok.byte_range(starts, 4, 4, len(data))]
+    assert [leaf.path for leaf in jsontok.overlapping(spans, ranges)] == [("b", "c")]
+    # Lines between leaves touch nothing.
+    ranges = [jsontok.byte_range(starts, 6, 7, len(data))]
+    assert jsontok.overlapping(spans, ranges) == []
+
+
+def _git(root, *args):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                   cwd=root, check=True, capture_output=True)
+
+
+def _write(path, tree):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(tree, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def test_since_scopes_changed_keys_and_sources(tmp_path, monkeypatch):
+    root = tmp_path.resolve()
+    src = root / "client" / "src"
+    locales = src / "locales"
+    monkeypatch.setattr(check, "ROOT", root)
+    monkeypatch.setattr(check, "CLIENT_SRC", src)
+    _write(locales / "en" / "translation.json",
+           {"page": {"title": "Title", "body": "Body", "old": "Old"}, "other": "Other"})
+    _write(locales / "ar" / "translation.json", {"page": {"title": "عنوان"}})
+    (src / "Page.tsx").write_text("t('page.title');\n", encoding="utf-8")
+    (src / "Other.tsx").write_text("t('other');\n", encoding="utf-8")
+    _git(root, "init", "-q")
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "base")
+
+    _write(locales / "en" / "translation.json",
+           {"page": {"title": "Title", "body": "New body", "added": "Added"}, "other": "Other"})
+    _write(locales / "fr" / "translation.json", {"page": {"title": "Titre"}})
+    (src / "New.tsx").write_text("t('page.added');\n", encoding="utf-8")
+
+    scope = check.Scope.since("HEAD", locales)
+    assert scope.sources == {src / "New.tsx"}
+    # The removed key counts from the old side, the added one from the new.
+    assert scope.keys == {
+        "en": {("page", "body"), ("page", "old"), ("page", "added")},
+        "fr": {("page", "title")},
+    }
+    assert check.dependents(scope.keys["en"], roots=(src,)) == {src / "New.tsx"}
@@ -0,0 +1,11 @@
+"""Dispatch of ``python -m i18n`` commands."""
+
+from i18n import cli
+
+
+def test_standalone_command_with_a_run_function_goes_through_main(tmp_path, capsys):
+    # memoize has run(paths, write) but no add_arguments: it parses its own argv.
+    path = tmp_path / "Empty.tsx"
+    path.write_text("export const x = 1;\n", encoding="utf-8")
+    assert cli.main(["--locales", str(tmp_path), "memoize", str(path)]) == 0
+    assert "Can rewrite 0 declarations" in capsys.readouterr().out
@@ -0,0 +1,61 @@
+"""``i18n codemod``: stripping t() fallbacks and migrating them to the locales."""
+
+import json
+
+from i18n import codemod
+
+
+def _setup(tmp_path, en, ar, source):
+    for lang, tree in (("en", en), ("ar", ar)):
+        (tmp_path / lang).mkdir()
+        (tmp_path / lang / "translation.json").write_text(
+            json.dumps(tree, ensure_ascii=False), encoding="utf-8")
+    path = tmp_path / "Page.tsx"
+    path.write_text(source, encoding="utf-8")
+    return path
+
+
+def _locale(tmp_path, lang):
+    return json.loads((tmp_path / lang / "translation.json").read_text(encoding="utf-8"))
+
+
+def test_strips_fallbacks_and_migrates_missing_keys(tmp_path):
+    path = _setup(tmp_path, {"common": {"save": "Save"}}, {}, (
+        "export function Page({ t }: any) {\n"
+        "  return <>{t('common.save', 'Save it')}{t(\"page.title\", { defaultValue: 'Title' })}\n"
+        "    {t('page.hint',\n"
+        "       `Hint`)}</>;\n"
+        "}\n"
+    ))
+    report = codemod.run([path], jobs=1, locales_dir=tmp_path)
+    assert report["calls"] == 3
+    assert path.read_text(encoding="utf-8") == (
+        "export function Page({ t }: any) {\n"
+        "  return <>{t('common.save')}{t(\"page.title\")}\n"
+        "    {t('page.hint')}</>;\n"
+        "}\n"
+    )
+    # Present keys keep their text; missing ones get the fallback.
+    assert _locale(tmp_path, "en") == {"common": {"save": "Save"},
+                                       "page": {"title": "Title", "hint": "Hint"}}
+
+
+def test_keeps_call_sites_it_cannot_migrate(tmp_path):
+    source = (
+        "export function Page({ t, name }: any) {\n"
+        "  return <>{t('page.a', 'One')}{t('page.a', 'Two')}{t('page.b', `Hi ${name}`)}\n"
+        "    {t('page.c', 'تم')}{t('page.c.sub', 'فرعي')}{t('common', 'Common')}</>;\n"
+        "}\n"
+    )
+    path = _setup(tmp_path, {"common": {"save": "Save"}}, {}, source)
+    report = codemod.run([path], jobs=1, locales_dir=tmp_path)
+    assert report["calls"] == 0
+    assert path.read_text(encoding="utf-8") == source
+    assert set(report["conflicts"]) == {"page.a"}
+    # Arabic fallbacks go to ar, but never at the cost of replacing a string there.
+    assert report["reference"] == {"page.c": "تم"}
+    assert _locale(tmp_path, "ar") == {"page": {"c": "تم"}}
+    reasons = {key: reason for _, _, key, reason in report["skipped"]}
+    assert reasons["page.c.sub"] == "'page.c' is already a string in ar"
+    assert reasons["common"] == "'common' is a namespace in en, not a string"
+    assert reasons["page.b"] == "fallback is not a plain string literal"
@@ -0,0 +1,50 @@
+"""The coverage matrix and its reports."""
+
+import csv
+
+from i18n import coverage
+
+TREES = {
+    "en": {"common": {"save": "Save", "name": "Name", "url": "https://example.com"},
+           "page": {"title": "Title"}},
+    "fr": {"common": {"save": "Enregistrer", "name": "Name", "url": "https://example.com"},
+           "page": {"title": "title"}, "old": {"key": "Ancien"}},
+    "ar": {"common": {"save": "حفظ"}, "legacy": {"x": "قديم"}},
+}
+LANGS = ["en", "fr", "ar"]
+
+
+def _statuses(paths, matrix):
+    return {".".join(path): [coverage.STATUS_NAMES[s] for s in row]
+            for path, row in zip(paths, matrix)}
+
+
+def test_keys_outside_english_are_never_missing():
+    paths, matrix, _ = coverage.build_matrix(TREES, LANGS)
+    assert _statuses(paths, matrix) == {
+        "common.save": ["translated", "translated", "translated"],
+        "common.name": ["translated", "identical", "missing"],
+        "common.url": ["translated", "translated", "missing"],
+        "page.title": ["translated", "missing", "missing"],
+        "old.key": ["absent", "orphan", "absent"],
+        "legacy.x": ["absent", "absent", "orphan"],
+    }
+    assert coverage.namespace_coverage(paths, matrix, LANGS) == {
+        "common": {"en": 100.0, "fr": 66.7, "ar": 33.3},
+        "page": {"en": 100.0, "fr": 0.0, "ar": 0.0},
+    }
+
+
+def test_reports_count_and_list_english_keys_only(tmp_path):
+    summary = coverage.write_reports(TREES, LANGS, tmp_path)
+    assert summary["sourceKeys"] == 4
+    assert summary["languages"]["en"]["missing"] == 0
+    assert summary["languages"]["en"]["coverage"] == 100.0
+    assert summary["languages"]["fr"]["coverage"] == 50.0
+    with open(tmp_path / "fr.csv", encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows == [
+        ["Key", "English", "fr", "Status"],
+        ["common.name", "Name", "Name", "identical"],
+        ["page.title", "Title", "title", "missing"],
+    ]
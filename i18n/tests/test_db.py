@@ -0,0 +1,60 @@
+"""The SQLite mirror and the tracked annotations file."""
+
+import argparse
+import json
+
+import pytest
+
+from i18n import db
+from i18n.session import Session
+
+TREES = {
+    "en": {"common": {"save": "Save", "cancel": "Cancel"},
+           "disclaimerPage": {"points": ["First", "Second"]}},
+    "ar": {"common": {"save": "حفظ", "cancel": "Cancel", "extra": "إضافي"}},
+}
+
+
+@pytest.fixture
+def session(tmp_path):
+    for lang, tree in TREES.items():
+        (tmp_path / lang).mkdir()
+        (tmp_path / lang / "translation.json").write_text(
+            json.dumps(tree, ensure_ascii=False), encoding="utf-8")
+    return Session(tmp_path)
+
+
+def _run(session, tmp_path, action, **kwargs):
+    args = argparse.Namespace(action=action, db=tmp_path / "db.sqlite",
+                              annotations=tmp_path / "annotations.json", **kwargs)
+    db.run(args, session)
+
+
+def test_import_export_round_trip(session, tmp_path):
+    with db.Store(tmp_path / "db.sqlite") as store:
+        store.import_trees({lang: session.tree(lang) for lang in TREES})
+        assert store.export_tree("en") == TREES["en"]
+        assert list(store.export_tree("ar")["common"]) == ["save", "cancel", "extra"]
+        assert store.missing("ar") == ["disclaimerPage.points"]
+        assert store.status("ar", "common.cancel") == "identical"
+
+
+def test_notes_and_statuses_survive_a_rebuilt_database(session, tmp_path):
+    _run(session, tmp_path, "import", langs=["en", "ar"])
+    _run(session, tmp_path, "note", key="common.save", text="Button label")
+    _run(session, tmp_path, "status", lang="ar", key="common.save", status="review")
+    assert db.load_annotations(tmp_path / "annotations.json") == {
+        "notes": {"common.save": "Button label"},
+        "status": {"ar": {"common.save": "review"}},
+    }
+
+    (tmp_path / "db.sqlite").unlink()
+    _run(session, tmp_path, "import", langs=["en", "ar"])
+    with db.Store(tmp_path / "db.sqlite") as store:
+        assert store.notes() == {"common.save": "Button label"}
+        assert store.status("ar", "common.save") == "review"
+
+    _run(session, tmp_path, "status", lang="ar", key="common.save", status="translated")
+    assert db.load_annotations(tmp_path / "annotations.json")["status"] == {}
+    with db.Store(tmp_path / "db.sqlite") as store:
+        assert store.status("ar", "common.save") == "translated"
@@ -0,0 +1,51 @@
+"""XLIFF and PO import of partly translated lists."""
+
+import json
+
+import pytest
+
+from i18n import po, xliff
+
+
+@pytest.fixture
+def locales(tmp_path):
+    trees = {
+        "en": {"steps": ["One", "Two", "Three"], "tips": ["Tip A", "Tip B"], "title": "Title"},
+        "ar": {},
+        "fr": {"steps": ["Un", "Deux", "Trois"], "title": "Titre"},
+    }
+    for lang, tree in trees.items():
+        (tmp_path / lang).mkdir()
+        (tmp_path / lang / "translation.json").write_text(json.dumps(tree), encoding="utf-8")
+    return tmp_path
+
+
+def _fr(locales):
+    return json.loads((locales / "fr" / "translation.json").read_text(encoding="utf-8"))
+
+
+def test_xliff_list_keeps_items_without_target(locales, tmp_path):
+    xliff.export(["fr"], tmp_path / "out", locales)
+    path = tmp_path / "out" / "fr.xlf"
+    text = path.read_text(encoding="utf-8")
+    text = text.replace("<target>Un</target>", "<target>Premier</target>")
+    text = text.replace("<target>Deux</target>", "")
+    # One of two tips translated, and fr has no tips to fall back on.
+    text = text.replace("<source>Tip A</source>", "<source>Tip A</source><target>Astuce A</target>")
+    path.write_text(text, encoding="utf-8")
+
+    xliff.import_files([path], locales)
+    fr = _fr(locales)
+    assert fr["steps"] == ["Premier", "Deux", "Trois"]
+    assert "tips" not in fr
+
+
+def test_po_list_keeps_items_without_msgstr(locales, tmp_path):
+    po.export(["fr"], tmp_path / "out", locales)
+    path = tmp_path / "out" / "fr.po"
+    text = path.read_text(encoding="utf-8")
+    text = text.replace('msgstr "Un"', 'msgstr "Premier"').replace('msgstr "Trois"', 'msgstr ""')
+    path.write_text(text, encoding="utf-8")
+
+    po.import_files([path], locales)
+    assert _fr(locales)["steps"] == ["Premier", "Deux", "Trois"]
@@ -0,0 +1,67 @@
+"""``i18n inline``: per-locale overlays with static t() calls inlined."""
+
+import json
+
+from i18n import inline
+from i18n.lexer import lex
+from i18n.paths import CLIENT_SRC
+
+SOURCE = (
+    "const a = t('common.save');\n"
+    "const b = i18n.t('common.close');\n"
+    "const c = t('items.count', { count: n });\n"
+    "const d = t(`status.${s}`);\n"
+    "const e = t('common.hello');\n"
+    "const f = t('items.count');\n"
+)
+TREES = {
+    "en": {"common": {"save": "Save", "close": "Close", "hello": "Hello {{name}}",
+                      "ref": "$t(common.save) now"},
+           "items": {"count_one": "{{count}} item", "count_other": "{{count}} items"},
+           "nav": {"home": "Home"}},
+    "fr": {"common": {"save": "Enregistrer"}},
+}
+
+
+def test_plans_only_calls_without_options():
+    calls = inline.plan_source(SOURCE, lex(SOURCE))
+    assert [(SOURCE[start:end], key) for start, end, key in calls] == [
+        ("t('common.save')", "common.save"),
+        ("i18n.t('common.close')", "common.close"),
+        ("t('common.hello')", "common.hello"),
+        ("t('items.count')", "items.count"),
+    ]
+
+
+def test_inline_value_falls_back_to_english_and_keeps_dynamic_texts():
+    en, fr = TREES["en"], TREES["fr"]
+    assert inline.inline_value(fr, en, "common.save") == ("Enregistrer", None)
+    assert inline.inline_value(fr, en, "common.close") == ("Close", None)
+    assert inline.inline_value(fr, en, "common.hello") == (None, "interpolation")
+    assert inline.inline_value(fr, en, "common.ref") == (None, "interpolation")
+    assert inline.inline_value(fr, en, "items.count") == (None, "plural")
+    assert inline.inline_value(fr, en, "nav") == (None, "not a string")
+    assert inline.inline_value(fr, en, "nav.away") == (None, "missing")
+
+
+def test_build_locale_writes_an_overlay_and_pinned_resources(tmp_path):
+    path = CLIENT_SRC / "pages" / "Example.tsx"
+    plans = [(str(path), SOURCE, inline.plan_source(SOURCE, lex(SOURCE)))]
+    stale = tmp_path / "fr" / "src" / "pages" / "Stale.tsx"
+    stale.parent.mkdir(parents=True)
+    stale.write_text("old", encoding="utf-8")
+
+    files, inlined, kept = inline.build_locale("fr", plans, TREES, tmp_path)
+    assert (files, inlined, dict(kept)) == (1, 2, {"interpolation": 1, "plural": 1})
+    assert not stale.exists()
+    overlay = (tmp_path / "fr" / "src" / "pages" / "Example.tsx").read_text(encoding="utf-8")
+    assert overlay.splitlines()[:2] == ['const a = "Enregistrer";', 'const b = "Close";']
+    resource = json.loads((tmp_path / "fr" / "translation.json").read_text(encoding="utf-8"))
+    assert resource["common"]["save"] == "Enregistrer"
+    assert resource["nav"] == {"home": "Home"}
+
+    module = (tmp_path / "fr" / "src" / "lib" / "locale-resources.ts").read_text(encoding="utf-8")
+    imported = module.split("import translation from ")[1].split(";")[0]
+    assert (inline.RESOURCES_MODULE.parent / json.loads(imported)).resolve() == \
+        (tmp_path / "fr" / "translation.json").resolve()
+    assert "export const pinnedLanguage: string | undefined = \"fr\";" in module
@@ -0,0 +1,37 @@
+"""TypeScript key types and key names generated from English."""
+
+from i18n import keytypes
+
+TREE = {
+    "common": {"save": "Save", "hello": "Hello {{name}}, {{- html}}"},
+    "items": {"count_one": "{{count}} item", "count_other": "{{count}} items"},
+    "2fa": {"code": "Code"},
+}
+
+
+def test_key_params_fold_plurals():
+    assert keytypes.key_params(TREE) == {
+        "common.save": {},
+        "common.hello": {"name": "string | number", "html": "string | number"},
+        "items.count": {"count": "number"},
+        "2fa.code": {},
+    }
+    assert list(keytypes.identifiers(["a.b", "a_b", "a-b"]).values()) == ["a__b", "a_b", "a_b_2"]
+
+
+def test_generate_writes_only_when_keys_change(tmp_path):
+    stamp, stale, count = keytypes.generate(TREE, tmp_path)
+    assert count == 4
+    assert sorted(p.name for p in stale) == [keytypes.CONSTANTS_FILE, keytypes.TYPES_FILE]
+    types = (tmp_path / keytypes.TYPES_FILE).read_text(encoding="utf-8")
+    assert '  | "items.count"' in types
+    assert '  "common.hello": { name: string | number; html: string | number };' in types
+    names = (tmp_path / keytypes.CONSTANTS_FILE).read_text(encoding="utf-8")
+    assert 'export const _2fa__code = "2fa.code";' in names
+
+    # Changing a text keeps the files; adding a key does not.
+    assert keytypes.generate({**TREE, "common": {**TREE["common"], "save": "Store"}},
+                             tmp_path)[1] == []
+    tree = {**TREE, "common": {**TREE["common"], "close": "Close"}}
+    assert len(keytypes.generate(tree, tmp_path, check=True)[1]) == 2
+    assert keytypes.generate(tree, tmp_path)[0] != stamp
@@ -0,0 +1,55 @@
+"""Sanitizing and pre-rendering the legal documents."""
+
+import json
+
+import pytest
+
+from i18n import legal
+
+
+@pytest.mark.parametrize("text, fragment", [
+    ("Plain & simple < 3", "Plain &amp; simple &lt; 3"),
+    ('<strong class="x" onclick="go()">Bold</strong>', "<strong>Bold</strong>"),
+    ("<EM>a</EM><br/><b>b</b><i>c</i>", "<em>a</em><br><b>b</b><i>c</i>"),
+    ("<script>alert(1)</script>", "&lt;script&gt;alert(1)&lt;/script&gt;"),
+    ('<a href="javascript:go()">x</a>', '&lt;a href="javascript:go()"&gt;x&lt;/a&gt;'),
+    ("<img src=x onerror=alert(1)>", "&lt;img src=x onerror=alert(1)&gt;"),
+    ("Hello {{name}}", "Hello {{name}}"),
+])
+def test_sanitize_keeps_only_the_allowed_tags(text, fragment):
+    assert legal.sanitize(text) == fragment
+
+
+@pytest.mark.parametrize("text, message", [
+    ("<strong>open", "terms: <strong> is not closed"),
+    ("close</em>", "terms: unexpected </em>"),
+    ("<b><i>x</b></i>", "terms: unexpected </b>"),
+])
+def test_sanitize_rejects_unbalanced_tags(text, message):
+    with pytest.raises(legal.LegalError) as error:
+        legal.sanitize(text, "terms")
+    assert str(error.value) == message
+
+
+def test_build_renders_changed_documents_only(tmp_path):
+    legal_dir, out = tmp_path / "legal", tmp_path / "out"
+    for lang, tree in (("en", {"title": "Terms", "items": ["<b>One</b>", "Two"]}),
+                       ("ar", {"title": "الشروط"})):
+        (legal_dir / lang).mkdir(parents=True)
+        for document in legal.DOCUMENTS:
+            (legal_dir / lang / f"{document}.json").write_text(
+                json.dumps(tree, ensure_ascii=False), encoding="utf-8")
+
+    rendered, kept = legal.build(out=out, legal_dir=legal_dir)
+    assert (len(rendered), kept) == (6, [])
+    manifest = legal.read_manifest(out)
+    assert sorted(manifest["terms"]) == ["ar", "en"]
+    fragment = json.loads((out / manifest["terms"]["ar"]["file"]).read_text(encoding="utf-8"))
+    # Keys the translation lacks come from English.
+    assert fragment == {"title": "الشروط", "items": ["<b>One</b>", "Two"]}
+
+    (legal_dir / "ar" / "terms.json").write_text('{"title": "شروط"}', encoding="utf-8")
+    rendered, kept = legal.build(out=out, legal_dir=legal_dir)
+    assert rendered == [legal.read_manifest(out)["terms"]["ar"]["file"]]
+    assert len(kept) == 5
+    assert len(list(out.glob("*.json"))) == 7
@@ -0,0 +1,38 @@
+"""``i18n localize``: replacing hard-coded text with t() calls."""
+
+from i18n import localize, scan
+from i18n.codemod import apply_edits
+from i18n.lexer import JSX_ATTR, STRING, lex
+
+SOURCE = (
+    "export function Preview({ title = 'Document', label = \"Document\" }: Props) {\n"
+    "  const { t } = useTranslation();\n"
+    "  let alt = 'Document';\n"
+    "  return <Card title=\"Document\" alt='Document' className=\"Document\">\n"
+    "    <img src=\"a.png\" title = 'Document' />\n"
+    "    Document\n"
+    "  </Card>;\n"
+    "}\n"
+)
+
+
+def test_only_strings_inside_tags_are_attributes():
+    kinds = [kind for kind, _, _, value in lex(SOURCE) if kind in (STRING, JSX_ATTR)]
+    assert kinds == [STRING, STRING, STRING, JSX_ATTR, JSX_ATTR, JSX_ATTR, JSX_ATTR, JSX_ATTR]
+
+
+def test_rewrites_visible_attributes_not_defaults_or_assignments():
+    edits = localize.plan_source(SOURCE, lex(SOURCE), {"Document": "common.document"})
+    assert apply_edits(SOURCE, edits) == SOURCE.replace(
+        "<Card title=\"Document\" alt='Document'",
+        "<Card title={t('common.document')} alt={t('common.document')}",
+    ).replace(
+        "title = 'Document' />", "title = {t('common.document')} />",
+    ).replace(
+        "    Document\n", "    {t('common.document')}\n",
+    )
+
+
+def test_scan_reports_visible_attributes_only():
+    _, _, hardcoded = scan.scan_source(SOURCE, lex(SOURCE))
+    assert hardcoded == [(4, "Document"), (4, "Document"), (5, "Document"), (6, "Document")]
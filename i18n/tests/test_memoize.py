@@ -0,0 +1,64 @@
+"""Rewrites made by ``i18n memoize --write``."""
+
+from i18n.memoize import run
+
+
+def _rewrite(tmp_path, source):
+    path = tmp_path / "Component.tsx"
+    path.write_text(source, encoding="utf-8")
+    run([path], write=True)
+    return path.read_text(encoding="utf-8")
+
+
+def test_named_react_import_gains_use_memo(tmp_path):
+    out = _rewrite(tmp_path, (
+        "import { useState } from 'react';\n"
+        "import { useTranslation } from 'react-i18next';\n"
+        "\n"
+        "export function Status() {\n"
+        "  const { t } = useTranslation();\n"
+        "  const labels = { open: t('status.open') };\n"
+        "  return <span>{labels.open}</span>;\n"
+        "}\n"
+    ))
+    assert "import { useState, useMemo } from 'react';" in out
+    assert "const labels = useMemo(() => ({ open: t('status.open') }), [t, i18n.language]);" in out
+    assert "const { t, i18n } = useTranslation();" in out
+
+
+def test_namespace_import_leaves_existing_calls_alone(tmp_path):
+    out = _rewrite(tmp_path, (
+        'import * as React from "react"\n'
+        'import { useTranslation } from "react-i18next"\n'
+        "\n"
+        "export function Picker({ value }: { value?: string }) {\n"
+        "  const { t } = useTranslation()\n"
+        "  const parsed = React.useMemo(() => value?.trim(), [value])\n"
+        '  const months = [t("months.jan"), t("months.feb")]\n'
+        "  return <div>{parsed}{months[0]}</div>\n"
+        "}\n"
+    ))
+    assert "React.React" not in out
+    assert "const parsed = React.useMemo(() => value?.trim(), [value])" in out
+    assert 'const months = React.useMemo(() => [t("months.jan"), t("months.feb")], ' in out
+    assert "import { useMemo }" not in out
+
+
+def test_new_import_follows_the_last_import(tmp_path):
+    out = _rewrite(tmp_path, (
+        "/**\n"
+        " * Status badges.\n"
+        " */\n"
+        'import { useTranslation } from "react-i18next";\n'
+        "import {\n"
+        "  Badge,\n"
+        '} from "@/components/ui/badge";\n'
+        "\n"
+        "export function StatusList() {\n"
+        "  const { t } = useTranslation();\n"
+        '  const labels = { open: t("status.open") };\n'
+        "  return <Badge>{labels.open}</Badge>;\n"
+        "}\n"
+    ))
+    assert out.startswith("/**\n")
+    assert '} from "@/components/ui/badge";\nimport { useMemo } from "react";\n\n' in out
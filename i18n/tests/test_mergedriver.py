@@ -0,0 +1,62 @@
+"""The key-level three-way merge driver for translation.json."""
+
+import json
+
+from i18n import mergedriver
+
+
+def _raw(tree):
+    return {tuple(key.split(".")): json.dumps(value, ensure_ascii=False).encode("utf-8")
+            for key, value in tree.items()}
+
+
+def _keys(merged):
+    return [".".join(path) for path in merged]
+
+
+def test_merges_key_by_key():
+    base = _raw({"a": "A", "b": "B", "c": "C", "d": "D", "e": "E", "f": "F"})
+    ours = _raw({"a": "A2", "b": "B", "x": "X", "d": "D", "e": "E1", "f": "F1"})
+    theirs = _raw({"a": "A", "y": "Y", "b": "B2", "c": "C", "d": "D", "e": "E2"})
+    # The same text, spelled differently, is not a change.
+    theirs[("d",)] = b'"\\u0044"'
+    merged, conflicts = mergedriver.merge_leaves(base, ours, theirs)
+    # Keys added by theirs go after the key that precedes them there; a key
+    # deleted on one side and untouched on the other stays deleted.
+    assert _keys(merged) == ["a", "y", "b", "x", "d", "e", "f"]
+    assert merged[("a",)] == b'"A2"'
+    assert merged[("b",)] == b'"B2"'
+    assert merged[("d",)] == b'"D"'
+    assert conflicts == {("e",): (b'"E1"', b'"E2"'), ("f",): (b'"F1"', None)}
+
+
+def test_text_against_namespace_is_a_conflict():
+    base = _raw({"a": "A"})
+    ours = _raw({"a": "A", "n": "Text"})
+    theirs = _raw({"a": "A", "n.k": "Nested"})
+    merged, conflicts = mergedriver.merge_leaves(base, ours, theirs)
+    assert conflicts == {("n",): (b'"Text"', None)}
+    text = mergedriver.render(merged, conflicts)
+    assert json.loads(text[:text.index("<<<<<<<")]) == {"a": "A", "n": {"k": "Nested"}}
+    assert text[text.index("<<<<<<<"):] == (
+        '<<<<<<< ours\n"n": "Text"\n=======\nn is a namespace\n>>>>>>> theirs\n'
+    )
+
+
+def test_merge_files_writes_ours(tmp_path):
+    files = {}
+    for name, tree in (("base", {"common": {"save": "Save"}}),
+                       ("ours", {"common": {"save": "Save", "cancel": "Cancel"}}),
+                       ("theirs", {"common": {"save": "Save changes"}, "page": {"title": "T"}})):
+        files[name] = tmp_path / f"{name}.json"
+        files[name].write_text(json.dumps(tree), encoding="utf-8")
+    assert mergedriver.merge_files(files["base"], files["ours"], files["theirs"]) == {}
+    assert json.loads(files["ours"].read_text(encoding="utf-8")) == {
+        "common": {"save": "Save changes", "cancel": "Cancel"}, "page": {"title": "T"}}
+
+    files["theirs"].write_text(json.dumps({"common": {"save": "Keep"}}), encoding="utf-8")
+    files["ours"].write_text(json.dumps({"common": {"save": "Store"}}), encoding="utf-8")
+    assert mergedriver.merge_files(files["base"], files["ours"], files["theirs"]) == {
+        ("common", "save"): (b'"Store"', b'"Keep"')}
+    assert files["ours"].read_text(encoding="utf-8").splitlines()[1:6] == [
+        '  "common": {', "<<<<<<< ours", '    "save": "Store"', "=======", '    "save": "Keep"']
@@ -0,0 +1,75 @@
+"""``i18n normalize``: locale files in English key order."""
+
+import json
+
+import pytest
+
+from i18n import cli, normalize, shards, store
+
+EN = {"common": {"save": "Save", "close": "Close"}, "page": {"title": "Title", "body": "Body"}}
+
+
+def _write(tmp_path, lang, text):
+    (tmp_path / lang).mkdir(exist_ok=True)
+    (tmp_path / lang / "translation.json").write_text(text, encoding="utf-8")
+
+
+def _setup(tmp_path):
+    _write(tmp_path, "en", store.dump_locale(EN))
+    _write(tmp_path, "fr", json.dumps({
+        "legacy": {"x": "Ancien"},
+        "page": {"body": "Corps", "old": "Vieux", "title": "Titre"},
+        "common": {"close": "Fermer", "save": "Enregistrer"},
+    }))
+
+
+def _keys(tree):
+    return [".".join(path) for path, _ in store.iter_leaves(tree)]
+
+
+def test_orphans_follow_the_english_keys_of_their_namespace(tmp_path):
+    _setup(tmp_path)
+    results = normalize.normalize(["en", "fr"], tmp_path, jobs=1)
+    assert results == [("en", False, 0, []), ("fr", True, 2, [])]
+    assert _keys(store.load_locale("fr", tmp_path)) == [
+        "common.save", "common.close", "page.title", "page.body", "page.old", "legacy.x"]
+    # A second pass has nothing to do.
+    assert normalize.normalize(["fr"], tmp_path, jobs=1) == [("fr", False, 2, [])]
+
+
+def test_duplicate_keys_are_reported_and_dropped(tmp_path):
+    _write(tmp_path, "en", store.dump_locale(EN))
+    _write(tmp_path, "fr", '{"common": {"save": "A", "close": "Fermer", "save": "Enregistrer"},\n'
+                           ' "page": {"title": "T"},\n'
+                           ' "page": {"body": "Corps"}}\n')
+    [(_, changed, _, duplicates)] = normalize.normalize(["fr"], tmp_path, jobs=1)
+    assert changed
+    assert duplicates == [("common", "save"), ("page", "title")]
+    assert store.load_locale("fr", tmp_path) == {
+        "common": {"save": "Enregistrer", "close": "Fermer"}, "page": {"body": "Corps"}}
+
+
+def test_check_exits_with_1_and_writes_nothing(tmp_path, capsys):
+    _setup(tmp_path)
+    before = (tmp_path / "fr" / "translation.json").read_bytes()
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["--locales", str(tmp_path), "normalize", "--check", "--jobs", "1", "en", "fr"])
+    assert exc.value.code == "normalize: 1 files are not in canonical order"
+    assert (tmp_path / "fr" / "translation.json").read_bytes() == before
+    assert "fr: out of order; 2 orphans" in capsys.readouterr().out
+
+    assert cli.main(["--locales", str(tmp_path), "normalize", "--jobs", "1", "fr"]) == 0
+    assert cli.main(["--locales", str(tmp_path), "normalize", "--check", "--jobs", "1"]) == 0
+
+
+def test_sharded_locales_are_ordered_per_shard(tmp_path):
+    _setup(tmp_path)
+    shards.split("fr", tmp_path)
+    common = tmp_path / "fr" / "common.json"
+    results = normalize.normalize(["fr"], tmp_path, jobs=1)
+    assert results == [("fr", True, 2, [])]
+    assert list(shards.read_index("fr", tmp_path)) == ["common", "page", "legacy"]
+    assert list(json.loads(common.read_text(encoding="utf-8"))) == ["save", "close"]
+    assert not (tmp_path / "fr" / "translation.json").exists()
+    assert _keys(store.load_locale("fr", tmp_path)) == [
+        "common.save", "common.close", "page.title", "page.body", "page.old", "legacy.x"]
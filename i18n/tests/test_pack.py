@@ -0,0 +1,57 @@
+"""Binary locale packs: building one and reading it back."""
+
+import argparse
+import json
+
+import pytest
+
+from i18n import pack
+from i18n.session import Session
+
+
+def test_hashes_match_the_reference_values():
+    assert pack.fnv1a(b"") == 0x811C9DC5
+    assert pack.fnv1a(b"a") == 0xE40C292C
+    assert pack.djb2(b"") == 5381
+    assert pack.djb2(b"a") == (5381 * 33) ^ ord("a")
+
+
+def test_round_trip():
+    items = [
+        (("common", "save"), "حفظ"),
+        (("common", "ok"), "OK"),
+        (("dialog", "ok"), "OK"),
+        (("legal", "points"), ["one", {"b": 2}]),
+    ]
+    data = pack.build("ar", items)
+    magic, version, _, count, hashes_offset, entries_offset, strings_offset, size, lang = \
+        pack.HEADER.unpack_from(data)
+    assert (magic, version, count, lang) == (b"I18P", pack.VERSION, 4, b"ar\0\0")
+    assert [offset % 4 for offset in (hashes_offset, entries_offset, strings_offset)] == [0, 0, 0]
+    assert len(data) % 4 == 0
+    # "OK" is stored once.
+    assert size == len("حفظ".encode()) + len("OK") + len('["one",{"b":2}]')
+    assert pack.read(data) == {pack.key_hashes(".".join(path)): value for path, value in items}
+
+
+def test_rejects_keys_with_the_same_hashes(monkeypatch):
+    monkeypatch.setattr(pack, "key_hashes", lambda key: (1, 2))
+    with pytest.raises(pack.PackError, match="keys a and b have the same hashes"):
+        pack.build("en", [(("a",), "A"), (("b",), "B")])
+    with pytest.raises(pack.PackError, match="not a version"):
+        pack.read(b"\0" * pack.HEADER.size)
+
+
+def test_run_writes_checked_packs(tmp_path):
+    (tmp_path / "en").mkdir()
+    (tmp_path / "en" / "translation.json").write_text(
+        json.dumps({"common": {"save": "Save"}, "items": {"count_one": "{{count}} item"}}),
+        encoding="utf-8")
+    out = tmp_path / "packs"
+    args = argparse.Namespace(langs=[], out=out, check=True)
+    sizes = pack.run(args, Session(tmp_path))
+    assert list(sizes) == ["en"]
+    assert pack.read((out / "en.i18p").read_bytes()) == {
+        pack.key_hashes("common.save"): "Save",
+        pack.key_hashes("items.count_one"): "{{count}} item",
+    }
@@ -0,0 +1,72 @@
+"""Declarative locale patches and the applied-patch ledger."""
+
+import json
+
+from i18n import patch
+from i18n.session import Session
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def _locale(locales, lang):
+    return json.loads((locales / lang / "translation.json").read_text(encoding="utf-8"))
+
+
+def _setup(tmp_path):
+    locales = tmp_path / "locales"
+    patches = tmp_path / "patches"
+    _write(locales / "en" / "translation.json",
+           {"common": {"save": "Save"}, "legacy": {"banner": "Old"}, "tax": {"rate": "Rate"}})
+    _write(locales / "ar" / "translation.json",
+           {"common": {"save": "حفظ"}, "legacy": {"banner": "قديم"}})
+    _write(patches / "0001-copy.json", {"operations": [
+        {"op": "add", "key": "common.retry", "values": {"en": "Retry", "ar": "إعادة المحاولة"}},
+        {"op": "add", "key": "common.save", "values": {"en": "Ignored"}},
+        {"op": "set", "key": "common.save", "values": {"en": "Save changes"}},
+        {"op": "rename", "key": "tax.rate", "to": "taxRate"},
+        {"op": "move", "key": "tax", "to": "reports.tax"},
+        {"op": "delete", "key": "legacy.banner", "langs": ["ar"]},
+    ]})
+    return locales, patches
+
+
+def test_applies_pending_patches_and_records_them(tmp_path):
+    locales, patches = _setup(tmp_path)
+    applied, failed = patch.run_pending(Session(locales), patches)
+    assert (applied, failed) == (["0001-copy.json"], None)
+    assert _locale(locales, "en") == {
+        "common": {"save": "Save changes", "retry": "Retry"},
+        "legacy": {"banner": "Old"},
+        "reports": {"tax": {"taxRate": "Rate"}},
+    }
+    assert _locale(locales, "ar") == {"common": {"save": "حفظ", "retry": "إعادة المحاولة"}}
+    # Languages the patch did not touch get no file.
+    assert sorted(p.name for p in locales.iterdir()) == ["ar", "en"]
+
+    ledger = patch.load_ledger(patches)
+    assert ledger["0001-copy.json"]["sha256"] == patch.file_hash(patches / "0001-copy.json")
+    assert patch.pending(patches)[0] == []
+    assert patch.run_pending(Session(locales), patches) == ([], None)
+
+    (patches / "0001-copy.json").write_text('{"operations": []}', encoding="utf-8")
+    assert patch.verify(patches) == ["0001-copy.json"]
+
+
+def test_failed_patch_changes_nothing(tmp_path):
+    locales, patches = _setup(tmp_path)
+    (patches / "0001-copy.json").unlink()
+    _write(patches / "0002-clash.json", {"operations": [
+        {"op": "add", "key": "common.retry", "values": {"en": "Retry"}},
+        {"op": "add", "key": "common.save.label", "values": {"en": "Save"}},
+    ]})
+    _write(patches / "0003-later.json", {"operations": [
+        {"op": "add", "key": "common.later", "values": {"en": "Later"}},
+    ]})
+    before = _locale(locales, "en")
+    applied, failed = patch.run_pending(Session(locales), patches)
+    assert (applied, failed) == ([], "0002-clash.json")
+    assert _locale(locales, "en") == before
+    assert not (patches / patch.LEDGER_NAME).exists()
@@ -0,0 +1,75 @@
+"""``i18n rekey``: moving keys in the locales and sources, all or nothing."""
+
+import os
+
+import pytest
+
+from i18n import rekey
+from i18n.codemod import apply_edits
+from i18n.lexer import lex
+
+
+def test_moves_subtrees_plurals_and_nested_references():
+    moves = rekey.parse_moves([("reports.tax.*", "tax.*"), ("common.count", "items.count")])
+    conflicts = []
+    tree = {
+        "reports": {"tax": {"rate": "Rate", "label": "$t(reports.tax.rate) %"}, "title": "Reports"},
+        "common": {"count_one": "{{count}} item", "count_other": "{{count}} items"},
+    }
+    new_tree, moved, merged = rekey.rekey_tree(rekey.Rekey(moves), tree, "en", conflicts)
+    assert conflicts == []
+    assert (moved, merged) == (4, 0)
+    assert new_tree == {
+        "tax": {"rate": "Rate", "label": "$t(tax.rate) %"},
+        "reports": {"title": "Reports"},
+        "items": {"count_one": "{{count}} item", "count_other": "{{count}} items"},
+    }
+
+
+def test_reports_clashing_targets():
+    moves = rekey.parse_moves([("a", "b"), ("c", "b.x")])
+    conflicts = []
+    new_tree, _, _ = rekey.rekey_tree(rekey.Rekey(moves), {"a": "A", "b": "B", "c": "C"},
+                                      "en", conflicts)
+    assert new_tree == {}
+    assert conflicts == [
+        "en: a -> b clashes with b, which has a different value",
+        "en: b would be both a text and a namespace (from a and c)",
+    ]
+    with pytest.raises(rekey.RekeyError):
+        rekey.parse_moves([("a.*", "b")])
+
+
+def test_rewrites_key_literals_and_template_heads():
+    moves = rekey.Rekey(rekey.parse_moves([("reports.tax.*", "tax.*")]))
+    src = ("t('reports.tax.rate'); t(\"reports.title\");\n"
+           "t(`reports.tax.${name}`); const k = `reports.tax.label`;\n"
+           "const el = <Trans i18nKey=\"reports.tax.rate\" />;\n")
+    edits, calls = rekey.plan_source(moves, src, lex(src))
+    assert apply_edits(src, edits) == ("t('tax.rate'); t(\"reports.title\");\n"
+                                       "t(`tax.${name}`); const k = `tax.label`;\n"
+                                       "const el = <Trans i18nKey=\"tax.rate\" />;\n")
+    assert calls == [src.index("t(`")]
+
+
+def test_commit_replaces_files_or_restores_them(tmp_path, monkeypatch):
+    first, second, shard = tmp_path / "a.json", tmp_path / "b.json", tmp_path / "c.json"
+    for path in (first, second, shard):
+        path.write_text("old", encoding="utf-8")
+    replace = os.replace
+
+    def failing_replace(src, dst):
+        if dst == second:
+            raise OSError("disk full")
+        replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        rekey.commit({first: "new", second: "new", shard: None, tmp_path / "d.json": "new"})
+    assert [first.read_text(), second.read_text(), shard.read_text()] == ["old"] * 3
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.json", "b.json", "c.json"]
+
+    monkeypatch.setattr(os, "replace", replace)
+    rekey.commit({first: "new", second: "new", shard: None, tmp_path / "d.json": "new"})
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.json", "b.json", "d.json"]
+    assert first.read_text() == "new"
@@ -0,0 +1,77 @@
+"""The per-namespace shard layout: split, join and partial reads and writes."""
+
+import json
+
+import pytest
+
+from i18n import shards, store
+from i18n.session import Session
+
+TREE = {
+    "app": {"name": "Ledger", "tagline": "Books"},
+    "footer": {"links": {"terms": "Terms"}, "points": ["a", "b"]},
+    "common": {"save": "Save"},
+}
+
+
+def _setup(tmp_path, tree=TREE):
+    (tmp_path / "en").mkdir()
+    path = tmp_path / "en" / "translation.json"
+    path.write_text(store.dump_locale(tree), encoding="utf-8")
+    return path
+
+
+def test_split_and_join_round_trip(tmp_path):
+    path = _setup(tmp_path)
+    original = path.read_bytes()
+    assert shards.split("en", tmp_path) == 3
+    assert not path.exists()
+    assert shards.read_index("en", tmp_path) == {
+        "app": "app.json", "footer": "footer.json", "common": "common.json"}
+    assert json.loads((tmp_path / "en" / "footer.json").read_text(encoding="utf-8")) == TREE["footer"]
+    assert store.load_locale("en", tmp_path) == TREE
+    assert list(store.load_locale("en", tmp_path)) == ["app", "footer", "common"]
+
+    assert shards.join("en", tmp_path) == 3
+    assert path.read_bytes() == original
+    assert sorted(p.name for p in (tmp_path / "en").iterdir()) == ["translation.json"]
+
+
+def test_session_reads_and_writes_only_the_shards_it_needs(tmp_path):
+    _setup(tmp_path)
+    shards.split("en", tmp_path)
+    app_before = (tmp_path / "en" / "app.json").read_bytes()
+    (tmp_path / "en" / "app.json").write_text("not json", encoding="utf-8")
+
+    session = Session(tmp_path)
+    tree = session.tree("en", namespaces={"footer"})
+    assert tree == {"footer": TREE["footer"]}
+    tree["footer"]["links"]["privacy"] = "Privacy"
+    tree["help"] = {"title": "Help"}
+    session.mark("en")
+    session.flush()
+
+    # The unread shard is left alone; the new namespace is added to the index.
+    assert (tmp_path / "en" / "app.json").read_text(encoding="utf-8") == "not json"
+    assert list(shards.read_index("en", tmp_path)) == ["app", "footer", "common", "help"]
+    (tmp_path / "en" / "app.json").write_bytes(app_before)
+    assert store.load_locale("en", tmp_path)["footer"]["links"] == {"terms": "Terms",
+                                                                    "privacy": "Privacy"}
+
+    tree = session.tree("en")
+    del tree["common"]
+    session.mark("en")
+    session.flush()
+    assert not (tmp_path / "en" / "common.json").exists()
+    assert list(shards.read_index("en", tmp_path)) == ["app", "footer", "help"]
+
+
+def test_split_refuses_namespaces_that_cannot_be_files(tmp_path):
+    _setup(tmp_path, {"index": {"a": "A"}})
+    with pytest.raises(shards.ShardError):
+        shards.split("en", tmp_path)
+    assert (tmp_path / "en" / "translation.json").exists()
+    (tmp_path / "en" / "translation.json").write_text('{"title": "Top"}', encoding="utf-8")
+    with pytest.raises(shards.ShardError):
+        shards.split("en", tmp_path)
+    assert sorted(p.name for p in (tmp_path / "en").iterdir()) == ["translation.json"]
@@ -0,0 +1,32 @@
+"""``i18n sync --prune`` on a small locale set."""
+
+import argparse
+import json
+
+from i18n import scan, sync
+from i18n.session import Session
+
+
+def test_prune_keeps_extra_plural_forms_of_used_keys(tmp_path, monkeypatch):
+    trees = {
+        "en": {"items": {"count_one": "{{count}} item", "count_other": "{{count}} items"}},
+        "ar": {"items": {
+            "count_one": "عنصر", "count_few": "{{count}} عناصر",
+            "count_many": "{{count}} عنصرًا", "count_other": "{{count}} عنصر",
+            "stale": "قديم", "stale_few": "قديمة",
+        }},
+    }
+    for lang, tree in trees.items():
+        (tmp_path / lang).mkdir()
+        (tmp_path / lang / "translation.json").write_text(
+            json.dumps(tree, ensure_ascii=False), encoding="utf-8")
+    source = tmp_path / "Items.tsx"
+    source.write_text("export const n = (t: any, count: number) => t('items.count', { count });\n",
+                      encoding="utf-8")
+    build = scan.build
+    monkeypatch.setattr(scan, "build", lambda paths=None, jobs=None: build([source], 1))
+
+    session = Session(tmp_path)
+    args = argparse.Namespace(langs=["ar"], prune=True, allow_unbounded=False, dry_run=False)
+    assert sync.run(args, session) == {"ar": (0, 4, 2)}
+    assert sorted(session.tree("ar")["items"]) == ["count_few", "count_many", "count_one", "count_other"]
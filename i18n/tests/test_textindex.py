@@ -0,0 +1,69 @@
+"""The English reverse index: resolving text to keys and minting new ones."""
+
+from i18n.textindex import Resolver, TextIndex, mint_name, mintable
+
+SOURCE = {
+    "common": {"dueDate": "Due date", "save": "Save", "rate": "Rate"},
+    "reports": {"tax": {"taxRate": "Rate", "dueDate": "Due Date"}},
+    "tax": {"rate": "Rate:"},
+    "dashboard": {
+        "title": "Dashboard",
+        "widgets": {"sales": "Sales"},
+        "items_one": "{{count}} item",
+        "items_other": "{{count}} items",
+        "points": ["a", "b"],
+    },
+    "banner": "Welcome",
+}
+
+
+def test_resolve_ranks_candidates():
+    index = TextIndex(SOURCE)
+    # Normalized lookup: case, whitespace and a trailing colon do not matter.
+    assert len(index.candidates("  rate : ")) == 3
+    # Exact case first, then the file's namespace, then common, then shortest.
+    assert index.resolve("Due Date") == ("reports", "tax", "dueDate")
+    assert index.resolve("Rate") == ("common", "rate")
+    assert index.resolve("Rate", {"tax": 2}) == ("tax", "rate")
+    assert index.resolve("Rate", {"reports": 3}) == ("reports", "tax", "taxRate")
+    assert index.resolve("Nothing") is None
+    # Plural forms are not text for reuse.
+    assert index.resolve("{{count}} items") is None
+
+
+def test_mint_never_replaces_english_keys():
+    index = TextIndex(SOURCE)
+    assert mint_name("Net Tax Due") == "netTaxDue"
+    assert mint_name("2FA code") == "n2faCode"
+    # A namespace, a plural family, a non-string leaf and a text.
+    assert index.mint("Widgets!", "dashboard") == ("dashboard", "widgets2")
+    assert index.mint("Items", "dashboard") == ("dashboard", "items2")
+    assert index.mint("Points", "dashboard") == ("dashboard", "points2")
+    assert index.mint("Title", "dashboard") == ("dashboard", "title2")
+    assert index.mint("Hello", "banner") is None
+    assert index.mint("Hello", "dashboard") == ("dashboard", "hello")
+
+
+def test_resolver_reuses_maps_and_mints():
+    index = TextIndex(SOURCE)
+    resolver = Resolver.for_file(index, "pages/TaxPage.tsx", ["tax.rate", "tax.rate", "common.save"],
+                                 mapping={"Save": "common.save", "Total": "tax.total"})
+    assert resolver.namespace == "tax"
+    assert resolver.get("Rate") == "tax.rate"
+    assert resolver.get("Save") == "common.save"
+    # A mapped key that does not exist yet loses to an existing one, and is
+    # used as given otherwise.
+    assert resolver.get("Total") == "tax.total"
+    assert resolver.get("Widgets") == "tax.widgets"
+    assert resolver.get("widgets") == "tax.widgets"
+    assert resolver.existing("Another text") is None
+    assert resolver.minted == {"tax.widgets": "Widgets"}
+    # Codes, other scripts and identifiers are never minted.
+    assert not mintable("FA-001")
+    assert not mintable("مرحبا بكم")
+    assert not mintable("support@example.com")
+    assert resolver.get("FA-001") is None
+
+    fresh = Resolver.for_file(TextIndex(SOURCE), "pages/Banner.tsx", ["banner"])
+    assert fresh.get("Hello there") is None
+    assert Resolver.for_file(TextIndex(SOURCE), "pages/TaxPage.tsx", []).namespace == "taxPage"
@@ -0,0 +1,229 @@
+"""Reverse index from English text to the keys that already hold it.
+
+The localize rewriters used to get text -> key from hand-written maps, and
+the maps disagreed ("Rate" went to ``reports.tax.taxRate`` in one page and
+``tax.rate`` in another), minting duplicate keys. This index maps the
+normalized English value (whitespace collapsed, case-folded, a trailing
+colon dropped) to every key with that value, so a literal resolves to an
+existing key with one dict lookup. When several keys match, the best one
+is, in order:
+
+1. an exact-case match (``Due date`` and ``Due Date`` render differently);
+2. in the namespace the file already uses most (from its ``t()`` calls);
+3. in ``common``;
+4. the shortest key, then the first in the English file.
+
+Only English texts with no match get a new key, minted under the file's
+main namespace (or one named after the file: ``TaxPage.tsx`` ->
+``taxPage``); text in other scripts is left for a human. A minted key never
+lands on an existing key, namespace or plural family, nor under a text.
+``--duplicates`` lists English texts stored under more than one key.
+
+Usage: python -m i18n.textindex [--duplicates] [TEXT ...]
+"""
+
+import argparse
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+
+from . import profiling
+from .exchange import plural_split
+from .paths import SOURCE_LANG
+from .scan import defined
+from .session import Session
+from .store import dotted, iter_leaves
+
+_TRAILING = re.compile(r"\s*:\s*$")
+_WORD = re.compile(r"[A-Za-z0-9]+")
+_LETTERS = re.compile(r"[^\W\d_]{2,}")
+# Only English UI text is minted into en: words in lower case (not codes
+# such as "FA-001" or "ECDSA P-256"), no other scripts, no bare domains,
+# paths or e-mail addresses.
+_MINTABLE = re.compile(r"[a-z]{2,}")
+_NON_LATIN = re.compile(r"[^\x00-\u024f\u2000-\u206f]")
+_IDENTIFIER_LIKE = re.compile(r"^\S*[./@]\S*$")
+MAX_KEY_WORDS = 5
+
+
+def normalize(text):
+    return _TRAILING.sub("", " ".join(text.split())).casefold()
+
+
+def namespace_weights(keys):
+    """``Counter`` of top-level namespaces over the static keys a file uses."""
+    return Counter(key.split(".", 1)[0] for key in keys if key)
+
+
+def mint_name(text):
+    """camelCase key segment for ``text`` (``Net Tax Due`` -> ``netTaxDue``)."""
+    words = _WORD.findall(text)[:MAX_KEY_WORDS]
+    if not words:
+        return "text"
+    first, rest = words[0], words[1:]
+    first = first.lower() if first.isupper() else first[0].lower() + first[1:]
+    name = first + "".join(w[0].upper() + w[1:] for w in rest)
+    return name if name[0].isalpha() else "n" + name
+
+
+def mintable(text):
+    """True for English UI text that may get a new key."""
+    return bool(_MINTABLE.search(text)) and not _NON_LATIN.search(text) \
+        and not _IDENTIFIER_LIKE.match(text.strip())
+
+
+def file_namespace(path):
+    stem = Path(path).stem
+    return stem[0].lower() + stem[1:]
+
+
+class TextIndex:
+    """``normalize(text) -> [path, ...]`` over the English tree."""
+
+    def __init__(self, source_tree):
+        self.by_text = {}
+        self.values = {}
+        self.keys = set()       # every English leaf, dotted
+        self.namespaces = set()  # every proper prefix of one, dotted
+        for order, (path, value) in enumerate(iter_leaves(source_tree)):
+            self._take(path)
+            if not isinstance(value, str) or plural_split(path):
+                continue
+            self.by_text.setdefault(normalize(value), []).append(path)
+            self.values[path] = (value, order)
+
+    def _take(self, path):
+        self.keys.add(dotted(path))
+        self.namespaces.update(dotted(path[:i]) for i in range(1, len(path)))
+
+    def taken(self, path):
+        """True if a leaf at ``path`` would clash with an English key."""
+        key = dotted(path)
+        return defined(key, self.keys) or key in self.namespaces \
+            or any(dotted(path[:i]) in self.keys for i in range(1, len(path)))
+
+    def add(self, path, value):
+        """Record a key minted during this run."""
+        self._take(path)
+        self.by_text.setdefault(normalize(value), []).append(path)
+        self.values[path] = (value, len(self.values))
+
+    def candidates(self, text):
+        return self.by_text.get(normalize(text), [])
+
+    def resolve(self, text, weights=None):
+        """Best existing key path for ``text``, or None."""
+        paths = self.candidates(text)
+        if not paths:
+            return None
+        weights = weights or {}
+        exact = " ".join(text.split())
+
+        def rank(path):
+            value, order = self.values[path]
+            return (
+                _TRAILING.sub("", " ".join(value.split())) != _TRAILING.sub("", exact),
+                -weights.get(path[0], 0),
+                path[0] != "common",
+                len(path),
+                order,
+            )
+
+        return min(paths, key=rank)
+
+    def mint(self, text, namespace):
+        """A free key path under ``namespace``, or None if it is a text."""
+        if namespace in self.keys:
+            return None
+        base = mint_name(text)
+        name, n = base, 1
+        while self.taken((namespace, name)):
+            n += 1
+            name = f"{base}{n}"
+        return (namespace, name)
+
+    def duplicates(self):
+        return {paths[0]: paths for paths in self.by_text.values() if len(paths) > 1}
+
+
+class Resolver:
+    """``text -> dotted key`` for one file.
+
+    An explicit mapping wins when its key already exists in English;
+    otherwise the best existing key from the index does, then the mapped
+    key, then a newly minted one. Used as the ``mapping`` of
+    :func:`i18n.localize.plan_source`; ``minted`` collects the new keys with
+    their English text.
+    """
+
+    def __init__(self, index, mapping=None, weights=None, namespace=None, mint=True):
+        self.index = index
+        self.mapping = mapping or {}
+        self.weights = weights or {}
+        self.namespace = namespace
+        self.mint_new = mint
+        self.minted = {}
+
+    def existing(self, text):
+        """Like :meth:`get` but never mints a key."""
+        return self.get(text, mint=False)
+
+    def get(self, text, mint=True):
+        key = self.mapping.get(text)
+        if key is not None and tuple(key.split(".")) in self.index.values:
+            return key
+        if not _LETTERS.search(text):
+            return key
+        path = self.index.resolve(text, self.weights)
+        if path is None and key is not None:
+            return key
+        if path is None and mint and self.mint_new and self.namespace and mintable(text):
+            path = self.index.mint(text, self.namespace)
+            if path is not None:
+                self.index.add(path, " ".join(text.split()))
+                self.minted[dotted(path)] = " ".join(text.split())
+        return dotted(path) if path else None
+
+    @classmethod
+    def for_file(cls, index, path, used_keys, mapping=None, mint=True):
+        weights = namespace_weights(used_keys)
+        namespace = weights.most_common(1)[0][0] if weights else file_namespace(path)
+        return cls(index, mapping, weights, namespace, mint)
+
+
+def add_arguments(parser):
+    parser.add_argument("texts", nargs="*", help="English texts to resolve")
+    parser.add_argument("--duplicates", action="store_true",
+                        help="list texts stored under more than one key")
+
+
+def run(args, session):
+    index = TextIndex(session.tree(SOURCE_LANG))
+    for text in args.texts:
+        paths = index.candidates(text)
+        best = index.resolve(text)
+        print(f"{text!r}: " + (", ".join(
+            ("*" if path == best else "") + dotted(path) for path in paths) or "no key"))
+    if args.duplicates:
+        groups = index.duplicates()
+        for paths in groups.values():
+            value = index.values[paths[0]][0]
+            print(f"  {value!r}: {', '.join(dotted(p) for p in paths)}")
+        print(f"{len(groups)} texts under {sum(len(p) for p in groups.values())} keys")
+    return index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_arguments(parser)
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with profiling.session(args, "textindex"):
+        run(args, Session())
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
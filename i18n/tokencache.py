@@ -0,0 +1,195 @@
+"""Content-addressed on-disk cache of lexed TSX token streams.
+
+Each source file's token list is stored under ``.i18n-cache/tokens/`` keyed
+by the SHA-1 of the file's bytes, so an unchanged file is never re-lexed no
+matter which tool asks for it or where the file has moved. Entries are a
+small zlib-compressed binary record (see ``_encode``); stale entries for old
+file contents are simply never looked up again and can be dropped with
+``--clear``.
+
+Usage: python -m i18n.tokencache [--clear] [--jobs N] [path ...]
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import struct
+import sys
+import time
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from . import profiling
+from .lexer import KIND_NAMES, LEXER_VERSION, lex
+from .paths import CLIENT_SRC, ROOT
+
+CACHE_DIR = ROOT / ".i18n-cache" / "tokens"
+SOURCE_SUFFIXES = (".tsx", ".ts")
+# Dependencies, and files written by the tooling (i18n keytypes).
+SKIP_DIRS = frozenset({"node_modules", "generated"})
+
+_MAGIC = b"I18T"
+_HEADER = struct.Struct("<4sHI")  # magic, lexer version, token count
+
+
+def iter_sources(root=CLIENT_SRC, suffixes=SOURCE_SUFFIXES):
+    """Yield every TS/TSX source under ``root`` (declarations and generated code excluded)."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        for name in sorted(filenames):
+            if name.endswith(suffixes) and not name.endswith(".d.ts"):
+                yield Path(dirpath) / name
+
+
+def _encode(tokens):
+    kinds = bytes(tok[0] for tok in tokens)
+    starts = array("I", (tok[1] for tok in tokens))
+    ends = array("I", (tok[2] for tok in tokens))
+    lengths = array("i")
+    blob = bytearray()
+    for tok in tokens:
+        if tok[3] is None:
+            lengths.append(-1)
+        else:
+            data = tok[3].encode("utf-8")
+            lengths.append(len(data))
+            blob += data
+    if sys.byteorder != "little":
+        for column in (starts, ends, lengths):
+            column.byteswap()
+    body = kinds + starts.tobytes() + ends.tobytes() + lengths.tobytes() + bytes(blob)
+    return _HEADER.pack(_MAGIC, LEXER_VERSION, len(tokens)) + zlib.compress(body, 6)
+
+
+def _decode(data):
+    magic, version, count = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != LEXER_VERSION:
+        return None
+    body = zlib.decompress(data[_HEADER.size:])
+    pos = count
+    kinds = body[:count]
+    columns = []
+    for typecode in ("I", "I", "i"):
+        column = array(typecode)
+        column.frombytes(body[pos:pos + 4 * count])
+        if sys.byteorder != "little":
+            column.byteswap()
+        columns.append(column)
+        pos += 4 * count
+    starts, ends, lengths = columns
+    tokens = []
+    for i in range(count):
+        length = lengths[i]
+        if length < 0:
+            value = None
+        else:
+            value = body[pos:pos + length].decode("utf-8")
+            pos += length
+        tokens.append((kinds[i], starts[i], ends[i], value))
+    return tokens
+
+
+class TokenCache:
+    """Looks up or computes token streams; counts hits for reporting."""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    def _entry(self, digest):
+        return self.cache_dir / digest[:2] / f"{digest}.bin"
+
+    def tokens_for_bytes(self, data, jsx=True):
+        digest = hashlib.sha1(data).hexdigest()
+        entry = self._entry(digest)
+        try:
+            tokens = _decode(entry.read_bytes())
+        except (OSError, struct.error, zlib.error):
+            tokens = None
+        if tokens is not None:
+            self.hits += 1
+            return tokens
+        self.misses += 1
+        tokens = lex(data.decode("utf-8"), jsx=jsx)
+        self._store(entry, tokens)
+        return tokens
+
+    def _store(self, entry, tokens):
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(_encode(tokens))
+        os.replace(tmp, entry)
+
+    def load(self, path):
+        """Return ``(source_text, tokens)`` for a file."""
+        with profiling.phase("tokens", path):
+            data = Path(path).read_bytes()
+            tokens = self.tokens_for_bytes(data, jsx=str(path).endswith(".tsx"))
+        return data.decode("utf-8"), tokens
+
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+_default = None
+
+
+def default_cache():
+    global _default
+    if _default is None:
+        _default = TokenCache()
+    return _default
+
+
+def load(path):
+    """Return ``(source_text, tokens)`` for a file via the shared cache."""
+    return default_cache().load(path)
+
+
+def _warm(path):
+    cache = TokenCache()
+    cache.load(path)
+    return cache.misses
+
+
+def warm(paths, jobs=None):
+    """Make sure every path has a cache entry; returns how many were lexed."""
+    paths = list(paths)
+    if jobs == 1 or len(paths) < 16:
+        return sum(_warm(p) for p in paths)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return sum(pool.map(_warm, paths, chunksize=8))
+
+
+@profiling.command("tokencache")
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", help="files to lex (default: all of client/src)")
+    parser.add_argument("--clear", action="store_true", help="drop the cache first")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes")
+    parser.add_argument("--stats", action="store_true", help="print token counts by kind")
+    args = parser.parse_args(argv)
+
+    if args.clear:
+        default_cache().clear()
+    paths = [Path(p) for p in args.paths] or list(iter_sources())
+    started = time.perf_counter()
+    lexed = warm(paths, args.jobs)
+    print(f"{len(paths)} files, {lexed} lexed, {len(paths) - lexed} from cache "
+          f"in {time.perf_counter() - started:.2f}s")
+    if args.stats:
+        counts = {}
+        for path in paths:
+            for tok in load(path)[1]:
+                counts[tok[0]] = counts.get(tok[0], 0) + 1
+        for kind, count in sorted(counts.items()):
+            print(f"  {KIND_NAMES[kind]}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
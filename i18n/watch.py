@@ -0,0 +1,284 @@
+"""Watch client/src and re-check translations on every save.
+
+Keeps the usage index and the flattened locale key sets in memory and, for
+each changed file, re-scans only that file: a TSX save re-lexes the one file
+(through the token cache) and swaps its entries in the usage index; a locale
+save re-reads that one locale. After each batch it prints what changed:
+keys that became missing from English or unused, keys that stopped being
+missing, new hard-coded strings in the touched files, and per-locale key
+count changes. With ``--types`` an English save also regenerates the
+TypeScript key types (:mod:`i18n.keytypes`) when its key set changed.
+
+Events come from inotify on Linux (through ctypes, no extra packages) and
+from mtime polling elsewhere or with ``--poll``. Bursts (editors writing
+temp files, ``git checkout`` touching hundreds of files) are debounced: a
+batch runs once no event arrived for ``--debounce`` milliseconds.
+
+Usage: python -m i18n.watch [--debounce MS] [--poll] [--types]
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+from . import scan, tokencache
+from .paths import CLIENT_SRC, LANGUAGES, LOCALES_DIR, SOURCE_LANG, locale_exists
+from .store import flatten, load_locale
+
+DEBOUNCE_MS = 40
+POLL_INTERVAL = 0.25
+
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_MASK = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT = struct.Struct("iIII")
+
+
+def _relevant(path):
+    name = path.name
+    if name.endswith(".json"):
+        return path.parent.parent == Path(LOCALES_DIR)
+    return name.endswith(tokencache.SOURCE_SUFFIXES) and not name.endswith(".d.ts") \
+        and not tokencache.SKIP_DIRS.intersection(path.parts)
+
+
+class InotifyWatcher:
+    """Recursive inotify watch on one directory tree."""
+
+    def __init__(self, root):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add = libc.inotify_add_watch
+        self._add.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs = {}
+        self._watch_tree(Path(root))
+
+    def _watch_tree(self, root):
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d != "node_modules" and not d.startswith(".")]
+            wd = self._add(self.fd, os.fsencode(dirpath), _MASK)
+            if wd >= 0:
+                self.dirs[wd] = Path(dirpath)
+
+    def read(self, timeout):
+        """Return changed file paths, waiting up to ``timeout`` seconds."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        changed = []
+        pos = 0
+        while pos < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, pos)
+            pos += _EVENT.size
+            name = data[pos:pos + length].rstrip(b"\0").decode("utf-8", "replace")
+            pos += length
+            directory = self.dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / name
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    self._watch_tree(path)
+                    changed += [p for p in path.rglob("*") if p.is_file()]
+                continue
+            changed.append(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Fallback: compares mtimes of the watched files every interval."""
+
+    def __init__(self, root, interval=POLL_INTERVAL):
+        self.root = Path(root)
+        self.interval = interval
+        self.mtimes = self._snapshot()
+
+    def _snapshot(self):
+        mtimes = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if d != "node_modules" and not d.startswith(".")]
+            for name in filenames:
+                path = Path(dirpath) / name
+                if _relevant(path):
+                    try:
+                        mtimes[path] = path.stat().st_mtime_ns
+                    except FileNotFoundError:
+                        pass
+        return mtimes
+
+    def read(self, timeout):
+        time.sleep(min(timeout, self.interval))
+        current = self._snapshot()
+        changed = [p for p, m in current.items() if self.mtimes.get(p) != m]
+        changed += [p for p in self.mtimes if p not in current]
+        self.mtimes = current
+        return changed
+
+    def close(self):
+        pass
+
+
+def open_watcher(root, poll=False):
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(root)
+
+
+class Index:
+    """Usage index plus per-locale key sets, updated one file at a time."""
+
+    def __init__(self, jobs=None, types=False):
+        self.types = types
+        paths = list(tokencache.iter_sources(CLIENT_SRC))
+        self.usage = scan.build(paths, jobs=jobs)
+        self.sources = {scan._relative(p) for p in paths}
+        self.keys = {lang: set(flatten(load_locale(lang))) for lang in LANGUAGES
+                     if locale_exists(lang)}
+        self.missing = set(scan.missing_keys(self.usage, self.source))
+        self.unused = set(scan.unused_keys(self.usage, self.source))
+
+    @property
+    def source(self):
+        return self.keys.get(SOURCE_LANG, set())
+
+    def update(self, paths):
+        """Re-index ``paths``; returns printable report lines."""
+        lines = []
+        for path in paths:
+            path = Path(path)
+            if not _relevant(path):
+                continue
+            if path.suffix == ".json" and path.parent.parent == Path(LOCALES_DIR):
+                lines += self._update_locale(path.parent.name, path)
+            elif path.is_relative_to(CLIENT_SRC):
+                lines += self._update_source(path)
+
+        source = self.source
+        missing = set(scan.missing_keys(self.usage, source))
+        unused = set(scan.unused_keys(self.usage, source))
+        for key in sorted(missing - self.missing):
+            rel, line = self.usage.keys[key][0]
+            lines.append(f"  + missing {key}  ({rel}:{line})")
+        for key in sorted(self.missing - missing):
+            lines.append(f"  - missing {key}")
+        for key in sorted(unused - self.unused):
+            lines.append(f"  + unused {key}")
+        for key in sorted(self.unused - unused):
+            lines.append(f"  - unused {key}")
+        self.missing, self.unused = missing, unused
+        return lines
+
+    def _update_locale(self, lang, path):
+        try:
+            tree = load_locale(lang)
+        except FileNotFoundError:
+            tree = {}
+        except ValueError as e:
+            return [f"  {lang}: invalid JSON ({e}); keeping the previous keys"]
+        keys = set(flatten(tree))
+        lines = []
+        if self.types and lang == SOURCE_LANG:
+            from . import keytypes
+
+            stamp, stale, _ = keytypes.generate(tree)
+            if stale:
+                lines.append(f"  key types regenerated ({stamp[:12]})")
+        before = self.keys.get(lang, set())
+        self.keys[lang] = keys
+        added, removed = len(keys - before), len(before - keys)
+        if added or removed:
+            lines.insert(0, f"  {lang}: {len(keys)} keys (+{added} -{removed})")
+        return lines
+
+    def _update_source(self, path):
+        rel = scan._relative(path)
+        before = {(line, text) for r, line, text in self.usage.hardcoded if r == rel}
+        known = rel in self.sources
+        if known:
+            self.usage.remove_file(rel)
+            self.usage.files -= 1
+            self.sources.discard(rel)
+        if not path.exists():
+            return [f"  {rel}: removed"] if known else []
+        self.sources.add(rel)
+        try:
+            self.usage.add_file(*scan.scan_file(path))
+        except UnicodeDecodeError:
+            return []
+        after = [(line, text) for r, line, text in self.usage.hardcoded if r == rel]
+        return [f"  {rel}:{line}: hard-coded {text!r}"
+                for line, text in after if (line, text) not in before]
+
+
+def watch(root=CLIENT_SRC, debounce=DEBOUNCE_MS / 1000, poll=False, types=False,
+          out=sys.stdout):
+    started = time.perf_counter()
+    index = Index(types=types)
+    watcher = open_watcher(root, poll)
+    kind = "inotify" if isinstance(watcher, InotifyWatcher) else "polling"
+    print(f"Watching {root} ({kind}); {index.usage.files} files, {len(index.missing)} missing, "
+          f"{len(index.unused)} unused keys; ready in {time.perf_counter() - started:.2f}s",
+          file=out, flush=True)
+    try:
+        while True:
+            batch = set(watcher.read(3600))
+            # Debounce: keep collecting until the burst goes quiet.
+            while batch:
+                more = watcher.read(debounce)
+                if not more:
+                    break
+                batch.update(more)
+            batch = {p for p in batch if _relevant(p)}
+            if not batch:
+                continue
+            t0 = time.perf_counter()
+            lines = index.update(sorted(batch))
+            elapsed = (time.perf_counter() - t0) * 1000
+            stamp = time.strftime("%H:%M:%S")
+            print(f"[{stamp}] {len(batch)} file(s) in {elapsed:.0f} ms", file=out)
+            for line in lines:
+                print(line, file=out)
+            out.flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--debounce", type=int, default=DEBOUNCE_MS, help="milliseconds")
+    parser.add_argument("--poll", action="store_true", help="poll mtimes instead of inotify")
+    parser.add_argument("--types", action="store_true",
+                        help="regenerate the TypeScript key types when en's keys change")
+    args = parser.parse_args(argv)
+    watch(debounce=args.debounce / 1000, poll=args.poll, types=args.types)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
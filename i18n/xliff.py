@@ -0,0 +1,234 @@
+"""XLIFF 2.0 export and import for translation vendors.
+
+Export writes one ``<lang>.xlf`` per vendor language from a single walk over
+the English tree, streaming elements out as it goes. Import feeds the file
+to an incremental parser in fixed-size chunks and drops each ``<unit>`` once
+it has been read, so memory stays flat regardless of file size.
+
+Each unit is named after its dotted key. Arrays (the legal pages' ``points``)
+become one segment per item. ``{{...}}`` interpolations are emitted as
+``<ph/>`` so CAT tools protect them, and the Arabic reference and translator
+note travel as ``<note>`` elements.
+
+Usage:
+    python -m i18n.xliff export [--out i18n-reports/xliff] [lang ...]
+    python -m i18n.xliff import FILE [FILE ...]
+"""
+
+import argparse
+import sys
+import xml.etree.ElementTree as ET
+from contextlib import ExitStack
+from pathlib import Path
+from xml.sax.saxutils import XMLGenerator
+
+from . import profiling
+from .exchange import (
+    PLACEHOLDER,
+    VENDOR_LANGUAGES,
+    KeyResolver,
+    apply_translations,
+    plural_split,
+    source_rows,
+)
+from .paths import LOCALES_DIR, REFERENCE_LANG, ROOT, SOURCE_LANG
+from .store import dotted, iter_leaves, load_locale
+
+XLIFF_NS = "urn:oasis:names:tc:xliff:document:2.0"
+DEFAULT_OUT = ROOT / "i18n-reports" / "xliff"
+CHUNK_SIZE = 64 * 1024
+
+
+class _Writer:
+    """Streams one XLIFF document; nothing is kept after it is written."""
+
+    def __init__(self, stream, lang):
+        self.gen = XMLGenerator(stream, encoding="utf-8", short_empty_elements=True)
+        self.lang = lang
+        self.units = 0
+        self.gen.startDocument()
+        self._start("xliff", {"xmlns": XLIFF_NS, "version": "2.0",
+                              "srcLang": SOURCE_LANG, "trgLang": lang})
+        self._start("file", {"id": "translation", "original": f"locales/{lang}/translation.json"})
+        self.gen.ignorableWhitespace("\n")
+
+    def _start(self, name, attrs=None):
+        self.gen.startElement(name, attrs or {})
+
+    def _end(self, name):
+        self.gen.endElement(name)
+
+    def _text(self, name, text, ids):
+        self._start(name)
+        pos = 0
+        for match in PLACEHOLDER.finditer(text):
+            self.gen.characters(text[pos:match.start()])
+            token = match.group(0)
+            ph_id = ids.setdefault(token, f"ph{len(ids) + 1}")
+            self._start("ph", {"id": ph_id, "equiv": token, "disp": token})
+            self._end("ph")
+            pos = match.end()
+        self.gen.characters(text[pos:])
+        self._end(name)
+
+    def unit(self, path, source, target, reference, note):
+        self.units += 1
+        attrs = {"id": f"u{self.units}", "name": dotted(path)}
+        self._start("unit", attrs)
+
+        notes = []
+        if reference is not None:
+            notes.append(("reference", _as_text(reference)))
+        if note:
+            notes.append(("context", note))
+        plural = plural_split(path)
+        if plural:
+            notes.append(("plural", f"{dotted(plural[0])} ({plural[1]})"))
+        if notes:
+            self._start("notes")
+            for category, text in notes:
+                self._start("note", {"category": category})
+                self.gen.characters(text)
+                self._end("note")
+            self._end("notes")
+
+        sources = source if isinstance(source, list) else [source]
+        targets = target if isinstance(target, list) else [target]
+        for i, text in enumerate(sources):
+            text = text if isinstance(text, str) else str(text)
+            target_text = targets[i] if i < len(targets) else None
+            translated = isinstance(target_text, str) and target_text != ""
+            self._start("segment", {"state": "translated" if translated else "initial"})
+            ids = {}
+            self._text("source", text, ids)
+            if translated:
+                self._text("target", target_text, ids)
+            self._end("segment")
+        self._end("unit")
+        self.gen.ignorableWhitespace("\n")
+
+    def close(self):
+        self._end("file")
+        self._end("xliff")
+        self.gen.endDocument()
+
+
+def _as_text(value):
+    return "\n".join(value) if isinstance(value, list) else str(value)
+
+
+def export(langs=VENDOR_LANGUAGES, out_dir=DEFAULT_OUT, locales_dir=LOCALES_DIR, notes=None):
+    """Write ``<out_dir>/<lang>.xlf`` for every language in one pass."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    source = load_locale(SOURCE_LANG, locales_dir)
+    reference = load_locale(REFERENCE_LANG, locales_dir)
+    targets = {lang: dict(iter_leaves(load_locale(lang, locales_dir))) for lang in langs}
+
+    with profiling.phase("export"), ExitStack() as stack:
+        writers = {}
+        for lang in langs:
+            stream = stack.enter_context(open(out_dir / f"{lang}.xlf", "w", encoding="utf-8"))
+            writers[lang] = _Writer(stream, lang)
+        for path, value, ref, note in source_rows(source, reference, notes):
+            for lang, writer in writers.items():
+                writer.unit(path, value, targets[lang].get(path), ref, note)
+        for writer in writers.values():
+            writer.close()
+    return {lang: writer.units for lang, writer in writers.items()}
+
+
+def _inline_text(elem):
+    parts = [elem.text or ""]
+    for child in elem:
+        if child.tag == f"{{{XLIFF_NS}}}ph":
+            parts.append(child.get("equiv") or child.get("disp") or "")
+        else:
+            parts.append(_inline_text(child))
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+
+def read(path, chunk_size=CHUNK_SIZE):
+    """Yield ``(lang, key, [target, ...])`` for each translated unit."""
+    unit_tag = f"{{{XLIFF_NS}}}unit"
+    segment_tag = f"{{{XLIFF_NS}}}segment"
+    target_tag = f"{{{XLIFF_NS}}}target"
+    parser = ET.XMLPullParser(events=("start", "end"))
+    lang = None
+    parents = []
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if chunk:
+                parser.feed(chunk)
+            else:
+                parser.close()
+            for event, elem in parser.read_events():
+                if event == "start":
+                    if elem.tag == f"{{{XLIFF_NS}}}xliff":
+                        lang = elem.get("trgLang")
+                    parents.append(elem)
+                    continue
+                parents.pop()
+                if elem.tag != unit_tag:
+                    continue
+                targets = []
+                for segment in elem.iter(segment_tag):
+                    target = segment.find(target_tag)
+                    targets.append(_inline_text(target) if target is not None else None)
+                if any(t for t in targets):
+                    yield lang, elem.get("name"), targets
+                # Drop the finished unit from its parent to keep memory flat.
+                if parents:
+                    parents[-1].remove(elem)
+            if not chunk:
+                break
+
+
+def import_files(paths, locales_dir=LOCALES_DIR):
+    """Merge translated units from XLIFF files into the locale files."""
+    source = load_locale(SOURCE_LANG, locales_dir)
+    resolver = KeyResolver(source)
+    source_leaves = dict(iter_leaves(source))
+    counts = {}
+    for path in paths:
+        items = {}
+        lang = None
+        with profiling.phase("import", path):
+            for lang, key, targets in read(path):
+                key_path = resolver.resolve(key)
+                if isinstance(source_leaves.get(key_path), list):
+                    items[key_path] = targets
+                else:
+                    items[key_path] = targets[0] or ""
+        if lang and items:
+            counts[lang] = counts.get(lang, 0) + apply_translations(
+                lang, items.items(), locales_dir
+            )
+    return counts
+
+
+@profiling.command("xliff")
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    exp = sub.add_parser("export", help="write one .xlf per language")
+    exp.add_argument("langs", nargs="*", help="languages (default: the 15 vendor languages)")
+    exp.add_argument("--out", default=DEFAULT_OUT)
+    imp = sub.add_parser("import", help="merge translated .xlf files into the locales")
+    imp.add_argument("files", nargs="+")
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        counts = export(args.langs or VENDOR_LANGUAGES, args.out)
+        print(f"Exported {sum(counts.values())} units for {len(counts)} languages to {args.out}")
+    else:
+        counts = import_files(args.files)
+        for lang, count in counts.items():
+            print(f"Imported {count} keys into {lang}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
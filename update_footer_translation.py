@@ -1,36 +0,0 @@
-import json
-import os
-
-def deep_merge(source, destination):
-    for key, value in source.items():
-        if isinstance(value, dict):
-            node = destination.setdefault(key, {})
-            deep_merge(value, node)
-        else:
-            destination[key] = value
-    return destination
-
-def update_translation():
-    file_path = "/Users/omar.matouki/TibrCode Apps/log_and_ledger_main/client/src/locales/en/translation.json"
-    
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-    
-    new_keys = {
-        "footer": {
-            "terms": "Terms",
-            "privacy": "Privacy",
-            "disclaimer": "Disclaimer",
-            "copyright": "© {{year}} Log & Ledger"
-        }
-    }
-    
-    deep_merge(new_keys, data)
-    
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2)
-    
-    print(f"Updated {file_path}")
-
-if __name__ == "__main__":
-    update_translation()
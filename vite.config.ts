@@ -1,9 +1,36 @@
-import { defineConfig } from "vite";
+import { defineConfig, type Plugin } from "vite";
 import react from "@vitejs/plugin-react";
+import fs from "fs";
 import path from "path";
+
+// Single-locale build: `python -m i18n inline ar && I18N_LOCALE=ar vite build`
+// serves each client/src file from the inline overlay when it has one.
+const inlineLocale = process.env.I18N_LOCALE;
+const clientSrc = path.resolve(import.meta.dirname, "client", "src");
+const inlineDir = inlineLocale && path.resolve(import.meta.dirname, "dist", "inline", inlineLocale);
+
+function inlineOverlay(dir: string): Plugin {
+  return {
+    name: "i18n-inline-overlay",
+    enforce: "pre",
+    buildStart() {
+      if (!fs.existsSync(path.join(dir, "translation.json"))) {
+        this.error(`no inline overlay in ${dir}; run \`python -m i18n inline ${inlineLocale}\` first`);
+      }
+    },
+    load(id) {
+      const file = id.split("?")[0];
+      if (!file.startsWith(clientSrc + path.sep)) return null;
+      const overlay = path.join(dir, "src", path.relative(clientSrc, file));
+      return fs.existsSync(overlay) ? fs.readFileSync(overlay, "utf-8") : null;
+    },
+  };
+}
+
 // Build cache buster: 2025-11-12T11:50
 export default defineConfig({
   plugins: [
+    ...(inlineDir ? [inlineOverlay(inlineDir)] : []),
     // Keep production build clean and minimal
     react(),
   ],
@@ -21,7 +48,7 @@ export default defineConfig({
   },
   root: path.resolve(import.meta.dirname, "client"),
   build: {
-    outDir: path.resolve(import.meta.dirname, "dist/public"),
+    outDir: inlineDir ? path.join(inlineDir, "public") : path.resolve(import.meta.dirname, "dist/public"),
     // Restore normal production optimizations
     minify: 'esbuild',
     sourcemap: false,